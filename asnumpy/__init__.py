@@ -15,19 +15,50 @@
 # *****************************************************************************
 
 import atexit
+import importlib
 from .lib import * 
-from .lib import init, finalize, set_device, reset_device# 哄pylance的 其实可以不写
+from .lib import init, finalize, set_device, reset_device, npu# 哄pylance的 其实可以不写
 from .lib import __all__ as __lib_all__
-from .io import save, savez, savez_compressed, load
+# lazy 模式下可融合的 ufunc 覆盖 lib 中的 eager 版本
+from .fusion import lazy, LazyArray
+from .fusion import (add, subtract, multiply, divide, negative, absolute, square,
+                     exp, log, sin, cos, tanh, reciprocal)
 
 __version__ = "0.2.0"
 
-__all__ = __lib_all__ + ['save', 'savez', 'savez_compressed', 'load']
+__all__ = __lib_all__ + ['save', 'savez', 'savez_compressed', 'load', 'lazy', 'LazyArray']
 
+# 按需导入的子模块成员：name -> 子模块
+_lazy_attrs = {
+    'io': 'io',
+    'save': 'io',
+    'savez': 'io',
+    'savez_compressed': 'io',
+    'load': 'io',
+    'profiler': 'profiler',
+}
+
+
+def __getattr__(name):
+    module = _lazy_attrs.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = importlib.import_module('.' + module, __name__)
+    if name != module:
+        value = getattr(value, name)
+    globals()[name] = value
+    return value
+
+
+# 导入时不初始化 ACL，也不占用设备：运行时在第一次使用设备时才启动，
+# 设备由 ap.npu.set_device() 或环境变量 ASNUMPY_DEVICE 指定，默认 0
 @atexit.register
 def reset():
-    reset_device(0)
+    if not npu.is_initialized():
+        return
+    npu.executor_cache().clear()
+    for device in npu.active_devices():
+        npu.workspace_arena(device).release()
+        npu.memory_pool(device).free_all_blocks()
+    npu.pinned_memory_pool().free_all_blocks()
     finalize()
-
-init()
-set_device(0)
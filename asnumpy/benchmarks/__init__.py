@@ -0,0 +1,186 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+"""
+asnumpy.benchmarks
+------------------
+Reproducible benchmarks of asnumpy against NumPy.
+
+Suites cover dispatch overhead, host/device transfer bandwidth and the
+throughput of elementwise, reduction, linalg and random operators across
+shapes and dtypes. Every case is warmed up, then timed repeat times with
+device events (and the host clock); results report the median and
+percentiles as JSON so that runs of different commits can be compared.
+
+Command line:
+    python -m asnumpy.benchmarks run -o base.json            # full suite
+    python -m asnumpy.benchmarks run -k elementwise --quick  # subset, small shapes
+    python -m asnumpy.benchmarks compare base.json new.json --threshold 0.1
+
+Implements:
+- run
+- compare
+- format_results
+- format_comparison
+"""
+
+import platform
+import re
+import time
+
+import numpy as _np
+
+from .. import __version__
+from ..lib import npu as _npu
+from .harness import summarize, time_device, time_host
+from .suites import SUITES, Case, cases
+
+FORMAT_VERSION = 1
+
+
+def _primary(result):
+    """Median of the timing a case is judged by, in microseconds."""
+    stats = result.get(result.get("metric", "device"))
+    return stats["median"] if stats else None
+
+
+def run(pattern=None, quick=False, warmup=5, repeat=50, numpy=True, label=None, log=None):
+    """
+    Run the cases whose name matches the regular expression pattern.
+
+    Args:
+        pattern: regular expression searched in case names, all cases if None.
+        quick: small shapes only, for smoke tests and CI.
+        warmup: untimed calls before sampling; they also plan and cache executors.
+        repeat: timed calls per case.
+        numpy: time the NumPy counterpart too and report the speedup.
+        label: free-form run label stored in the metadata, e.g. a commit id.
+        log: file to print progress to, None for silence.
+
+    Returns:
+        dict with "meta" (versions, platform, settings) and "results", one
+        dict per case. A case that fails records its error instead of timings.
+    """
+    meta = {
+        "format": FORMAT_VERSION,
+        "label": label,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "asnumpy": __version__,
+        "numpy": _np.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "devices": _npu.device_count(),
+        "device": _npu.current_device(),
+        "warmup": warmup,
+        "repeat": repeat,
+        "quick": quick,
+    }
+    selected = re.compile(pattern) if pattern else None
+    results = []
+    for case in cases(quick):
+        if selected and not selected.search(case.name):
+            continue
+        result = {"name": case.name, "group": case.group, "params": case.params,
+                  "metric": case.metric, "bytes": case.bytes, "flops": case.flops}
+        try:
+            fn, np_fn = case.setup()
+            device, host = time_device(fn, warmup, repeat)
+            result["device"] = summarize(device)
+            result["host"] = summarize(host)
+            if numpy and np_fn is not None:
+                result["numpy"] = summarize(time_host(np_fn, warmup, repeat))
+                result["speedup"] = result["numpy"]["median"] / _primary(result)
+            median = _primary(result)
+            if case.bytes:
+                result["gbps"] = case.bytes / median / 1e3
+            if case.flops:
+                result["gflops"] = case.flops / median / 1e3
+        except Exception as e:  # 某些 dtype / 算子在部分环境不可用，记录后继续
+            result["error"] = f"{type(e).__name__}: {e}"
+        results.append(result)
+        if log is not None:
+            print(_format_row(result), file=log, flush=True)
+    return {"meta": meta, "results": results}
+
+
+def compare(base, new, threshold=0.1):
+    """
+    Compare two run() outputs case by case on each case's metric.
+
+    A case regresses when its median grows by more than threshold (0.1 is
+    10%) and improves when it shrinks by more than threshold.
+
+    Returns:
+        list of dict with name, base and new medians, ratio new/base and
+        status: regression, improvement, ok, new (only in new), missing
+        (only in base) or error (failed in either run).
+    """
+    base_results = {r["name"]: r for r in base["results"]}
+    new_results = {r["name"]: r for r in new["results"]}
+    rows = []
+    for name in list(base_results) + [n for n in new_results if n not in base_results]:
+        b, n = base_results.get(name), new_results.get(name)
+        row = {"name": name, "base": None, "new": None, "ratio": None}
+        if b is None:
+            row["status"] = "new"
+        elif n is None:
+            row["status"] = "missing"
+        elif "error" in b or "error" in n:
+            row["status"] = "error"
+        else:
+            row["base"], row["new"] = _primary(b), _primary(n)
+            row["ratio"] = row["new"] / row["base"] if row["base"] > 0 else float("inf")
+            if row["ratio"] > 1 + threshold:
+                row["status"] = "regression"
+            elif row["ratio"] < 1 - threshold:
+                row["status"] = "improvement"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+
+def _format_row(result):
+    if "error" in result:
+        return f"{result['name']:<44} error: {result['error']}"
+    stats = result[result["metric"]]
+    line = (f"{result['name']:<44} {result['metric']:>6} median {stats['median']:>10.1f} us"
+            f"  p90 {stats['p90']:>10.1f} us")
+    if "gflops" in result:
+        line += f"  {result['gflops']:>8.2f} GFLOP/s"
+    elif "gbps" in result:
+        line += f"  {result['gbps']:>8.2f} GB/s"
+    if "speedup" in result:
+        line += f"  x{result['speedup']:.2f} vs numpy"
+    return line
+
+
+def format_results(report):
+    """One line per case: metric, median and p90, throughput and speedup over NumPy."""
+    return "\n".join(_format_row(r) for r in report["results"])
+
+
+def format_comparison(rows):
+    """One line per compared case, regressions first."""
+    order = {"regression": 0, "error": 1, "missing": 2, "improvement": 3, "new": 4, "ok": 5}
+    lines = []
+    for row in sorted(rows, key=lambda row: order[row["status"]]):
+        if row["ratio"] is None:
+            lines.append(f"{row['name']:<44} {row['status']}")
+        else:
+            lines.append(f"{row['name']:<44} {row['base']:>10.1f} -> {row['new']:>10.1f} us"
+                         f"  x{row['ratio']:.3f}  {row['status']}")
+    return "\n".join(lines)
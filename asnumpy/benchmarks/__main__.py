@@ -0,0 +1,79 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+"""Command line of asnumpy.benchmarks: run, compare and list."""
+
+import argparse
+import json
+import sys
+
+from . import compare, format_comparison, format_results, run
+from .suites import cases
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m asnumpy.benchmarks",
+                                     description="Benchmark asnumpy against NumPy.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("run", help="run benchmarks and write the results as JSON")
+    p.add_argument("-k", "--filter", help="regular expression selecting case names")
+    p.add_argument("--quick", action="store_true", help="small shapes only")
+    p.add_argument("--warmup", type=int, default=5, help="untimed calls per case (default 5)")
+    p.add_argument("--repeat", type=int, default=50, help="timed calls per case (default 50)")
+    p.add_argument("--no-numpy", action="store_true", help="do not time NumPy")
+    p.add_argument("--label", help="label stored with the results, e.g. a commit id")
+    p.add_argument("-o", "--output", help="JSON file to write, stdout if omitted")
+
+    p = commands.add_parser("compare", help="compare two result files and flag regressions")
+    p.add_argument("base", help="results of the reference run")
+    p.add_argument("new", help="results of the run under test")
+    p.add_argument("--threshold", type=float, default=0.1,
+                   help="relative slowdown of the median counted as a regression (default 0.1)")
+
+    p = commands.add_parser("list", help="list case names")
+    p.add_argument("--quick", action="store_true", help="small shapes only")
+
+    args = parser.parse_args(argv)
+    if args.command == "list":
+        for case in cases(args.quick):
+            print(case.name)
+        return 0
+
+    if args.command == "run":
+        report = run(args.filter, quick=args.quick, warmup=args.warmup, repeat=args.repeat,
+                     numpy=not args.no_numpy, label=args.label, log=sys.stderr)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(report, f, indent=1)
+        else:
+            json.dump(report, sys.stdout, indent=1)
+            print()
+        return 1 if any("error" in r for r in report["results"]) else 0
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    rows = compare(base, new, args.threshold)
+    print(format_comparison(rows))
+    regressions = sum(row["status"] == "regression" for row in rows)
+    print(f"\n{regressions} regression(s) over {args.threshold:.0%} in {len(rows)} case(s)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
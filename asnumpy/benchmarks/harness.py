@@ -0,0 +1,88 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+"""
+Timing primitives shared by the benchmark suites.
+
+All times are in microseconds. Device times come from a pair of events
+recorded around each call on the current stream; host times are wall-clock
+time until the call returns, so for asynchronous operators they measure
+dispatch overhead.
+"""
+
+import statistics
+import time
+
+import numpy as _np
+
+from ..lib import npu as _npu
+
+
+def summarize(samples):
+    """
+    Statistics of timing samples: min, median, mean, stdev and the 10th,
+    90th and 99th percentiles (interpolated like numpy.percentile).
+    """
+    p10, median, p90, p99 = (float(v) for v in _np.percentile(samples, (10, 50, 90, 99)))
+    return {
+        "samples": len(samples),
+        "min": float(min(samples)),
+        "median": median,
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.pstdev(samples),
+        "p10": p10,
+        "p90": p90,
+        "p99": p99,
+    }
+
+
+def time_device(fn, warmup, repeat):
+    """
+    Time fn() on the device and on the host.
+
+    The device is idle at the start of every sample, so each sample times
+    one call and nothing queued before it.
+
+    Returns:
+        (device, host): lists of repeat samples.
+    """
+    for _ in range(warmup):
+        fn()
+    _npu.synchronize()
+    start, end = _npu.Event(), _npu.Event()
+    device, host = [], []
+    for _ in range(repeat):
+        start.record()
+        t0 = time.perf_counter()
+        fn()
+        t1 = time.perf_counter()
+        end.record()
+        end.synchronize()
+        device.append(start.elapsed_time(end) * 1e3)
+        host.append((t1 - t0) * 1e6)
+    return device, host
+
+
+def time_host(fn, warmup, repeat):
+    """Wall-clock samples of fn(), for NumPy and other host code."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1e6)
+    return samples
@@ -0,0 +1,196 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+"""
+Benchmark cases.
+
+A case names what it measures and, when it runs, builds its inputs and
+returns the callable to time together with its NumPy counterpart. Inputs are
+drawn from a fixed seed so runs are comparable.
+"""
+
+import numpy as _np
+
+from .. import lib as _lib
+from .. import fusion as _fusion
+from ..lib import npu as _npu
+
+
+class Case:
+    """
+    One benchmark.
+
+    Attributes:
+        name: unique id, "<group>/<op>/<dtype>/<shape>".
+        group: suite the case belongs to.
+        metric: "device" or "host", the timing compared between runs.
+        bytes: bytes read and written per call, for bandwidth.
+        flops: floating point operations per call, for throughput.
+        setup: callable returning (fn, numpy_fn); numpy_fn may be None.
+    """
+
+    def __init__(self, group, op, dtype, shape, setup, metric="device", bytes=0, flops=0):
+        self.group = group
+        self.params = {"op": op, "dtype": _np.dtype(dtype).name, "shape": list(shape)}
+        self.name = f"{group}/{op}/{self.params['dtype']}/{'x'.join(map(str, shape))}"
+        self.setup = setup
+        self.metric = metric
+        self.bytes = bytes
+        self.flops = flops
+
+
+def _host(shape, dtype, seed=0):
+    return _np.random.default_rng(seed).standard_normal(shape).astype(dtype)
+
+
+def _device(shape, dtype, seed=0):
+    return _lib.ndarray.from_numpy(_host(shape, dtype, seed))
+
+
+def _size(shape):
+    return int(_np.prod(shape))
+
+
+def dispatch(quick):
+    """Host cost of launching tiny operators, planned and from the executor cache."""
+    shape = (1,)
+
+    def add():
+        x = _device(shape, _np.float32)
+        a = _host(shape, _np.float32)
+        return (lambda: _fusion.add(x, x)), (lambda: _np.add(a, a))
+
+    def sign():
+        x = _device(shape, _np.float32)
+        a = _host(shape, _np.float32)
+        return (lambda: _lib.sign(x)), (lambda: _np.sign(a))
+
+    yield Case("dispatch", "add", _np.float32, shape, add, metric="host")
+    yield Case("dispatch", "sign", _np.float32, shape, sign, metric="host")
+
+
+def transfer(quick):
+    """Host/device copy bandwidth from pageable and pinned host memory."""
+    sizes = [(1 << 10,), (1 << 20,)] if quick else [(1 << 10,), (1 << 20,), (1 << 24,)]
+    dtype = _np.dtype(_np.float32)
+    for shape in sizes:
+        nbytes = _size(shape) * dtype.itemsize
+
+        def h2d(shape=shape):
+            a = _host(shape, dtype)
+            return (lambda: _lib.ndarray.from_numpy(a)), None
+
+        def h2d_pinned(shape=shape):
+            a = _npu.empty_pinned(list(shape), dtype)
+            a[...] = _host(shape, dtype)
+            return (lambda: _lib.ndarray.from_numpy(a)), None
+
+        def d2h(shape=shape):
+            x = _device(shape, dtype)
+            return (lambda: x.to_numpy()), None
+
+        def d2h_pinned(shape=shape):
+            x = _device(shape, dtype)
+            out = _npu.empty_pinned(list(shape), dtype)
+            return (lambda: x.to_numpy(out=out)), None
+
+        for op, setup in (("h2d", h2d), ("h2d_pinned", h2d_pinned), ("d2h", d2h), ("d2h_pinned", d2h_pinned)):
+            yield Case("transfer", op, dtype, shape, setup, metric="host", bytes=nbytes)
+
+
+def elementwise(quick):
+    """Memory-bound unary and binary ufuncs."""
+    shapes = [(1 << 10,), (256, 256)] if quick else [(1 << 10,), (1024, 1024), (4096, 4096)]
+    ops = [("add", 2, _fusion.add, _np.add), ("multiply", 2, _fusion.multiply, _np.multiply),
+           ("exp", 1, _fusion.exp, _np.exp)]
+    for dtype in (_np.float32, _np.float16):
+        for shape in shapes:
+            for op, arity, fn, np_fn in ops:
+                def setup(shape=shape, dtype=dtype, arity=arity, fn=fn, np_fn=np_fn):
+                    xs = [_device(shape, dtype, seed) for seed in range(arity)]
+                    hs = [_host(shape, dtype, seed) for seed in range(arity)]
+                    return (lambda: fn(*xs)), (lambda: np_fn(*hs))
+
+                nbytes = (arity + 1) * _size(shape) * _np.dtype(dtype).itemsize
+                yield Case("elementwise", op, dtype, shape, setup, bytes=nbytes)
+
+
+def reduction(quick):
+    """Sums over the whole array and along the first axis."""
+    shapes = [(256, 256)] if quick else [(1024, 1024), (4096, 4096)]
+    for dtype in (_np.float32, _np.float16):
+        for shape in shapes:
+            def total(shape=shape, dtype=dtype):
+                x, a = _device(shape, dtype), _host(shape, dtype)
+                return (lambda: _lib.sum(x)), (lambda: _np.sum(a))
+
+            def axis0(shape=shape, dtype=dtype):
+                x, a = _device(shape, dtype), _host(shape, dtype)
+                return (lambda: _lib.sum(x, 0, False)), (lambda: _np.sum(a, axis=0))
+
+            nbytes = _size(shape) * _np.dtype(dtype).itemsize
+            yield Case("reduction", "sum", dtype, shape, total, bytes=nbytes)
+            yield Case("reduction", "sum_axis0", dtype, shape, axis0, bytes=nbytes)
+
+
+def linalg(quick):
+    """Square matmul; NumPy has no fast float16 matmul, so it is compared for float32 only."""
+    sizes = [64, 256] if quick else [256, 1024, 2048]
+    for dtype in (_np.float32, _np.float16):
+        for n in sizes:
+            def setup(n=n, dtype=dtype):
+                x, y = _device((n, n), dtype, 0), _device((n, n), dtype, 1)
+                a, b = _host((n, n), dtype, 0), _host((n, n), dtype, 1)
+                np_fn = (lambda: _np.matmul(a, b)) if dtype == _np.float32 else None
+                return (lambda: _lib.matmul(x, y)), np_fn
+
+            nbytes = 3 * n * n * _np.dtype(dtype).itemsize
+            yield Case("linalg", "matmul", dtype, (n, n), setup, bytes=nbytes, flops=2 * n ** 3)
+
+
+def random(quick):
+    """Counter-based generators filling fresh arrays."""
+    shapes = [(1 << 16,)] if quick else [(1 << 16,), (1 << 24,)]
+    dtype = _np.dtype(_np.float32)
+    for shape in shapes:
+        def uniform(shape=shape):
+            g, rng = _lib.random.default_rng(0), _np.random.default_rng(0)
+            return (lambda: g.random(list(shape), dtype=dtype)), (lambda: rng.random(shape, dtype=dtype))
+
+        def normal(shape=shape):
+            # normal() has no dtype argument and samples float64
+            g, rng = _lib.random.default_rng(0), _np.random.default_rng(0)
+            return (lambda: g.normal(size=list(shape))), (lambda: rng.standard_normal(shape))
+
+        nbytes = _size(shape) * dtype.itemsize
+        yield Case("random", "uniform", dtype, shape, uniform, bytes=nbytes)
+        yield Case("random", "normal", _np.float64, shape, normal, bytes=2 * nbytes)
+
+
+SUITES = {
+    "dispatch": dispatch,
+    "transfer": transfer,
+    "elementwise": elementwise,
+    "reduction": reduction,
+    "linalg": linalg,
+    "random": random,
+}
+
+
+def cases(quick=False):
+    """All cases of all suites, in suite order."""
+    for suite in SUITES.values():
+        yield from suite(quick)
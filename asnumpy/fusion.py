@@ -0,0 +1,322 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+"""
+asnumpy.fusion
+--------------
+Lazy evaluation of elementwise ufunc chains.
+
+Inside ``with asnumpy.lazy():`` the fusible ufuncs return LazyArray nodes
+instead of launching kernels. A chain runs as one program when its value is
+needed (``compute()``, ``to_numpy()``, or passing it to any function or
+operator that takes an ndarray, which converts it through
+``__asnumpy_array__``):
+
+- repeated inputs are uploaded once;
+- ``x + y * z`` becomes one addcmul and ``x + a * y`` one add with alpha;
+- intermediates that die inside the chain are overwritten in place, so a
+  chain of N ops allocates one output buffer instead of N.
+
+Implements:
+- lazy
+- LazyArray
+- add, subtract, multiply, divide, negative, absolute, square,
+  exp, log, sin, cos, tanh, reciprocal
+"""
+
+import contextlib
+import numbers
+import threading
+
+import numpy as _np
+
+from . import lib as _lib
+from .lib.asnumpy_core import fusion as _core
+
+_UNARY = ("negative", "absolute", "square", "exp", "log", "sin", "cos", "tanh", "reciprocal")
+_BINARY = ("add", "subtract", "multiply", "divide")
+_FLOAT_DTYPES = (_np.dtype(_np.float16), _np.dtype(_np.float32), _np.dtype(_np.float64))
+
+# eager 实现，在 fallback 路径中使用
+_EAGER = {name: getattr(_lib, name) for name in _UNARY + _BINARY}
+
+_state = threading.local()
+
+# (op, operand dtypes, scalar type) -> result dtype of the eager ufunc
+_result_dtypes = {}
+
+
+@contextlib.contextmanager
+def lazy():
+    """
+    Defer fusible elementwise ufuncs until their result is needed.
+
+    Example:
+        with ap.lazy():
+            y = ap.add(ap.multiply(a, b), c)   # nothing launched yet
+        out = y.compute()                       # one addcmul
+    """
+    _state.depth = getattr(_state, "depth", 0) + 1
+    try:
+        yield
+    finally:
+        _state.depth -= 1
+
+
+def _is_lazy():
+    return getattr(_state, "depth", 0) > 0
+
+
+def _is_scalar(x):
+    return isinstance(x, numbers.Real) and not isinstance(x, bool)
+
+
+class LazyArray:
+    """
+    Deferred result of an elementwise ufunc.
+
+    Holds the op, its arguments (ndarray or LazyArray) and an optional
+    Python scalar, kept as given so the eager fallback promotes like eager
+    mode. shape and dtype are known without running anything; the value is
+    computed once and cached. Passing it where an ndarray is expected
+    computes it.
+    """
+
+    __slots__ = ("op", "args", "scalar", "shape", "dtype", "_value")
+
+    def __init__(self, op, args, scalar=0.0):
+        self.op = op
+        self.args = tuple(args)
+        self.scalar = scalar
+        shape = tuple(self.args[0].shape)
+        for arg in self.args[1:]:
+            shape = _np.broadcast_shapes(shape, tuple(arg.shape))
+        self.shape = shape
+        self.dtype = _result_dtype(op, self.args, scalar)
+        self._value = None
+
+    def compute(self):
+        """Run the pending chain and return the result as an ndarray."""
+        if self._value is None:
+            _run(self)
+        return self._value
+
+    def to_numpy(self):
+        return self.compute().to_numpy()
+
+    def __asnumpy_array__(self):
+        return self.compute()
+
+    def __repr__(self):
+        state = "computed" if self._value is not None else "pending"
+        return f"LazyArray(op={self.op}, shape={self.shape}, dtype={self.dtype}, {state})"
+
+    def __neg__(self):
+        return _apply("negative", self)
+
+    def __abs__(self):
+        return _apply("absolute", self)
+
+    def __add__(self, other):
+        return _apply("add", self, other)
+
+    def __radd__(self, other):
+        return _apply("add", other, self)
+
+    def __sub__(self, other):
+        return _apply("subtract", self, other)
+
+    def __rsub__(self, other):
+        return _apply("subtract", other, self)
+
+    def __mul__(self, other):
+        return _apply("multiply", self, other)
+
+    def __rmul__(self, other):
+        return _apply("multiply", other, self)
+
+    def __truediv__(self, other):
+        return _apply("divide", self, other)
+
+    def __rtruediv__(self, other):
+        return _apply("divide", other, self)
+
+
+def _result_dtype(op, args, scalar):
+    """dtype the eager ufunc gives for these operands, probed once on empty arrays."""
+    key = (op, tuple(arg.dtype for arg in args), type(scalar))
+    dtype = _result_dtypes.get(key)
+    if dtype is None:
+        # 0 长度数组不启动内核，直接得到 eager 模式的结果类型
+        probes = [_lib.empty((0,), arg.dtype) for arg in args]
+        dtype = _result_dtypes[key] = _call_eager(op, probes, scalar).dtype
+    return dtype
+
+
+def _apply(name, *args):
+    """Build the node for ufunc name, folding Python scalars into the op."""
+    if len(args) == 1:
+        return LazyArray(name, args)
+    x1, x2 = args
+    if _is_scalar(x2):
+        return LazyArray(name + "_scalar", (x1,), x2)
+    if _is_scalar(x1):
+        if name in ("subtract", "divide"):
+            return LazyArray("r" + name + "_scalar", (x2,), x1)
+        return LazyArray(name + "_scalar", (x2,), x1)
+    return LazyArray(name, args)
+
+
+def _topological_order(root):
+    """Pending nodes reachable from root, producers first."""
+    order, seen = [], set()
+    stack = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            order.append(node)
+            continue
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        stack.append((node, True))
+        for arg in node.args:
+            if isinstance(arg, LazyArray) and arg._value is None:
+                stack.append((arg, False))
+    return order
+
+
+def _leaf(arg):
+    return arg._value if isinstance(arg, LazyArray) else arg
+
+
+def _run(root):
+    order = _topological_order(root)
+
+    leaves = {}
+    for node in order:
+        for arg in node.args:
+            if not isinstance(arg, LazyArray) or arg._value is not None:
+                leaves.setdefault(id(_leaf(arg)), _leaf(arg))
+    inputs = list(leaves.values())
+
+    if all(x.dtype == inputs[0].dtype for x in inputs) and inputs[0].dtype in _FLOAT_DTYPES:
+        root._value = _execute_fused(order, root, inputs)
+    else:
+        # 混合或整型 dtype: 逐个节点 eager 执行，保持与非 lazy 模式一致的类型规则
+        root._value = _execute_eager(order)
+    root.args = ()
+
+
+def _fold_candidates(order, root):
+    """Map add/subtract nodes onto a single-use multiply operand they can absorb."""
+    uses = {}
+    for node in order:
+        for arg in node.args:
+            uses[id(arg)] = uses.get(id(arg), 0) + 1
+
+    def foldable(arg):
+        return (isinstance(arg, LazyArray) and arg._value is None and arg is not root
+                and uses[id(arg)] == 1 and arg.op in ("multiply", "multiply_scalar"))
+
+    folds = {}
+    for node in order:
+        if node.op not in ("add", "subtract"):
+            continue
+        x, m = node.args
+        if not foldable(m) and node.op == "add" and foldable(x):
+            x, m = m, x
+        if foldable(m) and m is not x:
+            folds[id(node)] = (x, m, -1.0 if node.op == "subtract" else 1.0)
+    return folds
+
+
+def _execute_fused(order, root, inputs):
+    folds = _fold_candidates(order, root)
+    skipped = {id(m) for _, m, _ in folds.values()}
+
+    ids = {id(x): i for i, x in enumerate(inputs)}
+
+    def value_id(arg):
+        return ids[id(_leaf(arg))] if not isinstance(arg, LazyArray) or arg._value is not None else ids[id(arg)]
+
+    program = []
+    for node in order:
+        if id(node) in skipped:
+            continue
+        if id(node) in folds:
+            x, m, sign = folds[id(node)]
+            if m.op == "multiply":
+                instruction = ("addcmul", [value_id(x), value_id(m.args[0]), value_id(m.args[1])], sign)
+            else:
+                instruction = ("add_scaled", [value_id(x), value_id(m.args[0])], sign * m.scalar)
+        elif node.op == "rdivide_scalar":
+            # s / x 没有对应内核：先取倒数再乘以 s
+            program.append(("reciprocal", [value_id(node.args[0])], 0.0))
+            instruction = ("multiply_scalar", [len(inputs) + len(program) - 1], float(node.scalar))
+        else:
+            instruction = (node.op, [value_id(arg) for arg in node.args], float(node.scalar))
+        ids[id(node)] = len(inputs) + len(program)
+        program.append(instruction)
+
+    return _core.execute(program, inputs, [ids[id(root)]])[0]
+
+
+def _execute_eager(order):
+    values = {}
+
+    def value(arg):
+        return values[id(arg)] if id(arg) in values else _leaf(arg)
+
+    for node in order:
+        values[id(node)] = _call_eager(node.op, [value(arg) for arg in node.args], node.scalar)
+    return values[id(order[-1])]
+
+
+def _call_eager(op, args, scalar):
+    if op.endswith("_scalar"):
+        # 标量直接交给 eager ufunc，类型提升与非 lazy 模式一致
+        name = op[:-len("_scalar")]
+        if name.startswith("r"):
+            return _EAGER[name[1:]](scalar, args[0])
+        return _EAGER[name](args[0], scalar)
+    return _EAGER[op](*args)
+
+
+def _make_ufunc(name, nin):
+    eager = _EAGER[name]
+
+    def ufunc(*args, **kwargs):
+        # eager 模式直接调用 C++ 函数；LazyArray 参数由绑定层转换
+        if not getattr(_state, "depth", 0):
+            return eager(*args, **kwargs)
+        fusible = (len(args) == nin and kwargs.get("dtype") is None and kwargs.get("out") is None
+                   and all(isinstance(a, (_lib.ndarray, LazyArray)) or _is_scalar(a) for a in args)
+                   and any(not _is_scalar(a) for a in args))
+        if fusible:
+            return _apply(name, *args)
+        return eager(*args, **kwargs)
+
+    ufunc.__name__ = ufunc.__qualname__ = name
+    ufunc.__doc__ = eager.__doc__
+    return ufunc
+
+
+for _name in _UNARY:
+    globals()[_name] = _make_ufunc(_name, 1)
+for _name in _BINARY:
+    globals()[_name] = _make_ufunc(_name, 2)
+del _name
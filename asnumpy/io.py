@@ -24,10 +24,12 @@ Implements:
 - savez
 - savez_compressed
 - load
+- iter_chunks
 """
 
 import numpy as _np
 from .lib import ndarray as NPUArray
+from .lib import npu as _npu
 
 def _to_numpy(x):
     """
@@ -113,7 +115,78 @@ class _AsnpNpz:
         return self._cache[key]
 
 
-def load(file, mmap_mode=None, allow_pickle=False, **kwargs):
+def _chunk_bounds(length, chunks):
+    """Start/stop of chunks pieces of length rows, sized like numpy.array_split."""
+    chunks = max(1, min(int(chunks), length))
+    size, extra = divmod(length, chunks)
+    start = 0
+    for i in range(chunks):
+        stop = start + size + (1 if i < extra else 0)
+        yield start, stop
+        start = stop
+
+
+def iter_chunks(file, chunks):
+    """
+    Stream a .npy file to the device in chunks along the first axis.
+
+    The file is memory-mapped, so neither the host nor the device ever holds
+    the whole array. Uploads run on a separate stream and are double-buffered:
+    chunk k+1 is copied while the caller's kernels on chunk k run on the
+    current stream.
+
+    Parameters
+    ----------
+    file : str or file-like
+        Path of a .npy file.
+    chunks : int
+        Number of pieces, sized like numpy.array_split; 0-d arrays give one.
+
+    Yields
+    ------
+    NPUArray
+        Consecutive row blocks, ready to use on the current stream.
+
+    Example:
+        total = None
+        for block in asnumpy.io.iter_chunks("big.npy", chunks=16):
+            s = asnumpy.sum(block)
+            total = s if total is None else total + s
+    """
+    host = _np.load(file, mmap_mode="r")
+    if not isinstance(host, _np.ndarray):
+        raise ValueError("iter_chunks: only .npy files can be read in chunks")
+    if chunks < 1:
+        raise ValueError("iter_chunks: chunks must be >= 1")
+    if host.ndim == 0 or host.shape[0] == 0:
+        pieces = [(None, None)]
+    else:
+        pieces = list(_chunk_bounds(host.shape[0], chunks))
+
+    compute = _npu.current_stream()
+    copy = _npu.Stream()
+
+    def upload(bounds):
+        start, stop = bounds
+        block = host if start is None else host[start:stop]
+        array = NPUArray.from_numpy(block, stream=copy, non_blocking=True)
+        return array, copy.record()
+
+    pending = upload(pieces[0])
+    for k in range(len(pieces)):
+        array, ready = pending
+        if k + 1 < len(pieces):
+            # overlap the next block's copy with the caller's work on this one
+            pending = upload(pieces[k + 1])
+        compute.wait_event(ready)
+        yield array
+        # later uploads may reuse this block's memory, so they wait for the
+        # work the caller has queued on it
+        del array
+        copy.wait_event(compute.record())
+
+
+def load(file, mmap_mode=None, allow_pickle=False, chunks=None, **kwargs):
     """
     Load array(s) from .npy or .npz file.
 
@@ -125,9 +198,14 @@ def load(file, mmap_mode=None, allow_pickle=False, **kwargs):
         If not None, memory-map the file (host side only).
     allow_pickle : bool, default False
         Allow loading pickled object arrays.
+    chunks : int, optional
+        If given, return iter_chunks(file, chunks): a generator streaming the
+        .npy file to the device chunk by chunk instead of one upload.
     kwargs : dict
         Other keyword args passed to numpy.load.
     """
+    if chunks is not None:
+        return iter_chunks(file, chunks)
     obj = _np.load(file, mmap_mode=mmap_mode, allow_pickle=allow_pickle, **kwargs)
 
     if isinstance(obj, _np.ndarray):
@@ -21,6 +21,9 @@ from .asnumpy_core.cann import *
 from .asnumpy_core.array import *
 from .asnumpy_core.logic import * 
 from .asnumpy_core import linalg  
+from .asnumpy_core import npu
+from .asnumpy_core import random
+from .asnumpy_core.npu import Stream, Event, Device
 # linalg模块内部分需要ap.linalg.xxx调用，部分ap.yyy调用，
 # yyy类函数分到了.asnumpy_core根模块中
 
@@ -36,17 +39,29 @@ __all__ = [
     "ones",
     "ones_like",
     "identity",
+    "reshape",
+    "transpose",
+    "squeeze",
+    "expand_dims",
     "ndarray",
     "init",
     "finalize",
     "set_device",
     "reset_device",
     "broadcast_shape",
+    "promote_types",
+    "result_type",
+    "from_dlpack",
     "absolute",
     "fabs",
     "sign",
     "heaviside",
     "linalg",  # linalg整个子模块
+    "npu",
+    "random",  # random整个子模块，含 Generator / default_rng
+    "Stream",
+    "Event",
+    "Device",
     "dot",
     "vdot",
     "inner",
@@ -0,0 +1,162 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+"""
+asnumpy.profiler
+----------------
+Op-level profiling.
+
+Inside ``with asnumpy.profiler.profile() as prof:`` every aclnn operator is
+recorded with its operand shapes and dtypes, the host time spent planning it
+(aclnnXxxGetWorkspaceSize), its workspace size and its device time, measured
+with events around the launch. Host/device copies are recorded with their
+size. Leaving the block waits for the device to read the events.
+
+Example:
+    with ap.profiler.profile() as prof:
+        y = ap.add(ap.multiply(a, b), c)
+    print(prof.table(sort_by="device_time"))
+    prof.export_chrome_trace("trace.json")     # open in chrome://tracing
+
+Implements:
+- profile
+"""
+
+import json
+
+from .lib import npu as _npu
+
+_SORT_KEYS = ("device_time", "host_time", "plan_time", "calls", "workspace_bytes", "bytes", "name")
+
+
+class profile:
+    """
+    Record operators and copies while the block runs.
+
+    After the block, ``records`` holds one ProfilerRecord per operator launch
+    or copy, ordered by start time. Sessions do not nest.
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def __enter__(self):
+        _npu.start_profiler()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.records = _npu.stop_profiler()
+        return False
+
+    def key_averages(self, group_by_shape=False):
+        """
+        Aggregate the records by name, or by name and operand shapes.
+
+        Returns:
+            list of dict with name, shapes, dtypes, calls, cached, host_time,
+            plan_time, device_time (totals in microseconds), workspace_bytes
+            (largest) and bytes (total).
+        """
+        rows = {}
+        for r in self.records:
+            key = (r.name, tuple(map(tuple, r.shapes))) if group_by_shape else r.name
+            row = rows.get(key)
+            if row is None:
+                row = rows[key] = {
+                    "name": r.name, "shapes": r.shapes if group_by_shape else None,
+                    "dtypes": r.dtypes if group_by_shape else None, "calls": 0, "cached": 0,
+                    "host_time": 0.0, "plan_time": 0.0, "device_time": 0.0,
+                    "workspace_bytes": 0, "bytes": 0,
+                }
+            row["calls"] += 1
+            row["cached"] += r.cached
+            row["host_time"] += r.host_time
+            row["plan_time"] += r.plan_time
+            row["device_time"] += max(r.device_time, 0.0)
+            row["workspace_bytes"] = max(row["workspace_bytes"], r.workspace_bytes)
+            row["bytes"] += r.bytes
+        return list(rows.values())
+
+    def table(self, sort_by="device_time", row_limit=None, group_by_shape=False):
+        """
+        Format key_averages() as a text table, largest first.
+
+        Args:
+            sort_by: one of device_time, host_time, plan_time, calls,
+                workspace_bytes, bytes or name.
+            row_limit: show at most this many rows.
+            group_by_shape: one row per operand shapes instead of per name.
+        """
+        if sort_by not in _SORT_KEYS:
+            raise ValueError(f"sort_by must be one of {', '.join(_SORT_KEYS)}, got {sort_by!r}")
+        rows = self.key_averages(group_by_shape)
+        rows.sort(key=lambda row: row[sort_by], reverse=sort_by != "name")
+        if row_limit is not None:
+            rows = rows[:row_limit]
+
+        headers = ["Name", "Calls", "Cached", "Host total (us)", "Plan total (us)",
+                   "Device total (us)", "Device avg (us)", "Workspace (B)", "Copied (B)"]
+        if group_by_shape:
+            headers[1:1] = ["Shapes", "Dtypes"]
+        lines = []
+        for row in rows:
+            line = [row["name"], row["calls"], row["cached"], f"{row['host_time']:.1f}",
+                    f"{row['plan_time']:.1f}", f"{row['device_time']:.1f}",
+                    f"{row['device_time'] / row['calls']:.1f}", row["workspace_bytes"], row["bytes"]]
+            if group_by_shape:
+                line[1:1] = [" ".join(str(tuple(s)) for s in row["shapes"]), " ".join(row["dtypes"])]
+            lines.append([str(x) for x in line])
+
+        widths = [max([len(h)] + [len(line[i]) for line in lines]) for i, h in enumerate(headers)]
+        fmt = "  ".join(("{:<%d}" if i == 0 else "{:>%d}") % w for i, w in enumerate(widths))
+        out = [fmt.format(*headers), "  ".join("-" * w for w in widths)]
+        out += [fmt.format(*line) for line in lines]
+        return "\n".join(out)
+
+    def export_chrome_trace(self, path):
+        """
+        Write the records as a chrome://tracing (Trace Event Format) JSON file.
+
+        Host work appears under the "host" process, one track per thread, with
+        the planning part as a nested slice. Device work appears under one
+        process per device, one track per stream; its start is placed through
+        the first event recorded on the stream, so it is exact relative to the
+        other work of the stream.
+        """
+        events = [{"ph": "M", "name": "process_name", "pid": 0, "args": {"name": "host"}}]
+        devices = set()
+        for r in self.records:
+            args = {"shapes": r.shapes, "dtypes": r.dtypes}
+            if r.copy:
+                args["bytes"] = r.bytes
+            else:
+                args.update(plan_time=r.plan_time, workspace_bytes=r.workspace_bytes, cached=r.cached)
+            cat = "copy" if r.copy else "op"
+            events.append({"ph": "X", "cat": cat, "name": r.name, "pid": 0, "tid": r.thread,
+                           "ts": r.start, "dur": r.host_time, "args": args})
+            if not r.copy and r.plan_time > 0:
+                events.append({"ph": "X", "cat": "plan", "name": r.name + " plan", "pid": 0,
+                               "tid": r.thread, "ts": r.start, "dur": r.plan_time})
+            if r.device_time >= 0 and r.device_start >= 0:
+                devices.add(r.device)
+                events.append({"ph": "X", "cat": cat, "name": r.name, "pid": r.device + 1,
+                               "tid": r.stream, "ts": r.device_start, "dur": r.device_time,
+                               "args": args})
+        for device in sorted(devices):
+            events.append({"ph": "M", "name": "process_name", "pid": device + 1,
+                           "args": {"name": f"device {device}"}})
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
@@ -0,0 +1,54 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#pragma once
+
+#include "../utils/npu_array.hpp"
+
+#include <optional>
+#include <vector>
+
+/**
+ * @brief Give a new shape to an array without changing its data.
+ * @param a Input array.
+ * @param newshape New shape; one entry may be -1.
+ * @return NPUArray A view if a is contiguous, otherwise a copy.
+ */
+NPUArray Reshape(const NPUArray& a, const std::vector<int64_t>& newshape);
+
+/**
+ * @brief Permute the axes of an array.
+ * @param a Input array.
+ * @param axes Permutation of the axes; reverses them if not given.
+ * @return NPUArray A view of a.
+ */
+NPUArray Transpose(const NPUArray& a, std::optional<std::vector<int64_t>> axes = std::nullopt);
+
+/**
+ * @brief Remove axes of length one.
+ * @param a Input array.
+ * @param axis Axis to remove; all length-one axes if not given.
+ * @return NPUArray A view of a.
+ */
+NPUArray Squeeze(const NPUArray& a, std::optional<int64_t> axis = std::nullopt);
+
+/**
+ * @brief Insert an axis of length one.
+ * @param a Input array.
+ * @param axis Position of the new axis in the result.
+ * @return NPUArray A view of a.
+ */
+NPUArray ExpandDims(const NPUArray& a, int64_t axis);
@@ -23,8 +23,47 @@
 namespace asnumpy {
 namespace cann {
 
+/**
+ * The ACL runtime is brought up lazily: nothing touches the driver at import
+ * time. The first thread that needs a stream, an allocation or an event calls
+ * ensure_initialized(), which runs aclInit once per process and binds the
+ * calling thread to the selected device. The device is the one passed to
+ * set_device(), else the ASNUMPY_DEVICE environment variable, else 0.
+ *
+ * Each device gets one context, created the first time any thread uses the
+ * device. Switching a thread between devices (use_device(), npu::Device)
+ * only makes that context current, so it is cheap and not reference counted.
+ */
+
+/// Run aclInit once; later calls are no-ops until finalize().
 void init();
+
+/// Reset every device in use and run aclFinalize, if the runtime was brought up.
 void finalize();
 
+/// Whether init() has run and finalize() has not.
+bool is_initialized();
+
+/// Select device_id for the process and bind the calling thread to it.
+void set_device(int32_t device_id);
+
+/// Bind the calling thread to device_id without changing the process default.
+void use_device(int32_t device_id);
+
+/// Release device_id; every thread rebinds on its next device use.
+void reset_device(int32_t device_id);
+
+/// Number of devices visible to the process.
+int32_t device_count();
+
+/// Devices that have a context, in ascending order.
+std::vector<int32_t> active_devices();
+
+/// Device the calling thread uses, or would use on its first device access.
+int32_t current_device();
+
+/// Bring up the runtime and bind the calling thread, if not done yet.
+void ensure_initialized();
+
 }
 }
\ No newline at end of file
@@ -0,0 +1,67 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#pragma once
+
+#include <asnumpy/utils/npu_array.hpp>
+
+#include <cstdint>
+#include <string>
+#include <vector>
+
+namespace asnumpy {
+namespace fusion {
+
+/**
+ * @brief One step of an elementwise program.
+ *
+ * Values are numbered in SSA form: ids [0, n_inputs) are the program
+ * inputs, and instruction i defines value n_inputs + i.
+ *
+ * Supported ops:
+ * - unary: negative, absolute, square, sqrt, exp, log, sin, cos, tanh, reciprocal
+ * - binary: add, subtract, multiply, divide
+ * - with scalar: add_scalar, subtract_scalar, rsubtract_scalar (scalar - x),
+ *   multiply_scalar, divide_scalar
+ * - fused: add_scaled (x + scalar * y), addcmul (x + scalar * y * z)
+ */
+struct Instruction {
+    std::string op;
+    std::vector<int64_t> operands;
+    double scalar = 0.0;
+};
+
+/**
+ * @brief Execute an elementwise program with temporaries reused in place.
+ *
+ * Every instruction is one aclnn launch on the current stream. A temporary
+ * whose last use is the current instruction and whose shape and dtype match
+ * the result is overwritten by an in-place kernel instead of allocating a
+ * new buffer; other dead temporaries are returned to the memory pool right
+ * away. Inputs are never written.
+ *
+ * @param program Instructions in execution order.
+ * @param inputs Input arrays, all of the same dtype.
+ * @param outputs Value ids to return.
+ * @return std::vector<NPUArray> One array per requested output.
+ * @throws std::invalid_argument If an op is unknown or an operand is undefined.
+ */
+std::vector<NPUArray> Execute(const std::vector<Instruction>& program,
+                              const std::vector<const NPUArray*>& inputs,
+                              const std::vector<int64_t>& outputs);
+
+}
+}
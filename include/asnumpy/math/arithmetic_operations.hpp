@@ -75,6 +75,18 @@ NPUArray Positive(const NPUArray& x, std::optional<py::dtype> dtype = std::nullo
  */
 NPUArray Negative(const NPUArray& x, std::optional<py::dtype> dtype = std::nullopt);
 
+/**
+ * @brief In-place reciprocal and negation: x = 1 / x, x = -x.
+ *
+ * Runs aclnnInplaceReciprocal / aclnnInplaceNeg on x, which keeps its dtype.
+ * Used for out= when out already has the result dtype.
+ *
+ * @param x Array updated in place.
+ * @throws std::runtime_error If the ACL operation fails.
+ */
+void InplaceReciprocal(NPUArray& x);
+void InplaceNegative(NPUArray& x);
+
 /**
  * @brief Element-wise multiplication of two arrays with broadcasting.
  *
@@ -292,4 +304,77 @@ NPUArray Remainder(const NPUArray& x1, const NPUArray& x2, std::optional<py::dty
  */
 std::pair<NPUArray, NPUArray> Divmod(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dtype = std::nullopt);
 
+/**
+ * @brief Array-scalar arithmetic: x op scalar, or scalar op x for the reversed forms.
+ *
+ * The scalar is passed to the aclnn*s / *Scalar kernel as an aclScalar
+ * (aclnnAdds, aclnnSubs, aclnnRsubs, aclnnMuls, aclnnDivs, aclnnFloorDivides,
+ * aclnnRemainderTensorScalar, aclnnRemainderScalarTensor, aclnnFmodScalar), so
+ * no array is broadcast from it. The aclScalar is taken from GetCachedScalar. Without dtype the result keeps the array's dtype, except
+ * that an integer or bool array with a Python float gives float64, a bool array
+ * with a Python int gives int64, and division of an integer array gives float64.
+ *
+ * @param x Array operand.
+ * @param scalar Python bool, int or float.
+ * @param dtype (optional) Target dtype for the output array.
+ * @return NPUArray Array of x's shape.
+ * @throws std::invalid_argument If scalar is not a real number.
+ * @throws std::runtime_error If the ACL operation fails.
+ */
+NPUArray Add(const NPUArray& x, const py::object& scalar, std::optional<py::dtype> dtype = std::nullopt);
+NPUArray Subtract(const NPUArray& x, const py::object& scalar, std::optional<py::dtype> dtype = std::nullopt);
+NPUArray Subtract(const py::object& scalar, const NPUArray& x, std::optional<py::dtype> dtype = std::nullopt);
+NPUArray Multiply(const NPUArray& x, const py::object& scalar, std::optional<py::dtype> dtype = std::nullopt);
+NPUArray Divide(const NPUArray& x, const py::object& scalar, std::optional<py::dtype> dtype = std::nullopt);
+NPUArray Divide(const py::object& scalar, const NPUArray& x, std::optional<py::dtype> dtype = std::nullopt);
+NPUArray FloorDivide(const NPUArray& x, const py::object& scalar, std::optional<py::dtype> dtype = std::nullopt);
+NPUArray FloorDivide(const py::object& scalar, const NPUArray& x, std::optional<py::dtype> dtype = std::nullopt);
+NPUArray Mod(const NPUArray& x, const py::object& scalar, std::optional<py::dtype> dtype = std::nullopt);
+NPUArray Mod(const py::object& scalar, const NPUArray& x, std::optional<py::dtype> dtype = std::nullopt);
+NPUArray Fmod(const NPUArray& x, const py::object& scalar, std::optional<py::dtype> dtype = std::nullopt);
+
+/**
+ * @brief In-place element-wise operations: x1 = x1 op x2.
+ *
+ * Each function writes into x1 with the matching aclnnInplace* kernel, so no
+ * result array is allocated. x2 is broadcast to x1's shape and the result is
+ * computed in x1's dtype. Used for out= when out is the first operand and for
+ * the augmented assignment operators (+=, -=, ...) of ndarray.
+ *
+ * @param x1 Array updated in place.
+ * @param x2 Second operand, broadcastable to x1's shape.
+ * @throws std::invalid_argument If broadcasting x1 with x2 would change x1's shape.
+ * @throws std::runtime_error If the ACL operation fails.
+ */
+void InplaceAdd(NPUArray& x1, const NPUArray& x2);
+void InplaceSubtract(NPUArray& x1, const NPUArray& x2);
+void InplaceMultiply(NPUArray& x1, const NPUArray& x2);
+void InplaceDivide(NPUArray& x1, const NPUArray& x2);
+void InplaceFloorDivide(NPUArray& x1, const NPUArray& x2);
+void InplacePower(NPUArray& x1, const NPUArray& x2);
+void InplaceFmod(NPUArray& x1, const NPUArray& x2);
+void InplaceRemainder(NPUArray& x1, const NPUArray& x2);
+
+/**
+ * @brief In-place array-scalar operations: x = x op scalar.
+ *
+ * The scalar is converted to x's dtype and applied with the aclnnInplace*s /
+ * *TensorScalar kernel (aclnnInplaceAdds, aclnnInplaceSubs, aclnnInplaceMuls,
+ * aclnnInplaceDivs, aclnnInplacePowTensorScalar); floor division and remainder
+ * broadcast a 0-d array instead. Callers check that the result dtype can be
+ * cast to x's dtype.
+ *
+ * @param x Array updated in place.
+ * @param scalar Python bool, int or float.
+ * @throws std::invalid_argument If scalar is not a real number.
+ * @throws std::runtime_error If the ACL operation fails.
+ */
+void InplaceAdd(NPUArray& x, const py::object& scalar);
+void InplaceSubtract(NPUArray& x, const py::object& scalar);
+void InplaceMultiply(NPUArray& x, const py::object& scalar);
+void InplaceDivide(NPUArray& x, const py::object& scalar);
+void InplaceFloorDivide(NPUArray& x, const py::object& scalar);
+void InplacePower(NPUArray& x, const py::object& scalar);
+void InplaceRemainder(NPUArray& x, const py::object& scalar);
+
 }
\ No newline at end of file
@@ -41,4 +41,22 @@ namespace asnumpy {
     NPUArray Logaddexp(const NPUArray& x1, const NPUArray& x2);
 
     NPUArray Logaddexp2(const NPUArray& x1, const NPUArray& x2);
-}
\ No newline at end of file
+
+    /**
+     * @brief Exponentials and logarithms computed in place, x = f(x).
+     *
+     * aclnnInplaceExp, aclnnInplaceExpm1, aclnnInplaceExp2, aclnnInplaceLog,
+     * aclnnInplaceLog10, aclnnInplaceLog2 and aclnnInplaceLog1p write into x,
+     * which keeps its (floating-point) dtype. Used by exp(x, out=...) and friends.
+     *
+     * @param x Array overwritten with the result.
+     * @throws std::runtime_error If the ACL operation fails.
+     */
+    void InplaceExp(NPUArray& x);
+    void InplaceExpm1(NPUArray& x);
+    void InplaceExp2(NPUArray& x);
+    void InplaceLog(NPUArray& x);
+    void InplaceLog10(NPUArray& x);
+    void InplaceLog2(NPUArray& x);
+    void InplaceLog1p(NPUArray& x);
+}
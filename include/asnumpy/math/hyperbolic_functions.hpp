@@ -84,4 +84,19 @@ NPUArray Arccosh(const NPUArray& x, std::optional<py::dtype> dtype = std::nullop
  */
 NPUArray Arctanh(const NPUArray& x, std::optional<py::dtype> dtype = std::nullopt);
 
-}
\ No newline at end of file
+/**
+ * @brief Compute hyperbolic functions in place.
+ * 
+ * Runs aclnnInplaceSinh, aclnnInplaceCosh, aclnnInplaceTanh, aclnnInplaceAsinh,
+ * aclnnInplaceAcosh or aclnnInplaceAtanh on x. Used for out= when out already
+ * has x's floating-point dtype.
+ * 
+ * @param x NPUArray, overwritten with f(x)
+ */
+void InplaceSinh(NPUArray& x);
+void InplaceCosh(NPUArray& x);
+void InplaceTanh(NPUArray& x);
+void InplaceArcsinh(NPUArray& x);
+void InplaceArccosh(NPUArray& x);
+void InplaceArctanh(NPUArray& x);
+}
@@ -106,4 +106,16 @@ NPUArray Ceil(const NPUArray& x, std::optional<py::dtype> dtype = std::nullopt);
  */
 NPUArray Trunc(const NPUArray& x, std::optional<py::dtype> dtype = std::nullopt);
 
-}
\ No newline at end of file
+/**
+ * @brief Round in place: rint, floor, ceil and trunc (also used for fix).
+ * 
+ * Runs aclnnInplaceRound, aclnnInplaceFloor, aclnnInplaceCeil or aclnnInplaceTrunc
+ * on x, so the out= path of these ufuncs does not allocate a result array.
+ * 
+ * @param x NPUArray, overwritten with the rounded values
+ */
+void InplaceRint(NPUArray& x);
+void InplaceFloor(NPUArray& x);
+void InplaceCeil(NPUArray& x);
+void InplaceTrunc(NPUArray& x);
+}
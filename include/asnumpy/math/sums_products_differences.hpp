@@ -26,16 +26,16 @@
 
 namespace asnumpy {
     NPUArray Prod(const NPUArray& a, int64_t axis, bool keepdims, std::optional<py::dtype> dtype=std::nullopt);
-    double Prod(const NPUArray& a);
+    NPUArray Prod(const NPUArray& a);
 
     NPUArray Sum(const NPUArray& a, int64_t axis, bool keepdims, std::optional<py::dtype> dtype=std::nullopt);
-    double Sum(const NPUArray& a);
+    NPUArray Sum(const NPUArray& a);
         
     NPUArray Nanprod(const NPUArray& a, int64_t axis, bool keepdims, std::optional<py::dtype> dtype=std::nullopt);
-    double Nanprod(const NPUArray& a);
+    NPUArray Nanprod(const NPUArray& a);
 
     NPUArray Nansum(const NPUArray& a, int64_t axis, bool keepdims, std::optional<py::dtype> dtype=std::nullopt);
-    double Nansum(const NPUArray& a);
+    NPUArray Nansum(const NPUArray& a);
 
     NPUArray Cumprod(const NPUArray& a, int64_t axis, std::optional<py::dtype> dtype=std::nullopt);
 
@@ -130,4 +130,21 @@ namespace asnumpy {
     * @throws std::runtime_error If ACL operations encounter errors
     */
     NPUArray Radians(const NPUArray& x);
-}
\ No newline at end of file
+
+    /**
+    * @brief Compute trigonometric functions in place, x = f(x).
+    * 
+    * Calls aclnnInplaceSin, aclnnInplaceCos, aclnnInplaceTan, aclnnInplaceAsin,
+    * aclnnInplaceAcos or aclnnInplaceAtan on x, so no result array is allocated.
+    * The out= path of the matching ufuncs uses these once x is copied into out.
+    * 
+    * @param x Floating-point array, overwritten with the result.
+    * @throws std::runtime_error If ACL operation fails.
+    */
+    void InplaceSin(NPUArray& x);
+    void InplaceCos(NPUArray& x);
+    void InplaceTan(NPUArray& x);
+    void InplaceArcsin(NPUArray& x);
+    void InplaceArccos(NPUArray& x);
+    void InplaceArctan(NPUArray& x);
+}
@@ -0,0 +1,115 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+
+#pragma once
+
+#include <acl/acl.h>
+#include <cstddef>
+#include <cstdint>
+#include <mutex>
+#include <unordered_map>
+
+namespace asnumpy {
+namespace npu {
+
+/**
+ * @brief Handle to one NPU, usable as a context manager.
+ *
+ * Entering a Device makes it the calling thread's current device until the
+ * matching Exit(). Arrays, streams and workspaces created meanwhile belong to
+ * it and operators run on it, so the operands of an operator must live on the
+ * current device; NPUArray::To() moves an array to another one.
+ */
+class Device {
+public:
+    /**
+     * @brief Refer to device id.
+     * @throws std::invalid_argument If id is not a visible device.
+     */
+    explicit Device(int32_t id);
+
+    int32_t Id() const { return id_; }
+
+    /// Make this device current for the calling thread.
+    void Enter() const;
+
+    /// Restore the device that was current before Enter().
+    void Exit() const;
+
+    /// Block the host until all work on all streams of this device has finished.
+    void Synchronize() const;
+
+    /// Number of devices visible to the process.
+    static int32_t Count();
+
+private:
+    int32_t id_;
+};
+
+/**
+ * @brief Switch the calling thread to a device for the lifetime of the guard.
+ *
+ * Does nothing if the device is already current.
+ */
+class DeviceGuard {
+public:
+    explicit DeviceGuard(int32_t device);
+    ~DeviceGuard();
+    DeviceGuard(const DeviceGuard&) = delete;
+    DeviceGuard& operator=(const DeviceGuard&) = delete;
+
+private:
+    int32_t previous_;
+};
+
+/**
+ * @brief The instance of T for a device, created with T(device) on first use.
+ *
+ * Instances are leaked like the memory pool: device memory can no longer be
+ * returned once static destructors run after aclFinalize.
+ */
+template <typename T>
+T& PerDevice(int32_t device) {
+    static std::mutex mutex;
+    static std::unordered_map<int32_t, T*> instances;
+    std::lock_guard<std::mutex> lock(mutex);
+    T*& instance = instances[device];
+    if (instance == nullptr) {
+        instance = new T(device);
+    }
+    return *instance;
+}
+
+/**
+ * @brief Copy device memory from one device to another.
+ *
+ * Copies directly when the devices can access each other, enabling peer
+ * access on first use, and stages through pinned host memory otherwise.
+ * Returns once dst holds the data; the caller makes sure no queued work
+ * still writes src.
+ *
+ * @param dst Pointer on dstDevice.
+ * @param dstDevice Device owning dst.
+ * @param src Pointer on srcDevice.
+ * @param srcDevice Device owning src.
+ * @param size Number of bytes.
+ * @return aclError ACL_SUCCESS, or the first failing runtime error.
+ */
+aclError CopyPeer(void* dst, int32_t dstDevice, const void* src, int32_t srcDevice, size_t size);
+
+}
+}
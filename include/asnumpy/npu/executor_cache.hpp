@@ -0,0 +1,126 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#pragma once
+
+#include <asnumpy/utils/npu_array.hpp>
+
+#include <acl/acl.h>
+#include <aclnn/acl_meta.h>
+#include <cstddef>
+#include <cstdint>
+#include <functional>
+#include <list>
+#include <mutex>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+namespace asnumpy {
+namespace npu {
+
+/**
+ * @brief LRU cache of repeatable aclOpExecutors.
+ *
+ * Planning an aclnn call (aclnnXxxGetWorkspaceSize) costs more than the
+ * launch itself for small tensors. The cache keys a plan on the op name and
+ * the shapes, strides and dtypes of its tensors. On a miss the op is planned
+ * once against tensor descriptors owned by the cache and the executor is
+ * marked repeatable; on a hit only the device addresses are rebound with
+ * aclSetInputTensorAddr/aclSetOutputTensorAddr before launching.
+ *
+ * Lookup, rebinding and launch happen under one lock, so a cached executor
+ * is never rebound while another thread is launching it.
+ */
+class ExecutorCache {
+public:
+    /// Plans the op over the given tensors (inputs, then outputs).
+    using PlanFn = std::function<aclnnStatus(const std::vector<aclTensor*>& tensors,
+                                             uint64_t* workspaceSize, aclOpExecutor** executor)>;
+    /// The aclnnXxx launch function.
+    using LaunchFn = aclnnStatus (*)(void* workspace, uint64_t workspaceSize,
+                                     aclOpExecutor* executor, aclrtStream stream);
+
+    explicit ExecutorCache(size_t capacity = 256) : capacity_(capacity) {}
+    ~ExecutorCache();
+    ExecutorCache(const ExecutorCache&) = delete;
+    ExecutorCache& operator=(const ExecutorCache&) = delete;
+
+    /**
+     * @brief Plan (or reuse a plan for) an op and launch it on the current stream.
+     * @param op Operator name, part of the cache key.
+     * @param inputs Input arrays in the order the aclnn op takes them.
+     * @param outputs Output arrays in the order the aclnn op takes them.
+     * @param plan Calls aclnnXxxGetWorkspaceSize with the given tensors.
+     * @param launch The matching aclnnXxx function.
+     * @throws std::runtime_error If planning or launching fails.
+     */
+    void Run(const std::string& op,
+             const std::vector<const NPUArray*>& inputs,
+             const std::vector<const NPUArray*>& outputs,
+             const PlanFn& plan, LaunchFn launch);
+
+    /// Drop all cached executors.
+    void Clear();
+
+    /// Change the number of cached executors, evicting the oldest if needed.
+    void SetCapacity(size_t capacity);
+
+    /// Enable or disable caching; when disabled every call plans afresh.
+    void SetEnabled(bool enabled);
+
+    /// Reset the hit and miss counters.
+    void ResetStats();
+
+    size_t Hits() const;
+    size_t Misses() const;
+    size_t Size() const;
+    size_t Capacity() const;
+    bool Enabled() const;
+
+private:
+    struct Entry {
+        std::string key;
+        aclOpExecutor* executor = nullptr;
+        uint64_t workspaceSize = 0;
+        std::vector<aclTensor*> tensors;  // plan-time descriptors, inputs then outputs
+    };
+
+    static std::string MakeKey(const std::string& op,
+                               const std::vector<const NPUArray*>& inputs,
+                               const std::vector<const NPUArray*>& outputs);
+    static void Launch(const std::string& op, LaunchFn launch,
+                       aclOpExecutor* executor, uint64_t workspaceSize);
+    static void Destroy(Entry& entry);
+    void Evict();
+
+    std::list<Entry> entries_;  // most recently used first
+    std::unordered_map<std::string, std::list<Entry>::iterator> index_;
+    size_t capacity_;
+    size_t hits_ = 0;
+    size_t misses_ = 0;
+    bool enabled_ = true;
+    mutable std::mutex mutex_;
+};
+
+/**
+ * @brief Get the process-wide executor cache.
+ * @return ExecutorCache& The cache used by DEFINE_UNARY_OP/DEFINE_BINARY_OP ops.
+ */
+ExecutorCache& GetExecutorCache();
+
+}
+}
@@ -0,0 +1,169 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#pragma once
+
+#include <acl/acl.h>
+#include <cstddef>
+#include <cstdint>
+#include <mutex>
+#include <set>
+#include <unordered_map>
+
+namespace asnumpy {
+namespace npu {
+
+/**
+ * @brief Caching allocator for NPU device memory.
+ *
+ * Device memory is requested from the driver in large segments and handed out
+ * as size-rounded blocks. Freed blocks are kept in per-stream free lists and
+ * reused by later allocations on the same stream, so steady-state pipelines
+ * never go back to aclrtMalloc/aclrtFree.
+ *
+ * - Requests <= 1 MiB are served from 2 MiB segments (small pool), larger
+ *   ones from segments rounded up to 2 MiB (large pool).
+ * - A cached block that is bigger than the request is split, and the
+ *   remainder goes back to the free list.
+ * - On free, a block is merged with its free neighbours in the same segment.
+ * - If the driver runs out of memory, fully free segments are released and
+ *   the allocation is retried once.
+ *
+ * Every device has its own pool; see GetMemoryPool().
+ */
+class MemoryPool {
+public:
+    explicit MemoryPool(int32_t device = 0) : device_(device) {}
+    MemoryPool(const MemoryPool&) = delete;
+    MemoryPool& operator=(const MemoryPool&) = delete;
+
+    /**
+     * @brief Allocate device memory from the pool.
+     * @param size Requested size in bytes.
+     * @param stream Stream the memory will be used on.
+     * @return void* Device pointer, or nullptr if size is 0.
+     * @throws std::runtime_error If the driver allocation fails.
+     */
+    void* Malloc(size_t size, aclrtStream stream = nullptr);
+
+    /**
+     * @brief Non-throwing variant of Malloc.
+     * @param ptr Output device pointer, set to nullptr on failure.
+     * @param size Requested size in bytes.
+     * @param stream Stream the memory will be used on.
+     * @return aclError ACL_SUCCESS, or the driver error if allocation failed.
+     */
+    aclError Allocate(void** ptr, size_t size, aclrtStream stream = nullptr);
+
+    /**
+     * @brief Return a pointer obtained from Malloc to the pool.
+     * @param ptr Device pointer. nullptr is ignored.
+     * @throws std::runtime_error If ptr was not allocated by this pool.
+     */
+    void Free(void* ptr);
+
+    /**
+     * @brief Release all cached blocks whose segment is completely unused.
+     */
+    void FreeAllBlocks();
+
+    /// Bytes currently handed out to callers (rounded block sizes).
+    size_t UsedBytes() const;
+
+    /// Bytes currently held from the driver, used and cached.
+    size_t TotalBytes() const;
+
+    /// Bytes cached in the pool and not handed out.
+    size_t FreeBytes() const;
+
+    /// Number of cached free blocks.
+    size_t NumFreeBlocks() const;
+
+    /// Device the pool allocates on.
+    int32_t Device() const { return device_; }
+
+private:
+    struct Block {
+        void* ptr = nullptr;
+        size_t size = 0;
+        aclrtStream stream = nullptr;
+        bool allocated = false;
+        bool small = false;
+        Block* prev = nullptr;  // neighbours inside the same driver segment
+        Block* next = nullptr;
+    };
+
+    struct BlockComparator {
+        bool operator()(const Block* a, const Block* b) const {
+            if (a->stream != b->stream) {
+                return reinterpret_cast<uintptr_t>(a->stream) < reinterpret_cast<uintptr_t>(b->stream);
+            }
+            if (a->size != b->size) {
+                return a->size < b->size;
+            }
+            return reinterpret_cast<uintptr_t>(a->ptr) < reinterpret_cast<uintptr_t>(b->ptr);
+        }
+    };
+
+    using FreeList = std::set<Block*, BlockComparator>;
+
+    static size_t RoundSize(size_t size);
+    static size_t SegmentSize(size_t size);
+
+    Block* FindFreeBlock(FreeList& pool, size_t size, aclrtStream stream);
+    aclError AllocateSegment(Block** block, size_t size, aclrtStream stream, bool small);
+    void MergeBlocks(Block* dst, Block* src, FreeList& pool);
+    void ReleaseCachedSegments();
+
+    FreeList smallBlocks_;
+    FreeList largeBlocks_;
+    std::unordered_map<void*, Block*> activeBlocks_;
+    size_t usedBytes_ = 0;
+    size_t totalBytes_ = 0;
+    int32_t device_;
+    mutable std::recursive_mutex mutex_;
+};
+
+/**
+ * @brief Get the memory pool of the calling thread's current device.
+ * @return MemoryPool& The pool used by NPUArray and operator workspaces.
+ */
+MemoryPool& GetMemoryPool();
+
+/**
+ * @brief Get the memory pool of a device.
+ * @param device Device id.
+ * @return MemoryPool& The pool allocating on device.
+ */
+MemoryPool& GetMemoryPool(int32_t device);
+
+/**
+ * @brief Pool-backed drop-in for aclrtMalloc, on the current stream.
+ * @param ptr Output device pointer.
+ * @param size Requested size in bytes.
+ * @return aclError ACL_SUCCESS, or the driver error if allocation failed.
+ */
+aclError Malloc(void** ptr, size_t size);
+
+/**
+ * @brief Pool-backed drop-in for aclrtFree.
+ * @param ptr Device pointer obtained from Malloc.
+ * @return aclError ACL_SUCCESS.
+ */
+aclError Free(void* ptr);
+
+}
+}
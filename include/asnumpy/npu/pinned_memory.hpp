@@ -0,0 +1,114 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#pragma once
+
+#include <acl/acl.h>
+#include <cstddef>
+#include <map>
+#include <mutex>
+#include <vector>
+
+namespace asnumpy {
+namespace npu {
+
+/**
+ * @brief Caching allocator for page-locked host memory.
+ *
+ * Copies between device and page-locked (pinned) host memory run as DMA
+ * transfers at full bus bandwidth and can be queued asynchronously.
+ * aclrtMallocHost is expensive, so freed buffers are cached and handed out
+ * again for requests of up to twice their size.
+ *
+ * A buffer used by an asynchronous copy is tagged with an event on the
+ * copy's stream (RecordUse); once freed, it is only reused after all such
+ * events have completed.
+ */
+class PinnedMemoryPool {
+public:
+    PinnedMemoryPool() = default;
+    PinnedMemoryPool(const PinnedMemoryPool&) = delete;
+    PinnedMemoryPool& operator=(const PinnedMemoryPool&) = delete;
+
+    /**
+     * @brief Allocate page-locked host memory.
+     * @param size Requested size in bytes.
+     * @return void* Host pointer, nullptr if size is 0.
+     * @throws std::runtime_error If aclrtMallocHost fails.
+     */
+    void* Malloc(size_t size);
+
+    /**
+     * @brief Return a buffer obtained from Malloc to the pool.
+     * @param ptr Host pointer. nullptr is ignored.
+     * @throws std::runtime_error If ptr was not allocated by this pool.
+     */
+    void Free(void* ptr);
+
+    /**
+     * @brief Mark a buffer as in use by work queued on a stream.
+     * @param ptr Pointer into a buffer allocated by this pool.
+     * @param stream Stream the asynchronous copy was queued on.
+     */
+    void RecordUse(const void* ptr, aclrtStream stream);
+
+    /**
+     * @brief Check whether [ptr, ptr + size) lies inside one allocated buffer.
+     * @param ptr Host pointer.
+     * @param size Number of bytes.
+     * @return bool True if the range is page-locked memory from this pool.
+     */
+    bool Contains(const void* ptr, size_t size) const;
+
+    /**
+     * @brief Wait for pending copies and release all cached buffers.
+     */
+    void FreeAllBlocks();
+
+    /// Bytes currently handed out to callers.
+    size_t UsedBytes() const;
+
+    /// Bytes currently held from the driver, used and cached.
+    size_t TotalBytes() const;
+
+    /// Number of cached free buffers.
+    size_t NumFreeBlocks() const;
+
+private:
+    struct Block {
+        void* ptr = nullptr;
+        size_t size = 0;
+        std::vector<aclrtEvent> events;  // pending copies using the buffer
+    };
+
+    static bool Ready(Block& block);
+    static void WaitEvents(Block& block);
+
+    std::map<const void*, Block> allocated_;    // by address, for Contains
+    std::multimap<size_t, Block> freeBlocks_;   // by size, for best fit
+    size_t usedBytes_ = 0;
+    size_t totalBytes_ = 0;
+    mutable std::mutex mutex_;
+};
+
+/**
+ * @brief Get the process-wide pinned host memory pool.
+ * @return PinnedMemoryPool& The pool used for host staging buffers.
+ */
+PinnedMemoryPool& GetPinnedMemoryPool();
+
+}
+}
@@ -0,0 +1,179 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#pragma once
+
+#include <acl/acl.h>
+#include <aclnn/acl_meta.h>
+#include <cstddef>
+#include <cstdint>
+#include <string>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+/*
+ * Op-level profiler.
+ *
+ * While a session is running (Start() .. Stop()), every aclnn operator is
+ * recorded with its tensor shapes and dtypes, the host time spent planning it
+ * (aclnnXxxGetWorkspaceSize), its workspace size and its device time, taken
+ * from a pair of events recorded around the launch. Host/device copies are
+ * recorded with their size. Operators go through Plan() and Launch():
+ *
+ *   auto error = asnumpy::npu::profiler::Plan("Add", aclnnAddGetWorkspaceSize,
+ *                                              x1, x2, alpha, out, &workspaceSize, &executor);
+ *   ...
+ *   error = asnumpy::npu::profiler::Launch(aclnnAdd, workspaceAddr, workspaceSize, executor,
+ *                                          asnumpy::npu::GetCurrentStream());
+ *
+ * Both just forward the call when no session is running.
+ */
+
+namespace asnumpy {
+namespace npu {
+namespace profiler {
+
+/// One operator launch or memory copy. Times are in microseconds since Start().
+struct Record {
+    std::string name;                          // aclnn operator, or H2D / D2H / D2D for copies
+    bool copy = false;                         // memory copy rather than an operator
+    std::vector<std::vector<int64_t>> shapes;  // tensor operands in call order
+    std::vector<aclDataType> dtypes;
+    int32_t device = 0;
+    uint64_t thread = 0;
+    uintptr_t stream = 0;
+    double start = 0;          // host time the operator started planning, or the copy started
+    double hostTime = 0;       // host time from planning start until the launch returned
+    double planTime = 0;       // host time in aclnnXxxGetWorkspaceSize
+    bool cached = false;       // executor reused from the executor cache, not planned
+    uint64_t workspaceBytes = 0;
+    uint64_t bytes = 0;        // bytes moved by a copy
+    double deviceStart = -1;   // start on the device timeline, -1 if unknown
+    double deviceTime = -1;    // device time between the events around the launch, -1 if unknown
+};
+
+/// Whether a session is running.
+bool Enabled();
+
+/**
+ * @brief Start a session.
+ * @throws std::runtime_error If a session is already running.
+ */
+void Start();
+
+/**
+ * @brief Stop the session and return its records ordered by start time.
+ *
+ * Waits for the recorded device work to finish to read the events.
+ */
+std::vector<Record> Stop();
+
+namespace detail {
+void BeginPlan(const char* op);
+void AddOperand(const aclTensor* tensor);
+void EndPlan(aclOpExecutor* executor, uint64_t workspaceSize, bool cached = false);
+void BeginLaunch(aclOpExecutor* executor, aclrtStream stream);
+void EndLaunch(bool ok);
+}
+
+/**
+ * @brief Call an aclnnXxxGetWorkspaceSize function, timing it when profiling.
+ *
+ * Tensor arguments (aclTensor* or a vector of them) become the operands of
+ * the record; the uint64_t* and aclOpExecutor** arguments are read back for
+ * the workspace size and the executor the later Launch() runs.
+ */
+template <typename PlanFn, typename... Args>
+aclnnStatus Plan(const char* op, PlanFn&& plan, Args&&... args) {
+    if (!Enabled()) {
+        return plan(std::forward<Args>(args)...);
+    }
+    detail::BeginPlan(op);
+    uint64_t* workspaceSize = nullptr;
+    aclOpExecutor** executor = nullptr;
+    auto inspect = [&](const auto& arg) {
+        using T = std::decay_t<decltype(arg)>;
+        if constexpr (std::is_same_v<T, uint64_t*>) {
+            workspaceSize = arg;
+        } else if constexpr (std::is_same_v<T, aclOpExecutor**>) {
+            executor = arg;
+        } else if constexpr (std::is_pointer_v<T> && std::is_convertible_v<T, const aclTensor*>) {
+            detail::AddOperand(arg);
+        } else if constexpr (std::is_same_v<T, std::vector<aclTensor*>>) {
+            for (const aclTensor* tensor : arg) {
+                detail::AddOperand(tensor);
+            }
+        }
+    };
+    (inspect(args), ...);
+    aclnnStatus status = plan(std::forward<Args>(args)...);
+    bool ok = status == ACL_SUCCESS && executor != nullptr;
+    detail::EndPlan(ok ? *executor : nullptr, ok && workspaceSize != nullptr ? *workspaceSize : 0);
+    return status;
+}
+
+/**
+ * @brief Record an executor taken from the executor cache, which skips planning.
+ */
+inline void Reuse(const char* op, const std::vector<aclTensor*>& tensors,
+                  aclOpExecutor* executor, uint64_t workspaceSize) {
+    if (!Enabled()) {
+        return;
+    }
+    detail::BeginPlan(op);
+    for (const aclTensor* tensor : tensors) {
+        detail::AddOperand(tensor);
+    }
+    detail::EndPlan(executor, workspaceSize, true);
+}
+
+/**
+ * @brief Call an aclnnXxx launch function, timing it on the device when profiling.
+ */
+template <typename LaunchFn>
+aclnnStatus Launch(LaunchFn&& launch, void* workspace, uint64_t workspaceSize,
+                   aclOpExecutor* executor, aclrtStream stream) {
+    if (!Enabled()) {
+        return launch(workspace, workspaceSize, executor, stream);
+    }
+    detail::BeginLaunch(executor, stream);
+    aclnnStatus status = launch(workspace, workspaceSize, executor, stream);
+    detail::EndLaunch(status == ACL_SUCCESS);
+    return status;
+}
+
+/**
+ * @brief Record a memory copy for the lifetime of the range.
+ *
+ * A synchronous copy is timed on the host only. Given a stream, the copy is
+ * also timed on the device and must be enqueued on it while the range is alive.
+ */
+class CopyRange {
+public:
+    CopyRange(const char* name, size_t bytes);
+    CopyRange(const char* name, size_t bytes, aclrtStream stream);
+    ~CopyRange();
+    CopyRange(const CopyRange&) = delete;
+    CopyRange& operator=(const CopyRange&) = delete;
+
+private:
+    bool active_ = false;
+};
+
+}
+}
+}
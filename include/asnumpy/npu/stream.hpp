@@ -0,0 +1,175 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#pragma once
+
+#include <acl/acl.h>
+#include <cstddef>
+#include <cstdint>
+
+namespace asnumpy {
+namespace npu {
+
+class Event;
+
+/**
+ * @brief Owning wrapper around an aclrtStream.
+ *
+ * Operators are enqueued on the current stream and return immediately; the
+ * host only waits in Synchronize() and when data is copied back to host
+ * memory. Memory allocated while a stream is current belongs to that stream.
+ * Using an array on another stream requires ordering the two streams with
+ * an Event.
+ *
+ * A stream belongs to the device that was current when it was created.
+ * Every device keeps its own stack of current streams, and entering a stream
+ * of another device switches the thread to that device until Exit().
+ */
+class Stream {
+public:
+    /**
+     * @brief Create a new stream.
+     * @throws std::runtime_error If aclrtCreateStream fails.
+     */
+    Stream();
+
+    /**
+     * @brief Wrap an existing stream of the current device without taking ownership.
+     * @param stream Stream handle, nullptr for the default stream.
+     */
+    explicit Stream(aclrtStream stream);
+
+    Stream(const Stream&) = delete;
+    Stream& operator=(const Stream&) = delete;
+    Stream(Stream&& other) noexcept;
+    Stream& operator=(Stream&& other) noexcept;
+    ~Stream();
+
+    /// Block the host until all work queued on this stream has finished.
+    void Synchronize() const;
+
+    /// Make all future work on this stream wait for the event.
+    void WaitEvent(const Event& event) const;
+
+    /// Make this stream the current stream of the calling thread.
+    void Enter() const;
+
+    /// Restore the stream that was current before Enter().
+    void Exit() const;
+
+    aclrtStream Get() const { return stream_; }
+
+    /// Device the stream belongs to.
+    int32_t Device() const { return device_; }
+
+private:
+    aclrtStream stream_ = nullptr;
+    bool owner_ = false;
+    int32_t device_ = 0;
+};
+
+/**
+ * @brief Owning wrapper around an aclrtEvent, used to order streams.
+ */
+class Event {
+public:
+    /**
+     * @brief Create a new event.
+     * @throws std::runtime_error If aclrtCreateEvent fails.
+     */
+    Event();
+
+    Event(const Event&) = delete;
+    Event& operator=(const Event&) = delete;
+    ~Event();
+
+    /// Record the event at the current end of the stream.
+    void Record(aclrtStream stream);
+
+    /// Block the host until the recorded work has finished.
+    void Synchronize() const;
+
+    /// Return true if the recorded work has finished.
+    bool Query() const;
+
+    /// Milliseconds elapsed between this event and a later one.
+    float ElapsedTime(const Event& end) const;
+
+    aclrtEvent Get() const { return event_; }
+
+private:
+    aclrtEvent event_ = nullptr;
+};
+
+/**
+ * @brief Get the current stream of the calling thread.
+ * @return aclrtStream The innermost stream entered on the current device,
+ *         nullptr (its default stream) if none.
+ */
+aclrtStream GetCurrentStream();
+
+/**
+ * @brief Push a stream of the current device onto the calling thread's stream stack.
+ * @param stream Stream that becomes current.
+ */
+void PushStream(aclrtStream stream);
+
+/**
+ * @brief Pop the innermost stream from the calling thread's stream stack.
+ */
+void PopStream();
+
+/**
+ * @brief Block until all work on the current stream has finished.
+ * @throws std::runtime_error If aclrtSynchronizeStream fails.
+ */
+void SynchronizeCurrentStream();
+
+/**
+ * @brief Copy host memory into device memory in stream order.
+ *
+ * The copy is queued behind the kernels already on the current stream, so
+ * it is safe for device memory that was just recycled by the memory pool.
+ * Pinned source buffers are copied directly; pageable ones are first staged
+ * through a buffer from the pinned memory pool.
+ *
+ * @param dst Device pointer.
+ * @param src Host pointer.
+ * @param size Number of bytes.
+ * @param nonBlocking If false, return once the copy has finished. If true,
+ *        return once it is queued; a pageable src may then be reused right
+ *        away, a pinned src only after the stream has reached the copy.
+ * @return aclError ACL_SUCCESS, or the first failing runtime error.
+ */
+aclError CopyToDevice(void* dst, const void* src, size_t size, bool nonBlocking = false);
+
+/**
+ * @brief Copy device memory into host memory in stream order.
+ *
+ * Waits for the work queued on the current stream only, not for the whole
+ * device. Pageable destinations are filled through a pinned staging buffer.
+ * src must be on the current device; callers holding memory of another
+ * device switch to it with a DeviceGuard first.
+ *
+ * @param dst Host pointer.
+ * @param src Device pointer on the current device.
+ * @param size Number of bytes.
+ * @return aclError ACL_SUCCESS, or the first failing runtime error.
+ */
+aclError CopyToHost(void* dst, const void* src, size_t size);
+
+}
+}
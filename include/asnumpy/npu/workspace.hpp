@@ -0,0 +1,113 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#pragma once
+
+#include <acl/acl.h>
+#include <cstddef>
+#include <cstdint>
+#include <mutex>
+#include <unordered_map>
+
+namespace asnumpy {
+namespace npu {
+
+/**
+ * @brief Per-stream scratch buffer for aclnn operator workspaces.
+ *
+ * Every stream owns one device buffer. An operator asks for its workspace
+ * right before launching; if the buffer is large enough it is handed out as
+ * is, otherwise it is returned to the memory pool and a bigger one is taken.
+ * Kernels on a stream execute in order, so consecutive operators can share
+ * the buffer without further synchronization. Workspaces are never freed by
+ * the caller. Every device has its own arena, backed by its memory pool.
+ */
+class WorkspaceArena {
+public:
+    explicit WorkspaceArena(int32_t device = 0) : device_(device) {}
+    WorkspaceArena(const WorkspaceArena&) = delete;
+    WorkspaceArena& operator=(const WorkspaceArena&) = delete;
+
+    /**
+     * @brief Get a workspace of at least size bytes for the given stream.
+     * @param ptr Output device pointer, nullptr if size is 0.
+     * @param size Workspace size reported by aclnnXxxGetWorkspaceSize.
+     * @param stream Stream the operator is launched on.
+     * @return aclError ACL_SUCCESS, or the driver error if growing failed.
+     */
+    aclError Get(void** ptr, size_t size, aclrtStream stream = nullptr);
+
+    /**
+     * @brief Return the workspace of one stream to the memory pool.
+     * @param stream Stream whose workspace is released.
+     */
+    void Release(aclrtStream stream);
+
+    /**
+     * @brief Return the workspaces of all streams to the memory pool.
+     */
+    void ReleaseAll();
+
+    /// Bytes currently held by all workspaces.
+    size_t UsedBytes() const;
+
+    /// Largest number of bytes held by all workspaces at once.
+    size_t HighWaterMark() const;
+
+    /// Reset the high-water mark to the current usage.
+    void ResetHighWaterMark();
+
+private:
+    struct Workspace {
+        void* ptr = nullptr;
+        size_t size = 0;
+    };
+
+    std::unordered_map<aclrtStream, Workspace> workspaces_;
+    size_t usedBytes_ = 0;
+    size_t highWaterMark_ = 0;
+    int32_t device_;
+    mutable std::mutex mutex_;
+};
+
+/**
+ * @brief Get the workspace arena of the calling thread's current device.
+ * @return WorkspaceArena& The arena used by operators on that device.
+ */
+WorkspaceArena& GetWorkspaceArena();
+
+/**
+ * @brief Get the workspace arena of a device.
+ * @param device Device id.
+ * @return WorkspaceArena& The arena used by operators on device.
+ */
+WorkspaceArena& GetWorkspaceArena(int32_t device);
+
+/**
+ * @brief Get an operator workspace for the current stream.
+ *
+ * Replaces the aclrtMalloc/aclrtFree pair around aclnn launches. The
+ * returned pointer stays valid until the next call on the same stream and
+ * must not be freed.
+ *
+ * @param ptr Output device pointer.
+ * @param size Workspace size in bytes.
+ * @return aclError ACL_SUCCESS, or the driver error if allocation failed.
+ */
+aclError GetWorkspace(void** ptr, size_t size);
+
+}
+}
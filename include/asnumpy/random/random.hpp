@@ -16,9 +16,81 @@
 
 #pragma once
 
+#include <cstddef>
+#include <cstdint>
+#include <optional>
+#include <utility>
+#include <vector>
+
 namespace asnumpy {
 namespace random {
 
+/**
+ * @brief Seedable source of Philox counter states for the random kernels.
+ *
+ * The aclnn random kernels are counter based: a (seed, offset) pair selects
+ * the Philox key and the first counter, so the same pair always yields the
+ * same numbers. A Generator holds the key and advances the offset past the
+ * counters used by every call, which keeps successive calls independent and
+ * a seeded sequence of calls reproducible.
+ *
+ * Spawn derives child generators with keys hashed from the parent key and a
+ * spawn index, giving independent streams for parallel work.
+ *
+ * A Generator is not thread-safe; calls from Python are serialized by the GIL.
+ */
+class Generator {
+public:
+    /**
+     * @brief Create a generator.
+     * @param seed Philox key. If not given, it is drawn from std::random_device.
+     */
+    explicit Generator(std::optional<uint64_t> seed = std::nullopt);
+
+    /**
+     * @brief Reserve counters for one kernel launch.
+     * @param count Number of values the kernel draws.
+     * @return std::pair<uint64_t, uint64_t> (seed, offset) to pass to the kernel.
+     */
+    std::pair<uint64_t, uint64_t> Advance(uint64_t count);
+
+    /**
+     * @brief Derive independent child generators.
+     * @param n Number of children.
+     * @return std::vector<Generator> Generators with distinct keys and offset 0.
+     */
+    std::vector<Generator> Spawn(size_t n);
+
+    /**
+     * @brief Restore a state returned by Seed and Offset.
+     * @param seed Philox key.
+     * @param offset Counter offset.
+     */
+    void SetState(uint64_t seed, uint64_t offset);
 
+    /// Philox key.
+    uint64_t Seed() const { return seed_; }
+
+    /// Counter offset of the next launch.
+    uint64_t Offset() const { return offset_; }
+
+private:
+    uint64_t seed_;
+    uint64_t offset_ = 0;
+    uint64_t spawned_ = 0;      // children derived so far, for distinct child keys
+};
+
+/**
+ * @brief Get the generator used by the module-level random functions.
+ * @return Generator& Process-wide generator, seeded from std::random_device.
+ */
+Generator& GetDefaultGenerator();
+
+/**
+ * @brief Reseed the default generator and reset its offset.
+ * @param seed New Philox key.
+ */
+void SetSeed(uint64_t seed);
+
+}
 }
-}
\ No newline at end of file
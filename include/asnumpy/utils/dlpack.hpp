@@ -0,0 +1,115 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#pragma once
+
+#include <asnumpy/utils/npu_array.hpp>
+
+#include <pybind11/pybind11.h>
+#include <cstdint>
+#include <utility>
+
+namespace asnumpy {
+
+/**
+ * DLPack C ABI (https://dmlc.github.io/dlpack/latest/c_api.html).
+ *
+ * Only the unversioned structs exchanged through "dltensor" capsules are
+ * declared; their layout is fixed by the specification and shared by every
+ * framework speaking the protocol (torch_npu, NumPy, JAX, ...).
+ */
+namespace dlpack {
+
+enum DLDeviceType : int32_t {
+    kDLCPU = 1,
+    kDLExtDev = 12,
+};
+
+/// Device type torch_npu and other Ascend frameworks use for NPU memory.
+constexpr int32_t kDLAscendNPU = kDLExtDev;
+
+enum DLDataTypeCode : uint8_t {
+    kDLInt = 0,
+    kDLUInt = 1,
+    kDLFloat = 2,
+    kDLBfloat = 4,
+    kDLComplex = 5,
+    kDLBool = 6,
+};
+
+struct DLDevice {
+    int32_t device_type;
+    int32_t device_id;
+};
+
+struct DLDataType {
+    uint8_t code;
+    uint8_t bits;
+    uint16_t lanes;
+};
+
+struct DLTensor {
+    void* data;
+    DLDevice device;
+    int32_t ndim;
+    DLDataType dtype;
+    int64_t* shape;
+    int64_t* strides;       // in elements, nullptr for a compact row-major tensor
+    uint64_t byte_offset;
+};
+
+struct DLManagedTensor {
+    DLTensor dl_tensor;
+    void* manager_ctx;
+    void (*deleter)(DLManagedTensor* self);
+};
+
+}
+
+/**
+ * @brief DLPack device of an array, as (device_type, device_id).
+ * @return std::pair<int32_t, int32_t> (kDLAscendNPU, device owning x).
+ */
+std::pair<int32_t, int32_t> DLPackDevice(const NPUArray& x);
+
+/**
+ * @brief Export an array as a "dltensor" capsule without copying.
+ *
+ * The capsule holds a view of x, so the device buffer stays alive until the
+ * consumer calls the DLManagedTensor deleter (or the capsule is dropped
+ * unconsumed), even if every asnumpy array using it is gone.
+ *
+ * @param x Array to export, may be a strided view.
+ * @return pybind11::capsule Capsule named "dltensor".
+ * @throws pybind11::buffer_error If the dtype has no DLPack equivalent.
+ */
+pybind11::capsule ToDLPack(const NPUArray& x);
+
+/**
+ * @brief Wrap a "dltensor" capsule as an NPUArray without copying.
+ *
+ * The capsule is renamed "used_dltensor" as the protocol requires. The
+ * producer's deleter runs when the last array or view over the buffer goes
+ * away.
+ *
+ * @param capsule Capsule returned by a producer's __dlpack__.
+ * @return NPUArray Array sharing the producer's device memory.
+ * @throws pybind11::buffer_error If the capsule was already consumed, lives
+ *         on another device, or has an unsupported dtype.
+ */
+NPUArray FromDLPack(const pybind11::capsule& capsule);
+
+}
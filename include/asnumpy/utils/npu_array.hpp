@@ -24,6 +24,8 @@
 #include <acl/acl.h>
 #include <aclnn/aclnn_base.h>
 #include <iostream>
+#include <memory>
+#include <optional>
 #include <vector>
 #include <utility>
 #include <stdexcept>
@@ -39,9 +41,21 @@ public:
     py::dtype dtype;
     aclDataType aclDtype;
     size_t tensorSize;
+    int32_t device = 0;                 // device owning the buffer
 
 private:
-    void* devicePtr;
+    void* devicePtr = nullptr;          // first element of this array
+    std::shared_ptr<void> storage;      // device buffer, shared between an array and its views
+
+    /**
+     * @brief Constructor for a view sharing the storage of base
+     * @param base Array whose storage is shared
+     * @param shape View shape
+     * @param strides View strides in elements
+     * @param offset Offset of the first element from base, in elements
+     */
+    NPUArray(const NPUArray& base, const std::vector<int64_t>& shape,
+             const std::vector<int64_t>& strides, int64_t offset);
 
 public:
     /**
@@ -51,6 +65,8 @@ public:
      */
     NPUArray(const std::vector<int64_t>& shape, py::dtype dtype);
     void* device_address() const { return devicePtr; }
+    /// True if both arrays are views of the same device buffer (np.may_share_memory).
+    bool SharesMemory(const NPUArray& other) const { return storage && storage == other.storage; }
 
     /**
      * @brief Constructor to create an empty NPUArray from shape and ACL data type
@@ -59,6 +75,21 @@ public:
      */
     NPUArray(const std::vector<int64_t>& shape, aclDataType acl_type);
 
+    /**
+     * @brief Constructor wrapping device memory owned by someone else
+     *
+     * Nothing is allocated or copied. storage keeps the memory alive; its
+     * deleter runs when the last array or view referencing it goes away.
+     *
+     * @param storage Owner of the device buffer
+     * @param data Device address of the first element
+     * @param shape Tensor shape
+     * @param strides Strides in elements
+     * @param acl_type ACL data type constant
+     */
+    NPUArray(std::shared_ptr<void> storage, void* data, const std::vector<int64_t>& shape,
+             const std::vector<int64_t>& strides, aclDataType acl_type);
+
     // Copy constructor - deep copy
     NPUArray(const NPUArray& other);
     
@@ -81,15 +112,55 @@ public:
      * and copies the data from host memory to NPU device memory.
      *
      * @param host_data Input NumPy array.
+     * @param non_blocking Return once the copy is queued on the current stream.
      * @return NPUArray Created NPUArray.
      */
-    static NPUArray FromNumpy(py::array host_data);
+    static NPUArray FromNumpy(py::array host_data, bool non_blocking = false);
 
     /**
      * @brief Copy data from NPU to host and return a NumPy array
+     *
+     * float16 arrays are returned as np.float16 without conversion; bfloat16
+     * arrays, which NumPy has no dtype for, are widened to float32 on the host.
+     *
+     * @param out Optional C-contiguous NumPy array of matching shape and dtype to copy into
+     * @param dtype Optional dtype to cast to on the device before copying
      * @return py::array Returned NumPy array
      */
-    py::array ToNumpy() const;
+    py::array ToNumpy(std::optional<py::array> out = std::nullopt,
+                      std::optional<py::dtype> dtype = std::nullopt) const;
+
+    /**
+     * @brief Copy the array to another device.
+     *
+     * Waits for the work queued on this array's device, then copies device
+     * to device, staging through the host if the devices cannot access each
+     * other. Returns a view of this array if it is already on device.
+     *
+     * @param device Target device id.
+     * @return NPUArray Contiguous array on device.
+     * @throws std::invalid_argument If device is not a visible device.
+     */
+    NPUArray To(int32_t device) const;
+
+    /**
+     * @brief Cast to another data type on the device with aclnnCast
+     *
+     * No data goes through the host. Casting to the array's own dtype still
+     * returns a copy; callers wanting copy=False semantics check aclDtype first.
+     *
+     * @param dtype Target ACL data type, including ACL_BF16 and the float8/6/4 types
+     * @return NPUArray New contiguous array of dtype
+     * @throws std::runtime_error If aclnnCast does not support the conversion
+     */
+    NPUArray AsType(aclDataType dtype) const;
+
+    /**
+     * @brief Copy the single element of a size-1 array to host as a Python scalar
+     * @return py::object Python int, float or bool
+     * @throws std::invalid_argument If the array does not have exactly one element
+     */
+    py::object Item() const;
 
     /**
      * @brief Create a view
@@ -97,6 +168,80 @@ public:
      */
     std::unique_ptr<NPUArray> View() const;
 
+    /**
+     * @brief Copy src into this array in place
+     *
+     * src is broadcast to this array's shape and cast to its dtype on the device.
+     *
+     * @param src Source array, broadcastable to this array's shape
+     * @throws std::invalid_argument If src cannot be broadcast to this shape
+     */
+    void CopyFrom(const NPUArray& src);
+
+    /**
+     * @brief Check whether the array is laid out row-major without gaps
+     * @return bool True if the strides are the C-contiguous strides of shape
+     */
+    bool IsContiguous() const;
+
+    /**
+     * @brief Create a new aclTensor describing this array
+     *
+     * Views are described with their strides over a 1-D storage that starts
+     * at the first element. The caller owns the returned tensor.
+     *
+     * @return aclTensor* New tensor descriptor
+     */
+    aclTensor* CreateTensor() const;
+
+    /**
+     * @brief Basic indexing: integers, slices, None and Ellipsis
+     *
+     * Integers and positive-step slices return views; a negative step
+     * returns a copy flipped along that axis.
+     *
+     * @param key Index object as passed to __getitem__
+     * @return NPUArray Indexed array
+     * @throws std::out_of_range If an integer index is out of bounds
+     * @throws std::invalid_argument If the key has unsupported entries
+     */
+    NPUArray GetItem(const py::object& key) const;
+
+    /**
+     * @brief Give a new shape to the array
+     *
+     * Returns a view if the array is contiguous and a copy otherwise. One
+     * dimension may be -1 and is inferred.
+     *
+     * @param newShape New shape
+     * @return NPUArray Reshaped array
+     * @throws std::invalid_argument If the sizes do not match
+     */
+    NPUArray Reshape(const std::vector<int64_t>& newShape) const;
+
+    /**
+     * @brief Permute the axes without copying
+     * @param axes Permutation of the axes, reversed order if empty
+     * @return NPUArray Transposed view
+     * @throws std::invalid_argument If axes is not a permutation
+     */
+    NPUArray Transpose(const std::vector<int64_t>& axes = {}) const;
+
+    /**
+     * @brief Remove axes of length one without copying
+     * @param axis Axis to remove, all length-one axes if not given
+     * @return NPUArray Squeezed view
+     * @throws std::invalid_argument If the selected axis is not of length one
+     */
+    NPUArray Squeeze(std::optional<int64_t> axis = std::nullopt) const;
+
+    /**
+     * @brief Insert an axis of length one without copying
+     * @param axis Position of the new axis in the result
+     * @return NPUArray Expanded view
+     */
+    NPUArray ExpandDims(int64_t axis) const;
+
     /**
      * @brief Calculate the total size of the array.
      * @param shape Vector containing the dimensions of the array, defining its shape.
@@ -113,11 +258,25 @@ public:
 
     /**
      * @brief Convert py::dtype to aclDataType
+     *
+     * Dtypes that are not NumPy builtins are matched by name, so the custom
+     * float types (bfloat16, float8_e5m2, ...) registered by asnumpy.dtypes
+     * or ml_dtypes are accepted.
+     *
      * @param dtype Input py::dtype.
      * @return aclDataType Converted aclDataType.
      */
     static aclDataType GetACLDataType(py::dtype dtype);
 
+    /**
+     * @brief Convert a dtype name to aclDataType
+     * @param name NumPy dtype name ("float32", "int64", ...) or the name of one of the
+     *        custom float types in asnumpy/dtypes/float_types.hpp ("bfloat16", "float8_e4m3fn", ...).
+     * @return aclDataType Converted aclDataType.
+     * @throws std::runtime_error If the name is not a supported dtype.
+     */
+    static aclDataType GetACLDataTypeByName(const std::string& name);
+
     /**
      * @brief Convert aclDataType to py::dtype
      * @param acl_type Input aclDataType.
@@ -15,6 +15,10 @@
  *****************************************************************************/
 
 #include <asnumpy/utils/status_handler.hpp>
+#include <asnumpy/utils/type_promotion.hpp>
+#include <asnumpy/npu/executor_cache.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/workspace.hpp>
 #include <fmt/base.h>
 
 #define CHECK_RET(cond, return_expr)                                                                                   \
@@ -37,13 +41,11 @@
                                                                                                                        \
 		void* workspaceAddr = nullptr;                                                                                 \
 		if (workspaceSize > 0) {                                                                                       \
-			auto error_malloc = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);                 \
+			auto error_malloc = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);                             \
 			CheckMallocAclnnStatus(error_malloc);                                                                      \
 		}                                                                                                              \
-		auto error_func = AclnnFunc(workspaceAddr, workspaceSize, executor, nullptr);                                  \
+		auto error_func = AclnnFunc(workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());         \
 		CheckAclnnStatus(error_func, fmt::format("[{}] Failed to execute operation.", #OpName));                       \
-		auto error_sync = aclrtSynchronizeDevice();                                                                    \
-		CheckSynchronizeDeviceAclnnStatus(error_sync);                                                                 \
 	}                                                                                                                  \
 	while (0)
 
@@ -52,24 +54,25 @@
 		auto shape = x.shape;                                                                                          \
 		auto dtype = x.dtype;                                                                                          \
 		auto result = NPUArray(shape, dtype);                                                                          \
-		uint64_t workspaceSize = 0;                                                                                    \
-		aclOpExecutor* executor;                                                                                       \
-		auto error = AclnnGetWorkspaceSizeFunc(x.tensorPtr, result.tensorPtr, &workspaceSize, &executor);              \
-		CheckGetWorkspaceSizeAclnnStatus(error);                                                                       \
-		EXECUTE_OP_WORKSPACE(OpName, workspaceSize, executor, AclnnFunc);                                              \
+		asnumpy::npu::GetExecutorCache().Run(                                                                          \
+			#OpName, {&x}, {&result},                                                                                  \
+			[](const std::vector<aclTensor*>& t, uint64_t* workspaceSize, aclOpExecutor** executor) {                  \
+				return AclnnGetWorkspaceSizeFunc(t[0], t[1], workspaceSize, executor);                                 \
+			},                                                                                                         \
+			AclnnFunc);                                                                                                \
 		return result;                                                                                                 \
 	}
 
 #define DEFINE_BINARY_OP(OpName, AclnnGetWorkspaceSizeFunc, AclnnFunc)                                                 \
 	NPUArray OpName(const NPUArray& x1, const NPUArray& x2) {                                                          \
 		auto shape = GetBroadcastShape(x1, x2);                                                                        \
-		auto dtype = x1.dtype;                                                                                         \
-		auto result = NPUArray(shape, dtype);                                                                          \
-		uint64_t workspaceSize = 0;                                                                                    \
-		aclOpExecutor* executor;                                                                                       \
-		auto error =                                                                                                   \
-			AclnnGetWorkspaceSizeFunc(x1.tensorPtr, x2.tensorPtr, result.tensorPtr, &workspaceSize, &executor);        \
-		CheckGetWorkspaceSizeAclnnStatus(error);                                                                       \
-		EXECUTE_OP_WORKSPACE(OpName, workspaceSize, executor, AclnnFunc);                                              \
+		asnumpy::PromotedOperands in(x1, x2);                                                                          \
+		auto result = NPUArray(shape, in.dtype);                                                                       \
+		asnumpy::npu::GetExecutorCache().Run(                                                                          \
+			#OpName, {&in.x1(), &in.x2()}, {&result},                                                                  \
+			[](const std::vector<aclTensor*>& t, uint64_t* workspaceSize, aclOpExecutor** executor) {                  \
+				return AclnnGetWorkspaceSizeFunc(t[0], t[1], t[2], workspaceSize, executor);                           \
+			},                                                                                                         \
+			AclnnFunc);                                                                                                \
 		return result;                                                                                                 \
 	}
@@ -18,6 +18,7 @@
 
 #include <acl/acl.h>
 #include <aclnn/aclnn_base.h>
+#include <pybind11/pybind11.h>
 #include <stdexcept>
 #include <complex>
 #include <string>
@@ -70,3 +71,50 @@ aclScalar* CreateScalar(T value);
 template <typename ValueType>
 aclScalar* CreateScalar(ValueType value, aclDataType dtype);
 
+/**
+ * @brief Check that a Python int fits an integer dtype, as NumPy 2 does for weak scalars
+ * @param value Python scalar; anything but a Python int is accepted unchanged
+ * @param dtype ACL data type the value will be stored in
+ * @throws std::overflow_error If value is a Python int outside the range of an integer dtype
+ */
+void CheckPyIntInRange(const pybind11::handle& value, aclDataType dtype);
+
+/**
+ * @brief Creates a scalar object from a Python bool, int or float
+ * @param value Python scalar (NumPy scalars are accepted too)
+ * @param dtype Target ACL data type for the scalar
+ * @return aclScalar* Pointer to the created scalar object
+ * @throws std::invalid_argument If value is not a real number
+ * @throws std::overflow_error If value is a Python int that dtype cannot hold
+ * @note Python ints are converted through int64_t, so integer dtypes receive them exactly.
+ */
+aclScalar* CreateScalarFromPy(const pybind11::handle& value, aclDataType dtype);
+
+/**
+ * @brief Check whether a Python object is a real scalar (bool, int, float or a NumPy scalar)
+ * @param value Python object
+ * @return bool True for scalars; false for arrays and everything else
+ */
+bool IsPyScalar(const pybind11::handle& value);
+
+/**
+ * @brief Result dtype of an operation between an array and a Python scalar
+ * @param arrayDtype ACL data type of the array operand
+ * @param value Python scalar
+ * @return aclDataType arrayDtype, unless the scalar's kind is higher: a float with an
+ *         integer or bool array gives ACL_DOUBLE, an int with a bool array gives ACL_INT64
+ * @throws std::invalid_argument If value is not a real number
+ */
+aclDataType WeakScalarDtype(aclDataType arrayDtype, const pybind11::handle& value);
+
+/**
+ * @brief Get a shared aclScalar for a Python scalar, created on first use
+ * @param value Python bool, int or float
+ * @param dtype Target ACL data type for the scalar
+ * @return aclScalar* Scalar owned by a process-wide cache; the caller must not destroy it
+ * @throws std::invalid_argument If value is not a real number
+ * @throws std::overflow_error If value is a Python int that dtype cannot hold
+ * @note Used by the array-scalar ops so repeated calls with the same scalar do not
+ *       create and destroy an aclScalar each time.
+ */
+aclScalar* GetCachedScalar(const pybind11::handle& value, aclDataType dtype);
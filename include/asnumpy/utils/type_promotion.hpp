@@ -0,0 +1,126 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#pragma once
+
+#include <asnumpy/utils/npu_array.hpp>
+
+#include <acl/acl.h>
+#include <pybind11/pybind11.h>
+#include <optional>
+
+namespace asnumpy {
+
+/**
+ * @brief Smallest dtype both inputs can be safely cast to (numpy.promote_types).
+ *
+ * Follows NumPy's table: bool promotes to anything, signed with unsigned of
+ * the same size goes one size up (uint64 with a signed type gives float64),
+ * integers with floats give a float wide enough for the integer
+ * (int8 + float16 = float16, int16 + float16 = float32, int32 + float32 =
+ * float64), and complex absorbs the float width of the other side.
+ * bfloat16 behaves like float16 except that bfloat16 + float16 = float32.
+ *
+ * Decisions are computed once per dtype pair and cached.
+ *
+ * @param a First ACL data type.
+ * @param b Second ACL data type.
+ * @return aclDataType The promoted data type.
+ * @throws std::invalid_argument If the two types have no common type.
+ */
+aclDataType PromoteTypes(aclDataType a, aclDataType b);
+
+/**
+ * @brief Result dtype of a binary operation between two arrays (numpy.result_type).
+ * @param x1 First operand.
+ * @param x2 Second operand.
+ * @return aclDataType PromoteTypes(x1.aclDtype, x2.aclDtype).
+ */
+aclDataType ResultType(const NPUArray& x1, const NPUArray& x2);
+
+/**
+ * @brief Result dtype of a binary operation between an array and a Python scalar.
+ *
+ * Python scalars are weak (NEP 50): they only change the result when their
+ * kind is higher than the array's, see WeakScalarDtype.
+ *
+ * @param x Array operand.
+ * @param scalar Python bool, int or float.
+ * @return aclDataType The result data type.
+ */
+aclDataType ResultType(const NPUArray& x, const pybind11::handle& scalar);
+
+/**
+ * @brief Cast an array to another data type on the device with aclnnCast.
+ * @param x Input array, may be a strided view.
+ * @param dtype Target ACL data type.
+ * @return NPUArray New contiguous array of dtype.
+ * @throws std::runtime_error If the cast fails.
+ */
+NPUArray CastTo(const NPUArray& x, aclDataType dtype);
+
+/**
+ * @brief Operands of a binary operation brought to a common dtype.
+ *
+ * An operand that already has the common dtype is used as is; the other one
+ * is cast on the device into a temporary owned by this object.
+ *
+ * Example:
+ *     PromotedOperands in(x1, x2);
+ *     NPUArray out(shape, in.dtype);
+ *     aclnnMulGetWorkspaceSize(in.x1().tensorPtr, in.x2().tensorPtr, out.tensorPtr, ...);
+ */
+class PromotedOperands {
+public:
+    /// Promote to ResultType(x1, x2).
+    PromotedOperands(const NPUArray& x1, const NPUArray& x2);
+
+    /// Promote to an explicit compute dtype.
+    PromotedOperands(const NPUArray& x1, const NPUArray& x2, aclDataType dtype);
+
+    PromotedOperands(const PromotedOperands&) = delete;
+    PromotedOperands& operator=(const PromotedOperands&) = delete;
+
+    const NPUArray& x1() const { return cast1_ ? *cast1_ : *x1_; }
+    const NPUArray& x2() const { return cast2_ ? *cast2_ : *x2_; }
+
+    /// The common dtype both operands have.
+    aclDataType dtype;
+
+private:
+    const NPUArray* x1_;
+    const NPUArray* x2_;
+    std::optional<NPUArray> cast1_;
+    std::optional<NPUArray> cast2_;
+};
+
+/**
+ * @brief Whether an ACL data type is bool or an integer type.
+ * @param dtype ACL data type.
+ * @return bool True for ACL_BOOL and the signed/unsigned integer types.
+ */
+bool IsIntegralType(aclDataType dtype);
+
+/**
+ * @brief Whether values of one dtype may be stored in another under NumPy's
+ *        'same_kind' casting rule (the rule used for ufunc outputs and a op= b).
+ * @param from Result data type.
+ * @param to Target data type.
+ * @return bool True unless the cast goes to a lower kind (bool < unsigned < signed < float < complex).
+ */
+bool CanCastSameKind(aclDataType from, aclDataType to);
+
+}
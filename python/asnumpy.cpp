@@ -21,10 +21,12 @@ void bind_array(pybind11::module_& array);
 void bind_cann(pybind11::module_& cann);
 void bind_dtypes(pybind11::module_& dtypes);
 void bind_fft(pybind11::module_& fft);
+void bind_fusion(pybind11::module_& fusion);
 void bind_linalg(pybind11::module_& linalg);
 void bind_linalg_no_submodule(pybind11::module_& m);
 void bind_math(pybind11::module_& math);
 void bind_logic(pybind11::module_& logic);
+void bind_npu(pybind11::module_& npu);
 void bind_random(pybind11::module_& random);
 void bind_testing(pybind11::module_& testing);
 void bind_utils(pybind11::module_& utils);
@@ -37,9 +39,11 @@ PYBIND11_MODULE(asnumpy_core, module) {
     auto cann = module.def_submodule("cann");
     auto dtypes = module.def_submodule("dtypes");
     auto fft = module.def_submodule("fft");
+    auto fusion = module.def_submodule("fusion");
     auto linalg = module.def_submodule("linalg");
     auto math = module.def_submodule("math");
     auto logic = module.def_submodule("logic");
+    auto npu = module.def_submodule("npu");
     auto random = module.def_submodule("random");
     auto testing = module.def_submodule("testing");
     // auto utils = module.def_submodule("utils");
@@ -50,10 +54,12 @@ PYBIND11_MODULE(asnumpy_core, module) {
     bind_cann(cann);
     // bind_dtypes(dtypes);
     bind_fft(fft);
+    bind_fusion(fusion);
     bind_linalg(linalg);
     bind_linalg_no_submodule(module);
     bind_math(math);
     bind_logic(logic);
+    bind_npu(npu);
     bind_random(random);
     bind_testing(testing);
     bind_utils(module);
@@ -17,17 +17,52 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <asnumpy/array/basic.hpp>
+#include <asnumpy/array/manipulation.hpp>
+
+namespace {
+
+// Any dtype-like (np.float32, "float32", np.dtype(...)); py::dtype parameters
+// only accept dtype instances.
+py::dtype AsDtype(const py::object& dtype) {
+    return py::dtype::from_args(dtype);
+}
+
+}
 
 void bind_array(pybind11::module_& array) {
     array.doc() = "array module of asnumpy";
-    array.def("zeros", &Zeros, py::arg("shape"), py::arg("dtype"));
-    array.def("zeros_like", &Zeros_like, py::arg("other"), py::arg("dtype"));
-    array.def("full", &Full, py::arg("shape"), py::arg("value"), py::arg("dtype"));
-    array.def("full_like", &Full_like, py::arg("other"), py::arg("value"), py::arg("dtype"));
-    array.def("empty", &Empty, py::arg("shape"), py::arg("dtype"));
-    array.def("empty_like", &EmptyLike, py::arg("prototype"), py::arg("dtype")=py::none());
-    array.def("eye", &Eye, py::arg("n"), py::arg("dtype"));
-    array.def("ones", &Ones, py::arg("shape"), py::arg("dtype"));
-    array.def("ones_like", &ones_like, py::arg("other"), py::arg("dtype"));
-    array.def("identity", &Identity, py::arg("n"), py::arg("dtype"));
+    array.def("zeros", [](const std::vector<int64_t>& shape, const py::object& dtype) {
+            return Zeros(shape, AsDtype(dtype));
+        }, py::arg("shape"), py::arg("dtype"));
+    array.def("zeros_like", [](const NPUArray& other, const py::object& dtype) {
+            return Zeros_like(other, AsDtype(dtype));
+        }, py::arg("other"), py::arg("dtype"));
+    array.def("full", [](const std::vector<int64_t>& shape, const py::object& value, const py::object& dtype) {
+            return Full(shape, value, AsDtype(dtype));
+        }, py::arg("shape"), py::arg("value"), py::arg("dtype"));
+    array.def("full_like", [](const NPUArray& other, const py::object& value, const py::object& dtype) {
+            return Full_like(other, value, AsDtype(dtype));
+        }, py::arg("other"), py::arg("value"), py::arg("dtype"));
+    array.def("empty", [](const std::vector<int64_t>& shape, const py::object& dtype) {
+            return Empty(shape, AsDtype(dtype));
+        }, py::arg("shape"), py::arg("dtype"));
+    array.def("empty_like", [](const NPUArray& prototype, const py::object& dtype) {
+            return dtype.is_none() ? EmptyLike(prototype) : EmptyLike(prototype, AsDtype(dtype));
+        }, py::arg("prototype"), py::arg("dtype")=py::none());
+    array.def("eye", [](int64_t n, const py::object& dtype) {
+            return Eye(n, AsDtype(dtype));
+        }, py::arg("n"), py::arg("dtype"));
+    array.def("ones", [](const std::vector<int64_t>& shape, const py::object& dtype) {
+            return Ones(shape, AsDtype(dtype));
+        }, py::arg("shape"), py::arg("dtype"));
+    array.def("ones_like", [](const NPUArray& other, const py::object& dtype) {
+            return ones_like(other, AsDtype(dtype));
+        }, py::arg("other"), py::arg("dtype"));
+    array.def("identity", [](int64_t n, const py::object& dtype) {
+            return Identity(n, AsDtype(dtype));
+        }, py::arg("n"), py::arg("dtype"));
+    array.def("reshape", &Reshape, py::arg("a"), py::arg("newshape"));
+    array.def("transpose", &Transpose, py::arg("a"), py::arg("axes") = py::none());
+    array.def("squeeze", &Squeeze, py::arg("a"), py::arg("axis") = py::none());
+    array.def("expand_dims", &ExpandDims, py::arg("a"), py::arg("axis"));
 }
@@ -20,8 +20,8 @@
 
 void bind_cann(pybind11::module_& cann) {
     cann.doc() = "cann module of asnumpy";
-    cann.def("set_device", &aclrtSetDevice, pybind11::arg("device_id"));
-    cann.def("reset_device", &aclrtResetDevice, pybind11::arg("device_id"));
+    cann.def("set_device", &asnumpy::cann::set_device, pybind11::arg("device_id"));
+    cann.def("reset_device", &asnumpy::cann::reset_device, pybind11::arg("device_id"));
     cann.def("reset_device_force", &aclrtResetDeviceForce, pybind11::arg("device_id"));
     cann.def("init", &asnumpy::cann::init);
     cann.def("finalize", &asnumpy::cann::finalize);
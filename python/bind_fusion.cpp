@@ -0,0 +1,44 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <asnumpy/fusion/elementwise.hpp>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#include <string>
+#include <tuple>
+#include <vector>
+
+void bind_fusion(pybind11::module_& fusion) {
+    fusion.doc() = "fusion module of asnumpy";
+
+    fusion.def("execute",
+        [](const std::vector<std::tuple<std::string, std::vector<int64_t>, double>>& program,
+           const std::vector<const NPUArray*>& inputs,
+           const std::vector<int64_t>& outputs) {
+            std::vector<asnumpy::fusion::Instruction> instructions;
+            instructions.reserve(program.size());
+            for (const auto& [op, operands, scalar] : program) {
+                instructions.push_back({op, operands, scalar});
+            }
+            return asnumpy::fusion::Execute(instructions, inputs, outputs);
+        },
+        pybind11::arg("program"), pybind11::arg("inputs"), pybind11::arg("outputs"),
+        "Run a straight-line elementwise program.\n\n"
+        "program is a list of (op, operands, scalar); inputs are values 0..n-1 and\n"
+        "instruction i defines value n + i. Temporaries that die inside the program\n"
+        "are overwritten in place instead of allocating new arrays.");
+}
@@ -17,10 +17,35 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <asnumpy/logic/logic.hpp>
+#include <asnumpy/array/basic.hpp>
+#include <asnumpy/utils/npu_scalar.hpp>
 
 namespace py = pybind11;
 using namespace asnumpy;
 
+namespace {
+
+using Dtype = std::optional<py::dtype>;
+using LogicalFn = NPUArray (*)(const NPUArray&, const NPUArray&);
+
+// Logical ops have no scalar kernels; the scalar goes in as a 0-d array,
+// which the kernel broadcasts.
+NPUArray ScalarOperand(const py::object& scalar, const NPUArray& other) {
+    return Full({}, scalar, NPUArray::GetPyDtype(WeakScalarDtype(other.aclDtype, scalar)));
+}
+
+template <LogicalFn Op>
+NPUArray LogicalScalar(const NPUArray& x1, const py::object& scalar) {
+    return Op(x1, ScalarOperand(scalar, x1));
+}
+
+template <LogicalFn Op>
+NPUArray LogicalScalarFirst(const py::object& scalar, const NPUArray& x2) {
+    return Op(ScalarOperand(scalar, x2), x2);
+}
+
+}
+
 void bind_logic(py::module_& logic) {
     logic.doc() = "logic module of asnumpy";
 
@@ -46,11 +71,17 @@ void bind_logic(py::module_& logic) {
 
     // Logical operators
     logic.def("logical_and", &LogicalAnd, py::arg("x1"), py::arg("x2"));
+    logic.def("logical_and", &LogicalScalar<&LogicalAnd>, py::arg("x1"), py::arg("scalar"));
+    logic.def("logical_and", &LogicalScalarFirst<&LogicalAnd>, py::arg("scalar"), py::arg("x2"));
     logic.def("logical_or", &LogicalOr, py::arg("x1"), py::arg("x2"));
+    logic.def("logical_or", &LogicalScalar<&LogicalOr>, py::arg("x1"), py::arg("scalar"));
+    logic.def("logical_or", &LogicalScalarFirst<&LogicalOr>, py::arg("scalar"), py::arg("x2"));
     logic.def("logical_not", &LogicalNot, py::arg("x"));
     logic.def("logical_xor", &LogicalXor, py::arg("x1"), py::arg("x2"));
+    logic.def("logical_xor", &LogicalScalar<&LogicalXor>, py::arg("x1"), py::arg("scalar"));
+    logic.def("logical_xor", &LogicalScalarFirst<&LogicalXor>, py::arg("scalar"), py::arg("x2"));
 
-    // Comparisons (array-array / array-scalar), dtype 可选
+    // Comparisons (array-array / array-scalar / scalar-array), dtype 可选
     logic.def("greater",
               py::overload_cast<const NPUArray&, const NPUArray&, std::optional<py::dtype>>(&greater),
               py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
@@ -59,6 +90,10 @@ void bind_logic(py::module_& logic) {
               py::overload_cast<const NPUArray&, const py::object&, std::optional<py::dtype>>(&greater),
               py::arg("x1"), py::arg("scalar"), py::arg("dtype") = py::none());
 
+    logic.def("greater",
+              [](const py::object& scalar, const NPUArray& x2, Dtype dtype) { return less(x2, scalar, dtype); },
+              py::arg("scalar"), py::arg("x2"), py::arg("dtype") = py::none());
+
     logic.def("greater_equal",
               py::overload_cast<const NPUArray&, const NPUArray&, std::optional<py::dtype>>(&greater_equal),
               py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
@@ -67,6 +102,10 @@ void bind_logic(py::module_& logic) {
               py::overload_cast<const NPUArray&, const py::object&, std::optional<py::dtype>>(&greater_equal),
               py::arg("x1"), py::arg("scalar"), py::arg("dtype") = py::none());
 
+    logic.def("greater_equal",
+              [](const py::object& scalar, const NPUArray& x2, Dtype dtype) { return less_equal(x2, scalar, dtype); },
+              py::arg("scalar"), py::arg("x2"), py::arg("dtype") = py::none());
+
     // Less comparisons
     logic.def("less",
               py::overload_cast<const NPUArray&, const NPUArray&, std::optional<py::dtype>>(&less),
@@ -76,6 +115,10 @@ void bind_logic(py::module_& logic) {
               py::overload_cast<const NPUArray&, const py::object&, std::optional<py::dtype>>(&less),
               py::arg("x1"), py::arg("scalar"), py::arg("dtype") = py::none());
 
+    logic.def("less",
+              [](const py::object& scalar, const NPUArray& x2, Dtype dtype) { return greater(x2, scalar, dtype); },
+              py::arg("scalar"), py::arg("x2"), py::arg("dtype") = py::none());
+
     logic.def("less_equal",
               py::overload_cast<const NPUArray&, const NPUArray&, std::optional<py::dtype>>(&less_equal),
               py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
@@ -84,11 +127,23 @@ void bind_logic(py::module_& logic) {
               py::overload_cast<const NPUArray&, const py::object&, std::optional<py::dtype>>(&less_equal),
               py::arg("x1"), py::arg("scalar"), py::arg("dtype") = py::none());
 
+    logic.def("less_equal",
+              [](const py::object& scalar, const NPUArray& x2, Dtype dtype) { return greater_equal(x2, scalar, dtype); },
+              py::arg("scalar"), py::arg("x2"), py::arg("dtype") = py::none());
+
     // Equal / Not equal comparisons
     logic.def("equal",
               py::overload_cast<const NPUArray&, const NPUArray&, std::optional<py::dtype>>(&equal),
               py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
 
+    logic.def("equal",
+              py::overload_cast<const NPUArray&, const py::object&, std::optional<py::dtype>>(&equal),
+              py::arg("x1"), py::arg("scalar"), py::arg("dtype") = py::none());
+
+    logic.def("equal",
+              [](const py::object& scalar, const NPUArray& x2, Dtype dtype) { return equal(x2, scalar, dtype); },
+              py::arg("scalar"), py::arg("x2"), py::arg("dtype") = py::none());
+
     logic.def("not_equal",
               py::overload_cast<const NPUArray&, const NPUArray&, std::optional<py::dtype>>(&not_equal),
               py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
@@ -97,4 +152,8 @@ void bind_logic(py::module_& logic) {
               py::overload_cast<const NPUArray&, const py::object&, std::optional<py::dtype>>(&not_equal),
               py::arg("x1"), py::arg("scalar"), py::arg("dtype") = py::none());
 
+    logic.def("not_equal",
+              [](const py::object& scalar, const NPUArray& x2, Dtype dtype) { return not_equal(x2, scalar, dtype); },
+              py::arg("scalar"), py::arg("x2"), py::arg("dtype") = py::none());
+
 }
@@ -27,6 +27,9 @@
 #include <asnumpy/math/arithmetic_operations.hpp>
 #include <asnumpy/math/handling_complex_numbers.hpp>
 #include <asnumpy/math/miscellaneous.hpp>
+#include <asnumpy/array/basic.hpp>
+#include <asnumpy/utils/npu_scalar.hpp>
+#include <asnumpy/utils/type_promotion.hpp>
 
 
 namespace py = pybind11;
@@ -46,6 +49,243 @@ void bind_arithmetic_operations(py::module_& math);
 void bind_handling_complex_numbers(py::module_& math);
 void bind_miscellaneous(py::module_& math);
 
+py::object ArrayOperand(const py::object& x);
+
+}
+
+namespace {
+
+// out= support shared by the ufuncs and reductions below, following NumPy:
+// out must be an ndarray with the result's shape, the result is cast to out's
+// dtype, and out itself is returned. Ufuncs only cast under 'same_kind'.
+
+NPUArray& OutArray(const py::object& out) {
+    if (!py::isinstance<NPUArray>(out)) {
+        throw py::type_error("out must be an asnumpy ndarray");
+    }
+    return out.cast<NPUArray&>();
+}
+
+py::object StoreOut(const NPUArray& result, const py::object& out) {
+    NPUArray& target = OutArray(out);
+    if (target.shape != result.shape) {
+        throw py::value_error("out has the wrong shape for the result of this operation");
+    }
+    target.CopyFrom(result);
+    return out;
+}
+
+// StoreOut for a ufunc result: like NumPy, a cast to a lower kind
+// (float to int, int to bool, ...) raises instead of truncating.
+py::object StoreUfuncOut(const NPUArray& result, const py::object& out) {
+    const NPUArray& target = OutArray(out);
+    if (!CanCastSameKind(result.aclDtype, target.aclDtype)) {
+        throw py::type_error("Cannot cast ufunc output from " +
+                             py::repr(NPUArray::GetPyDtype(result.aclDtype)).cast<std::string>() + " to " +
+                             py::repr(target.dtype).cast<std::string>() + " with casting rule 'same_kind'");
+    }
+    return StoreOut(result, out);
+}
+
+// Reductions with out= and no explicit dtype accumulate in out's dtype.
+template <typename T>
+void DefaultDtype(T&, const py::dtype&) {}
+
+void DefaultDtype(std::optional<py::dtype>& dtype, const py::dtype& outDtype) {
+    if (!dtype.has_value()) {
+        dtype = outDtype;
+    }
+}
+
+// Append an out=None parameter to the ufunc fn.
+template <typename... Args>
+auto WithOut(NPUArray (*fn)(Args...)) {
+    return [fn](Args... args, const py::object& out) -> py::object {
+        if (out.is_none()) {
+            return py::cast(fn(args...));
+        }
+        return StoreUfuncOut(fn(args...), out);
+    };
+}
+
+// Same for the two-output ufuncs (modf, divmod); out is a pair of ndarrays.
+template <typename... Args>
+auto WithOut(std::pair<NPUArray, NPUArray> (*fn)(Args...)) {
+    return [fn](Args... args, const py::object& out) -> py::object {
+        if (out.is_none()) {
+            return py::cast(fn(args...));
+        }
+        auto outs = out.cast<py::tuple>();
+        if (outs.size() != 2) {
+            throw py::value_error("out must be a tuple of 2 arrays");
+        }
+        auto result = fn(args...);
+        StoreUfuncOut(result.first, outs[0]);
+        StoreUfuncOut(result.second, outs[1]);
+        return outs;
+    };
+}
+
+// Append an out=None parameter to the reduction fn; as in NumPy, the result is
+// computed in out's dtype unless dtype is given and then cast without checks.
+template <typename... Args>
+auto ReductionWithOut(NPUArray (*fn)(Args...)) {
+    return [fn](Args... args, const py::object& out) -> py::object {
+        if (out.is_none()) {
+            return py::cast(fn(args...));
+        }
+        (DefaultDtype(args, OutArray(out).dtype), ...);
+        return StoreOut(fn(args...), out);
+    };
+}
+
+bool SameView(const NPUArray& a, const NPUArray& b) {
+    return a.device_address() == b.device_address() && a.shape == b.shape && a.strides == b.strides &&
+           a.aclDtype == b.aclDtype;
+}
+
+using InplaceFn = void (*)(NPUArray&, const NPUArray&);
+
+// True unless arg is an explicit dtype other than dtype.
+template <typename T>
+bool DtypeMatches(const T&, aclDataType) {
+    return true;
+}
+
+bool DtypeMatches(const std::optional<py::dtype>& dtype, aclDataType target) {
+    return !dtype.has_value() || NPUArray::GetACLDataType(*dtype) == target;
+}
+
+// out= for binary arithmetic without a result temporary: when out has the
+// operands' dtype, the aclnnInplace* kernel runs on out directly (after
+// copying x1 into it unless out already is x1). Returns false, leaving out
+// untouched, when dtypes differ or out partially overlaps an operand.
+bool TryInplace(const NPUArray& x1, const NPUArray& x2, NPUArray& target, InplaceFn inplace, bool commutative) {
+    if (x1.aclDtype != target.aclDtype || x2.aclDtype != target.aclDtype ||
+        GetBroadcastShape(x1, x2) != target.shape) {
+        return false;
+    }
+    if (SameView(target, x1) && (SameView(target, x2) || !target.SharesMemory(x2))) {
+        inplace(target, x2);
+        return true;
+    }
+    if (commutative && SameView(target, x2) && !target.SharesMemory(x1)) {
+        inplace(target, x1);
+        return true;
+    }
+    if (!target.SharesMemory(x1) && !target.SharesMemory(x2)) {
+        target.CopyFrom(x1);
+        inplace(target, x2);
+        return true;
+    }
+    return false;
+}
+
+using UnaryInplaceFn = void (*)(NPUArray&);
+
+// out= for element-wise unary ufuncs without a result temporary: when x and
+// out share a floating-point dtype, x is copied into out (unless out already
+// is x) and the aclnnInplace* kernel runs on out. Returns false, leaving out
+// untouched, when the dtypes or shapes differ or out partially overlaps x.
+bool TryInplaceUnary(const NPUArray& x, NPUArray& target, UnaryInplaceFn inplace) {
+    bool floating = x.aclDtype == ACL_FLOAT16 || x.aclDtype == ACL_FLOAT || x.aclDtype == ACL_DOUBLE;
+    if (!floating || x.aclDtype != target.aclDtype || x.shape != target.shape) {
+        return false;
+    }
+    if (!SameView(target, x)) {
+        if (target.SharesMemory(x)) {
+            return false;
+        }
+        target.CopyFrom(x);
+    }
+    inplace(target);
+    return true;
+}
+
+// WithOut for a unary ufunc that has an in-place kernel, see TryInplaceUnary.
+template <typename... Args>
+auto WithOut(NPUArray (*fn)(const NPUArray&, Args...), UnaryInplaceFn inplace) {
+    return [fn, inplace](const NPUArray& x, Args... args, const py::object& out) -> py::object {
+        if (out.is_none()) {
+            return py::cast(fn(x, args...));
+        }
+        NPUArray& target = OutArray(out);
+        if ((DtypeMatches(args, target.aclDtype) && ...) && TryInplaceUnary(x, target, inplace)) {
+            return out;
+        }
+        return StoreUfuncOut(fn(x, args...), out);
+    };
+}
+
+// A Python scalar as a 0-d array in the dtype it takes against other; the
+// kernel broadcasts it, so no array of the full shape is built.
+NPUArray ScalarOperand(const py::object& scalar, const NPUArray& other) {
+    return Full({}, scalar, NPUArray::GetPyDtype(WeakScalarDtype(other.aclDtype, scalar)));
+}
+
+py::object Finish(NPUArray result, const py::object& out) {
+    return out.is_none() ? py::cast(std::move(result)) : StoreUfuncOut(result, out);
+}
+
+// Binary ufunc over ndarrays and Python scalars, with out=. A scalar goes to
+// the op's array-scalar kernel (scalarFn / rscalarFn) when it has one and is
+// otherwise passed as a 0-d array. With inplace, array operands and an out of
+// their dtype are handled by TryInplace.
+template <typename... Rest>
+struct BinarySignature {
+    using ArrayFn = NPUArray (*)(const NPUArray&, const NPUArray&, Rest...);
+    using ScalarFn = NPUArray (*)(const NPUArray&, const py::object&, Rest...);
+    using ReflectedFn = NPUArray (*)(const py::object&, const NPUArray&, Rest...);
+};
+
+// Rest is always given explicitly; the signatures are non-deduced so that
+// overloaded names like &Add resolve against them.
+template <typename... Rest>
+auto BinaryUfunc(typename BinarySignature<Rest...>::ArrayFn fn,
+                 typename BinarySignature<Rest...>::ScalarFn scalarFn = nullptr,
+                 typename BinarySignature<Rest...>::ReflectedFn rscalarFn = nullptr,
+                 InplaceFn inplace = nullptr, bool commutative = false) {
+    return [=](const py::object& operand1, const py::object& operand2, Rest... rest,
+               const py::object& out) -> py::object {
+        py::object x1 = ArrayOperand(operand1);
+        py::object x2 = ArrayOperand(operand2);
+        bool array1 = py::isinstance<NPUArray>(x1);
+        bool array2 = py::isinstance<NPUArray>(x2);
+        if (!out.is_none()) {
+            NPUArray& target = OutArray(out);
+            // true division of integers gives float64, so it never stays in the operands' dtype
+            bool keepsDtype = !(inplace == InplaceFn(&InplaceDivide) && IsIntegralType(target.aclDtype));
+            if (inplace != nullptr && keepsDtype && array1 && array2 && (DtypeMatches(rest, target.aclDtype) && ...) &&
+                TryInplace(x1.cast<const NPUArray&>(), x2.cast<const NPUArray&>(), target, inplace, commutative)) {
+                return out;
+            }
+        }
+        if (array1 && array2) {
+            return Finish(fn(x1.cast<const NPUArray&>(), x2.cast<const NPUArray&>(), rest...), out);
+        }
+        if (array1 && IsPyScalar(x2)) {
+            const auto& a = x1.cast<const NPUArray&>();
+            return Finish(scalarFn ? scalarFn(a, x2, rest...) : fn(a, ScalarOperand(x2, a), rest...), out);
+        }
+        if (array2 && IsPyScalar(x1)) {
+            const auto& b = x2.cast<const NPUArray&>();
+            return Finish(rscalarFn ? rscalarFn(x1, b, rest...) : fn(ScalarOperand(x1, b), b, rest...), out);
+        }
+        throw py::type_error("operands must be asnumpy ndarrays or real scalars");
+    };
+}
+
+using Dtype = std::optional<py::dtype>;
+
+// Reversed forms of the commutative array-scalar ops.
+NPUArray AddScalarFirst(const py::object& scalar, const NPUArray& x, Dtype dtype) {
+    return Add(x, scalar, dtype);
+}
+
+NPUArray MultiplyScalarFirst(const py::object& scalar, const NPUArray& x, Dtype dtype) {
+    return Multiply(x, scalar, dtype);
+}
+
 }
 
 
@@ -67,132 +307,129 @@ void bind_math(py::module_& math) {
 
 namespace asnumpy {
 void bind_trigonometric_functions(py::module_& math){   
-    math.def("sin", &Sin, py::arg("x"));
-    math.def("cos", &Cos, py::arg("x"));
-    math.def("tan", &Tan, py::arg("x"));
-    math.def("arcsin",&Arcsin, py::arg("x"));
-    math.def("arccos",&Arccos, py::arg("x"));
-    math.def("arctan",&Arctan, py::arg("x"));
-    math.def("arctan2",&Arctan2, py::arg("x1"), py::arg("x2"));
-    math.def("hypot",&Hypot, py::arg("x1"), py::arg("x2"));
-    math.def("radians",&Radians, py::arg("x"));
+    math.def("sin", WithOut(&Sin, &InplaceSin), py::arg("x"), py::arg("out") = py::none());
+    math.def("cos", WithOut(&Cos, &InplaceCos), py::arg("x"), py::arg("out") = py::none());
+    math.def("tan", WithOut(&Tan, &InplaceTan), py::arg("x"), py::arg("out") = py::none());
+    math.def("arcsin", WithOut(&Arcsin, &InplaceArcsin), py::arg("x"), py::arg("out") = py::none());
+    math.def("arccos", WithOut(&Arccos, &InplaceArccos), py::arg("x"), py::arg("out") = py::none());
+    math.def("arctan", WithOut(&Arctan, &InplaceArctan), py::arg("x"), py::arg("out") = py::none());
+    math.def("arctan2", WithOut(&Arctan2), py::arg("x1"), py::arg("x2"), py::arg("out") = py::none());
+    math.def("hypot", WithOut(&Hypot), py::arg("x1"), py::arg("x2"), py::arg("out") = py::none());
+    math.def("radians", WithOut(&Radians), py::arg("x"), py::arg("out") = py::none());
 }
 
 
 void bind_miscellaneous(py::module_& math){
-    math.def("absolute", &Absolute, py::arg("x"));
-    math.def("fabs", &Fabs, py::arg("x"));
-    math.def("sign", &Sign, py::arg("x"));
-    math.def("heaviside",&Heaviside, py::arg("x1"), py::arg("x2"));
-    math.def("clip", py::overload_cast<const NPUArray&, const NPUArray&, const NPUArray&>(&Clip), 
-            py::arg("a"), py::arg("a_min"), py::arg("a_max"));
-    math.def("clip", py::overload_cast<const NPUArray&, float, float>(&Clip), 
-            py::arg("a"), py::arg("a_min"), py::arg("a_max"));
-    math.def("clip", py::overload_cast<const NPUArray&, float, const NPUArray&>(&Clip), 
-            py::arg("a"), py::arg("a_min"), py::arg("a_max"));
-    math.def("clip", py::overload_cast<const NPUArray&, const NPUArray&, float>(&Clip), 
-            py::arg("a"), py::arg("a_min"), py::arg("a_max"));
-    math.def("nan_to_num",&Nan_to_num, py::arg("x"), py::arg("nan"), py::arg("posinf"), py::arg("neginf"));
-    math.def("square", &Square, py::arg("x"));
-    math.def("maximum", &Maximum, py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
-    math.def("minimum", &Minimum, py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
-    math.def("fmax", &Fmax, py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
-    math.def("fmin", &Fmin, py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
+    math.def("absolute", WithOut(&Absolute), py::arg("x"), py::arg("out") = py::none());
+    math.def("fabs", WithOut(&Fabs), py::arg("x"), py::arg("out") = py::none());
+    math.def("sign", WithOut(&Sign), py::arg("x"), py::arg("out") = py::none());
+    math.def("heaviside", BinaryUfunc<>(&Heaviside), py::arg("x1"), py::arg("x2"), py::arg("out") = py::none());
+    math.def("clip", WithOut(py::overload_cast<const NPUArray&, const NPUArray&, const NPUArray&>(&Clip)), 
+            py::arg("a"), py::arg("a_min"), py::arg("a_max"), py::arg("out") = py::none());
+    math.def("clip", WithOut(py::overload_cast<const NPUArray&, float, float>(&Clip)), 
+            py::arg("a"), py::arg("a_min"), py::arg("a_max"), py::arg("out") = py::none());
+    math.def("clip", WithOut(py::overload_cast<const NPUArray&, float, const NPUArray&>(&Clip)), 
+            py::arg("a"), py::arg("a_min"), py::arg("a_max"), py::arg("out") = py::none());
+    math.def("clip", WithOut(py::overload_cast<const NPUArray&, const NPUArray&, float>(&Clip)), 
+            py::arg("a"), py::arg("a_min"), py::arg("a_max"), py::arg("out") = py::none());
+    math.def("nan_to_num", WithOut(&Nan_to_num), py::arg("x"), py::arg("nan"), py::arg("posinf"), py::arg("neginf"), py::arg("out") = py::none());
+    math.def("square", WithOut(&Square), py::arg("x"), py::arg("out") = py::none());
+    math.def("maximum", BinaryUfunc<Dtype>(&Maximum), py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("minimum", BinaryUfunc<Dtype>(&Minimum), py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("fmax", BinaryUfunc<Dtype>(&Fmax), py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("fmin", BinaryUfunc<Dtype>(&Fmin), py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
 }
 
 void bind_arithmetic_operations(py::module_& math) {
-    math.def("add", &Add, py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
-    math.def("reciprocal", &Reciprocal, py::arg("x"), py::arg("dtype") = py::none());
-    math.def("positive", &Positive, py::arg("x"), py::arg("dtype") = py::none());
-    math.def("negative", &Negative, py::arg("x"), py::arg("dtype") = py::none());
-    math.def("multiply", &Multiply, py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
-    math.def("divide", &Divide, py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
-    math.def("true_divide", &TrueDivide, py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
-    math.def("subtract", &Subtract, py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
-    math.def("floor_divide", &FloorDivide, py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
-    math.def("float_power", &FloatPower, py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
-    math.def("fmod", &Fmod, py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
-    math.def("mod", &Mod, py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
-    math.def("modf", &Modf, py::arg("x"));
-    math.def("remainder", &Remainder, py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
-    math.def("divmod", &Divmod, py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
-    math.def("power",
-        py::overload_cast<const NPUArray&, const NPUArray&, std::optional<py::dtype>>(&Power),
-        py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
-    math.def("power",
-        py::overload_cast<const py::object&, const NPUArray&, std::optional<py::dtype>>(&Power),
-        py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
-    math.def("power",
-        py::overload_cast<const NPUArray&, const py::object&, std::optional<py::dtype>>(&Power),
-        py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
+    math.def("add", BinaryUfunc<Dtype>(&Add, &Add, &AddScalarFirst, &InplaceAdd, true), py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("reciprocal", WithOut(&Reciprocal, &InplaceReciprocal), py::arg("x"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("positive", WithOut(&Positive), py::arg("x"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("negative", WithOut(&Negative, &InplaceNegative), py::arg("x"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("multiply", BinaryUfunc<Dtype>(&Multiply, &Multiply, &MultiplyScalarFirst, &InplaceMultiply, true), py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("divide", BinaryUfunc<Dtype>(&Divide, &Divide, &Divide, &InplaceDivide), py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("true_divide", BinaryUfunc<Dtype>(&TrueDivide, &Divide, &Divide, &InplaceDivide), py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("subtract", BinaryUfunc<Dtype>(&Subtract, &Subtract, &Subtract, &InplaceSubtract), py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("floor_divide", BinaryUfunc<Dtype>(&FloorDivide, &FloorDivide, &FloorDivide, &InplaceFloorDivide), py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("float_power", BinaryUfunc<Dtype>(&FloatPower), py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("fmod", BinaryUfunc<Dtype>(&Fmod, &Fmod, nullptr, &InplaceFmod), py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("mod", BinaryUfunc<Dtype>(&Mod, &Mod, &Mod, &InplaceRemainder), py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("modf", WithOut(&Modf), py::arg("x"), py::arg("out") = py::none());
+    math.def("remainder", BinaryUfunc<Dtype>(&Remainder, &Mod, &Mod, &InplaceRemainder), py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("divmod", WithOut(&Divmod), py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("power", WithOut(py::overload_cast<const NPUArray&, const NPUArray&, std::optional<py::dtype>>(&Power)),
+        py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("power", WithOut(py::overload_cast<const py::object&, const NPUArray&, std::optional<py::dtype>>(&Power)),
+        py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("power", WithOut(py::overload_cast<const NPUArray&, const py::object&, std::optional<py::dtype>>(&Power)),
+        py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
 }
 
 void bind_sums_products_differences(py::module_& math){
-    math.def("prod", py::overload_cast<const NPUArray&, int64_t, bool, std::optional<py::dtype>>(&Prod), 
-            py::arg("a"), py::arg("axis"), py::arg("keepdims"), py::arg("dtype") = py::none());
-    math.def("prod", py::overload_cast<const NPUArray&>(&Prod), py::arg("a"));
-    math.def("sum", py::overload_cast<const NPUArray&, int64_t, bool, std::optional<py::dtype>>(&Sum), 
-            py::arg("a"), py::arg("axis"), py::arg("keepdims"), py::arg("dtype") = py::none());
-    math.def("sum", py::overload_cast<const NPUArray&>(&Sum), py::arg("a"));
-    math.def("nanprod", py::overload_cast<const NPUArray&, int64_t, bool, std::optional<py::dtype>>(&Nanprod), 
-            py::arg("a"), py::arg("axis"), py::arg("keepdims"), py::arg("dtype") = py::none());
-    math.def("nanprod", py::overload_cast<const NPUArray&>(&Nanprod), py::arg("a"));
-    math.def("nansum", py::overload_cast<const NPUArray&, int64_t, bool, std::optional<py::dtype>>(&Nansum), 
-            py::arg("a"), py::arg("axis"), py::arg("keepdims"), py::arg("dtype") = py::none());
-    math.def("nansum", py::overload_cast<const NPUArray&>(&Nansum), py::arg("a"));
-    math.def("cumprod", &Cumprod, py::arg("a"), py::arg("axis"), py::arg("dtype") = py::none());
-    math.def("cumsum", &Cumsum, py::arg("a"), py::arg("axis"), py::arg("dtype") = py::none());
-    math.def("nancumprod", &Nancumprod, py::arg("a"), py::arg("axis"), py::arg("dtype") = py::none());
-    math.def("nancumsum", &Nancumsum, py::arg("a"), py::arg("axis"), py::arg("dtype") = py::none());
-    math.def("cross", &Cross, py::arg("a"), py::arg("b"), py::arg("axis"));
+    math.def("prod", ReductionWithOut(py::overload_cast<const NPUArray&, int64_t, bool, std::optional<py::dtype>>(&Prod)), 
+            py::arg("a"), py::arg("axis"), py::arg("keepdims"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("prod", ReductionWithOut(py::overload_cast<const NPUArray&>(&Prod)), py::arg("a"), py::arg("out") = py::none());
+    math.def("sum", ReductionWithOut(py::overload_cast<const NPUArray&, int64_t, bool, std::optional<py::dtype>>(&Sum)), 
+            py::arg("a"), py::arg("axis"), py::arg("keepdims"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("sum", ReductionWithOut(py::overload_cast<const NPUArray&>(&Sum)), py::arg("a"), py::arg("out") = py::none());
+    math.def("nanprod", ReductionWithOut(py::overload_cast<const NPUArray&, int64_t, bool, std::optional<py::dtype>>(&Nanprod)), 
+            py::arg("a"), py::arg("axis"), py::arg("keepdims"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("nanprod", ReductionWithOut(py::overload_cast<const NPUArray&>(&Nanprod)), py::arg("a"), py::arg("out") = py::none());
+    math.def("nansum", ReductionWithOut(py::overload_cast<const NPUArray&, int64_t, bool, std::optional<py::dtype>>(&Nansum)), 
+            py::arg("a"), py::arg("axis"), py::arg("keepdims"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("nansum", ReductionWithOut(py::overload_cast<const NPUArray&>(&Nansum)), py::arg("a"), py::arg("out") = py::none());
+    math.def("cumprod", ReductionWithOut(&Cumprod), py::arg("a"), py::arg("axis"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("cumsum", ReductionWithOut(&Cumsum), py::arg("a"), py::arg("axis"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("nancumprod", ReductionWithOut(&Nancumprod), py::arg("a"), py::arg("axis"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("nancumsum", ReductionWithOut(&Nancumsum), py::arg("a"), py::arg("axis"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("cross", WithOut(&Cross), py::arg("a"), py::arg("b"), py::arg("axis"), py::arg("out") = py::none());
 }
 
 void bind_exponents_and_logarithms(py::module_& math){
-    math.def("exp", &Exp, py::arg("x"));
-    math.def("expm1", &Expm1, py::arg("x"));
-    math.def("exp2", &Exp2, py::arg("x"));
-    math.def("log", &Log, py::arg("x"));
-    math.def("log10", &Log10, py::arg("x"));
-    math.def("log2", &Log2, py::arg("x"));
-    math.def("log1p", &Log1p, py::arg("x"));
-    math.def("logaddexp", &Logaddexp, py::arg("x1"), py::arg("x2"));
-    math.def("logaddexp2", &Logaddexp2, py::arg("x1"), py::arg("x2"));
+    math.def("exp", WithOut(&Exp, &InplaceExp), py::arg("x"), py::arg("out") = py::none());
+    math.def("expm1", WithOut(&Expm1, &InplaceExpm1), py::arg("x"), py::arg("out") = py::none());
+    math.def("exp2", WithOut(&Exp2, &InplaceExp2), py::arg("x"), py::arg("out") = py::none());
+    math.def("log", WithOut(&Log, &InplaceLog), py::arg("x"), py::arg("out") = py::none());
+    math.def("log10", WithOut(&Log10, &InplaceLog10), py::arg("x"), py::arg("out") = py::none());
+    math.def("log2", WithOut(&Log2, &InplaceLog2), py::arg("x"), py::arg("out") = py::none());
+    math.def("log1p", WithOut(&Log1p, &InplaceLog1p), py::arg("x"), py::arg("out") = py::none());
+    math.def("logaddexp", WithOut(&Logaddexp), py::arg("x1"), py::arg("x2"), py::arg("out") = py::none());
+    math.def("logaddexp2", WithOut(&Logaddexp2), py::arg("x1"), py::arg("x2"), py::arg("out") = py::none());
 }
 
 void bind_handling_complex_numbers(py::module_& math){
-    math.def("real", &Real, py::arg("x"));
+    math.def("real", WithOut(&Real), py::arg("x"), py::arg("out") = py::none());
 }
 
 void bind_floating_point_routines(py::module_& math){
-    math.def("signbit", &Signbit, py::arg("x"));
+    math.def("signbit", WithOut(&Signbit), py::arg("x"), py::arg("out") = py::none());
 }
 
 void bind_hyperbolic_functions(py::module_& math){
-    math.def("sinh", &Sinh, py::arg("x"), py::arg("dtype") = py::none());
-    math.def("cosh", &Cosh, py::arg("x"), py::arg("dtype") = py::none());
-    math.def("tanh", &Tanh, py::arg("x"), py::arg("dtype") = py::none());
-    math.def("arcsinh",&Arcsinh, py::arg("x"), py::arg("dtype") = py::none());
-    math.def("arccosh",&Arccosh, py::arg("x"), py::arg("dtype") = py::none());
-    math.def("arctanh",&Arctanh, py::arg("x"), py::arg("dtype") = py::none());
+    math.def("sinh", WithOut(&Sinh, &InplaceSinh), py::arg("x"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("cosh", WithOut(&Cosh, &InplaceCosh), py::arg("x"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("tanh", WithOut(&Tanh, &InplaceTanh), py::arg("x"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("arcsinh", WithOut(&Arcsinh, &InplaceArcsinh), py::arg("x"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("arccosh", WithOut(&Arccosh, &InplaceArccosh), py::arg("x"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("arctanh", WithOut(&Arctanh, &InplaceArctanh), py::arg("x"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
 }
 
 void bind_other_special_functions(py::module_& math){
-    math.def("sinc", &Sinc, py::arg("x"), py::arg("dtype") = py::none());
+    math.def("sinc", WithOut(&Sinc), py::arg("x"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
 }
 
 void bind_rational_routines(py::module_& math){
-    math.def("gcd", &Gcd, py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
-    math.def("lcm", &Lcm, py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none());
+    math.def("gcd", WithOut(&Gcd), py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("lcm", WithOut(&Lcm), py::arg("x1"), py::arg("x2"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
 }
 
 void bind_rounding(py::module_& math){
-    math.def("around", &Around, py::arg("x"), py::arg("decimals"), py::arg("dtype") = py::none());
-    math.def("round_", &Round_, py::arg("x"), py::arg("decimals"), py::arg("dtype") = py::none());
-    math.def("rint", &Rint, py::arg("x"), py::arg("dtype") = py::none());
-    math.def("fix", &Fix, py::arg("x"), py::arg("dtype") = py::none());
-    math.def("floor", &Floor, py::arg("x"), py::arg("dtype") = py::none());
-    math.def("ceil", &Ceil, py::arg("x"), py::arg("dtype") = py::none());
-    math.def("trunc", &Trunc, py::arg("x"), py::arg("dtype") = py::none());
+    math.def("around", WithOut(&Around), py::arg("x"), py::arg("decimals"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("round_", WithOut(&Round_), py::arg("x"), py::arg("decimals"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("rint", WithOut(&Rint, &InplaceRint), py::arg("x"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("fix", WithOut(&Fix, &InplaceTrunc), py::arg("x"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("floor", WithOut(&Floor, &InplaceFloor), py::arg("x"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("ceil", WithOut(&Ceil, &InplaceCeil), py::arg("x"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
+    math.def("trunc", WithOut(&Trunc, &InplaceTrunc), py::arg("x"), py::arg("dtype") = py::none(), py::arg("out") = py::none());
 }
 
 }
\ No newline at end of file
@@ -0,0 +1,263 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <asnumpy/cann/driver.hpp>
+#include <asnumpy/npu/device.hpp>
+#include <asnumpy/npu/executor_cache.hpp>
+#include <asnumpy/npu/memory_pool.hpp>
+#include <asnumpy/npu/pinned_memory.hpp>
+#include <asnumpy/npu/profiler.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/utils/npu_array.hpp>
+#include <asnumpy/utils/status_handler.hpp>
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#include <cstdint>
+#include <memory>
+#include <optional>
+#include <string>
+#include <vector>
+
+void bind_npu(pybind11::module_& npu) {
+    npu.doc() = "npu module of asnumpy";
+
+    pybind11::class_<asnumpy::npu::MemoryPool>(npu, "MemoryPool",
+        "Caching allocator that backs every ndarray and operator workspace.")
+        .def("used_bytes", &asnumpy::npu::MemoryPool::UsedBytes,
+            "Bytes currently handed out to arrays and workspaces.")
+        .def("total_bytes", &asnumpy::npu::MemoryPool::TotalBytes,
+            "Bytes currently held from the device, used and cached.")
+        .def("free_bytes", &asnumpy::npu::MemoryPool::FreeBytes,
+            "Bytes cached in the pool and available for reuse.")
+        .def("n_free_blocks", &asnumpy::npu::MemoryPool::NumFreeBlocks,
+            "Number of cached free blocks.")
+        .def("free_all_blocks", &asnumpy::npu::MemoryPool::FreeAllBlocks,
+            "Return all unused cached segments to the device.");
+
+    npu.def("memory_pool", [](std::optional<int32_t> device) -> asnumpy::npu::MemoryPool& {
+            return device ? asnumpy::npu::GetMemoryPool(asnumpy::npu::Device(*device).Id())
+                          : asnumpy::npu::GetMemoryPool();
+        }, pybind11::arg("device") = pybind11::none(), pybind11::return_value_policy::reference,
+        "Return the memory pool of device, or of the current device.");
+
+    pybind11::class_<asnumpy::npu::PinnedMemoryPool>(npu, "PinnedMemoryPool",
+        "Caching allocator for page-locked host memory used by host-device copies.")
+        .def("used_bytes", &asnumpy::npu::PinnedMemoryPool::UsedBytes,
+            "Bytes currently handed out to arrays and staging copies.")
+        .def("total_bytes", &asnumpy::npu::PinnedMemoryPool::TotalBytes,
+            "Bytes of page-locked memory currently held, used and cached.")
+        .def("n_free_blocks", &asnumpy::npu::PinnedMemoryPool::NumFreeBlocks,
+            "Number of cached free buffers.")
+        .def("free_all_blocks", &asnumpy::npu::PinnedMemoryPool::FreeAllBlocks,
+            "Wait for pending copies and release all cached buffers.");
+
+    npu.def("pinned_memory_pool", &asnumpy::npu::GetPinnedMemoryPool,
+        pybind11::return_value_policy::reference,
+        "Return the process-wide pinned host memory pool.");
+
+    npu.def("empty_pinned", [](const std::vector<int64_t>& shape, const pybind11::object& dtypeLike) {
+            auto dtype = pybind11::dtype::from_args(dtypeLike);
+            size_t size = static_cast<size_t>(dtype.itemsize());
+            for (int64_t dim : shape) {
+                size *= static_cast<size_t>(dim);
+            }
+            if (size == 0) {
+                return pybind11::array(dtype, shape);
+            }
+            void* ptr = asnumpy::npu::GetPinnedMemoryPool().Malloc(size);
+            pybind11::capsule owner(ptr, [](void* p) { asnumpy::npu::GetPinnedMemoryPool().Free(p); });
+            return pybind11::array(dtype, shape, ptr, owner);
+        }, pybind11::arg("shape"), pybind11::arg("dtype") = pybind11::dtype::of<double>(),
+        "Return a NumPy array backed by page-locked host memory.\n"
+        "Uploads from and downloads into such arrays skip the staging copy.");
+
+    pybind11::class_<asnumpy::npu::WorkspaceArena>(npu, "WorkspaceArena",
+        "Per-stream scratch buffers shared by all operator workspaces.")
+        .def("get", [](asnumpy::npu::WorkspaceArena& self, size_t size) {
+                void* ptr = nullptr;
+                CheckMallocAclnnStatus(self.Get(&ptr, size, asnumpy::npu::GetCurrentStream()));
+                return reinterpret_cast<uintptr_t>(ptr);
+            }, pybind11::arg("size"),
+            "Workspace of at least size bytes for the current stream, as a device address.\n"
+            "It stays valid until the next request on the stream, as for an operator.")
+        .def("used_bytes", &asnumpy::npu::WorkspaceArena::UsedBytes,
+            "Bytes currently held by the workspaces of all streams.")
+        .def("high_water_mark", &asnumpy::npu::WorkspaceArena::HighWaterMark,
+            "Largest number of workspace bytes held at once.")
+        .def("reset_high_water_mark", &asnumpy::npu::WorkspaceArena::ResetHighWaterMark,
+            "Reset the high-water mark to the current usage.")
+        .def("release", &asnumpy::npu::WorkspaceArena::ReleaseAll,
+            "Return all workspaces to the memory pool.");
+
+    npu.def("workspace_arena", [](std::optional<int32_t> device) -> asnumpy::npu::WorkspaceArena& {
+            return device ? asnumpy::npu::GetWorkspaceArena(asnumpy::npu::Device(*device).Id())
+                          : asnumpy::npu::GetWorkspaceArena();
+        }, pybind11::arg("device") = pybind11::none(), pybind11::return_value_policy::reference,
+        "Return the operator workspace arena of device, or of the current device.");
+
+    pybind11::class_<asnumpy::npu::ExecutorCache>(npu, "ExecutorCache",
+        "LRU cache of planned aclnn executors, keyed on op, shapes, strides and dtypes.")
+        .def("hits", &asnumpy::npu::ExecutorCache::Hits,
+            "Number of calls that reused a cached executor.")
+        .def("misses", &asnumpy::npu::ExecutorCache::Misses,
+            "Number of calls that had to plan a new executor.")
+        .def("size", &asnumpy::npu::ExecutorCache::Size,
+            "Number of cached executors.")
+        .def("capacity", &asnumpy::npu::ExecutorCache::Capacity,
+            "Maximum number of cached executors.")
+        .def("set_capacity", &asnumpy::npu::ExecutorCache::SetCapacity, pybind11::arg("capacity"),
+            "Change the capacity, evicting the least recently used executors.")
+        .def("enabled", &asnumpy::npu::ExecutorCache::Enabled,
+            "Whether executors are cached.")
+        .def("set_enabled", &asnumpy::npu::ExecutorCache::SetEnabled, pybind11::arg("enabled"),
+            "Enable or disable caching.")
+        .def("reset_stats", &asnumpy::npu::ExecutorCache::ResetStats,
+            "Reset the hit and miss counters.")
+        .def("clear", &asnumpy::npu::ExecutorCache::Clear,
+            "Destroy all cached executors.");
+
+    npu.def("executor_cache", &asnumpy::npu::GetExecutorCache,
+        pybind11::return_value_policy::reference,
+        "Return the process-wide executor cache.");
+
+    pybind11::class_<asnumpy::npu::Event>(npu, "Event",
+        "Marker in a stream, used to order work across streams and for timing.")
+        .def(pybind11::init<>())
+        .def("record", [](asnumpy::npu::Event& self, const asnumpy::npu::Stream* stream) {
+                self.Record(stream ? stream->Get() : asnumpy::npu::GetCurrentStream());
+            }, pybind11::arg("stream") = pybind11::none(),
+            "Record the event on the given stream, or on the current stream.")
+        .def("synchronize", &asnumpy::npu::Event::Synchronize,
+            "Block until the work recorded before the event has finished.")
+        .def("query", &asnumpy::npu::Event::Query,
+            "Return True if the work recorded before the event has finished.")
+        .def("elapsed_time", &asnumpy::npu::Event::ElapsedTime, pybind11::arg("end"),
+            "Milliseconds elapsed between this event and end.");
+
+    pybind11::class_<asnumpy::npu::Stream>(npu, "Stream",
+        "Queue of device work. Operators run asynchronously on the current stream.")
+        .def(pybind11::init<>())
+        .def("synchronize", &asnumpy::npu::Stream::Synchronize,
+            "Block until all work queued on the stream has finished.")
+        .def("wait_event", &asnumpy::npu::Stream::WaitEvent, pybind11::arg("event"),
+            "Make all future work on the stream wait for the event.")
+        .def("record", [](const asnumpy::npu::Stream& self) {
+                auto event = std::make_unique<asnumpy::npu::Event>();
+                event->Record(self.Get());
+                return event;
+            }, "Record a new event on the stream and return it.")
+        .def("__enter__", [](asnumpy::npu::Stream& self) -> asnumpy::npu::Stream& {
+                self.Enter();
+                return self;
+            }, pybind11::return_value_policy::reference)
+        .def("__exit__", [](asnumpy::npu::Stream& self, pybind11::args) { self.Exit(); })
+        .def_property_readonly("ptr", [](const asnumpy::npu::Stream& self) {
+                return reinterpret_cast<uintptr_t>(self.Get());
+            }, "Raw aclrtStream handle, 0 for the default stream.")
+        .def_property_readonly("device", [](const asnumpy::npu::Stream& self) {
+                return asnumpy::npu::Device(self.Device());
+            }, "Device the stream belongs to.");
+
+    pybind11::class_<asnumpy::npu::Device>(npu, "Device",
+        "An NPU. Used as a context manager it makes the device current: arrays are allocated and "
+        "operators run there, each device with its own memory pool, workspace and streams.")
+        .def(pybind11::init([](std::optional<int32_t> id) {
+                return asnumpy::npu::Device(id.value_or(asnumpy::cann::current_device()));
+            }), pybind11::arg("device_id") = pybind11::none(),
+            "Device device_id, or the current device when omitted.")
+        .def_property_readonly("id", &asnumpy::npu::Device::Id)
+        .def("synchronize", &asnumpy::npu::Device::Synchronize,
+            "Block until all work queued on the device has finished.")
+        .def("__enter__", [](asnumpy::npu::Device& self) -> asnumpy::npu::Device& {
+                self.Enter();
+                return self;
+            }, pybind11::return_value_policy::reference)
+        .def("__exit__", [](asnumpy::npu::Device& self, pybind11::args) { self.Exit(); })
+        .def("__int__", &asnumpy::npu::Device::Id)
+        .def("__index__", &asnumpy::npu::Device::Id)
+        .def("__eq__", [](const asnumpy::npu::Device& self, const pybind11::object& other) {
+                if (pybind11::isinstance<asnumpy::npu::Device>(other)) {
+                    return self.Id() == other.cast<const asnumpy::npu::Device&>().Id();
+                }
+                return pybind11::isinstance<pybind11::int_>(other) && self.Id() == other.cast<int32_t>();
+            })
+        .def("__hash__", [](const asnumpy::npu::Device& self) { return std::hash<int32_t>{}(self.Id()); })
+        .def("__repr__", [](const asnumpy::npu::Device& self) {
+                return "<Device " + std::to_string(self.Id()) + ">";
+            });
+
+    npu.def("current_stream", []() {
+            return std::make_unique<asnumpy::npu::Stream>(asnumpy::npu::GetCurrentStream());
+        }, "Return the current stream of the calling thread.");
+    npu.def("synchronize", []() {
+            if (!asnumpy::cann::is_initialized()) {
+                return;  // nothing has been queued yet
+            }
+            CheckSynchronizeDeviceAclnnStatus(aclrtSynchronizeDevice());
+        }, "Block until all work on all streams of the device has finished.");
+
+    using asnumpy::npu::profiler::Record;
+    pybind11::class_<Record>(npu, "ProfilerRecord",
+        "Operator launch or memory copy recorded by the profiler. Times are microseconds since the "
+        "session started; device times are -1 when unknown.")
+        .def_readonly("name", &Record::name, "aclnn operator, or H2D / D2H / D2D for copies.")
+        .def_readonly("copy", &Record::copy)
+        .def_readonly("shapes", &Record::shapes, "Shapes of the tensor operands in call order.")
+        .def_property_readonly("dtypes", [](const Record& self) {
+                std::vector<std::string> names;
+                for (aclDataType dtype : self.dtypes) {
+                    try {
+                        names.push_back(pybind11::str(NPUArray::GetPyDtype(dtype)));
+                    } catch (const std::exception&) {
+                        names.push_back("undefined");
+                    }
+                }
+                return names;
+            }, "Dtypes of the tensor operands in call order.")
+        .def_readonly("device", &Record::device)
+        .def_readonly("thread", &Record::thread)
+        .def_readonly("stream", &Record::stream)
+        .def_readonly("start", &Record::start)
+        .def_readonly("host_time", &Record::hostTime, "From planning start until the launch returned.")
+        .def_readonly("plan_time", &Record::planTime, "Time in aclnnXxxGetWorkspaceSize.")
+        .def_readonly("cached", &Record::cached, "Executor reused from the executor cache, not planned.")
+        .def_readonly("workspace_bytes", &Record::workspaceBytes)
+        .def_readonly("bytes", &Record::bytes, "Bytes moved by a copy.")
+        .def_readonly("device_start", &Record::deviceStart)
+        .def_readonly("device_time", &Record::deviceTime);
+
+    npu.def("start_profiler", &asnumpy::npu::profiler::Start,
+        "Start recording operators and copies. Use asnumpy.profiler.profile() instead.");
+    npu.def("stop_profiler", &asnumpy::npu::profiler::Stop,
+        "Stop recording and return the records, waiting for the device to read the timing events.");
+    npu.def("profiler_enabled", &asnumpy::npu::profiler::Enabled,
+        "Whether a profiling session is running.");
+
+    npu.def("set_device", &asnumpy::cann::set_device, pybind11::arg("device_id"),
+        "Use device_id for this process and bind the calling thread to it. Without a call, the first "
+        "device use picks the ASNUMPY_DEVICE environment variable, or device 0.");
+    npu.def("current_device", &asnumpy::cann::current_device,
+        "Device the calling thread uses, or will use on its first device access.");
+    npu.def("device_count", &asnumpy::cann::device_count,
+        "Number of devices visible to the process.");
+    npu.def("active_devices", &asnumpy::cann::active_devices,
+        "Devices used so far, each holding a context, a memory pool and a workspace.");
+    npu.def("is_initialized", &asnumpy::cann::is_initialized,
+        "Whether the ACL runtime has been brought up. It is started on first device use, not at import.");
+}
@@ -17,24 +17,201 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <asnumpy/random/distributions.hpp>
+#include <asnumpy/random/random.hpp>
+
+#include <cstdint>
+#include <optional>
+#include <string>
+#include <utility>
+#include <vector>
 
 using namespace asnumpy;
 
+namespace {
+
+/**
+ * @brief Run a sampler with NumPy's size/out conventions.
+ *
+ * size may be None, an int or a sequence; if it is None the shape of out is
+ * used. When out is given the samples are written into it and out itself is
+ * returned.
+ */
+template <typename Sampler>
+py::object Sample(Sampler&& sampler, const py::object& size, const py::object& out) {
+    NPUArray* outArray = out.is_none() ? nullptr : out.cast<NPUArray*>();
+    std::vector<int64_t> shape;
+    if (!size.is_none()) {
+        shape = py::isinstance<py::int_>(size) ? std::vector<int64_t>{size.cast<int64_t>()}
+                                               : size.cast<std::vector<int64_t>>();
+    } else if (outArray != nullptr) {
+        shape = outArray->shape;
+    }
+    NPUArray result = sampler(shape, outArray);
+    if (outArray != nullptr) {
+        return out;
+    }
+    return py::cast(std::move(result));
+}
+
+/**
+ * @brief Allocate the result of a floating-point sampler with a requested dtype.
+ */
+template <typename Sampler>
+py::object SampleFloat(Sampler&& sampler, const py::object& size, py::dtype dtype, const py::object& out) {
+    return Sample([&](const std::vector<int64_t>& shape, NPUArray* outArray) {
+        if (outArray != nullptr || dtype.is(py::dtype::of<double>())) {
+            return sampler(shape, outArray);
+        }
+        NPUArray result(shape, dtype);
+        sampler(shape, &result);
+        return result;
+    }, size, out);
+}
+
+}
+
 void bind_random(pybind11::module_& random) {
     random.doc() = "random module of asnumpy";
 
-    random.def("pareto", &Generator_Pareto, py::arg("a"), py::arg("size"));
-    random.def("rayleigh", &Generator_Rayleigh, py::arg("scale"), py::arg("size"));
-    random.def("normal", &Generator_Normal, py::arg("loc"), py::arg("scale"), py::arg("size"));
-    random.def("uniform", &Generator_Uniform, py::arg("low"), py::arg("high"), py::arg("size"));
-    random.def("standard_normal", &Generator_Standard_normal, py::arg("size"));
-    random.def("standard_cauchy", &Generator_Standard_cauchy, py::arg("size"));
-    random.def("weibull", &Generator_Weibull, py::arg("a"), py::arg("size"));
-    random.def("binomial", &Binomial, py::arg("n"), py::arg("p"), py::arg("size"));
-    random.def("exponential", &Exponential, py::arg("scale"), py::arg("size"));
-    random.def("geometric", &Geometric, py::arg("p"), py::arg("size"));
-    random.def("gumbel", &Gumbel, py::arg("loc"), py::arg("scale"), py::arg("size"));
-    random.def("laplace", &Laplace, py::arg("loc"), py::arg("scale"), py::arg("size"));
-    random.def("logistic", &Logistic, py::arg("loc"), py::arg("scale"), py::arg("size"));
-    random.def("lognormal", &Lognormal, py::arg("mean"), py::arg("sigma"), py::arg("size"));
-}
\ No newline at end of file
+    py::class_<asnumpy::random::Generator>(random, "Generator",
+        "Seedable Philox generator. Each call advances the counter offset, so a\n"
+        "seeded sequence of calls is reproducible and calls never reuse numbers.")
+        .def(py::init<std::optional<uint64_t>>(), py::arg("seed") = py::none())
+        .def_property_readonly("seed", &asnumpy::random::Generator::Seed, "Philox key.")
+        .def_property_readonly("offset", &asnumpy::random::Generator::Offset, "Counter offset of the next call.")
+        .def_property("state",
+            [](const asnumpy::random::Generator& self) { return py::make_tuple(self.Seed(), self.Offset()); },
+            [](asnumpy::random::Generator& self, std::pair<uint64_t, uint64_t> state) { self.SetState(state.first, state.second); },
+            "(seed, offset) tuple; assigning it restores the generator.")
+        .def("spawn", &asnumpy::random::Generator::Spawn, py::arg("n_children"),
+            "Return n_children generators with independent streams.")
+        .def("__repr__", [](const asnumpy::random::Generator& self) {
+                return "Generator(seed=" + std::to_string(self.Seed()) + ", offset=" + std::to_string(self.Offset()) + ")";
+            })
+        .def("random", [](asnumpy::random::Generator& self, py::object size, py::object dtype, py::object out) {
+                return SampleFloat([&](const std::vector<int64_t>& shape, NPUArray* o) {
+                    return Generator_Uniform(0.0, 1.0, shape, &self, o);
+                }, size, py::dtype::from_args(dtype), out);
+            }, py::arg("size") = py::none(), py::arg("dtype") = py::dtype::of<double>(), py::arg("out") = py::none())
+        .def("uniform", [](asnumpy::random::Generator& self, double low, double high, py::object size, py::object out) {
+                return Sample([&](const std::vector<int64_t>& shape, NPUArray* o) {
+                    return Generator_Uniform(low, high, shape, &self, o);
+                }, size, out);
+            }, py::arg("low") = 0.0, py::arg("high") = 1.0, py::arg("size") = py::none(), py::arg("out") = py::none())
+        .def("normal", [](asnumpy::random::Generator& self, float loc, float scale, py::object size, py::object out) {
+                return Sample([&](const std::vector<int64_t>& shape, NPUArray* o) {
+                    return Generator_Normal(loc, scale, shape, &self, o);
+                }, size, out);
+            }, py::arg("loc") = 0.0f, py::arg("scale") = 1.0f, py::arg("size") = py::none(), py::arg("out") = py::none())
+        .def("standard_normal", [](asnumpy::random::Generator& self, py::object size, py::object dtype, py::object out) {
+                return SampleFloat([&](const std::vector<int64_t>& shape, NPUArray* o) {
+                    return Generator_Standard_normal(shape, &self, o);
+                }, size, py::dtype::from_args(dtype), out);
+            }, py::arg("size") = py::none(), py::arg("dtype") = py::dtype::of<double>(), py::arg("out") = py::none())
+        .def("standard_cauchy", [](asnumpy::random::Generator& self, py::object size, py::object out) {
+                return Sample([&](const std::vector<int64_t>& shape, NPUArray* o) {
+                    return Generator_Standard_cauchy(shape, &self, o);
+                }, size, out);
+            }, py::arg("size") = py::none(), py::arg("out") = py::none())
+        .def("pareto", [](asnumpy::random::Generator& self, float a, py::object size, py::object out) {
+                return Sample([&](const std::vector<int64_t>& shape, NPUArray* o) {
+                    return Generator_Pareto(a, shape, &self, o);
+                }, size, out);
+            }, py::arg("a"), py::arg("size") = py::none(), py::arg("out") = py::none())
+        .def("rayleigh", [](asnumpy::random::Generator& self, float scale, py::object size, py::object out) {
+                return Sample([&](const std::vector<int64_t>& shape, NPUArray* o) {
+                    return Generator_Rayleigh(scale, shape, &self, o);
+                }, size, out);
+            }, py::arg("scale") = 1.0f, py::arg("size") = py::none(), py::arg("out") = py::none())
+        .def("weibull", [](asnumpy::random::Generator& self, float a, py::object size, py::object out) {
+                return Sample([&](const std::vector<int64_t>& shape, NPUArray* o) {
+                    return Generator_Weibull(a, shape, &self, o);
+                }, size, out);
+            }, py::arg("a"), py::arg("size") = py::none(), py::arg("out") = py::none())
+        .def("binomial", [](asnumpy::random::Generator& self, int n, float p, py::object size, py::object out) {
+                return Sample([&](const std::vector<int64_t>& shape, NPUArray* o) {
+                    return Binomial(n, p, shape, &self, o);
+                }, size, out);
+            }, py::arg("n"), py::arg("p"), py::arg("size") = py::none(), py::arg("out") = py::none())
+        .def("exponential", [](asnumpy::random::Generator& self, float scale, py::object size, py::object out) {
+                return Sample([&](const std::vector<int64_t>& shape, NPUArray* o) {
+                    return Exponential(scale, shape, &self, o);
+                }, size, out);
+            }, py::arg("scale") = 1.0f, py::arg("size") = py::none(), py::arg("out") = py::none())
+        .def("geometric", [](asnumpy::random::Generator& self, float p, py::object size, py::object out) {
+                return Sample([&](const std::vector<int64_t>& shape, NPUArray* o) {
+                    return Geometric(p, shape, &self, o);
+                }, size, out);
+            }, py::arg("p"), py::arg("size") = py::none(), py::arg("out") = py::none())
+        .def("gumbel", [](asnumpy::random::Generator& self, double loc, double scale, py::object size, py::object out) {
+                return Sample([&](const std::vector<int64_t>& shape, NPUArray* o) {
+                    return Gumbel(loc, scale, shape, &self, o);
+                }, size, out);
+            }, py::arg("loc") = 0.0, py::arg("scale") = 1.0, py::arg("size") = py::none(), py::arg("out") = py::none())
+        .def("laplace", [](asnumpy::random::Generator& self, double loc, double scale, py::object size, py::object out) {
+                return Sample([&](const std::vector<int64_t>& shape, NPUArray* o) {
+                    return Laplace(loc, scale, shape, &self, o);
+                }, size, out);
+            }, py::arg("loc") = 0.0, py::arg("scale") = 1.0, py::arg("size") = py::none(), py::arg("out") = py::none())
+        .def("logistic", [](asnumpy::random::Generator& self, double loc, double scale, py::object size, py::object out) {
+                return Sample([&](const std::vector<int64_t>& shape, NPUArray* o) {
+                    return Logistic(loc, scale, shape, &self, o);
+                }, size, out);
+            }, py::arg("loc") = 0.0, py::arg("scale") = 1.0, py::arg("size") = py::none(), py::arg("out") = py::none())
+        .def("lognormal", [](asnumpy::random::Generator& self, float mean, float sigma, py::object size, py::object out) {
+                return Sample([&](const std::vector<int64_t>& shape, NPUArray* o) {
+                    return Lognormal(mean, sigma, shape, &self, o);
+                }, size, out);
+            }, py::arg("mean") = 0.0f, py::arg("sigma") = 1.0f, py::arg("size") = py::none(), py::arg("out") = py::none());
+
+    random.def("default_rng", [](std::optional<uint64_t> seed) { return asnumpy::random::Generator(seed); },
+        py::arg("seed") = py::none(), "Construct a new Generator.");
+    random.def("seed", &asnumpy::random::SetSeed, py::arg("seed"),
+        "Reseed the generator behind the module-level functions.");
+    random.def("get_default_generator", &asnumpy::random::GetDefaultGenerator, py::return_value_policy::reference,
+        "Return the generator behind the module-level functions.");
+
+    // 模块级函数使用默认 Generator
+    random.def("pareto", [](float a, const std::vector<int64_t>& size) {
+            return Generator_Pareto(a, size);
+        }, py::arg("a"), py::arg("size"));
+    random.def("rayleigh", [](float scale, const std::vector<int64_t>& size) {
+            return Generator_Rayleigh(scale, size);
+        }, py::arg("scale"), py::arg("size"));
+    random.def("normal", [](float loc, float scale, const std::vector<int64_t>& size) {
+            return Generator_Normal(loc, scale, size);
+        }, py::arg("loc"), py::arg("scale"), py::arg("size"));
+    random.def("uniform", [](double low, double high, const std::vector<int64_t>& size) {
+            return Generator_Uniform(low, high, size);
+        }, py::arg("low"), py::arg("high"), py::arg("size"));
+    random.def("standard_normal", [](const std::vector<int64_t>& size) {
+            return Generator_Standard_normal(size);
+        }, py::arg("size"));
+    random.def("standard_cauchy", [](const std::vector<int64_t>& size) {
+            return Generator_Standard_cauchy(size);
+        }, py::arg("size"));
+    random.def("weibull", [](float a, const std::vector<int64_t>& size) {
+            return Generator_Weibull(a, size);
+        }, py::arg("a"), py::arg("size"));
+    random.def("binomial", [](int n, float p, const std::vector<int64_t>& size) {
+            return Binomial(n, p, size);
+        }, py::arg("n"), py::arg("p"), py::arg("size"));
+    random.def("exponential", [](float scale, const std::vector<int64_t>& size) {
+            return Exponential(scale, size);
+        }, py::arg("scale"), py::arg("size"));
+    random.def("geometric", [](float p, const std::vector<int64_t>& size) {
+            return Geometric(p, size);
+        }, py::arg("p"), py::arg("size"));
+    random.def("gumbel", [](double loc, double scale, const std::vector<int64_t>& size) {
+            return Gumbel(loc, scale, size);
+        }, py::arg("loc"), py::arg("scale"), py::arg("size"));
+    random.def("laplace", [](double loc, double scale, const std::vector<int64_t>& size) {
+            return Laplace(loc, scale, size);
+        }, py::arg("loc"), py::arg("scale"), py::arg("size"));
+    random.def("logistic", [](double loc, double scale, const std::vector<int64_t>& size) {
+            return Logistic(loc, scale, size);
+        }, py::arg("loc"), py::arg("scale"), py::arg("size"));
+    random.def("lognormal", [](float mean, float sigma, const std::vector<int64_t>& size) {
+            return Lognormal(mean, sigma, size);
+        }, py::arg("mean"), py::arg("sigma"), py::arg("size"));
+}
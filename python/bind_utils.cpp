@@ -17,17 +17,328 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <asnumpy/utils/npu_array.hpp>
+#include <asnumpy/math/arithmetic_operations.hpp>
+#include <asnumpy/math/miscellaneous.hpp>
+#include <asnumpy/logic/logic.hpp>
+#include <asnumpy/linalg/product.hpp>
+#include <asnumpy/utils/npu_scalar.hpp>
+#include <asnumpy/utils/type_promotion.hpp>
+#include <asnumpy/utils/dlpack.hpp>
+#include <asnumpy/npu/device.hpp>
+#include <asnumpy/npu/stream.hpp>
+
+#include <optional>
+#include <string>
+#include <utility>
+
+namespace asnumpy {
+
+// Objects that stand for an ndarray without being one (asnumpy.fusion.LazyArray)
+// provide __asnumpy_array__() returning it. Bindings taking an ndarray accept them
+// through the implicit conversion registered in bind_utils; bindings taking any
+// object pass their operands through here. Other objects are returned unchanged.
+pybind11::object ArrayOperand(const pybind11::object& x) {
+    if (pybind11::isinstance<NPUArray>(x) || IsPyScalar(x) || !pybind11::hasattr(x, "__asnumpy_array__")) {
+        return x;
+    }
+    return x.attr("__asnumpy_array__")();
+}
+
+}
+
+namespace {
+
+// Implicit conversion to ndarray for the objects ArrayOperand resolves.
+PyObject* ArrayLikeToNPUArray(PyObject* obj, PyTypeObject*) {
+    static bool converting = false;  // no recursion, as in pybind11::implicitly_convertible
+    if (converting || !PyObject_HasAttrString(obj, "__asnumpy_array__")) {
+        return nullptr;
+    }
+    converting = true;
+    PyObject* result = PyObject_CallMethod(obj, "__asnumpy_array__", nullptr);
+    converting = false;
+    if (result == nullptr) {
+        PyErr_Clear();
+    }
+    return result;
+}
+
+// A dtype, type or dtype string; names NumPy does not know (the custom
+// float types when asnumpy.dtypes is not registered) are looked up directly.
+aclDataType ToACLDataType(const pybind11::object& dtype) {
+    if (pybind11::isinstance<pybind11::str>(dtype)) {
+        try {
+            return NPUArray::GetACLDataType(pybind11::dtype::from_args(dtype));
+        } catch (const pybind11::error_already_set&) {
+            return NPUArray::GetACLDataTypeByName(dtype.cast<std::string>());
+        }
+    }
+    return NPUArray::GetACLDataType(pybind11::dtype::from_args(dtype));
+}
+
+pybind11::object NotImplemented() {
+    return pybind11::reinterpret_borrow<pybind11::object>(Py_NotImplemented);
+}
+
+// self op other for an ndarray or a Python scalar other; anything else is
+// NotImplemented so Python can try the reflected operator.
+template <typename ArrayOp, typename ScalarOp>
+pybind11::object Binary(const NPUArray& self, const pybind11::object& other, ArrayOp arrayOp, ScalarOp scalarOp) {
+    if (pybind11::isinstance<NPUArray>(other)) {
+        return pybind11::cast(arrayOp(self, other.cast<const NPUArray&>()));
+    }
+    if (IsPyScalar(other)) {
+        return pybind11::cast(scalarOp(self, other));
+    }
+    auto array = asnumpy::ArrayOperand(other);
+    if (pybind11::isinstance<NPUArray>(array)) {
+        return pybind11::cast(arrayOp(self, array.cast<const NPUArray&>()));
+    }
+    return NotImplemented();
+}
+
+// Binds name(self, other) so that both operand kinds reach C++ without a Python wrapper.
+#define ASNUMPY_BINARY_OPERATOR(name, arrayExpr, scalarExpr)                                                \
+    .def(name, [](const NPUArray& a, const pybind11::object& other) {                                     \
+            return Binary(a, other, [](const NPUArray& x, const NPUArray& y) { return arrayExpr; },        \
+                          [](const NPUArray& x, const pybind11::object& s) { return scalarExpr; });       \
+        }, pybind11::is_operator())
+
+// a op= b: run the aclnnInplace* kernel on a and return the same Python object,
+// so views of a see the update. Like NumPy, the result of a op b must be castable
+// to a's dtype under 'same_kind' (int_array /= 2 and int_array += 0.5 raise).
+template <typename ArrayOp, typename ScalarOp>
+pybind11::object Inplace(pybind11::object self, const pybind11::object& other, const char* ufunc, bool trueDivide,
+                         ArrayOp arrayOp, ScalarOp scalarOp) {
+    auto& array = self.cast<NPUArray&>();
+    auto operand = asnumpy::ArrayOperand(other);
+    bool isArray = pybind11::isinstance<NPUArray>(operand);
+    if (!isArray && !IsPyScalar(operand)) {
+        return NotImplemented();
+    }
+    aclDataType result = isArray ? asnumpy::ResultType(array, operand.cast<const NPUArray&>())
+                                 : asnumpy::ResultType(array, operand);
+    if (trueDivide && asnumpy::IsIntegralType(result)) {
+        result = ACL_DOUBLE;
+    }
+    if (!asnumpy::CanCastSameKind(result, array.aclDtype)) {
+        throw pybind11::type_error(
+            std::string("Cannot cast ufunc '") + ufunc + "' output from "
+            + pybind11::repr(NPUArray::GetPyDtype(result)).cast<std::string>() + " to "
+            + pybind11::repr(NPUArray::GetPyDtype(array.aclDtype)).cast<std::string>()
+            + " with casting rule 'same_kind'");
+    }
+    if (isArray) {
+        arrayOp(array, operand.cast<const NPUArray&>());
+    } else {
+        scalarOp(array, operand);
+    }
+    return self;
+}
+
+// Binds name(self, other) for a op= b with an ndarray or Python scalar b.
+#define ASNUMPY_INPLACE_OPERATOR(name, ufunc, op, trueDivide)                                              \
+    .def(name, [](pybind11::object self, const pybind11::object& other) {                                  \
+            return Inplace(std::move(self), other, ufunc, trueDivide,                                      \
+                           [](NPUArray& x, const NPUArray& y) { op(x, y); },                               \
+                           [](NPUArray& x, const pybind11::object& s) { op(x, s); });                      \
+        }, pybind11::is_operator())
+
+// Makes stream current for the lifetime of the guard; no-op for None.
+struct ScopedStream {
+    explicit ScopedStream(const asnumpy::npu::Stream* stream) : stream_(stream) {
+        if (stream_) stream_->Enter();
+    }
+    ~ScopedStream() {
+        if (stream_) stream_->Exit();
+    }
+    const asnumpy::npu::Stream* stream_;
+};
+
+}
 
 void bind_utils(pybind11::module_& utils) {
-    pybind11::class_<NPUArray>(utils, "ndarray")
+    auto ndarray = pybind11::class_<NPUArray>(utils, "ndarray");
+    pybind11::detail::get_type_info(typeid(NPUArray))->implicit_conversions.push_back(&ArrayLikeToNPUArray);
+    ndarray
         .def(py::init<const std::vector<int64_t>&, py::dtype>(),
             py::arg("shape"), py::arg("dtype"),
             "Constructs an empty NPUArray with the given shape and dtype.")
         .def(py::init<const NPUArray&>(), "Copy constructor for NPUArray")
-        .def("to_numpy", &NPUArray::ToNumpy)
-        .def_static("from_numpy", &NPUArray::FromNumpy, py::arg("host_data"))
+        .def("to_numpy", [](const NPUArray& self, std::optional<py::array> out, const asnumpy::npu::Stream* stream,
+                            const py::object& dtype) {
+                ScopedStream guard(stream);
+                if (dtype.is_none()) {
+                    return self.ToNumpy(out);
+                }
+                return self.ToNumpy(out, py::dtype::from_args(dtype));
+            }, py::arg("out") = py::none(), py::arg("stream") = py::none(), py::arg("dtype") = py::none(),
+            "Copy to host, into out if given, after the work queued on stream (default: current stream).\n"
+            "With dtype, the array is cast on the device first so only the target bytes are transferred.")
+        .def_static("from_numpy", [](py::array host_data, const asnumpy::npu::Stream* stream, bool non_blocking) {
+                ScopedStream guard(stream);
+                return NPUArray::FromNumpy(host_data, non_blocking);
+            }, py::arg("host_data"), py::arg("stream") = py::none(), py::arg("non_blocking") = false,
+            "Copy a NumPy array to the device on stream (default: current stream).\n"
+            "With non_blocking=True the call returns once the copy is queued.")
+        .def("astype", [](const py::object& self, const py::object& dtype, bool copy) -> py::object {
+                const auto& array = self.cast<const NPUArray&>();
+                aclDataType target = ToACLDataType(dtype);
+                if (!copy && target == array.aclDtype) {
+                    return self;
+                }
+                return py::cast(array.AsType(target));
+            }, py::arg("dtype"), py::arg("copy") = true,
+            "Cast to dtype on the device. With copy=False the array itself is returned when it\n"
+            "already has dtype. dtype may also name a custom float type, e.g. 'bfloat16' or 'float8_e4m3fn'.")
+        .def("__dlpack__", [](const NPUArray& self, const py::object& stream, const py::object& max_version,
+                              const py::object& dl_device, std::optional<bool> copy) {
+                if (!dl_device.is_none() && dl_device.cast<std::pair<int32_t, int32_t>>() != asnumpy::DLPackDevice(self)) {
+                    throw py::buffer_error("__dlpack__: cannot export to another device");
+                }
+                asnumpy::npu::DeviceGuard guard(self.device);  // streams below are the array's device's
+                // stream is the consumer's stream: -1 asks for no synchronization, the
+                // current stream is already ordered, anything else waits for pending kernels
+                if (!stream.is_none()) {
+                    auto consumer = stream.cast<intptr_t>();
+                    if (consumer != -1 && consumer != reinterpret_cast<intptr_t>(asnumpy::npu::GetCurrentStream())) {
+                        asnumpy::npu::SynchronizeCurrentStream();
+                    }
+                } else if (asnumpy::npu::GetCurrentStream() != nullptr) {
+                    asnumpy::npu::SynchronizeCurrentStream();
+                }
+                if (copy.value_or(false)) {
+                    return asnumpy::ToDLPack(NPUArray(self));
+                }
+                return asnumpy::ToDLPack(self);
+            }, py::kw_only(), py::arg("stream") = py::none(), py::arg("max_version") = py::none(),
+            py::arg("dl_device") = py::none(), py::arg("copy") = py::none(),
+            "Export as a DLPack capsule sharing the device buffer (copy=True exports a copy).")
+        .def("__dlpack_device__", [](const NPUArray& self) { return asnumpy::DLPackDevice(self); },
+            "DLPack (device_type, device_id) of the array.")
+        .def("item", &NPUArray::Item,
+            "Copy the element of a size-1 array to host as a Python scalar.")
+        .def("__float__", [](const NPUArray& self) { return self.Item().cast<double>(); })
+        .def("__int__", [](const NPUArray& self) { return py::int_(self.Item()); })
+        .def("__bool__", [](const NPUArray& self) {
+                if (self.tensorSize != 1) {
+                    throw py::value_error("The truth value of an array with more than one element is ambiguous.");
+                }
+                return self.Item().cast<bool>();
+            })
         .def_property_readonly("shape", [](const NPUArray& self) { return self.shape; })
         .def_property_readonly("dtype", [](const NPUArray& self) { return self.dtype; })
-        .def_property_readonly("aclDtype", [](const NPUArray& self) { return static_cast<int>(self.aclDtype); });
+        .def_property_readonly("aclDtype", [](const NPUArray& self) { return static_cast<int>(self.aclDtype); })
+        .def_property_readonly("ndim", [](const NPUArray& self) { return self.shape.size(); })
+        .def_property_readonly("size", [](const NPUArray& self) { return self.tensorSize; })
+        .def_property_readonly("device", [](const NPUArray& self) { return asnumpy::npu::Device(self.device); },
+            "Device owning the array's buffer.")
+        .def("to", [](const NPUArray& self, py::object device) {
+                int32_t id = py::isinstance<asnumpy::npu::Device>(device)
+                    ? device.cast<const asnumpy::npu::Device&>().Id() : device.cast<int32_t>();
+                return self.To(id);
+            }, py::arg("device"),
+            "Copy to device (a Device or an id) peer to peer; returns a view if already there.")
+        .def_property_readonly("T", [](const NPUArray& self) { return self.Transpose(); },
+            "View with the axes reversed.")
+        .def("__getitem__", &NPUArray::GetItem, py::arg("key"),
+            "Basic indexing with integers, slices, None and Ellipsis; returns a view.")
+        .def("view", [](const NPUArray& self) { return NPUArray(*self.View()); },
+            "New array object sharing the same device memory.")
+        .def("is_contiguous", &NPUArray::IsContiguous)
+        .def("reshape", [](const NPUArray& self, py::args shape) {
+                std::vector<int64_t> newShape;
+                if (shape.size() == 1 && py::isinstance<py::sequence>(shape[0])) {
+                    newShape = shape[0].cast<std::vector<int64_t>>();
+                } else {
+                    newShape = shape.cast<std::vector<int64_t>>();
+                }
+                return self.Reshape(newShape);
+            }, "Reshape to the given shape; a view when the array is contiguous.")
+        .def("transpose", [](const NPUArray& self, py::args axes) {
+                std::vector<int64_t> perm;
+                if (axes.size() == 1 && py::isinstance<py::sequence>(axes[0])) {
+                    perm = axes[0].cast<std::vector<int64_t>>();
+                } else if (axes.size() != 1 || !axes[0].is_none()) {
+                    perm = axes.cast<std::vector<int64_t>>();
+                }
+                return self.Transpose(perm);
+            }, "View with the axes permuted, reversed if none are given.")
+        .def("squeeze", &NPUArray::Squeeze, py::arg("axis") = py::none(),
+            "View with axes of length one removed.")
+        ASNUMPY_BINARY_OPERATOR("__add__", asnumpy::Add(x, y), asnumpy::Add(x, s))
+        ASNUMPY_BINARY_OPERATOR("__radd__", asnumpy::Add(y, x), asnumpy::Add(x, s))
+        ASNUMPY_BINARY_OPERATOR("__sub__", asnumpy::Subtract(x, y), asnumpy::Subtract(x, s))
+        ASNUMPY_BINARY_OPERATOR("__rsub__", asnumpy::Subtract(y, x), asnumpy::Subtract(s, x))
+        ASNUMPY_BINARY_OPERATOR("__mul__", asnumpy::Multiply(x, y), asnumpy::Multiply(x, s))
+        ASNUMPY_BINARY_OPERATOR("__rmul__", asnumpy::Multiply(y, x), asnumpy::Multiply(x, s))
+        ASNUMPY_BINARY_OPERATOR("__truediv__", asnumpy::Divide(x, y), asnumpy::Divide(x, s))
+        ASNUMPY_BINARY_OPERATOR("__rtruediv__", asnumpy::Divide(y, x), asnumpy::Divide(s, x))
+        ASNUMPY_BINARY_OPERATOR("__floordiv__", asnumpy::FloorDivide(x, y), asnumpy::FloorDivide(x, s))
+        ASNUMPY_BINARY_OPERATOR("__rfloordiv__", asnumpy::FloorDivide(y, x), asnumpy::FloorDivide(s, x))
+        ASNUMPY_BINARY_OPERATOR("__mod__", asnumpy::Mod(x, y), asnumpy::Mod(x, s))
+        ASNUMPY_BINARY_OPERATOR("__rmod__", asnumpy::Mod(y, x), asnumpy::Mod(s, x))
+        ASNUMPY_BINARY_OPERATOR("__pow__", asnumpy::Power(x, y), asnumpy::Power(x, s))
+        ASNUMPY_BINARY_OPERATOR("__rpow__", asnumpy::Power(y, x), asnumpy::Power(s, x))
+        ASNUMPY_BINARY_OPERATOR("__lt__", asnumpy::less(x, y), asnumpy::less(x, s))
+        ASNUMPY_BINARY_OPERATOR("__le__", asnumpy::less_equal(x, y), asnumpy::less_equal(x, s))
+        ASNUMPY_BINARY_OPERATOR("__gt__", asnumpy::greater(x, y), asnumpy::greater(x, s))
+        ASNUMPY_BINARY_OPERATOR("__ge__", asnumpy::greater_equal(x, y), asnumpy::greater_equal(x, s))
+        ASNUMPY_BINARY_OPERATOR("__eq__", asnumpy::equal(x, y), asnumpy::equal(x, s))
+        ASNUMPY_BINARY_OPERATOR("__ne__", asnumpy::not_equal(x, y), asnumpy::not_equal(x, s))
+        .def("__matmul__", [](const NPUArray& a, const NPUArray& b) { return Matmul(a, b); }, py::is_operator())
+        .def("__rmatmul__", [](const NPUArray& a, const NPUArray& b) { return Matmul(b, a); }, py::is_operator())
+        .def("__neg__", [](const NPUArray& a) { return asnumpy::Negative(a); })
+        .def("__pos__", [](const NPUArray& a) { return asnumpy::Positive(a); })
+        .def("__abs__", [](const NPUArray& a) { return asnumpy::Absolute(a); })
+        .def("__invert__", [](const NPUArray& a) {
+                if (a.aclDtype != ACL_BOOL) {
+                    throw py::type_error("~ is only supported for boolean arrays");
+                }
+                return asnumpy::LogicalNot(a);
+            })
+        ASNUMPY_INPLACE_OPERATOR("__iadd__", "add", asnumpy::InplaceAdd, false)
+        ASNUMPY_INPLACE_OPERATOR("__isub__", "subtract", asnumpy::InplaceSubtract, false)
+        ASNUMPY_INPLACE_OPERATOR("__imul__", "multiply", asnumpy::InplaceMultiply, false)
+        ASNUMPY_INPLACE_OPERATOR("__itruediv__", "divide", asnumpy::InplaceDivide, true)
+        ASNUMPY_INPLACE_OPERATOR("__ifloordiv__", "floor_divide", asnumpy::InplaceFloorDivide, false)
+        ASNUMPY_INPLACE_OPERATOR("__imod__", "remainder", asnumpy::InplaceRemainder, false)
+        ASNUMPY_INPLACE_OPERATOR("__ipow__", "power", asnumpy::InplacePower, false);
+#undef ASNUMPY_BINARY_OPERATOR
+#undef ASNUMPY_INPLACE_OPERATOR
     utils.def("broadcast_shape", &GetBroadcastShape, py::arg("a"), py::arg("b"));
+
+    // Zero-copy import of any object implementing __dlpack__ on this NPU; host
+    // (kDLCPU) producers are copied to the device once
+    utils.def("from_dlpack", [](const py::object& x) {
+        if (py::isinstance<py::capsule>(x)) {
+            return asnumpy::FromDLPack(x.cast<py::capsule>());
+        }
+        auto device = x.attr("__dlpack_device__")().cast<std::pair<int32_t, int32_t>>();
+        if (device.first == asnumpy::dlpack::kDLCPU) {
+            py::array host = py::module_::import("numpy").attr("from_dlpack")(x);
+            return NPUArray::FromNumpy(host);
+        }
+        aclrtStream current = asnumpy::npu::GetCurrentStream();
+        py::object stream = py::none();
+        if (current != nullptr) {
+            stream = py::int_(reinterpret_cast<intptr_t>(current));
+        }
+        return asnumpy::FromDLPack(x.attr("__dlpack__")(py::arg("stream") = stream).cast<py::capsule>());
+    }, py::arg("x"),
+    "Wrap a DLPack producer's NPU buffer (e.g. a torch_npu tensor) as an ndarray without copying.");
+
+    // NumPy type promotion (numpy.promote_types / numpy.result_type), Python scalars are weak
+    utils.def("promote_types", [](const py::object& type1, const py::object& type2) {
+        return NPUArray::GetPyDtype(asnumpy::PromoteTypes(ToACLDataType(type1), ToACLDataType(type2)));
+    }, py::arg("type1"), py::arg("type2"));
+    utils.def("result_type", [](const NPUArray& x1, const NPUArray& x2) {
+        return NPUArray::GetPyDtype(asnumpy::ResultType(x1, x2));
+    }, py::arg("x1"), py::arg("x2"));
+    utils.def("result_type", [](const NPUArray& x1, const py::object& scalar) {
+        return NPUArray::GetPyDtype(asnumpy::ResultType(x1, scalar));
+    }, py::arg("x1"), py::arg("scalar"));
+    utils.def("result_type", [](const py::object& scalar, const NPUArray& x2) {
+        return NPUArray::GetPyDtype(asnumpy::ResultType(x2, scalar));
+    }, py::arg("scalar"), py::arg("x2"));
 }
\ No newline at end of file
@@ -62,6 +62,9 @@ class CMakeBuild(build_ext):
             f"-DCMAKE_LIBRARY_OUTPUT_DIRECTORY={os.path.abspath(os.path.join(build_lib, 'asnumpy', 'lib'))}",
             f"-DCMAKE_RUNTIME_OUTPUT_DIRECTORY={os.path.abspath(os.path.join(build_lib, 'asnumpy', 'lib'))}",
         ]
+        # ASNUMPY_HOST_RUNTIME=1 builds against the host stand-in runtime, no CANN needed
+        if os.environ.get("ASNUMPY_HOST_RUNTIME", "0") not in ("", "0"):
+            cmake_args.append("-DASNUMPY_HOST_RUNTIME=ON")
 
         try:
             subprocess.check_output(["ninja", "--version"])
@@ -102,6 +105,6 @@ setup(
         "clean": CMakeClean,
         "build_ext": CMakeBuild,
     },
-    packages=["asnumpy", "asnumpy.lib"],
+    packages=["asnumpy", "asnumpy.lib", "asnumpy.benchmarks"],
     zip_safe = False,
 )
@@ -16,6 +16,9 @@
 
 
 #include "asnumpy/array/basic.hpp"
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/profiler.hpp>
 #include <aclnnop/aclnn_fill_scalar.h>
 #include <aclnnop/aclnn_ones.h>
 #include <aclnnop/aclnn_zero.h>
@@ -47,60 +50,52 @@ NPUArray EmptyLike(const NPUArray& prototype, py::dtype dtype) {
 
 NPUArray Zeros(const std::vector<int64_t>& shape, py::dtype dtype) {
     auto array = NPUArray(shape, dtype);
+    if(array.tensorSize == 0) return array;
     uint64_t workspaceSize = 0;
     aclOpExecutor *executor;
-    auto error = aclnnInplaceZeroGetWorkspaceSize(array.tensorPtr, &workspaceSize, &executor);
+    auto error = asnumpy::npu::profiler::Plan("InplaceZero", aclnnInplaceZeroGetWorkspaceSize, array.tensorPtr, &workspaceSize, &executor);
     if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](zeros) aclnnInplaceZeroGetWorkspaceSize error = {}",error));
     // 检查workspaceSize是否有效
     if(workspaceSize < 0) throw std::runtime_error(fmt::format("[creation.cpp](zeros) Invalid workspaceSize: {}", workspaceSize));
     // 申请工作空间
     void *workspaceAddr = nullptr;
     if(workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](zeros) aclrtMalloc error = {}",error));
     }
-    error = aclnnInplaceZero(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnInplaceZero, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](zeros) aclnnInplaceZero error = {}",error));
-    error = aclrtSynchronizeDevice();
-    if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](zeros) aclrtSynchronizeDevice error = {}",error));
-    // 执行结束后释放工作空间
-    if(workspaceAddr != nullptr) {
-        aclrtFree(workspaceAddr);
-    }
     return array;
 }
 
 NPUArray Zeros_like(const NPUArray& other, py::dtype dtype) {
     auto array = NPUArray(other.shape, dtype);
+    if(array.tensorSize == 0) return array;
     uint64_t workspaceSize = 0;
     aclOpExecutor *executor;
-    auto error = aclnnInplaceZeroGetWorkspaceSize(array.tensorPtr, &workspaceSize, &executor);
+    auto error = asnumpy::npu::profiler::Plan("InplaceZero", aclnnInplaceZeroGetWorkspaceSize, array.tensorPtr, &workspaceSize, &executor);
     if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](zeros) aclnnInplaceZeroGetWorkspaceSize error = {}",error));
     // 检查workspaceSize是否有效
     if(workspaceSize < 0) throw std::runtime_error(fmt::format("[creation.cpp](zeros) Invalid workspaceSize: {}", workspaceSize));
     // 申请工作空间
     void *workspaceAddr = nullptr;
     if(workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](zeros) aclrtMalloc error = {}",error));
     }
-    error = aclnnInplaceZero(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnInplaceZero, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](zeros) aclnnInplaceZero error = {}",error));
-    error = aclrtSynchronizeDevice();
-    if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](zeros) aclrtSynchronizeDevice error = {}",error));
-    // 执行结束后释放工作空间
-    if(workspaceAddr != nullptr) {
-        aclrtFree(workspaceAddr);
-    }
     return array;
 }
 
 NPUArray Full(const std::vector<int64_t>& shape, const py::object& value, py::dtype dtype) {
     auto array = NPUArray(shape, dtype);
+    if(array.tensorSize == 0) return array;
     double valueDouble = 0;
     if (value.is_none()) {
         throw std::runtime_error("[creation.cpp](full) Input is None");
     }
+    CheckPyIntInRange(value, array.aclDtype);
     try {
         valueDouble = py::cast<double>(value);
     } catch (const py::cast_error& e) {
@@ -109,34 +104,31 @@ NPUArray Full(const std::vector<int64_t>& shape, const py::object& value, py::dt
     aclScalar* scalar = CreateScalar(valueDouble, array.aclDtype);
     uint64_t workspaceSize = 0;
     aclOpExecutor *executor;
-    auto error = aclnnInplaceFillScalarGetWorkspaceSize(array.tensorPtr, scalar, &workspaceSize, &executor);
+    auto error = asnumpy::npu::profiler::Plan("InplaceFillScalar", aclnnInplaceFillScalarGetWorkspaceSize, array.tensorPtr, scalar, &workspaceSize, &executor);
     if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](full) aclnnInplaceFillScalarGetWorkspaceSize error = {}",error));
     // 检查workspaceSize是否有效
     if(workspaceSize < 0) throw std::runtime_error(fmt::format("[creation.cpp](full) Invalid workspaceSize: {}", workspaceSize));
     // 3. 申请工作空间
     void *workspaceAddr = nullptr;
     if(workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](full) aclrtMalloc error = {}",error));
     }
-    error = aclnnInplaceFillScalar(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnInplaceFillScalar, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](full) aclnnInplaceFillScalar error = {}", error));
-    error = aclrtSynchronizeDevice();
-    if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](full) aclrtSynchronizeDevice error = {}",error));
     // 6. 释放
-    if(workspaceAddr != nullptr) {
-        aclrtFree(workspaceAddr);
-    }
     aclDestroyScalar(scalar);
     return array;
 }
 
 NPUArray Full_like(const NPUArray& other, const py::object& value, py::dtype dtype) {
     auto array = NPUArray(other.shape, dtype);
+    if(array.tensorSize == 0) return array;
     double valueDouble = 0;
     if (value.is_none()) {
         throw std::runtime_error("[creation.cpp](full) Input is None");
     }
+    CheckPyIntInRange(value, array.aclDtype);
     try {
         valueDouble = py::cast<double>(value);
     } catch (const py::cast_error& e) {
@@ -145,24 +137,19 @@ NPUArray Full_like(const NPUArray& other, const py::object& value, py::dtype dty
     aclScalar* scalar = CreateScalar(valueDouble, array.aclDtype);
     uint64_t workspaceSize = 0;
     aclOpExecutor *executor;
-    auto error = aclnnInplaceFillScalarGetWorkspaceSize(array.tensorPtr, scalar, &workspaceSize, &executor);
+    auto error = asnumpy::npu::profiler::Plan("InplaceFillScalar", aclnnInplaceFillScalarGetWorkspaceSize, array.tensorPtr, scalar, &workspaceSize, &executor);
     if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](full) aclnnInplaceFillScalarGetWorkspaceSize error = {}",error));
     // 检查workspaceSize是否有效
     if(workspaceSize < 0) throw std::runtime_error(fmt::format("[creation.cpp](full) Invalid workspaceSize: {}", workspaceSize));
     // 3. 申请工作空间
     void *workspaceAddr = nullptr;
     if(workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](full) aclrtMalloc error = {}",error));
     }
-    error = aclnnInplaceFillScalar(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnInplaceFillScalar, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](full) aclnnInplaceFillScalar error = {}", error));
-    error = aclrtSynchronizeDevice();
-    if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](full) aclrtSynchronizeDevice error = {}",error));
     // 6. 释放
-    if(workspaceAddr != nullptr) {
-        aclrtFree(workspaceAddr);
-    }
     aclDestroyScalar(scalar);
     return array;
 }
@@ -171,32 +158,27 @@ NPUArray Eye(int64_t n, py::dtype dtype) {
     auto array = NPUArray({n, n}, dtype);
     uint64_t workspaceSize = 0;
     aclOpExecutor *executor;
-    auto error = aclnnEyeGetWorkspaceSize(n, n, array.tensorPtr, &workspaceSize, &executor);
+    auto error = asnumpy::npu::profiler::Plan("Eye", aclnnEyeGetWorkspaceSize, n, n, array.tensorPtr, &workspaceSize, &executor);
     if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](eye) aclnnEyeGetWorkspaceSize error = {}",error));
     // 检查workspaceSize是否有效
     if(workspaceSize < 0) throw std::runtime_error(fmt::format("[creation.cpp](eye) Invalid workspaceSize: {}", workspaceSize));
     // 申请工作空间
     void *workspaceAddr = nullptr;
     if(workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](eye) aclrtMalloc error = {}",error));
     }
-    error = aclnnEye(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnEye, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](eye) aclnnEye error = {}",error));
-    error = aclrtSynchronizeDevice();
-    if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("[creation.cpp](eye) aclrtSynchronizeDevice error = {}",error));
-    // 执行结束后释放工作空间
-    if(workspaceAddr != nullptr) {
-        aclrtFree(workspaceAddr);
-    }
     return array;
 }
 
 NPUArray Ones(const std::vector<int64_t>& shape, py::dtype dtype) {
     auto array = NPUArray(shape, dtype);
+    if(array.tensorSize == 0) return array;
     uint64_t workspaceSize = 0;
     aclOpExecutor *executor;
-    auto error = aclnnInplaceOneGetWorkspaceSize(array.tensorPtr, &workspaceSize, &executor);
+    auto error = asnumpy::npu::profiler::Plan("InplaceOne", aclnnInplaceOneGetWorkspaceSize, array.tensorPtr, &workspaceSize, &executor);
     if(error != ACL_SUCCESS) {
         std::string error_msg = fmt::format("[basic.cpp](ones) aclnnInplaceOneGetWorkspaceSize error = {}", error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -210,7 +192,7 @@ NPUArray Ones(const std::vector<int64_t>& shape, py::dtype dtype) {
     // 申请工作空间
     void *workspaceAddr = nullptr;
     if(workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if(error != ACL_SUCCESS) {
             std::string error_msg = fmt::format("[basic.cpp](ones) aclrtMalloc error = {}", error);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -220,7 +202,7 @@ NPUArray Ones(const std::vector<int64_t>& shape, py::dtype dtype) {
             throw std::runtime_error(error_msg);
         }
     }
-    error = aclnnInplaceOne(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnInplaceOne, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if(error != ACL_SUCCESS) {
         std::string error_msg = fmt::format("[basic.cpp](ones) aclnnInplaceOne error = {}", error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -229,19 +211,6 @@ NPUArray Ones(const std::vector<int64_t>& shape, py::dtype dtype) {
         }
         throw std::runtime_error(error_msg);
     }
-    error = aclrtSynchronizeDevice();
-    if(error != ACL_SUCCESS) {
-        std::string error_msg = fmt::format("[basic.cpp](ones) aclrtSynchronizeDevice error = {}", error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg != nullptr && strlen(detailed_msg) > 0) {
-            error_msg += std::string(" - ") + detailed_msg;
-        }
-        throw std::runtime_error(error_msg);
-    }
-    // 执行结束后释放工作空间
-    if(workspaceAddr != nullptr) {
-        aclrtFree(workspaceAddr);
-    }
     return array;
 }
 
@@ -251,7 +220,7 @@ NPUArray Identity(int64_t n, py::dtype dtype) {
     uint64_t workspaceSize = 0;
     aclOpExecutor *executor;
 
-    auto error = aclnnEyeGetWorkspaceSize(n, n,  // 行, 列, 对角线偏移(k=0)
+    auto error = asnumpy::npu::profiler::Plan("Eye", aclnnEyeGetWorkspaceSize, n, n,  // 行, 列, 对角线偏移(k=0)
                                           array.tensorPtr,
                                           &workspaceSize,
                                           &executor);
@@ -270,7 +239,7 @@ NPUArray Identity(int64_t n, py::dtype dtype) {
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string error_msg = fmt::format("[basic.cpp](identity) aclrtMalloc error = {}", error);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -281,7 +250,7 @@ NPUArray Identity(int64_t n, py::dtype dtype) {
         }
     }
 
-    error = aclnnEye(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnEye, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
         std::string error_msg = fmt::format("[basic.cpp](identity) aclnnEye error = {}", error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -291,27 +260,15 @@ NPUArray Identity(int64_t n, py::dtype dtype) {
         throw std::runtime_error(error_msg);
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        std::string error_msg = fmt::format("[basic.cpp](identity) aclrtSynchronizeDevice error = {}", error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg != nullptr && strlen(detailed_msg) > 0) {
-            error_msg += std::string(" - ") + detailed_msg;
-        }
-        throw std::runtime_error(error_msg);
-    }
-
-    if (workspaceAddr != nullptr) {
-        aclrtFree(workspaceAddr);
-    }
     return array;
 }
 
 NPUArray ones_like(const NPUArray& other, py::dtype dtype) {
     auto array = NPUArray(other.shape, dtype);
+    if(array.tensorSize == 0) return array;
     uint64_t workspaceSize = 0;
     aclOpExecutor *executor;
-    auto error = aclnnInplaceOneGetWorkspaceSize(array.tensorPtr, &workspaceSize, &executor);
+    auto error = asnumpy::npu::profiler::Plan("InplaceOne", aclnnInplaceOneGetWorkspaceSize, array.tensorPtr, &workspaceSize, &executor);
     if (error != ACL_SUCCESS) {
         std::string error_msg = fmt::format("[basic.cpp](ones_like) aclnnInplaceOneGetWorkspaceSize error = {}", error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -325,7 +282,7 @@ NPUArray ones_like(const NPUArray& other, py::dtype dtype) {
     }
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string error_msg = fmt::format("[basic.cpp](ones_like) aclrtMalloc error = {}", error);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -335,7 +292,7 @@ NPUArray ones_like(const NPUArray& other, py::dtype dtype) {
             throw std::runtime_error(error_msg);
         }
     }
-    error = aclnnInplaceOne(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnInplaceOne, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
         std::string error_msg = fmt::format("[basic.cpp](ones_like) aclnnInplaceOne error = {}", error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -344,17 +301,5 @@ NPUArray ones_like(const NPUArray& other, py::dtype dtype) {
         }
         throw std::runtime_error(error_msg);
     }
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        std::string error_msg = fmt::format("[basic.cpp](ones_like) aclrtSynchronizeDevice error = {}", error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && strlen(detailed_msg) > 0) {
-            error_msg += std::string(" - ") + detailed_msg;
-        }
-        throw std::runtime_error(error_msg);
-    }
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
     return array;
 }
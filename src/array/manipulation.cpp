@@ -0,0 +1,35 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+
+#include "asnumpy/array/manipulation.hpp"
+
+
+NPUArray Reshape(const NPUArray& a, const std::vector<int64_t>& newshape) {
+    return a.Reshape(newshape);
+}
+
+NPUArray Transpose(const NPUArray& a, std::optional<std::vector<int64_t>> axes) {
+    return a.Transpose(axes.value_or(std::vector<int64_t>{}));
+}
+
+NPUArray Squeeze(const NPUArray& a, std::optional<int64_t> axis) {
+    return a.Squeeze(axis);
+}
+
+NPUArray ExpandDims(const NPUArray& a, int64_t axis) {
+    return a.ExpandDims(axis);
+}
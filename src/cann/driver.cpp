@@ -15,21 +15,159 @@
  *****************************************************************************/
 
 
+
 #include "asnumpy/cann/driver.hpp"
+#include "asnumpy/utils/status_handler.hpp"
 #include "fmt/base.h"
+#include "fmt/format.h"
+
+#include <atomic>
+#include <cstdlib>
+#include <map>
+#include <mutex>
+#include <stdexcept>
+
+namespace {
+
+std::mutex initMutex;
+std::atomic<bool> initialized{false};
+// device chosen by set_device(), -1 until then
+std::atomic<int32_t> selectedDevice{-1};
+// process-wide generation, bumped by reset_device() and finalize()
+std::atomic<uint64_t> generation{0};
+// context of every device in use, guarded by initMutex
+std::map<int32_t, aclrtContext> contexts;
+
+struct Binding {
+    int32_t device = -1;
+    uint64_t generation = 0;
+};
+
+Binding& ThreadBinding() {
+    thread_local Binding binding;
+    return binding;
+}
+
+int32_t DeviceFromEnv() {
+    const char* env = std::getenv("ASNUMPY_DEVICE");
+    if (env == nullptr || *env == '\0') {
+        return 0;
+    }
+    char* end = nullptr;
+    long id = std::strtol(env, &end, 10);
+    if (*end != '\0' || id < 0) {
+        throw std::invalid_argument(fmt::format(
+            "[driver.cpp](DeviceFromEnv) ASNUMPY_DEVICE must be a device id, got \"{}\"", env));
+    }
+    return static_cast<int32_t>(id);
+}
+
+int32_t SelectedDevice() {
+    int32_t device = selectedDevice.load();
+    return device >= 0 ? device : DeviceFromEnv();
+}
+
+}
 
 void asnumpy::cann::init() {
-    auto ret = aclInit(nullptr);
-    if (ret != ACL_SUCCESS) {
-        auto message = aclGetRecentErrMsg();
-        fmt::println("{}", message);
+    if (initialized.load()) {
+        return;
+    }
+    std::lock_guard<std::mutex> lock(initMutex);
+    if (!initialized.load()) {
+        CheckAclnnStatus(aclInit(nullptr), "[driver.cpp](init) aclInit failed.");
+        initialized.store(true);
     }
 }
 
 void asnumpy::cann::finalize() {
+    std::lock_guard<std::mutex> lock(initMutex);
+    if (!initialized.load()) {
+        return;
+    }
+    for (const auto& [device, context] : contexts) {
+        aclrtResetDevice(device);
+    }
+    contexts.clear();
+    ThreadBinding().device = -1;
+    generation.fetch_add(1);
+    initialized.store(false);
     auto ret = aclFinalize();
     if (ret != ACL_SUCCESS) {
         auto message = aclGetRecentErrMsg();
         fmt::println("{}", message);
     }
-}
\ No newline at end of file
+}
+
+bool asnumpy::cann::is_initialized() {
+    return initialized.load();
+}
+
+void asnumpy::cann::set_device(int32_t device_id) {
+    use_device(device_id);
+    selectedDevice.store(device_id);
+}
+
+void asnumpy::cann::use_device(int32_t device_id) {
+    Binding& binding = ThreadBinding();
+    if (binding.device == device_id && binding.generation == generation.load()) {
+        return;
+    }
+    init();
+    std::lock_guard<std::mutex> lock(initMutex);
+    auto it = contexts.find(device_id);
+    if (it == contexts.end()) {
+        // the first use of a device creates its default context on this thread
+        CheckAclnnStatus(aclrtSetDevice(device_id),
+                         fmt::format("[driver.cpp](use_device) aclrtSetDevice({}) failed.", device_id));
+        aclrtContext context = nullptr;
+        CheckAclnnStatus(aclrtGetCurrentContext(&context),
+                         fmt::format("[driver.cpp](use_device) aclrtGetCurrentContext({}) failed.", device_id));
+        contexts.emplace(device_id, context);
+    } else {
+        CheckAclnnStatus(aclrtSetCurrentContext(it->second),
+                         fmt::format("[driver.cpp](use_device) aclrtSetCurrentContext({}) failed.", device_id));
+    }
+    binding = {device_id, generation.load()};
+}
+
+void asnumpy::cann::reset_device(int32_t device_id) {
+    std::lock_guard<std::mutex> lock(initMutex);
+    if (contexts.erase(device_id) == 0) {
+        return;
+    }
+    CheckAclnnStatus(aclrtResetDevice(device_id), fmt::format("[driver.cpp](reset_device) aclrtResetDevice({}) failed.", device_id));
+    generation.fetch_add(1);
+}
+
+int32_t asnumpy::cann::device_count() {
+    init();
+    uint32_t count = 0;
+    CheckAclnnStatus(aclrtGetDeviceCount(&count), "[driver.cpp](device_count) aclrtGetDeviceCount failed.");
+    return static_cast<int32_t>(count);
+}
+
+std::vector<int32_t> asnumpy::cann::active_devices() {
+    std::lock_guard<std::mutex> lock(initMutex);
+    std::vector<int32_t> devices;
+    for (const auto& [device, context] : contexts) {
+        devices.push_back(device);
+    }
+    return devices;
+}
+
+int32_t asnumpy::cann::current_device() {
+    const Binding& binding = ThreadBinding();
+    if (binding.device >= 0 && binding.generation == generation.load()) {
+        return binding.device;
+    }
+    return SelectedDevice();
+}
+
+void asnumpy::cann::ensure_initialized() {
+    const Binding& binding = ThreadBinding();
+    if (binding.device >= 0 && binding.generation == generation.load()) {
+        return;
+    }
+    use_device(SelectedDevice());
+}
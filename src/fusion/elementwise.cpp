@@ -0,0 +1,351 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#include <asnumpy/fusion/elementwise.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/utils/npu_scalar.hpp>
+#include <asnumpy/utils/status_handler.hpp>
+#include <asnumpy/npu/profiler.hpp>
+
+#include <aclnnop/aclnn_abs.h>
+#include <aclnnop/aclnn_add.h>
+#include <aclnnop/aclnn_addcmul.h>
+#include <aclnnop/aclnn_cos.h>
+#include <aclnnop/aclnn_div.h>
+#include <aclnnop/aclnn_exp.h>
+#include <aclnnop/aclnn_log.h>
+#include <aclnnop/aclnn_mul.h>
+#include <aclnnop/aclnn_neg.h>
+#include <aclnnop/aclnn_reciprocal.h>
+#include <aclnnop/aclnn_rsub.h>
+#include <aclnnop/aclnn_sin.h>
+#include <aclnnop/aclnn_sqrt.h>
+#include <aclnnop/aclnn_sub.h>
+#include <aclnnop/aclnn_tanh.h>
+
+#include <fmt/format.h>
+#include <memory>
+#include <stdexcept>
+#include <unordered_map>
+
+namespace asnumpy {
+namespace fusion {
+
+namespace {
+
+enum class OpCode {
+    Negative, Absolute, Square, Sqrt, Exp, Log, Sin, Cos, Tanh, Reciprocal,
+    Add, Subtract, Multiply, Divide,
+    AddScalar, SubtractScalar, RSubtractScalar, MultiplyScalar, DivideScalar,
+    AddScaled, Addcmul
+};
+
+struct OpInfo {
+    OpCode code;
+    size_t arity;
+    bool inplace;       // has an aclnnInplace variant writing into operand 0
+    bool commutative;   // operands 0 and 1 may be swapped to write into operand 1
+};
+
+const std::unordered_map<std::string, OpInfo>& OpTable() {
+    static const std::unordered_map<std::string, OpInfo> table = {
+        {"negative",         {OpCode::Negative,        1, true,  false}},
+        {"absolute",         {OpCode::Absolute,        1, false, false}},
+        {"square",           {OpCode::Square,          1, true,  false}},
+        {"sqrt",             {OpCode::Sqrt,            1, true,  false}},
+        {"exp",              {OpCode::Exp,             1, true,  false}},
+        {"log",              {OpCode::Log,             1, true,  false}},
+        {"sin",              {OpCode::Sin,             1, true,  false}},
+        {"cos",              {OpCode::Cos,             1, true,  false}},
+        {"tanh",             {OpCode::Tanh,            1, true,  false}},
+        {"reciprocal",       {OpCode::Reciprocal,      1, true,  false}},
+        {"add",              {OpCode::Add,             2, true,  true}},
+        {"subtract",         {OpCode::Subtract,        2, true,  false}},
+        {"multiply",         {OpCode::Multiply,        2, true,  true}},
+        {"divide",           {OpCode::Divide,          2, true,  false}},
+        {"add_scalar",       {OpCode::AddScalar,       1, true,  false}},
+        {"subtract_scalar",  {OpCode::SubtractScalar,  1, true,  false}},
+        {"rsubtract_scalar", {OpCode::RSubtractScalar, 1, false, false}},
+        {"multiply_scalar",  {OpCode::MultiplyScalar,  1, true,  false}},
+        {"divide_scalar",    {OpCode::DivideScalar,    1, true,  false}},
+        {"add_scaled",       {OpCode::AddScaled,       2, true,  false}},
+        {"addcmul",          {OpCode::Addcmul,         3, true,  false}},
+    };
+    return table;
+}
+
+/// Run one aclnn operator on the current stream: plan, take a workspace, launch.
+template <typename GetWorkspaceSize, typename Kernel, typename... Args>
+void Launch(const char* name, GetWorkspaceSize getWorkspaceSize, Kernel kernel, Args... args) {
+    uint64_t workspaceSize = 0;
+    aclOpExecutor* executor = nullptr;
+    auto error = asnumpy::npu::profiler::Plan(name, getWorkspaceSize, args..., &workspaceSize, &executor);
+    CheckAclnnStatus(error, fmt::format("[elementwise.cpp]({}) GetWorkspaceSize failed.", name));
+    void* workspaceAddr = nullptr;
+    if (workspaceSize > 0) {
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
+        CheckMallocAclnnStatus(error);
+    }
+    error = asnumpy::npu::profiler::Launch(kernel, workspaceAddr, workspaceSize, executor,
+                                           asnumpy::npu::GetCurrentStream());
+    CheckAclnnStatus(error, fmt::format("[elementwise.cpp]({}) launch failed.", name));
+}
+
+std::vector<int64_t> BroadcastShapes(const std::vector<int64_t>& a, const std::vector<int64_t>& b) {
+    size_t ndim = std::max(a.size(), b.size());
+    std::vector<int64_t> shape(ndim);
+    for (size_t i = 0; i < ndim; ++i) {
+        int64_t da = i < ndim - a.size() ? 1 : a[i - (ndim - a.size())];
+        int64_t db = i < ndim - b.size() ? 1 : b[i - (ndim - b.size())];
+        if (da != db && da != 1 && db != 1) {
+            throw std::invalid_argument("[elementwise.cpp](Execute) operands could not be broadcast together");
+        }
+        shape[i] = da == 1 ? db : da;
+    }
+    return shape;
+}
+
+/// Scalars are passed as float (double for double tensors); aclnn promotes them to the tensor dtype.
+aclScalar* MakeScalar(double value, aclDataType dtype) {
+    return CreateScalar(value, dtype == ACL_DOUBLE ? ACL_DOUBLE : ACL_FLOAT);
+}
+
+/**
+ * Compute one instruction into out. When inplace is true, out is the same
+ * array as x[0] and the aclnnInplace variant is used.
+ */
+void RunInstruction(OpCode code, double scalar, NPUArray& out, bool inplace, const std::vector<const NPUArray*>& x) {
+    aclTensor* self = inplace ? out.tensorPtr : x[0]->tensorPtr;
+    aclDataType dtype = out.aclDtype;
+    aclScalar* value = nullptr;
+
+    switch (code) {
+        case OpCode::Negative:
+            if (inplace) Launch("negative", aclnnInplaceNegGetWorkspaceSize, aclnnInplaceNeg, self);
+            else Launch("negative", aclnnNegGetWorkspaceSize, aclnnNeg, self, out.tensorPtr);
+            break;
+        case OpCode::Absolute:
+            Launch("absolute", aclnnAbsGetWorkspaceSize, aclnnAbs, self, out.tensorPtr);
+            break;
+        case OpCode::Square:
+            if (inplace) Launch("square", aclnnInplaceMulGetWorkspaceSize, aclnnInplaceMul, self, static_cast<const aclTensor*>(self));
+            else Launch("square", aclnnMulGetWorkspaceSize, aclnnMul, self, self, out.tensorPtr);
+            break;
+        case OpCode::Sqrt:
+            if (inplace) Launch("sqrt", aclnnInplaceSqrtGetWorkspaceSize, aclnnInplaceSqrt, self);
+            else Launch("sqrt", aclnnSqrtGetWorkspaceSize, aclnnSqrt, self, out.tensorPtr);
+            break;
+        case OpCode::Exp:
+            if (inplace) Launch("exp", aclnnInplaceExpGetWorkspaceSize, aclnnInplaceExp, self);
+            else Launch("exp", aclnnExpGetWorkspaceSize, aclnnExp, self, out.tensorPtr);
+            break;
+        case OpCode::Log:
+            if (inplace) Launch("log", aclnnInplaceLogGetWorkspaceSize, aclnnInplaceLog, self);
+            else Launch("log", aclnnLogGetWorkspaceSize, aclnnLog, self, out.tensorPtr);
+            break;
+        case OpCode::Sin:
+            if (inplace) Launch("sin", aclnnInplaceSinGetWorkspaceSize, aclnnInplaceSin, self);
+            else Launch("sin", aclnnSinGetWorkspaceSize, aclnnSin, self, out.tensorPtr);
+            break;
+        case OpCode::Cos:
+            if (inplace) Launch("cos", aclnnInplaceCosGetWorkspaceSize, aclnnInplaceCos, self);
+            else Launch("cos", aclnnCosGetWorkspaceSize, aclnnCos, self, out.tensorPtr);
+            break;
+        case OpCode::Tanh:
+            if (inplace) Launch("tanh", aclnnInplaceTanhGetWorkspaceSize, aclnnInplaceTanh, self);
+            else Launch("tanh", aclnnTanhGetWorkspaceSize, aclnnTanh, self, out.tensorPtr);
+            break;
+        case OpCode::Reciprocal:
+            if (inplace) Launch("reciprocal", aclnnInplaceReciprocalGetWorkspaceSize, aclnnInplaceReciprocal, self);
+            else Launch("reciprocal", aclnnReciprocalGetWorkspaceSize, aclnnReciprocal, self, out.tensorPtr);
+            break;
+        case OpCode::Add:
+        case OpCode::AddScaled:
+            value = MakeScalar(code == OpCode::Add ? 1.0 : scalar, dtype);
+            if (inplace) Launch("add", aclnnInplaceAddGetWorkspaceSize, aclnnInplaceAdd, self, x[1]->tensorPtr, value);
+            else Launch("add", aclnnAddGetWorkspaceSize, aclnnAdd, self, x[1]->tensorPtr, value, out.tensorPtr);
+            break;
+        case OpCode::Subtract:
+            value = MakeScalar(1.0, dtype);
+            if (inplace) Launch("subtract", aclnnInplaceSubGetWorkspaceSize, aclnnInplaceSub, self, x[1]->tensorPtr, value);
+            else Launch("subtract", aclnnSubGetWorkspaceSize, aclnnSub, self, x[1]->tensorPtr, value, out.tensorPtr);
+            break;
+        case OpCode::Multiply:
+            if (inplace) Launch("multiply", aclnnInplaceMulGetWorkspaceSize, aclnnInplaceMul, self, x[1]->tensorPtr);
+            else Launch("multiply", aclnnMulGetWorkspaceSize, aclnnMul, self, x[1]->tensorPtr, out.tensorPtr);
+            break;
+        case OpCode::Divide:
+            if (inplace) Launch("divide", aclnnInplaceDivGetWorkspaceSize, aclnnInplaceDiv, self, x[1]->tensorPtr);
+            else Launch("divide", aclnnDivGetWorkspaceSize, aclnnDiv, self, x[1]->tensorPtr, out.tensorPtr);
+            break;
+        case OpCode::AddScalar:
+        case OpCode::SubtractScalar: {
+            value = MakeScalar(scalar, dtype);
+            aclScalar* alpha = MakeScalar(1.0, dtype);
+            if (code == OpCode::AddScalar) {
+                if (inplace) Launch("add_scalar", aclnnInplaceAddsGetWorkspaceSize, aclnnInplaceAdds, self, value, alpha);
+                else Launch("add_scalar", aclnnAddsGetWorkspaceSize, aclnnAdds, self, value, alpha, out.tensorPtr);
+            } else {
+                if (inplace) Launch("subtract_scalar", aclnnInplaceSubsGetWorkspaceSize, aclnnInplaceSubs, self, value, alpha);
+                else Launch("subtract_scalar", aclnnSubsGetWorkspaceSize, aclnnSubs, self, value, alpha, out.tensorPtr);
+            }
+            aclDestroyScalar(alpha);
+            break;
+        }
+        case OpCode::RSubtractScalar: {
+            value = MakeScalar(scalar, dtype);
+            aclScalar* alpha = MakeScalar(1.0, dtype);
+            Launch("rsubtract_scalar", aclnnRsubsGetWorkspaceSize, aclnnRsubs, self, value, alpha, out.tensorPtr);
+            aclDestroyScalar(alpha);
+            break;
+        }
+        case OpCode::MultiplyScalar:
+            value = MakeScalar(scalar, dtype);
+            if (inplace) Launch("multiply_scalar", aclnnInplaceMulsGetWorkspaceSize, aclnnInplaceMuls, self, value);
+            else Launch("multiply_scalar", aclnnMulsGetWorkspaceSize, aclnnMuls, self, value, out.tensorPtr);
+            break;
+        case OpCode::DivideScalar:
+            value = MakeScalar(scalar, dtype);
+            if (inplace) Launch("divide_scalar", aclnnInplaceDivsGetWorkspaceSize, aclnnInplaceDivs, self, value);
+            else Launch("divide_scalar", aclnnDivsGetWorkspaceSize, aclnnDivs, self, value, out.tensorPtr);
+            break;
+        case OpCode::Addcmul:
+            value = MakeScalar(scalar, dtype);
+            if (inplace) Launch("addcmul", aclnnInplaceAddcmulGetWorkspaceSize, aclnnInplaceAddcmul, self, x[1]->tensorPtr, x[2]->tensorPtr, value);
+            else Launch("addcmul", aclnnAddcmulGetWorkspaceSize, aclnnAddcmul, self, x[1]->tensorPtr, x[2]->tensorPtr, value, out.tensorPtr);
+            break;
+    }
+
+    if (value != nullptr) {
+        aclDestroyScalar(value);
+    }
+}
+
+}
+
+std::vector<NPUArray> Execute(const std::vector<Instruction>& program,
+                              const std::vector<const NPUArray*>& inputs,
+                              const std::vector<int64_t>& outputs) {
+    const int64_t nInputs = static_cast<int64_t>(inputs.size());
+    const int64_t nValues = nInputs + static_cast<int64_t>(program.size());
+
+    // Liveness: the last instruction reading each value.
+    std::vector<int64_t> lastUse(nValues, -1);
+    for (int64_t i = 0; i < static_cast<int64_t>(program.size()); ++i) {
+        for (int64_t v : program[i].operands) {
+            if (v < 0 || v >= nInputs + i) {
+                throw std::invalid_argument(fmt::format(
+                    "[elementwise.cpp](Execute) instruction {} reads undefined value {}", i, v));
+            }
+            lastUse[v] = i;
+        }
+    }
+    std::vector<bool> isOutput(nValues, false);
+    for (int64_t v : outputs) {
+        if (v < 0 || v >= nValues) {
+            throw std::invalid_argument(fmt::format("[elementwise.cpp](Execute) output {} is undefined", v));
+        }
+        isOutput[v] = true;
+    }
+
+    std::vector<std::unique_ptr<NPUArray>> temps(nValues);
+    auto value = [&](int64_t v) -> const NPUArray* {
+        return v < nInputs ? inputs[v] : temps[v].get();
+    };
+
+    for (int64_t i = 0; i < static_cast<int64_t>(program.size()); ++i) {
+        const Instruction& ins = program[i];
+        auto it = OpTable().find(ins.op);
+        if (it == OpTable().end()) {
+            throw std::invalid_argument(fmt::format("[elementwise.cpp](Execute) unsupported op '{}'", ins.op));
+        }
+        const OpInfo& info = it->second;
+        if (ins.operands.size() != info.arity) {
+            throw std::invalid_argument(fmt::format(
+                "[elementwise.cpp](Execute) op '{}' takes {} operands, got {}", ins.op, info.arity, ins.operands.size()));
+        }
+
+        std::vector<int64_t> operands = ins.operands;
+        std::vector<int64_t> shape = value(operands[0])->shape;
+        for (size_t k = 1; k < operands.size(); ++k) {
+            shape = BroadcastShapes(shape, value(operands[k])->shape);
+        }
+        aclDataType dtype = value(operands[0])->aclDtype;
+
+        // Overwrite an operand that dies here instead of allocating.
+        int64_t reuse = -1;
+        if (info.inplace) {
+            size_t candidates = info.commutative ? 2 : 1;
+            for (size_t k = 0; k < candidates; ++k) {
+                int64_t v = operands[k];
+                if (v >= nInputs && lastUse[v] == i && !isOutput[v] &&
+                    temps[v]->shape == shape && temps[v]->aclDtype == dtype) {
+                    reuse = static_cast<int64_t>(k);
+                    break;
+                }
+            }
+        }
+        if (reuse == 1) {
+            std::swap(operands[0], operands[1]);
+        }
+
+        std::vector<const NPUArray*> args;
+        for (int64_t v : operands) {
+            args.push_back(value(v));
+        }
+
+        std::unique_ptr<NPUArray> out;
+        if (reuse >= 0) {
+            out = std::move(temps[operands[0]]);
+        } else {
+            out = std::make_unique<NPUArray>(shape, dtype);
+        }
+        RunInstruction(info.code, ins.scalar, *out, reuse >= 0, args);
+
+        // Dead temporaries go back to the pool; later kernels on this stream
+        // are ordered after the ones still reading them.
+        for (int64_t v : ins.operands) {
+            if (v >= nInputs && lastUse[v] == i && !isOutput[v]) {
+                temps[v].reset();
+            }
+        }
+        temps[nInputs + i] = std::move(out);
+    }
+
+    std::vector<NPUArray> results;
+    results.reserve(outputs.size());
+    for (size_t k = 0; k < outputs.size(); ++k) {
+        int64_t v = outputs[k];
+        if (v < nInputs) {
+            results.emplace_back(*inputs[v]);
+        } else if (temps[v]) {
+            results.push_back(std::move(*temps[v]));
+            temps[v].reset();
+        } else {
+            // The same value requested twice: copy the first result.
+            size_t first = 0;
+            while (outputs[first] != v) {
+                ++first;
+            }
+            results.emplace_back(results[first]);
+        }
+    }
+    return results;
+}
+
+}
+}
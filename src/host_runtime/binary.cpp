@@ -0,0 +1,650 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#include "host_runtime.hpp"
+
+#include <aclnnop/aclnn_add.h>
+#include <aclnnop/aclnn_addcmul.h>
+#include <aclnnop/aclnn_atan2.h>
+#include <aclnnop/aclnn_clamp.h>
+#include <aclnnop/aclnn_div.h>
+#include <aclnnop/aclnn_eq_scalar.h>
+#include <aclnnop/aclnn_eq_tensor.h>
+#include <aclnnop/aclnn_floor_divide.h>
+#include <aclnnop/aclnn_fmod_scalar.h>
+#include <aclnnop/aclnn_fmod_tensor.h>
+#include <aclnnop/aclnn_foreach_mul_scalar.h>
+#include <aclnnop/aclnn_gcd.h>
+#include <aclnnop/aclnn_ge_scalar.h>
+#include <aclnnop/aclnn_ge_tensor.h>
+#include <aclnnop/aclnn_gt_scalar.h>
+#include <aclnnop/aclnn_gt_tensor.h>
+#include <aclnnop/aclnn_heaviside.h>
+#include <aclnnop/aclnn_le_scalar.h>
+#include <aclnnop/aclnn_le_tensor.h>
+#include <aclnnop/aclnn_logaddexp.h>
+#include <aclnnop/aclnn_logaddexp2.h>
+#include <aclnnop/aclnn_logical_and.h>
+#include <aclnnop/aclnn_logical_or.h>
+#include <aclnnop/aclnn_logical_xor.h>
+#include <aclnnop/aclnn_lt_scalar.h>
+#include <aclnnop/aclnn_lt_tensor.h>
+#include <aclnnop/aclnn_maximum.h>
+#include <aclnnop/aclnn_minimum.h>
+#include <aclnnop/aclnn_mul.h>
+#include <aclnnop/aclnn_ne_scalar.h>
+#include <aclnnop/aclnn_ne_tensor.h>
+#include <aclnnop/aclnn_pow.h>
+#include <aclnnop/aclnn_pow_tensor_tensor.h>
+#include <aclnnop/aclnn_remainder.h>
+#include <aclnnop/aclnn_rsub.h>
+#include <aclnnop/aclnn_sub.h>
+
+#include <algorithm>
+#include <limits>
+#include <numeric>
+
+/*
+ * Two- and three-input elementwise operators. Integer division by zero
+ * yields 0, as numpy does after its warning.
+ */
+
+using host::Arg;
+using host::Domain;
+using host::Elementwise;
+using host::Factor;
+using host::Scalar;
+using host::Tensor;
+
+namespace {
+
+template <typename T>
+constexpr bool kIsComplex = host::kIsComplex<T>;
+
+template <typename T>
+constexpr bool kIsInt = std::is_same_v<T, int64_t>;
+
+/// Ordering used by comparisons, maximum and clamp; complex numbers compare lexicographically.
+template <typename T>
+bool Less(T x, T y) {
+    if constexpr (kIsComplex<T>) {
+        return x.real() < y.real() || (x.real() == y.real() && x.imag() < y.imag());
+    } else {
+        return x < y;
+    }
+}
+
+template <typename T>
+bool IsNan(T x) {
+    if constexpr (kIsComplex<T>) {
+        return std::isnan(x.real()) || std::isnan(x.imag());
+    } else if constexpr (std::is_floating_point_v<T>) {
+        return std::isnan(x);
+    } else {
+        return false;
+    }
+}
+
+const auto AddScaled = [](auto x, auto y, auto alpha) { return x + alpha * y; };
+const auto SubScaled = [](auto x, auto y, auto alpha) { return x - alpha * y; };
+const auto RsubScaled = [](auto x, auto y, auto alpha) { return y - alpha * x; };
+const auto Mul = [](auto x, auto y) { return x * y; };
+const auto Addcmul = [](auto x, auto t1, auto t2, auto value) { return x + value * t1 * t2; };
+
+const auto Div = [](auto x, auto y) {
+    if constexpr (kIsInt<decltype(x)>) {
+        return static_cast<double>(x) / static_cast<double>(y);
+    } else {
+        return x / y;
+    }
+};
+
+const auto TruncDiv = [](auto x, auto y) {
+    using T = decltype(x);
+    if constexpr (kIsInt<T>) {
+        return y == 0 ? T(0) : x / y;
+    } else if constexpr (kIsComplex<T>) {
+        host::NotForComplex("truncating division");
+        return x;
+    } else {
+        return std::trunc(x / y);
+    }
+};
+
+const auto FloorDiv = [](auto x, auto y) {
+    using T = decltype(x);
+    if constexpr (kIsInt<T>) {
+        if (y == 0) {
+            return T(0);
+        }
+        T q = x / y;
+        return (x % y != 0 && ((x < 0) != (y < 0))) ? q - 1 : q;
+    } else if constexpr (kIsComplex<T>) {
+        host::NotForComplex("floor division");
+        return x;
+    } else {
+        return std::floor(x / y);
+    }
+};
+
+const auto Fmod = [](auto x, auto y) {
+    using T = decltype(x);
+    if constexpr (kIsInt<T>) {
+        return y == 0 ? T(0) : x % y;
+    } else if constexpr (kIsComplex<T>) {
+        host::NotForComplex("fmod");
+        return x;
+    } else {
+        return std::fmod(x, y);
+    }
+};
+
+/// Python modulo: the result has the sign of the divisor.
+const auto Remainder = [](auto x, auto y) {
+    using T = decltype(x);
+    if constexpr (kIsInt<T>) {
+        if (y == 0) {
+            return T(0);
+        }
+        T r = x % y;
+        return (r != 0 && ((r < 0) != (y < 0))) ? r + y : r;
+    } else if constexpr (kIsComplex<T>) {
+        host::NotForComplex("remainder");
+        return x;
+    } else {
+        T r = std::fmod(x, y);
+        if (r != 0 && ((r < 0) != (y < 0))) {
+            r += y;
+        } else if (r == 0) {
+            r = std::copysign(T(0), y);
+        }
+        return r;
+    }
+};
+
+const auto Gcd = [](auto x, auto y) {
+    using T = decltype(x);
+    if constexpr (kIsInt<T>) {
+        return std::gcd(x, y);
+    } else {
+        throw host::Error("gcd is only defined for integer tensors");
+        return x;
+    }
+};
+
+const auto Atan2 = [](auto x, auto y) {
+    if constexpr (kIsComplex<decltype(x)>) {
+        host::NotForComplex("arctan2");
+        return x;
+    } else {
+        return std::atan2(static_cast<double>(x), static_cast<double>(y));
+    }
+};
+
+const auto Maximum = [](auto x, auto y) {
+    if (IsNan(x)) return x;
+    if (IsNan(y)) return y;
+    return Less(x, y) ? y : x;
+};
+
+const auto Minimum = [](auto x, auto y) {
+    if (IsNan(x)) return x;
+    if (IsNan(y)) return y;
+    return Less(y, x) ? y : x;
+};
+
+/// log(b**x + b**y) without overflow, for b = e (log2 false) or 2.
+template <bool log2>
+auto LogAddExpBase() {
+    return [](auto x, auto y) {
+        if constexpr (kIsComplex<decltype(x)>) {
+            host::NotForComplex("logaddexp");
+            return x;
+        } else {
+            double a = static_cast<double>(x);
+            double b = static_cast<double>(y);
+            const double ln2 = std::log(2.0);
+            if (a == b) {
+                return a + (log2 ? 1.0 : ln2);
+            }
+            double m = std::max(a, b);
+            double d = -std::abs(a - b);
+            if (std::isnan(d)) {
+                return d;
+            }
+            return log2 ? m + std::log1p(std::exp2(d)) / ln2 : m + std::log1p(std::exp(d));
+        }
+    };
+}
+
+const auto LogAddExp = LogAddExpBase<false>();
+const auto LogAddExp2 = LogAddExpBase<true>();
+
+const auto Heaviside = [](auto x, auto values) {
+    using T = decltype(x);
+    if constexpr (kIsComplex<T>) {
+        host::NotForComplex("heaviside");
+        return x;
+    } else {
+        if (IsNan(x)) return x;
+        return x < 0 ? T(0) : (x > 0 ? T(1) : values);
+    }
+};
+
+const auto Pow = [](auto x, auto y) {
+    using T = decltype(x);
+    if constexpr (kIsInt<T>) {
+        if (y < 0) {
+            return x == 1 ? T(1) : (x == -1 ? (y % 2 == 0 ? T(1) : T(-1)) : T(0));
+        }
+        T result = 1;
+        for (T base = x; y > 0; y >>= 1, base *= base) {
+            if (y & 1) {
+                result *= base;
+            }
+        }
+        return result;
+    } else {
+        return std::pow(x, y);
+    }
+};
+
+const auto Eq = [](auto x, auto y) -> bool { return x == y; };
+const auto Ne = [](auto x, auto y) -> bool { return x != y; };
+const auto Lt = [](auto x, auto y) -> bool { return !IsNan(x) && !IsNan(y) && Less(x, y); };
+const auto Gt = [](auto x, auto y) -> bool { return !IsNan(x) && !IsNan(y) && Less(y, x); };
+const auto Le = [](auto x, auto y) -> bool { return !IsNan(x) && !IsNan(y) && !Less(y, x); };
+const auto Ge = [](auto x, auto y) -> bool { return !IsNan(x) && !IsNan(y) && !Less(x, y); };
+
+template <typename T>
+bool Truth(T x) {
+    return x != T(0);
+}
+
+const auto LogicalAnd = [](auto x, auto y) -> bool { return Truth(x) && Truth(y); };
+const auto LogicalOr = [](auto x, auto y) -> bool { return Truth(x) || Truth(y); };
+const auto LogicalXor = [](auto x, auto y) -> bool { return Truth(x) != Truth(y); };
+
+const auto ClampBoth = [](auto x, auto lo, auto hi) {
+    if constexpr (kIsComplex<decltype(x)>) {
+        host::NotForComplex("clamp");
+        return x;
+    } else {
+        if (x < lo) x = lo;
+        if (x > hi) x = hi;
+        return x;
+    }
+};
+const auto ClampLow = [](auto x, auto lo) {
+    if constexpr (kIsComplex<decltype(x)>) {
+        host::NotForComplex("clamp");
+        return x;
+    } else {
+        return x < lo ? lo : x;
+    }
+};
+const auto ClampHigh = [](auto x, auto hi) {
+    if constexpr (kIsComplex<decltype(x)>) {
+        host::NotForComplex("clamp");
+        return x;
+    } else {
+        return x > hi ? hi : x;
+    }
+};
+
+/// Clamp with optional bounds, each a tensor or a scalar.
+aclnnStatus Clamp(const char* op, const aclTensor* self, Arg lo, Arg hi, aclTensor* out,
+                  uint64_t* workspaceSize, aclOpExecutor** executor) {
+    bool hasLo = lo.tensor != nullptr || lo.scalar != nullptr;
+    bool hasHi = hi.tensor != nullptr || hi.scalar != nullptr;
+    if (hasLo && hasHi) {
+        return Elementwise(op, {Tensor(self), lo, hi}, out, workspaceSize, executor, ClampBoth);
+    }
+    if (hasLo) {
+        return Elementwise(op, {Tensor(self), lo}, out, workspaceSize, executor, ClampLow);
+    }
+    if (hasHi) {
+        return Elementwise(op, {Tensor(self), hi}, out, workspaceSize, executor, ClampHigh);
+    }
+    host::SetRecentError(std::string(op) + ": at least one of the bounds must be given");
+    return ACLNN_ERR_PARAM_NULLPTR;
+}
+
+}
+
+// tensor-tensor, tensor-scalar and in-place variants of a two-input operator
+#define BINARY_OP(Op, least, fn)                                                                        \
+    aclnnStatus aclnn##Op##GetWorkspaceSize(const aclTensor* self, const aclTensor* other, aclTensor* out, \
+                                            uint64_t* workspaceSize, aclOpExecutor** executor) {         \
+        return Elementwise(#Op, {Tensor(self), Tensor(other)}, out, workspaceSize, executor, fn, least); \
+    }                                                                                                   \
+    HOST_RUNTIME_LAUNCH(Op)
+
+#define BINARY_SCALAR_OP(Op, least, fn)                                                                 \
+    aclnnStatus aclnn##Op##GetWorkspaceSize(const aclTensor* self, const aclScalar* other, aclTensor* out, \
+                                            uint64_t* workspaceSize, aclOpExecutor** executor) {         \
+        return Elementwise(#Op, {Tensor(self), Scalar(other)}, out, workspaceSize, executor, fn, least); \
+    }                                                                                                   \
+    HOST_RUNTIME_LAUNCH(Op)
+
+#define INPLACE_BINARY_OP(Op, least, fn)                                                                 \
+    aclnnStatus aclnn##Op##GetWorkspaceSize(aclTensor* selfRef, const aclTensor* other,                  \
+                                            uint64_t* workspaceSize, aclOpExecutor** executor) {          \
+        return Elementwise(#Op, {Tensor(selfRef), Tensor(other)}, selfRef, workspaceSize, executor, fn,  \
+                           least);                                                                       \
+    }                                                                                                    \
+    HOST_RUNTIME_LAUNCH(Op)
+
+#define INPLACE_BINARY_SCALAR_OP(Op, least, fn)                                                          \
+    aclnnStatus aclnn##Op##GetWorkspaceSize(aclTensor* selfRef, const aclScalar* other,                  \
+                                            uint64_t* workspaceSize, aclOpExecutor** executor) {          \
+        return Elementwise(#Op, {Tensor(selfRef), Scalar(other)}, selfRef, workspaceSize, executor, fn,  \
+                           least);                                                                       \
+    }                                                                                                    \
+    HOST_RUNTIME_LAUNCH(Op)
+
+// comparisons compute in the inputs' domain and write booleans
+#define COMPARE_OP(Op, fn)                                                                                     \
+    aclnnStatus aclnn##Op##TensorGetWorkspaceSize(const aclTensor* self, const aclTensor* other, aclTensor* out, \
+                                                  uint64_t* workspaceSize, aclOpExecutor** executor) {         \
+        return Elementwise(#Op "Tensor", {Tensor(self), Tensor(other)}, out, workspaceSize, executor, fn,     \
+                           Domain::Int, false);                                                               \
+    }                                                                                                         \
+    HOST_RUNTIME_LAUNCH(Op##Tensor)                                                                           \
+    aclnnStatus aclnn##Op##ScalarGetWorkspaceSize(const aclTensor* self, const aclScalar* other, aclTensor* out, \
+                                                  uint64_t* workspaceSize, aclOpExecutor** executor) {         \
+        return Elementwise(#Op "Scalar", {Tensor(self), Scalar(other)}, out, workspaceSize, executor, fn,     \
+                           Domain::Int, false);                                                               \
+    }                                                                                                         \
+    HOST_RUNTIME_LAUNCH(Op##Scalar)
+
+#define LOGICAL_OP(Op, fn)                                                                              \
+    aclnnStatus aclnn##Op##GetWorkspaceSize(const aclTensor* self, const aclTensor* other, aclTensor* out, \
+                                            uint64_t* workspaceSize, aclOpExecutor** executor) {         \
+        return Elementwise(#Op, {Tensor(self), Tensor(other)}, out, workspaceSize, executor, fn,         \
+                           Domain::Int, false);                                                         \
+    }                                                                                                   \
+    HOST_RUNTIME_LAUNCH(Op)
+
+// ---------------------------------------------------------------- arithmetic
+
+aclnnStatus aclnnAddGetWorkspaceSize(const aclTensor* self, const aclTensor* other, const aclScalar* alpha,
+                                     aclTensor* out, uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("Add", {Tensor(self), Tensor(other), Factor(alpha)}, out, workspaceSize, executor, AddScaled);
+}
+HOST_RUNTIME_LAUNCH(Add)
+
+aclnnStatus aclnnAddsGetWorkspaceSize(const aclTensor* self, const aclScalar* other, const aclScalar* alpha,
+                                      aclTensor* out, uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("Adds", {Tensor(self), Scalar(other), Factor(alpha)}, out, workspaceSize, executor, AddScaled);
+}
+HOST_RUNTIME_LAUNCH(Adds)
+
+aclnnStatus aclnnInplaceAddGetWorkspaceSize(aclTensor* selfRef, const aclTensor* other, const aclScalar* alpha,
+                                            uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("InplaceAdd", {Tensor(selfRef), Tensor(other), Factor(alpha)}, selfRef, workspaceSize,
+                       executor, AddScaled);
+}
+HOST_RUNTIME_LAUNCH(InplaceAdd)
+
+aclnnStatus aclnnInplaceAddsGetWorkspaceSize(aclTensor* selfRef, const aclScalar* other, const aclScalar* alpha,
+                                             uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("InplaceAdds", {Tensor(selfRef), Scalar(other), Factor(alpha)}, selfRef, workspaceSize,
+                       executor, AddScaled);
+}
+HOST_RUNTIME_LAUNCH(InplaceAdds)
+
+aclnnStatus aclnnSubGetWorkspaceSize(const aclTensor* self, const aclTensor* other, const aclScalar* alpha,
+                                     aclTensor* out, uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("Sub", {Tensor(self), Tensor(other), Factor(alpha)}, out, workspaceSize, executor, SubScaled);
+}
+HOST_RUNTIME_LAUNCH(Sub)
+
+aclnnStatus aclnnSubsGetWorkspaceSize(const aclTensor* self, const aclScalar* other, const aclScalar* alpha,
+                                      aclTensor* out, uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("Subs", {Tensor(self), Scalar(other), Factor(alpha)}, out, workspaceSize, executor, SubScaled);
+}
+HOST_RUNTIME_LAUNCH(Subs)
+
+aclnnStatus aclnnInplaceSubGetWorkspaceSize(aclTensor* selfRef, const aclTensor* other, const aclScalar* alpha,
+                                            uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("InplaceSub", {Tensor(selfRef), Tensor(other), Factor(alpha)}, selfRef, workspaceSize,
+                       executor, SubScaled);
+}
+HOST_RUNTIME_LAUNCH(InplaceSub)
+
+aclnnStatus aclnnInplaceSubsGetWorkspaceSize(aclTensor* selfRef, const aclScalar* other, const aclScalar* alpha,
+                                             uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("InplaceSubs", {Tensor(selfRef), Scalar(other), Factor(alpha)}, selfRef, workspaceSize,
+                       executor, SubScaled);
+}
+HOST_RUNTIME_LAUNCH(InplaceSubs)
+
+aclnnStatus aclnnRsubGetWorkspaceSize(const aclTensor* self, const aclTensor* other, const aclScalar* alpha,
+                                      aclTensor* out, uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("Rsub", {Tensor(self), Tensor(other), Factor(alpha)}, out, workspaceSize, executor, RsubScaled);
+}
+HOST_RUNTIME_LAUNCH(Rsub)
+
+aclnnStatus aclnnRsubsGetWorkspaceSize(const aclTensor* self, const aclScalar* other, const aclScalar* alpha,
+                                       aclTensor* out, uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("Rsubs", {Tensor(self), Scalar(other), Factor(alpha)}, out, workspaceSize, executor,
+                       RsubScaled);
+}
+HOST_RUNTIME_LAUNCH(Rsubs)
+
+BINARY_OP(Mul, Domain::Int, Mul)
+BINARY_SCALAR_OP(Muls, Domain::Int, Mul)
+INPLACE_BINARY_OP(InplaceMul, Domain::Int, Mul)
+INPLACE_BINARY_SCALAR_OP(InplaceMuls, Domain::Int, Mul)
+
+BINARY_OP(Div, Domain::Float, Div)
+BINARY_SCALAR_OP(Divs, Domain::Float, Div)
+INPLACE_BINARY_OP(InplaceDiv, Domain::Float, Div)
+INPLACE_BINARY_SCALAR_OP(InplaceDivs, Domain::Float, Div)
+
+aclnnStatus aclnnDivModGetWorkspaceSize(const aclTensor* self, const aclTensor* other, int mode, aclTensor* out,
+                                        uint64_t* workspaceSize, aclOpExecutor** executor) {
+    switch (mode) {
+        case 0:
+            return Elementwise("DivMod", {Tensor(self), Tensor(other)}, out, workspaceSize, executor, Div,
+                               Domain::Float);
+        case 1:
+            return Elementwise("DivMod", {Tensor(self), Tensor(other)}, out, workspaceSize, executor, TruncDiv);
+        case 2:
+            return Elementwise("DivMod", {Tensor(self), Tensor(other)}, out, workspaceSize, executor, FloorDiv);
+        default:
+            host::SetRecentError("DivMod: mode must be 0, 1 or 2");
+            return ACLNN_ERR_PARAM_INVALID;
+    }
+}
+HOST_RUNTIME_LAUNCH(DivMod)
+
+BINARY_OP(FloorDivide, Domain::Int, FloorDiv)
+BINARY_SCALAR_OP(FloorDivides, Domain::Int, FloorDiv)
+INPLACE_BINARY_OP(InplaceFloorDivide, Domain::Int, FloorDiv)
+
+BINARY_SCALAR_OP(FmodScalar, Domain::Int, Fmod)
+BINARY_OP(FmodTensor, Domain::Int, Fmod)
+INPLACE_BINARY_OP(InplaceFmodTensor, Domain::Int, Fmod)
+
+BINARY_OP(RemainderTensorTensor, Domain::Int, Remainder)
+BINARY_SCALAR_OP(RemainderTensorScalar, Domain::Int, Remainder)
+INPLACE_BINARY_OP(InplaceRemainderTensorTensor, Domain::Int, Remainder)
+
+aclnnStatus aclnnRemainderScalarTensorGetWorkspaceSize(const aclScalar* self, const aclTensor* other, aclTensor* out,
+                                                       uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("RemainderScalarTensor", {Scalar(self), Tensor(other)}, out, workspaceSize, executor,
+                       Remainder);
+}
+HOST_RUNTIME_LAUNCH(RemainderScalarTensor)
+
+BINARY_OP(Gcd, Domain::Int, Gcd)
+BINARY_OP(Atan2, Domain::Float, Atan2)
+BINARY_OP(Maximum, Domain::Int, Maximum)
+BINARY_OP(Minimum, Domain::Int, Minimum)
+BINARY_OP(LogAddExp, Domain::Float, LogAddExp)
+BINARY_OP(LogAddExp2, Domain::Float, LogAddExp2)
+
+aclnnStatus aclnnHeavisideGetWorkspaceSize(const aclTensor* input, const aclTensor* values, aclTensor* out,
+                                           uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("Heaviside", {Tensor(input), Tensor(values)}, out, workspaceSize, executor, Heaviside);
+}
+HOST_RUNTIME_LAUNCH(Heaviside)
+
+aclnnStatus aclnnAddcmulGetWorkspaceSize(const aclTensor* self, const aclTensor* tensor1, const aclTensor* tensor2,
+                                         const aclScalar* value, aclTensor* out, uint64_t* workspaceSize,
+                                         aclOpExecutor** executor) {
+    return Elementwise("Addcmul", {Tensor(self), Tensor(tensor1), Tensor(tensor2), Factor(value)}, out,
+                       workspaceSize, executor, Addcmul);
+}
+HOST_RUNTIME_LAUNCH(Addcmul)
+
+aclnnStatus aclnnInplaceAddcmulGetWorkspaceSize(aclTensor* selfRef, const aclTensor* tensor1,
+                                                const aclTensor* tensor2, const aclScalar* value,
+                                                uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("InplaceAddcmul", {Tensor(selfRef), Tensor(tensor1), Tensor(tensor2), Factor(value)},
+                       selfRef, workspaceSize, executor, Addcmul);
+}
+HOST_RUNTIME_LAUNCH(InplaceAddcmul)
+
+// ---------------------------------------------------------------- powers
+
+aclnnStatus aclnnPowTensorScalarGetWorkspaceSize(const aclTensor* self, const aclScalar* exponent, aclTensor* out,
+                                                 uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("PowTensorScalar", {Tensor(self), Scalar(exponent)}, out, workspaceSize, executor, Pow);
+}
+HOST_RUNTIME_LAUNCH(PowTensorScalar)
+
+aclnnStatus aclnnPowScalarTensorGetWorkspaceSize(const aclScalar* self, const aclTensor* exponent, aclTensor* out,
+                                                 uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("PowScalarTensor", {Scalar(self), Tensor(exponent)}, out, workspaceSize, executor, Pow);
+}
+HOST_RUNTIME_LAUNCH(PowScalarTensor)
+
+aclnnStatus aclnnInplacePowTensorScalarGetWorkspaceSize(aclTensor* selfRef, const aclScalar* exponent,
+                                                        uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("InplacePowTensorScalar", {Tensor(selfRef), Scalar(exponent)}, selfRef, workspaceSize,
+                       executor, Pow);
+}
+HOST_RUNTIME_LAUNCH(InplacePowTensorScalar)
+
+aclnnStatus aclnnPowTensorTensorGetWorkspaceSize(const aclTensor* self, const aclTensor* exponent, aclTensor* out,
+                                                 uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("PowTensorTensor", {Tensor(self), Tensor(exponent)}, out, workspaceSize, executor, Pow);
+}
+HOST_RUNTIME_LAUNCH(PowTensorTensor)
+
+aclnnStatus aclnnInplacePowTensorTensorGetWorkspaceSize(aclTensor* selfRef, const aclTensor* exponent,
+                                                        uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("InplacePowTensorTensor", {Tensor(selfRef), Tensor(exponent)}, selfRef, workspaceSize,
+                       executor, Pow);
+}
+HOST_RUNTIME_LAUNCH(InplacePowTensorTensor)
+
+// ---------------------------------------------------------------- comparisons
+
+COMPARE_OP(Eq, Eq)
+COMPARE_OP(Ne, Ne)
+COMPARE_OP(Lt, Lt)
+COMPARE_OP(Le, Le)
+COMPARE_OP(Gt, Gt)
+COMPARE_OP(Ge, Ge)
+
+LOGICAL_OP(LogicalAnd, LogicalAnd)
+LOGICAL_OP(LogicalOr, LogicalOr)
+LOGICAL_OP(LogicalXor, LogicalXor)
+
+// ---------------------------------------------------------------- clamp
+
+aclnnStatus aclnnClampGetWorkspaceSize(const aclTensor* self, const aclScalar* clipValueMin,
+                                       const aclScalar* clipValueMax, aclTensor* out, uint64_t* workspaceSize,
+                                       aclOpExecutor** executor) {
+    return Clamp("Clamp", self, Scalar(clipValueMin), Scalar(clipValueMax), out, workspaceSize, executor);
+}
+HOST_RUNTIME_LAUNCH(Clamp)
+
+aclnnStatus aclnnClampMinGetWorkspaceSize(const aclTensor* self, const aclScalar* clipValueMin, aclTensor* out,
+                                          uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Clamp("ClampMin", self, Scalar(clipValueMin), Arg{}, out, workspaceSize, executor);
+}
+HOST_RUNTIME_LAUNCH(ClampMin)
+
+aclnnStatus aclnnClampMaxGetWorkspaceSize(const aclTensor* self, const aclScalar* clipValueMax, aclTensor* out,
+                                          uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Clamp("ClampMax", self, Arg{}, Scalar(clipValueMax), out, workspaceSize, executor);
+}
+HOST_RUNTIME_LAUNCH(ClampMax)
+
+aclnnStatus aclnnClampTensorGetWorkspaceSize(const aclTensor* self, const aclTensor* clipValueMin,
+                                             const aclTensor* clipValueMax, aclTensor* out, uint64_t* workspaceSize,
+                                             aclOpExecutor** executor) {
+    return Clamp("ClampTensor", self, Tensor(clipValueMin), Tensor(clipValueMax), out, workspaceSize, executor);
+}
+HOST_RUNTIME_LAUNCH(ClampTensor)
+
+aclnnStatus aclnnClampMinTensorGetWorkspaceSize(const aclTensor* self, const aclTensor* clipValueMin, aclTensor* out,
+                                                uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Clamp("ClampMinTensor", self, Tensor(clipValueMin), Arg{}, out, workspaceSize, executor);
+}
+HOST_RUNTIME_LAUNCH(ClampMinTensor)
+
+aclnnStatus aclnnClampMaxTensorGetWorkspaceSize(const aclTensor* self, const aclTensor* clipValueMax, aclTensor* out,
+                                                uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Clamp("ClampMaxTensor", self, Arg{}, Tensor(clipValueMax), out, workspaceSize, executor);
+}
+HOST_RUNTIME_LAUNCH(ClampMaxTensor)
+
+// ---------------------------------------------------------------- foreach
+
+aclnnStatus aclnnForeachMulScalarGetWorkspaceSize(const aclTensorList* x, const aclTensor* scalar,
+                                                  const aclTensorList* out, uint64_t* workspaceSize,
+                                                  aclOpExecutor** executor) {
+    if (x == nullptr || out == nullptr) {
+        host::SetRecentError("ForeachMulScalar: tensor list is null");
+        return ACLNN_ERR_PARAM_NULLPTR;
+    }
+    std::vector<const aclTensor*> inputs = host::TensorsOf(x);
+    std::vector<const aclTensor*> outputs = host::TensorsOf(out);
+    const size_t n = inputs.size();
+    inputs.push_back(scalar);
+    return host::Plan("ForeachMulScalar", inputs, outputs, workspaceSize, executor, [&]() -> host::Kernel {
+        if (outputs.size() != n) {
+            throw host::Error("x and out must have the same number of tensors");
+        }
+        host::View factor = host::ViewOf(scalar);
+        if (factor.Numel() != 1) {
+            throw host::Error("scalar must have exactly one element");
+        }
+        std::vector<Domain> domains;
+        for (size_t i = 0; i < n; ++i) {
+            host::View in = host::ViewOf(inputs[i]);
+            host::View result = host::ViewOf(outputs[i]);
+            host::CheckBroadcastable(in, result.dims, "x");
+            domains.push_back(host::Max(host::Max(host::DomainOf(in.dtype), host::DomainOf(result.dtype)),
+                                        host::DomainOf(factor.dtype)));
+        }
+        return [n, domains](const std::vector<host::View>& tensors) {
+            host::View factor = tensors[n];
+            factor.dims.clear();
+            factor.strides.clear();
+            for (size_t i = 0; i < n; ++i) {
+                host::Compute(domains[i], tensors[n + 1 + i], {&tensors[i], &factor}, Mul);
+            }
+        };
+    });
+}
+HOST_RUNTIME_LAUNCH(ForeachMulScalar)
@@ -0,0 +1,480 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#pragma once
+
+#include <aclnn/aclnn_base.h>
+
+#include <cmath>
+#include <complex>
+#include <cstdint>
+#include <cstring>
+#include <functional>
+#include <memory>
+#include <stdexcept>
+#include <string>
+#include <type_traits>
+#include <vector>
+
+/*
+ * Internals of the host runtime: descriptor layouts, dtype conversion,
+ * strided iteration and the plan/launch protocol shared by all kernels.
+ */
+
+namespace host {
+
+/// Thrown while planning or running an op; becomes the returned status.
+class Error : public std::runtime_error {
+public:
+    Error(aclnnStatus status, const std::string& message) : std::runtime_error(message), status(status) {}
+    explicit Error(const std::string& message) : Error(ACLNN_ERR_PARAM_INVALID, message) {}
+    aclnnStatus status;
+};
+
+/// Message returned by aclGetRecentErrMsg on the calling thread.
+void SetRecentError(const std::string& message);
+
+/// Queue a task on a stream (nullptr is the default stream); tasks run in order on the stream's worker.
+void Enqueue(aclrtStream stream, std::function<void()> task);
+
+// ---------------------------------------------------------------- dtypes
+
+/// Arithmetic a kernel computes in: int64, double or complex<double>.
+enum class Domain { Int = 0, Float = 1, Complex = 2 };
+
+using Complex = std::complex<double>;
+
+size_t ElementSize(aclDataType dtype);
+bool IsSupported(aclDataType dtype);
+Domain DomainOf(aclDataType dtype);
+const char* DtypeName(aclDataType dtype);
+
+inline Domain Max(Domain a, Domain b) { return a > b ? a : b; }
+
+template <typename T>
+struct IsComplexType : std::false_type {};
+template <typename T>
+struct IsComplexType<std::complex<T>> : std::true_type {};
+template <typename T>
+constexpr bool kIsComplex = IsComplexType<T>::value;
+
+float HalfToFloat(uint16_t bits);
+uint16_t FloatToHalf(float value);
+float Bfloat16ToFloat(uint16_t bits);
+uint16_t FloatToBfloat16(float value);
+
+/// Value conversion with C semantics, except that NaN and inf become 0 in integers.
+template <typename To, typename From>
+To Convert(From v) {
+    if constexpr (kIsComplex<To>) {
+        using Part = typename To::value_type;
+        if constexpr (kIsComplex<From>) {
+            return To(static_cast<Part>(v.real()), static_cast<Part>(v.imag()));
+        } else {
+            return To(static_cast<Part>(v), Part(0));
+        }
+    } else if constexpr (kIsComplex<From>) {
+        return Convert<To>(v.real());
+    } else if constexpr (std::is_same_v<To, bool>) {
+        return v != From(0);
+    } else if constexpr (std::is_integral_v<To> && std::is_floating_point_v<From>) {
+        if (!std::isfinite(v)) {
+            return To(0);
+        }
+        if constexpr (std::is_unsigned_v<To>) {
+            return v < 0 ? static_cast<To>(static_cast<int64_t>(v)) : static_cast<To>(v);
+        } else {
+            return static_cast<To>(static_cast<int64_t>(v));
+        }
+    } else {
+        return static_cast<To>(v);
+    }
+}
+
+/// Read one element of dtype at p as T (int64_t, double or Complex).
+template <typename T>
+T Load(const char* p, aclDataType dtype) {
+    switch (dtype) {
+        case ACL_BOOL: return Convert<T>(*reinterpret_cast<const bool*>(p));
+        case ACL_INT8: return Convert<T>(*reinterpret_cast<const int8_t*>(p));
+        case ACL_INT16: return Convert<T>(*reinterpret_cast<const int16_t*>(p));
+        case ACL_INT32: return Convert<T>(*reinterpret_cast<const int32_t*>(p));
+        case ACL_INT64: return Convert<T>(*reinterpret_cast<const int64_t*>(p));
+        case ACL_UINT8: return Convert<T>(*reinterpret_cast<const uint8_t*>(p));
+        case ACL_UINT16: return Convert<T>(*reinterpret_cast<const uint16_t*>(p));
+        case ACL_UINT32: return Convert<T>(*reinterpret_cast<const uint32_t*>(p));
+        case ACL_UINT64: return Convert<T>(*reinterpret_cast<const uint64_t*>(p));
+        case ACL_FLOAT16: return Convert<T>(HalfToFloat(*reinterpret_cast<const uint16_t*>(p)));
+        case ACL_BF16: return Convert<T>(Bfloat16ToFloat(*reinterpret_cast<const uint16_t*>(p)));
+        case ACL_FLOAT: return Convert<T>(*reinterpret_cast<const float*>(p));
+        case ACL_DOUBLE: return Convert<T>(*reinterpret_cast<const double*>(p));
+        case ACL_COMPLEX64: return Convert<T>(*reinterpret_cast<const std::complex<float>*>(p));
+        case ACL_COMPLEX128: return Convert<T>(*reinterpret_cast<const Complex*>(p));
+        default: throw Error(std::string("unsupported dtype ") + DtypeName(dtype));
+    }
+}
+
+/// Write value to one element of dtype at p.
+template <typename T>
+void Store(char* p, aclDataType dtype, T value) {
+    switch (dtype) {
+        case ACL_BOOL: *reinterpret_cast<bool*>(p) = Convert<bool>(value); break;
+        case ACL_INT8: *reinterpret_cast<int8_t*>(p) = Convert<int8_t>(value); break;
+        case ACL_INT16: *reinterpret_cast<int16_t*>(p) = Convert<int16_t>(value); break;
+        case ACL_INT32: *reinterpret_cast<int32_t*>(p) = Convert<int32_t>(value); break;
+        case ACL_INT64: *reinterpret_cast<int64_t*>(p) = Convert<int64_t>(value); break;
+        case ACL_UINT8: *reinterpret_cast<uint8_t*>(p) = Convert<uint8_t>(value); break;
+        case ACL_UINT16: *reinterpret_cast<uint16_t*>(p) = Convert<uint16_t>(value); break;
+        case ACL_UINT32: *reinterpret_cast<uint32_t*>(p) = Convert<uint32_t>(value); break;
+        case ACL_UINT64: *reinterpret_cast<uint64_t*>(p) = Convert<uint64_t>(value); break;
+        case ACL_FLOAT16: *reinterpret_cast<uint16_t*>(p) = FloatToHalf(Convert<float>(value)); break;
+        case ACL_BF16: *reinterpret_cast<uint16_t*>(p) = FloatToBfloat16(Convert<float>(value)); break;
+        case ACL_FLOAT: *reinterpret_cast<float*>(p) = Convert<float>(value); break;
+        case ACL_DOUBLE: *reinterpret_cast<double*>(p) = Convert<double>(value); break;
+        case ACL_COMPLEX64: *reinterpret_cast<std::complex<float>*>(p) = Convert<std::complex<float>>(value); break;
+        case ACL_COMPLEX128: *reinterpret_cast<Complex*>(p) = Convert<Complex>(value); break;
+        default: throw Error(std::string("unsupported dtype ") + DtypeName(dtype));
+    }
+}
+
+/// Calls fn(T{}) with T the C++ type of domain.
+template <typename Fn>
+void Dispatch(Domain domain, Fn&& fn) {
+    switch (domain) {
+        case Domain::Int: fn(int64_t{}); break;
+        case Domain::Float: fn(double{}); break;
+        case Domain::Complex: fn(Complex{}); break;
+    }
+}
+
+// ---------------------------------------------------------------- descriptors
+
+/// Tensor as seen by a kernel: a strided view over base.
+struct View {
+    char* base = nullptr;
+    int64_t offset = 0;                 // elements from base to the first element
+    aclDataType dtype = ACL_DT_UNDEFINED;
+    std::vector<int64_t> dims;
+    std::vector<int64_t> strides;       // in elements
+
+    char* Data() const { return base + offset * static_cast<int64_t>(ElementSize(dtype)); }
+    int64_t Numel() const;
+    int64_t Rank() const { return static_cast<int64_t>(dims.size()); }
+    /// Address of the element at a multi-index.
+    char* At(const std::vector<int64_t>& index) const;
+};
+
+/// Scalar operand, captured by value when the op is planned.
+struct Value {
+    aclDataType dtype = ACL_DT_UNDEFINED;
+    Complex value;          // exact for floats and for integers up to 2**53
+    int64_t integer = 0;    // exact integer value for integer and bool dtypes
+
+    Domain domain() const { return DomainOf(dtype); }
+
+    template <typename T>
+    T As() const {
+        if constexpr (std::is_integral_v<T>) {
+            return DomainOf(dtype) == Domain::Int ? static_cast<T>(integer) : Convert<T>(value.real());
+        } else {
+            return Convert<T>(value);
+        }
+    }
+};
+
+View ViewOf(const aclTensor* tensor);
+Value ValueOf(const aclScalar* scalar);
+std::vector<int64_t> IntsOf(const aclIntArray* array);
+std::vector<const aclTensor*> TensorsOf(const aclTensorList* list);
+
+/// Kernel body; receives the views of the op's inputs followed by its outputs.
+using Kernel = std::function<void(const std::vector<View>& tensors)>;
+
+/**
+ * Validate an op and create its executor: the body of every aclnnXxxGetWorkspaceSize.
+ *
+ * build() checks the arguments (throwing Error) and returns the kernel. The
+ * kernel is handed the inputs followed by the outputs, in the order given
+ * here, which is also the index order of aclSetInputTensorAddr and
+ * aclSetOutputTensorAddr.
+ */
+aclnnStatus Plan(const char* op, const std::vector<const aclTensor*>& inputs,
+                 const std::vector<const aclTensor*>& outputs, uint64_t* workspaceSize,
+                 aclOpExecutor** executor, const std::function<Kernel()>& build);
+
+/// Queue an executor on a stream: the body of every aclnnXxx.
+aclnnStatus Launch(aclOpExecutor* executor, aclrtStream stream);
+
+// ---------------------------------------------------------------- iteration
+
+/// Shape both a and b broadcast to, throws if they are incompatible.
+std::vector<int64_t> BroadcastShape(const std::vector<int64_t>& a, const std::vector<int64_t>& b);
+
+/// Throws unless view can be broadcast to dims.
+void CheckBroadcastable(const View& view, const std::vector<int64_t>& dims, const char* what);
+
+/**
+ * Calls fn(ptrs) once per element of dims, in row-major order, where
+ * ptrs[k] points at the element of operands[k] broadcast to dims.
+ */
+void ForEach(const std::vector<int64_t>& dims, const std::vector<const View*>& operands,
+             const std::function<void(char* const* ptrs)>& fn);
+
+/// out[i] = fn(a[i]) with a broadcast to out, computed as T.
+template <typename T, typename Fn>
+void Map(const View& out, const View& a, Fn&& fn) {
+    ForEach(out.dims, {&out, &a}, [&](char* const* p) {
+        Store(p[0], out.dtype, fn(Load<T>(p[1], a.dtype)));
+    });
+}
+
+/// out[i] = fn(a[i], b[i]) with a and b broadcast to out, computed as T.
+template <typename T, typename Fn>
+void Map(const View& out, const View& a, const View& b, Fn&& fn) {
+    ForEach(out.dims, {&out, &a, &b}, [&](char* const* p) {
+        Store(p[0], out.dtype, fn(Load<T>(p[1], a.dtype), Load<T>(p[2], b.dtype)));
+    });
+}
+
+/// out[i] = fn(a[i], b[i], c[i]) with a, b and c broadcast to out, computed as T.
+template <typename T, typename Fn>
+void Map(const View& out, const View& a, const View& b, const View& c, Fn&& fn) {
+    ForEach(out.dims, {&out, &a, &b, &c}, [&](char* const* p) {
+        Store(p[0], out.dtype, fn(Load<T>(p[1], a.dtype), Load<T>(p[2], b.dtype), Load<T>(p[3], c.dtype)));
+    });
+}
+
+/// Normalize a possibly negative axis, throws if out of range.
+int64_t WrapAxis(int64_t axis, int64_t rank);
+
+/// view with the full rank of dims, broadcast dimensions getting stride 0.
+View BroadcastTo(const View& view, const std::vector<int64_t>& dims);
+
+/// view without the given dimensions (each index must appear at most once).
+View DropDims(const View& view, const std::vector<int64_t>& axes);
+
+/// Row-major strides of a compact tensor of shape dims.
+std::vector<int64_t> CompactStrides(const std::vector<int64_t>& dims);
+
+// ---------------------------------------------------------------- elementwise
+
+/// 0-d view over a copy of a scalar, kept alive by whoever holds it.
+struct HeldScalar {
+    std::shared_ptr<aclScalar> storage;
+    View view;
+};
+
+HeldScalar Hold(const aclScalar* scalar);
+
+/**
+ * Calls fn(T x...) once per element of out, computing in domain, with each
+ * argument broadcast to out; fn may take 0 to 4 arguments.
+ */
+template <typename Fn>
+void Compute(Domain domain, const View& out, const std::vector<const View*>& args, const Fn& fn) {
+    std::vector<const View*> operands{&out};
+    operands.insert(operands.end(), args.begin(), args.end());
+    std::vector<aclDataType> dtypes;
+    for (const View* view : operands) {
+        dtypes.push_back(view->dtype);
+    }
+    const aclDataType* d = dtypes.data();
+    Dispatch(domain, [&](auto tag) {
+        using T = decltype(tag);
+        switch (args.size()) {
+            case 0:
+                if constexpr (std::is_invocable_v<const Fn&>) {
+                    ForEach(out.dims, operands, [&](char* const* p) { Store(p[0], d[0], fn()); });
+                    return;
+                }
+                break;
+            case 1:
+                if constexpr (std::is_invocable_v<const Fn&, T>) {
+                    ForEach(out.dims, operands, [&](char* const* p) { Store(p[0], d[0], fn(Load<T>(p[1], d[1]))); });
+                    return;
+                }
+                break;
+            case 2:
+                if constexpr (std::is_invocable_v<const Fn&, T, T>) {
+                    ForEach(out.dims, operands, [&](char* const* p) {
+                        Store(p[0], d[0], fn(Load<T>(p[1], d[1]), Load<T>(p[2], d[2])));
+                    });
+                    return;
+                }
+                break;
+            case 3:
+                if constexpr (std::is_invocable_v<const Fn&, T, T, T>) {
+                    ForEach(out.dims, operands, [&](char* const* p) {
+                        Store(p[0], d[0], fn(Load<T>(p[1], d[1]), Load<T>(p[2], d[2]), Load<T>(p[3], d[3])));
+                    });
+                    return;
+                }
+                break;
+            case 4:
+                if constexpr (std::is_invocable_v<const Fn&, T, T, T, T>) {
+                    ForEach(out.dims, operands, [&](char* const* p) {
+                        Store(p[0], d[0], fn(Load<T>(p[1], d[1]), Load<T>(p[2], d[2]), Load<T>(p[3], d[3]),
+                                             Load<T>(p[4], d[4])));
+                    });
+                    return;
+                }
+                break;
+        }
+        throw Error(ACLNN_ERR_INNER, "elementwise function takes a different number of arguments");
+    });
+}
+
+/// Operand of an elementwise op: a tensor or a scalar.
+struct Arg {
+    const aclTensor* tensor = nullptr;
+    const aclScalar* scalar = nullptr;
+    bool promotes = true;   // takes part in choosing the compute domain
+};
+
+inline Arg Tensor(const aclTensor* tensor) { return {tensor, nullptr, true}; }
+inline Arg Scalar(const aclScalar* scalar) { return {nullptr, scalar, true}; }
+/// Scalar factor such as alpha that does not widen the computation.
+inline Arg Factor(const aclScalar* scalar) { return {nullptr, scalar, false}; }
+
+/**
+ * Plan out = fn(args...) elementwise.
+ *
+ * The computation runs in the widest domain of least, the promoting
+ * arguments and, if widen is set, out. An argument that is the out tensor
+ * itself makes the op in place.
+ */
+template <typename Fn>
+aclnnStatus Elementwise(const char* op, const std::vector<Arg>& args, const aclTensor* out,
+                        uint64_t* workspaceSize, aclOpExecutor** executor, Fn fn,
+                        Domain least = Domain::Int, bool widen = true) {
+    std::vector<const aclTensor*> inputs;
+    for (const Arg& arg : args) {
+        if (arg.tensor != nullptr && arg.tensor != out) {
+            inputs.push_back(arg.tensor);
+        }
+    }
+    return Plan(op, inputs, {out}, workspaceSize, executor, [&]() -> Kernel {
+        // slot >= 0: tensors[slot]; -1: a held scalar
+        struct Slot {
+            int64_t index;
+            HeldScalar scalar;
+        };
+        std::vector<Slot> slots;
+        const View result = ViewOf(out);
+        const int64_t outIndex = static_cast<int64_t>(inputs.size());
+        Domain domain = widen ? Max(least, DomainOf(result.dtype)) : least;
+        int64_t next = 0;
+        for (const Arg& arg : args) {
+            aclDataType dtype;
+            if (arg.tensor == out) {
+                slots.push_back({outIndex, {}});
+                dtype = result.dtype;
+            } else if (arg.tensor != nullptr) {
+                View view = ViewOf(arg.tensor);
+                CheckBroadcastable(view, result.dims, "input");
+                slots.push_back({next++, {}});
+                dtype = view.dtype;
+            } else {
+                slots.push_back({-1, Hold(arg.scalar)});
+                dtype = slots.back().scalar.view.dtype;
+            }
+            if (arg.promotes) {
+                domain = Max(domain, DomainOf(dtype));
+            }
+        }
+        return [domain, slots, outIndex, fn](const std::vector<View>& tensors) {
+            std::vector<const View*> operands;
+            for (const Slot& slot : slots) {
+                operands.push_back(slot.index >= 0 ? &tensors[slot.index] : &slot.scalar.view);
+            }
+            Compute(domain, tensors[outIndex], operands, fn);
+        };
+    });
+}
+
+/// Raised by functions the host runtime does not implement for complex operands.
+[[noreturn]] inline void NotForComplex(const char* what) {
+    throw Error(std::string(what) + " is not supported for complex tensors");
+}
+
+// ---------------------------------------------------------------- reductions
+
+/// Dimensions to reduce: dims wrapped and deduplicated, all of them if dims is empty.
+std::vector<int64_t> ReduceAxes(const std::vector<int64_t>& dims, int64_t rank);
+
+/**
+ * Calls fn(outPtr, reduced) once per element of out, where reduced is the
+ * view of the input elements folding into it. out has the input's shape with
+ * axes removed, or set to 1 if keepdim.
+ */
+void ForEachReduction(const View& in, const std::vector<int64_t>& axes, const View& out,
+                      const std::function<void(char* outPtr, const View& reduced)>& fn);
+
+/// Shape of reducing dims over axes.
+std::vector<int64_t> ReducedShape(const std::vector<int64_t>& dims, const std::vector<int64_t>& axes, bool keepdim);
+
+}
+
+// Descriptor layouts behind the opaque handles of acl_meta.h.
+
+struct aclTensor {
+    std::vector<int64_t> viewDims;
+    std::vector<int64_t> strides;
+    std::vector<int64_t> storageDims;
+    int64_t offset = 0;
+    aclDataType dtype = ACL_DT_UNDEFINED;
+    aclFormat format = ACL_FORMAT_ND;
+    void* data = nullptr;
+};
+
+struct aclScalar {
+    aclDataType dtype = ACL_DT_UNDEFINED;
+    alignas(16) unsigned char bytes[16] = {};
+};
+
+struct aclIntArray {
+    std::vector<int64_t> values;
+};
+
+struct aclFloatArray {
+    std::vector<float> values;
+};
+
+struct aclBoolArray {
+    std::vector<bool> values;
+};
+
+struct aclTensorList {
+    std::vector<const aclTensor*> tensors;
+};
+
+struct aclOpExecutor {
+    std::string op;
+    std::vector<host::View> tensors;    // inputs, then outputs
+    std::vector<const aclTensor*> sources;  // descriptor each view was taken from
+    size_t numInputs = 0;
+    host::Kernel kernel;
+    bool repeatable = false;
+};
+
+/// Defines aclnn<Op>, which queues the executor planned by aclnn<Op>GetWorkspaceSize.
+#define HOST_RUNTIME_LAUNCH(Op)                                                                        \
+    aclnnStatus aclnn##Op(void* workspace, uint64_t workspaceSize, aclOpExecutor* executor,           \
+                          aclrtStream stream) {                                                       \
+        (void)workspace;                                                                               \
+        (void)workspaceSize;                                                                           \
+        return host::Launch(executor, stream);                                                         \
+    }
@@ -0,0 +1,46 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+/*
+ * Host stand-in for CANN's aclnn/aclnn_base.h: executor control shared by
+ * all aclnn operators.
+ *
+ * aclnnXxxGetWorkspaceSize validates the arguments and records the call in
+ * an executor; aclnnXxx queues it on the stream. An executor is freed after
+ * its launch unless it was made repeatable, in which case the device
+ * addresses of its tensors can be rebound and it can be launched again.
+ */
+
+#pragma once
+
+#include <aclnn/acl_meta.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+aclnnStatus aclSetAclOpExecutorRepeatable(aclOpExecutor* executor);
+aclnnStatus aclDestroyAclOpExecutor(aclOpExecutor* executor);
+
+/// Rebind the device address of the index-th input tensor of a repeatable executor.
+aclnnStatus aclSetInputTensorAddr(aclOpExecutor* executor, const size_t index, aclTensor* tensor, void* addr);
+
+/// Rebind the device address of the index-th output tensor of a repeatable executor.
+aclnnStatus aclSetOutputTensorAddr(aclOpExecutor* executor, const size_t index, aclTensor* tensor, void* addr);
+
+#ifdef __cplusplus
+}
+#endif
@@ -0,0 +1,758 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#include "host_runtime.hpp"
+
+#include <aclnnop/aclnn_arange.h>
+#include <aclnnop/aclnn_convolution.h>
+#include <aclnnop/aclnn_dot.h>
+#include <aclnnop/aclnn_einsum.h>
+#include <aclnnop/aclnn_eye.h>
+#include <aclnnop/aclnn_flatten.h>
+#include <aclnnop/aclnn_flip.h>
+#include <aclnnop/aclnn_inverse.h>
+#include <aclnnop/aclnn_linalg_cross.h>
+#include <aclnnop/aclnn_linalg_qr.h>
+#include <aclnnop/aclnn_logdet.h>
+#include <aclnnop/aclnn_matmul.h>
+#include <aclnnop/aclnn_mm.h>
+#include <aclnnop/aclnn_slogdet.h>
+
+#include <algorithm>
+#include <limits>
+#include <map>
+
+/*
+ * Matrix products, decompositions and the shape-changing operators
+ * (eye, flatten, flip, arange). Decompositions work on a dense copy of each
+ * matrix, in double or complex<double>.
+ */
+
+using host::Complex;
+using host::Domain;
+using host::Error;
+using host::Kernel;
+using host::View;
+
+namespace {
+
+template <typename T>
+constexpr bool kIsComplex = host::kIsComplex<T>;
+
+int64_t Bytes(const View& view) {
+    return static_cast<int64_t>(host::ElementSize(view.dtype));
+}
+
+/// Dense row-major copy of the rows x cols matrix at p, laid out with the last two strides of view.
+template <typename T>
+std::vector<T> ReadMatrix(const char* p, const View& view, int64_t rows, int64_t cols) {
+    const int64_t rowStride = view.strides[view.Rank() - 2] * Bytes(view);
+    const int64_t colStride = view.strides[view.Rank() - 1] * Bytes(view);
+    std::vector<T> matrix(rows * cols);
+    for (int64_t i = 0; i < rows; ++i) {
+        for (int64_t j = 0; j < cols; ++j) {
+            matrix[i * cols + j] = host::Load<T>(p + i * rowStride + j * colStride, view.dtype);
+        }
+    }
+    return matrix;
+}
+
+/// Write the top-left rows x cols block of a dense matrix with ld columns to p.
+template <typename T>
+void WriteMatrix(char* p, const View& view, const std::vector<T>& matrix, int64_t ld, int64_t rows, int64_t cols) {
+    const int64_t rowStride = view.strides[view.Rank() - 2] * Bytes(view);
+    const int64_t colStride = view.strides[view.Rank() - 1] * Bytes(view);
+    for (int64_t i = 0; i < rows; ++i) {
+        for (int64_t j = 0; j < cols; ++j) {
+            host::Store(p + i * rowStride + j * colStride, view.dtype, matrix[i * ld + j]);
+        }
+    }
+}
+
+/// Leading (batch) dimensions of a stack of matrices.
+View Batch(const View& view) {
+    return host::DropDims(view, {view.Rank() - 2, view.Rank() - 1});
+}
+
+void CheckSquare(const View& view, const char* what) {
+    if (view.Rank() < 2 || view.dims[view.Rank() - 1] != view.dims[view.Rank() - 2]) {
+        throw Error(std::string(what) + " must be a stack of square matrices");
+    }
+}
+
+/// Domain of a decomposition: double for real input, complex<double> for complex input.
+Domain FloatDomain(const View& view) {
+    return host::Max(Domain::Float, host::DomainOf(view.dtype));
+}
+
+/**
+ * LU factorization with partial pivoting of a dense n x n matrix, in place.
+ * Returns false if the matrix is singular; swaps counts the row exchanges.
+ */
+template <typename T>
+bool Lu(std::vector<T>& a, int64_t n, std::vector<int64_t>& pivots, int64_t& swaps) {
+    pivots.resize(n);
+    swaps = 0;
+    bool regular = true;
+    for (int64_t j = 0; j < n; ++j) {
+        int64_t pivot = j;
+        for (int64_t i = j + 1; i < n; ++i) {
+            if (std::abs(a[i * n + j]) > std::abs(a[pivot * n + j])) {
+                pivot = i;
+            }
+        }
+        pivots[j] = pivot;
+        if (pivot != j) {
+            for (int64_t c = 0; c < n; ++c) {
+                std::swap(a[j * n + c], a[pivot * n + c]);
+            }
+            ++swaps;
+        }
+        if (a[j * n + j] == T(0)) {
+            regular = false;
+            continue;
+        }
+        for (int64_t i = j + 1; i < n; ++i) {
+            T factor = a[i * n + j] / a[j * n + j];
+            a[i * n + j] = factor;
+            for (int64_t c = j + 1; c < n; ++c) {
+                a[i * n + c] -= factor * a[j * n + c];
+            }
+        }
+    }
+    return regular;
+}
+
+/// sign and log|det| of a dense n x n matrix.
+template <typename T>
+std::pair<T, double> SignLogDet(std::vector<T> a, int64_t n) {
+    std::vector<int64_t> pivots;
+    int64_t swaps = 0;
+    if (!Lu(a, n, pivots, swaps)) {
+        return {T(0), -std::numeric_limits<double>::infinity()};
+    }
+    T sign = swaps % 2 == 0 ? T(1) : T(-1);
+    double logabs = 0;
+    for (int64_t i = 0; i < n; ++i) {
+        T u = a[i * n + i];
+        double magnitude = std::abs(u);
+        sign *= u / magnitude;
+        logabs += std::log(magnitude);
+    }
+    return {sign, logabs};
+}
+
+/// Matrices of a stack: calls fn(outPtrs..., inPtr) for every batch index of out.
+void ForEachMatrix(const std::vector<View>& outs, const View& in,
+                   const std::function<void(char* const* ptrs)>& fn) {
+    View batch = Batch(in);
+    std::vector<View> outBatches;
+    for (const View& out : outs) {
+        outBatches.push_back(Batch(out));
+    }
+    std::vector<const View*> operands;
+    for (const View& out : outBatches) {
+        operands.push_back(&out);
+    }
+    operands.push_back(&batch);
+    host::ForEach(batch.dims, operands, fn);
+}
+
+}
+
+// ---------------------------------------------------------------- products
+
+namespace {
+
+/// numpy.matmul: 1-D operands are promoted to matrices and the added dimension is dropped from out.
+aclnnStatus Matmul(const char* op, const aclTensor* self, const aclTensor* mat2, aclTensor* out, bool matricesOnly,
+                   uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return host::Plan(op, {self, mat2}, {out}, workspaceSize, executor, [&]() -> Kernel {
+        View a = host::ViewOf(self);
+        View b = host::ViewOf(mat2);
+        View result = host::ViewOf(out);
+        if (a.Rank() == 0 || b.Rank() == 0) {
+            throw Error("matmul operands must have at least one dimension");
+        }
+        if (matricesOnly && (a.Rank() != 2 || b.Rank() != 2)) {
+            throw Error("operands must be 2-D matrices");
+        }
+        const int64_t k = a.dims.back();
+        const int64_t kb = b.Rank() == 1 ? b.dims[0] : b.dims[b.Rank() - 2];
+        if (k != kb) {
+            throw Error("matmul contraction dimensions differ");
+        }
+        std::vector<int64_t> aBatch(a.dims.begin(), a.dims.end() - std::min<int64_t>(a.Rank(), 2));
+        std::vector<int64_t> bBatch(b.dims.begin(), b.dims.end() - std::min<int64_t>(b.Rank(), 2));
+        std::vector<int64_t> expected = host::BroadcastShape(aBatch, bBatch);
+        if (a.Rank() > 1) expected.push_back(a.dims[a.Rank() - 2]);
+        if (b.Rank() > 1) expected.push_back(b.dims.back());
+        if (expected != result.dims) {
+            throw Error("out does not have the shape of the matrix product");
+        }
+        Domain domain = host::Max(host::Max(host::DomainOf(a.dtype), host::DomainOf(b.dtype)),
+                                  host::DomainOf(result.dtype));
+        return [domain](const std::vector<View>& tensors) {
+            View a = tensors[0];
+            View b = tensors[1];
+            View out = tensors[2];
+            const bool aVector = a.Rank() == 1;
+            const bool bVector = b.Rank() == 1;
+            if (aVector) {
+                a.dims = {1, a.dims[0]};
+                a.strides = {0, a.strides[0]};
+                out.dims.insert(out.dims.end() - (bVector ? 0 : 1), 1);
+                out.strides.insert(out.strides.end() - (bVector ? 0 : 1), 0);
+            }
+            if (bVector) {
+                b.dims = {b.dims[0], 1};
+                b.strides = {b.strides[0], 0};
+                out.dims.push_back(1);
+                out.strides.push_back(0);
+            }
+            const int64_t n = a.dims[a.Rank() - 2];
+            const int64_t k = a.dims.back();
+            const int64_t m = b.dims.back();
+            std::vector<int64_t> batch(out.dims.begin(), out.dims.end() - 2);
+            View outBatch = Batch(out);
+            View aBatch = host::BroadcastTo(Batch(a), batch);
+            View bBatch = host::BroadcastTo(Batch(b), batch);
+            const int64_t as0 = a.strides[a.Rank() - 2] * Bytes(a), as1 = a.strides.back() * Bytes(a);
+            const int64_t bs0 = b.strides[b.Rank() - 2] * Bytes(b), bs1 = b.strides.back() * Bytes(b);
+            const int64_t os0 = out.strides[out.Rank() - 2] * Bytes(out), os1 = out.strides.back() * Bytes(out);
+            host::Dispatch(domain, [&](auto tag) {
+                using T = decltype(tag);
+                host::ForEach(batch, {&outBatch, &aBatch, &bBatch}, [&](char* const* p) {
+                    for (int64_t i = 0; i < n; ++i) {
+                        for (int64_t j = 0; j < m; ++j) {
+                            T acc = T(0);
+                            for (int64_t l = 0; l < k; ++l) {
+                                acc += host::Load<T>(p[1] + i * as0 + l * as1, a.dtype) *
+                                       host::Load<T>(p[2] + l * bs0 + j * bs1, b.dtype);
+                            }
+                            host::Store(p[0] + i * os0 + j * os1, out.dtype, acc);
+                        }
+                    }
+                });
+            });
+        };
+    });
+}
+
+}
+
+aclnnStatus aclnnMatmulGetWorkspaceSize(const aclTensor* self, const aclTensor* mat2, aclTensor* out,
+                                        int8_t cubeMathType, uint64_t* workspaceSize, aclOpExecutor** executor) {
+    (void)cubeMathType;     // products are always computed in full precision
+    return Matmul("Matmul", self, mat2, out, false, workspaceSize, executor);
+}
+HOST_RUNTIME_LAUNCH(Matmul)
+
+aclnnStatus aclnnMmGetWorkspaceSize(const aclTensor* self, const aclTensor* mat2, aclTensor* out,
+                                    int8_t cubeMathType, uint64_t* workspaceSize, aclOpExecutor** executor) {
+    (void)cubeMathType;
+    return Matmul("Mm", self, mat2, out, true, workspaceSize, executor);
+}
+HOST_RUNTIME_LAUNCH(Mm)
+
+aclnnStatus aclnnDotGetWorkspaceSize(const aclTensor* self, const aclTensor* tensor, aclTensor* out,
+                                     uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return host::Plan("Dot", {self, tensor}, {out}, workspaceSize, executor, [&]() -> Kernel {
+        View a = host::ViewOf(self);
+        View b = host::ViewOf(tensor);
+        View result = host::ViewOf(out);
+        if (a.Rank() != 1 || b.Rank() != 1 || a.dims != b.dims) {
+            throw Error("dot operands must be 1-D tensors of the same length");
+        }
+        if (result.Numel() != 1) {
+            throw Error("out must have exactly one element");
+        }
+        Domain domain = host::Max(host::Max(host::DomainOf(a.dtype), host::DomainOf(b.dtype)),
+                                  host::DomainOf(result.dtype));
+        return [domain](const std::vector<View>& tensors) {
+            const View& a = tensors[0];
+            const View& b = tensors[1];
+            const View& out = tensors[2];
+            host::Dispatch(domain, [&](auto tag) {
+                using T = decltype(tag);
+                T acc = T(0);
+                host::ForEach(a.dims, {&a, &b}, [&](char* const* p) {
+                    acc += host::Load<T>(p[0], a.dtype) * host::Load<T>(p[1], b.dtype);
+                });
+                host::Store(out.Data(), out.dtype, acc);
+            });
+        };
+    });
+}
+HOST_RUNTIME_LAUNCH(Dot)
+
+aclnnStatus aclnnEinsumGetWorkspaceSize(const aclTensorList* tensors, const char* equation, aclTensor* output,
+                                        uint64_t* workspaceSize, aclOpExecutor** executor) {
+    if (tensors == nullptr || equation == nullptr) {
+        host::SetRecentError("Einsum: tensors or equation is null");
+        return ACLNN_ERR_PARAM_NULLPTR;
+    }
+    std::vector<const aclTensor*> inputs = host::TensorsOf(tensors);
+    std::string spec;
+    for (const char* c = equation; *c != '\0'; ++c) {
+        if (*c != ' ') spec += *c;
+    }
+    return host::Plan("Einsum", inputs, {output}, workspaceSize, executor, [&]() -> Kernel {
+        if (spec.find('.') != std::string::npos) {
+            throw Error("ellipsis subscripts are not supported");
+        }
+        size_t arrow = spec.find("->");
+        std::string lhs = spec.substr(0, arrow);
+        std::vector<std::string> terms;
+        for (size_t start = 0;;) {
+            size_t comma = lhs.find(',', start);
+            terms.push_back(lhs.substr(start, comma - start));
+            if (comma == std::string::npos) break;
+            start = comma + 1;
+        }
+        if (terms.size() != inputs.size()) {
+            throw Error("equation has " + std::to_string(terms.size()) + " operands, got " +
+                        std::to_string(inputs.size()) + " tensors");
+        }
+        std::map<char, int64_t> sizes;
+        std::map<char, int> counts;
+        Domain domain = Domain::Int;
+        for (size_t t = 0; t < terms.size(); ++t) {
+            View view = host::ViewOf(inputs[t]);
+            if (static_cast<int64_t>(terms[t].size()) != view.Rank()) {
+                throw Error("subscripts '" + terms[t] + "' do not match the operand's rank");
+            }
+            for (size_t d = 0; d < terms[t].size(); ++d) {
+                char label = terms[t][d];
+                auto [it, inserted] = sizes.emplace(label, view.dims[d]);
+                if (!inserted && it->second != view.dims[d]) {
+                    throw Error(std::string("inconsistent size for subscript '") + label + "'");
+                }
+                counts[label]++;
+            }
+            domain = host::Max(domain, host::DomainOf(view.dtype));
+        }
+        std::string outLabels;
+        if (arrow != std::string::npos) {
+            outLabels = spec.substr(arrow + 2);
+        } else {
+            for (const auto& [label, count] : counts) {
+                if (count == 1) outLabels += label;
+            }
+        }
+        View result = host::ViewOf(output);
+        std::vector<int64_t> outDims;
+        for (char label : outLabels) {
+            if (!sizes.count(label)) {
+                throw Error(std::string("output subscript '") + label + "' does not appear in the inputs");
+            }
+            outDims.push_back(sizes[label]);
+        }
+        if (outDims != result.dims) {
+            throw Error("output does not have the shape given by the equation");
+        }
+        domain = host::Max(domain, host::DomainOf(result.dtype));
+        // every label, output labels first; each operand's stride per label
+        std::string labels = outLabels;
+        for (const auto& entry : sizes) {
+            if (labels.find(entry.first) == std::string::npos) labels += entry.first;
+        }
+        std::vector<int64_t> dims;
+        for (char label : labels) dims.push_back(sizes[label]);
+        const size_t n = terms.size();
+        std::vector<std::vector<size_t>> positions(n);     // label index of each operand dimension
+        for (size_t t = 0; t < n; ++t) {
+            for (char label : terms[t]) positions[t].push_back(labels.find(label));
+        }
+        const size_t outRank = outLabels.size();
+        return [domain, dims, positions, outRank, n](const std::vector<View>& tensors) {
+            // operand k viewed over all labels: repeated labels add their strides (diagonals)
+            std::vector<View> operands;
+            for (size_t t = 0; t < n; ++t) {
+                View view = tensors[t];
+                view.strides.assign(dims.size(), 0);
+                for (size_t d = 0; d < positions[t].size(); ++d) {
+                    view.strides[positions[t][d]] += tensors[t].strides[d];
+                }
+                view.dims = dims;
+                operands.push_back(view);
+            }
+            View out = tensors[n];
+            std::vector<int64_t> outDims(dims.begin(), dims.begin() + outRank);
+            std::vector<int64_t> innerDims(dims.begin() + outRank, dims.end());
+            std::vector<View> outer, inner;
+            for (const View& view : operands) {
+                View o = view, i = view;
+                o.dims = outDims;
+                o.strides.assign(view.strides.begin(), view.strides.begin() + outRank);
+                i.dims = innerDims;
+                i.strides.assign(view.strides.begin() + outRank, view.strides.end());
+                outer.push_back(o);
+                inner.push_back(i);
+            }
+            std::vector<const View*> outerOperands{&out};
+            for (const View& view : outer) outerOperands.push_back(&view);
+            host::Dispatch(domain, [&](auto tag) {
+                using T = decltype(tag);
+                host::ForEach(outDims, outerOperands, [&](char* const* p) {
+                    std::vector<View> slices = inner;
+                    std::vector<const View*> sliceOperands;
+                    for (size_t t = 0; t < n; ++t) {
+                        slices[t].base = p[t + 1];
+                        slices[t].offset = 0;
+                    }
+                    for (const View& slice : slices) sliceOperands.push_back(&slice);
+                    T acc = T(0);
+                    host::ForEach(innerDims, sliceOperands, [&](char* const* q) {
+                        T product = T(1);
+                        for (size_t t = 0; t < n; ++t) {
+                            product *= host::Load<T>(q[t], slices[t].dtype);
+                        }
+                        acc += product;
+                    });
+                    host::Store(p[0], out.dtype, acc);
+                });
+            });
+        };
+    });
+}
+HOST_RUNTIME_LAUNCH(Einsum)
+
+aclnnStatus aclnnLinalgCrossGetWorkspaceSize(const aclTensor* self, const aclTensor* other, int64_t dim,
+                                             aclTensor* out, uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return host::Plan("LinalgCross", {self, other}, {out}, workspaceSize, executor, [&]() -> Kernel {
+        View a = host::ViewOf(self);
+        View b = host::ViewOf(other);
+        View result = host::ViewOf(out);
+        if (host::BroadcastShape(a.dims, b.dims) != result.dims) {
+            throw Error("out does not have the broadcast shape of the operands");
+        }
+        const int64_t axis = host::WrapAxis(dim, result.Rank());
+        if (result.Rank() == 0 || result.dims[axis] != 3) {
+            throw Error("dimension dim must have length 3");
+        }
+        Domain domain = host::Max(host::Max(host::DomainOf(a.dtype), host::DomainOf(b.dtype)),
+                                  host::DomainOf(result.dtype));
+        return [domain, axis](const std::vector<View>& tensors) {
+            const View& out = tensors[2];
+            View a = host::BroadcastTo(tensors[0], out.dims);
+            View b = host::BroadcastTo(tensors[1], out.dims);
+            const int64_t as = a.strides[axis] * Bytes(a);
+            const int64_t bs = b.strides[axis] * Bytes(b);
+            const int64_t os = out.strides[axis] * Bytes(out);
+            View aRest = host::DropDims(a, {axis});
+            View bRest = host::DropDims(b, {axis});
+            View outRest = host::DropDims(out, {axis});
+            host::Dispatch(domain, [&](auto tag) {
+                using T = decltype(tag);
+                host::ForEach(outRest.dims, {&outRest, &aRest, &bRest}, [&](char* const* p) {
+                    T x[3], y[3];
+                    for (int i = 0; i < 3; ++i) {
+                        x[i] = host::Load<T>(p[1] + i * as, a.dtype);
+                        y[i] = host::Load<T>(p[2] + i * bs, b.dtype);
+                    }
+                    host::Store(p[0], out.dtype, x[1] * y[2] - x[2] * y[1]);
+                    host::Store(p[0] + os, out.dtype, x[2] * y[0] - x[0] * y[2]);
+                    host::Store(p[0] + 2 * os, out.dtype, x[0] * y[1] - x[1] * y[0]);
+                });
+            });
+        };
+    });
+}
+HOST_RUNTIME_LAUNCH(LinalgCross)
+
+// ---------------------------------------------------------------- decompositions
+
+aclnnStatus aclnnLinalgQrGetWorkspaceSize(const aclTensor* self, int64_t mode, aclTensor* Q, aclTensor* R,
+                                          uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return host::Plan("LinalgQr", {self}, {Q, R}, workspaceSize, executor, [&]() -> Kernel {
+        View a = host::ViewOf(self);
+        View q = host::ViewOf(Q);
+        View r = host::ViewOf(R);
+        if (a.Rank() < 2) {
+            throw Error("self must be a stack of matrices");
+        }
+        if (mode != 0 && mode != 1) {
+            throw Error("mode must be 0 (reduced) or 1 (complete)");
+        }
+        if (host::DomainOf(a.dtype) == Domain::Complex) {
+            host::NotForComplex("qr");
+        }
+        const int64_t m = a.dims[a.Rank() - 2];
+        const int64_t n = a.dims.back();
+        const int64_t k = mode == 0 ? std::min(m, n) : m;
+        std::vector<int64_t> qDims = Batch(a).dims, rDims = Batch(a).dims;
+        qDims.insert(qDims.end(), {m, k});
+        rDims.insert(rDims.end(), {k, n});
+        if (q.dims != qDims || r.dims != rDims) {
+            throw Error("Q or R does not have the shape of the decomposition");
+        }
+        return [m, n, k](const std::vector<View>& tensors) {
+            const View& a = tensors[0];
+            const View& q = tensors[1];
+            const View& r = tensors[2];
+            ForEachMatrix({q, r}, a, [&](char* const* p) {
+                // Householder QR with LAPACK's sign convention
+                std::vector<double> R = ReadMatrix<double>(p[2], a, m, n);
+                std::vector<double> Qm(m * m, 0.0);
+                for (int64_t i = 0; i < m; ++i) Qm[i * m + i] = 1.0;
+                std::vector<double> v(m);
+                for (int64_t j = 0; j < std::min(m, n); ++j) {
+                    double alpha = R[j * n + j];
+                    double tail = 0;
+                    for (int64_t i = j + 1; i < m; ++i) tail += R[i * n + j] * R[i * n + j];
+                    if (tail == 0) continue;
+                    double beta = -std::copysign(std::sqrt(alpha * alpha + tail), alpha);
+                    double tau = (beta - alpha) / beta;
+                    v[j] = 1.0;
+                    for (int64_t i = j + 1; i < m; ++i) v[i] = R[i * n + j] / (alpha - beta);
+                    for (int64_t c = j; c < n; ++c) {
+                        double s = 0;
+                        for (int64_t i = j; i < m; ++i) s += v[i] * R[i * n + c];
+                        for (int64_t i = j; i < m; ++i) R[i * n + c] -= tau * v[i] * s;
+                    }
+                    for (int64_t row = 0; row < m; ++row) {
+                        double s = 0;
+                        for (int64_t i = j; i < m; ++i) s += Qm[row * m + i] * v[i];
+                        for (int64_t i = j; i < m; ++i) Qm[row * m + i] -= tau * s * v[i];
+                    }
+                    for (int64_t i = j + 1; i < m; ++i) R[i * n + j] = 0;
+                }
+                WriteMatrix(p[0], q, Qm, m, m, k);
+                WriteMatrix(p[1], r, R, n, k, n);
+            });
+        };
+    });
+}
+HOST_RUNTIME_LAUNCH(LinalgQr)
+
+aclnnStatus aclnnSlogdetGetWorkspaceSize(const aclTensor* self, aclTensor* signOut, aclTensor* logOut,
+                                         uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return host::Plan("Slogdet", {self}, {signOut, logOut}, workspaceSize, executor, [&]() -> Kernel {
+        View a = host::ViewOf(self);
+        CheckSquare(a, "self");
+        if (host::ViewOf(signOut).dims != Batch(a).dims || host::ViewOf(logOut).dims != Batch(a).dims) {
+            throw Error("signOut and logOut must have the batch shape of self");
+        }
+        Domain domain = FloatDomain(a);
+        return [domain](const std::vector<View>& tensors) {
+            const View& a = tensors[0];
+            const int64_t n = a.dims.back();
+            host::Dispatch(domain, [&](auto tag) {
+                using T = decltype(tag);
+                if constexpr (!std::is_same_v<T, int64_t>) {
+                    ForEachMatrix({tensors[1], tensors[2]}, a, [&](char* const* p) {
+                        auto [sign, logabs] = SignLogDet(ReadMatrix<T>(p[2], a, n, n), n);
+                        host::Store(p[0], tensors[1].dtype, sign);
+                        host::Store(p[1], tensors[2].dtype, logabs);
+                    });
+                }
+            });
+        };
+    });
+}
+HOST_RUNTIME_LAUNCH(Slogdet)
+
+aclnnStatus aclnnLogdetGetWorkspaceSize(const aclTensor* self, aclTensor* out, uint64_t* workspaceSize,
+                                        aclOpExecutor** executor) {
+    return host::Plan("Logdet", {self}, {out}, workspaceSize, executor, [&]() -> Kernel {
+        View a = host::ViewOf(self);
+        CheckSquare(a, "self");
+        if (host::ViewOf(out).dims != Batch(a).dims) {
+            throw Error("out must have the batch shape of self");
+        }
+        Domain domain = FloatDomain(a);
+        return [domain](const std::vector<View>& tensors) {
+            const View& a = tensors[0];
+            const int64_t n = a.dims.back();
+            host::Dispatch(domain, [&](auto tag) {
+                using T = decltype(tag);
+                if constexpr (!std::is_same_v<T, int64_t>) {
+                    ForEachMatrix({tensors[1]}, a, [&](char* const* p) {
+                        auto [sign, logabs] = SignLogDet(ReadMatrix<T>(p[1], a, n, n), n);
+                        T result;
+                        if constexpr (kIsComplex<T>) {
+                            result = sign == T(0) ? T(logabs) : std::log(sign) + logabs;
+                        } else {
+                            result = sign < 0 ? std::numeric_limits<double>::quiet_NaN() : logabs;
+                        }
+                        host::Store(p[0], tensors[1].dtype, result);
+                    });
+                }
+            });
+        };
+    });
+}
+HOST_RUNTIME_LAUNCH(Logdet)
+
+aclnnStatus aclnnInverseGetWorkspaceSize(const aclTensor* self, aclTensor* out, uint64_t* workspaceSize,
+                                         aclOpExecutor** executor) {
+    return host::Plan("Inverse", {self}, {out}, workspaceSize, executor, [&]() -> Kernel {
+        View a = host::ViewOf(self);
+        CheckSquare(a, "self");
+        if (host::ViewOf(out).dims != a.dims) {
+            throw Error("out must have the shape of self");
+        }
+        Domain domain = FloatDomain(a);
+        return [domain](const std::vector<View>& tensors) {
+            const View& a = tensors[0];
+            const View& out = tensors[1];
+            const int64_t n = a.dims.back();
+            host::Dispatch(domain, [&](auto tag) {
+                using T = decltype(tag);
+                if constexpr (!std::is_same_v<T, int64_t>) {
+                    ForEachMatrix({out}, a, [&](char* const* p) {
+                        // Gauss-Jordan elimination with partial pivoting; singular matrices give inf/nan
+                        std::vector<T> m = ReadMatrix<T>(p[1], a, n, n);
+                        std::vector<T> inv(n * n, T(0));
+                        for (int64_t i = 0; i < n; ++i) inv[i * n + i] = T(1);
+                        for (int64_t j = 0; j < n; ++j) {
+                            int64_t pivot = j;
+                            for (int64_t i = j + 1; i < n; ++i) {
+                                if (std::abs(m[i * n + j]) > std::abs(m[pivot * n + j])) pivot = i;
+                            }
+                            for (int64_t c = 0; c < n; ++c) {
+                                std::swap(m[j * n + c], m[pivot * n + c]);
+                                std::swap(inv[j * n + c], inv[pivot * n + c]);
+                            }
+                            T d = m[j * n + j];
+                            for (int64_t c = 0; c < n; ++c) {
+                                m[j * n + c] /= d;
+                                inv[j * n + c] /= d;
+                            }
+                            for (int64_t i = 0; i < n; ++i) {
+                                if (i == j) continue;
+                                T factor = m[i * n + j];
+                                for (int64_t c = 0; c < n; ++c) {
+                                    m[i * n + c] -= factor * m[j * n + c];
+                                    inv[i * n + c] -= factor * inv[j * n + c];
+                                }
+                            }
+                        }
+                        WriteMatrix(p[0], out, inv, n, n, n);
+                    });
+                }
+            });
+        };
+    });
+}
+HOST_RUNTIME_LAUNCH(Inverse)
+
+// ---------------------------------------------------------------- shapes
+
+aclnnStatus aclnnEyeGetWorkspaceSize(int64_t n, int64_t m, aclTensor* out, uint64_t* workspaceSize,
+                                     aclOpExecutor** executor) {
+    return host::Plan("Eye", {}, {out}, workspaceSize, executor, [&]() -> Kernel {
+        if (host::ViewOf(out).dims != std::vector<int64_t>{n, m}) {
+            throw Error("out must have shape (n, m)");
+        }
+        return [](const std::vector<View>& tensors) {
+            const View& out = tensors[0];
+            for (int64_t i = 0; i < out.dims[0]; ++i) {
+                for (int64_t j = 0; j < out.dims[1]; ++j) {
+                    host::Store(out.At({i, j}), out.dtype, static_cast<int64_t>(i == j));
+                }
+            }
+        };
+    });
+}
+HOST_RUNTIME_LAUNCH(Eye)
+
+aclnnStatus aclnnFlattenGetWorkspaceSize(const aclTensor* self, int64_t axis, aclTensor* out,
+                                         uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return host::Plan("Flatten", {self}, {out}, workspaceSize, executor, [&]() -> Kernel {
+        View in = host::ViewOf(self);
+        View result = host::ViewOf(out);
+        host::WrapAxis(axis, in.Rank());
+        if (in.Numel() != result.Numel()) {
+            throw Error("out must have as many elements as self");
+        }
+        if (result.strides != host::CompactStrides(result.dims)) {
+            throw Error("out must be contiguous");
+        }
+        Domain domain = host::Max(host::DomainOf(in.dtype), host::DomainOf(result.dtype));
+        return [domain](const std::vector<View>& tensors) {
+            // the row-major order of self is the element order of the compact out
+            View out = tensors[1];
+            out.dims = tensors[0].dims;
+            out.strides = host::CompactStrides(out.dims);
+            host::Compute(domain, out, {&tensors[0]}, [](auto x) { return x; });
+        };
+    });
+}
+HOST_RUNTIME_LAUNCH(Flatten)
+
+aclnnStatus aclnnFlipGetWorkspaceSize(const aclTensor* self, const aclIntArray* dims, aclTensor* out,
+                                      uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return host::Plan("Flip", {self}, {out}, workspaceSize, executor, [&]() -> Kernel {
+        View in = host::ViewOf(self);
+        if (host::ViewOf(out).dims != in.dims) {
+            throw Error("out must have the shape of self");
+        }
+        std::vector<int64_t> axes;
+        for (int64_t dim : host::IntsOf(dims)) {
+            axes.push_back(host::WrapAxis(dim, in.Rank()));
+        }
+        Domain domain = host::Max(host::DomainOf(in.dtype), host::DomainOf(host::ViewOf(out).dtype));
+        return [domain, axes](const std::vector<View>& tensors) {
+            View in = tensors[0];
+            for (int64_t axis : axes) {
+                if (in.dims[axis] > 0) {
+                    in.offset += (in.dims[axis] - 1) * in.strides[axis];
+                }
+                in.strides[axis] = -in.strides[axis];
+            }
+            host::Compute(domain, tensors[1], {&in}, [](auto x) { return x; });
+        };
+    });
+}
+HOST_RUNTIME_LAUNCH(Flip)
+
+aclnnStatus aclnnArangeGetWorkspaceSize(const aclScalar* start, const aclScalar* end, const aclScalar* step,
+                                        aclTensor* out, uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return host::Plan("Arange", {}, {out}, workspaceSize, executor, [&]() -> Kernel {
+        host::Value first = host::ValueOf(start);
+        host::Value delta = host::ValueOf(step);
+        host::ValueOf(end);
+        View result = host::ViewOf(out);
+        if (result.Rank() != 1) {
+            throw Error("out must be 1-D");
+        }
+        Domain domain = host::Max(host::Max(first.domain(), delta.domain()), host::DomainOf(result.dtype));
+        return [domain, first, delta](const std::vector<View>& tensors) {
+            const View& out = tensors[0];
+            host::Dispatch(domain, [&](auto tag) {
+                using T = decltype(tag);
+                for (int64_t i = 0; i < out.dims[0]; ++i) {
+                    host::Store(out.At({i}), out.dtype, first.As<T>() + static_cast<T>(i) * delta.As<T>());
+                }
+            });
+        };
+    });
+}
+HOST_RUNTIME_LAUNCH(Arange)
+
+aclnnStatus aclnnConvolutionGetWorkspaceSize(const aclTensor* input, const aclTensor* weight, const aclTensor* bias,
+                                             const aclIntArray* stride, const aclIntArray* padding,
+                                             const aclIntArray* dilation, bool transposed,
+                                             const aclIntArray* outputPadding, int64_t groups, aclTensor* output,
+                                             int8_t cubeMathType, uint64_t* workspaceSize, aclOpExecutor** executor) {
+    (void)input, (void)weight, (void)bias, (void)stride, (void)padding, (void)dilation, (void)transposed;
+    (void)outputPadding, (void)groups, (void)output, (void)cubeMathType, (void)workspaceSize, (void)executor;
+    host::SetRecentError("Convolution: not implemented by the host runtime");
+    return ACLNN_ERR_RUNTIME_ERROR;
+}
+HOST_RUNTIME_LAUNCH(Convolution)
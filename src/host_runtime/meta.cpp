@@ -0,0 +1,661 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#include "host_runtime.hpp"
+
+#include <algorithm>
+#include <memory>
+
+namespace host {
+
+// ---------------------------------------------------------------- dtypes
+
+size_t ElementSize(aclDataType dtype) {
+    switch (dtype) {
+        case ACL_BOOL: case ACL_INT8: case ACL_UINT8: return 1;
+        case ACL_INT16: case ACL_UINT16: case ACL_FLOAT16: case ACL_BF16: return 2;
+        case ACL_INT32: case ACL_UINT32: case ACL_FLOAT: return 4;
+        case ACL_INT64: case ACL_UINT64: case ACL_DOUBLE: case ACL_COMPLEX64: return 8;
+        case ACL_COMPLEX128: return 16;
+        default: throw Error(std::string("unsupported dtype ") + DtypeName(dtype));
+    }
+}
+
+bool IsSupported(aclDataType dtype) {
+    switch (dtype) {
+        case ACL_BOOL: case ACL_INT8: case ACL_INT16: case ACL_INT32: case ACL_INT64:
+        case ACL_UINT8: case ACL_UINT16: case ACL_UINT32: case ACL_UINT64:
+        case ACL_FLOAT16: case ACL_BF16: case ACL_FLOAT: case ACL_DOUBLE:
+        case ACL_COMPLEX64: case ACL_COMPLEX128:
+            return true;
+        default:
+            return false;
+    }
+}
+
+Domain DomainOf(aclDataType dtype) {
+    switch (dtype) {
+        case ACL_FLOAT16: case ACL_BF16: case ACL_FLOAT: case ACL_DOUBLE: return Domain::Float;
+        case ACL_COMPLEX64: case ACL_COMPLEX128: return Domain::Complex;
+        default: return Domain::Int;
+    }
+}
+
+const char* DtypeName(aclDataType dtype) {
+    switch (dtype) {
+        case ACL_BOOL: return "bool";
+        case ACL_INT8: return "int8";
+        case ACL_INT16: return "int16";
+        case ACL_INT32: return "int32";
+        case ACL_INT64: return "int64";
+        case ACL_UINT8: return "uint8";
+        case ACL_UINT16: return "uint16";
+        case ACL_UINT32: return "uint32";
+        case ACL_UINT64: return "uint64";
+        case ACL_FLOAT16: return "float16";
+        case ACL_BF16: return "bfloat16";
+        case ACL_FLOAT: return "float32";
+        case ACL_DOUBLE: return "float64";
+        case ACL_COMPLEX64: return "complex64";
+        case ACL_COMPLEX128: return "complex128";
+        default: return "<unsupported>";
+    }
+}
+
+float HalfToFloat(uint16_t bits) {
+    uint32_t sign = static_cast<uint32_t>(bits & 0x8000) << 16;
+    uint32_t exponent = (bits >> 10) & 0x1f;
+    uint32_t mantissa = bits & 0x3ff;
+    uint32_t result;
+    if (exponent == 0x1f) {
+        result = sign | 0x7f800000 | (mantissa << 13);
+    } else if (exponent != 0) {
+        result = sign | ((exponent + 112) << 23) | (mantissa << 13);
+    } else if (mantissa != 0) {
+        // subnormal: renormalize
+        exponent = 113;
+        while ((mantissa & 0x400) == 0) {
+            mantissa <<= 1;
+            exponent--;
+        }
+        result = sign | (exponent << 23) | ((mantissa & 0x3ff) << 13);
+    } else {
+        result = sign;
+    }
+    float value;
+    std::memcpy(&value, &result, sizeof(value));
+    return value;
+}
+
+uint16_t FloatToHalf(float value) {
+    uint32_t bits;
+    std::memcpy(&bits, &value, sizeof(bits));
+    uint16_t sign = static_cast<uint16_t>((bits >> 16) & 0x8000);
+    uint32_t magnitude = bits & 0x7fffffff;
+    if (magnitude >= 0x7f800000) {
+        return sign | 0x7c00 | (magnitude > 0x7f800000 ? 0x200 : 0);
+    }
+    if (magnitude >= 0x477ff000) {
+        return sign | 0x7c00;   // rounds to infinity
+    }
+    if (magnitude < 0x38800000) {
+        // subnormal or zero, round to nearest even on the shifted mantissa
+        if (magnitude < 0x33000000) {
+            return sign;
+        }
+        uint32_t exponent = magnitude >> 23;
+        uint32_t mantissa = (magnitude & 0x7fffff) | 0x800000;
+        uint32_t shift = 126 - exponent;
+        uint32_t half = mantissa >> shift;
+        uint32_t rest = mantissa & ((1u << shift) - 1);
+        uint32_t halfway = 1u << (shift - 1);
+        if (rest > halfway || (rest == halfway && (half & 1))) {
+            half++;
+        }
+        return sign | static_cast<uint16_t>(half);
+    }
+    uint32_t half = ((magnitude - 0x38000000) >> 13);
+    uint32_t rest = magnitude & 0x1fff;
+    if (rest > 0x1000 || (rest == 0x1000 && (half & 1))) {
+        half++;
+    }
+    return sign | static_cast<uint16_t>(half);
+}
+
+float Bfloat16ToFloat(uint16_t bits) {
+    uint32_t widened = static_cast<uint32_t>(bits) << 16;
+    float value;
+    std::memcpy(&value, &widened, sizeof(value));
+    return value;
+}
+
+uint16_t FloatToBfloat16(float value) {
+    uint32_t bits;
+    std::memcpy(&bits, &value, sizeof(bits));
+    if ((bits & 0x7fffffff) > 0x7f800000) {
+        return static_cast<uint16_t>((bits >> 16) | 0x40);
+    }
+    bits += 0x7fff + ((bits >> 16) & 1);
+    return static_cast<uint16_t>(bits >> 16);
+}
+
+// ---------------------------------------------------------------- descriptors
+
+int64_t View::Numel() const {
+    int64_t n = 1;
+    for (int64_t d : dims) {
+        n *= d;
+    }
+    return n;
+}
+
+char* View::At(const std::vector<int64_t>& index) const {
+    int64_t element = offset;
+    for (size_t d = 0; d < index.size(); ++d) {
+        element += index[d] * strides[d];
+    }
+    return base + element * static_cast<int64_t>(ElementSize(dtype));
+}
+
+View ViewOf(const aclTensor* tensor) {
+    if (tensor == nullptr) {
+        throw Error(ACLNN_ERR_PARAM_NULLPTR, "tensor is null");
+    }
+    if (!IsSupported(tensor->dtype)) {
+        throw Error(std::string("unsupported dtype ") + DtypeName(tensor->dtype));
+    }
+    View view;
+    view.base = static_cast<char*>(tensor->data);
+    view.offset = tensor->offset;
+    view.dtype = tensor->dtype;
+    view.dims = tensor->viewDims;
+    view.strides = tensor->strides;
+    return view;
+}
+
+Value ValueOf(const aclScalar* scalar) {
+    if (scalar == nullptr) {
+        throw Error(ACLNN_ERR_PARAM_NULLPTR, "scalar is null");
+    }
+    if (!IsSupported(scalar->dtype)) {
+        throw Error(std::string("unsupported scalar dtype ") + DtypeName(scalar->dtype));
+    }
+    const char* p = reinterpret_cast<const char*>(scalar->bytes);
+    Value value;
+    value.dtype = scalar->dtype;
+    value.value = Load<Complex>(p, scalar->dtype);
+    if (DomainOf(scalar->dtype) == Domain::Int) {
+        value.integer = scalar->dtype == ACL_UINT64
+                            ? static_cast<int64_t>(*reinterpret_cast<const uint64_t*>(p))
+                            : Load<int64_t>(p, scalar->dtype);
+    }
+    return value;
+}
+
+std::vector<int64_t> IntsOf(const aclIntArray* array) {
+    if (array == nullptr) {
+        throw Error(ACLNN_ERR_PARAM_NULLPTR, "int array is null");
+    }
+    return array->values;
+}
+
+std::vector<const aclTensor*> TensorsOf(const aclTensorList* list) {
+    if (list == nullptr) {
+        throw Error(ACLNN_ERR_PARAM_NULLPTR, "tensor list is null");
+    }
+    return list->tensors;
+}
+
+// ---------------------------------------------------------------- plan and launch
+
+namespace {
+
+aclnnStatus Report(const char* op, const Error& e) {
+    SetRecentError(std::string(op) + ": " + e.what());
+    return e.status;
+}
+
+}
+
+aclnnStatus Plan(const char* op, const std::vector<const aclTensor*>& inputs,
+                 const std::vector<const aclTensor*>& outputs, uint64_t* workspaceSize,
+                 aclOpExecutor** executor, const std::function<Kernel()>& build) {
+    if (workspaceSize == nullptr || executor == nullptr) {
+        return Report(op, Error(ACLNN_ERR_PARAM_NULLPTR, "workspaceSize or executor is null"));
+    }
+    auto planned = std::make_unique<aclOpExecutor>();
+    planned->op = op;
+    try {
+        for (const std::vector<const aclTensor*>* group : {&inputs, &outputs}) {
+            for (const aclTensor* tensor : *group) {
+                planned->tensors.push_back(ViewOf(tensor));
+                planned->sources.push_back(tensor);
+            }
+        }
+        planned->numInputs = inputs.size();
+        planned->kernel = build();
+    } catch (const Error& e) {
+        return Report(op, e);
+    } catch (const std::exception& e) {
+        return Report(op, Error(ACLNN_ERR_INNER, e.what()));
+    }
+    *workspaceSize = 0;
+    *executor = planned.release();
+    return ACLNN_SUCCESS;
+}
+
+aclnnStatus Launch(aclOpExecutor* executor, aclrtStream stream) {
+    if (executor == nullptr) {
+        return Report("aclnn", Error(ACLNN_ERR_PARAM_NULLPTR, "executor is null"));
+    }
+    Kernel kernel = executor->kernel;
+    std::vector<View> tensors = executor->tensors;
+    std::string op = executor->op;
+    if (!executor->repeatable) {
+        delete executor;
+    }
+    Enqueue(stream, [kernel = std::move(kernel), tensors = std::move(tensors), op = std::move(op)] {
+        try {
+            kernel(tensors);
+        } catch (const std::exception& e) {
+            throw std::runtime_error(op + ": " + e.what());
+        }
+    });
+    return ACLNN_SUCCESS;
+}
+
+// ---------------------------------------------------------------- iteration
+
+std::vector<int64_t> BroadcastShape(const std::vector<int64_t>& a, const std::vector<int64_t>& b) {
+    size_t rank = std::max(a.size(), b.size());
+    std::vector<int64_t> shape(rank);
+    for (size_t i = 0; i < rank; ++i) {
+        int64_t x = i < rank - a.size() ? 1 : a[i - (rank - a.size())];
+        int64_t y = i < rank - b.size() ? 1 : b[i - (rank - b.size())];
+        if (x != y && x != 1 && y != 1) {
+            throw Error("shapes cannot be broadcast together");
+        }
+        shape[i] = x == 1 ? y : x;
+    }
+    return shape;
+}
+
+void CheckBroadcastable(const View& view, const std::vector<int64_t>& dims, const char* what) {
+    if (view.dims.size() > dims.size()) {
+        throw Error(std::string(what) + " has more dimensions than the output");
+    }
+    size_t lead = dims.size() - view.dims.size();
+    for (size_t i = 0; i < view.dims.size(); ++i) {
+        if (view.dims[i] != 1 && view.dims[i] != dims[lead + i]) {
+            throw Error(std::string(what) + " cannot be broadcast to the output shape");
+        }
+    }
+}
+
+void ForEach(const std::vector<int64_t>& dims, const std::vector<const View*>& operands,
+             const std::function<void(char* const* ptrs)>& fn) {
+    const size_t rank = dims.size();
+    for (int64_t d : dims) {
+        if (d == 0) {
+            return;
+        }
+    }
+    const size_t n = operands.size();
+    // byte strides of every operand broadcast to dims
+    std::vector<int64_t> strides(n * rank, 0);
+    std::vector<char*> ptrs(n);
+    for (size_t k = 0; k < n; ++k) {
+        const View& view = *operands[k];
+        const int64_t size = static_cast<int64_t>(ElementSize(view.dtype));
+        const size_t lead = rank - view.dims.size();
+        for (size_t i = 0; i < view.dims.size(); ++i) {
+            strides[k * rank + lead + i] = view.dims[i] == 1 ? 0 : view.strides[i] * size;
+        }
+        ptrs[k] = view.Data();
+    }
+    if (rank == 0) {
+        fn(ptrs.data());
+        return;
+    }
+    std::vector<int64_t> index(rank, 0);
+    const size_t last = rank - 1;
+    while (true) {
+        for (int64_t i = 0; i < dims[last]; ++i) {
+            fn(ptrs.data());
+            for (size_t k = 0; k < n; ++k) {
+                ptrs[k] += strides[k * rank + last];
+            }
+        }
+        for (size_t k = 0; k < n; ++k) {
+            ptrs[k] -= strides[k * rank + last] * dims[last];
+        }
+        size_t d = last;
+        while (true) {
+            if (d == 0) {
+                return;
+            }
+            --d;
+            ++index[d];
+            for (size_t k = 0; k < n; ++k) {
+                ptrs[k] += strides[k * rank + d];
+            }
+            if (index[d] < dims[d]) {
+                break;
+            }
+            for (size_t k = 0; k < n; ++k) {
+                ptrs[k] -= strides[k * rank + d] * dims[d];
+            }
+            index[d] = 0;
+        }
+    }
+}
+
+int64_t WrapAxis(int64_t axis, int64_t rank) {
+    int64_t bound = std::max<int64_t>(rank, 1);
+    if (axis < -bound || axis >= bound) {
+        throw Error("axis " + std::to_string(axis) + " is out of bounds for a tensor of rank " + std::to_string(rank));
+    }
+    return axis < 0 ? axis + bound : axis;
+}
+
+View BroadcastTo(const View& view, const std::vector<int64_t>& dims) {
+    CheckBroadcastable(view, dims, "tensor");
+    View result = view;
+    const size_t lead = dims.size() - view.dims.size();
+    result.dims = dims;
+    result.strides.assign(dims.size(), 0);
+    for (size_t i = 0; i < view.dims.size(); ++i) {
+        result.strides[lead + i] = view.dims[i] == 1 ? 0 : view.strides[i];
+    }
+    return result;
+}
+
+View DropDims(const View& view, const std::vector<int64_t>& axes) {
+    View result = view;
+    result.dims.clear();
+    result.strides.clear();
+    for (int64_t i = 0; i < view.Rank(); ++i) {
+        if (std::find(axes.begin(), axes.end(), i) == axes.end()) {
+            result.dims.push_back(view.dims[i]);
+            result.strides.push_back(view.strides[i]);
+        }
+    }
+    return result;
+}
+
+std::vector<int64_t> CompactStrides(const std::vector<int64_t>& dims) {
+    std::vector<int64_t> strides(dims.size(), 1);
+    for (int64_t i = static_cast<int64_t>(dims.size()) - 2; i >= 0; --i) {
+        strides[i] = strides[i + 1] * std::max<int64_t>(dims[i + 1], 1);
+    }
+    return strides;
+}
+
+HeldScalar Hold(const aclScalar* scalar) {
+    ValueOf(scalar);
+    HeldScalar held;
+    held.storage = std::make_shared<aclScalar>(*scalar);
+    held.view.base = reinterpret_cast<char*>(held.storage->bytes);
+    held.view.dtype = scalar->dtype;
+    return held;
+}
+
+std::vector<int64_t> ReduceAxes(const std::vector<int64_t>& dims, int64_t rank) {
+    std::vector<int64_t> axes;
+    if (dims.empty()) {
+        for (int64_t i = 0; i < rank; ++i) {
+            axes.push_back(i);
+        }
+        return axes;
+    }
+    for (int64_t dim : dims) {
+        int64_t axis = rank == 0 ? 0 : WrapAxis(dim, rank);
+        if (rank > 0 && std::find(axes.begin(), axes.end(), axis) == axes.end()) {
+            axes.push_back(axis);
+        }
+    }
+    std::sort(axes.begin(), axes.end());
+    return axes;
+}
+
+std::vector<int64_t> ReducedShape(const std::vector<int64_t>& dims, const std::vector<int64_t>& axes, bool keepdim) {
+    std::vector<int64_t> shape;
+    for (int64_t i = 0; i < static_cast<int64_t>(dims.size()); ++i) {
+        if (std::find(axes.begin(), axes.end(), i) == axes.end()) {
+            shape.push_back(dims[i]);
+        } else if (keepdim) {
+            shape.push_back(1);
+        }
+    }
+    return shape;
+}
+
+void ForEachReduction(const View& in, const std::vector<int64_t>& axes, const View& out,
+                      const std::function<void(char* outPtr, const View& reduced)>& fn) {
+    View kept = DropDims(in, axes);
+    View reduced = in;
+    reduced.dims.clear();
+    reduced.strides.clear();
+    for (int64_t axis : axes) {
+        reduced.dims.push_back(in.dims[axis]);
+        reduced.strides.push_back(in.strides[axis]);
+    }
+    // out may keep the reduced axes as length-one dimensions
+    View target = out;
+    if (out.Rank() == in.Rank() && out.Rank() != kept.Rank()) {
+        target = DropDims(out, axes);
+    }
+    if (target.dims != kept.dims) {
+        throw Error("output shape does not match the reduced shape");
+    }
+    ForEach(kept.dims, {&target, &kept}, [&](char* const* p) {
+        View slice = reduced;
+        slice.base = p[1];
+        slice.offset = 0;
+        fn(p[0], slice);
+    });
+}
+
+}
+
+using host::Error;
+
+extern "C" {
+
+aclTensor* aclCreateTensor(const int64_t* viewDims, uint64_t viewDimsNum, aclDataType dataType,
+                           const int64_t* stride, int64_t offset, aclFormat format, const int64_t* storageDims,
+                           uint64_t storageDimsNum, void* tensorData) {
+    auto* tensor = new aclTensor();
+    tensor->viewDims.assign(viewDims, viewDims + viewDimsNum);
+    if (stride != nullptr) {
+        tensor->strides.assign(stride, stride + viewDimsNum);
+    } else {
+        tensor->strides.assign(viewDimsNum, 1);
+        for (int64_t i = static_cast<int64_t>(viewDimsNum) - 2; i >= 0; --i) {
+            tensor->strides[i] = tensor->strides[i + 1] * viewDims[i + 1];
+        }
+    }
+    if (storageDims != nullptr) {
+        tensor->storageDims.assign(storageDims, storageDims + storageDimsNum);
+    }
+    tensor->offset = offset;
+    tensor->dtype = dataType;
+    tensor->format = format;
+    tensor->data = tensorData;
+    return tensor;
+}
+
+aclScalar* aclCreateScalar(void* value, aclDataType dataType) {
+    if (value == nullptr || !host::IsSupported(dataType)) {
+        return nullptr;
+    }
+    auto* scalar = new aclScalar();
+    scalar->dtype = dataType;
+    std::memcpy(scalar->bytes, value, host::ElementSize(dataType));
+    return scalar;
+}
+
+aclIntArray* aclCreateIntArray(const int64_t* value, uint64_t size) {
+    auto* array = new aclIntArray();
+    if (value != nullptr) {
+        array->values.assign(value, value + size);
+    }
+    return array;
+}
+
+aclFloatArray* aclCreateFloatArray(const float* value, uint64_t size) {
+    auto* array = new aclFloatArray();
+    if (value != nullptr) {
+        array->values.assign(value, value + size);
+    }
+    return array;
+}
+
+aclBoolArray* aclCreateBoolArray(const bool* value, uint64_t size) {
+    auto* array = new aclBoolArray();
+    if (value != nullptr) {
+        array->values.assign(value, value + size);
+    }
+    return array;
+}
+
+aclTensorList* aclCreateTensorList(const aclTensor* const* value, uint64_t size) {
+    auto* list = new aclTensorList();
+    if (value != nullptr) {
+        list->tensors.assign(value, value + size);
+    }
+    return list;
+}
+
+aclnnStatus aclDestroyTensor(const aclTensor* tensor) {
+    delete tensor;
+    return ACLNN_SUCCESS;
+}
+
+aclnnStatus aclDestroyScalar(const aclScalar* scalar) {
+    delete scalar;
+    return ACLNN_SUCCESS;
+}
+
+aclnnStatus aclDestroyIntArray(const aclIntArray* array) {
+    delete array;
+    return ACLNN_SUCCESS;
+}
+
+aclnnStatus aclDestroyFloatArray(const aclFloatArray* array) {
+    delete array;
+    return ACLNN_SUCCESS;
+}
+
+aclnnStatus aclDestroyBoolArray(const aclBoolArray* array) {
+    delete array;
+    return ACLNN_SUCCESS;
+}
+
+aclnnStatus aclDestroyTensorList(const aclTensorList* array) {
+    // like CANN, the list owns its tensors
+    if (array != nullptr) {
+        for (const aclTensor* tensor : array->tensors) {
+            delete tensor;
+        }
+    }
+    delete array;
+    return ACLNN_SUCCESS;
+}
+
+aclnnStatus aclGetViewShape(const aclTensor* tensor, int64_t** viewDims, uint64_t* viewDimsNum) {
+    if (tensor == nullptr || viewDims == nullptr || viewDimsNum == nullptr) {
+        return ACLNN_ERR_PARAM_NULLPTR;
+    }
+    *viewDimsNum = tensor->viewDims.size();
+    *viewDims = new int64_t[tensor->viewDims.size() + 1];
+    std::copy(tensor->viewDims.begin(), tensor->viewDims.end(), *viewDims);
+    return ACLNN_SUCCESS;
+}
+
+aclnnStatus aclGetDataType(const aclTensor* tensor, aclDataType* dataType) {
+    if (tensor == nullptr || dataType == nullptr) {
+        return ACLNN_ERR_PARAM_NULLPTR;
+    }
+    *dataType = tensor->dtype;
+    return ACLNN_SUCCESS;
+}
+
+aclnnStatus aclGetRawTensorAddr(const aclTensor* tensor, void** addr) {
+    if (tensor == nullptr || addr == nullptr) {
+        return ACLNN_ERR_PARAM_NULLPTR;
+    }
+    *addr = tensor->data;
+    return ACLNN_SUCCESS;
+}
+
+aclnnStatus aclSetAclOpExecutorRepeatable(aclOpExecutor* executor) {
+    if (executor == nullptr) {
+        return ACLNN_ERR_PARAM_NULLPTR;
+    }
+    executor->repeatable = true;
+    return ACLNN_SUCCESS;
+}
+
+aclnnStatus aclDestroyAclOpExecutor(aclOpExecutor* executor) {
+    delete executor;
+    return ACLNN_SUCCESS;
+}
+
+}
+
+namespace {
+
+/// Point every use of tensor in the executor at addr; index is the fallback position.
+aclnnStatus Rebind(aclOpExecutor* executor, size_t position, aclTensor* tensor, void* addr) {
+    if (executor == nullptr || tensor == nullptr) {
+        return ACLNN_ERR_PARAM_NULLPTR;
+    }
+    if (!executor->repeatable) {
+        host::SetRecentError(executor->op + ": tensor addresses can only be rebound on a repeatable executor");
+        return ACLNN_ERR_PARAM_INVALID;
+    }
+    tensor->data = addr;
+    bool found = false;
+    for (size_t i = 0; i < executor->sources.size(); ++i) {
+        if (executor->sources[i] == tensor) {
+            executor->tensors[i].base = static_cast<char*>(addr);
+            found = true;
+        }
+    }
+    if (!found) {
+        if (position >= executor->tensors.size()) {
+            host::SetRecentError(executor->op + ": tensor index out of range");
+            return ACLNN_ERR_PARAM_INVALID;
+        }
+        executor->tensors[position].base = static_cast<char*>(addr);
+    }
+    return ACLNN_SUCCESS;
+}
+
+}
+
+extern "C" {
+
+aclnnStatus aclSetInputTensorAddr(aclOpExecutor* executor, const size_t index, aclTensor* tensor, void* addr) {
+    return Rebind(executor, index, tensor, addr);
+}
+
+aclnnStatus aclSetOutputTensorAddr(aclOpExecutor* executor, const size_t index, aclTensor* tensor, void* addr) {
+    return Rebind(executor, executor != nullptr ? executor->numInputs + index : index, tensor, addr);
+}
+
+}
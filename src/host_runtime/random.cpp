@@ -0,0 +1,100 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#include "host_runtime.hpp"
+
+#include <aclnnop/aclnn_bernoulli.h>
+#include <aclnnop/aclnn_normal.h>
+#include <aclnnop/aclnn_uniform.h>
+
+/*
+ * Random fills. Like the device generators they are counter based: element
+ * i of a fill with (seed, offset) depends only on seed and offset + i, so
+ * results do not depend on the order elements are visited in.
+ */
+
+using host::Kernel;
+using host::View;
+
+namespace {
+
+uint64_t SplitMix64(uint64_t x) {
+    x += 0x9e3779b97f4a7c15ULL;
+    x = (x ^ (x >> 30)) * 0xbf58476d1ce4e5b9ULL;
+    x = (x ^ (x >> 27)) * 0x94d049bb133111ebULL;
+    return x ^ (x >> 31);
+}
+
+/// Uniform double in [0, 1) for counter position index of stream seed.
+double Uniform01(uint64_t seed, uint64_t index) {
+    return static_cast<double>(SplitMix64(SplitMix64(seed) ^ index) >> 11) * 0x1.0p-53;
+}
+
+/**
+ * Plan a fill of selfRef where element i (in row-major order) becomes
+ * sample(seed, offset + i).
+ */
+template <typename Sample>
+aclnnStatus Fill(const char* op, aclTensor* selfRef, uint64_t seed, uint64_t offset, uint64_t* workspaceSize,
+                 aclOpExecutor** executor, Sample sample) {
+    return host::Plan(op, {}, {selfRef}, workspaceSize, executor, [&]() -> Kernel {
+        if (host::DomainOf(host::ViewOf(selfRef).dtype) == host::Domain::Complex) {
+            host::NotForComplex(op);
+        }
+        return [seed, offset, sample](const std::vector<View>& tensors) {
+            const View& out = tensors[0];
+            uint64_t i = 0;
+            host::ForEach(out.dims, {&out}, [&](char* const* p) {
+                host::Store(p[0], out.dtype, sample(seed, offset + i++));
+            });
+        };
+    });
+}
+
+}
+
+aclnnStatus aclnnInplaceUniformGetWorkspaceSize(aclTensor* selfRef, double from, double to, uint64_t seed,
+                                                uint64_t offset, uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Fill("InplaceUniform", selfRef, seed, offset, workspaceSize, executor,
+                [from, to](uint64_t seed, uint64_t index) { return from + (to - from) * Uniform01(seed, index); });
+}
+HOST_RUNTIME_LAUNCH(InplaceUniform)
+
+aclnnStatus aclnnInplaceNormalGetWorkspaceSize(aclTensor* selfRef, float mean, float std, int64_t seed,
+                                               int64_t offset, uint64_t* workspaceSize, aclOpExecutor** executor) {
+    // Box-Muller on two uniforms taken from independent streams
+    return Fill("InplaceNormal", selfRef, seed, offset, workspaceSize, executor,
+                [mean, std](uint64_t seed, uint64_t index) {
+                    double u = 1.0 - Uniform01(seed, index);
+                    double v = Uniform01(~seed, index);
+                    return mean + std * std::sqrt(-2.0 * std::log(u)) * std::cos(2.0 * 3.14159265358979323846 * v);
+                });
+}
+HOST_RUNTIME_LAUNCH(InplaceNormal)
+
+aclnnStatus aclnnInplaceBernoulliGetWorkspaceSize(aclTensor* selfRef, const aclScalar* prob, int64_t seed,
+                                                  int64_t offset, uint64_t* workspaceSize, aclOpExecutor** executor) {
+    double p = 0;
+    try {
+        p = host::ValueOf(prob).As<double>();
+    } catch (const host::Error& e) {
+        host::SetRecentError(std::string("InplaceBernoulli: ") + e.what());
+        return e.status;
+    }
+    return Fill("InplaceBernoulli", selfRef, seed, offset, workspaceSize, executor,
+                [p](uint64_t seed, uint64_t index) { return static_cast<int64_t>(Uniform01(seed, index) < p); });
+}
+HOST_RUNTIME_LAUNCH(InplaceBernoulli)
@@ -0,0 +1,281 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#include "host_runtime.hpp"
+
+#include <aclnnop/aclnn_all.h>
+#include <aclnnop/aclnn_any.h>
+#include <aclnnop/aclnn_cumprod.h>
+#include <aclnnop/aclnn_cumsum.h>
+#include <aclnnop/aclnn_norm.h>
+#include <aclnnop/aclnn_prod.h>
+#include <aclnnop/aclnn_reduce_nansum.h>
+#include <aclnnop/aclnn_reduce_sum.h>
+
+#include <algorithm>
+#include <limits>
+
+/*
+ * Reductions and scans. An empty dim list reduces over every dimension,
+ * as in CANN.
+ */
+
+using host::Domain;
+using host::Kernel;
+using host::View;
+
+namespace {
+
+const auto Unchanged = [](auto acc) { return acc; };
+
+/**
+ * Plan a reduction of self over dims into out.
+ *
+ * fold(acc, x) accumulates one element into acc, which starts at init and
+ * is computed in domain; finish(acc) is stored to out. A null dims reduces
+ * over every dimension, into an out of any shape with one element.
+ */
+template <typename Fold, typename Finish = decltype(Unchanged)>
+aclnnStatus Reduce(const char* op, const aclTensor* self, const aclIntArray* dims, bool keepdim,
+                   const aclTensor* out, uint64_t* workspaceSize, aclOpExecutor** executor, Domain least,
+                   bool widen, double init, Fold fold, Finish finish = Unchanged) {
+    return host::Plan(op, {self}, {out}, workspaceSize, executor, [&]() -> Kernel {
+        View in = host::ViewOf(self);
+        View result = host::ViewOf(out);
+        std::vector<int64_t> axes = host::ReduceAxes(dims != nullptr ? host::IntsOf(dims) : std::vector<int64_t>{},
+                                                     in.Rank());
+        const bool all = static_cast<int64_t>(axes.size()) == in.Rank();
+        if (all && dims == nullptr ? result.Numel() != 1 : host::ReducedShape(in.dims, axes, keepdim) != result.dims) {
+            throw host::Error("out does not have the reduced shape");
+        }
+        Domain domain = host::Max(least, host::DomainOf(in.dtype));
+        if (widen) {
+            domain = host::Max(domain, host::DomainOf(result.dtype));
+        }
+        return [domain, axes, all, init, fold, finish](const std::vector<View>& tensors) {
+            const View& in = tensors[0];
+            View out = tensors[1];
+            if (all) {
+                out.dims.clear();
+                out.strides.clear();
+            }
+            host::Dispatch(domain, [&](auto tag) {
+                using T = decltype(tag);
+                host::ForEachReduction(in, axes, out, [&](char* target, const View& reduced) {
+                    T acc = host::Convert<T>(init);
+                    host::ForEach(reduced.dims, {&reduced}, [&](char* const* p) {
+                        acc = fold(acc, host::Load<T>(p[0], reduced.dtype));
+                    });
+                    host::Store(target, out.dtype, finish(acc));
+                });
+            });
+        };
+    });
+}
+
+const auto Sum = [](auto acc, auto x) { return acc + x; };
+
+const auto NanSum = [](auto acc, auto x) {
+    using T = decltype(x);
+    if constexpr (host::kIsComplex<T>) {
+        return (std::isnan(x.real()) || std::isnan(x.imag())) ? acc : acc + x;
+    } else if constexpr (std::is_floating_point_v<T>) {
+        return std::isnan(x) ? acc : acc + x;
+    } else {
+        return acc + x;
+    }
+};
+
+const auto Product = [](auto acc, auto x) { return acc * x; };
+
+const auto AllTrue = [](auto acc, auto x) {
+    using T = decltype(x);
+    return T(acc != T(0) && x != T(0));
+};
+
+const auto AnyTrue = [](auto acc, auto x) {
+    using T = decltype(x);
+    return T(acc != T(0) || x != T(0));
+};
+
+/**
+ * Plan a scan of self along dim into out; step(acc, x) gives the running value.
+ */
+template <typename Step>
+aclnnStatus Scan(const char* op, const aclTensor* self, int64_t dim, aclDataType dtype, const aclTensor* out,
+                 uint64_t* workspaceSize, aclOpExecutor** executor, double init, Step step) {
+    return host::Plan(op, {self}, {out}, workspaceSize, executor, [&]() -> Kernel {
+        View in = host::ViewOf(self);
+        View result = host::ViewOf(out);
+        if (in.dims != result.dims) {
+            throw host::Error("out must have the shape of self");
+        }
+        if (result.dtype != dtype) {
+            throw host::Error("dtype does not match the dtype of out");
+        }
+        const int64_t axis = host::WrapAxis(dim, in.Rank());
+        Domain domain = host::Max(host::DomainOf(in.dtype), host::DomainOf(result.dtype));
+        return [domain, axis, init, step](const std::vector<View>& tensors) {
+            View in = tensors[0];
+            View out = tensors[1];
+            if (in.Rank() == 0) {
+                in.dims = out.dims = {1};
+                in.strides = out.strides = {1};
+            }
+            const int64_t length = in.dims[axis];
+            const int64_t inStride = in.strides[axis] * static_cast<int64_t>(host::ElementSize(in.dtype));
+            const int64_t outStride = out.strides[axis] * static_cast<int64_t>(host::ElementSize(out.dtype));
+            View inRest = host::DropDims(in, {axis});
+            View outRest = host::DropDims(out, {axis});
+            host::Dispatch(domain, [&](auto tag) {
+                using T = decltype(tag);
+                host::ForEach(outRest.dims, {&outRest, &inRest}, [&](char* const* p) {
+                    T acc = host::Convert<T>(init);
+                    for (int64_t i = 0; i < length; ++i) {
+                        acc = step(acc, host::Load<T>(p[1] + i * inStride, in.dtype));
+                        host::Store(p[0] + i * outStride, out.dtype, acc);
+                    }
+                });
+            });
+        };
+    });
+}
+
+}
+
+aclnnStatus aclnnReduceSumGetWorkspaceSize(const aclTensor* self, const aclIntArray* dim, bool keepDim,
+                                           aclDataType dtype, aclTensor* out, uint64_t* workspaceSize,
+                                           aclOpExecutor** executor) {
+    (void)dtype;    // the dtype of out
+    if (dim == nullptr) {
+        host::SetRecentError("ReduceSum: dim is null");
+        return ACLNN_ERR_PARAM_NULLPTR;
+    }
+    return Reduce("ReduceSum", self, dim, keepDim, out, workspaceSize, executor, Domain::Int, true, 0, Sum);
+}
+HOST_RUNTIME_LAUNCH(ReduceSum)
+
+aclnnStatus aclnnReduceNansumGetWorkspaceSize(const aclTensor* self, const aclIntArray* dim, bool keepDim,
+                                              aclDataType dtype, aclTensor* out, uint64_t* workspaceSize,
+                                              aclOpExecutor** executor) {
+    (void)dtype;
+    if (dim == nullptr) {
+        host::SetRecentError("ReduceNansum: dim is null");
+        return ACLNN_ERR_PARAM_NULLPTR;
+    }
+    return Reduce("ReduceNansum", self, dim, keepDim, out, workspaceSize, executor, Domain::Int, true, 0, NanSum);
+}
+HOST_RUNTIME_LAUNCH(ReduceNansum)
+
+aclnnStatus aclnnProdGetWorkspaceSize(const aclTensor* self, aclDataType dtype, aclTensor* out,
+                                      uint64_t* workspaceSize, aclOpExecutor** executor) {
+    (void)dtype;
+    return Reduce("Prod", self, nullptr, false, out, workspaceSize, executor, Domain::Int, true, 1, Product);
+}
+HOST_RUNTIME_LAUNCH(Prod)
+
+aclnnStatus aclnnProdDimGetWorkspaceSize(const aclTensor* self, int64_t dim, bool keepDim, aclDataType dtype,
+                                         aclTensor* out, uint64_t* workspaceSize, aclOpExecutor** executor) {
+    (void)dtype;
+    aclIntArray dims{{dim}};
+    return Reduce("ProdDim", self, &dims, keepDim, out, workspaceSize, executor, Domain::Int, true, 1, Product);
+}
+HOST_RUNTIME_LAUNCH(ProdDim)
+
+aclnnStatus aclnnAllGetWorkspaceSize(const aclTensor* self, const aclIntArray* dim, bool keepdim, aclTensor* out,
+                                     uint64_t* workspaceSize, aclOpExecutor** executor) {
+    if (dim == nullptr) {
+        host::SetRecentError("All: dim is null");
+        return ACLNN_ERR_PARAM_NULLPTR;
+    }
+    return Reduce("All", self, dim, keepdim, out, workspaceSize, executor, Domain::Int, false, 1, AllTrue);
+}
+HOST_RUNTIME_LAUNCH(All)
+
+aclnnStatus aclnnAnyGetWorkspaceSize(const aclTensor* self, const aclIntArray* dim, bool keepdim, aclTensor* out,
+                                     uint64_t* workspaceSize, aclOpExecutor** executor) {
+    if (dim == nullptr) {
+        host::SetRecentError("Any: dim is null");
+        return ACLNN_ERR_PARAM_NULLPTR;
+    }
+    return Reduce("Any", self, dim, keepdim, out, workspaceSize, executor, Domain::Int, false, 0, AnyTrue);
+}
+HOST_RUNTIME_LAUNCH(Any)
+
+aclnnStatus aclnnNormGetWorkspaceSize(const aclTensor* self, const aclScalar* pScalar, const aclIntArray* dim,
+                                      bool keepdim, aclTensor* out, uint64_t* workspaceSize,
+                                      aclOpExecutor** executor) {
+    if (pScalar == nullptr || dim == nullptr) {
+        host::SetRecentError("Norm: pScalar or dim is null");
+        return ACLNN_ERR_PARAM_NULLPTR;
+    }
+    double p;
+    try {
+        p = host::ValueOf(pScalar).As<double>();
+    } catch (const host::Error& e) {
+        host::SetRecentError(std::string("Norm: ") + e.what());
+        return e.status;
+    }
+    const double inf = std::numeric_limits<double>::infinity();
+    auto magnitude = [](auto x) { return std::abs(x); };
+    if (p == inf || p == -inf) {
+        auto pick = [p, magnitude](auto acc, auto x) {
+            using T = decltype(x);
+            double a = std::real(acc);
+            double m = static_cast<double>(magnitude(x));
+            return T(p > 0 ? std::max(a, m) : std::min(a, m));
+        };
+        return Reduce("Norm", self, dim, keepdim, out, workspaceSize, executor, Domain::Float, true,
+                      p > 0 ? 0.0 : inf, pick);
+    }
+    if (p == 0) {
+        auto count = [](auto acc, auto x) { return acc + decltype(x)(x != decltype(x)(0)); };
+        return Reduce("Norm", self, dim, keepdim, out, workspaceSize, executor, Domain::Float, true, 0, count);
+    }
+    auto power = [p, magnitude](auto acc, auto x) {
+        using T = decltype(x);
+        return acc + T(std::pow(static_cast<double>(magnitude(x)), p));
+    };
+    auto root = [p](auto acc) {
+        using T = decltype(acc);
+        return T(std::pow(std::real(acc), 1.0 / p));
+    };
+    return Reduce("Norm", self, dim, keepdim, out, workspaceSize, executor, Domain::Float, true, 0, power, root);
+}
+HOST_RUNTIME_LAUNCH(Norm)
+
+aclnnStatus aclnnCumsumGetWorkspaceSize(const aclTensor* self, int64_t dim, aclDataType dtype, aclTensor* out,
+                                        uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Scan("Cumsum", self, dim, dtype, out, workspaceSize, executor, 0, Sum);
+}
+HOST_RUNTIME_LAUNCH(Cumsum)
+
+aclnnStatus aclnnCumprodGetWorkspaceSize(const aclTensor* input, const aclScalar* axis, const aclDataType dtype,
+                                         aclTensor* out, uint64_t* workspaceSize, aclOpExecutor** executor) {
+    if (axis == nullptr) {
+        host::SetRecentError("Cumprod: axis is null");
+        return ACLNN_ERR_PARAM_NULLPTR;
+    }
+    int64_t dim;
+    try {
+        dim = host::ValueOf(axis).As<int64_t>();
+    } catch (const host::Error& e) {
+        host::SetRecentError(std::string("Cumprod: ") + e.what());
+        return e.status;
+    }
+    return Scan("Cumprod", input, dim, dtype, out, workspaceSize, executor, 1, Product);
+}
+HOST_RUNTIME_LAUNCH(Cumprod)
@@ -0,0 +1,553 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#include "host_runtime.hpp"
+
+#include <acl/acl.h>
+
+#include <algorithm>
+#include <chrono>
+#include <condition_variable>
+#include <cstdlib>
+#include <deque>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <set>
+#include <thread>
+
+/*
+ * ACL runtime on the host: "device" memory is malloc'ed host memory and
+ * every stream is a worker thread draining a FIFO of tasks, so work queued
+ * on one stream overlaps with the caller and with other streams exactly as
+ * far as events allow.
+ */
+
+namespace host {
+
+namespace {
+
+using Clock = std::chrono::steady_clock;
+
+constexpr size_t kAlignment = 512;
+
+thread_local std::string recentError;
+
+int32_t DeviceCount() {
+    static const int32_t count = [] {
+        const char* env = std::getenv("ASNUMPY_HOST_DEVICE_COUNT");
+        int32_t n = env != nullptr ? std::atoi(env) : 1;
+        return n > 0 ? n : 1;
+    }();
+    return count;
+}
+
+std::mutex deviceMutex;
+int32_t processDevice = -1;             // first device set by any thread
+thread_local int32_t threadDevice = -1;
+
+int32_t CurrentDevice() {
+    if (threadDevice >= 0) {
+        return threadDevice;
+    }
+    std::lock_guard<std::mutex> lock(deviceMutex);
+    return processDevice >= 0 ? processDevice : 0;
+}
+
+/// Context of a device; a context handle points at one of these.
+struct Context {
+    int32_t device;
+};
+
+std::vector<Context>& Contexts() {
+    static std::vector<Context> contexts = [] {
+        std::vector<Context> all;
+        for (int32_t device = 0; device < DeviceCount(); ++device) {
+            all.push_back({device});
+        }
+        return all;
+    }();
+    return contexts;
+}
+
+/// A stream: tasks run one at a time, in order, on a dedicated thread.
+class Stream {
+public:
+    explicit Stream(int32_t device) : device(device), worker_([this] { Work(); }) {}
+
+    ~Stream() {
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            stop_ = true;
+        }
+        wake_.notify_all();
+        worker_.join();
+    }
+
+    void Push(std::function<void()> task) {
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            tasks_.push_back(std::move(task));
+        }
+        wake_.notify_all();
+    }
+
+    /// Wait until every queued task has run; returns and clears the first failure.
+    aclError Synchronize() {
+        std::unique_lock<std::mutex> lock(mutex_);
+        idle_.wait(lock, [this] { return tasks_.empty() && !busy_; });
+        if (error_.empty()) {
+            return ACL_SUCCESS;
+        }
+        SetRecentError(error_);
+        error_.clear();
+        return ACL_ERROR_INTERNAL_ERROR;
+    }
+
+    const int32_t device;
+
+private:
+    void Work() {
+        std::unique_lock<std::mutex> lock(mutex_);
+        while (true) {
+            wake_.wait(lock, [this] { return stop_ || !tasks_.empty(); });
+            if (tasks_.empty()) {
+                return;
+            }
+            std::function<void()> task = std::move(tasks_.front());
+            tasks_.pop_front();
+            busy_ = true;
+            lock.unlock();
+            std::string failure;
+            try {
+                task();
+            } catch (const std::exception& e) {
+                failure = e.what();
+            }
+            lock.lock();
+            busy_ = false;
+            if (!failure.empty() && error_.empty()) {
+                error_ = std::move(failure);
+            }
+            if (tasks_.empty()) {
+                idle_.notify_all();
+            }
+        }
+    }
+
+    std::mutex mutex_;
+    std::condition_variable wake_;
+    std::condition_variable idle_;
+    std::deque<std::function<void()>> tasks_;
+    bool busy_ = false;
+    bool stop_ = false;
+    std::string error_;
+    std::thread worker_;
+};
+
+std::mutex streamsMutex;
+
+std::set<Stream*>& Streams() {
+    static auto* streams = new std::set<Stream*>();
+    return *streams;
+}
+
+/// Default stream of a device, created on first use and never destroyed.
+Stream* DefaultStream(int32_t device) {
+    static auto* defaults = new std::map<int32_t, Stream*>();
+    std::lock_guard<std::mutex> lock(streamsMutex);
+    Stream*& stream = (*defaults)[device];
+    if (stream == nullptr) {
+        stream = new Stream(device);
+        Streams().insert(stream);
+    }
+    return stream;
+}
+
+Stream* ToStream(aclrtStream stream) {
+    return stream != nullptr ? static_cast<Stream*>(stream) : DefaultStream(CurrentDevice());
+}
+
+/// Synchronize the streams of one device, or of all devices if device < 0.
+aclError SynchronizeStreams(int32_t device) {
+    std::vector<Stream*> streams;
+    {
+        std::lock_guard<std::mutex> lock(streamsMutex);
+        for (Stream* stream : Streams()) {
+            if (device < 0 || stream->device == device) {
+                streams.push_back(stream);
+            }
+        }
+    }
+    aclError result = ACL_SUCCESS;
+    for (Stream* stream : streams) {
+        aclError error = stream->Synchronize();
+        if (result == ACL_SUCCESS) {
+            result = error;
+        }
+    }
+    return result;
+}
+
+/// Completion state of an event, shared with the tasks that record or wait for it.
+struct EventState {
+    std::mutex mutex;
+    std::condition_variable done;
+    uint64_t recorded = 0;      // number of aclrtRecordEvent calls
+    uint64_t completed = 0;     // latest record reached by its stream
+    Clock::time_point stamp;
+
+    void WaitFor(uint64_t generation) {
+        std::unique_lock<std::mutex> lock(mutex);
+        done.wait(lock, [&] { return completed >= generation; });
+    }
+};
+
+struct Event {
+    std::shared_ptr<EventState> state = std::make_shared<EventState>();
+};
+
+std::shared_ptr<EventState> StateOf(aclrtEvent event) {
+    return static_cast<Event*>(event)->state;
+}
+
+void* AlignedAlloc(size_t size) {
+    size_t rounded = std::max<size_t>((size + kAlignment - 1) / kAlignment * kAlignment, kAlignment);
+    return std::aligned_alloc(kAlignment, rounded);
+}
+
+aclError Fail(aclError error, const std::string& message) {
+    SetRecentError(message);
+    return error;
+}
+
+}
+
+void SetRecentError(const std::string& message) {
+    recentError = message;
+}
+
+void Enqueue(aclrtStream stream, std::function<void()> task) {
+    ToStream(stream)->Push(std::move(task));
+}
+
+}
+
+using host::Fail;
+
+extern "C" {
+
+aclError aclInit(const char* configPath) {
+    (void)configPath;
+    return ACL_SUCCESS;
+}
+
+aclError aclFinalize() {
+    return host::SynchronizeStreams(-1);
+}
+
+const char* aclGetRecentErrMsg() {
+    return host::recentError.c_str();
+}
+
+size_t aclDataTypeSize(aclDataType dataType) {
+    return host::IsSupported(dataType) ? host::ElementSize(dataType) : 0;
+}
+
+aclError aclrtSetDevice(int32_t deviceId) {
+    if (deviceId < 0 || deviceId >= host::DeviceCount()) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtSetDevice: invalid device id " + std::to_string(deviceId));
+    }
+    host::threadDevice = deviceId;
+    std::lock_guard<std::mutex> lock(host::deviceMutex);
+    if (host::processDevice < 0) {
+        host::processDevice = deviceId;
+    }
+    return ACL_SUCCESS;
+}
+
+aclError aclrtResetDevice(int32_t deviceId) {
+    if (deviceId < 0 || deviceId >= host::DeviceCount()) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtResetDevice: invalid device id " + std::to_string(deviceId));
+    }
+    return host::SynchronizeStreams(deviceId);
+}
+
+aclError aclrtResetDeviceForce(int32_t deviceId) {
+    return aclrtResetDevice(deviceId);
+}
+
+aclError aclrtGetDevice(int32_t* deviceId) {
+    if (deviceId == nullptr) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtGetDevice: deviceId is null");
+    }
+    *deviceId = host::CurrentDevice();
+    return ACL_SUCCESS;
+}
+
+aclError aclrtGetDeviceCount(uint32_t* count) {
+    if (count == nullptr) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtGetDeviceCount: count is null");
+    }
+    *count = static_cast<uint32_t>(host::DeviceCount());
+    return ACL_SUCCESS;
+}
+
+aclError aclrtSynchronizeDevice() {
+    return host::SynchronizeStreams(host::CurrentDevice());
+}
+
+aclError aclrtGetCurrentContext(aclrtContext* context) {
+    if (context == nullptr) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtGetCurrentContext: context is null");
+    }
+    *context = &host::Contexts()[host::CurrentDevice()];
+    return ACL_SUCCESS;
+}
+
+aclError aclrtSetCurrentContext(aclrtContext context) {
+    auto& contexts = host::Contexts();
+    auto* target = static_cast<host::Context*>(context);
+    if (target < contexts.data() || target >= contexts.data() + contexts.size()) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtSetCurrentContext: unknown context");
+    }
+    host::threadDevice = target->device;
+    return ACL_SUCCESS;
+}
+
+aclError aclrtDeviceCanAccessPeer(int32_t* canAccessPeer, int32_t deviceId, int32_t peerDeviceId) {
+    if (canAccessPeer == nullptr) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtDeviceCanAccessPeer: canAccessPeer is null");
+    }
+    const int32_t count = host::DeviceCount();
+    if (deviceId < 0 || deviceId >= count || peerDeviceId < 0 || peerDeviceId >= count) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtDeviceCanAccessPeer: invalid device id");
+    }
+    // every simulated device lives in host memory
+    *canAccessPeer = deviceId != peerDeviceId ? 1 : 0;
+    return ACL_SUCCESS;
+}
+
+aclError aclrtDeviceEnablePeerAccess(int32_t peerDeviceId, uint32_t flags) {
+    if (peerDeviceId < 0 || peerDeviceId >= host::DeviceCount() || flags != 0) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtDeviceEnablePeerAccess: invalid peer device or flags");
+    }
+    return ACL_SUCCESS;
+}
+
+aclError aclrtMalloc(void** devPtr, size_t size, aclrtMemMallocPolicy policy) {
+    (void)policy;
+    if (devPtr == nullptr) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtMalloc: devPtr is null");
+    }
+    *devPtr = host::AlignedAlloc(size);
+    if (*devPtr == nullptr) {
+        return Fail(ACL_ERROR_RT_MEMORY_ALLOCATION, "aclrtMalloc: out of memory allocating " + std::to_string(size) + " bytes");
+    }
+    return ACL_SUCCESS;
+}
+
+aclError aclrtFree(void* devPtr) {
+    std::free(devPtr);
+    return ACL_SUCCESS;
+}
+
+aclError aclrtMallocHost(void** hostPtr, size_t size) {
+    return aclrtMalloc(hostPtr, size, ACL_MEM_MALLOC_NORMAL_ONLY);
+}
+
+aclError aclrtFreeHost(void* hostPtr) {
+    return aclrtFree(hostPtr);
+}
+
+aclError aclrtMemcpy(void* dst, size_t destMax, const void* src, size_t count, aclrtMemcpyKind kind) {
+    (void)kind;
+    if (count > destMax) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtMemcpy: count exceeds destMax");
+    }
+    // 同步拷贝需要看到所有已入队的计算结果
+    aclError error = host::SynchronizeStreams(-1);
+    if (error != ACL_SUCCESS) {
+        return error;
+    }
+    if (count > 0) {
+        std::memcpy(dst, src, count);
+    }
+    return ACL_SUCCESS;
+}
+
+aclError aclrtMemcpyAsync(void* dst, size_t destMax, const void* src, size_t count, aclrtMemcpyKind kind,
+                          aclrtStream stream) {
+    (void)kind;
+    if (count > destMax) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtMemcpyAsync: count exceeds destMax");
+    }
+    if (count > 0) {
+        host::Enqueue(stream, [dst, src, count] { std::memcpy(dst, src, count); });
+    }
+    return ACL_SUCCESS;
+}
+
+aclError aclrtMemset(void* devPtr, size_t maxCount, int32_t value, size_t count) {
+    if (count > maxCount) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtMemset: count exceeds maxCount");
+    }
+    aclError error = host::SynchronizeStreams(-1);
+    if (error != ACL_SUCCESS) {
+        return error;
+    }
+    std::memset(devPtr, value, count);
+    return ACL_SUCCESS;
+}
+
+aclError aclrtMemsetAsync(void* devPtr, size_t maxCount, int32_t value, size_t count, aclrtStream stream) {
+    if (count > maxCount) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtMemsetAsync: count exceeds maxCount");
+    }
+    if (count > 0) {
+        host::Enqueue(stream, [devPtr, value, count] { std::memset(devPtr, value, count); });
+    }
+    return ACL_SUCCESS;
+}
+
+aclError aclrtCreateStream(aclrtStream* stream) {
+    if (stream == nullptr) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtCreateStream: stream is null");
+    }
+    auto* created = new host::Stream(host::CurrentDevice());
+    {
+        std::lock_guard<std::mutex> lock(host::streamsMutex);
+        host::Streams().insert(created);
+    }
+    *stream = created;
+    return ACL_SUCCESS;
+}
+
+aclError aclrtDestroyStream(aclrtStream stream) {
+    if (stream == nullptr) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtDestroyStream: the default stream cannot be destroyed");
+    }
+    auto* destroyed = static_cast<host::Stream*>(stream);
+    {
+        std::lock_guard<std::mutex> lock(host::streamsMutex);
+        host::Streams().erase(destroyed);
+    }
+    // 销毁前执行完已入队的任务
+    destroyed->Synchronize();
+    delete destroyed;
+    return ACL_SUCCESS;
+}
+
+aclError aclrtSynchronizeStream(aclrtStream stream) {
+    return host::ToStream(stream)->Synchronize();
+}
+
+aclError aclrtStreamWaitEvent(aclrtStream stream, aclrtEvent event) {
+    if (event == nullptr) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtStreamWaitEvent: event is null");
+    }
+    auto state = host::StateOf(event);
+    uint64_t generation;
+    {
+        std::lock_guard<std::mutex> lock(state->mutex);
+        generation = state->recorded;
+    }
+    if (generation > 0) {
+        host::Enqueue(stream, [state, generation] { state->WaitFor(generation); });
+    }
+    return ACL_SUCCESS;
+}
+
+aclError aclrtCreateEvent(aclrtEvent* event) {
+    if (event == nullptr) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtCreateEvent: event is null");
+    }
+    *event = new host::Event();
+    return ACL_SUCCESS;
+}
+
+aclError aclrtDestroyEvent(aclrtEvent event) {
+    delete static_cast<host::Event*>(event);
+    return ACL_SUCCESS;
+}
+
+aclError aclrtRecordEvent(aclrtEvent event, aclrtStream stream) {
+    if (event == nullptr) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtRecordEvent: event is null");
+    }
+    auto state = host::StateOf(event);
+    uint64_t generation;
+    {
+        std::lock_guard<std::mutex> lock(state->mutex);
+        generation = ++state->recorded;
+    }
+    host::Enqueue(stream, [state, generation] {
+        {
+            std::lock_guard<std::mutex> lock(state->mutex);
+            state->completed = std::max(state->completed, generation);
+            state->stamp = host::Clock::now();
+        }
+        state->done.notify_all();
+    });
+    return ACL_SUCCESS;
+}
+
+aclError aclrtSynchronizeEvent(aclrtEvent event) {
+    if (event == nullptr) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtSynchronizeEvent: event is null");
+    }
+    auto state = host::StateOf(event);
+    uint64_t generation;
+    {
+        std::lock_guard<std::mutex> lock(state->mutex);
+        generation = state->recorded;
+    }
+    state->WaitFor(generation);
+    return ACL_SUCCESS;
+}
+
+aclError aclrtQueryEventStatus(aclrtEvent event, aclrtEventRecordedStatus* status) {
+    if (event == nullptr || status == nullptr) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtQueryEventStatus: null argument");
+    }
+    auto state = host::StateOf(event);
+    std::lock_guard<std::mutex> lock(state->mutex);
+    *status = state->completed >= state->recorded ? ACL_EVENT_RECORDED_STATUS_COMPLETE
+                                                   : ACL_EVENT_RECORDED_STATUS_NOT_READY;
+    return ACL_SUCCESS;
+}
+
+aclError aclrtEventElapsedTime(float* ms, aclrtEvent startEvent, aclrtEvent endEvent) {
+    if (ms == nullptr || startEvent == nullptr || endEvent == nullptr) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtEventElapsedTime: null argument");
+    }
+    aclrtSynchronizeEvent(startEvent);
+    aclrtSynchronizeEvent(endEvent);
+    auto Stamp = [](aclrtEvent event, host::Clock::time_point* stamp) {
+        auto state = host::StateOf(event);
+        std::lock_guard<std::mutex> lock(state->mutex);
+        *stamp = state->stamp;
+        return state->completed > 0;
+    };
+    host::Clock::time_point start, end;
+    if (!Stamp(startEvent, &start) || !Stamp(endEvent, &end)) {
+        return Fail(ACL_ERROR_INVALID_PARAM, "aclrtEventElapsedTime: event was never recorded");
+    }
+    *ms = std::chrono::duration<float, std::milli>(end - start).count();
+    return ACL_SUCCESS;
+}
+
+}
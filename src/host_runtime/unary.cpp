@@ -0,0 +1,399 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#include "host_runtime.hpp"
+
+#include <aclnnop/aclnn_abs.h>
+#include <aclnnop/aclnn_acos.h>
+#include <aclnnop/aclnn_acosh.h>
+#include <aclnnop/aclnn_asin.h>
+#include <aclnnop/aclnn_asinh.h>
+#include <aclnnop/aclnn_atan.h>
+#include <aclnnop/aclnn_atanh.h>
+#include <aclnnop/aclnn_cast.h>
+#include <aclnnop/aclnn_ceil.h>
+#include <aclnnop/aclnn_copy.h>
+#include <aclnnop/aclnn_cos.h>
+#include <aclnnop/aclnn_cosh.h>
+#include <aclnnop/aclnn_exp.h>
+#include <aclnnop/aclnn_exp2.h>
+#include <aclnnop/aclnn_expm1.h>
+#include <aclnnop/aclnn_fill_scalar.h>
+#include <aclnnop/aclnn_floor.h>
+#include <aclnnop/aclnn_is_inf.h>
+#include <aclnnop/aclnn_isfinite.h>
+#include <aclnnop/aclnn_isneginf.h>
+#include <aclnnop/aclnn_isposinf.h>
+#include <aclnnop/aclnn_log.h>
+#include <aclnnop/aclnn_log10.h>
+#include <aclnnop/aclnn_log1p.h>
+#include <aclnnop/aclnn_log2.h>
+#include <aclnnop/aclnn_logical_not.h>
+#include <aclnnop/aclnn_nan_to_num.h>
+#include <aclnnop/aclnn_neg.h>
+#include <aclnnop/aclnn_ones.h>
+#include <aclnnop/aclnn_real.h>
+#include <aclnnop/aclnn_reciprocal.h>
+#include <aclnnop/aclnn_round.h>
+#include <aclnnop/aclnn_sign.h>
+#include <aclnnop/aclnn_signbit.h>
+#include <aclnnop/aclnn_sin.h>
+#include <aclnnop/aclnn_sinc.h>
+#include <aclnnop/aclnn_sinh.h>
+#include <aclnnop/aclnn_sqrt.h>
+#include <aclnnop/aclnn_tan.h>
+#include <aclnnop/aclnn_tanh.h>
+#include <aclnnop/aclnn_trunc.h>
+#include <aclnnop/aclnn_zero.h>
+
+/*
+ * One-input elementwise operators, plus the copy, cast and fill operators
+ * that write a whole tensor.
+ */
+
+using host::Domain;
+using host::Elementwise;
+using host::Tensor;
+
+namespace {
+
+constexpr double kPi = 3.14159265358979323846;
+
+template <typename T>
+constexpr bool kIsComplex = host::kIsComplex<T>;
+
+const auto Identity = [](auto x) { return x; };
+
+const auto Abs = [](auto x) {
+    if constexpr (std::is_same_v<decltype(x), int64_t>) {
+        return x < 0 ? -x : x;
+    } else {
+        return std::abs(x);
+    }
+};
+
+const auto Neg = [](auto x) { return -x; };
+
+const auto Sign = [](auto x) {
+    using T = decltype(x);
+    if constexpr (kIsComplex<T>) {
+        double magnitude = std::abs(x);
+        return magnitude == 0 ? T(0) : x / magnitude;
+    } else if constexpr (std::is_floating_point_v<T>) {
+        return std::isnan(x) ? x : static_cast<T>((x > 0) - (x < 0));
+    } else {
+        return static_cast<T>((x > 0) - (x < 0));
+    }
+};
+
+/// fn on real values, identity on integers.
+template <typename Fn>
+auto Rounding(const char* name, Fn fn) {
+    return [name, fn](auto x) {
+        using T = decltype(x);
+        if constexpr (kIsComplex<T>) {
+            host::NotForComplex(name);
+            return x;
+        } else if constexpr (std::is_floating_point_v<T>) {
+            return fn(x);
+        } else {
+            return x;
+        }
+    };
+}
+
+const auto Ceil = Rounding("ceil", [](double x) { return std::ceil(x); });
+const auto Floor = Rounding("floor", [](double x) { return std::floor(x); });
+const auto Trunc = Rounding("trunc", [](double x) { return std::trunc(x); });
+
+const auto Round = [](auto x) {
+    using T = decltype(x);
+    if constexpr (kIsComplex<T>) {
+        return T(std::nearbyint(x.real()), std::nearbyint(x.imag()));
+    } else if constexpr (std::is_floating_point_v<T>) {
+        return std::nearbyint(x);
+    } else {
+        return x;
+    }
+};
+
+const auto Sqrt = [](auto x) { return std::sqrt(x); };
+const auto Exp = [](auto x) { return std::exp(x); };
+const auto Exp2 = [](auto x) {
+    if constexpr (kIsComplex<decltype(x)>) {
+        return std::pow(host::Complex(2), x);
+    } else {
+        return std::exp2(x);
+    }
+};
+const auto Expm1 = [](auto x) {
+    if constexpr (kIsComplex<decltype(x)>) {
+        return std::exp(x) - 1.0;
+    } else {
+        return std::expm1(x);
+    }
+};
+const auto Log = [](auto x) { return std::log(x); };
+const auto Log10 = [](auto x) { return std::log10(x); };
+const auto Log1p = [](auto x) {
+    if constexpr (kIsComplex<decltype(x)>) {
+        return std::log(1.0 + x);
+    } else {
+        return std::log1p(x);
+    }
+};
+const auto Log2 = [](auto x) {
+    if constexpr (kIsComplex<decltype(x)>) {
+        return std::log(x) / std::log(2.0);
+    } else {
+        return std::log2(x);
+    }
+};
+const auto Reciprocal = [](auto x) {
+    using T = decltype(x);
+    if constexpr (std::is_same_v<T, int64_t>) {
+        return 1.0 / static_cast<double>(x);
+    } else {
+        return T(1) / x;
+    }
+};
+
+const auto Sin = [](auto x) { return std::sin(x); };
+const auto Cos = [](auto x) { return std::cos(x); };
+const auto Tan = [](auto x) { return std::tan(x); };
+const auto Asin = [](auto x) { return std::asin(x); };
+const auto Acos = [](auto x) { return std::acos(x); };
+const auto Atan = [](auto x) { return std::atan(x); };
+const auto Sinh = [](auto x) { return std::sinh(x); };
+const auto Cosh = [](auto x) { return std::cosh(x); };
+const auto Tanh = [](auto x) { return std::tanh(x); };
+const auto Asinh = [](auto x) { return std::asinh(x); };
+const auto Acosh = [](auto x) { return std::acosh(x); };
+const auto Atanh = [](auto x) { return std::atanh(x); };
+const auto Sinc = [](auto x) {
+    using T = decltype(x);
+    if constexpr (std::is_same_v<T, int64_t>) {
+        double y = kPi * static_cast<double>(x);
+        return y == 0 ? 1.0 : std::sin(y) / y;
+    } else {
+        T y = kPi * x;
+        return y == T(0) ? T(1) : std::sin(y) / y;
+    }
+};
+
+const auto Real = [](auto x) {
+    if constexpr (kIsComplex<decltype(x)>) {
+        return x.real();
+    } else {
+        return x;
+    }
+};
+
+/// Predicate on real numbers, applied to both parts of a complex number with any_of.
+template <typename Fn>
+auto Classify(Fn fn) {
+    return [fn](auto x) -> bool {
+        using T = decltype(x);
+        if constexpr (kIsComplex<T>) {
+            return fn(x.real()) || fn(x.imag());
+        } else if constexpr (std::is_floating_point_v<T>) {
+            return fn(x);
+        } else {
+            return fn(static_cast<double>(x));
+        }
+    };
+}
+
+const auto IsInf = Classify([](double x) { return std::isinf(x); });
+const auto IsPosInf = Classify([](double x) { return std::isinf(x) && x > 0; });
+const auto IsNegInf = Classify([](double x) { return std::isinf(x) && x < 0; });
+const auto IsFinite = [](auto x) -> bool {
+    if constexpr (kIsComplex<decltype(x)>) {
+        return std::isfinite(x.real()) && std::isfinite(x.imag());
+    } else {
+        return std::isfinite(static_cast<double>(x));
+    }
+};
+const auto Signbit = [](auto x) -> bool {
+    if constexpr (kIsComplex<decltype(x)>) {
+        return std::signbit(x.real());
+    } else {
+        return std::signbit(static_cast<double>(x));
+    }
+};
+const auto LogicalNot = [](auto x) -> bool { return x == decltype(x)(0); };
+
+}
+
+#define UNARY_OP(Op, least, fn)                                                                            \
+    aclnnStatus aclnn##Op##GetWorkspaceSize(const aclTensor* self, aclTensor* out, uint64_t* workspaceSize, \
+                                            aclOpExecutor** executor) {                                    \
+        return Elementwise(#Op, {Tensor(self)}, out, workspaceSize, executor, fn, least);                  \
+    }                                                                                                      \
+    HOST_RUNTIME_LAUNCH(Op)
+
+#define INPLACE_UNARY_OP(Op, least, fn)                                                                  \
+    aclnnStatus aclnnInplace##Op##GetWorkspaceSize(aclTensor* selfRef, uint64_t* workspaceSize,          \
+                                                   aclOpExecutor** executor) {                           \
+        return Elementwise("Inplace" #Op, {Tensor(selfRef)}, selfRef, workspaceSize, executor, fn, least); \
+    }                                                                                                    \
+    HOST_RUNTIME_LAUNCH(Inplace##Op)
+
+// predicates compute in the input's domain, whatever the output dtype
+#define PREDICATE_OP(Op, fn)                                                                               \
+    aclnnStatus aclnn##Op##GetWorkspaceSize(const aclTensor* self, aclTensor* out, uint64_t* workspaceSize, \
+                                            aclOpExecutor** executor) {                                    \
+        return Elementwise(#Op, {Tensor(self)}, out, workspaceSize, executor, fn, Domain::Int, false);     \
+    }                                                                                                      \
+    HOST_RUNTIME_LAUNCH(Op)
+
+UNARY_OP(Abs, Domain::Int, Abs)
+UNARY_OP(Neg, Domain::Int, Neg)
+UNARY_OP(Sign, Domain::Int, Sign)
+UNARY_OP(Ceil, Domain::Int, Ceil)
+UNARY_OP(Floor, Domain::Int, Floor)
+UNARY_OP(Trunc, Domain::Int, Trunc)
+UNARY_OP(Round, Domain::Int, Round)
+UNARY_OP(Real, Domain::Int, Real)
+UNARY_OP(Sqrt, Domain::Float, Sqrt)
+UNARY_OP(Exp, Domain::Float, Exp)
+UNARY_OP(Exp2, Domain::Float, Exp2)
+UNARY_OP(Expm1, Domain::Float, Expm1)
+UNARY_OP(Log, Domain::Float, Log)
+UNARY_OP(Log10, Domain::Float, Log10)
+UNARY_OP(Log1p, Domain::Float, Log1p)
+UNARY_OP(Log2, Domain::Float, Log2)
+UNARY_OP(Reciprocal, Domain::Float, Reciprocal)
+UNARY_OP(Sin, Domain::Float, Sin)
+UNARY_OP(Cos, Domain::Float, Cos)
+UNARY_OP(Tan, Domain::Float, Tan)
+UNARY_OP(Asin, Domain::Float, Asin)
+UNARY_OP(Acos, Domain::Float, Acos)
+UNARY_OP(Atan, Domain::Float, Atan)
+UNARY_OP(Sinh, Domain::Float, Sinh)
+UNARY_OP(Cosh, Domain::Float, Cosh)
+UNARY_OP(Tanh, Domain::Float, Tanh)
+UNARY_OP(Asinh, Domain::Float, Asinh)
+UNARY_OP(Acosh, Domain::Float, Acosh)
+UNARY_OP(Atanh, Domain::Float, Atanh)
+UNARY_OP(Sinc, Domain::Float, Sinc)
+
+INPLACE_UNARY_OP(Neg, Domain::Int, Neg)
+INPLACE_UNARY_OP(Floor, Domain::Int, Floor)
+INPLACE_UNARY_OP(Ceil, Domain::Int, Ceil)
+INPLACE_UNARY_OP(Trunc, Domain::Int, Trunc)
+INPLACE_UNARY_OP(Round, Domain::Int, Round)
+INPLACE_UNARY_OP(Sqrt, Domain::Float, Sqrt)
+INPLACE_UNARY_OP(Exp, Domain::Float, Exp)
+INPLACE_UNARY_OP(Exp2, Domain::Float, Exp2)
+INPLACE_UNARY_OP(Expm1, Domain::Float, Expm1)
+INPLACE_UNARY_OP(Log, Domain::Float, Log)
+INPLACE_UNARY_OP(Log10, Domain::Float, Log10)
+INPLACE_UNARY_OP(Log1p, Domain::Float, Log1p)
+INPLACE_UNARY_OP(Log2, Domain::Float, Log2)
+INPLACE_UNARY_OP(Reciprocal, Domain::Float, Reciprocal)
+INPLACE_UNARY_OP(Sin, Domain::Float, Sin)
+INPLACE_UNARY_OP(Cos, Domain::Float, Cos)
+INPLACE_UNARY_OP(Tan, Domain::Float, Tan)
+INPLACE_UNARY_OP(Asin, Domain::Float, Asin)
+INPLACE_UNARY_OP(Acos, Domain::Float, Acos)
+INPLACE_UNARY_OP(Atan, Domain::Float, Atan)
+INPLACE_UNARY_OP(Sinh, Domain::Float, Sinh)
+INPLACE_UNARY_OP(Cosh, Domain::Float, Cosh)
+INPLACE_UNARY_OP(Tanh, Domain::Float, Tanh)
+INPLACE_UNARY_OP(Asinh, Domain::Float, Asinh)
+INPLACE_UNARY_OP(Acosh, Domain::Float, Acosh)
+INPLACE_UNARY_OP(Atanh, Domain::Float, Atanh)
+
+PREDICATE_OP(IsInf, IsInf)
+PREDICATE_OP(IsPosInf, IsPosInf)
+PREDICATE_OP(IsNegInf, IsNegInf)
+PREDICATE_OP(IsFinite, IsFinite)
+PREDICATE_OP(Signbit, Signbit)
+PREDICATE_OP(LogicalNot, LogicalNot)
+
+aclnnStatus aclnnRoundDecimalsGetWorkspaceSize(const aclTensor* self, int64_t decimals, aclTensor* out,
+                                               uint64_t* workspaceSize, aclOpExecutor** executor) {
+    // like numpy.round: scale, round halves to even, scale back
+    const double scale = std::pow(10.0, static_cast<double>(decimals < 0 ? -decimals : decimals));
+    auto fn = [decimals, scale](auto x) {
+        using T = decltype(x);
+        if constexpr (std::is_same_v<T, int64_t>) {
+            return decimals >= 0 ? static_cast<double>(x) : std::nearbyint(x / scale) * scale;
+        } else if constexpr (kIsComplex<T>) {
+            host::NotForComplex("round");
+            return x;
+        } else {
+            return decimals >= 0 ? std::nearbyint(x * scale) / scale : std::nearbyint(x / scale) * scale;
+        }
+    };
+    return Elementwise("RoundDecimals", {Tensor(self)}, out, workspaceSize, executor, fn);
+}
+HOST_RUNTIME_LAUNCH(RoundDecimals)
+
+aclnnStatus aclnnNanToNumGetWorkspaceSize(const aclTensor* self, float nan, float posinf, float neginf,
+                                          aclTensor* out, uint64_t* workspaceSize, aclOpExecutor** executor) {
+    auto replace = [nan, posinf, neginf](double x) -> double {
+        if (std::isnan(x)) return nan;
+        if (std::isinf(x)) return x > 0 ? posinf : neginf;
+        return x;
+    };
+    auto fn = [replace](auto x) {
+        using T = decltype(x);
+        if constexpr (kIsComplex<T>) {
+            return T(replace(x.real()), replace(x.imag()));
+        } else if constexpr (std::is_floating_point_v<T>) {
+            return replace(x);
+        } else {
+            return x;
+        }
+    };
+    return Elementwise("NanToNum", {Tensor(self)}, out, workspaceSize, executor, fn);
+}
+HOST_RUNTIME_LAUNCH(NanToNum)
+
+aclnnStatus aclnnCastGetWorkspaceSize(const aclTensor* self, const aclDataType dtype, aclTensor* out,
+                                      uint64_t* workspaceSize, aclOpExecutor** executor) {
+    aclDataType outDtype = ACL_DT_UNDEFINED;
+    if (out != nullptr && (aclGetDataType(out, &outDtype) != ACLNN_SUCCESS || outDtype != dtype)) {
+        host::SetRecentError("Cast: dtype does not match the dtype of out");
+        return ACLNN_ERR_PARAM_INVALID;
+    }
+    return Elementwise("Cast", {Tensor(self)}, out, workspaceSize, executor, Identity);
+}
+HOST_RUNTIME_LAUNCH(Cast)
+
+aclnnStatus aclnnInplaceCopyGetWorkspaceSize(aclTensor* selfRef, const aclTensor* src, uint64_t* workspaceSize,
+                                             aclOpExecutor** executor) {
+    return Elementwise("InplaceCopy", {Tensor(src)}, selfRef, workspaceSize, executor, Identity);
+}
+HOST_RUNTIME_LAUNCH(InplaceCopy)
+
+aclnnStatus aclnnInplaceFillScalarGetWorkspaceSize(aclTensor* selfRef, const aclScalar* value,
+                                                   uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("InplaceFillScalar", {host::Scalar(value)}, selfRef, workspaceSize, executor, Identity);
+}
+HOST_RUNTIME_LAUNCH(InplaceFillScalar)
+
+aclnnStatus aclnnInplaceOneGetWorkspaceSize(aclTensor* selfRef, uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("InplaceOne", {}, selfRef, workspaceSize, executor, [] { return int64_t(1); });
+}
+HOST_RUNTIME_LAUNCH(InplaceOne)
+
+aclnnStatus aclnnInplaceZeroGetWorkspaceSize(aclTensor* selfRef, uint64_t* workspaceSize, aclOpExecutor** executor) {
+    return Elementwise("InplaceZero", {}, selfRef, workspaceSize, executor, [] { return int64_t(0); });
+}
+HOST_RUNTIME_LAUNCH(InplaceZero)
@@ -17,6 +17,9 @@
 
 #include <asnumpy/linalg/decompositions.hpp>
 #include <asnumpy/utils/status_handler.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/profiler.hpp>
 
 #include <acl/acl.h>
 #include <aclnn/aclnn_base.h>
@@ -49,17 +52,15 @@ std::vector<NPUArray> Linalg_Qr(const NPUArray& a, const std::string& mode) {
     auto resultR = NPUArray(shapeR, a.aclDtype);
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor;
-    auto error = aclnnLinalgQrGetWorkspaceSize(a.tensorPtr, num, resultQ.tensorPtr, resultR.tensorPtr, &workspaceSize, &executor);
+    auto error = asnumpy::npu::profiler::Plan("LinalgQr", aclnnLinalgQrGetWorkspaceSize, a.tensorPtr, num, resultQ.tensorPtr, resultR.tensorPtr, &workspaceSize, &executor);
     CheckGetWorkspaceSizeAclnnStatus(error);
     void* workspaceAddr = nullptr;
     if(workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         CheckMallocAclnnStatus(error);
     }
-    error = aclnnLinalgQr(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnLinalgQr, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     CheckAclnnStatus(error, "aclnnLinalgQr error");
-    error = aclrtSynchronizeDevice();
-    CheckSynchronizeDeviceAclnnStatus(error);
     std::vector<NPUArray> result;
     result.push_back(resultQ);
     result.push_back(resultR);
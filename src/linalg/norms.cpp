@@ -17,6 +17,9 @@
 
 #include <asnumpy/linalg/norms.hpp>
 #include <asnumpy/utils/status_handler.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/profiler.hpp>
 
 #include <acl/acl.h>
 #include <aclnn/aclnn_base.h>
@@ -46,17 +49,15 @@ NPUArray Linalg_Norm(const NPUArray& a, double ord, const std::vector<int64_t>&
     auto result = NPUArray(shape, ACL_FLOAT);
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor;
-    auto error = aclnnNormGetWorkspaceSize(a.tensorPtr, ord_scalar, axis_array, keepdims, result.tensorPtr, &workspaceSize, &executor);
+    auto error = asnumpy::npu::profiler::Plan("Norm", aclnnNormGetWorkspaceSize, a.tensorPtr, ord_scalar, axis_array, keepdims, result.tensorPtr, &workspaceSize, &executor);
     CheckGetWorkspaceSizeAclnnStatus(error);
     void* workspaceAddr = nullptr;
     if(workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         CheckMallocAclnnStatus(error);
     }
-    error = aclnnNorm(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnNorm, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     CheckAclnnStatus(error, "aclnnNorm error");
-    error = aclrtSynchronizeDevice();
-    CheckSynchronizeDeviceAclnnStatus(error);
     return result;
 }
 
@@ -66,31 +67,27 @@ NPUArray Linalg_Det(const NPUArray& a) {
     auto result = NPUArray(shape, ACL_DOUBLE);
     uint64_t workspaceSize1 = 0;
     aclOpExecutor* executor1;
-    auto error1 = aclnnLogdetGetWorkspaceSize(a.tensorPtr, temp.tensorPtr, &workspaceSize1, &executor1);
+    auto error1 = asnumpy::npu::profiler::Plan("Logdet", aclnnLogdetGetWorkspaceSize, a.tensorPtr, temp.tensorPtr, &workspaceSize1, &executor1);
     CheckGetWorkspaceSizeAclnnStatus(error1);
     void* workspaceAddr1 = nullptr;
     if(workspaceSize1 > 0) {
-        error1 = aclrtMalloc(&workspaceAddr1, workspaceSize1, ACL_MEM_MALLOC_HUGE_FIRST);
+        error1 = asnumpy::npu::GetWorkspace(&workspaceAddr1, workspaceSize1);
         CheckMallocAclnnStatus(error1);
     }
-    error1 = aclnnLogdet(workspaceAddr1, workspaceSize1, executor1, nullptr);
+    error1 = asnumpy::npu::profiler::Launch(aclnnLogdet, workspaceAddr1, workspaceSize1, executor1, asnumpy::npu::GetCurrentStream());
     CheckAclnnStatus(error1, "aclnnLogdet error");
-    error1 = aclrtSynchronizeDevice();
-    CheckSynchronizeDeviceAclnnStatus(error1);
     
     uint64_t workspaceSize2 = 0;
     aclOpExecutor* executor2;
-    auto error2 = aclnnExpGetWorkspaceSize(temp.tensorPtr, result.tensorPtr, &workspaceSize2, &executor2);
+    auto error2 = asnumpy::npu::profiler::Plan("Exp", aclnnExpGetWorkspaceSize, temp.tensorPtr, result.tensorPtr, &workspaceSize2, &executor2);
     CheckGetWorkspaceSizeAclnnStatus(error2);
     void* workspaceAddr2 = nullptr;
     if(workspaceSize2 > 0) {
-        error2 = aclrtMalloc(&workspaceAddr2, workspaceSize2, ACL_MEM_MALLOC_HUGE_FIRST);
+        error2 = asnumpy::npu::GetWorkspace(&workspaceAddr2, workspaceSize2);
         CheckMallocAclnnStatus(error2);
     }
-    error2 = aclnnExp(workspaceAddr2, workspaceSize2, executor2, nullptr);
+    error2 = asnumpy::npu::profiler::Launch(aclnnExp, workspaceAddr2, workspaceSize2, executor2, asnumpy::npu::GetCurrentStream());
     CheckAclnnStatus(error2, "aclnnExp error");
-    error2 = aclrtSynchronizeDevice();
-    CheckSynchronizeDeviceAclnnStatus(error2);
     return result;
 }
 
@@ -100,17 +97,15 @@ std::vector<NPUArray> Linalg_Slogdet(const NPUArray& a) {
     auto logout = NPUArray(shape, ACL_DOUBLE);
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor;
-    auto error = aclnnSlogdetGetWorkspaceSize(a.tensorPtr, signout.tensorPtr, logout.tensorPtr, &workspaceSize, &executor);
+    auto error = asnumpy::npu::profiler::Plan("Slogdet", aclnnSlogdetGetWorkspaceSize, a.tensorPtr, signout.tensorPtr, logout.tensorPtr, &workspaceSize, &executor);
     CheckGetWorkspaceSizeAclnnStatus(error);
     void* workspaceAddr = nullptr;
     if(workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         CheckMallocAclnnStatus(error);
     }
-    error = aclnnSlogdet(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnSlogdet, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     CheckAclnnStatus(error, "aclnnSlogdet error");
-    error = aclrtSynchronizeDevice();
-    CheckSynchronizeDeviceAclnnStatus(error);
     std::vector<NPUArray> result;
     result.push_back(signout);
     result.push_back(logout);
@@ -19,142 +19,241 @@
 #include <aclnn/aclnn_base.h>
 #include <asnumpy/linalg/product.hpp>
 #include <asnumpy/utils/npu_array.hpp>
+#include <asnumpy/utils/type_promotion.hpp>
 #include <asnumpy/utils/status_handler.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/profiler.hpp>
 #include <fmt/base.h>
 #include <fmt/format.h>
+#include <optional>
 #include <stdexcept>
+#include <utility>
+#include "aclnnop/aclnn_copy.h"
 #include "aclnnop/aclnn_dot.h"
 #include "aclnnop/aclnn_flatten.h"
 #include "aclnnop/aclnn_mm.h"
 #include "aclnnop/aclnn_mul.h"
 
-NPUArray Matmul(const NPUArray& x1, const NPUArray& x2) {
-	// 考虑到[1x2][1x2]点积形式不能直接用广播 赫赫
-	auto broadcast = GetBroadcastShape(x1, x2);
-	// throw std::runtime_error(fmt::format("{}",broadcast));
-	auto result = NPUArray(broadcast, ACL_FLOAT);
-	int8_t use_fp16 = 2;
+NPUArray Einsum(const char* subscripts, const std::vector<NPUArray>& operands) {
+	// aclnnEinsum目前只支持'abcd,abced->abce'，'a,b->ab'(outer)操作，所以就当一共两个操作数来实现:)
+	std::vector<aclTensor*> tmp{operands[0].tensorPtr, operands[1].tensorPtr};
+	auto input = aclCreateTensorList(tmp.data(), tmp.size());
+	// TODO: reshape广播
+	auto broadcast = GetBroadcastShape(operands[0], operands[1]);
+	auto result = NPUArray(broadcast, operands[0].dtype);
 	uint64_t workspaceSize = 0;
 	aclOpExecutor* executor;
-	auto error =
-		aclnnMatmulGetWorkspaceSize(x1.tensorPtr, x2.tensorPtr, result.tensorPtr, use_fp16, &workspaceSize, &executor);
+	auto error = asnumpy::npu::profiler::Plan("Einsum", aclnnEinsumGetWorkspaceSize, input, subscripts, result.tensorPtr, &workspaceSize, &executor);
 	CheckGetWorkspaceSizeAclnnStatus(error);
 	void* workspaceAddr = nullptr;
 	if (workspaceSize > 0) {
-		error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+		error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
 		CheckMallocAclnnStatus(error);
 	}
-	error = aclnnMatmul(workspaceAddr, workspaceSize, executor, nullptr);
-	CheckAclnnStatus(error, "aclnnMatmul error");
-	error = aclrtSynchronizeDevice();
-	CheckSynchronizeDeviceAclnnStatus(error);
+	error = asnumpy::npu::profiler::Launch(aclnnEinsum, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
+	CheckAclnnStatus(error, "aclnnEinsum error");
 	return result;
 }
 
-NPUArray Einsum(const char* subscripts, const std::vector<NPUArray>& operands) {
-	// aclnnEinsum目前只支持'abcd,abced->abce'，'a,b->ab'(outer)操作，所以就当一共两个操作数来实现:)
-	std::vector<aclTensor*> tmp{operands[0].tensorPtr, operands[1].tensorPtr};
-	auto input = aclCreateTensorList(tmp.data(), tmp.size());
-	// TODO: reshape广播
-	auto broadcast = GetBroadcastShape(operands[0], operands[1]);
-	auto result = NPUArray(broadcast, operands[0].dtype);
+namespace {
+
+/**
+ * @brief out = x1 @ x2 into a preallocated result, keeping the input dtype.
+ */
+void MatmulInto(const NPUArray& x1, const NPUArray& x2, NPUArray& out) {
+	int8_t cubeMathType = 0; // KEEP_DTYPE
 	uint64_t workspaceSize = 0;
 	aclOpExecutor* executor;
-	auto error = aclnnEinsumGetWorkspaceSize(input, subscripts, result.tensorPtr, &workspaceSize, &executor);
+	auto error = asnumpy::npu::profiler::Plan("Matmul", aclnnMatmulGetWorkspaceSize, x1.tensorPtr, x2.tensorPtr, out.tensorPtr, cubeMathType, &workspaceSize,
+											 &executor);
 	CheckGetWorkspaceSizeAclnnStatus(error);
 	void* workspaceAddr = nullptr;
 	if (workspaceSize > 0) {
-		error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+		error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
 		CheckMallocAclnnStatus(error);
 	}
-	error = aclnnEinsum(workspaceAddr, workspaceSize, executor, nullptr);
-	CheckAclnnStatus(error, "aclnnEinsum error");
-	error = aclrtSynchronizeDevice();
-	CheckSynchronizeDeviceAclnnStatus(error);
+	error = asnumpy::npu::profiler::Launch(aclnnMatmul, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
+	CheckAclnnStatus(error, "aclnnMatmul error");
+}
+
+/**
+ * @brief Shape of x1 @ x2 under NumPy matmul rules.
+ *
+ * 1-D operands are treated as a row (x1) or column (x2) vector and their
+ * added axis dropped again; leading batch dimensions broadcast.
+ */
+std::vector<int64_t> MatmulShape(const NPUArray& x1, const NPUArray& x2) {
+	const auto& a = x1.shape;
+	const auto& b = x2.shape;
+	if (a.empty() || b.empty()) {
+		throw std::invalid_argument("matmul: input operands must have at least one dimension");
+	}
+	int64_t k = a.back();
+	int64_t kb = b.size() == 1 ? b[0] : b[b.size() - 2];
+	if (k != kb) {
+		throw std::invalid_argument(fmt::format("matmul: contraction dimensions differ ({} vs {})", k, kb));
+	}
+	std::vector<int64_t> batchA(a.begin(), a.end() - std::min<size_t>(a.size(), 2));
+	std::vector<int64_t> batchB(b.begin(), b.end() - std::min<size_t>(b.size(), 2));
+	size_t ndim = std::max(batchA.size(), batchB.size());
+	std::vector<int64_t> shape(ndim);
+	for (size_t i = 0; i < ndim; i++) {
+		int64_t da = i < ndim - batchA.size() ? 1 : batchA[i - (ndim - batchA.size())];
+		int64_t db = i < ndim - batchB.size() ? 1 : batchB[i - (ndim - batchB.size())];
+		if (da != db && da != 1 && db != 1) {
+			throw std::invalid_argument("matmul: batch dimensions are not broadcastable");
+		}
+		shape[i] = da == 1 ? db : da;
+	}
+	if (a.size() > 1) {
+		shape.push_back(a[a.size() - 2]);
+	}
+	if (b.size() > 1) {
+		shape.push_back(b.back());
+	}
+	return shape;
+}
+
+/**
+ * @brief Fill a (..., M, M) array with identity matrices.
+ */
+void FillIdentity(NPUArray& out) {
+	int64_t m = out.shape.back();
+	NPUArray eye = out.shape.size() == 2 ? std::move(*out.View()) : NPUArray({m, m}, out.aclDtype);
+	uint64_t workspaceSize = 0;
+	aclOpExecutor* executor;
+	auto error = asnumpy::npu::profiler::Plan("Eye", aclnnEyeGetWorkspaceSize, m, m, eye.tensorPtr, &workspaceSize, &executor);
+	CheckGetWorkspaceSizeAclnnStatus(error);
+	void* workspaceAddr = nullptr;
+	if (workspaceSize > 0) {
+		error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
+		CheckMallocAclnnStatus(error);
+	}
+	error = asnumpy::npu::profiler::Launch(aclnnEye, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
+	CheckAclnnStatus(error, "aclnnEye error");
+	if (out.shape.size() == 2) {
+		return;
+	}
+	// 堆叠输入：把单个单位阵广播复制到每个批次
+	workspaceSize = 0;
+	error = asnumpy::npu::profiler::Plan("InplaceCopy", aclnnInplaceCopyGetWorkspaceSize, out.tensorPtr, eye.tensorPtr, &workspaceSize, &executor);
+	CheckGetWorkspaceSizeAclnnStatus(error);
+	workspaceAddr = nullptr;
+	if (workspaceSize > 0) {
+		error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
+		CheckMallocAclnnStatus(error);
+	}
+	error = asnumpy::npu::profiler::Launch(aclnnInplaceCopy, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
+	CheckAclnnStatus(error, "aclnnInplaceCopy error");
+}
+
+}
+
+/**
+ * @brief Matrix product of two arrays, following numpy.matmul.
+ *
+ * Operands of different dtypes are cast to their promoted type on the device;
+ * the product keeps that dtype.
+ *
+ * @param x1 First operand, at least 1-D.
+ * @param x2 Second operand, at least 1-D.
+ * @return NPUArray x1 @ x2.
+ * @throws std::invalid_argument If the shapes do not match for a matrix product.
+ */
+NPUArray Matmul(const NPUArray& x1, const NPUArray& x2) {
+	auto shape = MatmulShape(x1, x2);
+	aclDataType dtype = asnumpy::PromoteTypes(x1.aclDtype, x2.aclDtype);
+	auto result = NPUArray(shape, dtype);
+	if (result.tensorSize == 0) {
+		return result;
+	}
+	// 类型不同时先在设备上转换为提升后的类型
+	std::optional<NPUArray> cast1, cast2;
+	if (x1.aclDtype != dtype) cast1.emplace(x1.AsType(dtype));
+	if (x2.aclDtype != dtype) cast2.emplace(x2.AsType(dtype));
+	MatmulInto(cast1 ? *cast1 : x1, cast2 ? *cast2 : x2, result);
 	return result;
 }
 
+/**
+ * @brief Raise a square matrix, or a stack of them, to the integer power n.
+ *
+ * Uses exponentiation by squaring, so A^n takes about 2*log2(n) matmuls.
+ * Products are written into a spare buffer that is swapped with the operand,
+ * which keeps at most three (..., M, M) buffers alive. Negative powers invert
+ * the input once and then proceed as for |n|.
+ *
+ * @param a Array of shape (..., M, M).
+ * @param n Exponent.
+ * @return NPUArray a raised to n, same shape and dtype as a.
+ * @throws std::invalid_argument If the last two dimensions are not square.
+ */
 NPUArray Matrix_power(const NPUArray& a, int64_t n) {
 	auto shape = a.shape;
-	auto temp = NPUArray(shape, a.aclDtype);
-	auto result = NPUArray(shape, a.aclDtype);
-	int absn = 0;
+	if (shape.size() < 2 || shape[shape.size() - 1] != shape[shape.size() - 2]) {
+		throw std::invalid_argument("matrix_power: last 2 dimensions of the array must be square");
+	}
 	if (n == 0) {
+		auto result = NPUArray(shape, a.aclDtype);
+		FillIdentity(result);
+		return result;
+	}
+
+	// base 起始时与 a 共享存储（只读），负指数时为 a 的逆
+	NPUArray base = std::move(*a.View());
+	if (n < 0) {
+		base = NPUArray(shape, a.aclDtype);
 		uint64_t workspaceSize = 0;
 		aclOpExecutor* executor;
-		auto error = aclnnEyeGetWorkspaceSize(shape[0], shape[1], result.tensorPtr, &workspaceSize, &executor);
+		auto error = asnumpy::npu::profiler::Plan("Inverse", aclnnInverseGetWorkspaceSize, a.tensorPtr, base.tensorPtr, &workspaceSize, &executor);
 		CheckGetWorkspaceSizeAclnnStatus(error);
 		void* workspaceAddr = nullptr;
 		if (workspaceSize > 0) {
-			error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+			error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
 			CheckMallocAclnnStatus(error);
 		}
-		error = aclnnEye(workspaceAddr, workspaceSize, executor, nullptr);
-		CheckAclnnStatus(error, "aclnnEye error");
-		error = aclrtSynchronizeDevice();
-		CheckSynchronizeDeviceAclnnStatus(error);
-		return result;
+		error = asnumpy::npu::profiler::Launch(aclnnInverse, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
+		CheckAclnnStatus(error, "aclnnInverse error");
 	}
-
-	else if (n < 0) {
-		absn = -n;
-		uint64_t workspaceSize1 = 0;
-		aclOpExecutor* executor1;
-		auto error1 = aclnnInverseGetWorkspaceSize(a.tensorPtr, temp.tensorPtr, &workspaceSize1, &executor1);
-		CheckGetWorkspaceSizeAclnnStatus(error1);
-		void* workspaceAddr1 = nullptr;
-		if (workspaceSize1 > 0) {
-			error1 = aclrtMalloc(&workspaceAddr1, workspaceSize1, ACL_MEM_MALLOC_HUGE_FIRST);
-			CheckMallocAclnnStatus(error1);
+	uint64_t p = n < 0 ? 0 - static_cast<uint64_t>(n) : static_cast<uint64_t>(n);
+
+	std::optional<NPUArray> result;
+	std::optional<NPUArray> spare;
+	// x = x @ y via the spare buffer. A buffer still shared with a, base or
+	// result must not be written, so such a spare is dropped after the swap.
+	auto multiply = [&](NPUArray& x, const NPUArray& y) {
+		if (!spare.has_value()) {
+			spare.emplace(shape, a.aclDtype);
 		}
-		error1 = aclnnInverse(workspaceAddr1, workspaceSize1, executor1, nullptr);
-		CheckAclnnStatus(error1, "aclnnInverse error");
-		error1 = aclrtSynchronizeDevice();
-		CheckSynchronizeDeviceAclnnStatus(error1);
-	}
-	else {
-		absn = n;
-		temp = NPUArray(a);
-	}
-
-	for (int i = 0; i < absn - 1; i++) {
-		auto x = NPUArray(shape, a.aclDtype);
-		int8_t use_fp16 = 2;
-		uint64_t workspaceSize2 = 0;
-		aclOpExecutor* executor2;
-		auto error2 = aclnnMatmulGetWorkspaceSize(temp.tensorPtr, a.tensorPtr, x.tensorPtr, use_fp16, &workspaceSize2,
-												  &executor2);
-		CheckGetWorkspaceSizeAclnnStatus(error2);
-		void* workspaceAddr2 = nullptr;
-		if (workspaceSize2 > 0) {
-			error2 = aclrtMalloc(&workspaceAddr2, workspaceSize2, ACL_MEM_MALLOC_HUGE_FIRST);
-			CheckMallocAclnnStatus(error2);
+		MatmulInto(x, y, *spare);
+		std::swap(x, *spare);
+		void* freed = spare->device_address();
+		if (freed == a.device_address() || freed == base.device_address() ||
+			(result.has_value() && freed == result->device_address())) {
+			spare.reset();
 		}
-		error2 = aclnnMatmul(workspaceAddr2, workspaceSize2, executor2, nullptr);
-		CheckAclnnStatus(error2, "aclnnMatmul error");
-		error2 = aclrtSynchronizeDevice();
-		CheckSynchronizeDeviceAclnnStatus(error2);
-		aclTensor* swap = temp.tensorPtr;
-		temp.tensorPtr = x.tensorPtr;
-		x.tensorPtr = swap;
+	};
+
+	while (true) {
+		if (p & 1) {
+			if (result.has_value()) {
+				multiply(*result, base);
+			} else {
+				result.emplace(std::move(*base.View()));
+			}
+		}
+		p >>= 1;
+		if (p == 0) {
+			break;
+		}
+		multiply(base, base);
 	}
 
-	int8_t use_fp16 = 2;
-	uint64_t workspaceSize2 = 0;
-	aclOpExecutor* executor2;
-	auto error2 = aclnnMatmulGetWorkspaceSize(temp.tensorPtr, a.tensorPtr, result.tensorPtr, use_fp16, &workspaceSize2,
-											  &executor2);
-	CheckGetWorkspaceSizeAclnnStatus(error2);
-	void* workspaceAddr2 = nullptr;
-	if (workspaceSize2 > 0) {
-		error2 = aclrtMalloc(&workspaceAddr2, workspaceSize2, ACL_MEM_MALLOC_HUGE_FIRST);
-		CheckMallocAclnnStatus(error2);
+	if (result->device_address() == a.device_address()) {
+		return NPUArray(a);
 	}
-	error2 = aclnnMatmul(workspaceAddr2, workspaceSize2, executor2, nullptr);
-	CheckAclnnStatus(error2, "aclnnMatmul error");
-	error2 = aclrtSynchronizeDevice();
-	CheckSynchronizeDeviceAclnnStatus(error2);
-	return result;
+	return std::move(*result);
 }
 
 /**
@@ -166,27 +265,21 @@ NPUArray dot(const NPUArray& a, const NPUArray& b) {
 		auto out = NPUArray({}, a.dtype);
 		uint64_t workspaceSize = 0;
 		aclOpExecutor* executor = nullptr;
-		auto error = aclnnDotGetWorkspaceSize(a.tensorPtr, b.tensorPtr, out.tensorPtr, &workspaceSize, &executor);
+		auto error = asnumpy::npu::profiler::Plan("Dot", aclnnDotGetWorkspaceSize, a.tensorPtr, b.tensorPtr, out.tensorPtr, &workspaceSize, &executor);
 		if (error != ACL_SUCCESS)
 			throw std::runtime_error("[product.cpp](dot) aclnnDotGetWorkspaceSize failed");
 
 		void* workspaceAddr = nullptr;
 		if (workspaceSize > 0) {
-			error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+			error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
 			if (error != ACL_SUCCESS)
 				throw std::runtime_error("[product.cpp](dot) aclrtMalloc failed");
 		}
 
-		error = aclnnDot(workspaceAddr, workspaceSize, executor, nullptr);
-		if (workspaceAddr)
-			aclrtFree(workspaceAddr);
+		error = asnumpy::npu::profiler::Launch(aclnnDot, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
 		if (error != ACL_SUCCESS)
 			throw std::runtime_error("[product.cpp](dot) aclnnDot failed");
 
-		error = aclrtSynchronizeDevice();
-		if (error != ACL_SUCCESS)
-			throw std::runtime_error("[product.cpp](dot) aclrtSynchronizeDevice failed");
-
 		return out;
 	}
 
@@ -195,27 +288,21 @@ NPUArray dot(const NPUArray& a, const NPUArray& b) {
 		auto out = NPUArray({}, a.dtype);
 		uint64_t workspaceSize = 0;
 		aclOpExecutor* executor = nullptr;
-		auto error = aclnnDotGetWorkspaceSize(a.tensorPtr, b.tensorPtr, out.tensorPtr, &workspaceSize, &executor);
+		auto error = asnumpy::npu::profiler::Plan("Dot", aclnnDotGetWorkspaceSize, a.tensorPtr, b.tensorPtr, out.tensorPtr, &workspaceSize, &executor);
 		if (error != ACL_SUCCESS)
 			throw std::runtime_error("[product.cpp](dot) aclnnDotGetWorkspaceSize failed");
 
 		void* workspaceAddr = nullptr;
 		if (workspaceSize > 0) {
-			error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+			error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
 			if (error != ACL_SUCCESS)
 				throw std::runtime_error("[product.cpp](dot) aclrtMalloc failed");
 		}
 
-		error = aclnnDot(workspaceAddr, workspaceSize, executor, nullptr);
-		if (workspaceAddr)
-			aclrtFree(workspaceAddr);
+		error = asnumpy::npu::profiler::Launch(aclnnDot, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
 		if (error != ACL_SUCCESS)
 			throw std::runtime_error("[product.cpp](dot) aclnnDot failed");
 
-		error = aclrtSynchronizeDevice();
-		if (error != ACL_SUCCESS)
-			throw std::runtime_error("[product.cpp](dot) aclrtSynchronizeDevice failed");
-
 		return out;
 	}
 
@@ -228,28 +315,22 @@ NPUArray dot(const NPUArray& a, const NPUArray& b) {
 		aclOpExecutor* executor = nullptr;
 		int8_t cubeMathType = 0; // KEEP_DTYPE
 		auto error =
-			aclnnMmGetWorkspaceSize(a.tensorPtr, b.tensorPtr, out.tensorPtr, cubeMathType, &workspaceSize, &executor);
+			asnumpy::npu::profiler::Plan("Mm", aclnnMmGetWorkspaceSize, a.tensorPtr, b.tensorPtr, out.tensorPtr, cubeMathType, &workspaceSize, &executor);
 
 		if (error != ACL_SUCCESS)
 			throw std::runtime_error("[product.cpp](dot) aclnnMmGetWorkspaceSize failed");
 
 		void* workspaceAddr = nullptr;
 		if (workspaceSize > 0) {
-			error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+			error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
 			if (error != ACL_SUCCESS)
 				throw std::runtime_error("[product.cpp](dot) aclrtMalloc failed");
 		}
 
-		error = aclnnMm(workspaceAddr, workspaceSize, executor, nullptr);
-		if (workspaceAddr)
-			aclrtFree(workspaceAddr);
+		error = asnumpy::npu::profiler::Launch(aclnnMm, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
 		if (error != ACL_SUCCESS)
 			throw std::runtime_error("[product.cpp](dot) aclnnMm failed");
 
-		error = aclrtSynchronizeDevice();
-		if (error != ACL_SUCCESS)
-			throw std::runtime_error("[product.cpp](dot) aclrtSynchronizeDevice failed");
-
 		return out;
 	}
 
@@ -277,24 +358,20 @@ NPUArray vdot(const NPUArray& a, const NPUArray& b) {
 	{
 		uint64_t workspaceSize = 0;
 		aclOpExecutor* executor = nullptr;
-		ret = aclnnFlattenGetWorkspaceSize(a.tensorPtr, 0, a_flat.tensorPtr, &workspaceSize, &executor);
+		ret = asnumpy::npu::profiler::Plan("Flatten", aclnnFlattenGetWorkspaceSize, a.tensorPtr, 0, a_flat.tensorPtr, &workspaceSize, &executor);
 		if (ret != ACL_SUCCESS) {
 			throw std::runtime_error("[vdot] aclnnFlattenGetWorkspaceSize for 'a' failed.");
 		}
 
 		void* workspace_addr = nullptr;
 		if (workspaceSize > 0) {
-			ret = aclrtMalloc(&workspace_addr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+			ret = asnumpy::npu::GetWorkspace(&workspace_addr, workspaceSize);
 			if (ret != ACL_SUCCESS) {
 				throw std::runtime_error("[vdot] aclrtMalloc for 'a' flatten workspace failed.");
 			}
 		}
 
-		// Pass nullptr for the stream, as in the dot function
-		ret = aclnnFlatten(workspace_addr, workspaceSize, executor, nullptr);
-		if (workspace_addr) {
-			aclrtFree(workspace_addr);
-		}
+		ret = asnumpy::npu::profiler::Launch(aclnnFlatten, workspace_addr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
 		if (ret != ACL_SUCCESS) {
 			throw std::runtime_error("[vdot] aclnnFlatten for 'a' failed.");
 		}
@@ -304,24 +381,20 @@ NPUArray vdot(const NPUArray& a, const NPUArray& b) {
 	{
 		uint64_t workspaceSize = 0;
 		aclOpExecutor* executor = nullptr;
-		ret = aclnnFlattenGetWorkspaceSize(b.tensorPtr, 0, b_flat.tensorPtr, &workspaceSize, &executor);
+		ret = asnumpy::npu::profiler::Plan("Flatten", aclnnFlattenGetWorkspaceSize, b.tensorPtr, 0, b_flat.tensorPtr, &workspaceSize, &executor);
 		if (ret != ACL_SUCCESS) {
 			throw std::runtime_error("[vdot] aclnnFlattenGetWorkspaceSize for 'b' failed.");
 		}
 
 		void* workspace_addr = nullptr;
 		if (workspaceSize > 0) {
-			ret = aclrtMalloc(&workspace_addr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+			ret = asnumpy::npu::GetWorkspace(&workspace_addr, workspaceSize);
 			if (ret != ACL_SUCCESS) {
 				throw std::runtime_error("[vdot] aclrtMalloc for 'b' flatten workspace failed.");
 			}
 		}
 
-		// Pass nullptr for the stream
-		ret = aclnnFlatten(workspace_addr, workspaceSize, executor, nullptr);
-		if (workspace_addr) {
-			aclrtFree(workspace_addr);
-		}
+		ret = asnumpy::npu::profiler::Launch(aclnnFlatten, workspace_addr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
 		if (ret != ACL_SUCCESS) {
 			throw std::runtime_error("[vdot] aclnnFlatten for 'b' failed.");
 		}
@@ -356,7 +429,7 @@ NPUArray vdot(const NPUArray& a, const NPUArray& b) {
 	{
 		uint64_t workspaceSize = 0;
 		aclOpExecutor* executor = nullptr;
-		ret = aclnnDotGetWorkspaceSize(a_1d_view, b_1d_view, out.tensorPtr, &workspaceSize, &executor);
+		ret = asnumpy::npu::profiler::Plan("Dot", aclnnDotGetWorkspaceSize, a_1d_view, b_1d_view, out.tensorPtr, &workspaceSize, &executor);
 		if (ret != ACL_SUCCESS) {
 			aclDestroyTensor(a_1d_view);
 			aclDestroyTensor(b_1d_view);
@@ -365,7 +438,7 @@ NPUArray vdot(const NPUArray& a, const NPUArray& b) {
 
 		void* workspace_addr = nullptr;
 		if (workspaceSize > 0) {
-			ret = aclrtMalloc(&workspace_addr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+			ret = asnumpy::npu::GetWorkspace(&workspace_addr, workspaceSize);
 			if (ret != ACL_SUCCESS) {
 				aclDestroyTensor(a_1d_view);
 				aclDestroyTensor(b_1d_view);
@@ -373,11 +446,7 @@ NPUArray vdot(const NPUArray& a, const NPUArray& b) {
 			}
 		}
 
-		// Pass nullptr for the stream
-		ret = aclnnDot(workspace_addr, workspaceSize, executor, nullptr);
-		if (workspace_addr) {
-			aclrtFree(workspace_addr);
-		}
+		ret = asnumpy::npu::profiler::Launch(aclnnDot, workspace_addr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
 		if (ret != ACL_SUCCESS) {
 			aclDestroyTensor(a_1d_view);
 			aclDestroyTensor(b_1d_view);
@@ -389,13 +458,6 @@ NPUArray vdot(const NPUArray& a, const NPUArray& b) {
 	aclDestroyTensor(a_1d_view);
 	aclDestroyTensor(b_1d_view);
 
-	// Synchronize the device to wait for computation to complete, as in the dot function
-	ret = aclrtSynchronizeDevice();
-	const char* error_msg = aclGetRecentErrMsg();
-	if (ret != ACL_SUCCESS) {
-		throw std::runtime_error("[vdot] aclrtSynchronizeDevice failed");
-	}
-
 	return out;
 }
 
@@ -410,7 +472,7 @@ NPUArray inner(const NPUArray& a, const NPUArray& b) {
 
 		uint64_t workspaceSize = 0;
 		aclOpExecutor* executor = nullptr;
-		auto error = aclnnDotGetWorkspaceSize(a.tensorPtr, b.tensorPtr, out.tensorPtr, &workspaceSize, &executor);
+		auto error = asnumpy::npu::profiler::Plan("Dot", aclnnDotGetWorkspaceSize, a.tensorPtr, b.tensorPtr, out.tensorPtr, &workspaceSize, &executor);
 		if (error != ACL_SUCCESS) {
 			throw std::runtime_error("[product.cpp](inner) aclnnDotGetWorkspaceSize failed, error = " +
 									 std::to_string(error));
@@ -418,25 +480,17 @@ NPUArray inner(const NPUArray& a, const NPUArray& b) {
 
 		void* workspaceAddr = nullptr;
 		if (workspaceSize > 0) {
-			error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+			error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
 			if (error != ACL_SUCCESS) {
 				throw std::runtime_error("[product.cpp](inner) aclrtMalloc failed, error = " + std::to_string(error));
 			}
 		}
 
-		error = aclnnDot(workspaceAddr, workspaceSize, executor, nullptr);
-		if (workspaceAddr)
-			aclrtFree(workspaceAddr);
+		error = asnumpy::npu::profiler::Launch(aclnnDot, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
 		if (error != ACL_SUCCESS) {
 			throw std::runtime_error("[product.cpp](inner) aclnnDot failed, error = " + std::to_string(error));
 		}
 
-		error = aclrtSynchronizeDevice();
-		if (error != ACL_SUCCESS) {
-			throw std::runtime_error("[product.cpp](inner) aclrtSynchronizeDevice failed, error = " +
-									 std::to_string(error));
-		}
-
 		return out;
 	}
 
@@ -449,7 +503,7 @@ NPUArray inner(const NPUArray& a, const NPUArray& b) {
 		aclOpExecutor* executor = nullptr;
 		int8_t cubeMathType = 0; // KEEP_DTYPE
 		auto error =
-			aclnnMmGetWorkspaceSize(a.tensorPtr, b.tensorPtr, out.tensorPtr, cubeMathType, &workspaceSize, &executor);
+			asnumpy::npu::profiler::Plan("Mm", aclnnMmGetWorkspaceSize, a.tensorPtr, b.tensorPtr, out.tensorPtr, cubeMathType, &workspaceSize, &executor);
 		if (error != ACL_SUCCESS) {
 			throw std::runtime_error("[product.cpp](inner) aclnnMmGetWorkspaceSize failed, error = " +
 									 std::to_string(error));
@@ -457,25 +511,17 @@ NPUArray inner(const NPUArray& a, const NPUArray& b) {
 
 		void* workspaceAddr = nullptr;
 		if (workspaceSize > 0) {
-			error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+			error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
 			if (error != ACL_SUCCESS) {
 				throw std::runtime_error("[product.cpp](inner) aclrtMalloc failed, error = " + std::to_string(error));
 			}
 		}
 
-		error = aclnnMm(workspaceAddr, workspaceSize, executor, nullptr);
-		if (workspaceAddr)
-			aclrtFree(workspaceAddr);
+		error = asnumpy::npu::profiler::Launch(aclnnMm, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
 		if (error != ACL_SUCCESS) {
 			throw std::runtime_error("[product.cpp](inner) aclnnMm failed, error = " + std::to_string(error));
 		}
 
-		error = aclrtSynchronizeDevice();
-		if (error != ACL_SUCCESS) {
-			throw std::runtime_error("[product.cpp](inner) aclrtSynchronizeDevice failed, error = " +
-									 std::to_string(error));
-		}
-
 		return out;
 	}
 
@@ -493,20 +539,18 @@ NPUArray outer(const NPUArray& a, const NPUArray& b) {
 	{
 		uint64_t ws = 0;
 		aclOpExecutor* exec = nullptr;
-		auto err = aclnnFlattenGetWorkspaceSize(a.tensorPtr, 1, a_flat.tensorPtr, &ws, &exec);
+		auto err = asnumpy::npu::profiler::Plan("Flatten", aclnnFlattenGetWorkspaceSize, a.tensorPtr, 1, a_flat.tensorPtr, &ws, &exec);
 		if (err != ACL_SUCCESS)
 			throw std::runtime_error("[outer] FlattenGetWorkspaceSize(a) failed");
 
 		void* wsAddr = nullptr;
 		if (ws > 0) {
-			err = aclrtMalloc(&wsAddr, ws, ACL_MEM_MALLOC_HUGE_FIRST);
+			err = asnumpy::npu::GetWorkspace(&wsAddr, ws);
 			if (err != ACL_SUCCESS)
 				throw std::runtime_error("[outer] aclrtMalloc (a) failed");
 		}
 
-		err = aclnnFlatten(wsAddr, ws, exec, nullptr);
-		if (wsAddr)
-			aclrtFree(wsAddr);
+		err = asnumpy::npu::profiler::Launch(aclnnFlatten, wsAddr, ws, exec, asnumpy::npu::GetCurrentStream());
 		if (err != ACL_SUCCESS)
 			throw std::runtime_error("[outer] Flatten(a) exec failed");
 	}
@@ -516,20 +560,18 @@ NPUArray outer(const NPUArray& a, const NPUArray& b) {
 	{
 		uint64_t ws = 0;
 		aclOpExecutor* exec = nullptr;
-		auto err = aclnnFlattenGetWorkspaceSize(b.tensorPtr, 0, b_flat.tensorPtr, &ws, &exec);
+		auto err = asnumpy::npu::profiler::Plan("Flatten", aclnnFlattenGetWorkspaceSize, b.tensorPtr, 0, b_flat.tensorPtr, &ws, &exec);
 		if (err != ACL_SUCCESS)
 			throw std::runtime_error("[outer] FlattenGetWorkspaceSize(b) failed");
 
 		void* wsAddr = nullptr;
 		if (ws > 0) {
-			err = aclrtMalloc(&wsAddr, ws, ACL_MEM_MALLOC_HUGE_FIRST);
+			err = asnumpy::npu::GetWorkspace(&wsAddr, ws);
 			if (err != ACL_SUCCESS)
 				throw std::runtime_error("[outer] aclrtMalloc (b) failed");
 		}
 
-		err = aclnnFlatten(wsAddr, ws, exec, nullptr);
-		if (wsAddr)
-			aclrtFree(wsAddr);
+		err = asnumpy::npu::profiler::Launch(aclnnFlatten, wsAddr, ws, exec, asnumpy::npu::GetCurrentStream());
 		if (err != ACL_SUCCESS)
 			throw std::runtime_error("[outer] Flatten(b) exec failed");
 	}
@@ -542,27 +584,21 @@ NPUArray outer(const NPUArray& a, const NPUArray& b) {
 	{
 		uint64_t ws = 0;
 		aclOpExecutor* exec = nullptr;
-		auto err = aclnnMulGetWorkspaceSize(a_flat.tensorPtr, b_flat.tensorPtr, out.tensorPtr, &ws, &exec);
+		auto err = asnumpy::npu::profiler::Plan("Mul", aclnnMulGetWorkspaceSize, a_flat.tensorPtr, b_flat.tensorPtr, out.tensorPtr, &ws, &exec);
 		if (err != ACL_SUCCESS)
 			throw std::runtime_error("[outer] MulGetWorkspaceSize failed");
 
 		void* wsAddr = nullptr;
 		if (ws > 0) {
-			err = aclrtMalloc(&wsAddr, ws, ACL_MEM_MALLOC_HUGE_FIRST);
+			err = asnumpy::npu::GetWorkspace(&wsAddr, ws);
 			if (err != ACL_SUCCESS)
 				throw std::runtime_error("[outer] aclrtMalloc (mul) failed");
 		}
 
-		err = aclnnMul(wsAddr, ws, exec, nullptr);
-		if (wsAddr)
-			aclrtFree(wsAddr);
+		err = asnumpy::npu::profiler::Launch(aclnnMul, wsAddr, ws, exec, asnumpy::npu::GetCurrentStream());
 		if (err != ACL_SUCCESS)
 			throw std::runtime_error("[outer] Mul exec failed");
 	}
 
-	auto err = aclrtSynchronizeDevice();
-	if (err != ACL_SUCCESS)
-		throw std::runtime_error("[outer] aclrtSynchronizeDevice failed");
-
 	return out;
 }
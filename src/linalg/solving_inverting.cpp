@@ -17,6 +17,9 @@
 
 #include <asnumpy/linalg/solving_inverting.hpp>
 #include <asnumpy/utils/status_handler.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/profiler.hpp>
 
 #include <acl/acl.h>
 #include <aclnn/aclnn_base.h>
@@ -31,16 +34,14 @@ NPUArray Linalg_Inv(const NPUArray& a) {
     auto result = NPUArray(shape, ACL_DOUBLE);
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor;
-    auto error = aclnnInverseGetWorkspaceSize(a.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
+    auto error = asnumpy::npu::profiler::Plan("Inverse", aclnnInverseGetWorkspaceSize, a.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
     CheckGetWorkspaceSizeAclnnStatus(error);
     void* workspaceAddr = nullptr;
     if(workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         CheckMallocAclnnStatus(error);
     }
-    error = aclnnInverse(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnInverse, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     CheckAclnnStatus(error, "aclnnInverse error");
-    error = aclrtSynchronizeDevice();
-    CheckSynchronizeDeviceAclnnStatus(error);
     return result;
 }
\ No newline at end of file
@@ -16,6 +16,10 @@
 
 
 #include <asnumpy/logic/logic.hpp>
+#include <asnumpy/utils/npu_scalar.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/profiler.hpp>
 #include <fmt/base.h>
 
 #include <aclnnop/aclnn_all.h>
@@ -36,12 +40,25 @@
 #include <aclnnop/aclnn_lt_tensor.h>
 #include <aclnnop/aclnn_le_tensor.h>
 #include <aclnnop/aclnn_le_scalar.h>
-#include <aclnnop/aclnn_equal.h>
+#include <aclnnop/aclnn_eq_tensor.h>
+#include <aclnnop/aclnn_eq_scalar.h>
 #include <aclnnop/aclnn_ne_scalar.h>
 #include <aclnnop/aclnn_ne_tensor.h>
 
 namespace asnumpy {
 
+namespace {
+
+/// Comparison scalars keep their Python kind (int64 or double) and aclnn promotes
+/// them against the tensor, so `x > 0.5` on an int array is not truncated to `x > 0`.
+/// The scalar comes from the shared cache and must not be destroyed.
+aclScalar* ComparisonScalar(const py::object& scalar) {
+    bool isInteger = PyBool_Check(scalar.ptr()) || PyIndex_Check(scalar.ptr());
+    return GetCachedScalar(scalar, isInteger ? ACL_INT64 : ACL_DOUBLE);
+}
+
+}
+
 /// Reduce array by logical AND operation over all elements.
 NPUArray All(const NPUArray& x) {
     auto result = NPUArray({}, ACL_BOOL);
@@ -56,7 +73,7 @@ NPUArray All(const NPUArray& x) {
         throw std::runtime_error("[logic.cpp](All) failed to create empty aclIntArray");
     }
 
-    auto error = aclnnAllGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("All", aclnnAllGetWorkspaceSize,
         x.tensorPtr,
         aclDim,
         false,  // keepdims = false
@@ -70,34 +87,20 @@ NPUArray All(const NPUArray& x) {
     }
 
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             aclDestroyIntArray(aclDim);
             throw std::runtime_error("[logic.cpp](All) aclrtMalloc failed, error=" + std::to_string(error));
         }
     }
 
-    error = aclnnAll(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnAll, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
         aclDestroyIntArray(aclDim);
         throw std::runtime_error("[logic.cpp](All) aclnnAll failed, error=" + std::to_string(error));
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        aclDestroyIntArray(aclDim);
-        throw std::runtime_error("[logic.cpp](All) sync device failed, error=" + std::to_string(error));
-    }
 
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
     aclDestroyIntArray(aclDim);
 
     return result;
@@ -117,7 +120,7 @@ NPUArray All(const NPUArray& x, const std::vector<int64_t>& dim, bool keepdims)
         throw std::runtime_error("[logic.cpp](All) failed to create aclIntArray");
     }
 
-    auto error = aclnnAllGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("All", aclnnAllGetWorkspaceSize,
         x.tensorPtr,
         aclDim,
         keepdims,
@@ -131,34 +134,20 @@ NPUArray All(const NPUArray& x, const std::vector<int64_t>& dim, bool keepdims)
     }
 
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             aclDestroyIntArray(aclDim);
             throw std::runtime_error("[logic.cpp](All) aclrtMalloc failed, error=" + std::to_string(error));
         }
     }
 
-    error = aclnnAll(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnAll, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
         aclDestroyIntArray(aclDim);
         throw std::runtime_error("[logic.cpp](All) aclnnAll failed, error=" + std::to_string(error));
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        aclDestroyIntArray(aclDim);
-        throw std::runtime_error("[logic.cpp](All) sync device failed, error=" + std::to_string(error));
-    }
 
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
     aclDestroyIntArray(aclDim);
 
     return result;
@@ -178,7 +167,7 @@ NPUArray Any(const NPUArray& x) {
         throw std::runtime_error("[logic.cpp](Any) failed to create empty aclIntArray");
     }
 
-    auto error = aclnnAnyGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("Any", aclnnAnyGetWorkspaceSize,
         x.tensorPtr,
         aclDim,
         false,  // keepdims = false
@@ -192,34 +181,20 @@ NPUArray Any(const NPUArray& x) {
     }
 
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             aclDestroyIntArray(aclDim);
             throw std::runtime_error("[logic.cpp](Any) aclrtMalloc failed, error=" + std::to_string(error));
         }
     }
 
-    error = aclnnAny(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnAny, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
         aclDestroyIntArray(aclDim);
         throw std::runtime_error("[logic.cpp](Any) aclnnAny failed, error=" + std::to_string(error));
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        aclDestroyIntArray(aclDim);
-        throw std::runtime_error("[logic.cpp](Any) sync device failed, error=" + std::to_string(error));
-    }
 
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
     aclDestroyIntArray(aclDim);
 
     return result;
@@ -239,7 +214,7 @@ NPUArray Any(const NPUArray& x, const std::vector<int64_t>& dim, bool keepdims)
         throw std::runtime_error("[logic.cpp](Any) failed to create aclIntArray");
     }
 
-    auto error = aclnnAnyGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("Any", aclnnAnyGetWorkspaceSize,
         x.tensorPtr,
         aclDim,
         keepdims,
@@ -253,34 +228,20 @@ NPUArray Any(const NPUArray& x, const std::vector<int64_t>& dim, bool keepdims)
     }
 
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             aclDestroyIntArray(aclDim);
             throw std::runtime_error("[logic.cpp](Any) aclrtMalloc failed, error=" + std::to_string(error));
         }
     }
 
-    error = aclnnAny(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnAny, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
         aclDestroyIntArray(aclDim);
         throw std::runtime_error("[logic.cpp](Any) aclnnAny failed, error=" + std::to_string(error));
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        aclDestroyIntArray(aclDim);
-        throw std::runtime_error("[logic.cpp](Any) sync device failed, error=" + std::to_string(error));
-    }
 
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
     aclDestroyIntArray(aclDim);
 
     return result;
@@ -290,13 +251,16 @@ NPUArray Any(const NPUArray& x, const std::vector<int64_t>& dim, bool keepdims)
 NPUArray IsFinite(const NPUArray& x) {
     // 输出布尔数组，shape 与输入一致
     auto result = NPUArray(x.shape, ACL_BOOL);
+    if (result.tensorSize == 0) {
+        return result;
+    }
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
     void* workspaceAddr = nullptr;
 
     // 获取 workspace 大小 & 执行器（按 NNOP 两段式）
-    auto error = aclnnIsFiniteGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("IsFinite", aclnnIsFiniteGetWorkspaceSize,
         x.tensorPtr,
         result.tensorPtr,
         &workspaceSize,
@@ -310,7 +274,7 @@ NPUArray IsFinite(const NPUArray& x) {
 
     // 分配 workspace
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format(
                 "[logic.cpp](IsFinite) aclrtMalloc failed, error={}", error));
@@ -318,40 +282,27 @@ NPUArray IsFinite(const NPUArray& x) {
     }
 
     // 执行计算
-    error = aclnnIsFinite(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnIsFinite, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
         throw std::runtime_error(fmt::format(
             "[logic.cpp](IsFinite) computation failed, error={}", error));
     }
 
-    // 同步设备
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        throw std::runtime_error(fmt::format(
-            "[logic.cpp](IsFinite) sync device failed, error={}", error));
-    }
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
     return result;
 }
 
 /// Check element-wise infinity of the input array.
 NPUArray IsInf(const NPUArray& x) {
     auto result = NPUArray(x.shape, ACL_BOOL);
+    if (result.tensorSize == 0) {
+        return result;
+    }
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
     void* workspaceAddr = nullptr;
 
-    auto error = aclnnIsInfGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("IsInf", aclnnIsInfGetWorkspaceSize,
         x.tensorPtr,
         result.tensorPtr,
         &workspaceSize,
@@ -364,155 +315,93 @@ NPUArray IsInf(const NPUArray& x) {
     }
 
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format("[logic.cpp](IsInf) aclrtMalloc failed, error={}", error));
         }
     }
 
-    error = aclnnIsInf(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnIsInf, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
         throw std::runtime_error(fmt::format("[logic.cpp](IsInf) computation failed, error={}", error));
     }
-{
 
-}
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        throw std::runtime_error(fmt::format("[logic.cpp](IsInf) sync device failed, error={}", error));
-    }
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
     return result;
 }
 
 /// Test element-wise for negative infinity (-inf).
 NPUArray IsNegInf(const NPUArray& x) {
     auto result = NPUArray(x.shape, ACL_BOOL);
+    if (result.tensorSize == 0) {
+        return result;
+    }
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
     void* workspaceAddr = nullptr;
-    aclrtStream stream = nullptr;
+    aclrtStream stream = asnumpy::npu::GetCurrentStream();
 
     // 获取 workspace 大小与执行器
-    auto error = aclnnIsNegInfGetWorkspaceSize(x.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
+    auto error = asnumpy::npu::profiler::Plan("IsNegInf", aclnnIsNegInfGetWorkspaceSize, x.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
     if (error != ACL_SUCCESS) {
         throw std::runtime_error(fmt::format("[logic.cpp](IsNegInf) GetWorkspaceSize failed, error={}", error));
     }
 
     // 分配 workspace
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format("[logic.cpp](IsNegInf) aclrtMalloc failed, error={}", error));
         }
     }
 
-    // 创建执行流
-    error = aclrtCreateStream(&stream);
-    if (error != ACL_SUCCESS || stream == nullptr) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        throw std::runtime_error(fmt::format("[logic.cpp](IsNegInf) create stream failed, error={}", error));
-    }
 
     // 执行计算
-    error = aclnnIsNegInf(workspaceAddr, workspaceSize, executor, stream);
+    error = asnumpy::npu::profiler::Launch(aclnnIsNegInf, workspaceAddr, workspaceSize, executor, stream);
     if (error != ACL_SUCCESS) {
-        aclrtDestroyStream(stream);
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
         throw std::runtime_error(fmt::format("[logic.cpp](IsNegInf) computation failed, error={}", error));
     }
 
-    // 同步设备
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        aclrtDestroyStream(stream);
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        throw std::runtime_error(fmt::format("[logic.cpp](IsNegInf) sync device failed, error={}", error));
-    }
 
     // 释放资源
-    aclrtDestroyStream(stream);
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }{
-
-    }
     return result;
 }
 
 /// Test element-wise for positive infinity (+inf).
 NPUArray IsPosInf(const NPUArray& x) {
     auto result = NPUArray(x.shape, ACL_BOOL);
+    if (result.tensorSize == 0) {
+        return result;
+    }
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
     void* workspaceAddr = nullptr;
-    aclrtStream stream = nullptr;
+    aclrtStream stream = asnumpy::npu::GetCurrentStream();
 
     // 获取 workspace 大小与执行器
-    auto error = aclnnIsPosInfGetWorkspaceSize(x.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
+    auto error = asnumpy::npu::profiler::Plan("IsPosInf", aclnnIsPosInfGetWorkspaceSize, x.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
     if (error != ACL_SUCCESS) {
         throw std::runtime_error(fmt::format("[logic.cpp](IsPosInf) GetWorkspaceSize failed, error={}", error));
     }
 
     // 分配 workspace
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format("[logic.cpp](IsPosInf) aclrtMalloc failed, error={}", error));
         }
     }
 
-    // 创建执行流
-    error = aclrtCreateStream(&stream);
-    if (error != ACL_SUCCESS || stream == nullptr) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        throw std::runtime_error(fmt::format("[logic.cpp](IsPosInf) create stream failed, error={}", error));
-    }
 
     // 执行计算
-    error = aclnnIsPosInf(workspaceAddr, workspaceSize, executor, stream);
+    error = asnumpy::npu::profiler::Launch(aclnnIsPosInf, workspaceAddr, workspaceSize, executor, stream);
     if (error != ACL_SUCCESS) {
-        aclrtDestroyStream(stream);
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
         throw std::runtime_error(fmt::format("[logic.cpp](IsPosInf) computation failed, error={}", error));
     }
 
-    // 同步设备（保持和其它算子一致）
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        aclrtDestroyStream(stream);
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        throw std::runtime_error(fmt::format("[logic.cpp](IsPosInf) sync device failed, error={}", error));
-    }
 
     // 释放资源
-    aclrtDestroyStream(stream);
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
     return result;
 }
 
@@ -524,7 +413,7 @@ NPUArray LogicalAnd(const NPUArray& x, const NPUArray& y) {
     aclOpExecutor* executor = nullptr;
     void* workspaceAddr = nullptr;
 
-    auto error = aclnnLogicalAndGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("LogicalAnd", aclnnLogicalAndGetWorkspaceSize,
         x.tensorPtr, y.tensorPtr, result.tensorPtr,
         &workspaceSize, &executor
     );
@@ -538,31 +427,17 @@ NPUArray LogicalAnd(const NPUArray& x, const NPUArray& y) {
     }
 
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format("[logic.cpp](LogicalAnd) aclrtMalloc failed, error={}", error));
         }
     }
 
-    error = aclnnLogicalAnd(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnLogicalAnd, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
         throw std::runtime_error(fmt::format("[logic.cpp](LogicalAnd) computation failed, error={}", error));
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        throw std::runtime_error(fmt::format("[logic.cpp](LogicalAnd) sync device failed, error={}", error));
-    }
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
     return result;
 }
 
@@ -574,7 +449,7 @@ NPUArray LogicalOr(const NPUArray& x, const NPUArray& y) {
     aclOpExecutor* executor = nullptr;
     void* workspaceAddr = nullptr;
 
-    auto error = aclnnLogicalOrGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("LogicalOr", aclnnLogicalOrGetWorkspaceSize,
         x.tensorPtr, y.tensorPtr, result.tensorPtr,
         &workspaceSize, &executor
     );
@@ -588,43 +463,32 @@ NPUArray LogicalOr(const NPUArray& x, const NPUArray& y) {
     }
 
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format("[logic.cpp](LogicalOr) aclrtMalloc failed, error={}", error));
         }
     }
 
-    error = aclnnLogicalOr(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnLogicalOr, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
         throw std::runtime_error(fmt::format("[logic.cpp](LogicalOr) computation failed, error={}", error));
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        throw std::runtime_error(fmt::format("[logic.cpp](LogicalOr) sync device failed, error={}", error));
-    }
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
     return result;
 }
 
 /// Perform element-wise logical NOT on a boolean array.
 NPUArray LogicalNot(const NPUArray& x) {
     auto result = NPUArray(x.shape, ACL_BOOL);
+    if (result.tensorSize == 0) {
+        return result;
+    }
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
     void* workspaceAddr = nullptr;
 
-    auto error = aclnnLogicalNotGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("LogicalNot", aclnnLogicalNotGetWorkspaceSize,
         x.tensorPtr, result.tensorPtr,
         &workspaceSize, &executor
     );
@@ -637,33 +501,20 @@ NPUArray LogicalNot(const NPUArray& x) {
     }
 
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format("[logic.cpp](LogicalNot) aclrtMalloc failed, error={}", error));
         }
     }
 
-    error = aclnnLogicalNot(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnLogicalNot, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
         throw std::runtime_error(fmt::format("[logic.cpp](LogicalNot) computation failed, error={}", error));
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        throw std::runtime_error(fmt::format("[logic.cpp](LogicalNot) sync device failed, error={}", error));
-    }{
+{
      }
 
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
     return result;
 }
 
@@ -675,7 +526,7 @@ NPUArray LogicalXor(const NPUArray& x, const NPUArray& y) {
     aclOpExecutor* executor = nullptr;
     void* workspaceAddr = nullptr;
 
-    auto error = aclnnLogicalXorGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("LogicalXor", aclnnLogicalXorGetWorkspaceSize,
         x.tensorPtr, y.tensorPtr, result.tensorPtr,
         &workspaceSize, &executor
     );
@@ -689,31 +540,17 @@ NPUArray LogicalXor(const NPUArray& x, const NPUArray& y) {
     }
 
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format("[logic.cpp](LogicalXor) aclrtMalloc failed, error={}", error));
         }
     }
 
-    error = aclnnLogicalXor(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnLogicalXor, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
         throw std::runtime_error(fmt::format("[logic.cpp](LogicalXor) computation failed, error={}", error));
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        throw std::runtime_error(fmt::format("[logic.cpp](LogicalXor) sync device failed, error={}", error));
-    }
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
     return result;
 }
 
@@ -724,7 +561,7 @@ NPUArray greater(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnGtTensorGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("GtTensor", aclnnGtTensorGetWorkspaceSize,
         x1.tensorPtr, x2.tensorPtr, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
@@ -742,7 +579,7 @@ NPUArray greater(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string error_msg = "[logic.cpp](greater) aclrtMalloc error = "
                                     + std::to_string(error);
@@ -753,11 +590,8 @@ NPUArray greater(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype
         }
     }
 
-    error = aclnnGtTensor(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnGtTensor, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
         std::string error_msg = "[logic.cpp](greater) aclnnGtTensor error = "
                                 + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -766,22 +600,6 @@ NPUArray greater(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype
         throw std::runtime_error(error_msg);
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }    
-        std::string error_msg = "[logic.cpp](greater) aclrtSynchronizeDevice error = "
-                                + std::to_string(error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0)
-            error_msg += " - " + std::string(detailed_msg);
-        throw std::runtime_error(error_msg);
-    }
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
     return out;
 }
 
@@ -797,15 +615,14 @@ NPUArray greater(const NPUArray& x1, const py::object& scalar, std::optional<py:
         throw std::runtime_error("[logic.cpp](greater) Invalid scalar type: "
                                  + std::string(e.what()));
     }
-    aclScalar* acl_scalar = aclCreateScalar(&scalar_val, x1.aclDtype);
+    aclScalar* acl_scalar = ComparisonScalar(scalar);
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnGtScalarGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("GtScalar", aclnnGtScalarGetWorkspaceSize,
         x1.tensorPtr, acl_scalar, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
-        aclDestroyScalar(acl_scalar);
         std::string error_msg = "[logic.cpp](greater) aclnnGtScalarGetWorkspaceSize error = "
                                 + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -814,16 +631,14 @@ NPUArray greater(const NPUArray& x1, const py::object& scalar, std::optional<py:
         throw std::runtime_error(error_msg);
     }
     if (workspaceSize < 0) {
-        aclDestroyScalar(acl_scalar);
         throw std::runtime_error("[logic.cpp](greater) Invalid workspaceSize: "
                                  + std::to_string(workspaceSize));
     }
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
-            aclDestroyScalar(acl_scalar);
             std::string error_msg = "[logic.cpp](greater) aclrtMalloc error = "
                                     + std::to_string(error);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -833,14 +648,8 @@ NPUArray greater(const NPUArray& x1, const py::object& scalar, std::optional<py:
         }
     }
 
-    error = aclnnGtScalar(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnGtScalar, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        {
-            aclDestroyScalar(acl_scalar);
-        }
         std::string error_msg = "[logic.cpp](greater) aclnnGtScalar error = "
                                 + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -848,29 +657,6 @@ NPUArray greater(const NPUArray& x1, const py::object& scalar, std::optional<py:
             error_msg += " - " + std::string(detailed_msg);
         throw std::runtime_error(error_msg);
     }
-
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        {
-            aclDestroyScalar(acl_scalar);
-        }
-        std::string error_msg = "[logic.cpp](greater) aclrtSynchronizeDevice error = "
-                                + std::to_string(error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0)
-            error_msg += " - " + std::string(detailed_msg);
-        throw std::runtime_error(error_msg);
-    }
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-    {
-        aclDestroyScalar(acl_scalar);
-    }
     return out;
 }
 
@@ -881,7 +667,7 @@ NPUArray greater_equal(const NPUArray& x1, const NPUArray& x2, std::optional<py:
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnGeTensorGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("GeTensor", aclnnGeTensorGetWorkspaceSize,
         x1.tensorPtr, x2.tensorPtr, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
@@ -899,7 +685,7 @@ NPUArray greater_equal(const NPUArray& x1, const NPUArray& x2, std::optional<py:
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string error_msg = "[logic.cpp](greater_equal) aclrtMalloc error = "
                                     + std::to_string(error);
@@ -910,11 +696,8 @@ NPUArray greater_equal(const NPUArray& x1, const NPUArray& x2, std::optional<py:
         }
     }
 
-    error = aclnnGeTensor(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnGeTensor, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
         std::string error_msg = "[logic.cpp](greater_equal) aclnnGeTensor error = "
                                 + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -923,22 +706,6 @@ NPUArray greater_equal(const NPUArray& x1, const NPUArray& x2, std::optional<py:
         throw std::runtime_error(error_msg);
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        std::string error_msg = "[logic.cpp](greater_equal) aclrtSynchronizeDevice error = "
-                                + std::to_string(error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0)
-            error_msg += " - " + std::string(detailed_msg);
-        throw std::runtime_error(error_msg);
-    }
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
     return out;
 }
 
@@ -954,15 +721,14 @@ NPUArray greater_equal(const NPUArray& x1, const py::object& scalar, std::option
         throw std::runtime_error("[logic.cpp](greater_equal) Invalid scalar type: "
                                  + std::string(e.what()));
     }
-    aclScalar* acl_scalar = aclCreateScalar(&scalar_val, x1.aclDtype);
+    aclScalar* acl_scalar = ComparisonScalar(scalar);
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnGeScalarGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("GeScalar", aclnnGeScalarGetWorkspaceSize,
         x1.tensorPtr, acl_scalar, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
-        aclDestroyScalar(acl_scalar);
         std::string error_msg = "[logic.cpp](greater_equal) aclnnGeScalarGetWorkspaceSize error = "
                                 + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -971,16 +737,14 @@ NPUArray greater_equal(const NPUArray& x1, const py::object& scalar, std::option
         throw std::runtime_error(error_msg);
     }
     if (workspaceSize < 0) {
-        aclDestroyScalar(acl_scalar);
         throw std::runtime_error("[logic.cpp](greater_equal) Invalid workspaceSize: "
                                  + std::to_string(workspaceSize));
     }
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
-            aclDestroyScalar(acl_scalar);
             std::string error_msg = "[logic.cpp](greater_equal) aclrtMalloc error = "
                                     + std::to_string(error);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -990,12 +754,8 @@ NPUArray greater_equal(const NPUArray& x1, const py::object& scalar, std::option
         }
     }
 
-    error = aclnnGeScalar(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnGeScalar, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        aclDestroyScalar(acl_scalar);
         std::string error_msg = "[logic.cpp](greater_equal) aclnnGeScalar error = "
                                 + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -1004,24 +764,7 @@ NPUArray greater_equal(const NPUArray& x1, const py::object& scalar, std::option
         throw std::runtime_error(error_msg);
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        aclDestroyScalar(acl_scalar);
-        std::string error_msg = "[logic.cpp](greater_equal) aclrtSynchronizeDevice error = "
-                                + std::to_string(error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0)
-            error_msg += " - " + std::string(detailed_msg);
-        throw std::runtime_error(error_msg);
-    }
 
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-    aclDestroyScalar(acl_scalar);
     return out;
 }
 
@@ -1033,7 +776,7 @@ NPUArray less(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> d
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnLtTensorGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("LtTensor", aclnnLtTensorGetWorkspaceSize,
         x1.tensorPtr, x2.tensorPtr, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
@@ -1051,7 +794,7 @@ NPUArray less(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> d
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string error_msg = "[logic.cpp](less) aclrtMalloc error = "
                                     + std::to_string(error);
@@ -1062,11 +805,8 @@ NPUArray less(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> d
         }
     }
 
-    error = aclnnLtTensor(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnLtTensor, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
         std::string error_msg = "[logic.cpp](less) aclnnLtTensor error = "
                                 + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -1075,22 +815,6 @@ NPUArray less(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> d
         throw std::runtime_error(error_msg);
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        std::string error_msg = "[logic.cpp](less) aclrtSynchronizeDevice error = "
-                                + std::to_string(error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0)
-            error_msg += " - " + std::string(detailed_msg);
-        throw std::runtime_error(error_msg);
-    }
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
     return out;
 }
 
@@ -1106,15 +830,14 @@ NPUArray less(const NPUArray& x1, const py::object& scalar, std::optional<py::dt
         throw std::runtime_error("[logic.cpp](less) Invalid scalar type: "
                                  + std::string(e.what()));
     }
-    aclScalar* acl_scalar = aclCreateScalar(&scalar_val, x1.aclDtype);
+    aclScalar* acl_scalar = ComparisonScalar(scalar);
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnLtScalarGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("LtScalar", aclnnLtScalarGetWorkspaceSize,
         x1.tensorPtr, acl_scalar, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
-        aclDestroyScalar(acl_scalar);
         std::string error_msg = "[logic.cpp](less) aclnnLtScalarGetWorkspaceSize error = "
                                 + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -1123,16 +846,14 @@ NPUArray less(const NPUArray& x1, const py::object& scalar, std::optional<py::dt
         throw std::runtime_error(error_msg);
     }
     if (workspaceSize < 0) {
-        aclDestroyScalar(acl_scalar);
         throw std::runtime_error("[logic.cpp](less) Invalid workspaceSize: "
                                  + std::to_string(workspaceSize));
     }
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
-            aclDestroyScalar(acl_scalar);
             std::string error_msg = "[logic.cpp](less) aclrtMalloc error = "
                                     + std::to_string(error);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -1142,12 +863,8 @@ NPUArray less(const NPUArray& x1, const py::object& scalar, std::optional<py::dt
         }
     }
 
-    error = aclnnLtScalar(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnLtScalar, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        aclDestroyScalar(acl_scalar);
         std::string error_msg = "[logic.cpp](less) aclnnLtScalar error = "
                                 + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -1156,24 +873,7 @@ NPUArray less(const NPUArray& x1, const py::object& scalar, std::optional<py::dt
         throw std::runtime_error(error_msg);
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        aclDestroyScalar(acl_scalar);
-        std::string error_msg = "[logic.cpp](less) aclrtSynchronizeDevice error = "
-                                + std::to_string(error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0)
-            error_msg += " - " + std::string(detailed_msg);
-        throw std::runtime_error(error_msg);
-    }
 
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-    aclDestroyScalar(acl_scalar);
     return out;
 }
 
@@ -1185,7 +885,7 @@ NPUArray less_equal(const NPUArray& x1, const NPUArray& x2, std::optional<py::dt
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnLeTensorGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("LeTensor", aclnnLeTensorGetWorkspaceSize,
         x1.tensorPtr, x2.tensorPtr, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
@@ -1203,7 +903,7 @@ NPUArray less_equal(const NPUArray& x1, const NPUArray& x2, std::optional<py::dt
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string error_msg = "[logic.cpp](less_equal) aclrtMalloc error = "
                                     + std::to_string(error);
@@ -1214,11 +914,8 @@ NPUArray less_equal(const NPUArray& x1, const NPUArray& x2, std::optional<py::dt
         }
     }
 
-    error = aclnnLeTensor(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnLeTensor, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
         std::string error_msg = "[logic.cpp](less_equal) aclnnLeTensor error = "
                                 + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -1227,22 +924,6 @@ NPUArray less_equal(const NPUArray& x1, const NPUArray& x2, std::optional<py::dt
         throw std::runtime_error(error_msg);
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        std::string error_msg = "[logic.cpp](less_equal) aclrtSynchronizeDevice error = "
-                                + std::to_string(error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0)
-            error_msg += " - " + std::string(detailed_msg);
-        throw std::runtime_error(error_msg);
-    }
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
     return out;
 }
 
@@ -1258,15 +939,14 @@ NPUArray less_equal(const NPUArray& x1, const py::object& scalar, std::optional<
         throw std::runtime_error("[logic.cpp](less_equal) Invalid scalar type: "
                                  + std::string(e.what()));
     }
-    aclScalar* acl_scalar = aclCreateScalar(&scalar_val, x1.aclDtype);
+    aclScalar* acl_scalar = ComparisonScalar(scalar);
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnLeScalarGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("LeScalar", aclnnLeScalarGetWorkspaceSize,
         x1.tensorPtr, acl_scalar, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
-        aclDestroyScalar(acl_scalar);
         std::string error_msg = "[logic.cpp](less_equal) aclnnLeScalarGetWorkspaceSize error = "
                                 + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -1275,16 +955,14 @@ NPUArray less_equal(const NPUArray& x1, const py::object& scalar, std::optional<
         throw std::runtime_error(error_msg);
     }
     if (workspaceSize < 0) {
-        aclDestroyScalar(acl_scalar);
         throw std::runtime_error("[logic.cpp](less_equal) Invalid workspaceSize: "
                                  + std::to_string(workspaceSize));
     }
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
-            aclDestroyScalar(acl_scalar);
             std::string error_msg = "[logic.cpp](less_equal) aclrtMalloc error = "
                                     + std::to_string(error);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -1294,12 +972,8 @@ NPUArray less_equal(const NPUArray& x1, const py::object& scalar, std::optional<
         }
     }
 
-    error = aclnnLeScalar(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnLeScalar, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        aclDestroyScalar(acl_scalar);
         std::string error_msg = "[logic.cpp](less_equal) aclnnLeScalar error = "
                                 + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -1308,51 +982,29 @@ NPUArray less_equal(const NPUArray& x1, const py::object& scalar, std::optional<
         throw std::runtime_error(error_msg);
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        aclDestroyScalar(acl_scalar);
-        std::string error_msg = "[logic.cpp](less_equal) aclrtSynchronizeDevice error = "
-                                + std::to_string(error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0)
-            error_msg += " - " + std::string(detailed_msg);
-        throw std::runtime_error(error_msg);
-    }
 
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-    aclDestroyScalar(acl_scalar);
     return out;
 }
 
 /// Element-wise equality comparison between two arrays.
-/// Note: aclnnEqual does not support broadcasting. Inputs must have identical shapes.
+/// aclnnEqual compares whole tensors to a single bool, so the element-wise aclnnEqTensor is used.
 NPUArray equal(const NPUArray& x1, const NPUArray& x2,
                std::optional<py::dtype> dtype) {
-    // 1. Shape check
-    if (x1.shape != x2.shape) {
-        throw std::runtime_error(
-            "[logic.cpp](equal) Input shapes must match exactly. "
-            "Broadcasting is not supported by aclnnEqual. "
-            "Got shape mismatch.");
+    // 1. Allocate output with the broadcast shape
+    auto out = NPUArray(GetBroadcastShape(x1, x2), dtype.value_or(py::dtype::of<bool>()));
+    if (out.tensorSize == 0) {
+        return out;
     }
 
-    // 2. Allocate output
-    auto out = NPUArray(x1.shape, dtype.value_or(py::dtype::of<bool>()));
-
-    // 3. Query workspace
+    // 2. Query workspace
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnEqualGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("EqTensor", aclnnEqTensorGetWorkspaceSize,
         x1.tensorPtr, x2.tensorPtr, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
         std::string error_msg =
-            "[logic.cpp](equal) aclnnEqualGetWorkspaceSize error = " +
+            "[logic.cpp](equal) aclnnEqTensorGetWorkspaceSize error = " +
             std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
         if (detailed_msg && std::strlen(detailed_msg) > 0)
@@ -1360,40 +1012,27 @@ NPUArray equal(const NPUArray& x1, const NPUArray& x2,
         throw std::runtime_error(error_msg);
     }
 
-    // 4. Allocate workspace
+    // 3. Allocate workspace
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize,
-                            ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error("[logic.cpp](equal) aclrtMalloc error = " +
                                      std::to_string(error));
         }
     }
 
-    // 5. Execute
-    error = aclnnEqual(workspaceAddr, workspaceSize, executor, nullptr);
+    // 4. Execute
+    error = asnumpy::npu::profiler::Launch(aclnnEqTensor, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         std::string error_msg =
-            "[logic.cpp](equal) aclnnEqual error = " + std::to_string(error);
+            "[logic.cpp](equal) aclnnEqTensor error = " + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
         if (detailed_msg && std::strlen(detailed_msg) > 0)
             error_msg += " - " + std::string(detailed_msg);
         throw std::runtime_error(error_msg);
     }
 
-    // 6. Sync
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error("[logic.cpp](equal) aclrtSynchronizeDevice error = " +
-                                 std::to_string(error));
-    }
-
-    // 7. Free
-    if (workspaceAddr) aclrtFree(workspaceAddr);
-
     return out;
 }
 
@@ -1404,7 +1043,7 @@ NPUArray not_equal(const NPUArray& x1, const NPUArray& x2, std::optional<py::dty
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnNeTensorGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("NeTensor", aclnnNeTensorGetWorkspaceSize,
         x1.tensorPtr, x2.tensorPtr, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
@@ -1422,7 +1061,7 @@ NPUArray not_equal(const NPUArray& x1, const NPUArray& x2, std::optional<py::dty
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string error_msg = "[logic.cpp](not_equal) aclrtMalloc error = "
                                     + std::to_string(error);
@@ -1433,11 +1072,8 @@ NPUArray not_equal(const NPUArray& x1, const NPUArray& x2, std::optional<py::dty
         }
     }
 
-    error = aclnnNeTensor(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnNeTensor, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
         std::string error_msg = "[logic.cpp](not_equal) aclnnNeTensor error = "
                                 + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -1446,22 +1082,65 @@ NPUArray not_equal(const NPUArray& x1, const NPUArray& x2, std::optional<py::dty
         throw std::runtime_error(error_msg);
     }
 
-    error = aclrtSynchronizeDevice();
+    return out;
+}
+
+/// Element-wise equality comparison between an array and a scalar.
+NPUArray equal(const NPUArray& x1, const py::object& scalar, std::optional<py::dtype> dtype) {
+    auto out = NPUArray(x1.shape,
+                        dtype.value_or(py::dtype::of<bool>()));
+
+    double scalar_val = 0;
+    try {
+        scalar_val = py::cast<double>(scalar);
+    } catch (const py::cast_error& e) {
+        throw std::runtime_error("[logic.cpp](equal) Invalid scalar type: "
+                                 + std::string(e.what()));
+    }
+    aclScalar* acl_scalar = ComparisonScalar(scalar);
+
+    uint64_t workspaceSize = 0;
+    aclOpExecutor* executor = nullptr;
+    auto error = asnumpy::npu::profiler::Plan("EqScalar", aclnnEqScalarGetWorkspaceSize,
+        x1.tensorPtr, acl_scalar, out.tensorPtr, &workspaceSize, &executor
+    );
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        std::string error_msg = "[logic.cpp](not_equal) aclrtSynchronizeDevice error = "
+        std::string error_msg = "[logic.cpp](equal) aclnnEqScalarGetWorkspaceSize error = "
                                 + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
         if (detailed_msg && std::strlen(detailed_msg) > 0)
             error_msg += " - " + std::string(detailed_msg);
         throw std::runtime_error(error_msg);
     }
+    if (workspaceSize < 0) {
+        throw std::runtime_error("[logic.cpp](equal) Invalid workspaceSize: "
+                                 + std::to_string(workspaceSize));
+    }
 
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
+    void* workspaceAddr = nullptr;
+    if (workspaceSize > 0) {
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
+        if (error != ACL_SUCCESS) {
+            std::string error_msg = "[logic.cpp](equal) aclrtMalloc error = "
+                                    + std::to_string(error);
+            const char* detailed_msg = aclGetRecentErrMsg();
+            if (detailed_msg && std::strlen(detailed_msg) > 0)
+                error_msg += " - " + std::string(detailed_msg);
+            throw std::runtime_error(error_msg);
+        }
     }
+
+    error = asnumpy::npu::profiler::Launch(aclnnEqScalar, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
+    if (error != ACL_SUCCESS) {
+        std::string error_msg = "[logic.cpp](equal) aclnnEqScalar error = "
+                                + std::to_string(error);
+        const char* detailed_msg = aclGetRecentErrMsg();
+        if (detailed_msg && std::strlen(detailed_msg) > 0)
+            error_msg += " - " + std::string(detailed_msg);
+        throw std::runtime_error(error_msg);
+    }
+
+
     return out;
 }
 
@@ -1477,15 +1156,14 @@ NPUArray not_equal(const NPUArray& x1, const py::object& scalar, std::optional<p
         throw std::runtime_error("[logic.cpp](not_equal) Invalid scalar type: "
                                  + std::string(e.what()));
     }
-    aclScalar* acl_scalar = aclCreateScalar(&scalar_val, x1.aclDtype);
+    aclScalar* acl_scalar = ComparisonScalar(scalar);
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnNeScalarGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("NeScalar", aclnnNeScalarGetWorkspaceSize,
         x1.tensorPtr, acl_scalar, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
-        aclDestroyScalar(acl_scalar);
         std::string error_msg = "[logic.cpp](not_equal) aclnnNeScalarGetWorkspaceSize error = "
                                 + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -1494,16 +1172,14 @@ NPUArray not_equal(const NPUArray& x1, const py::object& scalar, std::optional<p
         throw std::runtime_error(error_msg);
     }
     if (workspaceSize < 0) {
-        aclDestroyScalar(acl_scalar);
         throw std::runtime_error("[logic.cpp](not_equal) Invalid workspaceSize: "
                                  + std::to_string(workspaceSize));
     }
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
-            aclDestroyScalar(acl_scalar);
             std::string error_msg = "[logic.cpp](not_equal) aclrtMalloc error = "
                                     + std::to_string(error);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -1513,12 +1189,8 @@ NPUArray not_equal(const NPUArray& x1, const py::object& scalar, std::optional<p
         }
     }
 
-    error = aclnnNeScalar(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnNeScalar, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        aclDestroyScalar(acl_scalar);
         std::string error_msg = "[logic.cpp](not_equal) aclnnNeScalar error = "
                                 + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -1527,24 +1199,7 @@ NPUArray not_equal(const NPUArray& x1, const py::object& scalar, std::optional<p
         throw std::runtime_error(error_msg);
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-        aclDestroyScalar(acl_scalar);
-        std::string error_msg = "[logic.cpp](not_equal) aclrtSynchronizeDevice error = "
-                                + std::to_string(error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0)
-            error_msg += " - " + std::string(detailed_msg);
-        throw std::runtime_error(error_msg);
-    }
 
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-    aclDestroyScalar(acl_scalar);
     return out;
 }
 
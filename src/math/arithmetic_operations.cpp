@@ -16,14 +16,21 @@
 
 
 #include <asnumpy/math/arithmetic_operations.hpp>
+#include <asnumpy/array/basic.hpp>
 #include <asnumpy/utils/npu_array.hpp>
 #include <asnumpy/utils/npu_scalar.hpp>
+#include <asnumpy/utils/status_handler.hpp>
+#include <asnumpy/utils/type_promotion.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/profiler.hpp>
 
 #include <acl/acl.h>
 #include <aclnn/aclnn_base.h>
 #include <aclnnop/aclnn_add.h>
 #include <aclnnop/aclnn_cast.h>
 #include <aclnnop/aclnn_sub.h>
+#include <aclnnop/aclnn_rsub.h>
 #include <aclnnop/aclnn_mul.h>
 #include <aclnnop/aclnn_div.h>
 #include <aclnnop/aclnn_floor_divide.h>
@@ -36,6 +43,7 @@
 #include <aclnnop/aclnn_pow.h>
 #include <aclnnop/aclnn_pow_tensor_tensor.h>
 #include <aclnnop/aclnn_fmod_tensor.h>
+#include <aclnnop/aclnn_fmod_scalar.h>
 #include <aclnnop/aclnn_remainder.h>
 
 #include <fmt/base.h>
@@ -48,10 +56,14 @@ namespace asnumpy {
  * @brief Element-wise addition using aclnnAdd.
  */
 NPUArray Add(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dtype) {
-    py::dtype out_dtype = dtype.has_value() ? dtype.value() : x1.dtype;
+    PromotedOperands in(x1, x2);
+    py::dtype out_dtype = dtype.has_value() ? dtype.value() : NPUArray::GetPyDtype(in.dtype);
 
     auto out_shape = GetBroadcastShape(x1, x2);
     auto out = NPUArray(out_shape, out_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
 
     int32_t one = 1;
     aclScalar* alpha_scalar = aclCreateScalar(&one, ACL_INT32);
@@ -61,8 +73,8 @@ NPUArray Add(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dt
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnAddGetWorkspaceSize(
-        x1.tensorPtr, x2.tensorPtr, alpha_scalar, out.tensorPtr,
+    auto error = asnumpy::npu::profiler::Plan("Add", aclnnAddGetWorkspaceSize,
+        in.x1().tensorPtr, in.x2().tensorPtr, alpha_scalar, out.tensorPtr,
         &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
@@ -75,7 +87,7 @@ NPUArray Add(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dt
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             const char* detail = aclGetRecentErrMsg();
             std::string msg = "[arithmetic_operations.cpp](Add) aclrtMalloc error = " + std::to_string(error);
@@ -85,27 +97,16 @@ NPUArray Add(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dt
         }
     }
 
-    error = aclnnAdd(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnAdd, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
         const char* detail = aclGetRecentErrMsg();
         std::string msg = "[arithmetic_operations.cpp](Add) aclnnAdd error = " + std::to_string(error);
         if (detail && strlen(detail) > 0) msg += " - " + std::string(detail);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         aclDestroyScalar(alpha_scalar);
         throw std::runtime_error(msg);
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        const char* detail = aclGetRecentErrMsg();
-        std::string msg = "[arithmetic_operations.cpp](Add) aclrtSynchronizeDevice error = " + std::to_string(error);
-        if (detail && strlen(detail) > 0) msg += " - " + std::string(detail);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        aclDestroyScalar(alpha_scalar);
-        throw std::runtime_error(msg);
-    }
 
-    if (workspaceAddr) aclrtFree(workspaceAddr);
     aclDestroyScalar(alpha_scalar);
 
     return out;
@@ -117,10 +118,13 @@ NPUArray Add(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dt
 NPUArray Reciprocal(const NPUArray& x, std::optional<py::dtype> dtype) {
     py::dtype out_dtype = dtype.has_value() ? dtype.value() : x.dtype;
     auto out = NPUArray(x.shape, out_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnReciprocalGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("Reciprocal", aclnnReciprocalGetWorkspaceSize,
         x.tensorPtr, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
@@ -132,7 +136,7 @@ NPUArray Reciprocal(const NPUArray& x, std::optional<py::dtype> dtype) {
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             const char* detail = aclGetRecentErrMsg();
             std::string msg = "[arithmetic_operations.cpp](Reciprocal) aclrtMalloc error = " + std::to_string(error);
@@ -141,27 +145,14 @@ NPUArray Reciprocal(const NPUArray& x, std::optional<py::dtype> dtype) {
         }
     }
 
-    error = aclnnReciprocal(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnReciprocal, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
         const char* detail = aclGetRecentErrMsg();
         std::string msg = "[arithmetic_operations.cpp](Reciprocal) aclnnReciprocal error = " + std::to_string(error);
         if (detail && std::strlen(detail) > 0) msg += " - " + std::string(detail);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error(msg);
-    }
-
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        const char* detail = aclGetRecentErrMsg();
-        std::string msg = "[arithmetic_operations.cpp](Reciprocal) aclrtSynchronizeDevice error = " + std::to_string(error);
-        if (detail && std::strlen(detail) > 0) msg += " - " + std::string(detail);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         throw std::runtime_error(msg);
     }
 
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
     return out;
 }
 
@@ -176,10 +167,13 @@ NPUArray Positive(const NPUArray& x, std::optional<py::dtype> dtype) {
     }
 
     auto out = NPUArray(x.shape, out_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnCastGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("Cast", aclnnCastGetWorkspaceSize,
         x.tensorPtr, out.aclDtype, out.tensorPtr,
         &workspaceSize, &executor
     );
@@ -192,7 +186,7 @@ NPUArray Positive(const NPUArray& x, std::optional<py::dtype> dtype) {
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             const char* detail = aclGetRecentErrMsg();
             std::string msg = "[arithmetic_operations.cpp](Positive) aclrtMalloc error = " + std::to_string(error);
@@ -201,27 +195,14 @@ NPUArray Positive(const NPUArray& x, std::optional<py::dtype> dtype) {
         }
     }
 
-    error = aclnnCast(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnCast, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
         const char* detail = aclGetRecentErrMsg();
         std::string msg = "[arithmetic_operations.cpp](Positive) aclnnCast error = " + std::to_string(error);
         if (detail && strlen(detail) > 0) msg += " - " + std::string(detail);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         throw std::runtime_error(msg);
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        const char* detail = aclGetRecentErrMsg();
-        std::string msg = "[arithmetic_operations.cpp](Positive) aclrtSynchronizeDevice error = " + std::to_string(error);
-        if (detail && strlen(detail) > 0) msg += " - " + std::string(detail);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error(msg);
-    }
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
     return out;
 }
 
@@ -231,11 +212,14 @@ NPUArray Positive(const NPUArray& x, std::optional<py::dtype> dtype) {
 NPUArray Negative(const NPUArray& x, std::optional<py::dtype> dtype) {
     auto out_dtype = dtype.value_or(x.dtype);
     auto out = NPUArray(x.shape, out_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
 
     // 1. 获取 workspace
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnNegGetWorkspaceSize(x.tensorPtr, out.tensorPtr, &workspaceSize, &executor);
+    auto error = asnumpy::npu::profiler::Plan("Neg", aclnnNegGetWorkspaceSize, x.tensorPtr, out.tensorPtr, &workspaceSize, &executor);
     if (error != ACL_SUCCESS) {
         std::string msg = "[arithmetic_operations.cpp](Negative) aclnnNegGetWorkspaceSize error = "
                           + std::to_string(error);
@@ -247,7 +231,7 @@ NPUArray Negative(const NPUArray& x, std::optional<py::dtype> dtype) {
     // 2. 分配 workspace
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string msg = "[arithmetic_operations.cpp](Negative) aclrtMalloc error = "
                               + std::to_string(error);
@@ -258,31 +242,17 @@ NPUArray Negative(const NPUArray& x, std::optional<py::dtype> dtype) {
     }
 
     // 3. 执行 Neg
-    error = aclnnNeg(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnNeg, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
         std::string msg = "[arithmetic_operations.cpp](Negative) aclnnNeg error = "
                           + std::to_string(error);
         const char* detail = aclGetRecentErrMsg();
         if (detail && std::strlen(detail) > 0) msg += " - " + std::string(detail);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         throw std::runtime_error(msg);
     }
 
-    // 4. 同步
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        std::string msg = "[arithmetic_operations.cpp](Negative) aclrtSynchronizeDevice error = "
-                          + std::to_string(error);
-        const char* detail = aclGetRecentErrMsg();
-        if (detail && std::strlen(detail) > 0) msg += " - " + std::string(detail);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error(msg);
-    }
 
     // 5. 释放资源
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
 
     return out;
 }
@@ -293,13 +263,17 @@ NPUArray Negative(const NPUArray& x, std::optional<py::dtype> dtype) {
 NPUArray Multiply(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dtype) {
     // 1. 广播输出形状
     auto out_shape = GetBroadcastShape(x1, x2);
-    auto out_dtype = dtype.value_or(x1.dtype);
+    PromotedOperands in(x1, x2);
+    auto out_dtype = dtype.value_or(NPUArray::GetPyDtype(in.dtype));
     auto out = NPUArray(out_shape, out_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
 
     // 2. 获取 workspace
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnMulGetWorkspaceSize(x1.tensorPtr, x2.tensorPtr, out.tensorPtr, &workspaceSize, &executor);
+    auto error = asnumpy::npu::profiler::Plan("Mul", aclnnMulGetWorkspaceSize, in.x1().tensorPtr, in.x2().tensorPtr, out.tensorPtr, &workspaceSize, &executor);
     if (error != ACL_SUCCESS) {
         std::string msg = "[arithmetic_operations.cpp](Multiply) aclnnMulGetWorkspaceSize error = "
                           + std::to_string(error);
@@ -311,7 +285,7 @@ NPUArray Multiply(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtyp
     // 3. 分配 workspace
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string msg = "[arithmetic_operations.cpp](Multiply) aclrtMalloc error = "
                               + std::to_string(error);
@@ -322,32 +296,15 @@ NPUArray Multiply(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtyp
     }
 
     // 4. 执行算子
-    error = aclnnMul(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnMul, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
         std::string msg = "[arithmetic_operations.cpp](Multiply) aclnnMul error = "
                           + std::to_string(error);
         const char* detail = aclGetRecentErrMsg();
         if (detail && strlen(detail) > 0) msg += " - " + std::string(detail);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error(msg);
-    }
-
-    // 5. 同步设备
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        std::string msg = "[arithmetic_operations.cpp](Multiply) aclrtSynchronizeDevice error = "
-                          + std::to_string(error);
-        const char* detail = aclGetRecentErrMsg();
-        if (detail && strlen(detail) > 0) msg += " - " + std::string(detail);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         throw std::runtime_error(msg);
     }
 
-    // 6. 释放 workspace
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-
     return out;
 }
 
@@ -357,13 +314,19 @@ NPUArray Multiply(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtyp
 NPUArray Divide(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dtype) {
     // 1. 广播输出形状
     auto out_shape = GetBroadcastShape(x1, x2);
-    auto out_dtype = dtype.value_or(x1.dtype);
+    // 真除法：与 NumPy 一致，整型/布尔输入在 float64 上计算
+    aclDataType common = ResultType(x1, x2);
+    PromotedOperands in(x1, x2, IsIntegralType(common) ? ACL_DOUBLE : common);
+    auto out_dtype = dtype.value_or(NPUArray::GetPyDtype(in.dtype));
     auto out = NPUArray(out_shape, out_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
 
     // 2. 获取 workspace
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnDivGetWorkspaceSize(x1.tensorPtr, x2.tensorPtr, out.tensorPtr, &workspaceSize, &executor);
+    auto error = asnumpy::npu::profiler::Plan("Div", aclnnDivGetWorkspaceSize, in.x1().tensorPtr, in.x2().tensorPtr, out.tensorPtr, &workspaceSize, &executor);
     if (error != ACL_SUCCESS) {
         std::string msg = "[arithmetic_operations.cpp](Divide) aclnnDivGetWorkspaceSize error = "
                           + std::to_string(error);
@@ -375,7 +338,7 @@ NPUArray Divide(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype>
     // 3. 分配 workspace
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string msg = "[arithmetic_operations.cpp](Divide) aclrtMalloc error = "
                               + std::to_string(error);
@@ -386,32 +349,15 @@ NPUArray Divide(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype>
     }
 
     // 4. 执行算子
-    error = aclnnDiv(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnDiv, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
         std::string msg = "[arithmetic_operations.cpp](Divide) aclnnDiv error = "
                           + std::to_string(error);
         const char* detail = aclGetRecentErrMsg();
         if (detail && strlen(detail) > 0) msg += " - " + std::string(detail);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         throw std::runtime_error(msg);
     }
 
-    // 5. 同步设备
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        std::string msg = "[arithmetic_operations.cpp](Divide) aclrtSynchronizeDevice error = "
-                          + std::to_string(error);
-        const char* detail = aclGetRecentErrMsg();
-        if (detail && strlen(detail) > 0) msg += " - " + std::string(detail);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error(msg);
-    }
-
-    // 6. 释放 workspace
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-
     return out;
 }
 
@@ -428,8 +374,12 @@ NPUArray TrueDivide(const NPUArray& x1, const NPUArray& x2, std::optional<py::dt
 NPUArray Subtract(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dtype) {
     // 1. 广播输出形状
     auto out_shape = GetBroadcastShape(x1, x2);
-    auto out_dtype = dtype.value_or(x1.dtype);
+    PromotedOperands in(x1, x2);
+    auto out_dtype = dtype.value_or(NPUArray::GetPyDtype(in.dtype));
     auto out = NPUArray(out_shape, out_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
 
     // 2. 创建 alpha = 1 标量
     int32_t one = 1;
@@ -441,8 +391,8 @@ NPUArray Subtract(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtyp
     // 3. 获取 workspace
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnSubGetWorkspaceSize(
-        x1.tensorPtr, x2.tensorPtr, alpha_scalar, out.tensorPtr,
+    auto error = asnumpy::npu::profiler::Plan("Sub", aclnnSubGetWorkspaceSize,
+        in.x1().tensorPtr, in.x2().tensorPtr, alpha_scalar, out.tensorPtr,
         &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
@@ -457,7 +407,7 @@ NPUArray Subtract(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtyp
     // 4. 分配 workspace
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string msg = "[arithmetic_operations.cpp](Subtract) aclrtMalloc error = "
                               + std::to_string(error);
@@ -469,33 +419,18 @@ NPUArray Subtract(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtyp
     }
 
     // 5. 执行算子
-    error = aclnnSub(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnSub, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
         std::string msg = "[arithmetic_operations.cpp](Subtract) aclnnSub error = "
                           + std::to_string(error);
         const char* detail = aclGetRecentErrMsg();
         if (detail && std::strlen(detail) > 0) msg += " - " + std::string(detail);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         aclDestroyScalar(alpha_scalar);
         throw std::runtime_error(msg);
     }
 
-    // 6. 同步
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        std::string msg = "[arithmetic_operations.cpp](Subtract) aclrtSynchronizeDevice error = "
-                          + std::to_string(error);
-        const char* detail = aclGetRecentErrMsg();
-        if (detail && std::strlen(detail) > 0) msg += " - " + std::string(detail);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        aclDestroyScalar(alpha_scalar);
-        throw std::runtime_error(msg);
-    }
 
     // 7. 释放资源
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
     aclDestroyScalar(alpha_scalar);
 
     return out;
@@ -507,14 +442,18 @@ NPUArray Subtract(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtyp
 NPUArray FloorDivide(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dtype) {
     // 1. 广播输出形状
     auto out_shape = GetBroadcastShape(x1, x2);
-    auto out_dtype = dtype.value_or(x1.dtype);
+    PromotedOperands in(x1, x2);
+    auto out_dtype = dtype.value_or(NPUArray::GetPyDtype(in.dtype));
     auto out = NPUArray(out_shape, out_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
 
     // 2. 获取 workspace
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnFloorDivideGetWorkspaceSize(
-        x1.tensorPtr, x2.tensorPtr, out.tensorPtr,
+    auto error = asnumpy::npu::profiler::Plan("FloorDivide", aclnnFloorDivideGetWorkspaceSize,
+        in.x1().tensorPtr, in.x2().tensorPtr, out.tensorPtr,
         &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
@@ -528,7 +467,7 @@ NPUArray FloorDivide(const NPUArray& x1, const NPUArray& x2, std::optional<py::d
     // 3. 分配 workspace
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string msg = "[arithmetic_operations.cpp](FloorDivide) aclrtMalloc error = "
                               + std::to_string(error);
@@ -539,32 +478,15 @@ NPUArray FloorDivide(const NPUArray& x1, const NPUArray& x2, std::optional<py::d
     }
 
     // 4. 执行算子
-    error = aclnnFloorDivide(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnFloorDivide, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
         std::string msg = "[arithmetic_operations.cpp](FloorDivide) aclnnFloorDivide error = "
                           + std::to_string(error);
         const char* detail = aclGetRecentErrMsg();
         if (detail && strlen(detail) > 0) msg += " - " + std::string(detail);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error(msg);
-    }
-
-    // 5. 同步设备
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        std::string msg = "[arithmetic_operations.cpp](FloorDivide) aclrtSynchronizeDevice error = "
-                          + std::to_string(error);
-        const char* detail = aclGetRecentErrMsg();
-        if (detail && strlen(detail) > 0) msg += " - " + std::string(detail);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         throw std::runtime_error(msg);
     }
 
-    // 6. 释放 workspace
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-
     return out;
 }
 
@@ -572,14 +494,18 @@ NPUArray FloorDivide(const NPUArray& x1, const NPUArray& x2, std::optional<py::d
  * @brief Element-wise power using aclnnPowTensorTensor.
  */
 NPUArray Power(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dtype) {
-    py::dtype out_dtype = dtype.value_or(x1.dtype);
+    PromotedOperands in(x1, x2);
+    py::dtype out_dtype = dtype.value_or(NPUArray::GetPyDtype(in.dtype));
     auto out_shape = GetBroadcastShape(x1, x2);
     auto out = NPUArray(out_shape, out_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnPowTensorTensorGetWorkspaceSize(
-        x1.tensorPtr, x2.tensorPtr, out.tensorPtr,
+    auto error = asnumpy::npu::profiler::Plan("PowTensorTensor", aclnnPowTensorTensorGetWorkspaceSize,
+        in.x1().tensorPtr, in.x2().tensorPtr, out.tensorPtr,
         &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
@@ -589,22 +515,19 @@ NPUArray Power(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype>
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error("[arithmetic_operations.cpp](Power TensorTensor) aclrtMalloc error = " +
                                      std::to_string(error));
         }
     }
 
-    error = aclnnPowTensorTensor(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnPowTensorTensor, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         throw std::runtime_error("[arithmetic_operations.cpp](Power TensorTensor) error = " +
                                  std::to_string(error));
     }
 
-    aclrtSynchronizeDevice();
-    if (workspaceAddr) aclrtFree(workspaceAddr);
     return out;
 }
 
@@ -630,7 +553,7 @@ NPUArray Power(const py::object& x1, const NPUArray& x2, std::optional<py::dtype
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnPowScalarTensorGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("PowScalarTensor", aclnnPowScalarTensorGetWorkspaceSize,
         x1_scalar, x2.tensorPtr, out.tensorPtr,
         &workspaceSize, &executor
     );
@@ -642,7 +565,7 @@ NPUArray Power(const py::object& x1, const NPUArray& x2, std::optional<py::dtype
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             aclDestroyScalar(x1_scalar);
             throw std::runtime_error("[arithmetic_operations.cpp](Power ScalarTensor) aclrtMalloc error = " +
@@ -650,16 +573,13 @@ NPUArray Power(const py::object& x1, const NPUArray& x2, std::optional<py::dtype
         }
     }
 
-    error = aclnnPowScalarTensor(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnPowScalarTensor, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         aclDestroyScalar(x1_scalar);
         throw std::runtime_error("[arithmetic_operations.cpp](Power ScalarTensor) error = " +
                                  std::to_string(error));
     }
 
-    aclrtSynchronizeDevice();
-    if (workspaceAddr) aclrtFree(workspaceAddr);
     aclDestroyScalar(x1_scalar);
     return out;
 }
@@ -680,13 +600,16 @@ NPUArray Power(const NPUArray& x1, const py::object& x2, std::optional<py::dtype
                                  std::string(e.what()));
     }
 
-    aclScalar* x2_scalar = CreateScalar(value, ACL_FLOAT);
     py::dtype out_dtype = dtype.value_or(x1.dtype);
     auto out = NPUArray(x1.shape, out_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
+    aclScalar* x2_scalar = CreateScalar(value, ACL_FLOAT);
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnPowTensorScalarGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("PowTensorScalar", aclnnPowTensorScalarGetWorkspaceSize,
         x1.tensorPtr, x2_scalar, out.tensorPtr,
         &workspaceSize, &executor
     );
@@ -698,7 +621,7 @@ NPUArray Power(const NPUArray& x1, const py::object& x2, std::optional<py::dtype
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             aclDestroyScalar(x2_scalar);
             throw std::runtime_error("[arithmetic_operations.cpp](Power TensorScalar) aclrtMalloc error = " +
@@ -706,16 +629,13 @@ NPUArray Power(const NPUArray& x1, const py::object& x2, std::optional<py::dtype
         }
     }
 
-    error = aclnnPowTensorScalar(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnPowTensorScalar, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         aclDestroyScalar(x2_scalar);
         throw std::runtime_error("[arithmetic_operations.cpp](Power TensorScalar) error = " +
                                  std::to_string(error));
     }
 
-    aclrtSynchronizeDevice();
-    if (workspaceAddr) aclrtFree(workspaceAddr);
     aclDestroyScalar(x2_scalar);
     return out;
 }
@@ -726,18 +646,23 @@ NPUArray Power(const NPUArray& x1, const py::object& x2, std::optional<py::dtype
 NPUArray FloatPower(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dtype) {
     auto out_shape = GetBroadcastShape(x1, x2);
 
-    // 输出必须是浮点，默认 float32
-    py::dtype out_dtype = dtype.value_or(py::dtype::of<float>());
+    // 输出必须是浮点：默认 float32，输入提升为 float64 时为 float64
+    aclDataType common = ResultType(x1, x2) == ACL_DOUBLE ? ACL_DOUBLE : ACL_FLOAT;
+    py::dtype out_dtype = dtype.value_or(NPUArray::GetPyDtype(common));
     if (!(out_dtype.is(py::dtype::of<float>()) || out_dtype.is(py::dtype::of<double>()))) {
         throw std::runtime_error("[arithmetic_operations.cpp](FloatPower) dtype must be float or double");
     }
 
     auto out = NPUArray(out_shape, out_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
+    PromotedOperands in(x1, x2, out.aclDtype);
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnPowTensorTensorGetWorkspaceSize(
-        x1.tensorPtr, x2.tensorPtr, out.tensorPtr, &workspaceSize, &executor
+    auto error = asnumpy::npu::profiler::Plan("PowTensorTensor", aclnnPowTensorTensorGetWorkspaceSize,
+        in.x1().tensorPtr, in.x2().tensorPtr, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
         std::string msg = "[arithmetic_operations.cpp](FloatPower) aclnnPowTensorTensorGetWorkspaceSize error = "
@@ -747,31 +672,19 @@ NPUArray FloatPower(const NPUArray& x1, const NPUArray& x2, std::optional<py::dt
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error("[arithmetic_operations.cpp](FloatPower) aclrtMalloc error = "
                                      + std::to_string(error));
         }
     }
 
-    error = aclnnPowTensorTensor(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnPowTensorTensor, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         throw std::runtime_error("[arithmetic_operations.cpp](FloatPower) aclnnPowTensorTensor error = "
                                  + std::to_string(error));
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error("[arithmetic_operations.cpp](FloatPower) aclrtSynchronizeDevice error = "
-                                 + std::to_string(error));
-    }
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-
     return out;
 }
 
@@ -781,17 +694,23 @@ NPUArray FloatPower(const NPUArray& x1, const NPUArray& x2, std::optional<py::dt
 NPUArray Fmod(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dtype) {
     auto out_shape = GetBroadcastShape(x1, x2);
 
-    py::dtype out_dtype = dtype.value_or(py::dtype::of<float>());
+    // 默认 float32，输入提升为 float64 时为 float64
+    aclDataType common = ResultType(x1, x2) == ACL_DOUBLE ? ACL_DOUBLE : ACL_FLOAT;
+    py::dtype out_dtype = dtype.value_or(NPUArray::GetPyDtype(common));
     if (!(out_dtype.is(py::dtype::of<float>()) || out_dtype.is(py::dtype::of<double>()))) {
         throw std::runtime_error("[arithmetic_operations.cpp](Fmod) dtype must be float or double");
     }
 
     auto out = NPUArray(out_shape, out_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
+    PromotedOperands in(x1, x2, out.aclDtype);
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnFmodTensorGetWorkspaceSize(
-        x1.tensorPtr, x2.tensorPtr, out.tensorPtr, &workspaceSize, &executor
+    auto error = asnumpy::npu::profiler::Plan("FmodTensor", aclnnFmodTensorGetWorkspaceSize,
+        in.x1().tensorPtr, in.x2().tensorPtr, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
         std::string msg = "[arithmetic_operations.cpp](Fmod) aclnnFmodTensorGetWorkspaceSize error = "
@@ -801,31 +720,19 @@ NPUArray Fmod(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> d
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error("[arithmetic_operations.cpp](Fmod) aclrtMalloc error = "
                                      + std::to_string(error));
         }
     }
 
-    error = aclnnFmodTensor(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnFmodTensor, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         throw std::runtime_error("[arithmetic_operations.cpp](Fmod) aclnnFmodTensor error = "
                                  + std::to_string(error));
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error("[arithmetic_operations.cpp](Fmod) aclrtSynchronizeDevice error = "
-                                 + std::to_string(error));
-    }
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-
     return out;
 }
 
@@ -835,17 +742,23 @@ NPUArray Fmod(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> d
 NPUArray Mod(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dtype) {
     auto out_shape = GetBroadcastShape(x1, x2);
 
-    py::dtype out_dtype = dtype.value_or(py::dtype::of<float>());
+    // 默认 float32，输入提升为 float64 时为 float64
+    aclDataType common = ResultType(x1, x2) == ACL_DOUBLE ? ACL_DOUBLE : ACL_FLOAT;
+    py::dtype out_dtype = dtype.value_or(NPUArray::GetPyDtype(common));
     if (!(out_dtype.is(py::dtype::of<float>()) || out_dtype.is(py::dtype::of<double>()))) {
         throw std::runtime_error("[arithmetic_operations.cpp](Mod) dtype must be float or double");
     }
 
     auto out = NPUArray(out_shape, out_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
+    PromotedOperands in(x1, x2, out.aclDtype);
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnRemainderTensorTensorGetWorkspaceSize(
-        x1.tensorPtr, x2.tensorPtr, out.tensorPtr, &workspaceSize, &executor
+    auto error = asnumpy::npu::profiler::Plan("RemainderTensorTensor", aclnnRemainderTensorTensorGetWorkspaceSize,
+        in.x1().tensorPtr, in.x2().tensorPtr, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
         std::string msg = "[arithmetic_operations.cpp](Mod) aclnnRemainderTensorTensorGetWorkspaceSize error = "
@@ -855,31 +768,19 @@ NPUArray Mod(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dt
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error("[arithmetic_operations.cpp](Mod) aclrtMalloc error = "
                                      + std::to_string(error));
         }
     }
 
-    error = aclnnRemainderTensorTensor(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnRemainderTensorTensor, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         throw std::runtime_error("[arithmetic_operations.cpp](Mod) aclnnRemainderTensorTensor error = "
                                  + std::to_string(error));
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error("[arithmetic_operations.cpp](Mod) aclrtSynchronizeDevice error = "
-                                 + std::to_string(error));
-    }
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-
     return out;
 }
 
@@ -897,7 +798,7 @@ std::pair<NPUArray, NPUArray> Modf(const NPUArray& x) {
     // === Floor ===
     uint64_t floor_ws = 0;
     aclOpExecutor* floor_exec = nullptr;
-    auto error = aclnnFloorGetWorkspaceSize(x.tensorPtr, int_part.tensorPtr, &floor_ws, &floor_exec);
+    auto error = asnumpy::npu::profiler::Plan("Floor", aclnnFloorGetWorkspaceSize, x.tensorPtr, int_part.tensorPtr, &floor_ws, &floor_exec);
     if (error != ACL_SUCCESS) {
         throw std::runtime_error("[arithmetic_operations.cpp](Modf) aclnnFloorGetWorkspaceSize error = " +
                                  std::to_string(error));
@@ -905,20 +806,18 @@ std::pair<NPUArray, NPUArray> Modf(const NPUArray& x) {
 
     void* floor_ws_addr = nullptr;
     if (floor_ws > 0) {
-        error = aclrtMalloc(&floor_ws_addr, floor_ws, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&floor_ws_addr, floor_ws);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error("[arithmetic_operations.cpp](Modf) aclrtMalloc for floor error = " +
                                      std::to_string(error));
         }
     }
 
-    error = aclnnFloor(floor_ws_addr, floor_ws, floor_exec, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnFloor, floor_ws_addr, floor_ws, floor_exec, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (floor_ws_addr) aclrtFree(floor_ws_addr);
         throw std::runtime_error("[arithmetic_operations.cpp](Modf) aclnnFloor error = " +
                                  std::to_string(error));
     }
-    if (floor_ws_addr) aclrtFree(floor_ws_addr);
 
     // === Sub (frac = x - int_part) ===
     uint64_t sub_ws = 0;
@@ -929,7 +828,7 @@ std::pair<NPUArray, NPUArray> Modf(const NPUArray& x) {
         throw std::runtime_error("[arithmetic_operations.cpp](Modf) Failed to create alpha scalar");
     }
 
-    error = aclnnSubGetWorkspaceSize(x.tensorPtr, int_part.tensorPtr, alpha, frac_part.tensorPtr, &sub_ws, &sub_exec);
+    error = asnumpy::npu::profiler::Plan("Sub", aclnnSubGetWorkspaceSize, x.tensorPtr, int_part.tensorPtr, alpha, frac_part.tensorPtr, &sub_ws, &sub_exec);
     if (error != ACL_SUCCESS) {
         aclDestroyScalar(alpha);
         throw std::runtime_error("[arithmetic_operations.cpp](Modf) aclnnSubGetWorkspaceSize error = " +
@@ -938,7 +837,7 @@ std::pair<NPUArray, NPUArray> Modf(const NPUArray& x) {
 
     void* sub_ws_addr = nullptr;
     if (sub_ws > 0) {
-        error = aclrtMalloc(&sub_ws_addr, sub_ws, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&sub_ws_addr, sub_ws);
         if (error != ACL_SUCCESS) {
             aclDestroyScalar(alpha);
             throw std::runtime_error("[arithmetic_operations.cpp](Modf) aclrtMalloc for sub error = " +
@@ -946,24 +845,15 @@ std::pair<NPUArray, NPUArray> Modf(const NPUArray& x) {
         }
     }
 
-    error = aclnnSub(sub_ws_addr, sub_ws, sub_exec, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnSub, sub_ws_addr, sub_ws, sub_exec, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (sub_ws_addr) aclrtFree(sub_ws_addr);
         aclDestroyScalar(alpha);
         throw std::runtime_error("[arithmetic_operations.cpp](Modf) aclnnSub error = " +
                                  std::to_string(error));
     }
 
-    if (sub_ws_addr) aclrtFree(sub_ws_addr);
     aclDestroyScalar(alpha);
 
-    // === 同步设备 ===
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        throw std::runtime_error("[arithmetic_operations.cpp](Modf) aclrtSynchronizeDevice error = " +
-                                 std::to_string(error));
-    }
-
     return {frac_part, int_part};
 }
 
@@ -978,8 +868,9 @@ NPUArray Remainder(const NPUArray& x1, const NPUArray& x2, std::optional<py::dty
  * @brief Element-wise divmod using aclnnDivMod (mode=2) + Multiply/Subtract.
  */
 std::pair<NPUArray, NPUArray> Divmod(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dtype) {
-    // 1. 确定输出 dtype（默认和 x1 一致）
-    py::dtype out_dtype = dtype.value_or(x1.dtype);
+    // 1. 确定输出 dtype（默认为两个输入提升后的类型）
+    PromotedOperands in(x1, x2);
+    py::dtype out_dtype = dtype.value_or(NPUArray::GetPyDtype(in.dtype));
 
     // 2. 广播后的输出形状
     auto out_shape = GetBroadcastShape(x1, x2);
@@ -989,8 +880,8 @@ std::pair<NPUArray, NPUArray> Divmod(const NPUArray& x1, const NPUArray& x2, std
 
     uint64_t ws_size = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnDivModGetWorkspaceSize(
-        x1.tensorPtr, x2.tensorPtr, /*mode=*/2,
+    auto error = asnumpy::npu::profiler::Plan("DivMod", aclnnDivModGetWorkspaceSize,
+        in.x1().tensorPtr, in.x2().tensorPtr, /*mode=*/2,
         quotient.tensorPtr, &ws_size, &executor
     );
     if (error != ACL_SUCCESS) {
@@ -1000,37 +891,271 @@ std::pair<NPUArray, NPUArray> Divmod(const NPUArray& x1, const NPUArray& x2, std
 
     void* ws_addr = nullptr;
     if (ws_size > 0ULL) {
-        error = aclrtMalloc(&ws_addr, ws_size, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&ws_addr, ws_size);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error("[arithmetic_operations.cpp](Divmod) aclrtMalloc error = "
                                      + std::to_string(error));
         }
     }
 
-    error = aclnnDivMod(ws_addr, ws_size, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnDivMod, ws_addr, ws_size, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (ws_addr) {
-            aclrtFree(ws_addr);
-        }
         throw std::runtime_error("[arithmetic_operations.cpp](Divmod) aclnnDivMod error = "
                                  + std::to_string(error));
     }
-    if (ws_addr) {
-        aclrtFree(ws_addr);
-    }
 
     // 4. 余数 r = x1 - q * x2
     NPUArray qx2 = Multiply(quotient, x2, out_dtype);
     NPUArray remainder = Subtract(x1, qx2, out_dtype);
 
-    // 5. 同步
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        throw std::runtime_error("[arithmetic_operations.cpp](Divmod) aclrtSynchronizeDevice error = "
-                                 + std::to_string(error));
+    return {quotient, remainder};
+}
+
+namespace {
+
+/**
+ * @brief Plan and launch one aclnn kernel on the current stream.
+ */
+template <typename GetWorkspaceSize, typename Kernel, typename... Args>
+void Launch(const char* name, GetWorkspaceSize getWorkspaceSize, Kernel kernel, Args... args) {
+    uint64_t workspaceSize = 0;
+    aclOpExecutor* executor = nullptr;
+    auto error = asnumpy::npu::profiler::Plan(name, getWorkspaceSize, args..., &workspaceSize, &executor);
+    CheckGetWorkspaceSizeAclnnStatus(error);
+    void* workspaceAddr = nullptr;
+    if (workspaceSize > 0) {
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
+        CheckMallocAclnnStatus(error);
+    }
+    error = asnumpy::npu::profiler::Launch(kernel, workspaceAddr, workspaceSize, executor,
+                                           asnumpy::npu::GetCurrentStream());
+    CheckAclnnStatus(error, fmt::format("[arithmetic_operations.cpp]({}) kernel launch failed.", name));
+}
+
+/**
+ * @brief Launch an aclnnInplace* kernel that updates self with other.
+ */
+template <typename GetWorkspaceSize, typename Kernel, typename... Args>
+void LaunchInplace(const char* name, NPUArray& self, const NPUArray& other,
+                   GetWorkspaceSize getWorkspaceSize, Kernel kernel, Args... args) {
+    if (GetBroadcastShape(self, other) != self.shape) {
+        throw std::invalid_argument(fmt::format(
+            "[arithmetic_operations.cpp]({}) non-broadcastable output operand: "
+            "the result would not fit the in-place operand's shape", name));
+    }
+    if (self.tensorSize == 0) {
+        return;
+    }
+    Launch(name, getWorkspaceSize, kernel, self.tensorPtr, other.tensorPtr, args...);
+}
+
+/// alpha = 1 for aclnnInplaceAdd/aclnnInplaceSub, created once and kept for the process.
+aclScalar* UnitAlpha() {
+    static aclScalar* alpha = [] {
+        int32_t one = 1;
+        return aclCreateScalar(&one, ACL_INT32);
+    }();
+    return alpha;
+}
+
+aclDataType ResolveDtype(std::optional<py::dtype> dtype, const NPUArray& x, const py::object& scalar,
+                         bool trueDivide = false) {
+    aclDataType resolved = WeakScalarDtype(x.aclDtype, scalar);
+    if (trueDivide && IsIntegralType(resolved)) {
+        resolved = ACL_DOUBLE;
     }
+    return dtype.has_value() ? NPUArray::GetACLDataType(*dtype) : resolved;
+}
 
-    return {quotient, remainder};
+/**
+ * @brief out = x op scalar with one of the tensor-scalar kernels (scalar in out's dtype).
+ *
+ * The aclScalar comes from the shared scalar cache and is not destroyed here.
+ */
+template <typename GetWorkspaceSize, typename Kernel, typename... Extra>
+NPUArray TensorScalar(const char* name, const NPUArray& x, const py::object& scalar, aclDataType dtype,
+                      GetWorkspaceSize getWorkspaceSize, Kernel kernel, Extra... extra) {
+    auto out = NPUArray(x.shape, dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
+    aclScalar* other = GetCachedScalar(scalar, dtype);
+    Launch(name, getWorkspaceSize, kernel, x.tensorPtr, other, extra..., out.tensorPtr);
+    return out;
+}
+
+/**
+ * @brief A 0-d array holding scalar, for the reversed ops that have no scalar-tensor kernel.
+ */
+NPUArray ScalarArray(const py::object& scalar, aclDataType dtype) {
+    return Full({}, scalar, NPUArray::GetPyDtype(dtype));
+}
+
+}
+
+NPUArray Add(const NPUArray& x, const py::object& scalar, std::optional<py::dtype> dtype) {
+    return TensorScalar("Adds", x, scalar, ResolveDtype(dtype, x, scalar),
+                        aclnnAddsGetWorkspaceSize, aclnnAdds, UnitAlpha());
+}
+
+NPUArray Subtract(const NPUArray& x, const py::object& scalar, std::optional<py::dtype> dtype) {
+    return TensorScalar("Subs", x, scalar, ResolveDtype(dtype, x, scalar),
+                        aclnnSubsGetWorkspaceSize, aclnnSubs, UnitAlpha());
+}
+
+NPUArray Subtract(const py::object& scalar, const NPUArray& x, std::optional<py::dtype> dtype) {
+    // aclnnRsubs: out = scalar - alpha * x
+    return TensorScalar("Rsubs", x, scalar, ResolveDtype(dtype, x, scalar),
+                        aclnnRsubsGetWorkspaceSize, aclnnRsubs, UnitAlpha());
 }
 
-}
\ No newline at end of file
+NPUArray Multiply(const NPUArray& x, const py::object& scalar, std::optional<py::dtype> dtype) {
+    return TensorScalar("Muls", x, scalar, ResolveDtype(dtype, x, scalar),
+                        aclnnMulsGetWorkspaceSize, aclnnMuls);
+}
+
+NPUArray Divide(const NPUArray& x, const py::object& scalar, std::optional<py::dtype> dtype) {
+    return TensorScalar("Divs", x, scalar, ResolveDtype(dtype, x, scalar, true),
+                        aclnnDivsGetWorkspaceSize, aclnnDivs);
+}
+
+NPUArray Divide(const py::object& scalar, const NPUArray& x, std::optional<py::dtype> dtype) {
+    // scalar / x = scalar * (1 / x), computed in place on the reciprocal
+    aclDataType outDtype = ResolveDtype(dtype, x, scalar, true);
+    auto out = Reciprocal(x, NPUArray::GetPyDtype(outDtype));
+    if (out.tensorSize == 0) {
+        return out;
+    }
+    aclScalar* other = GetCachedScalar(scalar, outDtype);
+    Launch("Divide", aclnnInplaceMulsGetWorkspaceSize, aclnnInplaceMuls, out.tensorPtr, other);
+    return out;
+}
+
+NPUArray FloorDivide(const NPUArray& x, const py::object& scalar, std::optional<py::dtype> dtype) {
+    return TensorScalar("FloorDivides", x, scalar, ResolveDtype(dtype, x, scalar),
+                        aclnnFloorDividesGetWorkspaceSize, aclnnFloorDivides);
+}
+
+NPUArray FloorDivide(const py::object& scalar, const NPUArray& x, std::optional<py::dtype> dtype) {
+    aclDataType outDtype = ResolveDtype(dtype, x, scalar);
+    return FloorDivide(ScalarArray(scalar, outDtype), x, NPUArray::GetPyDtype(outDtype));
+}
+
+NPUArray Mod(const NPUArray& x, const py::object& scalar, std::optional<py::dtype> dtype) {
+    return TensorScalar("RemainderTensorScalar", x, scalar, ResolveDtype(dtype, x, scalar),
+                        aclnnRemainderTensorScalarGetWorkspaceSize, aclnnRemainderTensorScalar);
+}
+
+NPUArray Mod(const py::object& scalar, const NPUArray& x, std::optional<py::dtype> dtype) {
+    aclDataType outDtype = ResolveDtype(dtype, x, scalar);
+    auto out = NPUArray(x.shape, outDtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
+    aclScalar* self = GetCachedScalar(scalar, outDtype);
+    Launch("RemainderScalarTensor", aclnnRemainderScalarTensorGetWorkspaceSize, aclnnRemainderScalarTensor,
+           self, x.tensorPtr, out.tensorPtr);
+    return out;
+}
+
+NPUArray Fmod(const NPUArray& x, const py::object& scalar, std::optional<py::dtype> dtype) {
+    return TensorScalar("FmodScalar", x, scalar, ResolveDtype(dtype, x, scalar),
+                        aclnnFmodScalarGetWorkspaceSize, aclnnFmodScalar);
+}
+
+void InplaceAdd(NPUArray& x1, const NPUArray& x2) {
+    LaunchInplace("InplaceAdd", x1, x2, aclnnInplaceAddGetWorkspaceSize, aclnnInplaceAdd, UnitAlpha());
+}
+
+void InplaceSubtract(NPUArray& x1, const NPUArray& x2) {
+    LaunchInplace("InplaceSubtract", x1, x2, aclnnInplaceSubGetWorkspaceSize, aclnnInplaceSub, UnitAlpha());
+}
+
+void InplaceMultiply(NPUArray& x1, const NPUArray& x2) {
+    LaunchInplace("InplaceMultiply", x1, x2, aclnnInplaceMulGetWorkspaceSize, aclnnInplaceMul);
+}
+
+void InplaceDivide(NPUArray& x1, const NPUArray& x2) {
+    LaunchInplace("InplaceDivide", x1, x2, aclnnInplaceDivGetWorkspaceSize, aclnnInplaceDiv);
+}
+
+void InplaceFloorDivide(NPUArray& x1, const NPUArray& x2) {
+    LaunchInplace("InplaceFloorDivide", x1, x2, aclnnInplaceFloorDivideGetWorkspaceSize, aclnnInplaceFloorDivide);
+}
+
+void InplacePower(NPUArray& x1, const NPUArray& x2) {
+    LaunchInplace("InplacePower", x1, x2, aclnnInplacePowTensorTensorGetWorkspaceSize,
+                  aclnnInplacePowTensorTensor);
+}
+
+void InplaceFmod(NPUArray& x1, const NPUArray& x2) {
+    LaunchInplace("InplaceFmod", x1, x2, aclnnInplaceFmodTensorGetWorkspaceSize, aclnnInplaceFmodTensor);
+}
+
+void InplaceRemainder(NPUArray& x1, const NPUArray& x2) {
+    LaunchInplace("InplaceRemainder", x1, x2, aclnnInplaceRemainderTensorTensorGetWorkspaceSize,
+                  aclnnInplaceRemainderTensorTensor);
+}
+
+namespace {
+
+/**
+ * @brief Launch an aclnnInplace* tensor-scalar kernel on self, the scalar in self's dtype.
+ */
+template <typename GetWorkspaceSize, typename Kernel, typename... Extra>
+void LaunchInplaceScalar(const char* name, NPUArray& self, const py::object& scalar,
+                         GetWorkspaceSize getWorkspaceSize, Kernel kernel, Extra... extra) {
+    aclScalar* other = GetCachedScalar(scalar, self.aclDtype);
+    if (self.tensorSize == 0) {
+        return;
+    }
+    Launch(name, getWorkspaceSize, kernel, self.tensorPtr, other, extra...);
+}
+
+}
+
+void InplaceAdd(NPUArray& x, const py::object& scalar) {
+    LaunchInplaceScalar("InplaceAdds", x, scalar, aclnnInplaceAddsGetWorkspaceSize, aclnnInplaceAdds, UnitAlpha());
+}
+
+void InplaceSubtract(NPUArray& x, const py::object& scalar) {
+    LaunchInplaceScalar("InplaceSubs", x, scalar, aclnnInplaceSubsGetWorkspaceSize, aclnnInplaceSubs, UnitAlpha());
+}
+
+void InplaceMultiply(NPUArray& x, const py::object& scalar) {
+    LaunchInplaceScalar("InplaceMuls", x, scalar, aclnnInplaceMulsGetWorkspaceSize, aclnnInplaceMuls);
+}
+
+void InplaceDivide(NPUArray& x, const py::object& scalar) {
+    LaunchInplaceScalar("InplaceDivs", x, scalar, aclnnInplaceDivsGetWorkspaceSize, aclnnInplaceDivs);
+}
+
+void InplaceFloorDivide(NPUArray& x, const py::object& scalar) {
+    // 没有 tensor-scalar 的原地内核，标量以 0 维数组广播
+    InplaceFloorDivide(x, ScalarArray(scalar, x.aclDtype));
+}
+
+void InplacePower(NPUArray& x, const py::object& scalar) {
+    LaunchInplaceScalar("InplacePowTensorScalar", x, scalar, aclnnInplacePowTensorScalarGetWorkspaceSize,
+                        aclnnInplacePowTensorScalar);
+}
+
+void InplaceRemainder(NPUArray& x, const py::object& scalar) {
+    InplaceRemainder(x, ScalarArray(scalar, x.aclDtype));
+}
+
+void InplaceReciprocal(NPUArray& x) {
+    if (x.tensorSize == 0) {
+        return;
+    }
+    Launch("InplaceReciprocal", aclnnInplaceReciprocalGetWorkspaceSize, aclnnInplaceReciprocal, x.tensorPtr);
+}
+
+void InplaceNegative(NPUArray& x) {
+    if (x.tensorSize == 0) {
+        return;
+    }
+    Launch("InplaceNeg", aclnnInplaceNegGetWorkspaceSize, aclnnInplaceNeg, x.tensorPtr);
+}
+
+}
@@ -18,6 +18,9 @@
 #include <asnumpy/math/exponents_and_logarithms.hpp>
 #include <asnumpy/utils/npu_array.hpp>
 #include <asnumpy/utils/status_handler.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/profiler.hpp>
 
 #include <acl/acl.h>
 #include <aclnn/aclnn_base.h>
@@ -44,19 +47,20 @@ namespace asnumpy {
             aclType = ACL_DOUBLE;
         }
         auto result = NPUArray(shape, aclType);
+        if (result.tensorSize == 0) {
+            return result;
+        }
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor;
-        auto error = aclnnExpGetWorkspaceSize(x.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
+        auto error = asnumpy::npu::profiler::Plan("Exp", aclnnExpGetWorkspaceSize, x.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
         CheckGetWorkspaceSizeAclnnStatus(error);
         void* workspaceAddr = nullptr;
         if(workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
-        error = aclnnExp(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnExp, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnExp error");
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
         return result;
     }
 
@@ -68,19 +72,20 @@ namespace asnumpy {
             aclType = ACL_DOUBLE;
         }
         auto result = NPUArray(shape, aclType);
+        if (result.tensorSize == 0) {
+            return result;
+        }
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor;
-        auto error = aclnnExpm1GetWorkspaceSize(x.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
+        auto error = asnumpy::npu::profiler::Plan("Expm1", aclnnExpm1GetWorkspaceSize, x.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
         CheckGetWorkspaceSizeAclnnStatus(error);
         void* workspaceAddr = nullptr;
         if(workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
-        error = aclnnExpm1(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnExpm1, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnExpm1 error");
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
         return result;
     }
 
@@ -91,19 +96,20 @@ namespace asnumpy {
             aclType = x.aclDtype;
         }
         auto result = NPUArray(shape, aclType);
+        if (result.tensorSize == 0) {
+            return result;
+        }
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor;
-        auto error = aclnnExp2GetWorkspaceSize(x.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
+        auto error = asnumpy::npu::profiler::Plan("Exp2", aclnnExp2GetWorkspaceSize, x.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
         CheckGetWorkspaceSizeAclnnStatus(error);
         void* workspaceAddr = nullptr;
         if(workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
-        error = aclnnExp2(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnExp2, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnExp2 error");
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
         return result;
     }
 
@@ -114,19 +120,20 @@ namespace asnumpy {
             aclType = x.aclDtype;
         }
         auto result = NPUArray(shape, aclType);
+        if (result.tensorSize == 0) {
+            return result;
+        }
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor;
-        auto error = aclnnLogGetWorkspaceSize(x.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
+        auto error = asnumpy::npu::profiler::Plan("Log", aclnnLogGetWorkspaceSize, x.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
         CheckGetWorkspaceSizeAclnnStatus(error);
         void* workspaceAddr = nullptr;
         if(workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
-        error = aclnnLog(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnLog, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnLog error");
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
         return result;
     }
 
@@ -137,19 +144,20 @@ namespace asnumpy {
             aclType = x.aclDtype;
         }
         auto result = NPUArray(shape, aclType);
+        if (result.tensorSize == 0) {
+            return result;
+        }
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor;
-        auto error = aclnnLog10GetWorkspaceSize(x.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
+        auto error = asnumpy::npu::profiler::Plan("Log10", aclnnLog10GetWorkspaceSize, x.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
         CheckGetWorkspaceSizeAclnnStatus(error);
         void* workspaceAddr = nullptr;
         if(workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
-        error = aclnnLog10(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnLog10, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnLog10 error");
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
         return result;
     }
 
@@ -160,19 +168,20 @@ namespace asnumpy {
             aclType = x.aclDtype;
         }
         auto result = NPUArray(shape, aclType);
+        if (result.tensorSize == 0) {
+            return result;
+        }
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor;
-        auto error = aclnnLog2GetWorkspaceSize(x.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
+        auto error = asnumpy::npu::profiler::Plan("Log2", aclnnLog2GetWorkspaceSize, x.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
         CheckGetWorkspaceSizeAclnnStatus(error);
         void* workspaceAddr = nullptr;
         if(workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
-        error = aclnnLog2(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnLog2, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnLog2 error");
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
         return result;
     }
 
@@ -183,19 +192,20 @@ namespace asnumpy {
             aclType = x.aclDtype;
         }
         auto result = NPUArray(shape, aclType);
+        if (result.tensorSize == 0) {
+            return result;
+        }
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor;
-        auto error = aclnnLog1pGetWorkspaceSize(x.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
+        auto error = asnumpy::npu::profiler::Plan("Log1p", aclnnLog1pGetWorkspaceSize, x.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
         CheckGetWorkspaceSizeAclnnStatus(error);
         void* workspaceAddr = nullptr;
         if(workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
-        error = aclnnLog1p(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnLog1p, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnLog1p error");
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
         return result;
     }
 
@@ -204,17 +214,15 @@ namespace asnumpy {
         auto result = NPUArray(broadcast, ACL_FLOAT);
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor;
-        auto error = aclnnLogAddExpGetWorkspaceSize(x1.tensorPtr, x2.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
+        auto error = asnumpy::npu::profiler::Plan("LogAddExp", aclnnLogAddExpGetWorkspaceSize, x1.tensorPtr, x2.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
         CheckGetWorkspaceSizeAclnnStatus(error);
         void* workspaceAddr = nullptr;
         if(workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
-        error = aclnnLogAddExp(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnLogAddExp, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnLogAddExp error");
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
         return result;
     }
 
@@ -223,17 +231,69 @@ namespace asnumpy {
         auto result = NPUArray(broadcast, ACL_FLOAT);
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor;
-        auto error = aclnnLogAddExp2GetWorkspaceSize(x1.tensorPtr, x2.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
+        auto error = asnumpy::npu::profiler::Plan("LogAddExp2", aclnnLogAddExp2GetWorkspaceSize, x1.tensorPtr, x2.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
         CheckGetWorkspaceSizeAclnnStatus(error);
         void* workspaceAddr = nullptr;
         if(workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
-        error = aclnnLogAddExp2(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnLogAddExp2, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnLogAddExp2 error");
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
         return result;
     }
-}
\ No newline at end of file
+
+    namespace {
+
+    /**
+     * @brief Plan and launch an aclnnInplace* unary kernel on x.
+     */
+    template <typename GetWorkspaceSize, typename Kernel>
+    void LaunchInplace(const char* name, NPUArray& x, GetWorkspaceSize getWorkspaceSize, Kernel kernel) {
+        if (x.tensorSize == 0) {
+            return;
+        }
+        uint64_t workspaceSize = 0;
+        aclOpExecutor* executor = nullptr;
+        auto error = asnumpy::npu::profiler::Plan(name, getWorkspaceSize, x.tensorPtr, &workspaceSize, &executor);
+        CheckGetWorkspaceSizeAclnnStatus(error);
+        void* workspaceAddr = nullptr;
+        if (workspaceSize != 0ULL) {
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
+            CheckMallocAclnnStatus(error);
+        }
+        error = asnumpy::npu::profiler::Launch(kernel, workspaceAddr, workspaceSize, executor,
+                                               asnumpy::npu::GetCurrentStream());
+        CheckAclnnStatus(error, fmt::format("aclnn{} error", name));
+    }
+
+    }
+
+    void InplaceExp(NPUArray& x) {
+        LaunchInplace("InplaceExp", x, aclnnInplaceExpGetWorkspaceSize, aclnnInplaceExp);
+    }
+
+    void InplaceExpm1(NPUArray& x) {
+        LaunchInplace("InplaceExpm1", x, aclnnInplaceExpm1GetWorkspaceSize, aclnnInplaceExpm1);
+    }
+
+    void InplaceExp2(NPUArray& x) {
+        LaunchInplace("InplaceExp2", x, aclnnInplaceExp2GetWorkspaceSize, aclnnInplaceExp2);
+    }
+
+    void InplaceLog(NPUArray& x) {
+        LaunchInplace("InplaceLog", x, aclnnInplaceLogGetWorkspaceSize, aclnnInplaceLog);
+    }
+
+    void InplaceLog10(NPUArray& x) {
+        LaunchInplace("InplaceLog10", x, aclnnInplaceLog10GetWorkspaceSize, aclnnInplaceLog10);
+    }
+
+    void InplaceLog2(NPUArray& x) {
+        LaunchInplace("InplaceLog2", x, aclnnInplaceLog2GetWorkspaceSize, aclnnInplaceLog2);
+    }
+
+    void InplaceLog1p(NPUArray& x) {
+        LaunchInplace("InplaceLog1p", x, aclnnInplaceLog1pGetWorkspaceSize, aclnnInplaceLog1p);
+    }
+}
@@ -16,6 +16,9 @@
 
 
 #include <asnumpy/math/floating_point_routines.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/profiler.hpp>
 
 #include <acl/acl.h>
 #include <aclnn/aclnn_base.h>
@@ -35,7 +38,7 @@ NPUArray Signbit(const NPUArray& x) {
     // 获取工作空间大小
     uint64_t workspace_size = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnSignbitGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("Signbit", aclnnSignbitGetWorkspaceSize,
         x.tensorPtr,
         result.tensorPtr,
         &workspace_size,
@@ -48,29 +51,23 @@ NPUArray Signbit(const NPUArray& x) {
     // 分配工作空间
     void* workspace = nullptr;
     if (workspace_size > 0ULL) {
-        error = aclrtMalloc(&workspace, workspace_size, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspace, workspace_size);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format("Signbit: malloc workspace failed, error={}", error));
         }
     }
 
     // 执行符号位检查（检测是否为负数）
-    error = aclnnSignbit(
+    error = asnumpy::npu::profiler::Launch(aclnnSignbit,
         workspace,
         workspace_size,
         executor,
-        nullptr  // 无需回调
+        asnumpy::npu::GetCurrentStream()
     );
     if (error != ACL_SUCCESS) {
         throw std::runtime_error(fmt::format("Signbit: computation failed, error={}", error));
     }
 
-    // 同步设备并释放资源
-    aclrtSynchronizeDevice();
-    if (workspace != nullptr) {
-        aclrtFree(workspace);
-    }
-
     return result;
 }
 
@@ -17,6 +17,9 @@
 
 #include <asnumpy/math/handling_complex_numbers.hpp>
 #include <asnumpy/utils/status_handler.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/profiler.hpp>
 
 #include <acl/acl.h>
 #include <aclnn/aclnn_base.h>
@@ -36,17 +39,15 @@ namespace asnumpy{
         auto result = NPUArray(shape, aclType);
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor;
-        auto error = aclnnRealGetWorkspaceSize(val.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
+        auto error = asnumpy::npu::profiler::Plan("Real", aclnnRealGetWorkspaceSize, val.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
         CheckGetWorkspaceSizeAclnnStatus(error);
         void* workspaceAddr = nullptr;
         if(workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
-        error = aclnnReal(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnReal, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnReal error");
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
         return result;
     }
 }
\ No newline at end of file
@@ -16,6 +16,9 @@
 
 
 #include <asnumpy/math/hyperbolic_functions.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/profiler.hpp>
 
 #include <acl/acl.h>
 #include <aclnn/aclnn_base.h>
@@ -50,11 +53,14 @@ NPUArray Sinh(const NPUArray& x, std::optional<py::dtype> dtype) {
         out_dtype = NPUArray::GetACLDataType(out_py_dtype);
     }
     NPUArray result(shape, out_py_dtype);
+    if (result.tensorSize == 0) {
+        return result;
+    }
 
     // 获取工作空间大小
     uint64_t workspace_size = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnSinhGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("Sinh", aclnnSinhGetWorkspaceSize,
         x.tensorPtr,
         result.tensorPtr,
         &workspace_size,
@@ -67,29 +73,23 @@ NPUArray Sinh(const NPUArray& x, std::optional<py::dtype> dtype) {
     // 分配工作空间
     void* workspace = nullptr;
     if (workspace_size > 0) {
-        error = aclrtMalloc(&workspace, workspace_size, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspace, workspace_size);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format("Sinh: malloc workspace failed, error={}", error));
         }
     }
 
     // 执行双曲正弦计算
-    error = aclnnSinh(
+    error = asnumpy::npu::profiler::Launch(aclnnSinh,
         workspace,
         workspace_size,
         executor,
-        nullptr  // 无需回调
+        asnumpy::npu::GetCurrentStream()
     );
     if (error != ACL_SUCCESS) {
         throw std::runtime_error(fmt::format("Sinh: computation failed, error={}", error));
     }
 
-    // 同步设备并释放资源
-    aclrtSynchronizeDevice();
-    if (workspace != nullptr) {
-        aclrtFree(workspace);
-    }
-
     return result;
 }
 
@@ -112,11 +112,14 @@ NPUArray Cosh(const NPUArray& x, std::optional<py::dtype> dtype) {
         out_dtype = NPUArray::GetACLDataType(out_py_dtype);
     }
     NPUArray result(shape, out_py_dtype);
+    if (result.tensorSize == 0) {
+        return result;
+    }
 
     // 获取工作空间大小
     uint64_t workspace_size = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnCoshGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("Cosh", aclnnCoshGetWorkspaceSize,
         x.tensorPtr,
         result.tensorPtr,
         &workspace_size,
@@ -129,29 +132,23 @@ NPUArray Cosh(const NPUArray& x, std::optional<py::dtype> dtype) {
     // 分配工作空间
     void* workspace = nullptr;
     if (workspace_size > 0) {
-        error = aclrtMalloc(&workspace, workspace_size, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspace, workspace_size);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format("Cosh: malloc workspace failed, error={}", error));
         }
     }
 
     // 执行双曲余弦计算
-    error = aclnnCosh(
+    error = asnumpy::npu::profiler::Launch(aclnnCosh,
         workspace,
         workspace_size,
         executor,
-        nullptr  // 无需回调
+        asnumpy::npu::GetCurrentStream()
     );
     if (error != ACL_SUCCESS) {
         throw std::runtime_error(fmt::format("Cosh: computation failed, error={}", error));
     }
 
-    // 同步设备并释放资源
-    aclrtSynchronizeDevice();
-    if (workspace != nullptr) {
-        aclrtFree(workspace);
-    }
-
     return result;
 }
 
@@ -174,11 +171,14 @@ NPUArray Tanh(const NPUArray& x, std::optional<py::dtype> dtype) {
         out_dtype = NPUArray::GetACLDataType(out_py_dtype);
     }
     NPUArray result(shape, out_py_dtype);
+    if (result.tensorSize == 0) {
+        return result;
+    }
 
     // 获取工作空间大小
     uint64_t workspace_size = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnTanhGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("Tanh", aclnnTanhGetWorkspaceSize,
         x.tensorPtr,
         result.tensorPtr,
         &workspace_size,
@@ -191,29 +191,23 @@ NPUArray Tanh(const NPUArray& x, std::optional<py::dtype> dtype) {
     // 分配工作空间
     void* workspace = nullptr;
     if (workspace_size > 0) {
-        error = aclrtMalloc(&workspace, workspace_size, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspace, workspace_size);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format("Tanh: malloc workspace failed, error={}", error));
         }
     }
 
     // 执行双曲正切计算
-    error = aclnnTanh(
+    error = asnumpy::npu::profiler::Launch(aclnnTanh,
         workspace,
         workspace_size,
         executor,
-        nullptr  // 无需回调
+        asnumpy::npu::GetCurrentStream()
     );
     if (error != ACL_SUCCESS) {
         throw std::runtime_error(fmt::format("Tanh: computation failed, error={}", error));
     }
 
-    // 同步设备并释放资源
-    aclrtSynchronizeDevice();
-    if (workspace != nullptr) {
-        aclrtFree(workspace);
-    }
-
     return result;
 }
 
@@ -236,11 +230,14 @@ NPUArray Arcsinh(const NPUArray& x, std::optional<py::dtype> dtype) {
         out_dtype = NPUArray::GetACLDataType(out_py_dtype);
     }
     NPUArray result(shape, out_py_dtype);
+    if (result.tensorSize == 0) {
+        return result;
+    }
 
     // 获取工作空间大小
     uint64_t workspace_size = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnAsinhGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("Asinh", aclnnAsinhGetWorkspaceSize,
         x.tensorPtr,
         result.tensorPtr,
         &workspace_size,
@@ -253,29 +250,23 @@ NPUArray Arcsinh(const NPUArray& x, std::optional<py::dtype> dtype) {
     // 分配工作空间
     void* workspace = nullptr;
     if (workspace_size > 0) {
-        error = aclrtMalloc(&workspace, workspace_size, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspace, workspace_size);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format("Arcsinh: malloc workspace failed, error={}", error));
         }
     }
 
     // 执行反双曲正弦计算
-    error = aclnnAsinh(
+    error = asnumpy::npu::profiler::Launch(aclnnAsinh,
         workspace,
         workspace_size,
         executor,
-        nullptr  // 无需回调
+        asnumpy::npu::GetCurrentStream()
     );
     if (error != ACL_SUCCESS) {
         throw std::runtime_error(fmt::format("Arcsinh: computation failed, error={}", error));
     }
 
-    // 同步设备并释放资源
-    aclrtSynchronizeDevice();
-    if (workspace != nullptr) {
-        aclrtFree(workspace);
-    }
-
     return result;
 }
 
@@ -298,11 +289,14 @@ NPUArray Arccosh(const NPUArray& x, std::optional<py::dtype> dtype) {
         out_dtype = NPUArray::GetACLDataType(out_py_dtype);
     }
     NPUArray result(shape, out_py_dtype);
+    if (result.tensorSize == 0) {
+        return result;
+    }
 
     // 获取工作空间大小
     uint64_t workspace_size = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnAcoshGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("Acosh", aclnnAcoshGetWorkspaceSize,
         x.tensorPtr,
         result.tensorPtr,
         &workspace_size,
@@ -315,29 +309,23 @@ NPUArray Arccosh(const NPUArray& x, std::optional<py::dtype> dtype) {
     // 分配工作空间
     void* workspace = nullptr;
     if (workspace_size > 0) {
-        error = aclrtMalloc(&workspace, workspace_size, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspace, workspace_size);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format("Arccosh: malloc workspace failed, error={}", error));
         }
     }
 
     // 执行反双曲余弦计算
-    error = aclnnAcosh(
+    error = asnumpy::npu::profiler::Launch(aclnnAcosh,
         workspace,
         workspace_size,
         executor,
-        nullptr  // 无需回调
+        asnumpy::npu::GetCurrentStream()
     );
     if (error != ACL_SUCCESS) {
         throw std::runtime_error(fmt::format("Arccosh: computation failed, error={}", error));
     }
 
-    // 同步设备并释放资源
-    aclrtSynchronizeDevice();
-    if (workspace != nullptr) {
-        aclrtFree(workspace);
-    }
-
     return result;
 }
 
@@ -359,11 +347,14 @@ NPUArray Arctanh(const NPUArray& x, std::optional<py::dtype> dtype) {
         out_dtype = NPUArray::GetACLDataType(out_py_dtype);
     }
     NPUArray result(x.shape, out_py_dtype);
+    if (result.tensorSize == 0) {
+        return result;
+    }
 
     // 获取工作空间大小
     uint64_t workspace_size = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnAtanhGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("Atanh", aclnnAtanhGetWorkspaceSize,
         x.tensorPtr,
         result.tensorPtr,
         &workspace_size,
@@ -376,30 +367,79 @@ NPUArray Arctanh(const NPUArray& x, std::optional<py::dtype> dtype) {
     // 分配工作空间
     void* workspace = nullptr;
     if (workspace_size > 0) {
-        error = aclrtMalloc(&workspace, workspace_size, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspace, workspace_size);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format("Arctanh: malloc workspace failed, error={}", error));
         }
     }
 
     // 执行反双曲正切计算
-    error = aclnnAtanh(
+    error = asnumpy::npu::profiler::Launch(aclnnAtanh,
         workspace,
         workspace_size,
         executor,
-        nullptr  // 无需回调
+        asnumpy::npu::GetCurrentStream()
     );
     if (error != ACL_SUCCESS) {
         throw std::runtime_error(fmt::format("Arctanh: computation failed, error={}", error));
     }
 
-    // 同步设备并释放资源
-    aclrtSynchronizeDevice();
-    if (workspace != nullptr) {
-        aclrtFree(workspace);
+    return result;
+}
+
+namespace {
+
+/**
+ * @brief Plan and launch an aclnnInplace* unary kernel on x.
+ */
+template <typename GetWorkspaceSize, typename Kernel>
+void LaunchInplace(const char* name, NPUArray& x, GetWorkspaceSize getWorkspaceSize, Kernel kernel) {
+    if (x.tensorSize == 0) {
+        return;
+    }
+    uint64_t workspaceSize = 0;
+    aclOpExecutor* executor = nullptr;
+    auto error = asnumpy::npu::profiler::Plan(name, getWorkspaceSize, x.tensorPtr, &workspaceSize, &executor);
+    if (error != ACL_SUCCESS) {
+        throw std::runtime_error(fmt::format("{}: get workspace size failed, error={}", name, error));
+    }
+    void* workspaceAddr = nullptr;
+    if (workspaceSize > 0) {
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
+        if (error != ACL_SUCCESS) {
+            throw std::runtime_error(fmt::format("{}: malloc workspace failed, error={}", name, error));
+        }
     }
+    error = asnumpy::npu::profiler::Launch(kernel, workspaceAddr, workspaceSize, executor,
+                                           asnumpy::npu::GetCurrentStream());
+    if (error != ACL_SUCCESS) {
+        throw std::runtime_error(fmt::format("{}: computation failed, error={}", name, error));
+    }
+}
 
-    return result;
 }
 
-}
\ No newline at end of file
+void InplaceSinh(NPUArray& x) {
+    LaunchInplace("InplaceSinh", x, aclnnInplaceSinhGetWorkspaceSize, aclnnInplaceSinh);
+}
+
+void InplaceCosh(NPUArray& x) {
+    LaunchInplace("InplaceCosh", x, aclnnInplaceCoshGetWorkspaceSize, aclnnInplaceCosh);
+}
+
+void InplaceTanh(NPUArray& x) {
+    LaunchInplace("InplaceTanh", x, aclnnInplaceTanhGetWorkspaceSize, aclnnInplaceTanh);
+}
+
+void InplaceArcsinh(NPUArray& x) {
+    LaunchInplace("InplaceAsinh", x, aclnnInplaceAsinhGetWorkspaceSize, aclnnInplaceAsinh);
+}
+
+void InplaceArccosh(NPUArray& x) {
+    LaunchInplace("InplaceAcosh", x, aclnnInplaceAcoshGetWorkspaceSize, aclnnInplaceAcosh);
+}
+
+void InplaceArctanh(NPUArray& x) {
+    LaunchInplace("InplaceAtanh", x, aclnnInplaceAtanhGetWorkspaceSize, aclnnInplaceAtanh);
+}
+}
@@ -18,6 +18,10 @@
 #include <asnumpy/math/miscellaneous.hpp>
 #include <asnumpy/utils/npu_array.hpp>
 #include <asnumpy/utils/npu_ops_macros.hpp>
+#include <asnumpy/utils/type_promotion.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/profiler.hpp>
 
 #include <acl/acl.h>
 #include <aclnn/aclnn_base.h>
@@ -46,7 +50,7 @@ namespace asnumpy {
     auto temp = NPUArray(shape1, a.aclDtype);
     uint64_t workspaceSize1 = 0;
     aclOpExecutor* executor1;
-    auto error1 = aclnnFlipGetWorkspaceSize(a.tensorPtr, dims_acl, temp.tensorPtr, &workspaceSize1, &executor1);
+    auto error1 = asnumpy::npu::profiler::Plan("Flip", aclnnFlipGetWorkspaceSize, a.tensorPtr, dims_acl, temp.tensorPtr, &workspaceSize1, &executor1);
     if (error1 != ACL_SUCCESS) {
         std::string error_msg = "[miscellaneous.cpp](convolve) aclnnFlipGetWorkspaceSize error = " + std::to_string(error1);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -59,7 +63,7 @@ namespace asnumpy {
 
     void* workspaceAddr1 = nullptr;
     if(workspaceSize1 > 0) {
-        error1 = aclrtMalloc(&workspaceAddr1, workspaceSize1, ACL_MEM_MALLOC_HUGE_FIRST);
+        error1 = asnumpy::npu::GetWorkspace(&workspaceAddr1, workspaceSize1);
         if (error1 != ACL_SUCCESS) {
             std::string error_msg = "[miscellaneous.cpp](convolve) aclrtMalloc error = " + std::to_string(error1);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -68,23 +72,13 @@ namespace asnumpy {
         }
     }
 
-    error1 = aclnnFlip(workspaceAddr1, workspaceSize1, executor1, nullptr);
+    error1 = asnumpy::npu::profiler::Launch(aclnnFlip, workspaceAddr1, workspaceSize1, executor1, asnumpy::npu::GetCurrentStream());
     if (error1 != ACL_SUCCESS) {
         std::string error_msg = "[miscellaneous.cpp](convolve) aclnnFlip error = " + std::to_string(error1);
         const char* detailed_msg = aclGetRecentErrMsg();
         if (detailed_msg && std::strlen(detailed_msg) > 0) error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr1) aclrtFree(workspaceAddr1);
         throw std::runtime_error(error_msg);
     }
-    error1 = aclrtSynchronizeDevice();
-    if (error1 != ACL_SUCCESS) {
-        std::string error_msg = "[miscellaneous.cpp](convolve) aclrtSynchronizeDevice error = " + std::to_string(error1);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0) error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr1) aclrtFree(workspaceAddr1);
-        throw std::runtime_error(error_msg);
-    }
-    if (workspaceAddr1) aclrtFree(workspaceAddr1);
 
     auto shape2 = v.shape;
     int64_t size = shape1[2] + shape2[2] - 1;
@@ -102,7 +96,7 @@ namespace asnumpy {
     int8_t use_fp16 = 2;
     uint64_t workspaceSize2 = 0;
     aclOpExecutor* executor2;
-    auto error2 = aclnnConvolutionGetWorkspaceSize(temp.tensorPtr, v.tensorPtr, nullptr, strides, pads, dilations, false, outPads, 1, result.tensorPtr, use_fp16, &workspaceSize2, &executor2);
+    auto error2 = asnumpy::npu::profiler::Plan("Convolution", aclnnConvolutionGetWorkspaceSize, temp.tensorPtr, v.tensorPtr, nullptr, strides, pads, dilations, false, outPads, 1, result.tensorPtr, use_fp16, &workspaceSize2, &executor2);
     if (error2 != ACL_SUCCESS) {
         std::string error_msg = "[miscellaneous.cpp](convolve) aclnnConvolutionGetWorkspaceSize error = " + std::to_string(error2);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -115,7 +109,7 @@ namespace asnumpy {
 
     void* workspaceAddr2 = nullptr;
     if(workspaceSize2 > 0) {
-        error2 = aclrtMalloc(&workspaceAddr2, workspaceSize2, ACL_MEM_MALLOC_HUGE_FIRST);
+        error2 = asnumpy::npu::GetWorkspace(&workspaceAddr2, workspaceSize2);
         if (error2 != ACL_SUCCESS) {
             std::string error_msg = "[miscellaneous.cpp](convolve) aclrtMalloc error = " + std::to_string(error2);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -124,24 +118,14 @@ namespace asnumpy {
         }
     }
 
-    error2 = aclnnConvolution(workspaceAddr2, workspaceSize2, executor2, nullptr);
+    error2 = asnumpy::npu::profiler::Launch(aclnnConvolution, workspaceAddr2, workspaceSize2, executor2, asnumpy::npu::GetCurrentStream());
     if (error2 != ACL_SUCCESS) {
         std::string error_msg = "[miscellaneous.cpp](convolve) aclnnConvolution error = " + std::to_string(error2);
         const char* detailed_msg = aclGetRecentErrMsg();
         if (detailed_msg && std::strlen(detailed_msg) > 0) error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr2) aclrtFree(workspaceAddr2);
         throw std::runtime_error(error_msg);
     }
 
-    error2 = aclrtSynchronizeDevice();
-    if (error2 != ACL_SUCCESS) {
-        std::string error_msg = "[miscellaneous.cpp](convolve) aclrtSynchronizeDevice error = " + std::to_string(error2);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0) error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr2) aclrtFree(workspaceAddr2);
-        throw std::runtime_error(error_msg);
-    }
-    if (workspaceAddr2) aclrtFree(workspaceAddr2);
     return result;
 }*/
 
@@ -152,7 +136,7 @@ NPUArray Clip(const NPUArray& a, const NPUArray& a_min, const NPUArray& a_max) {
     auto result = NPUArray(broadcast, ACL_FLOAT);
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor;
-    auto error = aclnnClampTensorGetWorkspaceSize(a.tensorPtr, a_min.tensorPtr, a_max.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
+    auto error = asnumpy::npu::profiler::Plan("ClampTensor", aclnnClampTensorGetWorkspaceSize, a.tensorPtr, a_min.tensorPtr, a_max.tensorPtr, result.tensorPtr, &workspaceSize, &executor);
     if (error != ACL_SUCCESS) {
         std::string error_msg = "[miscellaneous.cpp](clip) aclnnClampTensorGetWorkspaceSize error = " + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -165,7 +149,7 @@ NPUArray Clip(const NPUArray& a, const NPUArray& a_min, const NPUArray& a_max) {
 
     void* workspaceAddr = nullptr;
     if(workspaceSize > 0ULL) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string error_msg = "[miscellaneous.cpp](clip) aclrtMalloc error = " + std::to_string(error);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -174,35 +158,28 @@ NPUArray Clip(const NPUArray& a, const NPUArray& a_min, const NPUArray& a_max) {
         }
     }
 
-    error = aclnnClampTensor(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnClampTensor, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
         std::string error_msg = "[miscellaneous.cpp](clip) aclnnClampTensor error = " + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
         if (detailed_msg && std::strlen(detailed_msg) > 0) error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         throw std::runtime_error(error_msg);
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        std::string error_msg = "[miscellaneous.cpp](clip) aclrtSynchronizeDevice error = " + std::to_string(error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0) error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error(error_msg);
-    }
-    if (workspaceAddr) aclrtFree(workspaceAddr);
     return result;
 }
 
 NPUArray Clip(const NPUArray& a, float a_min, float a_max) {
     auto shape = a.shape;
+    auto result = NPUArray(shape, ACL_FLOAT);
+    if (result.tensorSize == 0) {
+        return result;
+    }
     auto amin_scalar = aclCreateScalar(&a_min, ACL_FLOAT);
     auto amax_scalar = aclCreateScalar(&a_max, ACL_FLOAT);
-    auto result = NPUArray(shape, ACL_FLOAT);
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor;
-    auto error = aclnnClampGetWorkspaceSize(a.tensorPtr, amin_scalar, amax_scalar, result.tensorPtr, &workspaceSize, &executor);
+    auto error = asnumpy::npu::profiler::Plan("Clamp", aclnnClampGetWorkspaceSize, a.tensorPtr, amin_scalar, amax_scalar, result.tensorPtr, &workspaceSize, &executor);
     CheckGetWorkspaceSizeAclnnStatus(error);
     if (workspaceSize < 0ULL) {
         throw std::runtime_error("[miscellaneous.cpp](clip) Invalid workspaceSize: " + std::to_string(workspaceSize));
@@ -210,16 +187,13 @@ NPUArray Clip(const NPUArray& a, float a_min, float a_max) {
 
     void* workspaceAddr = nullptr;
     if(workspaceSize > 0ULL) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         CheckMallocAclnnStatus(error);
     }
 
-    error = aclnnClamp(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnClamp, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     CheckAclnnStatus(error, "aclnnClamp error");
 
-    error = aclrtSynchronizeDevice();
-    CheckSynchronizeDeviceAclnnStatus(error);
-    if (workspaceAddr) aclrtFree(workspaceAddr);
     return result;
 }
 
@@ -229,7 +203,7 @@ NPUArray Clip(const NPUArray& a, float a_min, const NPUArray& a_max) {
     auto temp = NPUArray(shape, ACL_FLOAT);
     uint64_t workspaceSize1 = 0;
     aclOpExecutor* executor1;
-    auto error1 = aclnnClampMinGetWorkspaceSize(a.tensorPtr, amin_scalar, temp.tensorPtr, &workspaceSize1, &executor1);
+    auto error1 = asnumpy::npu::profiler::Plan("ClampMin", aclnnClampMinGetWorkspaceSize, a.tensorPtr, amin_scalar, temp.tensorPtr, &workspaceSize1, &executor1);
     CheckGetWorkspaceSizeAclnnStatus(error1);
     if (workspaceSize1 < 0ULL) {
         throw std::runtime_error("[miscellaneous.cpp](clip) Invalid workspaceSize: " + std::to_string(workspaceSize1));
@@ -237,21 +211,18 @@ NPUArray Clip(const NPUArray& a, float a_min, const NPUArray& a_max) {
 
     void* workspaceAddr1 = nullptr;
     if(workspaceSize1 > 0ULL) {
-        error1 = aclrtMalloc(&workspaceAddr1, workspaceSize1, ACL_MEM_MALLOC_HUGE_FIRST);
+        error1 = asnumpy::npu::GetWorkspace(&workspaceAddr1, workspaceSize1);
         CheckMallocAclnnStatus(error1);
     }
 
-    error1 = aclnnClampMin(workspaceAddr1, workspaceSize1, executor1, nullptr);
+    error1 = asnumpy::npu::profiler::Launch(aclnnClampMin, workspaceAddr1, workspaceSize1, executor1, asnumpy::npu::GetCurrentStream());
     CheckAclnnStatus(error1, "aclnnClampMin error");
-    error1 = aclrtSynchronizeDevice();
-    CheckSynchronizeDeviceAclnnStatus(error1);
-    if (workspaceAddr1) aclrtFree(workspaceAddr1);
 
     auto broadcast = GetBroadcastShape(temp, a_max);
     auto result = NPUArray(broadcast, ACL_FLOAT);
     uint64_t workspaceSize2 = 0;
     aclOpExecutor* executor2;
-    auto error2 = aclnnClampMaxTensorGetWorkspaceSize(temp.tensorPtr, a_max.tensorPtr, result.tensorPtr, &workspaceSize2, &executor2);
+    auto error2 = asnumpy::npu::profiler::Plan("ClampMaxTensor", aclnnClampMaxTensorGetWorkspaceSize, temp.tensorPtr, a_max.tensorPtr, result.tensorPtr, &workspaceSize2, &executor2);
     CheckGetWorkspaceSizeAclnnStatus(error2);
     if (workspaceSize2 < 0) {
         throw std::runtime_error("[miscellaneous.cpp](clip) Invalid workspaceSize: " + std::to_string(workspaceSize2));
@@ -259,16 +230,13 @@ NPUArray Clip(const NPUArray& a, float a_min, const NPUArray& a_max) {
 
     void* workspaceAddr2 = nullptr;
     if(workspaceSize2 > 0) {
-        error2 = aclrtMalloc(&workspaceAddr2, workspaceSize2, ACL_MEM_MALLOC_HUGE_FIRST);
+        error2 = asnumpy::npu::GetWorkspace(&workspaceAddr2, workspaceSize2);
         CheckMallocAclnnStatus(error2);
     }
 
-    error2 = aclnnClampMaxTensor(workspaceAddr2, workspaceSize2, executor2, nullptr);
+    error2 = asnumpy::npu::profiler::Launch(aclnnClampMaxTensor, workspaceAddr2, workspaceSize2, executor2, asnumpy::npu::GetCurrentStream());
     CheckAclnnStatus(error2, "aclnnClampMaxTensor error");
 
-    error2 = aclrtSynchronizeDevice();
-    CheckSynchronizeDeviceAclnnStatus(error2);
-    if (workspaceAddr2) aclrtFree(workspaceAddr2);
     return result;
 }
 
@@ -278,7 +246,7 @@ NPUArray Clip(const NPUArray& a, const NPUArray& a_min, float a_max) {
     auto temp = NPUArray(shape, ACL_FLOAT);
     uint64_t workspaceSize1 = 0;
     aclOpExecutor* executor1;
-    auto error1 = aclnnClampMaxGetWorkspaceSize(a.tensorPtr, amax_scalar, temp.tensorPtr, &workspaceSize1, &executor1);
+    auto error1 = asnumpy::npu::profiler::Plan("ClampMax", aclnnClampMaxGetWorkspaceSize, a.tensorPtr, amax_scalar, temp.tensorPtr, &workspaceSize1, &executor1);
     CheckGetWorkspaceSizeAclnnStatus(error1);
     if (workspaceSize1 < 0ULL) {
         throw std::runtime_error("[miscellaneous.cpp](clip) Invalid workspaceSize: " + std::to_string(workspaceSize1));
@@ -286,21 +254,18 @@ NPUArray Clip(const NPUArray& a, const NPUArray& a_min, float a_max) {
 
     void* workspaceAddr1 = nullptr;
     if(workspaceSize1 > 0ULL) {
-        error1 = aclrtMalloc(&workspaceAddr1, workspaceSize1, ACL_MEM_MALLOC_HUGE_FIRST);
+        error1 = asnumpy::npu::GetWorkspace(&workspaceAddr1, workspaceSize1);
         CheckMallocAclnnStatus(error1);
     }
 
-    error1 = aclnnClampMax(workspaceAddr1, workspaceSize1, executor1, nullptr);
+    error1 = asnumpy::npu::profiler::Launch(aclnnClampMax, workspaceAddr1, workspaceSize1, executor1, asnumpy::npu::GetCurrentStream());
     CheckAclnnStatus(error1, "aclnnClampMax error");
-    error1 = aclrtSynchronizeDevice();
-    CheckSynchronizeDeviceAclnnStatus(error1);
-    if (workspaceAddr1) aclrtFree(workspaceAddr1);
 
     auto broadcast = GetBroadcastShape(a_min, temp);
     auto result = NPUArray(broadcast, ACL_FLOAT);
     uint64_t workspaceSize2 = 0;
     aclOpExecutor* executor2;
-    auto error2 = aclnnClampMinTensorGetWorkspaceSize(temp.tensorPtr, a_min.tensorPtr, result.tensorPtr, &workspaceSize2, &executor2);
+    auto error2 = asnumpy::npu::profiler::Plan("ClampMinTensor", aclnnClampMinTensorGetWorkspaceSize, temp.tensorPtr, a_min.tensorPtr, result.tensorPtr, &workspaceSize2, &executor2);
     CheckGetWorkspaceSizeAclnnStatus(error2);
     if (workspaceSize2 < 0) {
         throw std::runtime_error("[miscellaneous.cpp](clip) Invalid workspaceSize: " + std::to_string(workspaceSize2));
@@ -308,16 +273,13 @@ NPUArray Clip(const NPUArray& a, const NPUArray& a_min, float a_max) {
 
     void* workspaceAddr2 = nullptr;
     if(workspaceSize2 > 0) {
-        error2 = aclrtMalloc(&workspaceAddr2, workspaceSize2, ACL_MEM_MALLOC_HUGE_FIRST);
+        error2 = asnumpy::npu::GetWorkspace(&workspaceAddr2, workspaceSize2);
         CheckMallocAclnnStatus(error2);
     }
 
-    error2 = aclnnClampMinTensor(workspaceAddr2, workspaceSize2, executor2, nullptr);
+    error2 = asnumpy::npu::profiler::Launch(aclnnClampMinTensor, workspaceAddr2, workspaceSize2, executor2, asnumpy::npu::GetCurrentStream());
     CheckAclnnStatus(error2, "aclnnClampMinTensor error");
 
-    error2 = aclrtSynchronizeDevice();
-    CheckSynchronizeDeviceAclnnStatus(error2);
-    if (workspaceAddr2) aclrtFree(workspaceAddr2);
     return result;
 }
 
@@ -329,13 +291,16 @@ NPUArray Square(const NPUArray& x) {
         temp = ACL_DOUBLE;
     }
     NPUArray result(shape, temp);
+    if (result.tensorSize == 0) {
+        return result;
+    }
     float two = 2.0f;
     aclScalar* scalar = aclCreateScalar(&two, ACL_FLOAT);;
 
     // 获取 workspace 大小
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnPowTensorScalarGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("PowTensorScalar", aclnnPowTensorScalarGetWorkspaceSize,
         x.tensorPtr, scalar, result.tensorPtr, &workspaceSize, &executor);
     if (error != ACL_SUCCESS) {
         std::string error_msg = "[miscellaneous.cpp](square) aclnnPowTensorScalarGetWorkspaceSize error = "
@@ -349,7 +314,7 @@ NPUArray Square(const NPUArray& x) {
     // 分配 workspace
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0ULL) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string error_msg = "[miscellaneous.cpp](square) aclrtMalloc error = " + std::to_string(error);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -360,29 +325,17 @@ NPUArray Square(const NPUArray& x) {
     }
 
     // 执行计算
-    error = aclnnPowTensorScalar(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnPowTensorScalar, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
         std::string error_msg = "[miscellaneous.cpp](square) aclnnPowTensorScalar error = " + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
         if (detailed_msg && std::strlen(detailed_msg) > 0) error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         aclDestroyScalar(scalar);
         throw std::runtime_error(error_msg);
     }
 
-    // 同步
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        std::string error_msg = "[miscellaneous.cpp](square) aclrtSynchronizeDevice error = " + std::to_string(error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0) error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        aclDestroyScalar(scalar);
-        throw std::runtime_error(error_msg);
-    }
 
     // 释放资源
-    if (workspaceAddr) aclrtFree(workspaceAddr);
     aclDestroyScalar(scalar);
 
     return result;
@@ -406,6 +359,9 @@ NPUArray Fabs(const NPUArray& x){
  */
 NPUArray Nan_to_num(const NPUArray& x, float nan, py::object posinf, py::object neginf) {
     auto out = NPUArray(x.shape, x.aclDtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
 
     // Convert optional posinf/neginf to floats; use NaN as "not provided" sentinel.
     float pos_val = std::numeric_limits<float>::max();
@@ -416,7 +372,7 @@ NPUArray Nan_to_num(const NPUArray& x, float nan, py::object posinf, py::object
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
 
-    auto error = aclnnNanToNumGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("NanToNum", aclnnNanToNumGetWorkspaceSize,
         x.tensorPtr,          // input
         nan,                  // NaN replacement
         pos_val,              // +inf replacement (NaN sentinel means "use default")
@@ -432,20 +388,13 @@ NPUArray Nan_to_num(const NPUArray& x, float nan, py::object posinf, py::object
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0ULL) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         CheckMallocAclnnStatus(error);
     }
 
-    error = aclnnNanToNum(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnNanToNum, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     CheckAclnnStatus(error, "aclnnNanToNum error");
 
-    error = aclrtSynchronizeDevice();
-    CheckSynchronizeDeviceAclnnStatus(error);
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-
     return out;
 }
 
@@ -462,22 +411,21 @@ NPUArray Nan_to_num(const NPUArray& x, float nan, py::object posinf, py::object
  * @throws std::runtime_error If ACL operation or memory allocation fails.
  */
 NPUArray Maximum(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dtype) {
-    auto out_dtype = x1.dtype;
-    auto acl_dtype = x1.aclDtype;
+    PromotedOperands in(x1, x2);
+    auto out_dtype = NPUArray::GetPyDtype(in.dtype);
     auto shape = GetBroadcastShape(x1, x2);
-    auto temp = NPUArray::GetACLDataType(out_dtype);
-    if (temp == ACL_INT16 || temp == ACL_INT32 || temp == ACL_INT64) {
-        out_dtype = x2.dtype;
-    }
     if (dtype != std::nullopt) {
         out_dtype = *dtype;
     }
     auto out = NPUArray(shape, out_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
 
     // 4. 获取工作空间大小和 executor
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnMaximumGetWorkspaceSize(x1.tensorPtr, x2.tensorPtr, out.tensorPtr, &workspaceSize, &executor);
+    auto error = asnumpy::npu::profiler::Plan("Maximum", aclnnMaximumGetWorkspaceSize, in.x1().tensorPtr, in.x2().tensorPtr, out.tensorPtr, &workspaceSize, &executor);
     if (error != ACL_SUCCESS) {
         std::string error_msg = "[Maximum] aclnnMaximumGetWorkspaceSize error = " + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
@@ -492,7 +440,7 @@ NPUArray Maximum(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype
     // 5. 分配 workspace
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0ULL) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string error_msg = "[Maximum] aclrtMalloc error = " + std::to_string(error);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -503,31 +451,16 @@ NPUArray Maximum(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype
     }
 
     // 6. 执行 Maximum 操作
-    error = aclnnMaximum(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnMaximum, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
         std::string error_msg = "[Maximum] aclnnMaximum error = " + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
         if (detailed_msg && std::strlen(detailed_msg) > 0)
             error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         throw std::runtime_error(error_msg);
     }
 
-    // 7. 同步设备
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        std::string error_msg = "[Maximum] aclrtSynchronizeDevice error = " + std::to_string(error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0)
-            error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error(error_msg);
-    }
 
-    // 8. 释放 workspace
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
 
     // 9. 返回输出
     return out;
@@ -547,22 +480,21 @@ NPUArray Maximum(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype
  * @throws std::runtime_error If ACL operation or memory allocation fails.
  */
 NPUArray Minimum(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dtype) {
-    auto out_dtype = x1.dtype;
-    auto acl_dtype = x1.aclDtype;
+    PromotedOperands in(x1, x2);
+    auto out_dtype = NPUArray::GetPyDtype(in.dtype);
     auto shape = GetBroadcastShape(x1, x2);
-    auto temp = NPUArray::GetACLDataType(out_dtype);
-    if (temp == ACL_INT16 || temp == ACL_INT32 || temp == ACL_INT64) {
-        out_dtype = x2.dtype;
-    }
     if (dtype != std::nullopt) {
         out_dtype = *dtype;
     }
     auto out = NPUArray(shape, out_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnMinimumGetWorkspaceSize(
-        x1.tensorPtr, x2.tensorPtr, out.tensorPtr, &workspaceSize, &executor
+    auto error = asnumpy::npu::profiler::Plan("Minimum", aclnnMinimumGetWorkspaceSize,
+        in.x1().tensorPtr, in.x2().tensorPtr, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
         std::string error_msg = "[miscellaneous.cpp](minimum) aclnnMinimumGetWorkspaceSize error = " + std::to_string(error);
@@ -577,7 +509,7 @@ NPUArray Minimum(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0ULL) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string error_msg = "[miscellaneous.cpp](minimum) aclrtMalloc error = " + std::to_string(error);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -587,50 +519,34 @@ NPUArray Minimum(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype
         }
     }
 
-    error = aclnnMinimum(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnMinimum, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
         std::string error_msg = "[miscellaneous.cpp](minimum) aclnnMinimum error = " + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
         if (detailed_msg && std::strlen(detailed_msg) > 0)
             error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error(error_msg);
-    }
-
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        std::string error_msg = "[miscellaneous.cpp](minimum) aclrtSynchronizeDevice error = " + std::to_string(error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0)
-            error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         throw std::runtime_error(error_msg);
     }
 
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-
     return out;
 }
 
 NPUArray Fmax(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dtype) {
-    auto out_dtype = x1.dtype;
-    auto acl_dtype = x1.aclDtype;
+    PromotedOperands in(x1, x2);
+    auto out_dtype = NPUArray::GetPyDtype(in.dtype);
     auto shape = GetBroadcastShape(x1, x2);
-    auto temp = NPUArray::GetACLDataType(out_dtype);
-    if (temp == ACL_INT16 || temp == ACL_INT32 || temp == ACL_INT64) {
-        out_dtype = x2.dtype;
-    }
     if (dtype != std::nullopt) {
         out_dtype = *dtype;
     }
     auto out = NPUArray(shape, out_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnMaximumGetWorkspaceSize(
-        x1.tensorPtr, x2.tensorPtr, out.tensorPtr, &workspaceSize, &executor
+    auto error = asnumpy::npu::profiler::Plan("Maximum", aclnnMaximumGetWorkspaceSize,
+        in.x1().tensorPtr, in.x2().tensorPtr, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
         std::string error_msg = "[miscellaneous.cpp](fmax) aclnnMaximumGetWorkspaceSize error = " + std::to_string(error);
@@ -645,7 +561,7 @@ NPUArray Fmax(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> d
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0ULL) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string error_msg = "[miscellaneous.cpp](fmax) aclrtMalloc error = " + std::to_string(error);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -655,50 +571,34 @@ NPUArray Fmax(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> d
         }
     }
 
-    error = aclnnMaximum(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnMaximum, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
         std::string error_msg = "[miscellaneous.cpp](fmax) aclnnMaximum error = " + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
         if (detailed_msg && std::strlen(detailed_msg) > 0)
             error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         throw std::runtime_error(error_msg);
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        std::string error_msg = "[miscellaneous.cpp](fmax) aclrtSynchronizeDevice error = " + std::to_string(error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0)
-            error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error(error_msg);
-    }
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-
     return out;
 }
 
 NPUArray Fmin(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dtype) {
-    auto out_dtype = x1.dtype;
-    auto acl_dtype = x1.aclDtype;
+    PromotedOperands in(x1, x2);
+    auto out_dtype = NPUArray::GetPyDtype(in.dtype);
     auto shape = GetBroadcastShape(x1, x2);
-    auto temp = NPUArray::GetACLDataType(out_dtype);
-    if (temp == ACL_INT16 || temp == ACL_INT32 || temp == ACL_INT64) {
-        out_dtype = x2.dtype;
-    }
     if (dtype != std::nullopt) {
         out_dtype = *dtype;
     }
     auto out = NPUArray(shape, out_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnMinimumGetWorkspaceSize(
-        x1.tensorPtr, x2.tensorPtr, out.tensorPtr, &workspaceSize, &executor
+    auto error = asnumpy::npu::profiler::Plan("Minimum", aclnnMinimumGetWorkspaceSize,
+        in.x1().tensorPtr, in.x2().tensorPtr, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
         std::string error_msg = "[miscellaneous.cpp](fmin) aclnnMinimumGetWorkspaceSize error = " + std::to_string(error);
@@ -713,7 +613,7 @@ NPUArray Fmin(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> d
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0ULL) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string error_msg = "[miscellaneous.cpp](fmin) aclrtMalloc error = " + std::to_string(error);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -723,30 +623,15 @@ NPUArray Fmin(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> d
         }
     }
 
-    error = aclnnMinimum(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnMinimum, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
         std::string error_msg = "[miscellaneous.cpp](fmin) aclnnMinimum error = " + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
         if (detailed_msg && std::strlen(detailed_msg) > 0)
             error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         throw std::runtime_error(error_msg);
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        std::string error_msg = "[miscellaneous.cpp](fmin) aclrtSynchronizeDevice error = " + std::to_string(error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0)
-            error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error(error_msg);
-    }
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-
     return out;
 }
 
@@ -19,6 +19,9 @@
 #include <aclnn/aclnn_base.h>
 #include <aclnnop/aclnn_sinc.h>
 #include <asnumpy/math/other_special_functions.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/profiler.hpp>
 #include <fmt/format.h>
 #include <stdexcept>
 
@@ -38,12 +41,15 @@ NPUArray Sinc(const NPUArray& x, std::optional<py::dtype> dtype) {
         out_dtype = NPUArray::GetACLDataType(out_py_dtype);
     }
     NPUArray out(x.shape, out_py_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
 
     // 获取 workspace 和执行器
-    auto error = aclnnSincGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("Sinc", aclnnSincGetWorkspaceSize,
         x.tensorPtr, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
@@ -56,7 +62,7 @@ NPUArray Sinc(const NPUArray& x, std::optional<py::dtype> dtype) {
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string msg = "[other_special_functions.cpp](sinc) aclrtMalloc error = "
                               + std::to_string(error);
@@ -65,27 +71,13 @@ NPUArray Sinc(const NPUArray& x, std::optional<py::dtype> dtype) {
     }
 
     // 执行算子
-    error = aclnnSinc(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnSinc, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         std::string msg = "[other_special_functions.cpp](sinc) aclnnSinc error = "
                           + std::to_string(error);
         throw std::runtime_error(msg);
     }
 
-    // 同步设备
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        std::string msg = "[other_special_functions.cpp](sinc) aclrtSynchronizeDevice error = "
-                          + std::to_string(error);
-        throw std::runtime_error(msg);
-    }
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-
     return out;
 }
 
@@ -17,6 +17,9 @@
 
 #include <asnumpy/math/rational_routines.hpp>
 #include <asnumpy/utils/npu_array.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/profiler.hpp>
 
 #include <acl/acl.h>
 #include <aclnn/aclnn_base.h>
@@ -45,7 +48,7 @@ NPUArray Lcm(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dt
     NPUArray product(shape, out_dtype);
     uint64_t mul_workspace_size = 0;
     aclOpExecutor* mul_executor = nullptr;
-    auto error = aclnnMulGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("Mul", aclnnMulGetWorkspaceSize,
         x1.tensorPtr, x2.tensorPtr,
         product.tensorPtr,
         &mul_workspace_size, &mul_executor
@@ -56,15 +59,14 @@ NPUArray Lcm(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dt
 
     void* mul_workspace = nullptr;
     if (mul_workspace_size > 0) {
-        error = aclrtMalloc(&mul_workspace, mul_workspace_size, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&mul_workspace, mul_workspace_size);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format("Lcm: product workspace malloc failed, error={}", error));
         }
     }
 
-    error = aclnnMul(mul_workspace, mul_workspace_size, mul_executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnMul, mul_workspace, mul_workspace_size, mul_executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        aclrtFree(mul_workspace);
         throw std::runtime_error(fmt::format("Lcm: product computation failed, error={}", error));
     }
 
@@ -72,28 +74,24 @@ NPUArray Lcm(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dt
     NPUArray abs_product(shape, out_dtype);
     uint64_t abs_workspace_size = 0;
     aclOpExecutor* abs_executor = nullptr;
-    error = aclnnAbsGetWorkspaceSize(
+    error = asnumpy::npu::profiler::Plan("Abs", aclnnAbsGetWorkspaceSize,
         product.tensorPtr, abs_product.tensorPtr,
         &abs_workspace_size, &abs_executor
     );
     if (error != ACL_SUCCESS) {
-        aclrtFree(mul_workspace);
         throw std::runtime_error(fmt::format("Lcm: abs workspace size failed, error={}", error));
     }
 
     void* abs_workspace = nullptr;
     if (abs_workspace_size > 0) {
-        error = aclrtMalloc(&abs_workspace, abs_workspace_size, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&abs_workspace, abs_workspace_size);
         if (error != ACL_SUCCESS) {
-            aclrtFree(mul_workspace);
             throw std::runtime_error(fmt::format("Lcm: abs workspace malloc failed, error={}", error));
         }
     }
 
-    error = aclnnAbs(abs_workspace, abs_workspace_size, abs_executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnAbs, abs_workspace, abs_workspace_size, abs_executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        aclrtFree(mul_workspace);
-        aclrtFree(abs_workspace);
         throw std::runtime_error(fmt::format("Lcm: abs computation failed, error={}", error));
     }
 
@@ -104,41 +102,28 @@ NPUArray Lcm(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dt
     NPUArray result(shape, out_dtype);
     uint64_t div_workspace_size = 0;
     aclOpExecutor* div_executor = nullptr;
-    error = aclnnDivGetWorkspaceSize(
+    error = asnumpy::npu::profiler::Plan("Div", aclnnDivGetWorkspaceSize,
         abs_product.tensorPtr, gcd_result.tensorPtr,
         result.tensorPtr,
         &div_workspace_size, &div_executor
     );
     if (error != ACL_SUCCESS) {
-        aclrtFree(mul_workspace);
-        aclrtFree(abs_workspace);
         throw std::runtime_error(fmt::format("Lcm: division workspace size failed, error={}", error));
     }
 
     void* div_workspace = nullptr;
     if (div_workspace_size > 0) {
-        error = aclrtMalloc(&div_workspace, div_workspace_size, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&div_workspace, div_workspace_size);
         if (error != ACL_SUCCESS) {
-            aclrtFree(mul_workspace);
-            aclrtFree(abs_workspace);
             throw std::runtime_error(fmt::format("Lcm: division workspace malloc failed, error={}", error));
         }
     }
 
-    error = aclnnDiv(div_workspace, div_workspace_size, div_executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnDiv, div_workspace, div_workspace_size, div_executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
-        aclrtFree(mul_workspace);
-        aclrtFree(abs_workspace);
-        aclrtFree(div_workspace);
         throw std::runtime_error(fmt::format("Lcm: division computation failed, error={}", error));
     }
 
-    // 同步设备并释放所有资源
-    aclrtSynchronizeDevice();
-    aclrtFree(mul_workspace);
-    aclrtFree(abs_workspace);
-    aclrtFree(div_workspace);
-
     return result;
 }
     
@@ -156,7 +141,7 @@ NPUArray Gcd(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dt
     // 获取工作空间大小
     uint64_t workspace_size = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnGcdGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("Gcd", aclnnGcdGetWorkspaceSize,
         x1.tensorPtr,
         x2.tensorPtr,
         result.tensorPtr,
@@ -170,29 +155,23 @@ NPUArray Gcd(const NPUArray& x1, const NPUArray& x2, std::optional<py::dtype> dt
     // 分配工作空间
     void* workspace = nullptr;
     if (workspace_size > 0) {
-        error = aclrtMalloc(&workspace, workspace_size, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspace, workspace_size);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format("Gcd: malloc workspace failed, error={}", error));
         }
     }
 
     // 执行最大公约数计算
-    error = aclnnGcd(
+    error = asnumpy::npu::profiler::Launch(aclnnGcd,
         workspace,
         workspace_size,
         executor,
-        nullptr  // 无需回调
+        asnumpy::npu::GetCurrentStream()
     );
     if (error != ACL_SUCCESS) {
         throw std::runtime_error(fmt::format("Gcd: computation failed, error={}", error));
     }
 
-    // 同步设备并释放资源
-    aclrtSynchronizeDevice();
-    if (workspace != nullptr) {
-        aclrtFree(workspace);
-    }
-
     return result;
 }
 
@@ -17,6 +17,9 @@
 
 #include <asnumpy/math/rounding.hpp>
 #include <asnumpy/utils/npu_array.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/profiler.hpp>
 
 #include <acl/acl.h>
 #include <aclnn/aclnn_base.h>
@@ -43,6 +46,9 @@ NPUArray Around(const NPUArray& x, int decimals, std::optional<py::dtype> dtype)
         out_dtype = NPUArray::GetACLDataType(out_py_dtype);
     }
     NPUArray out(shape, out_py_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
 
     if (out.tensorPtr == nullptr) {
         throw std::runtime_error("[math.cpp](around) out.tensorPtr is null, failed to allocate output tensor");
@@ -50,7 +56,7 @@ NPUArray Around(const NPUArray& x, int decimals, std::optional<py::dtype> dtype)
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnRoundDecimalsGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("RoundDecimals", aclnnRoundDecimalsGetWorkspaceSize,
         x.tensorPtr, decimals, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
@@ -65,7 +71,7 @@ NPUArray Around(const NPUArray& x, int decimals, std::optional<py::dtype> dtype)
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string error_msg = "[math.cpp](around) aclrtMalloc error = " + std::to_string(error);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -74,35 +80,16 @@ NPUArray Around(const NPUArray& x, int decimals, std::optional<py::dtype> dtype)
         }
     }
 
-    aclrtStream stream = nullptr;
-    error = aclrtCreateStream(&stream);
-    if (error != ACL_SUCCESS || stream == nullptr) {
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error("[math.cpp](around) Failed to get current stream");
-    }
+    aclrtStream stream = asnumpy::npu::GetCurrentStream();
 
-    error = aclnnRoundDecimals(workspaceAddr, workspaceSize, executor, stream);
+    error = asnumpy::npu::profiler::Launch(aclnnRoundDecimals, workspaceAddr, workspaceSize, executor, stream);
     if (error != ACL_SUCCESS) {
         std::string error_msg = "[math.cpp](around) aclnnRoundDecimals error = " + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
         if (detailed_msg && std::strlen(detailed_msg) > 0) error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         throw std::runtime_error(error_msg);
     }
 
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        std::string error_msg = "[math.cpp](around) aclrtSynchronizeDevice error = " + std::to_string(error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0) error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error(error_msg);
-    }
-
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-
     return out;
 }
 
@@ -124,10 +111,13 @@ NPUArray Rint(const NPUArray& x, std::optional<py::dtype> dtype) {
         out_dtype = NPUArray::GetACLDataType(out_py_dtype);
     }
     NPUArray out(shape, out_py_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnRoundGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("Round", aclnnRoundGetWorkspaceSize,
         x.tensorPtr, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
@@ -142,7 +132,7 @@ NPUArray Rint(const NPUArray& x, std::optional<py::dtype> dtype) {
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string error_msg = "[math.cpp](rint) aclrtMalloc error = " + std::to_string(error);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -151,28 +141,14 @@ NPUArray Rint(const NPUArray& x, std::optional<py::dtype> dtype) {
         }
     }
 
-    error = aclnnRound(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnRound, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
         std::string error_msg = "[math.cpp](rint) aclnnRound error = " + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
         if (detailed_msg && std::strlen(detailed_msg) > 0) error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error(error_msg);
-    }
-
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        std::string error_msg = "[math.cpp](rint) aclrtSynchronizeDevice error = " + std::to_string(error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0) error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         throw std::runtime_error(error_msg);
     }
 
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-
     return out;
 }
 
@@ -189,10 +165,13 @@ NPUArray Fix(const NPUArray& x, std::optional<py::dtype> dtype) {
         out_dtype = NPUArray::GetACLDataType(out_py_dtype);
     }
     NPUArray out(shape, out_py_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnTruncGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("Trunc", aclnnTruncGetWorkspaceSize,
         x.tensorPtr, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
@@ -207,7 +186,7 @@ NPUArray Fix(const NPUArray& x, std::optional<py::dtype> dtype) {
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string error_msg = "[math.cpp](fix) aclrtMalloc error = " + std::to_string(error);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -216,28 +195,14 @@ NPUArray Fix(const NPUArray& x, std::optional<py::dtype> dtype) {
         }
     }
 
-    error = aclnnTrunc(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnTrunc, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
         std::string error_msg = "[math.cpp](fix) aclnnTrunc error = " + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
         if (detailed_msg && std::strlen(detailed_msg) > 0) error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error(error_msg);
-    }
-
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        std::string error_msg = "[math.cpp](fix) aclrtSynchronizeDevice error = " + std::to_string(error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0) error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         throw std::runtime_error(error_msg);
     }
 
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-
     return out;
 }
 
@@ -254,10 +219,13 @@ NPUArray Floor(const NPUArray& x, std::optional<py::dtype> dtype) {
         out_dtype = NPUArray::GetACLDataType(out_py_dtype);
     }
     NPUArray out(shape, out_py_dtype);
+    if (out.tensorSize == 0) {
+        return out;
+    }
 
     uint64_t workspaceSize = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnFloorGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("Floor", aclnnFloorGetWorkspaceSize,
         x.tensorPtr, out.tensorPtr, &workspaceSize, &executor
     );
     if (error != ACL_SUCCESS) {
@@ -272,7 +240,7 @@ NPUArray Floor(const NPUArray& x, std::optional<py::dtype> dtype) {
 
     void* workspaceAddr = nullptr;
     if (workspaceSize > 0) {
-        error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
         if (error != ACL_SUCCESS) {
             std::string error_msg = "[math.cpp](floor) aclrtMalloc error = " + std::to_string(error);
             const char* detailed_msg = aclGetRecentErrMsg();
@@ -281,28 +249,14 @@ NPUArray Floor(const NPUArray& x, std::optional<py::dtype> dtype) {
         }
     }
 
-    error = aclnnFloor(workspaceAddr, workspaceSize, executor, nullptr);
+    error = asnumpy::npu::profiler::Launch(aclnnFloor, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
     if (error != ACL_SUCCESS) {
         std::string error_msg = "[math.cpp](floor) aclnnFloor error = " + std::to_string(error);
         const char* detailed_msg = aclGetRecentErrMsg();
         if (detailed_msg && std::strlen(detailed_msg) > 0) error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
-        throw std::runtime_error(error_msg);
-    }
-
-    error = aclrtSynchronizeDevice();
-    if (error != ACL_SUCCESS) {
-        std::string error_msg = "[math.cpp](floor) aclrtSynchronizeDevice error = " + std::to_string(error);
-        const char* detailed_msg = aclGetRecentErrMsg();
-        if (detailed_msg && std::strlen(detailed_msg) > 0) error_msg += " - " + std::string(detailed_msg);
-        if (workspaceAddr) aclrtFree(workspaceAddr);
         throw std::runtime_error(error_msg);
     }
 
-    if (workspaceAddr) {
-        aclrtFree(workspaceAddr);
-    }
-
     return out;
 }
 
@@ -320,11 +274,14 @@ NPUArray Ceil(const NPUArray& x, std::optional<py::dtype> dtype) {
         out_dtype = NPUArray::GetACLDataType(out_py_dtype);
     }
     NPUArray result(shape, out_py_dtype);
+    if (result.tensorSize == 0) {
+        return result;
+    }
 
     // 获取工作空间大小
     uint64_t workspace_size = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnCeilGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("Ceil", aclnnCeilGetWorkspaceSize,
         x.tensorPtr,
         result.tensorPtr,
         &workspace_size,
@@ -337,29 +294,23 @@ NPUArray Ceil(const NPUArray& x, std::optional<py::dtype> dtype) {
     // 分配工作空间
     void* workspace = nullptr;
     if (workspace_size > 0) {
-        error = aclrtMalloc(&workspace, workspace_size, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspace, workspace_size);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format("Ceil: malloc workspace failed, error={}", error));
         }
     }
 
     // 执行向上取整计算
-    error = aclnnCeil(
+    error = asnumpy::npu::profiler::Launch(aclnnCeil,
         workspace,
         workspace_size,
         executor,
-        nullptr  // 无需回调
+        asnumpy::npu::GetCurrentStream()
     );
     if (error != ACL_SUCCESS) {
         throw std::runtime_error(fmt::format("Ceil: computation failed, error={}", error));
     }
 
-    // 同步设备并释放资源
-    aclrtSynchronizeDevice();
-    if (workspace != nullptr) {
-        aclrtFree(workspace);
-    }
-
     return result;
 }
 
@@ -377,11 +328,14 @@ NPUArray Trunc(const NPUArray& x, std::optional<py::dtype> dtype) {
         out_dtype = NPUArray::GetACLDataType(out_py_dtype);
     }
     NPUArray result(shape, out_py_dtype);
+    if (result.tensorSize == 0) {
+        return result;
+    }
 
     // 获取工作空间大小
     uint64_t workspace_size = 0;
     aclOpExecutor* executor = nullptr;
-    auto error = aclnnTruncGetWorkspaceSize(
+    auto error = asnumpy::npu::profiler::Plan("Trunc", aclnnTruncGetWorkspaceSize,
         x.tensorPtr,
         result.tensorPtr,
         &workspace_size,
@@ -394,30 +348,71 @@ NPUArray Trunc(const NPUArray& x, std::optional<py::dtype> dtype) {
     // 分配工作空间
     void* workspace = nullptr;
     if (workspace_size > 0) {
-        error = aclrtMalloc(&workspace, workspace_size, ACL_MEM_MALLOC_HUGE_FIRST);
+        error = asnumpy::npu::GetWorkspace(&workspace, workspace_size);
         if (error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format("Trunc: malloc workspace failed, error={}", error));
         }
     }
 
     // 执行截断计算（保留整数部分，去除小数）
-    error = aclnnTrunc(
+    error = asnumpy::npu::profiler::Launch(aclnnTrunc,
         workspace,
         workspace_size,
         executor,
-        nullptr  // 无需回调
+        asnumpy::npu::GetCurrentStream()
     );
     if (error != ACL_SUCCESS) {
         throw std::runtime_error(fmt::format("Trunc: computation failed, error={}", error));
     }
 
-    // 同步设备并释放资源
-    aclrtSynchronizeDevice();
-    if (workspace != nullptr) {
-        aclrtFree(workspace);
+    return result;
+}
+
+namespace {
+
+/**
+ * @brief Plan and launch an aclnnInplace* unary kernel on x.
+ */
+template <typename GetWorkspaceSize, typename Kernel>
+void LaunchInplace(const char* name, NPUArray& x, GetWorkspaceSize getWorkspaceSize, Kernel kernel) {
+    if (x.tensorSize == 0) {
+        return;
+    }
+    uint64_t workspaceSize = 0;
+    aclOpExecutor* executor = nullptr;
+    auto error = asnumpy::npu::profiler::Plan(name, getWorkspaceSize, x.tensorPtr, &workspaceSize, &executor);
+    if (error != ACL_SUCCESS) {
+        throw std::runtime_error(fmt::format("{}: get workspace size failed, error={}", name, error));
     }
+    void* workspaceAddr = nullptr;
+    if (workspaceSize > 0) {
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
+        if (error != ACL_SUCCESS) {
+            throw std::runtime_error(fmt::format("{}: malloc workspace failed, error={}", name, error));
+        }
+    }
+    error = asnumpy::npu::profiler::Launch(kernel, workspaceAddr, workspaceSize, executor,
+                                           asnumpy::npu::GetCurrentStream());
+    if (error != ACL_SUCCESS) {
+        throw std::runtime_error(fmt::format("{}: computation failed, error={}", name, error));
+    }
+}
 
-    return result;
 }
 
-}
\ No newline at end of file
+void InplaceRint(NPUArray& x) {
+    LaunchInplace("InplaceRound", x, aclnnInplaceRoundGetWorkspaceSize, aclnnInplaceRound);
+}
+
+void InplaceFloor(NPUArray& x) {
+    LaunchInplace("InplaceFloor", x, aclnnInplaceFloorGetWorkspaceSize, aclnnInplaceFloor);
+}
+
+void InplaceCeil(NPUArray& x) {
+    LaunchInplace("InplaceCeil", x, aclnnInplaceCeilGetWorkspaceSize, aclnnInplaceCeil);
+}
+
+void InplaceTrunc(NPUArray& x) {
+    LaunchInplace("InplaceTrunc", x, aclnnInplaceTruncGetWorkspaceSize, aclnnInplaceTrunc);
+}
+}
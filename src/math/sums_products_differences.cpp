@@ -18,12 +18,14 @@
 #include <asnumpy/math/sums_products_differences.hpp>
 #include <asnumpy/utils/npu_array.hpp>
 #include <asnumpy/utils/status_handler.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/profiler.hpp>
 
 #include <acl/acl.h>
 #include <aclnn/aclnn_base.h>
 #include <aclnnop/aclnn_prod.h>
 #include <aclnnop/aclnn_reduce_sum.h>
-#include <aclnnop/aclnn_flatten.h>
 #include <aclnnop/aclnn_reduce_nansum.h>
 #include <aclnnop/aclnn_cumsum.h>
 #include <aclnnop/aclnn_cumprod.h>
@@ -57,56 +59,34 @@ namespace asnumpy {
         auto result = NPUArray(shape, outDtype);
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor;
-        auto error = aclnnProdDimGetWorkspaceSize(a.tensorPtr, axis, keepdims, result.aclDtype, result.tensorPtr, &workspaceSize, &executor);
+        auto error = asnumpy::npu::profiler::Plan("ProdDim", aclnnProdDimGetWorkspaceSize, a.tensorPtr, axis, keepdims, result.aclDtype, result.tensorPtr, &workspaceSize, &executor);
         CheckGetWorkspaceSizeAclnnStatus(error);
         void* workspaceAddr = nullptr;
         if(workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
-        error = aclnnProdDim(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnProdDim, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnProdDim error");
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
         return result;
     }
 
-    double Prod(const NPUArray& a) {
+    NPUArray Prod(const NPUArray& a) {
         std::vector<int64_t> shape = {1};
         auto result = NPUArray(shape, a.aclDtype);
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor;
-        auto error = aclnnProdGetWorkspaceSize(a.tensorPtr, result.aclDtype, result.tensorPtr, &workspaceSize, &executor);
+        auto error = asnumpy::npu::profiler::Plan("Prod", aclnnProdGetWorkspaceSize, a.tensorPtr, result.aclDtype, result.tensorPtr, &workspaceSize, &executor);
         CheckGetWorkspaceSizeAclnnStatus(error);
         void* workspaceAddr = nullptr;
         if(workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
-        error = aclnnProd(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnProd, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnProd error");
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
 
-        py::array temp = result.ToNumpy();
-        py::dtype dt = temp.dtype();
-        py::buffer_info buf = temp.request();
-        if (dt.is(py::dtype::of<int>())) {
-            int* results = static_cast<int*>(buf.ptr);
-            return results[0];
-        } 
-        else if (dt.is(py::dtype::of<double>())) {
-            double* results = static_cast<double*>(buf.ptr);
-            return results[0];
-        }
-        else if (dt.is(py::dtype::of<float>())) {
-            float* results = static_cast<float*>(buf.ptr);
-            return results[0];
-        }
-        else {
-            throw std::runtime_error("Unsupported array data type!");
-        }
-        return 0;
+        return result.Reshape({});
     }
 
     NPUArray Sum(const NPUArray& a, int64_t axis, bool keepdims, std::optional<py::dtype> dtype) {
@@ -127,78 +107,38 @@ namespace asnumpy {
         auto result = NPUArray(shape, outDtype);
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor;
-        auto error = aclnnReduceSumGetWorkspaceSize(a.tensorPtr, axis_array, keepdims, result.aclDtype, result.tensorPtr, &workspaceSize, &executor);
+        auto error = asnumpy::npu::profiler::Plan("ReduceSum", aclnnReduceSumGetWorkspaceSize, a.tensorPtr, axis_array, keepdims, result.aclDtype, result.tensorPtr, &workspaceSize, &executor);
         CheckGetWorkspaceSizeAclnnStatus(error);
         void* workspaceAddr = nullptr;
         if(workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
-        error = aclnnReduceSum(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnReduceSum, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnReduceSum error");
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
         return result;
     }
 
-    double Sum(const NPUArray& a) {
-        std::vector<int64_t> shape = a.shape;
-        int64_t pro = 1;
-        for (int i=0; i<shape.size(); i++){
-            pro = pro * shape[i];
-        }
-        shape = {1, pro};
-        auto temp = NPUArray(shape, a.aclDtype);
-        uint64_t workspaceSize1 = 0;
-        aclOpExecutor* executor1;
-        auto error1 = aclnnFlattenGetWorkspaceSize(a.tensorPtr, 0, temp.tensorPtr, &workspaceSize1, &executor1);
-        CheckGetWorkspaceSizeAclnnStatus(error1);
-        void* workspaceAddr1 = nullptr;
-        if(workspaceSize1 != 0ULL) {
-            error1 = aclrtMalloc(&workspaceAddr1, workspaceSize1, ACL_MEM_MALLOC_HUGE_FIRST);
-            CheckMallocAclnnStatus(error1);
-        }
-        error1 = aclnnFlatten(workspaceAddr1, workspaceSize1, executor1, nullptr);
-        CheckAclnnStatus(error1, "aclnnFlatten error");
-        error1 = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error1);
+    NPUArray Sum(const NPUArray& a) {
+        // 连续数组直接以 (1, size) 视图归约，无需 Flatten 拷贝
+        auto temp = a.Reshape({1, static_cast<int64_t>(a.tensorSize)});
         
         std::vector<int64_t> tmp{1};
         aclIntArray* axis_array = aclCreateIntArray(tmp.data(), tmp.size());
         auto result = NPUArray({1}, a.aclDtype);
         uint64_t workspaceSize2 = 0;
         aclOpExecutor* executor2;
-        auto error2 = aclnnReduceSumGetWorkspaceSize(temp.tensorPtr, axis_array, false, result.aclDtype, result.tensorPtr, &workspaceSize2, &executor2);
+        auto error2 = asnumpy::npu::profiler::Plan("ReduceSum", aclnnReduceSumGetWorkspaceSize, temp.tensorPtr, axis_array, false, result.aclDtype, result.tensorPtr, &workspaceSize2, &executor2);
         CheckGetWorkspaceSizeAclnnStatus(error2);
         void* workspaceAddr2 = nullptr;
         if(workspaceSize2 != 0ULL) {
-            error2 = aclrtMalloc(&workspaceAddr2, workspaceSize2, ACL_MEM_MALLOC_HUGE_FIRST);
+            error2 = asnumpy::npu::GetWorkspace(&workspaceAddr2, workspaceSize2);
             CheckMallocAclnnStatus(error2);
         }
-        error2 = aclnnReduceSum(workspaceAddr2, workspaceSize2, executor2, nullptr);
+        error2 = asnumpy::npu::profiler::Launch(aclnnReduceSum, workspaceAddr2, workspaceSize2, executor2, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error2, "aclnnReduceSum error");
-        error2 = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error2);
         
-        py::array x = result.ToNumpy();
-        py::dtype dt = x.dtype();
-        py::buffer_info buf = x.request();
-        if (dt.is(py::dtype::of<int>())) {
-            int* results = static_cast<int*>(buf.ptr);
-            return results[0];
-        } 
-        else if (dt.is(py::dtype::of<double>())) {
-            double* results = static_cast<double*>(buf.ptr);
-            return results[0];
-        }
-        else if (dt.is(py::dtype::of<float>())) {
-            float* results = static_cast<float*>(buf.ptr);
-            return results[0];
-        }
-        else {
-            throw std::runtime_error("Unsupported array data type!");
-        }
-        return 0;
+        return result.Reshape({});
     }
 
     NPUArray Nanprod(const NPUArray& a, int64_t axis, bool keepdims, std::optional<py::dtype> dtype) {
@@ -219,88 +159,62 @@ namespace asnumpy {
         auto result = NPUArray(shape, outDtype);
         uint64_t workspaceSize1 = 0;
         aclOpExecutor* executor1;
-        auto error1 = aclnnNanToNumGetWorkspaceSize(a.tensorPtr, scalar, 
+        auto error1 = asnumpy::npu::profiler::Plan("NanToNum", aclnnNanToNumGetWorkspaceSize, a.tensorPtr, scalar, 
             std::numeric_limits<float>::infinity(), -std::numeric_limits<float>::infinity(), temp.tensorPtr, &workspaceSize1, &executor1);
         CheckGetWorkspaceSizeAclnnStatus(error1);
         void* workspaceAddr1 = nullptr;
         if(workspaceSize1 != 0ULL) {
-            error1 = aclrtMalloc(&workspaceAddr1, workspaceSize1, ACL_MEM_MALLOC_HUGE_FIRST);
+            error1 = asnumpy::npu::GetWorkspace(&workspaceAddr1, workspaceSize1);
             CheckMallocAclnnStatus(error1);
         }
-        error1 = aclnnNanToNum(workspaceAddr1, workspaceSize1, executor1, nullptr);
+        error1 = asnumpy::npu::profiler::Launch(aclnnNanToNum, workspaceAddr1, workspaceSize1, executor1, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error1, "aclnnNanToNum error");
-        error1 = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error1);
         
         uint64_t workspaceSize2 = 0;
         aclOpExecutor* executor2;
-        auto error2 = aclnnProdDimGetWorkspaceSize(temp.tensorPtr, axis, keepdims, result.aclDtype, result.tensorPtr, &workspaceSize2, &executor2);
+        auto error2 = asnumpy::npu::profiler::Plan("ProdDim", aclnnProdDimGetWorkspaceSize, temp.tensorPtr, axis, keepdims, result.aclDtype, result.tensorPtr, &workspaceSize2, &executor2);
         CheckGetWorkspaceSizeAclnnStatus(error2);
         void* workspaceAddr2 = nullptr;
         if(workspaceSize2 != 0ULL) {
-            error2 = aclrtMalloc(&workspaceAddr2, workspaceSize2, ACL_MEM_MALLOC_HUGE_FIRST);
+            error2 = asnumpy::npu::GetWorkspace(&workspaceAddr2, workspaceSize2);
             CheckMallocAclnnStatus(error2);
         }
-        error2 = aclnnProdDim(workspaceAddr2, workspaceSize2, executor2, nullptr);
+        error2 = asnumpy::npu::profiler::Launch(aclnnProdDim, workspaceAddr2, workspaceSize2, executor2, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error2, "aclnnProdDim error");
-        error2 = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error2);
         return result;
     }
 
-    double Nanprod(const NPUArray& a) {
+    NPUArray Nanprod(const NPUArray& a) {
         std::vector<int64_t> shape = {1};
         float scalar = 1.0;
         auto temp = NPUArray(a.shape, a.aclDtype);
         auto result = NPUArray(shape, a.aclDtype);
         uint64_t workspaceSize1 = 0;
         aclOpExecutor* executor1;
-        auto error1 = aclnnNanToNumGetWorkspaceSize(a.tensorPtr, scalar, 
+        auto error1 = asnumpy::npu::profiler::Plan("NanToNum", aclnnNanToNumGetWorkspaceSize, a.tensorPtr, scalar, 
             std::numeric_limits<float>::infinity(), -std::numeric_limits<float>::infinity(), temp.tensorPtr, &workspaceSize1, &executor1);
         CheckGetWorkspaceSizeAclnnStatus(error1);
         void* workspaceAddr1 = nullptr;
         if(workspaceSize1 != 0ULL) {
-            error1 = aclrtMalloc(&workspaceAddr1, workspaceSize1, ACL_MEM_MALLOC_HUGE_FIRST);
+            error1 = asnumpy::npu::GetWorkspace(&workspaceAddr1, workspaceSize1);
             CheckMallocAclnnStatus(error1);
         }
-        error1 = aclnnNanToNum(workspaceAddr1, workspaceSize1, executor1, nullptr);
+        error1 = asnumpy::npu::profiler::Launch(aclnnNanToNum, workspaceAddr1, workspaceSize1, executor1, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error1, "aclnnNanToNum error");
-        error1 = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error1);
         
         uint64_t workspaceSize2 = 0;
         aclOpExecutor* executor2;
-        auto error2 = aclnnProdGetWorkspaceSize(temp.tensorPtr, result.aclDtype, result.tensorPtr, &workspaceSize2, &executor2);
+        auto error2 = asnumpy::npu::profiler::Plan("Prod", aclnnProdGetWorkspaceSize, temp.tensorPtr, result.aclDtype, result.tensorPtr, &workspaceSize2, &executor2);
         CheckGetWorkspaceSizeAclnnStatus(error2);
         void* workspaceAddr2 = nullptr;
         if(workspaceSize2 != 0ULL) {
-            error2 = aclrtMalloc(&workspaceAddr2, workspaceSize2, ACL_MEM_MALLOC_HUGE_FIRST);
+            error2 = asnumpy::npu::GetWorkspace(&workspaceAddr2, workspaceSize2);
             CheckMallocAclnnStatus(error2);
         }
-        error2 = aclnnProd(workspaceAddr2, workspaceSize2, executor2, nullptr);
+        error2 = asnumpy::npu::profiler::Launch(aclnnProd, workspaceAddr2, workspaceSize2, executor2, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error2, "aclnnProd error");
-        error2 = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error2);
 
-        py::array tmp = result.ToNumpy();
-        py::dtype dt = tmp.dtype();
-        py::buffer_info buf = tmp.request();
-        if (dt.is(py::dtype::of<int>())) {
-            int* results = static_cast<int*>(buf.ptr);
-            return results[0];
-        } 
-        else if (dt.is(py::dtype::of<double>())) {
-            double* results = static_cast<double*>(buf.ptr);
-            return results[0];
-        }
-        else if (dt.is(py::dtype::of<float>())) {
-            float* results = static_cast<float*>(buf.ptr);
-            return results[0];
-        }
-        else {
-            throw std::runtime_error("Unsupported array data type!");
-        }
-        return 0;
+        return result.Reshape({});
     }
 
     NPUArray Nansum(const NPUArray& a, int64_t axis, bool keepdims, std::optional<py::dtype> dtype) {
@@ -322,78 +236,38 @@ namespace asnumpy {
         auto result = NPUArray(shape, outDtype);
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor;
-        auto error = aclnnReduceNansumGetWorkspaceSize(a.tensorPtr, axis_array, keepdims, result.aclDtype, result.tensorPtr, &workspaceSize, &executor);
+        auto error = asnumpy::npu::profiler::Plan("ReduceNansum", aclnnReduceNansumGetWorkspaceSize, a.tensorPtr, axis_array, keepdims, result.aclDtype, result.tensorPtr, &workspaceSize, &executor);
         CheckGetWorkspaceSizeAclnnStatus(error);
         void* workspaceAddr = nullptr;
         if(workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
-        error = aclnnReduceNansum(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnReduceNansum, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnReduceNansum error");
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
         return result;
     }
 
-    double Nansum(const NPUArray& a) {
-        auto shape = a.shape;
-        int64_t pro = 1;
-        for (int i=0; i<shape.size(); i++){
-            pro = pro * shape[i];
-        }
-        shape = {1, pro};
-        auto temp = NPUArray(shape, a.aclDtype);
-        uint64_t workspaceSize1 = 0;
-        aclOpExecutor* executor1;
-        auto error1 = aclnnFlattenGetWorkspaceSize(a.tensorPtr, 0, temp.tensorPtr, &workspaceSize1, &executor1);
-        CheckGetWorkspaceSizeAclnnStatus(error1);
-        void* workspaceAddr1 = nullptr;
-        if(workspaceSize1 != 0ULL) {
-            error1 = aclrtMalloc(&workspaceAddr1, workspaceSize1, ACL_MEM_MALLOC_HUGE_FIRST);
-            CheckMallocAclnnStatus(error1);
-        }
-        error1 = aclnnFlatten(workspaceAddr1, workspaceSize1, executor1, nullptr);
-        CheckAclnnStatus(error1, "aclnnFlatten error");
-        error1 = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error1);
+    NPUArray Nansum(const NPUArray& a) {
+        // 连续数组直接以 (1, size) 视图归约，无需 Flatten 拷贝
+        auto temp = a.Reshape({1, static_cast<int64_t>(a.tensorSize)});
         
         std::vector<int64_t> tmp{1};
         aclIntArray* axis_array = aclCreateIntArray(tmp.data(), tmp.size());
         auto result = NPUArray({1}, a.aclDtype);
         uint64_t workspaceSize2 = 0;
         aclOpExecutor* executor2;
-        auto error2 = aclnnReduceNansumGetWorkspaceSize(temp.tensorPtr, axis_array, false, result.aclDtype, result.tensorPtr, &workspaceSize2, &executor2);
+        auto error2 = asnumpy::npu::profiler::Plan("ReduceNansum", aclnnReduceNansumGetWorkspaceSize, temp.tensorPtr, axis_array, false, result.aclDtype, result.tensorPtr, &workspaceSize2, &executor2);
         CheckGetWorkspaceSizeAclnnStatus(error2);
         void* workspaceAddr2 = nullptr;
         if(workspaceSize2 != 0ULL) {
-            error2 = aclrtMalloc(&workspaceAddr2, workspaceSize2, ACL_MEM_MALLOC_HUGE_FIRST);
+            error2 = asnumpy::npu::GetWorkspace(&workspaceAddr2, workspaceSize2);
             CheckMallocAclnnStatus(error2);
         }
-        error2 = aclnnReduceNansum(workspaceAddr2, workspaceSize2, executor2, nullptr);
+        error2 = asnumpy::npu::profiler::Launch(aclnnReduceNansum, workspaceAddr2, workspaceSize2, executor2, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error2, "aclnnReduceNansum error");
-        error2 = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error2);
 
-        py::array x = result.ToNumpy();
-        py::dtype dt = x.dtype();
-        py::buffer_info buf = x.request();
-        if (dt.is(py::dtype::of<int>())) {
-            int* results = static_cast<int*>(buf.ptr);
-            return results[0];
-        } 
-        else if (dt.is(py::dtype::of<double>())) {
-            double* results = static_cast<double*>(buf.ptr);
-            return results[0];
-        }
-        else if (dt.is(py::dtype::of<float>())) {
-            float* results = static_cast<float*>(buf.ptr);
-            return results[0];
-        }
-        else {
-            throw std::runtime_error("Unsupported array data type!");
-        }
-        return 0;
+        return result.Reshape({});
     }
 
     NPUArray Cumprod(const NPUArray& a, int64_t axis, std::optional<py::dtype> dtype) {
@@ -403,17 +277,15 @@ namespace asnumpy {
         auto result = NPUArray(shape, outDtype);
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor;
-        auto error = aclnnCumprodGetWorkspaceSize(a.tensorPtr, axis_scalar, result.aclDtype, result.tensorPtr, &workspaceSize, &executor);
+        auto error = asnumpy::npu::profiler::Plan("Cumprod", aclnnCumprodGetWorkspaceSize, a.tensorPtr, axis_scalar, result.aclDtype, result.tensorPtr, &workspaceSize, &executor);
         CheckGetWorkspaceSizeAclnnStatus(error);
         void* workspaceAddr = nullptr;
         if(workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
-        error = aclnnCumprod(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnCumprod, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnCumprod error");
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
         return result;
     }
 
@@ -423,17 +295,15 @@ namespace asnumpy {
         auto result = NPUArray(shape, outDtype);
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor;
-        auto error = aclnnCumsumGetWorkspaceSize(a.tensorPtr, axis, result.aclDtype, result.tensorPtr, &workspaceSize, &executor);
+        auto error = asnumpy::npu::profiler::Plan("Cumsum", aclnnCumsumGetWorkspaceSize, a.tensorPtr, axis, result.aclDtype, result.tensorPtr, &workspaceSize, &executor);
         CheckGetWorkspaceSizeAclnnStatus(error);
         void* workspaceAddr = nullptr;
         if(workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
-        error = aclnnCumsum(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnCumsum, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnCumsum error");
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
         return result;
     }
 
@@ -446,32 +316,28 @@ namespace asnumpy {
         auto result = NPUArray(shape, outDtype);
         uint64_t workspaceSize1 = 0;
         aclOpExecutor* executor1;
-        auto error1 = aclnnNanToNumGetWorkspaceSize(a.tensorPtr, scalar, 
+        auto error1 = asnumpy::npu::profiler::Plan("NanToNum", aclnnNanToNumGetWorkspaceSize, a.tensorPtr, scalar, 
             std::numeric_limits<float>::infinity(), -std::numeric_limits<float>::infinity(), temp.tensorPtr, &workspaceSize1, &executor1);
         CheckGetWorkspaceSizeAclnnStatus(error1);
         void* workspaceAddr1 = nullptr;
         if(workspaceSize1 != 0ULL) {
-            error1 = aclrtMalloc(&workspaceAddr1, workspaceSize1, ACL_MEM_MALLOC_HUGE_FIRST);
+            error1 = asnumpy::npu::GetWorkspace(&workspaceAddr1, workspaceSize1);
             CheckMallocAclnnStatus(error1);
         }
-        error1 = aclnnNanToNum(workspaceAddr1, workspaceSize1, executor1, nullptr);
+        error1 = asnumpy::npu::profiler::Launch(aclnnNanToNum, workspaceAddr1, workspaceSize1, executor1, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error1, "aclnnNanToNum error");
-        error1 = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error1);
 
         uint64_t workspaceSize2 = 0;
         aclOpExecutor* executor2;
-        auto error2 = aclnnCumprodGetWorkspaceSize(temp.tensorPtr, axis_scalar, result.aclDtype, result.tensorPtr, &workspaceSize2, &executor2);
+        auto error2 = asnumpy::npu::profiler::Plan("Cumprod", aclnnCumprodGetWorkspaceSize, temp.tensorPtr, axis_scalar, result.aclDtype, result.tensorPtr, &workspaceSize2, &executor2);
         CheckGetWorkspaceSizeAclnnStatus(error2);
         void* workspaceAddr2 = nullptr;
         if(workspaceSize2 != 0ULL) {
-            error2 = aclrtMalloc(&workspaceAddr2, workspaceSize2, ACL_MEM_MALLOC_HUGE_FIRST);
+            error2 = asnumpy::npu::GetWorkspace(&workspaceAddr2, workspaceSize2);
             CheckMallocAclnnStatus(error2);
         }
-        error2 = aclnnCumprod(workspaceAddr2, workspaceSize2, executor2, nullptr);
+        error2 = asnumpy::npu::profiler::Launch(aclnnCumprod, workspaceAddr2, workspaceSize2, executor2, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error2, "aclnnCumprod error");
-        error2 = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error2);
         return result;
     }
 
@@ -483,32 +349,28 @@ namespace asnumpy {
         auto result = NPUArray(shape, outDtype);
         uint64_t workspaceSize1 = 0;
         aclOpExecutor* executor1;
-        auto error1 = aclnnNanToNumGetWorkspaceSize(a.tensorPtr, scalar, 
+        auto error1 = asnumpy::npu::profiler::Plan("NanToNum", aclnnNanToNumGetWorkspaceSize, a.tensorPtr, scalar, 
             std::numeric_limits<float>::infinity(), -std::numeric_limits<float>::infinity(), temp.tensorPtr, &workspaceSize1, &executor1);
         CheckGetWorkspaceSizeAclnnStatus(error1);
         void* workspaceAddr1 = nullptr;
         if(workspaceSize1 != 0ULL) {
-            error1 = aclrtMalloc(&workspaceAddr1, workspaceSize1, ACL_MEM_MALLOC_HUGE_FIRST);
+            error1 = asnumpy::npu::GetWorkspace(&workspaceAddr1, workspaceSize1);
             CheckMallocAclnnStatus(error1);
         }
-        error1 = aclnnNanToNum(workspaceAddr1, workspaceSize1, executor1, nullptr);
+        error1 = asnumpy::npu::profiler::Launch(aclnnNanToNum, workspaceAddr1, workspaceSize1, executor1, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error1, "aclnnNanToNum error");
-        error1 = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error1);
 
         uint64_t workspaceSize2 = 0;
         aclOpExecutor* executor2;
-        auto error2 = aclnnCumsumGetWorkspaceSize(temp.tensorPtr, axis, result.aclDtype, result.tensorPtr, &workspaceSize2, &executor2);
+        auto error2 = asnumpy::npu::profiler::Plan("Cumsum", aclnnCumsumGetWorkspaceSize, temp.tensorPtr, axis, result.aclDtype, result.tensorPtr, &workspaceSize2, &executor2);
         CheckGetWorkspaceSizeAclnnStatus(error2);
         void* workspaceAddr2 = nullptr;
         if(workspaceSize2 != 0ULL) {
-            error2 = aclrtMalloc(&workspaceAddr2, workspaceSize2, ACL_MEM_MALLOC_HUGE_FIRST);
+            error2 = asnumpy::npu::GetWorkspace(&workspaceAddr2, workspaceSize2);
             CheckMallocAclnnStatus(error2);
         }
-        error2 = aclnnCumsum(workspaceAddr2, workspaceSize2, executor2, nullptr);
+        error2 = asnumpy::npu::profiler::Launch(aclnnCumsum, workspaceAddr2, workspaceSize2, executor2, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error2, "aclnnCumsum error");
-        error2 = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error2);
         return result;
     }
 
@@ -518,17 +380,15 @@ namespace asnumpy {
         auto result = NPUArray(broadcast, a.aclDtype);
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor;
-        auto error = aclnnLinalgCrossGetWorkspaceSize(a.tensorPtr, b.tensorPtr, axis, result.tensorPtr, &workspaceSize, &executor);
+        auto error = asnumpy::npu::profiler::Plan("LinalgCross", aclnnLinalgCrossGetWorkspaceSize, a.tensorPtr, b.tensorPtr, axis, result.tensorPtr, &workspaceSize, &executor);
         CheckGetWorkspaceSizeAclnnStatus(error);
         void* workspaceAddr = nullptr;
         if(workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
-        error = aclnnLinalgCross(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnLinalgCross, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnLinalgCross error");
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
         return result;
     }
 }
\ No newline at end of file
@@ -15,9 +15,13 @@
  *****************************************************************************/
 
 
+#include <asnumpy/fusion/elementwise.hpp>
 #include <asnumpy/utils/npu_array.hpp>
 #include <asnumpy/math/trigonometric_functions.hpp>
 #include <asnumpy/utils/status_handler.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/profiler.hpp>
 
 #include <acl/acl.h>
 #include <aclnn/aclnn_base.h>
@@ -46,30 +50,26 @@ namespace asnumpy {
             aclType = x.aclDtype;
         }
         auto out = NPUArray(x.shape, aclType);
+        if (out.tensorSize == 0) {
+            return out;
+        }
 
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor = nullptr;
-        auto error = aclnnSinGetWorkspaceSize(
+        auto error = asnumpy::npu::profiler::Plan("Sin", aclnnSinGetWorkspaceSize,
             x.tensorPtr, out.tensorPtr, &workspaceSize, &executor
         );
         CheckGetWorkspaceSizeAclnnStatus(error);
 
         void* workspaceAddr = nullptr;
         if (workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
 
-        error = aclnnSin(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnSin, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnSin error");
 
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
-
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-
         return out;
     }
 
@@ -80,30 +80,26 @@ namespace asnumpy {
             aclType = x.aclDtype;
         }
         auto out = NPUArray(x.shape, aclType);
+        if (out.tensorSize == 0) {
+            return out;
+        }
 
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor = nullptr;
-        auto error = aclnnCosGetWorkspaceSize(
+        auto error = asnumpy::npu::profiler::Plan("Cos", aclnnCosGetWorkspaceSize,
             x.tensorPtr, out.tensorPtr, &workspaceSize, &executor
         );
         CheckGetWorkspaceSizeAclnnStatus(error);
 
         void* workspaceAddr = nullptr;
         if (workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
 
-        error = aclnnCos(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnCos, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnCos error");
 
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
-
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-
         return out;
     }
 
@@ -114,30 +110,26 @@ namespace asnumpy {
             aclType = x.aclDtype;
         }
         auto out = NPUArray(x.shape, aclType);
+        if (out.tensorSize == 0) {
+            return out;
+        }
 
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor = nullptr;
-        auto error = aclnnTanGetWorkspaceSize(
+        auto error = asnumpy::npu::profiler::Plan("Tan", aclnnTanGetWorkspaceSize,
             x.tensorPtr, out.tensorPtr, &workspaceSize, &executor
         );
         CheckGetWorkspaceSizeAclnnStatus(error);
 
         void* workspaceAddr = nullptr;
         if (workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
 
-        error = aclnnTan(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnTan, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnTan error");
 
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
-
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-
         return out;
     }
 
@@ -148,30 +140,26 @@ namespace asnumpy {
             aclType = x.aclDtype;
         }
         auto out = NPUArray(x.shape, aclType);
+        if (out.tensorSize == 0) {
+            return out;
+        }
 
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor = nullptr;
-        auto error = aclnnAsinGetWorkspaceSize(
+        auto error = asnumpy::npu::profiler::Plan("Asin", aclnnAsinGetWorkspaceSize,
             x.tensorPtr, out.tensorPtr, &workspaceSize, &executor
         );
         CheckGetWorkspaceSizeAclnnStatus(error);
 
         void* workspaceAddr = nullptr;
         if (workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
 
-        error = aclnnAsin(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnAsin, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnAsin error");
 
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
-
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-
         return out;
     }
 
@@ -182,30 +170,26 @@ namespace asnumpy {
             aclType = x.aclDtype;
         }
         auto out = NPUArray(x.shape, aclType);
+        if (out.tensorSize == 0) {
+            return out;
+        }
 
         uint64_t workspaceSize = 0;
         aclOpExecutor* executor = nullptr;
-        auto error = aclnnAcosGetWorkspaceSize(
+        auto error = asnumpy::npu::profiler::Plan("Acos", aclnnAcosGetWorkspaceSize,
             x.tensorPtr, out.tensorPtr, &workspaceSize, &executor
         );
         CheckGetWorkspaceSizeAclnnStatus(error);
 
         void* workspaceAddr = nullptr;
         if (workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             CheckMallocAclnnStatus(error);
         }
 
-        error = aclnnAcos(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnAcos, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnAcos error");
 
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
-
-        if (workspaceAddr) {
-            aclrtFree(workspaceAddr);
-        }
-
         return out;
     }
 
@@ -216,47 +200,52 @@ namespace asnumpy {
             aclType = x.aclDtype;
         }
         auto out = NPUArray(x.shape, aclType);
+        if (out.tensorSize == 0) {
+            return out;
+        }
 
         uint64_t workspaceSize = 0;
         aclOpExecutor *executor;
 
-        auto error = aclnnAtanGetWorkspaceSize(x.tensorPtr, out.tensorPtr, &workspaceSize, &executor);
+        auto error = asnumpy::npu::profiler::Plan("Atan", aclnnAtanGetWorkspaceSize, x.tensorPtr, out.tensorPtr, &workspaceSize, &executor);
         CheckGetWorkspaceSizeAclnnStatus(error);
 
         void *workspaceAddr = nullptr;
         if(workspaceSize != 0ULL) {
-            error = aclrtMalloc(&workspaceAddr, workspaceSize, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
             if(error != ACL_SUCCESS) {
                 throw std::runtime_error(fmt::format("[math.cpp](arctan) aclrtMalloc error = {}", error));
             }
         }
 
-        error = aclnnAtan(workspaceAddr, workspaceSize, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnAtan, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
         if(error != ACL_SUCCESS) {
             throw std::runtime_error(fmt::format("[math.cpp](arctan) aclnnAtan error = {}", error));
         }
 
-        error = aclrtSynchronizeDevice();
-        if(error != ACL_SUCCESS) {
-            throw std::runtime_error(fmt::format("[math.cpp](arctan) aclrtSynchronizeDevice error = {}", error));
-        }
-
-        if(workspaceAddr != nullptr) {
-            aclrtFree(workspaceAddr);
-        }
-
         return out;
     }
 
 
     NPUArray Hypot(const NPUArray& a, const NPUArray& b) {
+        // 同为浮点类型时: a² 之后原地 addcmul(b, b)、原地 sqrt，只分配一个缓冲区
+        if (a.aclDtype == b.aclDtype &&
+            (a.aclDtype == ACL_FLOAT || a.aclDtype == ACL_FLOAT16 || a.aclDtype == ACL_DOUBLE)) {
+            std::vector<fusion::Instruction> program = {
+                {"square", {0}},
+                {"addcmul", {2, 1, 1}, 1.0},
+                {"sqrt", {3}},
+            };
+            return std::move(fusion::Execute(program, {&a, &b}, {4}).front());
+        }
+
         auto broadcast = GetBroadcastShape(a, b);
 
         // 步骤1: 计算a的平方 (a²)
         NPUArray a_squared(a.shape, a.dtype);
         uint64_t a_sq_workspace_size = 0;
         aclOpExecutor* a_sq_executor = nullptr;
-        auto error = aclnnMulGetWorkspaceSize(
+        auto error = asnumpy::npu::profiler::Plan("Mul", aclnnMulGetWorkspaceSize,
             a.tensorPtr, a.tensorPtr,
             a_squared.tensorPtr,
             &a_sq_workspace_size,
@@ -266,21 +255,19 @@ namespace asnumpy {
 
         void* a_sq_workspace = nullptr;
         if (a_sq_workspace_size != 0ULL) {
-            error = aclrtMalloc(&a_sq_workspace, a_sq_workspace_size, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&a_sq_workspace, a_sq_workspace_size);
             CheckMallocAclnnStatus(error);
         }
 
-        error = aclnnMul(a_sq_workspace, a_sq_workspace_size, a_sq_executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnMul, a_sq_workspace, a_sq_workspace_size, a_sq_executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnMul error");
 
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
 
         // 步骤2: 计算b的平方 (b²)
         NPUArray b_squared(b.shape, b.dtype);
         uint64_t b_sq_workspace_size = 0;
         aclOpExecutor* b_sq_executor = nullptr;
-        error = aclnnMulGetWorkspaceSize(
+        error = asnumpy::npu::profiler::Plan("Mul", aclnnMulGetWorkspaceSize,
             b.tensorPtr, b.tensorPtr,
             b_squared.tensorPtr,
             &b_sq_workspace_size,
@@ -290,15 +277,13 @@ namespace asnumpy {
 
         void* b_sq_workspace = nullptr;
         if (b_sq_workspace_size != 0ULL) {
-            error = aclrtMalloc(&b_sq_workspace, b_sq_workspace_size, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&b_sq_workspace, b_sq_workspace_size);
             CheckMallocAclnnStatus(error);
         }
 
-        error = aclnnMul(b_sq_workspace, b_sq_workspace_size, b_sq_executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnMul, b_sq_workspace, b_sq_workspace_size, b_sq_executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnMul error");
 
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
 
         // 步骤3: 计算平方和 (a² + b²)
         auto dtype = a.aclDtype;
@@ -324,7 +309,7 @@ namespace asnumpy {
             alpha_scalar = aclCreateScalar(&alpha, dtype);
         }
         
-        error = aclnnAddGetWorkspaceSize(
+        error = asnumpy::npu::profiler::Plan("Add", aclnnAddGetWorkspaceSize,
             a_squared.tensorPtr, b_squared.tensorPtr,
             alpha_scalar, sum_squares.tensorPtr,
             &add_workspace_size, &add_executor
@@ -333,15 +318,13 @@ namespace asnumpy {
 
         void* add_workspace = nullptr;
         if (add_workspace_size != 0ULL) {
-            error = aclrtMalloc(&add_workspace, add_workspace_size, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&add_workspace, add_workspace_size);
             CheckMallocAclnnStatus(error);
         }
 
-        error = aclnnAdd(add_workspace, add_workspace_size, add_executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnAdd, add_workspace, add_workspace_size, add_executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnAdd error");
 
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
 
         // 步骤4: 计算平方根 (√(a² + b²))
         aclDataType aclType = ACL_DOUBLE;
@@ -351,7 +334,7 @@ namespace asnumpy {
         NPUArray result(broadcast, aclType);
         uint64_t sqrt_workspace_size = 0;
         aclOpExecutor* sqrt_executor = nullptr;
-        error = aclnnSqrtGetWorkspaceSize(
+        error = asnumpy::npu::profiler::Plan("Sqrt", aclnnSqrtGetWorkspaceSize,
             sum_squares.tensorPtr, result.tensorPtr,
             &sqrt_workspace_size, &sqrt_executor
         );
@@ -359,29 +342,14 @@ namespace asnumpy {
 
         void* sqrt_workspace = nullptr;
         if (sqrt_workspace_size != 0ULL) {
-            error = aclrtMalloc(&sqrt_workspace, sqrt_workspace_size, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&sqrt_workspace, sqrt_workspace_size);
             CheckMallocAclnnStatus(error);
         }
 
-        error = aclnnSqrt(sqrt_workspace, sqrt_workspace_size, sqrt_executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnSqrt, sqrt_workspace, sqrt_workspace_size, sqrt_executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnSqrt error");
 
-        // 同步设备并释放资源
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
         aclDestroyScalar(alpha_scalar);
-        if (a_sq_workspace) {
-            aclrtFree(a_sq_workspace);
-        }
-        if (b_sq_workspace) {
-            aclrtFree(b_sq_workspace);
-        }
-        if (add_workspace) {
-            aclrtFree(add_workspace);
-        }
-        if (sqrt_workspace) {
-            aclrtFree(sqrt_workspace);
-        }
 
         return result;
     }
@@ -400,7 +368,7 @@ namespace asnumpy {
         // 获取工作空间大小
         uint64_t workspace_size = 0;
         aclOpExecutor* executor = nullptr;
-        auto error = aclnnAtan2GetWorkspaceSize(
+        auto error = asnumpy::npu::profiler::Plan("Atan2", aclnnAtan2GetWorkspaceSize,
             y.tensorPtr, x.tensorPtr,
             result.tensorPtr,
             &workspace_size, &executor
@@ -410,21 +378,14 @@ namespace asnumpy {
         // 分配工作空间
         void* workspace = nullptr;
         if (workspace_size != 0ULL) {
-            error = aclrtMalloc(&workspace, workspace_size, ACL_MEM_MALLOC_HUGE_FIRST);
+            error = asnumpy::npu::GetWorkspace(&workspace, workspace_size);
             CheckMallocAclnnStatus(error);
         }
 
         // 执行计算
-        error = aclnnAtan2(workspace, workspace_size, executor, nullptr);
+        error = asnumpy::npu::profiler::Launch(aclnnAtan2, workspace, workspace_size, executor, asnumpy::npu::GetCurrentStream());
         CheckAclnnStatus(error, "aclnnAtan2 error");
 
-        // 同步设备并释放资源
-        error = aclrtSynchronizeDevice();
-        CheckSynchronizeDeviceAclnnStatus(error);
-        if (workspace) {
-            aclrtFree(workspace);
-        }
-
         return result;
     }
 
@@ -440,6 +401,9 @@ namespace asnumpy {
 
         // 初始化结果张量（与输入同形状同类型）
         NPUArray result(x.shape, x.aclDtype);
+        if (result.tensorSize == 0) {
+            return result;
+        }
 
         // 角度转弧度因子：π/180
         NPUArray scalar_factor({}, x.aclDtype);
@@ -447,7 +411,7 @@ namespace asnumpy {
         void* scalar_factor_ptr = nullptr;
 
         // 资源声明
-        aclrtStream stream = nullptr;
+        aclrtStream stream = asnumpy::npu::GetCurrentStream();
         uint64_t workspace_size = 0;
         aclOpExecutor *executor = nullptr;
         void *workspace_addr = nullptr;
@@ -464,9 +428,9 @@ namespace asnumpy {
             // 拷贝转换因子到设备（按数据类型适配）
             if (x.aclDtype == ACL_FLOAT) {
                 float factor = static_cast<float>(rad_factor);
-                aclrtMemcpy(scalar_factor_ptr, sizeof(float), &factor, sizeof(float), ACL_MEMCPY_HOST_TO_DEVICE);
+                asnumpy::npu::CopyToDevice(scalar_factor_ptr, &factor, sizeof(float));
             } else if (x.aclDtype == ACL_DOUBLE) {
-                aclrtMemcpy(scalar_factor_ptr, sizeof(double), &rad_factor, sizeof(double), ACL_MEMCPY_HOST_TO_DEVICE);
+                asnumpy::npu::CopyToDevice(scalar_factor_ptr, &rad_factor, sizeof(double));
             } else if (x.aclDtype == ACL_FLOAT16) {
                 float factor_float = static_cast<float>(rad_factor);
                 uint32_t float_bits;
@@ -476,11 +440,9 @@ namespace asnumpy {
                     (((float_bits >> 13) - 0x1C000U) & 0x7C00U) |
                     ((float_bits >> 13) & 0x03FFU)
                 );
-                aclrtMemcpy(scalar_factor_ptr, sizeof(uint16_t), &fp16_bits, sizeof(uint16_t), ACL_MEMCPY_HOST_TO_DEVICE);
+                asnumpy::npu::CopyToDevice(scalar_factor_ptr, &fp16_bits, sizeof(uint16_t));
             }
 
-            // 创建执行流
-            aclrtCreateStream(&stream);
 
             // 关键修复：将单个张量包装为张量列表（匹配接口参数要求）
             // 输入张量列表（包含1个元素）
@@ -492,7 +454,7 @@ namespace asnumpy {
             output_list = aclCreateTensorList(output_tensors, 1);
 
             // 获取工作空间大小（使用张量列表作为参数）
-            aclnnForeachMulScalarGetWorkspaceSize(
+            asnumpy::npu::profiler::Plan("ForeachMulScalar", aclnnForeachMulScalarGetWorkspaceSize,
                 input_list,          // 输入张量列表（第一个参数类型匹配）
                 scalar_factor.tensorPtr,
                 output_list,         // 输出张量列表
@@ -502,35 +464,78 @@ namespace asnumpy {
 
             // 分配工作空间
             if (workspace_size != 0ULL) {
-                aclrtMalloc(&workspace_addr, workspace_size, ACL_MEM_MALLOC_HUGE_FIRST);
+                asnumpy::npu::GetWorkspace(&workspace_addr, workspace_size);
             }
 
             // 执行标量乘法
-            aclnnForeachMulScalar(
+            asnumpy::npu::profiler::Launch(aclnnForeachMulScalar,
                 workspace_addr,
                 workspace_size,
                 executor,
                 stream
             );
-            aclrtSynchronizeStream(stream);
         }
         catch (const std::exception& e) {
             // 释放资源（包含张量列表）
-            if (workspace_addr != nullptr) {
-                aclrtFree(workspace_addr);
-            }
             if (input_list != nullptr) {
                 aclDestroyTensorList(input_list);
             }
             if (output_list != nullptr) {
                 aclDestroyTensorList(output_list);
             }
-            if (stream != nullptr) {
-                aclrtDestroyStream(stream);
-            }
             throw;
         }
 
         return result;
     }
+
+    namespace {
+
+    /**
+     * @brief Plan and launch an aclnnInplace* unary kernel on x.
+     */
+    template <typename GetWorkspaceSize, typename Kernel>
+    void LaunchInplace(const char* name, NPUArray& x, GetWorkspaceSize getWorkspaceSize, Kernel kernel) {
+        if (x.tensorSize == 0) {
+            return;
+        }
+        uint64_t workspaceSize = 0;
+        aclOpExecutor* executor = nullptr;
+        auto error = asnumpy::npu::profiler::Plan(name, getWorkspaceSize, x.tensorPtr, &workspaceSize, &executor);
+        CheckGetWorkspaceSizeAclnnStatus(error);
+        void* workspaceAddr = nullptr;
+        if (workspaceSize != 0ULL) {
+            error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
+            CheckMallocAclnnStatus(error);
+        }
+        error = asnumpy::npu::profiler::Launch(kernel, workspaceAddr, workspaceSize, executor,
+                                               asnumpy::npu::GetCurrentStream());
+        CheckAclnnStatus(error, fmt::format("aclnn{} error", name));
+    }
+
+    }
+
+    void InplaceSin(NPUArray& x) {
+        LaunchInplace("InplaceSin", x, aclnnInplaceSinGetWorkspaceSize, aclnnInplaceSin);
+    }
+
+    void InplaceCos(NPUArray& x) {
+        LaunchInplace("InplaceCos", x, aclnnInplaceCosGetWorkspaceSize, aclnnInplaceCos);
+    }
+
+    void InplaceTan(NPUArray& x) {
+        LaunchInplace("InplaceTan", x, aclnnInplaceTanGetWorkspaceSize, aclnnInplaceTan);
+    }
+
+    void InplaceArcsin(NPUArray& x) {
+        LaunchInplace("InplaceAsin", x, aclnnInplaceAsinGetWorkspaceSize, aclnnInplaceAsin);
+    }
+
+    void InplaceArccos(NPUArray& x) {
+        LaunchInplace("InplaceAcos", x, aclnnInplaceAcosGetWorkspaceSize, aclnnInplaceAcos);
+    }
+
+    void InplaceArctan(NPUArray& x) {
+        LaunchInplace("InplaceAtan", x, aclnnInplaceAtanGetWorkspaceSize, aclnnInplaceAtan);
+    }
 }
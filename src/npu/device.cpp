@@ -0,0 +1,131 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+
+#include <asnumpy/npu/device.hpp>
+#include <asnumpy/cann/driver.hpp>
+#include <asnumpy/npu/pinned_memory.hpp>
+#include <asnumpy/npu/profiler.hpp>
+#include <asnumpy/utils/status_handler.hpp>
+
+#include <fmt/format.h>
+#include <map>
+#include <stdexcept>
+#include <utility>
+#include <vector>
+
+namespace asnumpy {
+namespace npu {
+
+namespace {
+
+std::vector<int32_t>& DeviceStack() {
+    thread_local std::vector<int32_t> stack;
+    return stack;
+}
+
+/// Whether device can read peer's memory; enables the access on first query.
+bool PeerAccess(int32_t device, int32_t peer) {
+    static std::mutex mutex;
+    static std::map<std::pair<int32_t, int32_t>, bool> enabled;
+    std::lock_guard<std::mutex> lock(mutex);
+    auto it = enabled.find({device, peer});
+    if (it != enabled.end()) {
+        return it->second;
+    }
+    int32_t canAccess = 0;
+    bool ok = aclrtDeviceCanAccessPeer(&canAccess, device, peer) == ACL_SUCCESS && canAccess != 0;
+    if (ok) {
+        DeviceGuard guard(device);
+        ok = aclrtDeviceEnablePeerAccess(peer, 0) == ACL_SUCCESS;
+    }
+    enabled.emplace(std::make_pair(device, peer), ok);
+    return ok;
+}
+
+}
+
+Device::Device(int32_t id) : id_(id) {
+    if (id < 0 || id >= Count()) {
+        throw std::invalid_argument(fmt::format(
+            "[device.cpp](Device) device id {} is out of range, {} devices are visible", id, Count()));
+    }
+}
+
+void Device::Enter() const {
+    DeviceStack().push_back(cann::current_device());
+    cann::use_device(id_);
+}
+
+void Device::Exit() const {
+    auto& stack = DeviceStack();
+    if (stack.empty()) {
+        throw std::runtime_error("[device.cpp](Exit) device stack is empty");
+    }
+    int32_t previous = stack.back();
+    stack.pop_back();
+    cann::use_device(previous);
+}
+
+void Device::Synchronize() const {
+    DeviceGuard guard(id_);
+    CheckSynchronizeDeviceAclnnStatus(aclrtSynchronizeDevice());
+}
+
+int32_t Device::Count() {
+    return cann::device_count();
+}
+
+DeviceGuard::DeviceGuard(int32_t device) : previous_(cann::current_device()) {
+    if (device != previous_) {
+        cann::use_device(device);
+    }
+}
+
+DeviceGuard::~DeviceGuard() {
+    if (cann::current_device() != previous_) {
+        cann::use_device(previous_);
+    }
+}
+
+aclError CopyPeer(void* dst, int32_t dstDevice, const void* src, int32_t srcDevice, size_t size) {
+    if (size == 0) {
+        return ACL_SUCCESS;
+    }
+    if (dstDevice == srcDevice || PeerAccess(dstDevice, srcDevice)) {
+        DeviceGuard guard(dstDevice);
+        profiler::CopyRange range("D2D", size);
+        return aclrtMemcpy(dst, size, src, size, ACL_MEMCPY_DEVICE_TO_DEVICE);
+    }
+    PinnedMemoryPool& pinned = GetPinnedMemoryPool();
+    void* staging = pinned.Malloc(size);
+    aclError ret = ACL_SUCCESS;
+    {
+        DeviceGuard guard(srcDevice);
+        profiler::CopyRange range("D2H", size);
+        ret = aclrtMemcpy(staging, size, src, size, ACL_MEMCPY_DEVICE_TO_HOST);
+    }
+    if (ret == ACL_SUCCESS) {
+        DeviceGuard guard(dstDevice);
+        profiler::CopyRange range("H2D", size);
+        ret = aclrtMemcpy(dst, size, staging, size, ACL_MEMCPY_HOST_TO_DEVICE);
+    }
+    pinned.Free(staging);
+    return ret;
+}
+
+}
+}
@@ -0,0 +1,223 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#include <asnumpy/npu/executor_cache.hpp>
+#include <asnumpy/cann/driver.hpp>
+#include <asnumpy/npu/profiler.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/utils/status_handler.hpp>
+
+#include <fmt/format.h>
+
+namespace asnumpy {
+namespace npu {
+
+ExecutorCache::~ExecutorCache() {
+    Clear();
+}
+
+void ExecutorCache::Run(const std::string& op,
+                        const std::vector<const NPUArray*>& inputs,
+                        const std::vector<const NPUArray*>& outputs,
+                        const PlanFn& plan, LaunchFn launch) {
+    // Zero-size results have nothing to compute: no plan, no launch, no cache entry.
+    for (const NPUArray* x : outputs) {
+        if (x->tensorSize == 0) {
+            return;
+        }
+    }
+    // Kernels run on the current device and cannot read another device's memory.
+    int32_t device = cann::current_device();
+    for (const std::vector<const NPUArray*>* group : {&inputs, &outputs}) {
+        for (const NPUArray* x : *group) {
+            if (x->device != device) {
+                throw std::invalid_argument(fmt::format(
+                    "[executor_cache.cpp]({}) operand is on device {} but the current device is {}; "
+                    "move it with to() first", op, x->device, device));
+            }
+        }
+    }
+
+    std::lock_guard<std::mutex> lock(mutex_);
+
+    if (!enabled_) {
+        std::vector<aclTensor*> tensors;
+        for (const NPUArray* x : inputs) tensors.push_back(x->tensorPtr);
+        for (const NPUArray* x : outputs) tensors.push_back(x->tensorPtr);
+        uint64_t workspaceSize = 0;
+        aclOpExecutor* executor = nullptr;
+        CheckGetWorkspaceSizeAclnnStatus(profiler::Plan(op.c_str(), plan, tensors, &workspaceSize, &executor));
+        Launch(op, launch, executor, workspaceSize);
+        return;
+    }
+
+    std::string key = MakeKey(op, inputs, outputs);
+    auto it = index_.find(key);
+    if (it != index_.end()) {
+        ++hits_;
+        entries_.splice(entries_.begin(), entries_, it->second);
+        Entry& entry = entries_.front();
+        for (size_t i = 0; i < inputs.size(); ++i) {
+            auto error = aclSetInputTensorAddr(entry.executor, i, entry.tensors[i], inputs[i]->device_address());
+            CheckAclnnStatus(error, fmt::format("[executor_cache.cpp]({}) aclSetInputTensorAddr failed.", op));
+        }
+        for (size_t i = 0; i < outputs.size(); ++i) {
+            auto error = aclSetOutputTensorAddr(entry.executor, i, entry.tensors[inputs.size() + i],
+                                                outputs[i]->device_address());
+            CheckAclnnStatus(error, fmt::format("[executor_cache.cpp]({}) aclSetOutputTensorAddr failed.", op));
+        }
+        profiler::Reuse(op.c_str(), entry.tensors, entry.executor, entry.workspaceSize);
+        Launch(op, launch, entry.executor, entry.workspaceSize);
+        return;
+    }
+
+    ++misses_;
+    Entry entry;
+    entry.key = key;
+    for (const std::vector<const NPUArray*>* group : {&inputs, &outputs}) {
+        for (const NPUArray* x : *group) {
+            entry.tensors.push_back(x->CreateTensor());
+        }
+    }
+    auto error = profiler::Plan(op.c_str(), plan, entry.tensors, &entry.workspaceSize, &entry.executor);
+    if (error != ACL_SUCCESS) {
+        Destroy(entry);
+        CheckGetWorkspaceSizeAclnnStatus(error);
+    }
+    error = aclSetAclOpExecutorRepeatable(entry.executor);
+    CheckAclnnStatus(error, fmt::format("[executor_cache.cpp]({}) aclSetAclOpExecutorRepeatable failed.", op));
+
+    entries_.push_front(std::move(entry));
+    index_[key] = entries_.begin();
+    Evict();
+    Launch(op, launch, entries_.front().executor, entries_.front().workspaceSize);
+}
+
+void ExecutorCache::Clear() {
+    std::lock_guard<std::mutex> lock(mutex_);
+    for (Entry& entry : entries_) {
+        Destroy(entry);
+    }
+    entries_.clear();
+    index_.clear();
+}
+
+void ExecutorCache::SetCapacity(size_t capacity) {
+    std::lock_guard<std::mutex> lock(mutex_);
+    capacity_ = capacity;
+    Evict();
+}
+
+void ExecutorCache::SetEnabled(bool enabled) {
+    std::lock_guard<std::mutex> lock(mutex_);
+    enabled_ = enabled;
+}
+
+void ExecutorCache::ResetStats() {
+    std::lock_guard<std::mutex> lock(mutex_);
+    hits_ = 0;
+    misses_ = 0;
+}
+
+size_t ExecutorCache::Hits() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return hits_;
+}
+
+size_t ExecutorCache::Misses() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return misses_;
+}
+
+size_t ExecutorCache::Size() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return entries_.size();
+}
+
+size_t ExecutorCache::Capacity() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return capacity_;
+}
+
+bool ExecutorCache::Enabled() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return enabled_;
+}
+
+std::string ExecutorCache::MakeKey(const std::string& op,
+                                   const std::vector<const NPUArray*>& inputs,
+                                   const std::vector<const NPUArray*>& outputs) {
+    // executors are planned for one device
+    std::string key = std::to_string(cann::current_device()) + '@' + op;
+    for (const std::vector<const NPUArray*>* group : {&inputs, &outputs}) {
+        key += '|';
+        for (const NPUArray* x : *group) {
+            key += std::to_string(static_cast<int>(x->aclDtype));
+            for (int64_t dim : x->shape) {
+                key += ',';
+                key += std::to_string(dim);
+            }
+            key += ':';
+            for (int64_t stride : x->strides) {
+                key += ',';
+                key += std::to_string(stride);
+            }
+            key += ';';
+        }
+    }
+    return key;
+}
+
+void ExecutorCache::Launch(const std::string& op, LaunchFn launch,
+                           aclOpExecutor* executor, uint64_t workspaceSize) {
+    void* workspaceAddr = nullptr;
+    if (workspaceSize > 0) {
+        auto error = GetWorkspace(&workspaceAddr, workspaceSize);
+        CheckMallocAclnnStatus(error);
+    }
+    auto error = profiler::Launch(launch, workspaceAddr, workspaceSize, executor, GetCurrentStream());
+    CheckAclnnStatus(error, fmt::format("[{}] Failed to execute operation.", op));
+}
+
+void ExecutorCache::Destroy(Entry& entry) {
+    if (entry.executor != nullptr) {
+        aclDestroyAclOpExecutor(entry.executor);
+        entry.executor = nullptr;
+    }
+    for (aclTensor* tensor : entry.tensors) {
+        aclDestroyTensor(tensor);
+    }
+    entry.tensors.clear();
+}
+
+void ExecutorCache::Evict() {
+    while (entries_.size() > capacity_) {
+        Entry& entry = entries_.back();
+        index_.erase(entry.key);
+        Destroy(entry);
+        entries_.pop_back();
+    }
+}
+
+ExecutorCache& GetExecutorCache() {
+    // Leaked like the memory pool: executors must not be destroyed after aclFinalize.
+    static ExecutorCache* cache = new ExecutorCache();
+    return *cache;
+}
+
+}
+}
@@ -0,0 +1,257 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#include <asnumpy/npu/memory_pool.hpp>
+#include <asnumpy/cann/driver.hpp>
+#include <asnumpy/npu/device.hpp>
+#include <asnumpy/npu/stream.hpp>
+
+#include <fmt/format.h>
+#include <stdexcept>
+#include <vector>
+
+namespace asnumpy {
+namespace npu {
+
+namespace {
+
+constexpr size_t kMinBlockSize = 512;               // all sizes are rounded to 512 bytes
+constexpr size_t kSmallSize = 1048576;              // largest request served by the small pool
+constexpr size_t kSmallBuffer = 2097152;            // segment size of the small pool
+constexpr size_t kLargeBuffer = 20971520;           // segment size for mid-sized requests
+constexpr size_t kMinLargeAlloc = 10485760;         // above this, segments are sized to the request
+constexpr size_t kRoundLarge = 2097152;             // rounding of large segments
+
+}
+
+size_t MemoryPool::RoundSize(size_t size) {
+    if (size < kMinBlockSize) {
+        return kMinBlockSize;
+    }
+    return kMinBlockSize * ((size + kMinBlockSize - 1) / kMinBlockSize);
+}
+
+size_t MemoryPool::SegmentSize(size_t size) {
+    if (size <= kSmallSize) {
+        return kSmallBuffer;
+    }
+    if (size < kMinLargeAlloc) {
+        return kLargeBuffer;
+    }
+    return kRoundLarge * ((size + kRoundLarge - 1) / kRoundLarge);
+}
+
+void* MemoryPool::Malloc(size_t size, aclrtStream stream) {
+    void* ptr = nullptr;
+    aclError ret = Allocate(&ptr, size, stream);
+    if (ret != ACL_SUCCESS) {
+        throw std::runtime_error(fmt::format(
+            "[memory_pool.cpp](Malloc) aclrtMalloc failed for {} bytes, error = {}. "
+            "Pool holds {} bytes, {} in use.",
+            size, ret, TotalBytes(), UsedBytes()));
+    }
+    return ptr;
+}
+
+aclError MemoryPool::Allocate(void** ptr, size_t size, aclrtStream stream) {
+    *ptr = nullptr;
+    if (size == 0) {
+        return ACL_SUCCESS;
+    }
+
+    std::lock_guard<std::recursive_mutex> lock(mutex_);
+
+    size = RoundSize(size);
+    bool small = size <= kSmallSize;
+    FreeList& pool = small ? smallBlocks_ : largeBlocks_;
+
+    Block* block = FindFreeBlock(pool, size, stream);
+    if (block == nullptr) {
+        aclError ret = AllocateSegment(&block, SegmentSize(size), stream, small);
+        if (ret != ACL_SUCCESS) {
+            // Give cached segments back to the driver and try once more.
+            ReleaseCachedSegments();
+            ret = AllocateSegment(&block, SegmentSize(size), stream, small);
+            if (ret != ACL_SUCCESS) {
+                return ret;
+            }
+        }
+    } else {
+        pool.erase(block);
+    }
+
+    // Split off the unused tail if it is worth keeping.
+    size_t remaining = block->size - size;
+    if ((small && remaining >= kMinBlockSize) || (!small && remaining > kSmallSize)) {
+        Block* rest = new Block();
+        rest->ptr = static_cast<char*>(block->ptr) + size;
+        rest->size = remaining;
+        rest->stream = stream;
+        rest->small = small;
+        rest->prev = block;
+        rest->next = block->next;
+        if (rest->next != nullptr) {
+            rest->next->prev = rest;
+        }
+        block->next = rest;
+        block->size = size;
+        pool.insert(rest);
+    }
+
+    block->allocated = true;
+    activeBlocks_[block->ptr] = block;
+    usedBytes_ += block->size;
+    *ptr = block->ptr;
+    return ACL_SUCCESS;
+}
+
+void MemoryPool::Free(void* ptr) {
+    if (ptr == nullptr) {
+        return;
+    }
+
+    std::lock_guard<std::recursive_mutex> lock(mutex_);
+
+    auto it = activeBlocks_.find(ptr);
+    if (it == activeBlocks_.end()) {
+        throw std::runtime_error("[memory_pool.cpp](Free) pointer was not allocated by the memory pool");
+    }
+    Block* block = it->second;
+    activeBlocks_.erase(it);
+
+    block->allocated = false;
+    usedBytes_ -= block->size;
+
+    FreeList& pool = block->small ? smallBlocks_ : largeBlocks_;
+    if (block->prev != nullptr && !block->prev->allocated) {
+        Block* prev = block->prev;
+        MergeBlocks(prev, block, pool);
+        block = prev;
+    }
+    if (block->next != nullptr && !block->next->allocated) {
+        MergeBlocks(block, block->next, pool);
+    }
+    pool.insert(block);
+}
+
+void MemoryPool::FreeAllBlocks() {
+    std::lock_guard<std::recursive_mutex> lock(mutex_);
+    ReleaseCachedSegments();
+}
+
+size_t MemoryPool::UsedBytes() const {
+    std::lock_guard<std::recursive_mutex> lock(mutex_);
+    return usedBytes_;
+}
+
+size_t MemoryPool::TotalBytes() const {
+    std::lock_guard<std::recursive_mutex> lock(mutex_);
+    return totalBytes_;
+}
+
+size_t MemoryPool::FreeBytes() const {
+    std::lock_guard<std::recursive_mutex> lock(mutex_);
+    return totalBytes_ - usedBytes_;
+}
+
+size_t MemoryPool::NumFreeBlocks() const {
+    std::lock_guard<std::recursive_mutex> lock(mutex_);
+    return smallBlocks_.size() + largeBlocks_.size();
+}
+
+MemoryPool::Block* MemoryPool::FindFreeBlock(FreeList& pool, size_t size, aclrtStream stream) {
+    Block key;
+    key.stream = stream;
+    key.size = size;
+    auto it = pool.lower_bound(&key);
+    if (it == pool.end() || (*it)->stream != stream) {
+        return nullptr;
+    }
+    return *it;
+}
+
+aclError MemoryPool::AllocateSegment(Block** block, size_t size, aclrtStream stream, bool small) {
+    void* ptr = nullptr;
+    aclError ret = aclrtMalloc(&ptr, size, ACL_MEM_MALLOC_HUGE_FIRST);
+    if (ret != ACL_SUCCESS) {
+        return ret;
+    }
+    totalBytes_ += size;
+
+    *block = new Block();
+    (*block)->ptr = ptr;
+    (*block)->size = size;
+    (*block)->stream = stream;
+    (*block)->small = small;
+    return ACL_SUCCESS;
+}
+
+void MemoryPool::MergeBlocks(Block* dst, Block* src, FreeList& pool) {
+    // dst and src are adjacent in memory and dst comes first; dst may still
+    // be in the free list under its old size, src always is.
+    pool.erase(dst);
+    pool.erase(src);
+    dst->size += src->size;
+    dst->next = src->next;
+    if (dst->next != nullptr) {
+        dst->next->prev = dst;
+    }
+    delete src;
+}
+
+void MemoryPool::ReleaseCachedSegments() {
+    if (smallBlocks_.empty() && largeBlocks_.empty()) {
+        return;
+    }
+    DeviceGuard guard(device_);
+    // Cached blocks may still be read by kernels queued before they were freed.
+    aclrtSynchronizeDevice();
+    for (FreeList* pool : {&smallBlocks_, &largeBlocks_}) {
+        std::vector<Block*> segments;
+        for (Block* block : *pool) {
+            if (block->prev == nullptr && block->next == nullptr) {
+                segments.push_back(block);
+            }
+        }
+        for (Block* block : segments) {
+            pool->erase(block);
+            aclrtFree(block->ptr);
+            totalBytes_ -= block->size;
+            delete block;
+        }
+    }
+}
+
+MemoryPool& GetMemoryPool() {
+    return GetMemoryPool(cann::current_device());
+}
+
+MemoryPool& GetMemoryPool(int32_t device) {
+    return PerDevice<MemoryPool>(device);
+}
+
+aclError Malloc(void** ptr, size_t size) {
+    aclrtStream stream = GetCurrentStream();
+    return GetMemoryPool().Allocate(ptr, size, stream);
+}
+
+aclError Free(void* ptr) {
+    GetMemoryPool().Free(ptr);
+    return ACL_SUCCESS;
+}
+
+}
+}
@@ -0,0 +1,188 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#include <asnumpy/npu/pinned_memory.hpp>
+#include <asnumpy/cann/driver.hpp>
+
+#include <fmt/format.h>
+#include <iterator>
+#include <stdexcept>
+
+namespace asnumpy {
+namespace npu {
+
+namespace {
+
+constexpr size_t kMinBlockSize = 512;
+
+size_t RoundSize(size_t size) {
+    return kMinBlockSize * ((size + kMinBlockSize - 1) / kMinBlockSize);
+}
+
+}
+
+void* PinnedMemoryPool::Malloc(size_t size) {
+    if (size == 0) {
+        return nullptr;
+    }
+    size = RoundSize(size);
+
+    std::lock_guard<std::mutex> lock(mutex_);
+
+    // Best fit among cached buffers that are at most twice the request.
+    for (auto it = freeBlocks_.lower_bound(size); it != freeBlocks_.end() && it->first <= 2 * size; ++it) {
+        if (Ready(it->second)) {
+            Block block = std::move(it->second);
+            freeBlocks_.erase(it);
+            void* ptr = block.ptr;
+            usedBytes_ += block.size;
+            allocated_.emplace(ptr, std::move(block));
+            return ptr;
+        }
+    }
+
+    cann::ensure_initialized();
+    void* ptr = nullptr;
+    aclError ret = aclrtMallocHost(&ptr, size);
+    if (ret != ACL_SUCCESS) {
+        // Drop cached buffers that are idle and try once more.
+        for (auto it = freeBlocks_.begin(); it != freeBlocks_.end();) {
+            if (Ready(it->second)) {
+                aclrtFreeHost(it->second.ptr);
+                totalBytes_ -= it->first;
+                it = freeBlocks_.erase(it);
+            } else {
+                ++it;
+            }
+        }
+        ret = aclrtMallocHost(&ptr, size);
+        if (ret != ACL_SUCCESS) {
+            throw std::runtime_error(fmt::format(
+                "[pinned_memory.cpp](Malloc) aclrtMallocHost failed for {} bytes, error = {}", size, ret));
+        }
+    }
+    totalBytes_ += size;
+    usedBytes_ += size;
+    Block block;
+    block.ptr = ptr;
+    block.size = size;
+    allocated_.emplace(ptr, std::move(block));
+    return ptr;
+}
+
+void PinnedMemoryPool::Free(void* ptr) {
+    if (ptr == nullptr) {
+        return;
+    }
+    std::lock_guard<std::mutex> lock(mutex_);
+    auto it = allocated_.find(ptr);
+    if (it == allocated_.end()) {
+        throw std::runtime_error("[pinned_memory.cpp](Free) pointer was not allocated by the pinned memory pool");
+    }
+    usedBytes_ -= it->second.size;
+    size_t size = it->second.size;
+    freeBlocks_.emplace(size, std::move(it->second));
+    allocated_.erase(it);
+}
+
+void PinnedMemoryPool::RecordUse(const void* ptr, aclrtStream stream) {
+    std::lock_guard<std::mutex> lock(mutex_);
+    auto it = allocated_.upper_bound(ptr);
+    if (it == allocated_.begin()) {
+        return;
+    }
+    Block& block = std::prev(it)->second;
+    if (static_cast<const char*>(ptr) >= static_cast<const char*>(block.ptr) + block.size) {
+        return;
+    }
+    // Forget copies that already finished so the list stays short.
+    Ready(block);
+    aclrtEvent event = nullptr;
+    if (aclrtCreateEvent(&event) != ACL_SUCCESS) {
+        throw std::runtime_error("[pinned_memory.cpp](RecordUse) aclrtCreateEvent failed");
+    }
+    if (aclrtRecordEvent(event, stream) != ACL_SUCCESS) {
+        aclrtDestroyEvent(event);
+        throw std::runtime_error("[pinned_memory.cpp](RecordUse) aclrtRecordEvent failed");
+    }
+    block.events.push_back(event);
+}
+
+bool PinnedMemoryPool::Contains(const void* ptr, size_t size) const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    auto it = allocated_.upper_bound(ptr);
+    if (it == allocated_.begin()) {
+        return false;
+    }
+    const Block& block = std::prev(it)->second;
+    return static_cast<const char*>(ptr) + size <= static_cast<const char*>(block.ptr) + block.size;
+}
+
+void PinnedMemoryPool::FreeAllBlocks() {
+    std::lock_guard<std::mutex> lock(mutex_);
+    for (auto& [size, block] : freeBlocks_) {
+        WaitEvents(block);
+        aclrtFreeHost(block.ptr);
+        totalBytes_ -= size;
+    }
+    freeBlocks_.clear();
+}
+
+size_t PinnedMemoryPool::UsedBytes() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return usedBytes_;
+}
+
+size_t PinnedMemoryPool::TotalBytes() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return totalBytes_;
+}
+
+size_t PinnedMemoryPool::NumFreeBlocks() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return freeBlocks_.size();
+}
+
+bool PinnedMemoryPool::Ready(Block& block) {
+    auto it = block.events.begin();
+    while (it != block.events.end()) {
+        aclrtEventRecordedStatus status = ACL_EVENT_RECORDED_STATUS_NOT_READY;
+        if (aclrtQueryEventStatus(*it, &status) == ACL_SUCCESS && status == ACL_EVENT_RECORDED_STATUS_COMPLETE) {
+            aclrtDestroyEvent(*it);
+            it = block.events.erase(it);
+        } else {
+            ++it;
+        }
+    }
+    return block.events.empty();
+}
+
+void PinnedMemoryPool::WaitEvents(Block& block) {
+    for (aclrtEvent event : block.events) {
+        aclrtSynchronizeEvent(event);
+        aclrtDestroyEvent(event);
+    }
+    block.events.clear();
+}
+
+PinnedMemoryPool& GetPinnedMemoryPool() {
+    // Leaked like the device memory pool.
+    static PinnedMemoryPool* pool = new PinnedMemoryPool();
+    return *pool;
+}
+
+}
+}
@@ -0,0 +1,291 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#include <asnumpy/npu/profiler.hpp>
+#include <asnumpy/cann/driver.hpp>
+#include <asnumpy/npu/device.hpp>
+#include <asnumpy/npu/stream.hpp>
+
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <stdexcept>
+#include <unordered_map>
+
+namespace asnumpy {
+namespace npu {
+namespace profiler {
+
+namespace {
+
+using Clock = std::chrono::steady_clock;
+
+struct Entry {
+    Record record;
+    uint64_t session = 0;          // session the entry started in
+    std::unique_ptr<Event> begin;  // recorded before the launch or copy
+    std::unique_ptr<Event> end;    // recorded after it
+};
+
+/// First event recorded on a stream in the session, placing the stream's events on the host clock.
+struct Anchor {
+    std::unique_ptr<Event> event;
+    double time = 0;
+};
+
+struct Session {
+    std::mutex mutex;
+    std::atomic<bool> enabled{false};
+    std::atomic<uint64_t> id{0};  // sessions started so far; records of an older one are dropped
+    Clock::time_point origin;
+    std::vector<Entry> entries;
+    std::map<std::pair<int32_t, uintptr_t>, Anchor> anchors;
+};
+
+Session& GetSession() {
+    // Leaked like the memory pool: events must not be destroyed after aclFinalize.
+    static Session* session = new Session();
+    return *session;
+}
+
+struct ThreadState {
+    uint64_t session = 0;
+    Entry planning;                                      // between BeginPlan and EndPlan
+    std::unordered_map<aclOpExecutor*, Entry> planned;   // planned, waiting for the launch
+    Entry launching;                                     // between BeginLaunch and EndLaunch
+    bool isLaunching = false;
+    std::vector<Entry> copies;                           // open CopyRanges, innermost last
+};
+
+ThreadState& State() {
+    thread_local ThreadState state;
+    uint64_t id = GetSession().id.load();
+    if (state.session != id) {
+        state.session = id;
+        state.planned.clear();
+    }
+    return state;
+}
+
+uint64_t ThreadIndex() {
+    static std::atomic<uint64_t> next{0};
+    thread_local uint64_t index = next++;
+    return index;
+}
+
+double Now() {
+    return std::chrono::duration<double, std::micro>(Clock::now() - GetSession().origin).count();
+}
+
+Entry NewEntry(const char* name) {
+    Entry entry;
+    entry.record.name = name;
+    entry.record.device = cann::current_device();
+    entry.record.thread = ThreadIndex();
+    entry.record.start = Now();
+    entry.session = GetSession().id;
+    return entry;
+}
+
+/// Record the begin event of entry on stream, anchoring the stream first if needed.
+void RecordBegin(Entry& entry, aclrtStream stream) {
+    Session& session = GetSession();
+    entry.record.stream = reinterpret_cast<uintptr_t>(stream);
+    {
+        std::lock_guard<std::mutex> lock(session.mutex);
+        Anchor& anchor = session.anchors[{entry.record.device, entry.record.stream}];
+        if (!anchor.event) {
+            anchor.event = std::make_unique<Event>();
+            anchor.event->Record(stream);
+            anchor.time = Now();
+        }
+    }
+    entry.begin = std::make_unique<Event>();
+    entry.begin->Record(stream);
+}
+
+void Commit(Entry entry) {
+    Session& s = GetSession();
+    std::lock_guard<std::mutex> lock(s.mutex);
+    if (s.enabled && s.id == entry.session) {
+        s.entries.push_back(std::move(entry));
+    }
+}
+
+}
+
+bool Enabled() {
+    return GetSession().enabled.load(std::memory_order_relaxed);
+}
+
+void Start() {
+    Session& session = GetSession();
+    std::lock_guard<std::mutex> lock(session.mutex);
+    if (session.enabled) {
+        throw std::runtime_error("[profiler.cpp](Start) a profiling session is already running");
+    }
+    session.entries.clear();
+    session.anchors.clear();
+    session.origin = Clock::now();
+    ++session.id;
+    session.enabled = true;
+}
+
+std::vector<Record> Stop() {
+    Session& session = GetSession();
+    std::vector<Entry> entries;
+    std::map<std::pair<int32_t, uintptr_t>, Anchor> anchors;
+    {
+        std::lock_guard<std::mutex> lock(session.mutex);
+        if (!session.enabled) {
+            throw std::runtime_error("[profiler.cpp](Stop) no profiling session is running");
+        }
+        session.enabled = false;
+        entries.swap(session.entries);
+        anchors.swap(session.anchors);
+    }
+
+    std::vector<Record> records;
+    records.reserve(entries.size());
+    for (Entry& entry : entries) {
+        Record& record = entry.record;
+        if (entry.begin && entry.end) {
+            DeviceGuard guard(record.device);
+            entry.end->Synchronize();
+            record.deviceTime = entry.begin->ElapsedTime(*entry.end) * 1000.0;
+            auto it = anchors.find({record.device, record.stream});
+            if (it != anchors.end()) {
+                record.deviceStart = it->second.time + it->second.event->ElapsedTime(*entry.begin) * 1000.0;
+            }
+            entry.begin.reset();
+            entry.end.reset();
+        }
+        records.push_back(std::move(record));
+    }
+    for (auto& [key, anchor] : anchors) {
+        DeviceGuard guard(key.first);
+        anchor.event.reset();
+    }
+    std::stable_sort(records.begin(), records.end(),
+                     [](const Record& a, const Record& b) { return a.start < b.start; });
+    return records;
+}
+
+namespace detail {
+
+void BeginPlan(const char* op) {
+    State().planning = NewEntry(op);
+}
+
+void AddOperand(const aclTensor* tensor) {
+    if (tensor == nullptr) {
+        return;
+    }
+    Record& record = State().planning.record;
+    int64_t* dims = nullptr;
+    uint64_t ndim = 0;
+    if (aclGetViewShape(tensor, &dims, &ndim) == ACL_SUCCESS) {
+        record.shapes.emplace_back(dims, dims + ndim);
+        delete[] dims;
+    } else {
+        record.shapes.emplace_back();
+    }
+    aclDataType dtype = ACL_DT_UNDEFINED;
+    aclGetDataType(tensor, &dtype);
+    record.dtypes.push_back(dtype);
+}
+
+void EndPlan(aclOpExecutor* executor, uint64_t workspaceSize, bool cached) {
+    ThreadState& state = State();
+    Record& record = state.planning.record;
+    record.planTime = Now() - record.start;
+    record.workspaceBytes = workspaceSize;
+    record.cached = cached;
+    if (executor != nullptr) {
+        state.planned[executor] = std::move(state.planning);
+    }
+    state.planning = Entry();
+}
+
+void BeginLaunch(aclOpExecutor* executor, aclrtStream stream) {
+    ThreadState& state = State();
+    auto it = state.planned.find(executor);
+    state.isLaunching = it != state.planned.end();
+    if (!state.isLaunching) {
+        return;  // planned before the session started
+    }
+    state.launching = std::move(it->second);
+    state.planned.erase(it);
+    RecordBegin(state.launching, stream);
+}
+
+void EndLaunch(bool ok) {
+    ThreadState& state = State();
+    if (!state.isLaunching) {
+        return;
+    }
+    state.isLaunching = false;
+    Entry entry = std::move(state.launching);
+    state.launching = Entry();
+    if (!ok) {
+        return;
+    }
+    entry.end = std::make_unique<Event>();
+    entry.end->Record(reinterpret_cast<aclrtStream>(entry.record.stream));
+    entry.record.hostTime = Now() - entry.record.start;
+    Commit(std::move(entry));
+}
+
+}
+
+CopyRange::CopyRange(const char* name, size_t bytes) {
+    if (!Enabled()) {
+        return;
+    }
+    active_ = true;
+    Entry entry = NewEntry(name);
+    entry.record.copy = true;
+    entry.record.bytes = bytes;
+    State().copies.push_back(std::move(entry));
+}
+
+CopyRange::CopyRange(const char* name, size_t bytes, aclrtStream stream) : CopyRange(name, bytes) {
+    if (active_) {
+        RecordBegin(State().copies.back(), stream);
+    }
+}
+
+CopyRange::~CopyRange() {
+    if (!active_) {
+        return;
+    }
+    ThreadState& state = State();
+    Entry entry = std::move(state.copies.back());
+    state.copies.pop_back();
+    if (entry.begin) {
+        entry.end = std::make_unique<Event>();
+        entry.end->Record(reinterpret_cast<aclrtStream>(entry.record.stream));
+    }
+    entry.record.hostTime = Now() - entry.record.start;
+    Commit(std::move(entry));
+}
+
+}
+}
+}
@@ -0,0 +1,229 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/cann/driver.hpp>
+#include <asnumpy/npu/device.hpp>
+#include <asnumpy/npu/pinned_memory.hpp>
+#include <asnumpy/npu/profiler.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/utils/status_handler.hpp>
+
+#include <cstring>
+#include <stdexcept>
+#include <vector>
+
+namespace asnumpy {
+namespace npu {
+
+namespace {
+
+struct StackEntry {
+    int32_t device;
+    aclrtStream stream;
+    int32_t previousDevice;  // device to switch back to on pop, -1 if unchanged
+};
+
+/// Streams entered by the calling thread; each device sees only its own entries.
+std::vector<StackEntry>& StreamStack() {
+    thread_local std::vector<StackEntry> stack;
+    return stack;
+}
+
+}
+
+Stream::Stream() : owner_(true) {
+    cann::ensure_initialized();
+    device_ = cann::current_device();
+    CheckAclnnStatus(aclrtCreateStream(&stream_), "[stream.cpp](Stream) aclrtCreateStream failed.");
+}
+
+Stream::Stream(aclrtStream stream) : stream_(stream), owner_(false), device_(cann::current_device()) {}
+
+Stream::Stream(Stream&& other) noexcept : stream_(other.stream_), owner_(other.owner_), device_(other.device_) {
+    other.stream_ = nullptr;
+    other.owner_ = false;
+}
+
+Stream& Stream::operator=(Stream&& other) noexcept {
+    if (this != &other) {
+        this->~Stream();
+        stream_ = other.stream_;
+        owner_ = other.owner_;
+        device_ = other.device_;
+        other.stream_ = nullptr;
+        other.owner_ = false;
+    }
+    return *this;
+}
+
+Stream::~Stream() {
+    if (owner_ && stream_ != nullptr) {
+        DeviceGuard guard(device_);
+        aclrtSynchronizeStream(stream_);
+        GetWorkspaceArena(device_).Release(stream_);
+        aclrtDestroyStream(stream_);
+    }
+    stream_ = nullptr;
+    owner_ = false;
+}
+
+void Stream::Synchronize() const {
+    DeviceGuard guard(device_);  // the default stream is per device
+    CheckAclnnStatus(aclrtSynchronizeStream(stream_), "[stream.cpp](Synchronize) aclrtSynchronizeStream failed.");
+}
+
+void Stream::WaitEvent(const Event& event) const {
+    CheckAclnnStatus(aclrtStreamWaitEvent(stream_, event.Get()), "[stream.cpp](WaitEvent) aclrtStreamWaitEvent failed.");
+}
+
+void Stream::Enter() const {
+    int32_t current = cann::current_device();
+    if (device_ == current) {
+        PushStream(stream_);
+        return;
+    }
+    // entering a stream of another device also switches to that device
+    cann::use_device(device_);
+    StreamStack().push_back({device_, stream_, current});
+}
+
+void Stream::Exit() const {
+    PopStream();
+}
+
+Event::Event() {
+    cann::ensure_initialized();
+    CheckAclnnStatus(aclrtCreateEvent(&event_), "[stream.cpp](Event) aclrtCreateEvent failed.");
+}
+
+Event::~Event() {
+    if (event_ != nullptr) {
+        aclrtDestroyEvent(event_);
+        event_ = nullptr;
+    }
+}
+
+void Event::Record(aclrtStream stream) {
+    CheckAclnnStatus(aclrtRecordEvent(event_, stream), "[stream.cpp](Record) aclrtRecordEvent failed.");
+}
+
+void Event::Synchronize() const {
+    CheckAclnnStatus(aclrtSynchronizeEvent(event_), "[stream.cpp](Synchronize) aclrtSynchronizeEvent failed.");
+}
+
+bool Event::Query() const {
+    aclrtEventRecordedStatus status = ACL_EVENT_RECORDED_STATUS_NOT_READY;
+    CheckAclnnStatus(aclrtQueryEventStatus(event_, &status), "[stream.cpp](Query) aclrtQueryEventStatus failed.");
+    return status == ACL_EVENT_RECORDED_STATUS_COMPLETE;
+}
+
+float Event::ElapsedTime(const Event& end) const {
+    float ms = 0.0f;
+    CheckAclnnStatus(aclrtEventElapsedTime(&ms, event_, end.Get()), "[stream.cpp](ElapsedTime) aclrtEventElapsedTime failed.");
+    return ms;
+}
+
+aclrtStream GetCurrentStream() {
+    // every launch, allocation and copy asks for a stream first
+    cann::ensure_initialized();
+    const auto& stack = StreamStack();
+    int32_t device = cann::current_device();
+    for (auto it = stack.rbegin(); it != stack.rend(); ++it) {
+        if (it->device == device) {
+            return it->stream;
+        }
+    }
+    return nullptr;
+}
+
+void PushStream(aclrtStream stream) {
+    StreamStack().push_back({cann::current_device(), stream, -1});
+}
+
+void PopStream() {
+    auto& stack = StreamStack();
+    if (stack.empty()) {
+        throw std::runtime_error("[stream.cpp](PopStream) stream stack is empty");
+    }
+    int32_t previousDevice = stack.back().previousDevice;
+    stack.pop_back();
+    if (previousDevice >= 0) {
+        cann::use_device(previousDevice);
+    }
+}
+
+void SynchronizeCurrentStream() {
+    CheckAclnnStatus(aclrtSynchronizeStream(GetCurrentStream()), "[stream.cpp](SynchronizeCurrentStream) aclrtSynchronizeStream failed.");
+}
+
+aclError CopyToDevice(void* dst, const void* src, size_t size, bool nonBlocking) {
+    if (size == 0) {
+        return ACL_SUCCESS;
+    }
+    aclrtStream stream = GetCurrentStream();
+    PinnedMemoryPool& pinned = GetPinnedMemoryPool();
+
+    const void* staged = src;
+    void* staging = nullptr;
+    if (!pinned.Contains(src, size)) {
+        staging = pinned.Malloc(size);
+        std::memcpy(staging, src, size);
+        staged = staging;
+    }
+    profiler::CopyRange range("H2D", size, stream);
+    aclError ret = aclrtMemcpyAsync(dst, size, staged, size, ACL_MEMCPY_HOST_TO_DEVICE, stream);
+    if (ret == ACL_SUCCESS) {
+        pinned.RecordUse(staged, stream);
+    }
+    // The staging buffer is only handed out again after the copy has run.
+    pinned.Free(staging);
+    if (ret != ACL_SUCCESS || nonBlocking) {
+        return ret;
+    }
+    return aclrtSynchronizeStream(stream);
+}
+
+aclError CopyToHost(void* dst, const void* src, size_t size) {
+    if (size == 0) {
+        return ACL_SUCCESS;
+    }
+    aclrtStream stream = GetCurrentStream();
+    PinnedMemoryPool& pinned = GetPinnedMemoryPool();
+    profiler::CopyRange range("D2H", size, stream);
+
+    if (pinned.Contains(dst, size)) {
+        aclError ret = aclrtMemcpyAsync(dst, size, src, size, ACL_MEMCPY_DEVICE_TO_HOST, stream);
+        if (ret != ACL_SUCCESS) {
+            return ret;
+        }
+        return aclrtSynchronizeStream(stream);
+    }
+
+    void* staging = pinned.Malloc(size);
+    aclError ret = aclrtMemcpyAsync(staging, size, src, size, ACL_MEMCPY_DEVICE_TO_HOST, stream);
+    if (ret == ACL_SUCCESS) {
+        ret = aclrtSynchronizeStream(stream);
+    }
+    if (ret == ACL_SUCCESS) {
+        std::memcpy(dst, staging, size);
+    }
+    pinned.Free(staging);
+    return ret;
+}
+
+}
+}
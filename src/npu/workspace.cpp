@@ -0,0 +1,112 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/cann/driver.hpp>
+#include <asnumpy/npu/device.hpp>
+#include <asnumpy/npu/memory_pool.hpp>
+#include <asnumpy/npu/stream.hpp>
+
+#include <algorithm>
+
+namespace asnumpy {
+namespace npu {
+
+aclError WorkspaceArena::Get(void** ptr, size_t size, aclrtStream stream) {
+    *ptr = nullptr;
+    if (size == 0) {
+        return ACL_SUCCESS;
+    }
+
+    std::lock_guard<std::mutex> lock(mutex_);
+
+    Workspace& ws = workspaces_[stream];
+    if (ws.size >= size) {
+        *ptr = ws.ptr;
+        return ACL_SUCCESS;
+    }
+
+    // The old buffer may still be in use by kernels queued on this stream;
+    // the pool only hands it out again on the same stream, after them.
+    if (ws.ptr != nullptr) {
+        GetMemoryPool(device_).Free(ws.ptr);
+        usedBytes_ -= ws.size;
+        ws.ptr = nullptr;
+        ws.size = 0;
+    }
+
+    aclError ret = GetMemoryPool(device_).Allocate(&ws.ptr, size, stream);
+    if (ret != ACL_SUCCESS) {
+        return ret;
+    }
+    ws.size = size;
+    usedBytes_ += size;
+    highWaterMark_ = std::max(highWaterMark_, usedBytes_);
+
+    *ptr = ws.ptr;
+    return ACL_SUCCESS;
+}
+
+void WorkspaceArena::Release(aclrtStream stream) {
+    std::lock_guard<std::mutex> lock(mutex_);
+    auto it = workspaces_.find(stream);
+    if (it == workspaces_.end()) {
+        return;
+    }
+    GetMemoryPool(device_).Free(it->second.ptr);
+    usedBytes_ -= it->second.size;
+    workspaces_.erase(it);
+}
+
+void WorkspaceArena::ReleaseAll() {
+    std::lock_guard<std::mutex> lock(mutex_);
+    for (auto& [stream, ws] : workspaces_) {
+        GetMemoryPool(device_).Free(ws.ptr);
+    }
+    workspaces_.clear();
+    usedBytes_ = 0;
+}
+
+size_t WorkspaceArena::UsedBytes() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return usedBytes_;
+}
+
+size_t WorkspaceArena::HighWaterMark() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return highWaterMark_;
+}
+
+void WorkspaceArena::ResetHighWaterMark() {
+    std::lock_guard<std::mutex> lock(mutex_);
+    highWaterMark_ = usedBytes_;
+}
+
+WorkspaceArena& GetWorkspaceArena() {
+    return GetWorkspaceArena(cann::current_device());
+}
+
+WorkspaceArena& GetWorkspaceArena(int32_t device) {
+    return PerDevice<WorkspaceArena>(device);
+}
+
+aclError GetWorkspace(void** ptr, size_t size) {
+    aclrtStream stream = GetCurrentStream();
+    return GetWorkspaceArena().Get(ptr, size, stream);
+}
+
+}
+}
@@ -17,5 +17,62 @@
 
 #include <asnumpy/random/random.hpp>
 
-using namespace asnumpy::random;
+#include <random>
 
+namespace asnumpy {
+namespace random {
+
+namespace {
+
+constexpr uint64_t kPhiloxBlock = 4;    // values produced per Philox counter
+
+uint64_t SplitMix64(uint64_t x) {
+    x += 0x9E3779B97F4A7C15ULL;
+    x = (x ^ (x >> 30)) * 0xBF58476D1CE4E5B9ULL;
+    x = (x ^ (x >> 27)) * 0x94D049BB133111EBULL;
+    return x ^ (x >> 31);
+}
+
+uint64_t EntropySeed() {
+    std::random_device rd;
+    return (static_cast<uint64_t>(rd()) << 32) | rd();
+}
+
+}
+
+Generator::Generator(std::optional<uint64_t> seed)
+    : seed_(seed.has_value() ? seed.value() : EntropySeed()) {}
+
+std::pair<uint64_t, uint64_t> Generator::Advance(uint64_t count) {
+    uint64_t offset = offset_;
+    // Round up to whole Philox blocks so no counter is shared between calls.
+    offset_ += (count + kPhiloxBlock - 1) / kPhiloxBlock * kPhiloxBlock;
+    return {seed_, offset};
+}
+
+std::vector<Generator> Generator::Spawn(size_t n) {
+    std::vector<Generator> children;
+    children.reserve(n);
+    for (size_t i = 0; i < n; ++i) {
+        children.emplace_back(SplitMix64(seed_ ^ SplitMix64(++spawned_)));
+    }
+    return children;
+}
+
+void Generator::SetState(uint64_t seed, uint64_t offset) {
+    seed_ = seed;
+    offset_ = offset;
+    spawned_ = 0;
+}
+
+Generator& GetDefaultGenerator() {
+    static Generator generator;
+    return generator;
+}
+
+void SetSeed(uint64_t seed) {
+    GetDefaultGenerator().SetState(seed, 0);
+}
+
+}
+}
@@ -0,0 +1,203 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#include <asnumpy/utils/dlpack.hpp>
+
+#include <acl/acl.h>
+#include <fmt/format.h>
+#include <memory>
+#include <utility>
+#include <vector>
+
+namespace asnumpy {
+
+namespace {
+
+using dlpack::DLDataType;
+using dlpack::DLManagedTensor;
+
+constexpr const char* kCapsuleName = "dltensor";
+constexpr const char* kUsedCapsuleName = "used_dltensor";
+
+/// Owns everything an exported DLManagedTensor points to.
+struct ExportContext {
+    explicit ExportContext(const NPUArray& x) : array(std::move(*x.View())), shape(x.shape), strides(x.strides) {}
+
+    NPUArray array;                 // view keeping the storage alive
+    std::vector<int64_t> shape;
+    std::vector<int64_t> strides;
+    DLManagedTensor tensor{};
+};
+
+void DeleteExportContext(DLManagedTensor* self) {
+    // consumers may call the deleter without holding the GIL; the view owns a py::dtype
+    pybind11::gil_scoped_acquire gil;
+    delete static_cast<ExportContext*>(self->manager_ctx);
+}
+
+/// Frees a capsule nobody consumed; consumers rename it to "used_dltensor".
+void CapsuleDestructor(PyObject* capsule) {
+    if (!PyCapsule_IsValid(capsule, kCapsuleName)) {
+        return;
+    }
+    PyObject *type, *value, *traceback;
+    PyErr_Fetch(&type, &value, &traceback);
+    auto* tensor = static_cast<DLManagedTensor*>(PyCapsule_GetPointer(capsule, kCapsuleName));
+    if (tensor != nullptr && tensor->deleter != nullptr) {
+        tensor->deleter(tensor);
+    }
+    PyErr_Restore(type, value, traceback);
+}
+
+DLDataType ToDLDataType(aclDataType dtype) {
+    auto bits = [dtype] { return static_cast<uint8_t>(NPUArray::GetDataTypeSize(dtype) * 8); };
+    switch (dtype) {
+        case ACL_BOOL: return {dlpack::kDLBool, 8, 1};
+        case ACL_INT8: case ACL_INT16: case ACL_INT32: case ACL_INT64:
+            return {dlpack::kDLInt, bits(), 1};
+        case ACL_UINT8: case ACL_UINT16: case ACL_UINT32: case ACL_UINT64:
+            return {dlpack::kDLUInt, bits(), 1};
+        case ACL_FLOAT16: case ACL_FLOAT: case ACL_DOUBLE:
+            return {dlpack::kDLFloat, bits(), 1};
+        case ACL_BF16: return {dlpack::kDLBfloat, 16, 1};
+        case ACL_COMPLEX64: case ACL_COMPLEX128:
+            return {dlpack::kDLComplex, bits(), 1};
+        default:
+            throw pybind11::buffer_error(fmt::format(
+                "[dlpack.cpp](ToDLPack) dtype {} has no DLPack equivalent",
+                pybind11::str(NPUArray::GetPyDtype(dtype)).cast<std::string>()));
+    }
+}
+
+aclDataType FromDLDataType(const DLDataType& dtype) {
+    if (dtype.lanes == 1) {
+        switch (dtype.code) {
+            case dlpack::kDLBool:
+                if (dtype.bits == 8) return ACL_BOOL;
+                break;
+            case dlpack::kDLInt:
+                switch (dtype.bits) {
+                    case 8: return ACL_INT8;
+                    case 16: return ACL_INT16;
+                    case 32: return ACL_INT32;
+                    case 64: return ACL_INT64;
+                }
+                break;
+            case dlpack::kDLUInt:
+                switch (dtype.bits) {
+                    case 8: return ACL_UINT8;
+                    case 16: return ACL_UINT16;
+                    case 32: return ACL_UINT32;
+                    case 64: return ACL_UINT64;
+                }
+                break;
+            case dlpack::kDLFloat:
+                switch (dtype.bits) {
+                    case 16: return ACL_FLOAT16;
+                    case 32: return ACL_FLOAT;
+                    case 64: return ACL_DOUBLE;
+                }
+                break;
+            case dlpack::kDLBfloat:
+                if (dtype.bits == 16) return ACL_BF16;
+                break;
+            case dlpack::kDLComplex:
+                switch (dtype.bits) {
+                    case 64: return ACL_COMPLEX64;
+                    case 128: return ACL_COMPLEX128;
+                }
+                break;
+        }
+    }
+    throw pybind11::buffer_error(fmt::format(
+        "[dlpack.cpp](FromDLPack) unsupported DLPack dtype (code={}, bits={}, lanes={})",
+        dtype.code, dtype.bits, dtype.lanes));
+}
+
+}
+
+std::pair<int32_t, int32_t> DLPackDevice(const NPUArray& x) {
+    return {dlpack::kDLAscendNPU, x.device};
+}
+
+pybind11::capsule ToDLPack(const NPUArray& x) {
+    DLDataType dtype = ToDLDataType(x.aclDtype);
+    auto [deviceType, deviceId] = DLPackDevice(x);
+
+    auto context = std::make_unique<ExportContext>(x);
+    DLManagedTensor& tensor = context->tensor;
+    tensor.dl_tensor.data = context->array.device_address();
+    tensor.dl_tensor.device = {deviceType, deviceId};
+    tensor.dl_tensor.ndim = static_cast<int32_t>(context->shape.size());
+    tensor.dl_tensor.dtype = dtype;
+    tensor.dl_tensor.shape = context->shape.data();
+    tensor.dl_tensor.strides = context->strides.data();
+    tensor.dl_tensor.byte_offset = 0;
+    tensor.manager_ctx = context.get();
+    tensor.deleter = DeleteExportContext;
+
+    PyObject* capsule = PyCapsule_New(&tensor, kCapsuleName, CapsuleDestructor);
+    if (capsule == nullptr) {
+        throw pybind11::error_already_set();
+    }
+    context.release();
+    return pybind11::reinterpret_steal<pybind11::capsule>(capsule);
+}
+
+NPUArray FromDLPack(const pybind11::capsule& capsule) {
+    if (!PyCapsule_IsValid(capsule.ptr(), kCapsuleName)) {
+        throw pybind11::buffer_error(
+            "[dlpack.cpp](FromDLPack) expected an unconsumed \"dltensor\" capsule");
+    }
+    auto* managed = static_cast<DLManagedTensor*>(PyCapsule_GetPointer(capsule.ptr(), kCapsuleName));
+    const dlpack::DLTensor& dl = managed->dl_tensor;
+
+    if (dl.device.device_type != dlpack::kDLAscendNPU) {
+        throw pybind11::buffer_error(fmt::format(
+            "[dlpack.cpp](FromDLPack) tensor is on device ({}, {}), expected an NPU ({}, *)",
+            dl.device.device_type, dl.device.device_id, dlpack::kDLAscendNPU));
+    }
+    aclDataType dtype = FromDLDataType(dl.dtype);
+
+    std::vector<int64_t> shape(dl.shape, dl.shape + dl.ndim);
+    std::vector<int64_t> strides;
+    if (dl.strides != nullptr) {
+        strides.assign(dl.strides, dl.strides + dl.ndim);
+    } else {
+        strides.resize(shape.size());
+        int64_t stride = 1;
+        for (int64_t i = static_cast<int64_t>(shape.size()) - 1; i >= 0; i--) {
+            strides[i] = stride;
+            stride *= shape[i];
+        }
+    }
+    void* data = static_cast<char*>(dl.data) + dl.byte_offset;
+
+    // 从此处起由 storage 负责调用生产者的 deleter
+    if (PyCapsule_SetName(capsule.ptr(), kUsedCapsuleName) != 0) {
+        throw pybind11::error_already_set();
+    }
+    std::shared_ptr<void> storage(data, [managed](void*) {
+        if (managed->deleter != nullptr) {
+            managed->deleter(managed);
+        }
+    });
+    NPUArray array(std::move(storage), data, shape, strides, dtype);
+    array.device = dl.device.device_id;
+    return array;
+}
+
+}
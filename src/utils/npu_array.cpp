@@ -16,7 +16,97 @@
 
 
 #include <asnumpy/utils/npu_array.hpp>
+#include <asnumpy/utils/status_handler.hpp>
+#include <asnumpy/utils/type_promotion.hpp>
+#include <asnumpy/cann/driver.hpp>
+#include <asnumpy/npu/device.hpp>
+#include <asnumpy/npu/memory_pool.hpp>
+#include <asnumpy/npu/pinned_memory.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/npu/profiler.hpp>
+
+#include <aclnnop/aclnn_copy.h>
+#include <aclnnop/aclnn_flip.h>
+
+#include <algorithm>
 #include <cstddef>
+#include <cstring>
+#include <string>
+#include <thread>
+#include <unordered_map>
+
+
+namespace {
+
+/**
+ * @brief Row-major strides, in elements, of an array with the given shape.
+ */
+std::vector<int64_t> ContiguousStrides(const std::vector<int64_t>& shape) {
+    std::vector<int64_t> strides(shape.size());
+    int64_t currentStride = 1;
+    for(int64_t i = static_cast<int64_t>(shape.size()) - 1; i >= 0; i--) {
+        strides[i] = currentStride;
+        currentStride *= shape[i];
+    }
+    return strides;
+}
+
+/**
+ * @brief Allocate device storage from the memory pool, freed when the last owner goes away.
+ */
+std::shared_ptr<void> AllocateStorage(size_t byteSize, const char* message) {
+    void* ptr = nullptr;
+    auto error = asnumpy::npu::Malloc(&ptr, byteSize);
+    if(error != ACL_SUCCESS) {
+        std::cout << "error = " << error << std::endl;
+        throw std::runtime_error(message);
+    }
+    // 归还到分配它的设备的内存池，不直接调用 aclrtFree
+    int32_t device = asnumpy::cann::current_device();
+    return std::shared_ptr<void>(ptr, [device](void* p) { asnumpy::npu::GetMemoryPool(device).Free(p); });
+}
+
+/**
+ * @brief Widen bfloat16 values to float32. bfloat16 is the upper half of a float32,
+ * so the conversion is exact; the loop is written to be auto-vectorized.
+ */
+void Bfloat16ToFloat(const uint16_t* src, float* dst, size_t count) {
+    for(size_t i = 0; i < count; ++i) {
+        uint32_t bits = static_cast<uint32_t>(src[i]) << 16;
+        std::memcpy(dst + i, &bits, sizeof(bits));
+    }
+}
+
+/**
+ * @brief Split Bfloat16ToFloat over the hardware threads for large arrays.
+ */
+void ParallelBfloat16ToFloat(const uint16_t* src, float* dst, size_t count) {
+    constexpr size_t kMinPerThread = 1 << 18;
+    size_t threads = std::min<size_t>(std::max(1u, std::thread::hardware_concurrency()), count / kMinPerThread);
+    if(threads <= 1) {
+        Bfloat16ToFloat(src, dst, count);
+        return;
+    }
+    std::vector<std::thread> workers;
+    size_t chunk = (count + threads - 1) / threads;
+    for(size_t begin = 0; begin < count; begin += chunk) {
+        size_t n = std::min(chunk, count - begin);
+        workers.emplace_back(Bfloat16ToFloat, src + begin, dst + begin, n);
+    }
+    for(auto& worker : workers) {
+        worker.join();
+    }
+}
+
+int64_t NormalizeAxis(int64_t axis, int64_t ndim) {
+    if(axis < -ndim || axis >= ndim) {
+        throw std::invalid_argument(fmt::format("axis {} is out of bounds for array of dimension {}", axis, ndim));
+    }
+    return axis < 0 ? axis + ndim : axis;
+}
+
+}
 
 
 /**
@@ -36,19 +126,11 @@ NPUArray::NPUArray(const std::vector<int64_t>& shape, py::dtype dtype) {
     this->aclDtype = GetACLDataType(dtype);
     tensorSize = GetShapeSize(shape);
     auto tensorByteSize = this->tensorSize * GetDataTypeSize(this->aclDtype);
-    this->devicePtr = nullptr;
-    auto error = aclrtMalloc(&this->devicePtr, tensorByteSize, ACL_MEM_MALLOC_HUGE_FIRST);
-    if(error != ACL_SUCCESS) {
-        std::cout << "error = " << error << std::endl;
-        throw std::runtime_error("NPUArray malloc error!");
-    }
-    this->strides.resize(this->shape.size());
-    auto currentStride = 1;
-    for(int64_t i = this->shape.size() - 1; i >= 0; i--) {
-        this->strides[i] = currentStride;
-        currentStride *= this->shape[i];
-    }
-    tensorPtr = aclCreateTensor(this->shape.data(), this->shape.size(), GetACLDataType(this->dtype), this->strides.data(), 0, ACL_FORMAT_ND, this->shape.data(), this->shape.size(), this->devicePtr);
+    this->storage = AllocateStorage(tensorByteSize, "NPUArray malloc error!");
+    this->devicePtr = this->storage.get();
+    this->device = asnumpy::cann::current_device();
+    this->strides = ContiguousStrides(this->shape);
+    tensorPtr = CreateTensor();
 }
 
 
@@ -73,19 +155,59 @@ NPUArray::NPUArray(const std::vector<int64_t>& shape, aclDataType acl_type) {
     // 为了兼容性，创建一个空的 py::dtype 对象
     this->dtype = GetPyDtype(acl_type);
     
-    void *devicePtr = nullptr;
-    auto error = aclrtMalloc(&devicePtr, tensorByteSize, ACL_MEM_MALLOC_HUGE_FIRST);
-    if(error != ACL_SUCCESS) {
-        std::cout << "error = " << error << std::endl;
-        throw std::runtime_error("NPUArray malloc error!");
-    }
-    this->strides.resize(this->shape.size());
-    auto currentStride = 1;
-    for(int64_t i = this->shape.size() - 1; i >= 0; i--) {
-        this->strides[i] = currentStride;
-        currentStride *= this->shape[i];
-    }
-    tensorPtr = aclCreateTensor(this->shape.data(), this->shape.size(), acl_type, this->strides.data(), 0, ACL_FORMAT_ND, this->shape.data(), this->shape.size(), devicePtr);
+    this->storage = AllocateStorage(tensorByteSize, "NPUArray malloc error!");
+    this->devicePtr = this->storage.get();
+    this->device = asnumpy::cann::current_device();
+    this->strides = ContiguousStrides(this->shape);
+    tensorPtr = CreateTensor();
+}
+
+
+/**
+ * @brief Constructor for a view that shares the storage of another NPUArray.
+ * 
+ * No device memory is allocated or copied; the storage stays alive as long
+ * as any array or view referencing it exists.
+ * 
+ * @param base The NPUArray whose storage is shared.
+ * @param shape Shape of the view.
+ * @param strides Strides of the view, in elements.
+ * @param offset Offset of the first element of the view from the first element of base, in elements.
+ */
+NPUArray::NPUArray(const NPUArray& base, const std::vector<int64_t>& shape,
+                   const std::vector<int64_t>& strides, int64_t offset) {
+    this->shape = shape;
+    this->strides = strides;
+    this->dtype = base.dtype;
+    this->aclDtype = base.aclDtype;
+    this->tensorSize = GetShapeSize(shape);
+    this->storage = base.storage;
+    this->devicePtr = static_cast<char*>(base.devicePtr) + offset * GetDataTypeSize(this->aclDtype);
+    this->device = base.device;
+    this->tensorPtr = CreateTensor();
+}
+
+
+/**
+ * @brief Constructor for an array over external device memory, e.g. a DLPack import.
+ *
+ * @param storage Owner of the device buffer, released through its deleter.
+ * @param data Device address of the first element.
+ * @param shape Shape of the array.
+ * @param strides Strides of the array, in elements.
+ * @param acl_type ACL data type constant.
+ */
+NPUArray::NPUArray(std::shared_ptr<void> storage, void* data, const std::vector<int64_t>& shape,
+                   const std::vector<int64_t>& strides, aclDataType acl_type) {
+    this->shape = shape;
+    this->strides = strides;
+    this->aclDtype = acl_type;
+    this->dtype = GetPyDtype(acl_type);
+    this->tensorSize = GetShapeSize(shape);
+    this->storage = std::move(storage);
+    this->devicePtr = data;
+    this->device = asnumpy::cann::current_device();
+    this->tensorPtr = CreateTensor();
 }
 
 
@@ -94,30 +216,43 @@ NPUArray::NPUArray(const std::vector<int64_t>& shape, aclDataType acl_type) {
  * 
  * Creates a new NPUArray with the same content as the given NPUArray.
  * The new object owns its own memory space and is completely independent of the original.
+ * The copy is always contiguous, also when the original is a strided view.
  * 
  * @param other The NPUArray to copy from.
  */
 NPUArray::NPUArray(const NPUArray& other) {
     // fmt::println("拷贝构造函数");
+    asnumpy::npu::DeviceGuard guard(other.device);  // 副本与原数组在同一设备上
     this->shape = other.shape;
     this->dtype = other.dtype;
     this->aclDtype = other.aclDtype;
     this->tensorSize = other.tensorSize;
-    this->strides = other.strides;
+    this->strides = ContiguousStrides(this->shape);
     auto tensorByteSize = this->tensorSize * GetDataTypeSize(this->aclDtype);
-    void *devicePtr = nullptr;
-    auto error = aclrtMalloc(&devicePtr, tensorByteSize, ACL_MEM_MALLOC_HUGE_FIRST);
-    if(error != ACL_SUCCESS) {
-        throw std::runtime_error("NPUArray copy constructor malloc error!");
+    this->storage = AllocateStorage(tensorByteSize, "NPUArray copy constructor malloc error!");
+    this->devicePtr = this->storage.get();
+    this->device = other.device;
+    this->tensorPtr = CreateTensor();
+    if(tensorByteSize == 0) return;
+
+    if(other.IsContiguous()) {
+        auto error = aclrtMemcpyAsync(this->devicePtr, tensorByteSize, other.devicePtr, tensorByteSize, ACL_MEMCPY_DEVICE_TO_DEVICE, asnumpy::npu::GetCurrentStream());
+        if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("Failed to copy tensor data. error: {}", error));
+        return;
+    }
+
+    // 非连续视图：由 aclnnInplaceCopy 按步长读取
+    uint64_t workspaceSize = 0;
+    aclOpExecutor* executor = nullptr;
+    auto error = asnumpy::npu::profiler::Plan("InplaceCopy", aclnnInplaceCopyGetWorkspaceSize, this->tensorPtr, other.tensorPtr, &workspaceSize, &executor);
+    CheckGetWorkspaceSizeAclnnStatus(error);
+    void* workspaceAddr = nullptr;
+    if(workspaceSize > 0) {
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
+        CheckMallocAclnnStatus(error);
     }
-    this->tensorPtr = aclCreateTensor(this->shape.data(), this->shape.size(), this->aclDtype, this->strides.data(), 0, ACL_FORMAT_ND, this->shape.data(), this->shape.size(), devicePtr);
-    void* srcPtr = nullptr;
-    error = aclGetRawTensorAddr(other.tensorPtr, &srcPtr);
-    if(error != ACL_SUCCESS || !srcPtr) throw std::runtime_error(fmt::format("Failed to get source tensor data pointer. error: {}", error));
-    error = aclrtMemcpy(devicePtr, tensorByteSize, srcPtr, tensorByteSize, ACL_MEMCPY_DEVICE_TO_DEVICE);
-    if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("Failed to copy tensor data. error: {}", error));
-    error = aclrtSynchronizeDevice();
-    if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("Failed to synchronize after tensor copy. error: {}", error));
+    error = asnumpy::npu::profiler::Launch(aclnnInplaceCopy, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
+    CheckAclnnStatus(error, "[npu_array.cpp](NPUArray) aclnnInplaceCopy error");
 }
 
 
@@ -138,6 +273,8 @@ NPUArray::NPUArray(NPUArray&& other) noexcept {
     this->tensorSize = other.tensorSize;
     this->strides = std::move(other.strides);
     this->devicePtr = other.devicePtr;
+    this->storage = std::move(other.storage);
+    this->device = other.device;
     other.tensorPtr = nullptr;
     other.devicePtr = nullptr;
 }
@@ -154,30 +291,7 @@ NPUArray::NPUArray(NPUArray&& other) noexcept {
 NPUArray& NPUArray::operator=(const NPUArray& other) {
     // fmt::println("拷贝赋值运算符");
     if(this != &other) {
-        if(this->tensorPtr) {
-            aclDestroyTensor(this->tensorPtr);
-        }
-        this->shape = other.shape;
-        this->dtype = other.dtype;
-        this->aclDtype = other.aclDtype;
-        this->tensorSize = other.tensorSize;
-        this->strides = other.strides;
-
-
-        auto tensorByteSize = this->tensorSize * GetDataTypeSize(this->aclDtype);
-        void *devicePtr = nullptr;
-        auto error = aclrtMalloc(&devicePtr, tensorByteSize, ACL_MEM_MALLOC_HUGE_FIRST);
-        if(error != ACL_SUCCESS) {
-            throw std::runtime_error("NPUArray copy assignment malloc error!");
-        }
-        this->tensorPtr = aclCreateTensor(this->shape.data(), this->shape.size(), this->aclDtype, this->strides.data(), 0, ACL_FORMAT_ND, this->shape.data(), this->shape.size(), devicePtr);
-        void* srcPtr = nullptr;
-        error = aclGetRawTensorAddr(other.tensorPtr, &srcPtr);
-        if(error != ACL_SUCCESS || !srcPtr) throw std::runtime_error(fmt::format("Failed to get source tensor data pointer. error: {}", error));
-        error = aclrtMemcpy(devicePtr, tensorByteSize, srcPtr, tensorByteSize, ACL_MEMCPY_DEVICE_TO_DEVICE);
-        if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("Failed to copy tensor data. error: {}", error));
-        error = aclrtSynchronizeDevice();
-        if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("Failed to synchronize after tensor copy. error: {}", error));
+        *this = NPUArray(other);
     }
     return *this;
 }
@@ -204,7 +318,11 @@ NPUArray& NPUArray::operator=(NPUArray&& other) noexcept {
         this->aclDtype = other.aclDtype;
         this->tensorSize = other.tensorSize;
         this->strides = std::move(other.strides);
+        this->devicePtr = other.devicePtr;
+        this->storage = std::move(other.storage);
+        this->device = other.device;
         other.tensorPtr = nullptr;
+        other.devicePtr = nullptr;
     }
     return *this;
 }
@@ -212,6 +330,9 @@ NPUArray& NPUArray::operator=(NPUArray&& other) noexcept {
 
 /**
  * @brief Destructor that releases resources occupied by NPUArray.
+ * 
+ * The device storage is returned to the memory pool when the last array
+ * or view referencing it is destroyed.
  */
 NPUArray::~NPUArray() {
     // fmt::println("析构函数");
@@ -220,11 +341,337 @@ NPUArray::~NPUArray() {
         auto error = aclDestroyTensor(this->tensorPtr);
         this->tensorPtr = nullptr;
     }
-    if (this->devicePtr) {
-        // fmt::println("析构函数：aclrtFree");
-        auto error = aclrtFree(this->devicePtr);
-        this->devicePtr = nullptr;
+}
+
+
+/**
+ * @brief Create a view of the NPUArray.
+ * 
+ * @return std::unique_ptr<NPUArray> A new NPUArray sharing storage, shape and strides with this one.
+ */
+std::unique_ptr<NPUArray> NPUArray::View() const {
+    return std::unique_ptr<NPUArray>(new NPUArray(*this, this->shape, this->strides, 0));
+}
+
+
+/**
+ * @brief Copy the array to another device.
+ *
+ * Non-contiguous arrays are first made contiguous on their own device. The
+ * destination's current stream is drained before the copy because the block
+ * handed out by the pool may still be read by kernels queued on it.
+ *
+ * @param device Target device id.
+ * @return NPUArray Contiguous array on device, or a view of this array if it is already there.
+ */
+NPUArray NPUArray::To(int32_t device) const {
+    if(device == this->device) {
+        return std::move(*View());
+    }
+    asnumpy::npu::Device target(device);
+    NPUArray source = IsContiguous() ? std::move(*View()) : NPUArray(*this);
+    asnumpy::npu::Device(this->device).Synchronize();
+
+    asnumpy::npu::DeviceGuard guard(device);
+    NPUArray result(this->shape, this->aclDtype);
+    asnumpy::npu::SynchronizeCurrentStream();
+    auto error = asnumpy::npu::CopyPeer(result.devicePtr, device, source.devicePtr, source.device,
+                                        this->tensorSize * GetDataTypeSize(this->aclDtype));
+    CheckAclnnStatus(error, fmt::format("[npu_array.cpp](To) copy from device {} to device {} failed.", this->device, device));
+    return result;
+}
+
+
+/**
+ * @brief Copy src into this NPUArray in place.
+ * 
+ * Uses aclnnInplaceCopy, which reads src through its strides, broadcasts it
+ * to this array's shape and casts it to this array's dtype.
+ * 
+ * @param src Source array, broadcastable to this array's shape.
+ */
+void NPUArray::CopyFrom(const NPUArray& src) {
+    if(GetBroadcastShape(*this, src) != this->shape) {
+        throw std::invalid_argument("[npu_array.cpp](CopyFrom) could not broadcast input into the array's shape");
     }
+    if(this->tensorSize == 0) return;
+    uint64_t workspaceSize = 0;
+    aclOpExecutor* executor = nullptr;
+    auto error = asnumpy::npu::profiler::Plan("InplaceCopy", aclnnInplaceCopyGetWorkspaceSize, this->tensorPtr, src.tensorPtr, &workspaceSize, &executor);
+    CheckGetWorkspaceSizeAclnnStatus(error);
+    void* workspaceAddr = nullptr;
+    if(workspaceSize > 0) {
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
+        CheckMallocAclnnStatus(error);
+    }
+    error = asnumpy::npu::profiler::Launch(aclnnInplaceCopy, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
+    CheckAclnnStatus(error, "[npu_array.cpp](CopyFrom) aclnnInplaceCopy error");
+}
+
+
+/**
+ * @brief Check whether the NPUArray is C-contiguous.
+ * 
+ * Strides of axes with length one are ignored, as in NumPy.
+ * 
+ * @return bool True if the elements are laid out row-major without gaps.
+ */
+bool NPUArray::IsContiguous() const {
+    if(this->tensorSize == 0) {
+        return true;  // 空数组没有元素，步长无关紧要
+    }
+    int64_t expected = 1;
+    for(int64_t i = static_cast<int64_t>(this->shape.size()) - 1; i >= 0; i--) {
+        if(this->shape[i] != 1 && this->strides[i] != expected) {
+            return false;
+        }
+        expected *= this->shape[i];
+    }
+    return true;
+}
+
+
+/**
+ * @brief Create an aclTensor describing the NPUArray.
+ * 
+ * Contiguous arrays use their shape as storage shape; strided views use a
+ * 1-D storage spanning from the first to the last element they reference.
+ * 
+ * @return aclTensor* New tensor descriptor owned by the caller.
+ */
+aclTensor* NPUArray::CreateTensor() const {
+    if(IsContiguous()) {
+        return aclCreateTensor(this->shape.data(), this->shape.size(), this->aclDtype, this->strides.data(), 0, ACL_FORMAT_ND, this->shape.data(), this->shape.size(), this->devicePtr);
+    }
+    int64_t extent = 1;
+    for(size_t i = 0; i < this->shape.size(); i++) {
+        extent += (this->shape[i] - 1) * this->strides[i];
+    }
+    return aclCreateTensor(this->shape.data(), this->shape.size(), this->aclDtype, this->strides.data(), 0, ACL_FORMAT_ND, &extent, 1, this->devicePtr);
+}
+
+
+/**
+ * @brief Basic indexing with integers, slices, None and Ellipsis.
+ * 
+ * Integer indices drop their axis, slices keep it with a scaled stride, None
+ * inserts a new axis of length one and Ellipsis stands for all axes not
+ * otherwise indexed. The result shares storage with this NPUArray, except
+ * that axes sliced with a negative step are flipped into a new array.
+ * 
+ * @param key An index or a tuple of indices.
+ * @return NPUArray The indexed view.
+ * @throws std::out_of_range If an integer index is out of bounds or there are too many indices.
+ * @throws std::invalid_argument If the key contains anything else.
+ */
+NPUArray NPUArray::GetItem(const py::object& key) const {
+    std::vector<py::object> items;
+    if(py::isinstance<py::tuple>(key)) {
+        for(auto item : key.cast<py::tuple>()) {
+            items.push_back(py::reinterpret_borrow<py::object>(item));
+        }
+    } else {
+        items.push_back(key);
+    }
+
+    const int64_t ndim = static_cast<int64_t>(this->shape.size());
+    int64_t consumed = 0;
+    bool hasEllipsis = false;
+    for(const auto& item : items) {
+        if(item.is_none()) continue;
+        if(py::isinstance<py::ellipsis>(item)) {
+            if(hasEllipsis) throw std::invalid_argument("an index can only have a single ellipsis ('...')");
+            hasEllipsis = true;
+            continue;
+        }
+        if(py::isinstance<py::bool_>(item) || !(py::isinstance<py::slice>(item) || py::hasattr(item, "__index__"))) {
+            throw std::invalid_argument("only integers, slices (`:`), ellipsis (`...`) and None are valid indices");
+        }
+        consumed++;
+    }
+    if(consumed > ndim) {
+        throw std::out_of_range(fmt::format("too many indices for array: array is {}-dimensional, but {} were indexed", ndim, consumed));
+    }
+
+    std::vector<int64_t> newShape;
+    std::vector<int64_t> newStrides;
+    std::vector<int64_t> flipAxes;
+    int64_t offset = 0;
+    int64_t dim = 0;
+    for(const auto& item : items) {
+        if(item.is_none()) {
+            newShape.push_back(1);
+            newStrides.push_back(dim < ndim ? this->shape[dim] * this->strides[dim] : 1);
+        } else if(py::isinstance<py::ellipsis>(item)) {
+            for(int64_t k = 0; k < ndim - consumed; k++, dim++) {
+                newShape.push_back(this->shape[dim]);
+                newStrides.push_back(this->strides[dim]);
+            }
+        } else if(py::isinstance<py::slice>(item)) {
+            py::ssize_t start = 0, stop = 0, step = 0, length = 0;
+            if(!item.cast<py::slice>().compute(this->shape[dim], &start, &stop, &step, &length)) {
+                throw py::error_already_set();
+            }
+            if(length == 0) {
+                // 空切片：不引用任何元素，偏移保持不变
+                newStrides.push_back(this->strides[dim]);
+            } else if(step > 0) {
+                offset += start * this->strides[dim];
+                newStrides.push_back(step * this->strides[dim]);
+            } else {
+                // 负步长：先按正步长取出相同元素，再沿该轴翻转
+                offset += (start + (length - 1) * step) * this->strides[dim];
+                newStrides.push_back(-step * this->strides[dim]);
+                flipAxes.push_back(static_cast<int64_t>(newShape.size()));
+            }
+            newShape.push_back(length);
+            dim++;
+        } else {
+            int64_t index = item.attr("__index__")().cast<int64_t>();
+            if(index < -this->shape[dim] || index >= this->shape[dim]) {
+                throw std::out_of_range(fmt::format("index {} is out of bounds for axis {} with size {}", index, dim, this->shape[dim]));
+            }
+            if(index < 0) index += this->shape[dim];
+            offset += index * this->strides[dim];
+            dim++;
+        }
+    }
+    for(; dim < ndim; dim++) {
+        newShape.push_back(this->shape[dim]);
+        newStrides.push_back(this->strides[dim]);
+    }
+
+    NPUArray view(*this, newShape, newStrides, offset);
+    if(flipAxes.empty() || view.tensorSize == 0) {
+        return view;
+    }
+
+    NPUArray result(newShape, this->aclDtype);
+    aclIntArray* dims = aclCreateIntArray(flipAxes.data(), flipAxes.size());
+    uint64_t workspaceSize = 0;
+    aclOpExecutor* executor = nullptr;
+    auto error = asnumpy::npu::profiler::Plan("Flip", aclnnFlipGetWorkspaceSize, view.tensorPtr, dims, result.tensorPtr, &workspaceSize, &executor);
+    CheckGetWorkspaceSizeAclnnStatus(error);
+    void* workspaceAddr = nullptr;
+    if(workspaceSize > 0) {
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
+        CheckMallocAclnnStatus(error);
+    }
+    error = asnumpy::npu::profiler::Launch(aclnnFlip, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
+    CheckAclnnStatus(error, "[npu_array.cpp](GetItem) aclnnFlip error");
+    aclDestroyIntArray(dims);
+    return result;
+}
+
+
+/**
+ * @brief Give a new shape to the NPUArray.
+ * 
+ * @param newShape The new shape; one entry may be -1 and is inferred from the size.
+ * @return NPUArray A view if this NPUArray is contiguous, otherwise a reshaped copy.
+ * @throws std::invalid_argument If the new shape does not match the number of elements.
+ */
+NPUArray NPUArray::Reshape(const std::vector<int64_t>& newShape) const {
+    std::vector<int64_t> shape = newShape;
+    int64_t known = 1;
+    int64_t inferred = -1;
+    for(size_t i = 0; i < shape.size(); i++) {
+        if(shape[i] == -1) {
+            if(inferred >= 0) throw std::invalid_argument("can only specify one unknown dimension");
+            inferred = static_cast<int64_t>(i);
+        } else {
+            known *= shape[i];
+        }
+    }
+    if(inferred >= 0 && known > 0 && static_cast<int64_t>(this->tensorSize) % known == 0) {
+        shape[inferred] = static_cast<int64_t>(this->tensorSize) / known;
+        known *= shape[inferred];
+    }
+    if(known != static_cast<int64_t>(this->tensorSize)) {
+        throw std::invalid_argument(fmt::format("cannot reshape array of size {} into shape with {} elements", this->tensorSize, known));
+    }
+
+    if(IsContiguous()) {
+        return NPUArray(*this, shape, ContiguousStrides(shape), 0);
+    }
+    NPUArray copy(*this);
+    return NPUArray(copy, shape, ContiguousStrides(shape), 0);
+}
+
+
+/**
+ * @brief Permute the axes of the NPUArray without copying.
+ * 
+ * @param axes A permutation of [0, ndim); reverses the axes if empty.
+ * @return NPUArray The transposed view.
+ * @throws std::invalid_argument If axes is not a permutation of the axes.
+ */
+NPUArray NPUArray::Transpose(const std::vector<int64_t>& axes) const {
+    const int64_t ndim = static_cast<int64_t>(this->shape.size());
+    std::vector<int64_t> perm = axes;
+    if(perm.empty()) {
+        for(int64_t i = ndim - 1; i >= 0; i--) perm.push_back(i);
+    }
+    if(static_cast<int64_t>(perm.size()) != ndim) {
+        throw std::invalid_argument("axes don't match array");
+    }
+    std::vector<bool> seen(ndim, false);
+    std::vector<int64_t> newShape(ndim);
+    std::vector<int64_t> newStrides(ndim);
+    for(int64_t i = 0; i < ndim; i++) {
+        int64_t axis = NormalizeAxis(perm[i], ndim);
+        if(seen[axis]) throw std::invalid_argument("repeated axis in transpose");
+        seen[axis] = true;
+        newShape[i] = this->shape[axis];
+        newStrides[i] = this->strides[axis];
+    }
+    return NPUArray(*this, newShape, newStrides, 0);
+}
+
+
+/**
+ * @brief Remove axes of length one without copying.
+ * 
+ * @param axis The axis to remove; all axes of length one if not given.
+ * @return NPUArray The squeezed view.
+ * @throws std::invalid_argument If the selected axis does not have length one.
+ */
+NPUArray NPUArray::Squeeze(std::optional<int64_t> axis) const {
+    const int64_t ndim = static_cast<int64_t>(this->shape.size());
+    int64_t selected = -1;
+    if(axis.has_value()) {
+        selected = NormalizeAxis(axis.value(), ndim);
+        if(this->shape[selected] != 1) {
+            throw std::invalid_argument("cannot select an axis to squeeze out which has size not equal to one");
+        }
+    }
+    std::vector<int64_t> newShape;
+    std::vector<int64_t> newStrides;
+    for(int64_t i = 0; i < ndim; i++) {
+        if(this->shape[i] == 1 && (selected < 0 || i == selected)) continue;
+        newShape.push_back(this->shape[i]);
+        newStrides.push_back(this->strides[i]);
+    }
+    return NPUArray(*this, newShape, newStrides, 0);
+}
+
+
+/**
+ * @brief Insert an axis of length one without copying.
+ * 
+ * @param axis Position of the new axis in the result, may be negative.
+ * @return NPUArray The expanded view.
+ * @throws std::invalid_argument If axis is out of range.
+ */
+NPUArray NPUArray::ExpandDims(int64_t axis) const {
+    const int64_t ndim = static_cast<int64_t>(this->shape.size());
+    int64_t position = NormalizeAxis(axis, ndim + 1);
+    std::vector<int64_t> newShape = this->shape;
+    std::vector<int64_t> newStrides = this->strides;
+    int64_t stride = position < ndim ? this->shape[position] * this->strides[position] : 1;
+    newShape.insert(newShape.begin() + position, 1);
+    newStrides.insert(newStrides.begin() + position, stride);
+    return NPUArray(*this, newShape, newStrides, 0);
 }
 
 
@@ -232,23 +679,22 @@ NPUArray::~NPUArray() {
  * @brief Static method to create NPUArray from NumPy array.
  * 
  * Creates an NPUArray from a NumPy array and copies data
- * from host memory to NPU device memory.
+ * from host memory to NPU device memory. Arrays allocated with
+ * asnumpy.npu.empty_pinned are copied by DMA directly; pageable arrays
+ * are staged through the pinned memory pool.
  * 
  * @param host_data Input NumPy array.
+ * @param non_blocking If true, return once the copy is queued on the current stream.
  * @return NPUArray The created NPUArray.
- * @throws std::runtime_error If getting tensor data pointer fails or data copy fails.
+ * @throws std::runtime_error If data copy fails.
  */
-NPUArray NPUArray::FromNumpy(py::array hostData) {
+NPUArray NPUArray::FromNumpy(py::array hostData, bool non_blocking) {
+    hostData = py::array::ensure(hostData, py::array::c_style);
     py::buffer_info info = hostData.request();
     auto tensorByteSize = info.size * info.itemsize;
     auto result = NPUArray(info.shape, hostData.dtype());
-    void* rawDataPtr = nullptr;
-    auto error = aclGetRawTensorAddr(result.tensorPtr, &rawDataPtr);
-    if (error != ACL_SUCCESS || !rawDataPtr) throw std::runtime_error(fmt::format("Failed to get tensor data pointer. error: {}", error));
-    error = aclrtMemcpy(rawDataPtr, tensorByteSize, info.ptr, tensorByteSize, ACL_MEMCPY_HOST_TO_DEVICE);
+    auto error = asnumpy::npu::CopyToDevice(result.devicePtr, info.ptr, tensorByteSize, non_blocking);
     if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("Failed to copy numpy data to device. error: {}", error));
-    error = aclrtSynchronizeStream(nullptr);
-    if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("aclrtSynchronizeStream error: {}", error));
     return result;
 }
 
@@ -257,48 +703,54 @@ NPUArray NPUArray::FromNumpy(py::array hostData) {
  * @brief Convert NPUArray to NumPy array.
  * 
  * Copies data from NPU device memory to host memory and returns a NumPy array.
+ * The copy waits for the work queued on the current stream of the array's
+ * device only, whichever device is current for the caller.
  * 
+ * @param out Optional C-contiguous NumPy array to copy into instead of allocating a new one.
  * @return py::array The converted NumPy array.
- * @throws std::runtime_error If getting tensor data pointer fails or data copy fails.
+ * @throws std::runtime_error If data copy fails.
  * @throws std::runtime_error If tensor size doesn't match NumPy array size.
  */
-py::array NPUArray::ToNumpy() const {
+py::array NPUArray::ToNumpy(std::optional<py::array> out, std::optional<py::dtype> dtype) const {
+    asnumpy::npu::DeviceGuard guard(this->device);  // 等待并使用数组所在设备的流
+    if(dtype.has_value()) {
+        aclDataType target = GetACLDataType(dtype.value());
+        if(target != this->aclDtype) {
+            // 在设备上转换类型，只传输目标类型的字节数
+            return AsType(target).ToNumpy(out);
+        }
+    }
+    if(!IsContiguous()) {
+        return NPUArray(*this).ToNumpy(out);
+    }
     auto tensorByteSize = this->tensorSize * GetDataTypeSize(this->aclDtype);
-    void* rawDataPtr = nullptr;
-    auto error = aclGetRawTensorAddr(this->tensorPtr, &rawDataPtr);
-    if (error != ACL_SUCCESS || !rawDataPtr) throw std::runtime_error(fmt::format("Failed to get tensor data pointer. error: {}", error));
     
     // 创建结果数组
-    py::array result(this->dtype, this->shape);
-    py::buffer_info info = result.request();
+    py::array result = out.has_value() ? out.value() : py::array(this->dtype, this->shape);
+    if(out.has_value()) {
+        if(!result.dtype().is(this->dtype) || static_cast<size_t>(result.size()) != this->tensorSize) {
+            throw std::runtime_error("to_numpy: out must have the same size and dtype as the array");
+        }
+        if(!(result.flags() & py::array::c_style) || !result.writeable()) {
+            throw std::runtime_error("to_numpy: out must be a writeable C-contiguous array");
+        }
+    }
     if(tensorByteSize == 0) return result;
     
-    // 对于特殊类型，需要特殊处理
-    if (this->aclDtype == ACL_FLOAT16 || this->aclDtype == ACL_BF16) {
-        // 对于 float16 和 bf16，我们需要先复制到临时缓冲区，然后转换
-        std::vector<uint16_t> temp_buffer(this->tensorSize);
-        error = aclrtMemcpy(temp_buffer.data(), tensorByteSize, rawDataPtr, tensorByteSize, ACL_MEMCPY_DEVICE_TO_HOST);
-        if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("Failed to copy tensor data to host. error: {}", error));
-        
-        // 转换为 float32
-        float* result_ptr = static_cast<float*>(info.ptr);
-        for (size_t i = 0; i < this->tensorSize; ++i) {
-            if (this->aclDtype == ACL_FLOAT16) {
-                // 简单的 float16 到 float32 转换
-                uint16_t h = temp_buffer[i];
-                uint32_t f = ((h & 0x8000) << 16) | (((h & 0x7c00) + 0x1c000) << 13) | ((h & 0x03ff) << 13);
-                result_ptr[i] = *reinterpret_cast<float*>(&f);
-            } else { // ACL_BF16
-                // bfloat16 到 float32 转换
-                uint16_t bf = temp_buffer[i];
-                uint32_t f = (bf << 16);
-                result_ptr[i] = *reinterpret_cast<float*>(&f);
-            }
+    if (this->aclDtype == ACL_BF16) {
+        // NumPy 没有 bfloat16：16 位数据直接拷入锁页缓冲区，再并行展开为 float32
+        auto& pinned = asnumpy::npu::GetPinnedMemoryPool();
+        auto* staging = static_cast<uint16_t*>(pinned.Malloc(tensorByteSize));
+        auto error = asnumpy::npu::CopyToHost(staging, this->devicePtr, tensorByteSize);
+        if(error == ACL_SUCCESS) {
+            ParallelBfloat16ToFloat(staging, static_cast<float*>(result.mutable_data()), this->tensorSize);
         }
+        pinned.Free(staging);
+        if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("Failed to copy tensor data to host. error: {}", error));
     } else {
-        // 对于其他类型，直接复制
-        if(info.size * info.itemsize != tensorByteSize) throw std::runtime_error("Size mismatch between tensor and NumPy array");
-        error = aclrtMemcpy(info.ptr, tensorByteSize, rawDataPtr, tensorByteSize, ACL_MEMCPY_DEVICE_TO_HOST);
+        // 其他类型（包括 float16）按位直接复制
+        if(static_cast<size_t>(result.nbytes()) != tensorByteSize) throw std::runtime_error("Size mismatch between tensor and NumPy array");
+        auto error = asnumpy::npu::CopyToHost(result.mutable_data(), this->devicePtr, tensorByteSize);
         if(error != ACL_SUCCESS) throw std::runtime_error(fmt::format("Failed to copy tensor data to host. error: {}", error));
     }
     
@@ -306,20 +758,37 @@ py::array NPUArray::ToNumpy() const {
 }
 
 
+/**
+ * @brief Copy the single element of a size-1 array to host as a Python scalar.
+ * 
+ * This is the explicit synchronization point for reductions that return 0-d
+ * arrays: only the current stream is waited on and only one element is copied.
+ * 
+ * @return py::object Python int, float or bool.
+ * @throws std::invalid_argument If the array does not have exactly one element.
+ */
+py::object NPUArray::Item() const {
+    if(this->tensorSize != 1) {
+        throw std::invalid_argument("can only convert an array of size 1 to a Python scalar");
+    }
+    return ToNumpy().attr("item")();
+}
+
+
 /**
  * @brief Helper function to calculate total size of array.
  * 
  * Calculates the total number of elements for a given shape.
  * 
  * @param shape Vector containing array dimensions, defining the array shape.
- * @return int64_t Total number of elements in the array.
- * @throws std::runtime_error If any dimension in shape is less than or equal to 0.
+ * @return int64_t Total number of elements in the array; 0 if any dimension is 0, 1 for a 0-d shape.
+ * @throws std::runtime_error If any dimension in shape is negative.
  */
 int64_t NPUArray::GetShapeSize(const std::vector<int64_t>& shape) {
     int64_t shapeSize = 1;
     for(auto i : shape) {
-        if(i <= 0) {
-            throw std::runtime_error("Shape Dimensions Must Be Positive!");
+        if(i < 0) {
+            throw std::runtime_error("negative dimensions are not allowed");
         }
         shapeSize *= i;
     }
@@ -327,6 +796,17 @@ int64_t NPUArray::GetShapeSize(const std::vector<int64_t>& shape) {
 }
 
 
+/**
+ * @brief Cast to another data type on the device.
+ */
+NPUArray NPUArray::AsType(aclDataType dtype) const {
+    if(dtype == this->aclDtype) {
+        return NPUArray(*this);
+    }
+    return asnumpy::CastTo(*this, dtype);
+}
+
+
 /**
  * @brief Helper function to convert py::dtype to aclDataType.
  * 
@@ -339,6 +819,7 @@ int64_t NPUArray::GetShapeSize(const std::vector<int64_t>& shape) {
 aclDataType NPUArray::GetACLDataType(py::dtype dtype) {
     if(dtype.is(py::dtype::of<float>())) return ACL_FLOAT;
     if(dtype.is(py::dtype::of<double>())) return ACL_DOUBLE;
+    if(dtype.is(py::dtype("float16"))) return ACL_FLOAT16;
     if(dtype.is(py::dtype::of<int8_t>())) return ACL_INT8;
     if(dtype.is(py::dtype::of<int16_t>())) return ACL_INT16;
     if(dtype.is(py::dtype::of<int32_t>())) return ACL_INT32;
@@ -350,7 +831,38 @@ aclDataType NPUArray::GetACLDataType(py::dtype dtype) {
     if(dtype.is(py::dtype::of<bool>())) return ACL_BOOL;
     if(dtype.is(py::dtype::of<std::complex<float>>())) return ACL_COMPLEX64;
     if(dtype.is(py::dtype::of<std::complex<double>>())) return ACL_COMPLEX128;
-    throw std::runtime_error("Unsupported py::dtype for aclDataType.");
+    // 非内置 dtype（自定义浮点类型）按名称匹配
+    return GetACLDataTypeByName(py::str(dtype.attr("name")));
+}
+
+
+/**
+ * @brief Helper function to convert a dtype name to aclDataType.
+ * 
+ * Covers the NumPy builtin names and the custom float types of
+ * asnumpy/dtypes/float_types.hpp, which NumPy itself does not know.
+ * 
+ * @param name Input dtype name.
+ * @return aclDataType The converted aclDataType.
+ * @throws std::runtime_error If the name is not supported.
+ */
+aclDataType NPUArray::GetACLDataTypeByName(const std::string& name) {
+    static const std::unordered_map<std::string, aclDataType> kNames = {
+        {"float32", ACL_FLOAT}, {"float64", ACL_DOUBLE}, {"float16", ACL_FLOAT16},
+        {"int8", ACL_INT8}, {"int16", ACL_INT16}, {"int32", ACL_INT32}, {"int64", ACL_INT64},
+        {"uint8", ACL_UINT8}, {"uint16", ACL_UINT16}, {"uint32", ACL_UINT32}, {"uint64", ACL_UINT64},
+        {"bool", ACL_BOOL}, {"complex64", ACL_COMPLEX64}, {"complex128", ACL_COMPLEX128},
+        {"bfloat16", ACL_BF16},
+        {"float8_e5m2", ACL_FLOAT8_E5M2}, {"float8_e4m3fn", ACL_FLOAT8_E4M3FN}, {"float8_e8m0", ACL_FLOAT8_E8M0},
+        {"float8_e8m0fnu", ACL_FLOAT8_E8M0},
+        {"float6_e2m3fn", ACL_FLOAT6_E2M3}, {"float6_e3m2fn", ACL_FLOAT6_E3M2},
+        {"float4_e2m1fn", ACL_FLOAT4_E2M1},
+    };
+    auto it = kNames.find(name);
+    if(it == kNames.end()) {
+        throw std::runtime_error("Unsupported dtype '" + name + "' for aclDataType.");
+    }
+    return it->second;
 }
 
 
@@ -376,7 +888,7 @@ py::dtype NPUArray::GetPyDtype(aclDataType acl_type) {
         case ACL_UINT32: return py::dtype::of<uint32_t>();
         case ACL_UINT64: return py::dtype::of<uint64_t>();
         case ACL_BOOL: return py::dtype::of<bool>();
-        case ACL_FLOAT16: return py::dtype::of<float>();  // float16 映射到 float，保持浮点语义
+        case ACL_FLOAT16: return py::dtype("float16");
         case ACL_BF16: return py::dtype::of<float>();     // bf16 映射到 float，保持浮点语义
         case ACL_INT4: return py::dtype::of<uint8_t>();      // int4 映射到 uint8
         case ACL_UINT1: return py::dtype::of<uint8_t>();     // uint1 映射到 uint8
@@ -446,6 +958,16 @@ int64_t NPUArray::GetDataTypeSize(aclDataType dataType) {
 
 
 std::vector<int64_t> GetBroadcastShape(const NPUArray& a, const NPUArray& b) {
+    // Every binary operator broadcasts its operands here, and kernels run on the current device.
+    int32_t device = asnumpy::cann::current_device();
+    for (const NPUArray* x : {&a, &b}) {
+        if (x->device != device) {
+            throw std::invalid_argument(fmt::format(
+                "GetBroadcastShape: operand is on device {} but the current device is {}; move it with to() first",
+                x->device, device));
+        }
+    }
+
     const std::vector<int64_t>& shapeA = a.shape;
     const std::vector<int64_t>& shapeB = b.shape;
 
@@ -460,7 +982,7 @@ std::vector<int64_t> GetBroadcastShape(const NPUArray& a, const NPUArray& b) {
         int64_t dimB = (i < ndimB) ? shapeB[ndimB - 1 - i] : 1;
 
         if (dimA == dimB || dimA == 1 || dimB == 1) {
-            result[ndimOut - 1 - i] = std::max(dimA, dimB);
+            result[ndimOut - 1 - i] = dimA == 1 ? dimB : dimA;  // 0 与 1 广播为 0
         } else {
             throw std::invalid_argument(
                 "GetBroadcastShape: shapes are not broadcastable. "
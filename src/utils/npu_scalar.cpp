@@ -16,6 +16,70 @@
 
 
 #include "asnumpy/utils/npu_scalar.hpp"
+#include "asnumpy/utils/type_promotion.hpp"
+
+#include <climits>
+#include <cstring>
+#include <deque>
+#include <stdexcept>
+#include <mutex>
+#include <unordered_map>
+
+namespace {
+
+/*
+    IEEE binary16 bits for a float, rounded to nearest even. aclCreateScalar copies
+    the raw bytes, so half scalars need their bit pattern, not an integer cast.
+*/
+uint16_t FloatToHalfBits(float value) {
+    uint32_t bits;
+    std::memcpy(&bits, &value, sizeof(bits));
+    uint16_t sign = static_cast<uint16_t>((bits >> 16) & 0x8000);
+    uint32_t magnitude = bits & 0x7fffffff;
+    if (magnitude >= 0x7f800000) {
+        return sign | 0x7c00 | (magnitude > 0x7f800000 ? 0x200 : 0);
+    }
+    if (magnitude >= 0x477ff000) {
+        return sign | 0x7c00;
+    }
+    if (magnitude < 0x38800000) {
+        // subnormal or zero
+        if (magnitude < 0x33000000) {
+            return sign;
+        }
+        uint32_t exponent = magnitude >> 23;
+        uint32_t mantissa = (magnitude & 0x7fffff) | 0x800000;
+        uint32_t shift = 126 - exponent;
+        uint32_t half = mantissa >> shift;
+        uint32_t rest = mantissa & ((1u << shift) - 1);
+        uint32_t halfway = 1u << (shift - 1);
+        if (rest > halfway || (rest == halfway && (half & 1))) {
+            half++;
+        }
+        return sign | static_cast<uint16_t>(half);
+    }
+    uint32_t half = (magnitude - 0x38000000) >> 13;
+    uint32_t rest = magnitude & 0x1fff;
+    if (rest > 0x1000 || (rest == 0x1000 && (half & 1))) {
+        half++;
+    }
+    return sign | static_cast<uint16_t>(half);
+}
+
+/*
+    bfloat16 bits for a float: the upper half of the float32 bits, rounded to nearest even.
+*/
+uint16_t FloatToBfloat16Bits(float value) {
+    uint32_t bits;
+    std::memcpy(&bits, &value, sizeof(bits));
+    if ((bits & 0x7fffffff) > 0x7f800000) {
+        return static_cast<uint16_t>((bits >> 16) | 0x40);  // keep NaN quiet
+    }
+    bits += 0x7fff + ((bits >> 16) & 1);
+    return static_cast<uint16_t>(bits >> 16);
+}
+
+}  // namespace
 
 /*
     Creates an aclScalar object by automatically determining the appropriate ACL data type
@@ -124,11 +188,11 @@ aclScalar* CreateScalar(ValueType value, aclDataType dtype) {
             }
         }
         case ACL_FLOAT16: {
-            auto converted = static_cast<uint16_t>(static_cast<float>(value));
+            auto converted = FloatToHalfBits(static_cast<float>(value));
             return aclCreateScalar(&converted, ACL_FLOAT16);
         }
         case ACL_BF16: {
-            auto converted = static_cast<uint16_t>(static_cast<float>(value));
+            auto converted = FloatToBfloat16Bits(static_cast<float>(value));
             return aclCreateScalar(&converted, ACL_BF16);
         }
         case ACL_INT4: {
@@ -227,4 +291,161 @@ template aclScalar* CreateScalar<uint64_t>(uint64_t, aclDataType);
 template aclScalar* CreateScalar<uint32_t>(uint32_t, aclDataType);
 template aclScalar* CreateScalar<uint16_t>(uint16_t, aclDataType);
 template aclScalar* CreateScalar<uint8_t>(uint8_t, aclDataType);
-template aclScalar* CreateScalar<bool>(bool, aclDataType);
\ No newline at end of file
+template aclScalar* CreateScalar<bool>(bool, aclDataType);
+
+
+/*
+    As in NumPy 2, a Python int that does not fit an integer dtype is an error
+    instead of wrapping (int8 + 300). Other values and dtypes are left alone.
+*/
+void CheckPyIntInRange(const pybind11::handle& value, aclDataType dtype) {
+    PyObject* obj = value.ptr();
+    if (!PyLong_Check(obj) || PyBool_Check(obj)) {
+        return;
+    }
+    int overflow = 0;
+    long long v = PyLong_AsLongLongAndOverflow(obj, &overflow);
+    bool fits;
+    switch (dtype) {
+        case ACL_INT8:   fits = !overflow && v >= SCHAR_MIN && v <= SCHAR_MAX; break;
+        case ACL_INT16:  fits = !overflow && v >= SHRT_MIN && v <= SHRT_MAX; break;
+        case ACL_INT32:  fits = !overflow && v >= INT_MIN && v <= INT_MAX; break;
+        case ACL_INT64:  fits = !overflow; break;
+        case ACL_UINT8:  fits = !overflow && v >= 0 && v <= UCHAR_MAX; break;
+        case ACL_UINT16: fits = !overflow && v >= 0 && v <= USHRT_MAX; break;
+        case ACL_UINT32: fits = !overflow && v >= 0 && v <= UINT_MAX; break;
+        case ACL_UINT64:
+            if (overflow > 0) {
+                PyLong_AsUnsignedLongLong(obj);
+                fits = !PyErr_Occurred();
+                PyErr_Clear();
+            } else {
+                fits = !overflow && v >= 0;
+            }
+            break;
+        default:
+            return;
+    }
+    if (!fits) {
+        throw std::overflow_error("Python integer " + pybind11::str(value).cast<std::string>() + " out of bounds for " +
+                                  pybind11::str(NPUArray::GetPyDtype(dtype)).cast<std::string>());
+    }
+}
+
+
+/*
+    Creates an aclScalar object from a Python scalar. bools and integers (anything
+    with __index__) go through bool/int64_t so integer dtypes get exact values,
+    everything else through double.
+*/
+aclScalar* CreateScalarFromPy(const pybind11::handle& value, aclDataType dtype) {
+    if (!IsPyScalar(value)) {
+        throw std::invalid_argument("CreateScalar: expected a real Python scalar");
+    }
+    CheckPyIntInRange(value, dtype);
+    if (PyBool_Check(value.ptr())) {
+        return CreateScalar(value.cast<bool>(), dtype);
+    }
+    if (PyIndex_Check(value.ptr())) {
+        return CreateScalar(pybind11::int_(pybind11::reinterpret_borrow<pybind11::object>(value)).cast<int64_t>(), dtype);
+    }
+    return CreateScalar(value.cast<double>(), dtype);
+}
+
+
+bool IsPyScalar(const pybind11::handle& value) {
+    PyObject* obj = value.ptr();
+    if (PyBool_Check(obj) || PyLong_Check(obj) || PyFloat_Check(obj)) {
+        return true;
+    }
+    // NumPy scalars (np.float32(1), np.int64(2), ...) but not arrays
+    // Leaked on purpose: must outlive the interpreter's module teardown.
+    static PyObject* generic = pybind11::object(pybind11::module_::import("numpy").attr("generic")).release().ptr();
+    return PyObject_IsInstance(obj, generic) == 1 && PyNumber_Check(obj) && !PyComplex_Check(obj);
+}
+
+
+/*
+    A Python scalar is "weak": it keeps the array's dtype unless its kind is higher.
+    Then it counts as its default type, as in NumPy: a float (float64) with an
+    integer or bool array promotes to float64, an int (int64) with a bool array to int64.
+*/
+aclDataType WeakScalarDtype(aclDataType arrayDtype, const pybind11::handle& value) {
+    if (!IsPyScalar(value)) {
+        throw std::invalid_argument("WeakScalarDtype: expected a real Python scalar");
+    }
+    bool isBool = PyBool_Check(value.ptr());
+    bool isFloat = !isBool && !PyIndex_Check(value.ptr());
+    switch (arrayDtype) {
+        case ACL_BOOL:
+            return isFloat ? asnumpy::PromoteTypes(arrayDtype, ACL_DOUBLE) : (isBool ? ACL_BOOL : ACL_INT64);
+        case ACL_INT8: case ACL_INT16: case ACL_INT32: case ACL_INT64:
+        case ACL_UINT8: case ACL_UINT16: case ACL_UINT32: case ACL_UINT64:
+            return isFloat ? asnumpy::PromoteTypes(arrayDtype, ACL_DOUBLE) : arrayDtype;
+        default:
+            return arrayDtype;
+    }
+}
+
+
+namespace {
+
+constexpr size_t kScalarCacheCapacity = 1024;
+
+struct ScalarCache {
+    std::mutex mutex;
+    std::unordered_map<std::string, aclScalar*> scalars;
+    std::deque<std::string> order;  // insertion order, oldest first
+};
+
+ScalarCache& GetScalarCache() {
+    // Intentionally leaked, like the memory pool: aclScalars must not be
+    // destroyed after aclFinalize.
+    static ScalarCache* cache = new ScalarCache();
+    return *cache;
+}
+
+}
+
+/*
+    Scalars are keyed on the target dtype and the bits of the Python value (as
+    bool, int64 or double), so `x + 1.0` in a loop reuses a single aclScalar.
+    The oldest entry is destroyed once the cache is full.
+*/
+aclScalar* GetCachedScalar(const pybind11::handle& value, aclDataType dtype) {
+    if (!IsPyScalar(value)) {
+        throw std::invalid_argument("GetCachedScalar: expected a real Python scalar");
+    }
+    CheckPyIntInRange(value, dtype);
+    char kind;
+    uint64_t bits;
+    if (PyBool_Check(value.ptr())) {
+        kind = 'b';
+        bits = value.cast<bool>() ? 1 : 0;
+    } else if (PyIndex_Check(value.ptr())) {
+        kind = 'i';
+        int64_t v = pybind11::int_(pybind11::reinterpret_borrow<pybind11::object>(value)).cast<int64_t>();
+        std::memcpy(&bits, &v, sizeof(bits));
+    } else {
+        kind = 'f';
+        double v = value.cast<double>();
+        std::memcpy(&bits, &v, sizeof(bits));
+    }
+    std::string key = std::to_string(static_cast<int>(dtype)) + kind + std::to_string(bits);
+
+    ScalarCache& cache = GetScalarCache();
+    std::lock_guard<std::mutex> lock(cache.mutex);
+    auto it = cache.scalars.find(key);
+    if (it != cache.scalars.end()) {
+        return it->second;
+    }
+    if (cache.scalars.size() >= kScalarCacheCapacity) {
+        aclDestroyScalar(cache.scalars[cache.order.front()]);
+        cache.scalars.erase(cache.order.front());
+        cache.order.pop_front();
+    }
+    aclScalar* scalar = CreateScalarFromPy(value, dtype);
+    cache.scalars.emplace(key, scalar);
+    cache.order.push_back(key);
+    return scalar;
+}
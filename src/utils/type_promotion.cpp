@@ -0,0 +1,245 @@
+/******************************************************************************
+ * Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *****************************************************************************/
+
+#include <asnumpy/utils/type_promotion.hpp>
+#include <asnumpy/utils/npu_scalar.hpp>
+#include <asnumpy/utils/status_handler.hpp>
+#include <asnumpy/npu/stream.hpp>
+#include <asnumpy/npu/workspace.hpp>
+#include <asnumpy/npu/profiler.hpp>
+
+#include <aclnnop/aclnn_cast.h>
+
+#include <array>
+#include <fmt/format.h>
+#include <stdexcept>
+
+namespace asnumpy {
+
+namespace {
+
+enum class Kind { Bool, Unsigned, Signed, Float, Complex, Other };
+
+struct TypeInfo {
+    Kind kind;
+    int size;  // bytes; for complex, the size of one component
+};
+
+TypeInfo Info(aclDataType dtype) {
+    switch (dtype) {
+        case ACL_BOOL: return {Kind::Bool, 1};
+        case ACL_UINT8: return {Kind::Unsigned, 1};
+        case ACL_UINT16: return {Kind::Unsigned, 2};
+        case ACL_UINT32: return {Kind::Unsigned, 4};
+        case ACL_UINT64: return {Kind::Unsigned, 8};
+        case ACL_INT8: return {Kind::Signed, 1};
+        case ACL_INT16: return {Kind::Signed, 2};
+        case ACL_INT32: return {Kind::Signed, 4};
+        case ACL_INT64: return {Kind::Signed, 8};
+        case ACL_FLOAT16: case ACL_BF16: return {Kind::Float, 2};
+        case ACL_FLOAT: return {Kind::Float, 4};
+        case ACL_DOUBLE: return {Kind::Float, 8};
+        case ACL_COMPLEX64: return {Kind::Complex, 4};
+        case ACL_COMPLEX128: return {Kind::Complex, 8};
+        default: return {Kind::Other, 0};
+    }
+}
+
+aclDataType SignedOfSize(int size) {
+    switch (size) {
+        case 1: return ACL_INT8;
+        case 2: return ACL_INT16;
+        case 4: return ACL_INT32;
+        default: return ACL_INT64;
+    }
+}
+
+aclDataType FloatOfSize(int size) {
+    switch (size) {
+        case 2: return ACL_FLOAT16;
+        case 4: return ACL_FLOAT;
+        default: return ACL_DOUBLE;
+    }
+}
+
+/// Narrowest float that holds every value of an integer of the given size.
+int FloatSizeForInteger(int size) {
+    return size == 1 ? 2 : (size == 2 ? 4 : 8);
+}
+
+aclDataType PromoteReal(aclDataType a, aclDataType b) {
+    TypeInfo x = Info(a);
+    TypeInfo y = Info(b);
+    if (x.kind == Kind::Float && y.kind != Kind::Float) {
+        std::swap(a, b);
+        std::swap(x, y);
+    }
+    if (y.kind == Kind::Float) {
+        if (x.kind == Kind::Float) {
+            if (x.size == 2 && y.size == 2) {
+                return ACL_FLOAT;  // float16 with bfloat16 (a == b is handled by the caller)
+            }
+            return x.size > y.size ? a : b;
+        }
+        // integer with float: keep the float if it is wide enough, bfloat16 included
+        int needed = FloatSizeForInteger(x.size);
+        return y.size >= needed ? b : FloatOfSize(needed);
+    }
+    if (x.kind == y.kind) {
+        return x.size >= y.size ? a : b;
+    }
+    // signed with unsigned
+    const TypeInfo& s = x.kind == Kind::Signed ? x : y;
+    const TypeInfo& u = x.kind == Kind::Signed ? y : x;
+    if (s.size > u.size) {
+        return x.kind == Kind::Signed ? a : b;
+    }
+    return u.size == 8 ? ACL_DOUBLE : SignedOfSize(u.size * 2);
+}
+
+aclDataType ComputePromotion(aclDataType a, aclDataType b) {
+    if (a == b) {
+        return a;
+    }
+    TypeInfo x = Info(a);
+    TypeInfo y = Info(b);
+    if (x.kind == Kind::Other || y.kind == Kind::Other) {
+        throw std::invalid_argument(fmt::format(
+            "PromoteTypes: no common dtype for {} and {}",
+            py::str(NPUArray::GetPyDtype(a)).cast<std::string>(),
+            py::str(NPUArray::GetPyDtype(b)).cast<std::string>()));
+    }
+    if (x.kind == Kind::Bool) {
+        return b;
+    }
+    if (y.kind == Kind::Bool) {
+        return a;
+    }
+    if (x.kind == Kind::Complex || y.kind == Kind::Complex) {
+        // promote the real parts, then widen back to complex
+        aclDataType realA = x.kind == Kind::Complex ? FloatOfSize(x.size) : a;
+        aclDataType realB = y.kind == Kind::Complex ? FloatOfSize(y.size) : b;
+        aclDataType real = realA == realB ? realA : PromoteReal(realA, realB);
+        return Info(real).size == 8 ? ACL_COMPLEX128 : ACL_COMPLEX64;
+    }
+    return PromoteReal(a, b);
+}
+
+constexpr size_t kTableSize = 64;
+constexpr int16_t kUnset = -1;
+
+using PromotionTable = std::array<std::array<int16_t, kTableSize>, kTableSize>;
+
+/// Every pair of the dtypes above, filled once on first use; other pairs
+/// are left unset and go through ComputePromotion each time.
+const PromotionTable& GetPromotionTable() {
+    static const PromotionTable table = [] {
+        static const aclDataType kTypes[] = {
+            ACL_BOOL, ACL_UINT8, ACL_UINT16, ACL_UINT32, ACL_UINT64,
+            ACL_INT8, ACL_INT16, ACL_INT32, ACL_INT64,
+            ACL_FLOAT16, ACL_BF16, ACL_FLOAT, ACL_DOUBLE, ACL_COMPLEX64, ACL_COMPLEX128,
+        };
+        PromotionTable t;
+        for (auto& row : t) {
+            row.fill(kUnset);
+        }
+        for (aclDataType a : kTypes) {
+            for (aclDataType b : kTypes) {
+                if (static_cast<size_t>(a) < kTableSize && static_cast<size_t>(b) < kTableSize) {
+                    t[a][b] = static_cast<int16_t>(ComputePromotion(a, b));
+                }
+            }
+        }
+        return t;
+    }();
+    return table;
+}
+
+}
+
+aclDataType PromoteTypes(aclDataType a, aclDataType b) {
+    if (a == b) {
+        return a;
+    }
+    size_t i = static_cast<size_t>(a);
+    size_t j = static_cast<size_t>(b);
+    if (i < kTableSize && j < kTableSize) {
+        int16_t cached = GetPromotionTable()[i][j];
+        if (cached != kUnset) {
+            return static_cast<aclDataType>(cached);
+        }
+    }
+    return ComputePromotion(a, b);
+}
+
+aclDataType ResultType(const NPUArray& x1, const NPUArray& x2) {
+    return PromoteTypes(x1.aclDtype, x2.aclDtype);
+}
+
+aclDataType ResultType(const NPUArray& x, const pybind11::handle& scalar) {
+    return WeakScalarDtype(x.aclDtype, scalar);
+}
+
+NPUArray CastTo(const NPUArray& x, aclDataType dtype) {
+    NPUArray result(x.shape, dtype);
+    if (result.tensorSize == 0) {
+        return result;
+    }
+    uint64_t workspaceSize = 0;
+    aclOpExecutor* executor = nullptr;
+    auto error = asnumpy::npu::profiler::Plan("Cast", aclnnCastGetWorkspaceSize, x.tensorPtr, dtype, result.tensorPtr, &workspaceSize, &executor);
+    CheckGetWorkspaceSizeAclnnStatus(error);
+    void* workspaceAddr = nullptr;
+    if (workspaceSize > 0) {
+        error = asnumpy::npu::GetWorkspace(&workspaceAddr, workspaceSize);
+        CheckMallocAclnnStatus(error);
+    }
+    error = asnumpy::npu::profiler::Launch(aclnnCast, workspaceAddr, workspaceSize, executor, asnumpy::npu::GetCurrentStream());
+    CheckAclnnStatus(error, "[type_promotion.cpp](CastTo) aclnnCast error");
+    return result;
+}
+
+PromotedOperands::PromotedOperands(const NPUArray& x1, const NPUArray& x2)
+    : PromotedOperands(x1, x2, ResultType(x1, x2)) {}
+
+PromotedOperands::PromotedOperands(const NPUArray& x1, const NPUArray& x2, aclDataType dtype)
+    : dtype(dtype), x1_(&x1), x2_(&x2) {
+    if (x1.aclDtype != dtype) {
+        cast1_.emplace(CastTo(x1, dtype));
+    }
+    if (x2.aclDtype != dtype) {
+        cast2_.emplace(CastTo(x2, dtype));
+    }
+}
+
+bool IsIntegralType(aclDataType dtype) {
+    TypeInfo info = Info(dtype);
+    return info.kind == Kind::Bool || info.kind == Kind::Unsigned || info.kind == Kind::Signed;
+}
+
+bool CanCastSameKind(aclDataType from, aclDataType to) {
+    if (from == to) {
+        return true;
+    }
+    Kind source = Info(from).kind;
+    Kind target = Info(to).kind;
+    if (source == Kind::Other || target == Kind::Other) {
+        return false;
+    }
+    return source <= target;
+}
+
+}
@@ -0,0 +1,68 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+import numpy as np
+import asnumpy as ap
+
+
+def test_astype():
+    x_np = (np.random.rand(16, 8) * 100 - 50).astype(np.float32)
+    x = ap.ndarray.from_numpy(x_np)
+    for dtype in (np.float16, np.float64, np.int32, np.int64, np.int8, np.bool_):
+        y = x.astype(dtype)
+        assert y.dtype == np.dtype(dtype), dtype
+        assert np.allclose(y.to_numpy().astype(np.float64), x_np.astype(dtype).astype(np.float64), rtol=1e-3), dtype
+    # dtype 也可以是字符串
+    assert x.astype("float16").dtype == np.float16
+    print("astype: ok")
+
+
+def test_astype_copy():
+    x = ap.ndarray.from_numpy(np.arange(6, dtype=np.float32))
+    # copy=False 且 dtype 相同时返回同一个对象
+    assert x.astype(np.float32, copy=False) is x
+    y = x.astype(np.float32)
+    assert y is not x
+    assert np.array_equal(y.to_numpy(), x.to_numpy())
+    # copy=True 得到独立的存储
+    ap.add(y, y, out=y)
+    assert np.array_equal(x.to_numpy(), np.arange(6, dtype=np.float32))
+    assert x.astype(np.int32, copy=False) is not x
+    print("astype copy: ok")
+
+
+def test_astype_view():
+    x_np = np.arange(24, dtype=np.int32).reshape(4, 6)
+    x = ap.ndarray.from_numpy(x_np)
+    y = x[:, 1::2].astype(np.float32)
+    assert np.array_equal(y.to_numpy(), x_np[:, 1::2].astype(np.float32))
+    print("astype of a view: ok")
+
+
+def test_astype_bfloat16():
+    x_np = np.array([1.0, 2.5, -3.0, 0.125], dtype=np.float32)
+    x = ap.ndarray.from_numpy(x_np)
+    b = x.astype("bfloat16")
+    # bfloat16 在 host 端放宽为 float32；这些值在 bfloat16 中可精确表示
+    assert np.array_equal(b.to_numpy(), x_np)
+    assert np.array_equal(b.astype(np.float32).to_numpy(), x_np)
+    print("astype bfloat16: ok")
+
+
+if __name__ == "__main__":
+    test_astype()
+    test_astype_copy()
+    test_astype_view()
+    test_astype_bfloat16()
@@ -0,0 +1,108 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+import gc
+
+import numpy as np
+import asnumpy as ap
+
+
+def test_dlpack_roundtrip():
+    x_np = np.random.rand(8, 4).astype(np.float32)
+    x = ap.ndarray.from_numpy(x_np)
+    y = ap.from_dlpack(x)
+    assert y.shape == x.shape and y.dtype == x.dtype
+    assert np.array_equal(y.to_numpy(), x_np)
+    # 共享同一块设备内存，修改 x 后 y 可见
+    ap.add(x, x, out=x)
+    assert np.array_equal(y.to_numpy(), x_np * 2)
+    print("dlpack roundtrip: ok")
+
+
+def test_dlpack_lifetime():
+    x_np = np.arange(12, dtype=np.int32)
+    x = ap.ndarray.from_numpy(x_np)
+    y = ap.from_dlpack(x)
+    # 生产者释放后缓冲区仍由 y 持有
+    del x
+    gc.collect()
+    assert np.array_equal(y.to_numpy(), x_np)
+    # 未被消费的 capsule 被回收时释放导出的视图
+    used = ap.npu.memory_pool().used_bytes()
+    z = ap.ndarray.from_numpy(x_np)
+    capsule = z.__dlpack__()
+    del z, capsule
+    gc.collect()
+    assert ap.npu.memory_pool().used_bytes() == used
+    print("dlpack lifetime: ok")
+
+
+def test_dlpack_view():
+    x_np = np.arange(24, dtype=np.float32).reshape(4, 6)
+    x = ap.ndarray.from_numpy(x_np)
+    y = ap.from_dlpack(x[1:, ::2])
+    assert np.array_equal(y.to_numpy(), x_np[1:, ::2])
+    print("dlpack strided view: ok")
+
+
+def test_dlpack_capsule():
+    x = ap.ndarray.from_numpy(np.ones(3, dtype=np.float16))
+    assert x.__dlpack_device__() == ap.ndarray.from_numpy(np.zeros(1)).__dlpack_device__()
+    capsule = x.__dlpack__()
+    y = ap.from_dlpack(capsule)
+    assert np.array_equal(y.to_numpy(), np.ones(3, dtype=np.float16))
+    # capsule 只能被消费一次
+    try:
+        ap.from_dlpack(capsule)
+        assert False, "consumed capsule accepted"
+    except BufferError:
+        pass
+    # copy=True 导出独立的副本
+    c = ap.from_dlpack(x.__dlpack__(copy=True))
+    ap.add(x, x, out=x)
+    assert np.array_equal(c.to_numpy(), np.ones(3, dtype=np.float16))
+    print("dlpack capsule: ok")
+
+
+def test_dlpack_host():
+    # host 端生产者（numpy）拷贝一次到设备
+    x_np = np.arange(10, dtype=np.int64)
+    y = ap.from_dlpack(x_np)
+    assert np.array_equal(y.to_numpy(), x_np)
+    print("dlpack from host: ok")
+
+
+def test_dlpack_torch_npu():
+    try:
+        import torch
+        import torch_npu  # noqa: F401
+    except ImportError:
+        print("dlpack torch_npu: skipped")
+        return
+    t = torch.arange(6, dtype=torch.float32).npu()
+    x = ap.from_dlpack(t)
+    assert np.array_equal(x.to_numpy(), np.arange(6, dtype=np.float32))
+    back = torch.from_dlpack(x)
+    assert back.data_ptr() == t.data_ptr()
+    print("dlpack torch_npu: ok")
+
+
+if __name__ == "__main__":
+    test_dlpack_roundtrip()
+    test_dlpack_lifetime()
+    test_dlpack_view()
+    test_dlpack_capsule()
+    test_dlpack_host()
+    test_dlpack_torch_npu()
@@ -0,0 +1,80 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+import numpy as np
+import asnumpy as ap
+
+
+def test_zero_size_creation():
+    for shape in ((0,), (3, 0), (0, 4, 5)):
+        for create in (ap.empty, ap.zeros, ap.ones):
+            x = create(shape, np.float32)
+            assert tuple(x.shape) == shape and x.size == 0
+            assert x.to_numpy().shape == shape
+        assert ap.full(shape, 2.0, np.float32).size == 0
+    x = ap.ndarray.from_numpy(np.zeros((2, 0), dtype=np.int32))
+    assert tuple(x.to_numpy().shape) == (2, 0)
+    print("zero-size creation: ok")
+
+
+def test_zero_size_ops():
+    pool = ap.npu.memory_pool()
+    a = ap.ndarray.from_numpy(np.zeros((0, 8), dtype=np.float32))
+    b = ap.ndarray.from_numpy(np.ones((8,), dtype=np.float32))
+    used = pool.used_bytes()
+    # 空数组不分配设备内存，也不启动算子
+    for r in (ap.add(a, b), ap.multiply(a, 2.0), ap.exp(a), ap.sin(a), ap.negative(a),
+              ap.maximum(a, b), ap.greater(a, b), ap.isfinite(a), a + b, a.astype(np.float16)):
+        assert tuple(r.shape) == (0, 8)
+        assert r.to_numpy().size == 0
+    assert pool.used_bytes() == used
+    print("zero-size ops: ok")
+
+
+def test_empty_slices():
+    x_np = np.arange(12, dtype=np.float32).reshape(3, 4)
+    x = ap.ndarray.from_numpy(x_np)
+    for key in (np.s_[2:1], np.s_[:, 3:3], np.s_[5:]):
+        assert x[key].to_numpy().shape == x_np[key].shape
+    print("empty slices: ok")
+
+
+def test_zero_dim():
+    s = ap.ndarray.from_numpy(np.array(3.5, dtype=np.float32))
+    assert tuple(s.shape) == () and s.ndim == 0 and s.size == 1
+    assert s.to_numpy().shape == ()
+    assert s.item() == 3.5
+    x = ap.ndarray.from_numpy(np.arange(4, dtype=np.float32))
+    # 0-d 数组与任意形状广播
+    assert np.allclose((x * s).to_numpy(), np.arange(4) * 3.5)
+    assert float(ap.add(s, s)) == 7.0
+    print("0-d arrays: ok")
+
+
+def test_negative_dimension():
+    try:
+        ap.empty((2, -1), np.float32)
+    except Exception:
+        print("negative dimension: ok")
+        return
+    raise AssertionError("negative dimensions must be rejected")
+
+
+if __name__ == "__main__":
+    test_zero_size_creation()
+    test_zero_size_ops()
+    test_empty_slices()
+    test_zero_dim()
+    test_negative_dimension()
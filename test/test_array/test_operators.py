@@ -0,0 +1,113 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+import operator
+
+import numpy as np
+import asnumpy as ap
+
+
+def _check(result, expected):
+    assert isinstance(result, ap.ndarray)
+    assert tuple(result.shape) == expected.shape
+    assert np.allclose(result.to_numpy(), expected, rtol=1e-5, atol=1e-6)
+
+
+def test_array_operators():
+    a_np = np.random.rand(8, 16).astype(np.float32) + 1
+    b_np = np.random.rand(16).astype(np.float32) + 1
+    a = ap.ndarray.from_numpy(a_np)
+    b = ap.ndarray.from_numpy(b_np)
+    for op in (operator.add, operator.sub, operator.mul, operator.truediv,
+               operator.floordiv, operator.mod, operator.pow):
+        _check(op(a, b), op(a_np, b_np))
+        _check(op(b, a), op(b_np, a_np))
+    m_np = np.random.rand(16, 4).astype(np.float32)
+    _check(a @ ap.ndarray.from_numpy(m_np), a_np @ m_np)
+    _check(a @ b, a_np @ b_np)
+    s_np = np.random.rand(3, 4, 8).astype(np.float32)
+    _check(ap.ndarray.from_numpy(s_np) @ a, s_np @ a_np)
+    print("array operators: ok")
+
+
+def test_scalar_operators():
+    a_np = np.random.rand(8, 16).astype(np.float32) + 1
+    a = ap.ndarray.from_numpy(a_np)
+    for s in (2, 0.5, np.float32(3.0)):
+        for op in (operator.add, operator.sub, operator.mul, operator.truediv,
+                   operator.floordiv, operator.mod, operator.pow):
+            _check(op(a, s), op(a_np, np.float32(s)))
+            _check(op(s, a), op(np.float32(s), a_np))
+    print("scalar operators: ok")
+
+
+def test_scalar_result_dtype():
+    i = ap.ndarray.from_numpy(np.arange(6, dtype=np.int32))
+    assert (i + 1).dtype == np.int32
+    # Python float 与整型数组运算得到 float64，与 NumPy 一致
+    assert (i * 0.5).dtype == np.float64
+    assert np.allclose((i * 0.5).to_numpy(), np.arange(6) * 0.5)
+    assert (i / 2).dtype == np.float64
+    print("scalar result dtype: ok")
+
+
+def test_comparisons():
+    a_np = np.arange(12, dtype=np.float32).reshape(3, 4)
+    b_np = np.full((4,), 5, dtype=np.float32)
+    a = ap.ndarray.from_numpy(a_np)
+    b = ap.ndarray.from_numpy(b_np)
+    for op in (operator.lt, operator.le, operator.gt, operator.ge, operator.eq, operator.ne):
+        r = op(a, b)
+        assert r.dtype == np.bool_
+        assert np.array_equal(r.to_numpy(), op(a_np, b_np))
+        assert np.array_equal(op(a, 5).to_numpy(), op(a_np, 5))
+        # 反射比较：5 < a 转为 a > 5
+        assert np.array_equal(op(5.5, a).to_numpy(), op(5.5, a_np))
+    i = ap.ndarray.from_numpy(np.arange(4, dtype=np.int32))
+    assert np.array_equal((i > 0.5).to_numpy(), np.arange(4) > 0.5)
+    print("comparisons: ok")
+
+
+def test_unary_operators():
+    a_np = np.random.randn(5, 3).astype(np.float32)
+    a = ap.ndarray.from_numpy(a_np)
+    _check(-a, -a_np)
+    _check(+a, +a_np)
+    _check(abs(a), np.abs(a_np))
+    m = a > 0
+    assert np.array_equal((~m).to_numpy(), ~(a_np > 0))
+    print("unary operators: ok")
+
+
+def test_unsupported_operand():
+    a = ap.ndarray.from_numpy(np.ones(3, dtype=np.float32))
+    try:
+        a + "x"
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("ndarray + str should raise TypeError")
+    assert (a == None) is False
+    print("unsupported operand: ok")
+
+
+if __name__ == "__main__":
+    test_array_operators()
+    test_scalar_operators()
+    test_scalar_result_dtype()
+    test_comparisons()
+    test_unary_operators()
+    test_unsupported_operand()
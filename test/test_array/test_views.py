@@ -0,0 +1,78 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+import numpy as np
+import asnumpy as ap
+
+
+def test_basic_indexing():
+    x_np = np.arange(60, dtype=np.float32).reshape(3, 4, 5)
+    x = ap.ndarray.from_numpy(x_np)
+    cases = [
+        (1,),
+        (slice(None), 2),
+        (slice(0, 3, 2), slice(1, None), slice(None, None, 2)),
+        (Ellipsis, 3),
+        (None, 1, Ellipsis, None),
+        (slice(None, None, -1), 0),
+        (-1, slice(3, 0, -2)),
+    ]
+    for key in cases:
+        y = x[key]
+        assert tuple(y.shape) == x_np[key].shape, key
+        assert np.array_equal(y.to_numpy(), x_np[key]), key
+    print("basic indexing: ok")
+
+
+def test_views_share_memory():
+    pool = ap.npu.memory_pool()
+    x_np = np.random.rand(64, 32).astype(np.float32)
+    x = ap.ndarray.from_numpy(x_np)
+    used = pool.used_bytes()
+    # 视图不分配新的设备内存
+    v = x[8:40:2, ::4]
+    t = x.T
+    r = x.reshape(32, -1)
+    s = ap.expand_dims(x, 0).squeeze(0)
+    assert pool.used_bytes() == used
+    assert not v.is_contiguous() and not t.is_contiguous() and r.is_contiguous()
+    assert np.array_equal(v.to_numpy(), x_np[8:40:2, ::4])
+    assert np.array_equal(t.to_numpy(), x_np.T)
+    assert np.array_equal(r.to_numpy(), x_np.reshape(32, -1))
+    assert np.array_equal(s.to_numpy(), x_np)
+    # 原数组释放后视图仍然有效
+    del x
+    assert np.array_equal(t.to_numpy(), x_np.T)
+    print("views share memory: ok")
+
+
+def test_ops_on_views():
+    a_np = np.random.rand(16, 8).astype(np.float32)
+    a = ap.ndarray.from_numpy(a_np)
+    y = ap.add(a.T, a.T)
+    assert np.allclose(y.to_numpy(), a_np.T * 2)
+    z = ap.absolute(a[::2, 1:5])
+    assert np.allclose(z.to_numpy(), np.abs(a_np[::2, 1:5]))
+    # 非连续数组 reshape 时复制
+    w = ap.transpose(a, (1, 0)).reshape(-1)
+    assert np.array_equal(w.to_numpy(), a_np.T.reshape(-1))
+    print("ops on views: ok")
+
+
+if __name__ == "__main__":
+    test_basic_indexing()
+    test_views_share_memory()
+    test_ops_on_views()
@@ -0,0 +1,72 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+import json
+import os
+import tempfile
+
+from asnumpy import benchmarks
+from asnumpy.benchmarks.__main__ import main
+
+
+def _report(medians):
+    results = [{"name": name, "metric": "device", "device": {"median": m}} for name, m in medians.items()]
+    return {"meta": {}, "results": results}
+
+
+def test_run_quick():
+    report = benchmarks.run("dispatch|elementwise/add/float32/1024$", quick=True, warmup=1, repeat=3)
+    names = [r["name"] for r in report["results"]]
+    assert names == ["dispatch/add/float32/1", "dispatch/sign/float32/1", "elementwise/add/float32/1024"]
+    for r in report["results"]:
+        assert "error" not in r, r["error"]
+        assert r["device"]["samples"] == 3
+        assert r["host"]["p10"] <= r["host"]["median"] <= r["host"]["p90"]
+        assert r["speedup"] > 0
+    assert report["results"][-1]["gbps"] > 0
+    assert report["meta"]["repeat"] == 3
+    json.dumps(report)
+    print("run quick: ok")
+
+
+def test_compare():
+    base = _report({"a": 100.0, "b": 100.0, "c": 100.0, "gone": 1.0})
+    new = _report({"a": 115.0, "b": 105.0, "c": 80.0, "added": 1.0})
+    status = {row["name"]: row["status"] for row in benchmarks.compare(base, new, threshold=0.1)}
+    assert status == {"a": "regression", "b": "ok", "c": "improvement", "gone": "missing", "added": "new"}
+    assert benchmarks.format_comparison(benchmarks.compare(base, new)).splitlines()[0].startswith("a ")
+    print("compare: ok")
+
+
+def test_cli():
+    tmp = tempfile.mkdtemp()
+    base, new = os.path.join(tmp, "base.json"), os.path.join(tmp, "new.json")
+    with open(base, "w") as f:
+        json.dump(_report({"a": 100.0}), f)
+    with open(new, "w") as f:
+        json.dump(_report({"a": 150.0}), f)
+    assert main(["compare", base, new]) == 1
+    assert main(["compare", base, base]) == 0
+    assert main(["run", "-k", "dispatch/sign", "--quick", "--repeat", "2", "--warmup", "1", "-o", new]) == 0
+    with open(new) as f:
+        assert [r["name"] for r in json.load(f)["results"]] == ["dispatch/sign/float32/1"]
+    print("cli: ok")
+
+
+if __name__ == "__main__":
+    test_run_quick()
+    test_compare()
+    test_cli()
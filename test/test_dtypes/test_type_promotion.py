@@ -0,0 +1,98 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+import numpy as np
+import asnumpy as ap
+
+
+_DTYPES = (np.bool_, np.int8, np.uint8, np.int16, np.uint16, np.int32, np.uint32, np.int64, np.uint64,
+           np.float16, np.float32, np.float64)
+
+
+def test_promote_types():
+    # 与 numpy.promote_types 完全一致
+    for a in _DTYPES:
+        for b in _DTYPES:
+            assert ap.promote_types(np.dtype(a), np.dtype(b)) == np.promote_types(a, b), (a, b)
+    # 也接受类型对象和字符串等 dtype-like
+    assert ap.promote_types(np.int64, np.uint64) == np.float64
+    assert ap.promote_types('i4', 'f4') == np.float64
+    assert ap.promote_types(np.float16, 'int8') == np.float16
+    print("promote_types: ok")
+
+
+def test_binary_result_dtype():
+    i_np = np.arange(1, 9, dtype=np.int32)
+    f_np = np.linspace(0.5, 4, 8).astype(np.float32)
+    i = ap.ndarray.from_numpy(i_np)
+    f = ap.ndarray.from_numpy(f_np)
+    # int32 + float32 -> float64，不再截断为 int32
+    r = ap.add(i, f)
+    assert r.dtype == np.float64
+    assert np.allclose(r.to_numpy(), i_np + f_np)
+    assert ap.add(f, i).dtype == np.float64
+    assert ap.result_type(i, f) == np.float64
+    for ap_func, np_func in ((ap.subtract, np.subtract), (ap.multiply, np.multiply),
+                             (ap.maximum, np.maximum), (ap.minimum, np.minimum)):
+        r = ap_func(i, f)
+        assert r.dtype == np_func(i_np, f_np).dtype, ap_func.__name__
+        assert np.allclose(r.to_numpy(), np_func(i_np, f_np)), ap_func.__name__
+    print("binary result dtype: ok")
+
+
+def test_mixed_integers():
+    a_np = np.arange(8, dtype=np.uint8)
+    b_np = np.arange(8, dtype=np.int8) - 4
+    a = ap.ndarray.from_numpy(a_np)
+    b = ap.ndarray.from_numpy(b_np)
+    r = ap.add(a, b)
+    assert r.dtype == np.int16
+    assert np.array_equal(r.to_numpy(), a_np + b_np)
+    # 真除法：整型输入得到 float64，与 NumPy 一致
+    d_np = np.full(8, 2, dtype=np.int32)
+    q = ap.divide(a, ap.ndarray.from_numpy(d_np))
+    assert q.dtype == (a_np / d_np).dtype == np.float64
+    assert np.allclose(q.to_numpy(), a_np / d_np)
+    print("mixed integers: ok")
+
+
+def test_scalar_is_weak():
+    h = ap.ndarray.from_numpy(np.ones(4, dtype=np.float16))
+    assert ap.result_type(h, 2.0) == np.float16
+    assert ap.result_type(3, h) == np.float16
+    i = ap.ndarray.from_numpy(np.ones(4, dtype=np.int8))
+    assert ap.result_type(i, 1000) == np.int8
+    assert ap.result_type(i, 1.5) == (np.ones(4, dtype=np.int8) + 1.5).dtype
+    print("weak scalars: ok")
+
+
+def test_same_dtype_no_cast():
+    pool = ap.npu.memory_pool()
+    a = ap.ndarray.from_numpy(np.random.rand(128, 128).astype(np.float32))
+    b = ap.ndarray.from_numpy(np.random.rand(128, 128).astype(np.float32))
+    before = pool.used_bytes()
+    r = ap.multiply(a, b)
+    # 同 dtype 时不产生 aclnnCast 临时数组
+    assert pool.used_bytes() - before == 128 * 128 * 4
+    assert np.allclose(r.to_numpy(), a.to_numpy() * b.to_numpy())
+    print("same dtype without cast: ok")
+
+
+if __name__ == "__main__":
+    test_promote_types()
+    test_binary_result_dtype()
+    test_mixed_integers()
+    test_scalar_is_weak()
+    test_same_dtype_no_cast()
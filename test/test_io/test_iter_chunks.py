@@ -0,0 +1,84 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+import os
+import tempfile
+
+import numpy as np
+import asnumpy as ap
+
+
+def _saved(x_np):
+    path = os.path.join(tempfile.mkdtemp(), "x.npy")
+    np.save(path, x_np)
+    return path
+
+
+def test_iter_chunks():
+    x_np = np.random.rand(103, 7).astype(np.float32)
+    path = _saved(x_np)
+    blocks = [b.to_numpy() for b in ap.io.iter_chunks(path, chunks=4)]
+    # 分块方式与 numpy.array_split 一致
+    expected = np.array_split(x_np, 4)
+    assert len(blocks) == 4
+    for got, want in zip(blocks, expected):
+        assert np.array_equal(got, want)
+    print("iter_chunks: ok")
+
+
+def test_load_chunks_compute():
+    x_np = np.arange(1000, dtype=np.float64).reshape(100, 10)
+    path = _saved(x_np)
+    total = 0.0
+    # 在当前块上计算的同时，下一块在拷贝流上上传
+    for block in ap.io.load(path, chunks=8):
+        total += ap.multiply(block, 2.0).to_numpy().sum()
+    assert total == x_np.sum() * 2
+    print("load chunks with compute: ok")
+
+
+def test_iter_chunks_edge_cases():
+    # 块数多于行数时每行一块
+    path = _saved(np.arange(3, dtype=np.int32))
+    assert [b.to_numpy().tolist() for b in ap.io.iter_chunks(path, chunks=10)] == [[0], [1], [2]]
+    # 0-d 与空数组整体作为一块
+    path = _saved(np.array(5.0))
+    (block,) = list(ap.io.iter_chunks(path, chunks=4))
+    assert tuple(block.shape) == () and block.to_numpy() == 5.0
+    path = _saved(np.zeros((0, 4), dtype=np.float32))
+    (block,) = list(ap.io.iter_chunks(path, chunks=4))
+    assert tuple(block.shape) == (0, 4)
+    print("iter_chunks edge cases: ok")
+
+
+def test_iter_chunks_memory():
+    x_np = np.ones((64, 1024), dtype=np.float32)
+    path = _saved(x_np)
+    pool = ap.npu.memory_pool()
+    base = pool.used_bytes()
+    peak = 0
+    for block in ap.io.iter_chunks(path, chunks=16):
+        peak = max(peak, pool.used_bytes() - base)
+        del block
+    # 同时驻留在设备上的块不超过两块（双缓冲）
+    assert peak <= 2 * (x_np.nbytes // 16)
+    print("iter_chunks memory: ok")
+
+
+if __name__ == "__main__":
+    test_iter_chunks()
+    test_load_chunks_compute()
+    test_iter_chunks_edge_cases()
+    test_iter_chunks_memory()
@@ -0,0 +1,82 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+import numpy as np
+import asnumpy as ap
+
+
+def _well_conditioned(shape):
+    # 接近单位阵的矩阵，高次幂也不会溢出
+    m = shape[-1]
+    a = np.random.uniform(-0.1, 0.1, shape) / m + np.eye(m)
+    return a.astype(np.float32)
+
+
+def test_powers():
+    a_np = _well_conditioned((4, 4))
+    a = ap.ndarray.from_numpy(a_np)
+    for n in (0, 1, 2, 3, 7, 8, 100, 1000):
+        expected = np.linalg.matrix_power(a_np.astype(np.float64), n)
+        assert np.allclose(ap.linalg.matrix_power(a, n).to_numpy(), expected, rtol=1e-3, atol=1e-3), n
+    print("positive powers: ok")
+
+
+def test_negative_powers():
+    a_np = _well_conditioned((5, 5))
+    a = ap.ndarray.from_numpy(a_np)
+    for n in (-1, -2, -5, -64):
+        expected = np.linalg.matrix_power(a_np.astype(np.float64), n)
+        assert np.allclose(ap.linalg.matrix_power(a, n).to_numpy(), expected, rtol=1e-3, atol=1e-3), n
+    print("negative powers: ok")
+
+
+def test_stacked():
+    a_np = _well_conditioned((2, 3, 4, 4))
+    a = ap.ndarray.from_numpy(a_np)
+    for n in (0, 1, 5, -3):
+        expected = np.linalg.matrix_power(a_np.astype(np.float64), n)
+        result = ap.linalg.matrix_power(a, n).to_numpy()
+        assert result.shape == expected.shape, n
+        assert np.allclose(result, expected, rtol=1e-3, atol=1e-3), n
+    print("stacked powers: ok")
+
+
+def test_input_unchanged():
+    a_np = _well_conditioned((3, 3))
+    a = ap.ndarray.from_numpy(a_np)
+    b = ap.linalg.matrix_power(a, 1)
+    assert np.array_equal(b.to_numpy(), a_np)
+    ap.linalg.matrix_power(a, 9)
+    assert np.array_equal(a.to_numpy(), a_np)
+    print("input unchanged: ok")
+
+
+def test_not_square():
+    a = ap.ndarray.from_numpy(np.ones((3, 4), dtype=np.float32))
+    try:
+        ap.linalg.matrix_power(a, 2)
+    except ValueError:
+        print("not square: ok")
+    else:
+        raise AssertionError("expected ValueError")
+
+
+if __name__ == "__main__":
+    test_powers()
+    test_negative_powers()
+    test_stacked()
+    test_input_unchanged()
+    test_not_square()
@@ -0,0 +1,230 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+import numpy as np
+import asnumpy as ap
+
+
+def test_binary_out():
+    a_np = np.random.rand(64, 32).astype(np.float32) + 1
+    b_np = np.random.rand(32).astype(np.float32) + 1
+    a = ap.ndarray.from_numpy(a_np)
+    b = ap.ndarray.from_numpy(b_np)
+    out = ap.empty((64, 32), np.float32)
+    for ap_func, np_func in ((ap.add, np.add), (ap.subtract, np.subtract), (ap.multiply, np.multiply),
+                             (ap.divide, np.divide), (ap.floor_divide, np.floor_divide), (ap.fmod, np.fmod)):
+        r = ap_func(a, b, out=out)
+        # out= 返回 out 本身
+        assert r is out
+        assert np.allclose(out.to_numpy(), np_func(a_np, b_np), rtol=1e-5), ap_func.__name__
+    print("binary out: ok")
+
+
+def test_out_no_allocation():
+    pool = ap.npu.memory_pool()
+    a = ap.ndarray.from_numpy(np.random.rand(256, 256).astype(np.float32))
+    b = ap.ndarray.from_numpy(np.random.rand(256, 256).astype(np.float32))
+    out = ap.empty((256, 256), np.float32)
+    ap.add(a, b, out=out)
+    used = pool.used_bytes()
+    for _ in range(10):
+        ap.multiply(out, b, out=out)
+        ap.add(a, b, out=out)
+    # 与输入同 dtype 的 out 直接走 Inplace 算子，不再分配结果数组
+    assert pool.used_bytes() == used
+    print("out without allocation: ok")
+
+
+def test_unary_out_inplace_kernel():
+    x_np = np.random.rand(64, 32).astype(np.float32) + 0.5
+    x = ap.ndarray.from_numpy(x_np)
+    out = ap.empty((64, 32), np.float32)
+    for ap_func, np_func, kernel in ((ap.sin, np.sin, "InplaceSin"), (ap.exp, np.exp, "InplaceExp"),
+                                     (ap.log, np.log, "InplaceLog"), (ap.tanh, np.tanh, "InplaceTanh"),
+                                     (ap.arcsinh, np.arcsinh, "InplaceAsinh"), (ap.floor, np.floor, "InplaceFloor"),
+                                     (ap.negative, np.negative, "InplaceNeg"),
+                                     (ap.reciprocal, np.reciprocal, "InplaceReciprocal")):
+        with ap.profiler.profile() as prof:
+            assert ap_func(x, out=out) is out
+        # out 与输入同 dtype 时只拷贝一次输入，再在 out 上跑 Inplace 算子，不经过临时结果
+        assert [r.name for r in prof.records] == ["InplaceCopy", kernel], ap_func.__name__
+        assert np.allclose(out.to_numpy(), np_func(x_np), rtol=1e-5), ap_func.__name__
+    # out 就是输入时不需要拷贝
+    y = ap.ndarray.from_numpy(x_np)
+    with ap.profiler.profile() as prof:
+        assert ap.cos(y, out=y) is y
+    assert [r.name for r in prof.records] == ["InplaceCos"]
+    assert np.allclose(y.to_numpy(), np.cos(x_np), rtol=1e-5)
+    print("unary out with in-place kernels: ok")
+
+
+def test_unary_and_reduction_out():
+    x_np = np.random.rand(16, 8).astype(np.float32)
+    x = ap.ndarray.from_numpy(x_np)
+    out = ap.empty((16, 8), np.float32)
+    assert ap.exp(x, out=out) is out
+    assert np.allclose(out.to_numpy(), np.exp(x_np), rtol=1e-5)
+    assert ap.sin(x, out=out) is out
+    assert np.allclose(out.to_numpy(), np.sin(x_np), rtol=1e-5)
+    # 结果按 out 的 dtype 转换
+    out64 = ap.empty((16, 8), np.float64)
+    ap.square(x, out=out64)
+    assert out64.dtype == np.float64
+    assert np.allclose(out64.to_numpy(), np.square(x_np), rtol=1e-5)
+    s = ap.empty((8,), np.float32)
+    assert ap.sum(x, 0, False, out=s) is s
+    assert np.allclose(s.to_numpy(), x_np.sum(axis=0), rtol=1e-4)
+    total = ap.empty((), np.float32)
+    ap.sum(x, out=total)
+    assert np.isclose(total.item(), x_np.sum(), rtol=1e-4)
+    print("unary/reduction out: ok")
+
+
+def test_out_validation():
+    x = ap.ndarray.from_numpy(np.ones((4, 4), dtype=np.float32))
+    for bad in (ap.empty((4, 5), np.float32), ap.empty((16,), np.float32)):
+        try:
+            ap.add(x, x, out=bad)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("out with the wrong shape should raise")
+    try:
+        ap.exp(x, out=np.empty((4, 4), dtype=np.float32))
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("host out should raise")
+    print("out validation: ok")
+
+
+def test_out_casting():
+    f_np = np.linspace(0.5, 2.5, 6, dtype=np.float32).reshape(2, 3)
+    i_np = np.arange(6, dtype=np.int32).reshape(2, 3) + 1
+    f = ap.ndarray.from_numpy(f_np)
+    i = ap.ndarray.from_numpy(i_np)
+    out_i = ap.empty((2, 3), np.int32)
+    # ufunc 的结果只能按 'same_kind' 写入 out，降级到整数时报错而不是截断
+    for call in (lambda: ap.add(f, f, out=out_i),
+                 lambda: ap.sin(f, out=out_i),
+                 lambda: ap.divide(i, i, out=out_i),
+                 lambda: ap.add(i, 0.5, out=out_i)):
+        try:
+            call()
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("an unsafe cast into out should raise")
+    # 同类或升级的转换照常写入
+    out_f = ap.empty((2, 3), np.float64)
+    ap.divide(i, i, out=out_f)
+    assert np.allclose(out_f.to_numpy(), np.ones((2, 3)))
+    ap.add(i, i, out=out_f)
+    assert np.allclose(out_f.to_numpy(), 2 * i_np)
+    # 归约与 NumPy 一致，允许 unsafe 转换
+    g = ap.ndarray.from_numpy(np.array([1.0, 2.0, 3.0], dtype=np.float32))
+    total = ap.empty((), np.int32)
+    assert ap.sum(g, out=total) is total
+    assert total.item() == 6
+    print("out casting: ok")
+
+
+def test_inplace_operators():
+    a_np = np.random.rand(32, 16).astype(np.float32) + 1
+    b_np = np.random.rand(16).astype(np.float32) + 1
+    a = ap.ndarray.from_numpy(a_np)
+    b = ap.ndarray.from_numpy(b_np)
+    ref = a
+    a += b
+    a_np += b_np
+    a *= b
+    a_np *= b_np
+    a -= b
+    a_np -= b_np
+    a /= b
+    a_np /= b_np
+    # 原地运算不替换对象
+    assert a is ref
+    assert np.allclose(a.to_numpy(), a_np, rtol=1e-5)
+    try:
+        b += a
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("broadcasting that changes the in-place operand's shape should raise")
+    print("in-place operators: ok")
+
+
+def test_inplace_scalar():
+    a_np = np.arange(8, dtype=np.float32)
+    a = ap.ndarray.from_numpy(a_np)
+    b = a[1:3]
+    ref = b
+    b += 1.0
+    a_np[1:3] += 1.0
+    b *= 3
+    a_np[1:3] *= 3
+    b /= 2
+    a_np[1:3] /= 2
+    b **= 2
+    a_np[1:3] **= 2
+    # 标量原地运算写回视图，原数组可见
+    assert b is ref
+    assert np.allclose(a.to_numpy(), a_np)
+    i_np = np.arange(1, 9, dtype=np.int32)
+    i = ap.ndarray.from_numpy(i_np)
+    i += 2
+    i_np += 2
+    i //= 3
+    i_np //= 3
+    i %= 2
+    i_np %= 2
+    assert i.dtype == np.int32
+    assert np.array_equal(i.to_numpy(), i_np)
+    # 结果不能按 same_kind 转回整数时与 NumPy 一样报错，且不修改数组
+    for op in (lambda x: x.__itruediv__(2), lambda x: x.__iadd__(0.5),
+               lambda x: x.__itruediv__(ap.ndarray.from_numpy(np.ones(8, dtype=np.int32)))):
+        try:
+            op(i)
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("casting the result into an integer array should raise")
+    assert np.array_equal(i.to_numpy(), i_np)
+    print("in-place scalar operators: ok")
+
+
+def test_out_aliasing():
+    x_np = np.arange(10, dtype=np.float32)
+    x = ap.ndarray.from_numpy(x_np)
+    # out 与输入部分重叠时退回到临时结果再拷贝
+    ap.add(x[1:], x[:-1], out=x[1:])
+    expected = x_np.copy()
+    expected[1:] = x_np[1:] + x_np[:-1]
+    assert np.allclose(x.to_numpy(), expected)
+    print("out aliasing: ok")
+
+
+if __name__ == "__main__":
+    test_binary_out()
+    test_out_no_allocation()
+    test_unary_out_inplace_kernel()
+    test_unary_and_reduction_out()
+    test_out_validation()
+    test_out_casting()
+    test_inplace_operators()
+    test_inplace_scalar()
+    test_out_aliasing()
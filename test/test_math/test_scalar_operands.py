@@ -0,0 +1,139 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+import numpy as np
+import asnumpy as ap
+
+
+def test_array_scalar():
+    x_np = (np.random.rand(32, 16).astype(np.float32) + 1) * 4
+    x = ap.ndarray.from_numpy(x_np)
+    for ap_func, np_func in ((ap.add, np.add), (ap.subtract, np.subtract), (ap.multiply, np.multiply),
+                             (ap.divide, np.divide), (ap.floor_divide, np.floor_divide), (ap.fmod, np.fmod),
+                             (ap.mod, np.mod), (ap.maximum, np.maximum), (ap.minimum, np.minimum)):
+        r = ap_func(x, 2.5)
+        assert r.dtype == np.float32, ap_func.__name__
+        assert np.allclose(r.to_numpy(), np_func(x_np, np.float32(2.5)), rtol=1e-5), ap_func.__name__
+    print("array-scalar: ok")
+
+
+def test_scalar_array():
+    x_np = np.random.rand(32, 16).astype(np.float32) + 1
+    x = ap.ndarray.from_numpy(x_np)
+    for ap_func, np_func in ((ap.add, np.add), (ap.subtract, np.subtract), (ap.multiply, np.multiply),
+                             (ap.divide, np.divide), (ap.floor_divide, np.floor_divide), (ap.mod, np.mod)):
+        r = ap_func(3.0, x)
+        assert np.allclose(r.to_numpy(), np_func(np.float32(3.0), x_np), rtol=1e-5), ap_func.__name__
+    print("scalar-array: ok")
+
+
+def test_scalar_dtype():
+    # 标量不提升数组的 dtype，只有种类更高时才改变，结果类型与 NumPy 一致
+    i_np = np.arange(10, dtype=np.int32)
+    i = ap.ndarray.from_numpy(i_np)
+    assert ap.add(i, 1).dtype == (i_np + 1).dtype
+    assert ap.add(i, 0.5).dtype == (i_np + 0.5).dtype
+    assert np.allclose(ap.add(i, 0.5).to_numpy(), i_np + 0.5)
+    h = ap.ndarray.from_numpy(np.ones(10, dtype=np.float16))
+    assert ap.multiply(h, 3).dtype == np.float16
+    assert ap.divide(i, 2).dtype == (i_np / 2).dtype
+    assert np.allclose(ap.divide(i, 2).to_numpy(), i_np / 2)
+    print("scalar dtype: ok")
+
+
+def test_scalar_overflow():
+    # 与 NumPy 2 一致，超出数组整数类型范围的 Python int 报 OverflowError 而不是回绕
+    a_np = np.arange(3, dtype=np.int8)
+    a = ap.ndarray.from_numpy(a_np)
+    u = ap.ndarray.from_numpy(np.arange(3, dtype=np.uint8))
+    for call in (lambda: a + 300, lambda: ap.add(a, 300), lambda: ap.subtract(300, a),
+                 lambda: ap.maximum(a, -129), lambda: u + (-1), lambda: a.__iadd__(300)):
+        try:
+            call()
+        except OverflowError:
+            pass
+        else:
+            raise AssertionError("an out-of-range Python int should raise")
+    assert np.array_equal(a.to_numpy(), a_np)
+    # 能放下的值、显式更宽的 dtype、真除法和比较照常计算
+    assert np.array_equal((a + 127).to_numpy(), a_np + 127)
+    assert np.array_equal(ap.add(a, 300, dtype=np.dtype(np.int16)).to_numpy(), a_np.astype(np.int16) + 300)
+    assert np.allclose((a / 300).to_numpy(), a_np / 300)
+    assert np.array_equal((a < 300).to_numpy(), a_np < 300)
+    print("scalar overflow: ok")
+
+
+def test_half_scalar():
+    # float16/bfloat16 标量按其位模式传给内核
+    h_np = (np.arange(8, dtype=np.float32) / 4).astype(np.float16)
+    h = ap.ndarray.from_numpy(h_np)
+    for ap_func, np_func in ((ap.add, np.add), (ap.multiply, np.multiply), (ap.subtract, np.subtract)):
+        for value in (1.0, 3, -0.5):
+            r = ap_func(h, value)
+            assert r.dtype == np.float16
+            assert np.allclose(r.to_numpy().astype(np.float32), np_func(h_np, np.float16(value)).astype(np.float32),
+                               rtol=1e-3), ap_func.__name__
+    assert np.allclose((h + 1.0).to_numpy().astype(np.float32), h_np.astype(np.float32) + 1)
+    b = ap.ndarray.from_numpy(np.arange(8, dtype=np.float32)).astype("bfloat16")
+    assert np.array_equal(ap.add(b, 1.0).to_numpy(), np.arange(8, dtype=np.float32) + 1)
+    assert np.array_equal(ap.multiply(b, 3).to_numpy(), np.arange(8, dtype=np.float32) * 3)
+    print("half scalar: ok")
+
+
+def test_scalar_out():
+    x_np = np.random.rand(64).astype(np.float32)
+    x = ap.ndarray.from_numpy(x_np)
+    out = ap.empty((64,), np.float32)
+    assert ap.multiply(x, 2.0, out=out) is out
+    assert np.allclose(out.to_numpy(), x_np * 2)
+    assert ap.subtract(1.0, x, out=out) is out
+    assert np.allclose(out.to_numpy(), 1 - x_np)
+    print("scalar out: ok")
+
+
+def test_scalar_comparisons():
+    x_np = np.arange(10, dtype=np.int32)
+    x = ap.ndarray.from_numpy(x_np)
+    assert np.array_equal(ap.greater(x, 4.5).to_numpy(), x_np > 4.5)
+    assert np.array_equal(ap.greater(4.5, x).to_numpy(), 4.5 > x_np)
+    assert np.array_equal(ap.less_equal(3, x).to_numpy(), 3 <= x_np)
+    assert np.array_equal(ap.equal(5, x).to_numpy(), x_np == 5)
+    b_np = x_np > 4
+    b = ap.ndarray.from_numpy(b_np)
+    assert np.array_equal(ap.logical_and(b, True).to_numpy(), b_np)
+    assert np.array_equal(ap.logical_xor(True, b).to_numpy(), ~b_np)
+    print("scalar comparisons: ok")
+
+
+def test_scalar_no_allocation():
+    pool = ap.npu.memory_pool()
+    x = ap.ndarray.from_numpy(np.random.rand(256, 256).astype(np.float32))
+    before = pool.used_bytes()
+    r = ap.add(x, 1.0)
+    # 带标量内核的运算只分配结果数组，不构造整形状的标量数组
+    assert pool.used_bytes() - before == 256 * 256 * 4
+    assert np.allclose(r.to_numpy(), x.to_numpy() + 1)
+    print("scalar without temporaries: ok")
+
+
+if __name__ == "__main__":
+    test_array_scalar()
+    test_scalar_array()
+    test_scalar_dtype()
+    test_scalar_overflow()
+    test_half_scalar()
+    test_scalar_out()
+    test_scalar_comparisons()
+    test_scalar_no_allocation()
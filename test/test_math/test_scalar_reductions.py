@@ -0,0 +1,61 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+import numpy as np
+import asnumpy as ap
+
+
+def test_full_reduction_is_0d():
+    x_np = np.random.rand(8, 16).astype(np.float32)
+    x = ap.ndarray.from_numpy(x_np)
+    for ap_func, np_func in ((ap.sum, np.sum), (ap.prod, np.prod), (ap.nansum, np.nansum), (ap.nanprod, np.nanprod)):
+        r = ap_func(x)
+        # 结果留在设备上，为 0 维数组
+        assert isinstance(r, ap.ndarray)
+        assert tuple(r.shape) == () and r.ndim == 0 and r.size == 1
+        assert np.allclose(r.to_numpy(), np_func(x_np), rtol=1e-4)
+        assert np.isclose(r.item(), np_func(x_np), rtol=1e-4)
+    print("full reduction 0-d: ok")
+
+
+def test_scalar_conversion():
+    x = ap.ndarray.from_numpy(np.array([[1, 2], [3, 4]], dtype=np.int32))
+    s = ap.sum(x)
+    assert isinstance(s.item(), int) and s.item() == 10
+    assert int(s) == 10 and float(s) == 10.0 and bool(s)
+    try:
+        float(x)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("float() on a size-4 array should raise")
+    print("scalar conversion: ok")
+
+
+def test_chained_on_device():
+    x_np = np.random.rand(1024).astype(np.float32)
+    x = ap.ndarray.from_numpy(x_np)
+    # 0 维结果可直接参与后续设备计算，不需要回传主机
+    total = ap.sum(x)
+    y = ap.divide(x, total)
+    assert np.allclose(y.to_numpy(), x_np / x_np.sum(), rtol=1e-4)
+    print("chained on device: ok")
+
+
+if __name__ == "__main__":
+    test_full_reduction_is_0d()
+    test_scalar_conversion()
+    test_chained_on_device()
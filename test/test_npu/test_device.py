@@ -0,0 +1,109 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+import os
+import subprocess
+import sys
+
+# 主机替身下模拟两张卡；真实环境中设备不足两张时跳过
+_PRELUDE = ("import numpy as np, asnumpy as ap\n"
+            "if ap.npu.device_count() < 2:\n"
+            "    print('skip'); raise SystemExit\n")
+
+
+def _run(code):
+    # 设备上下文是进程级的，所以在新进程中检查
+    env = {**os.environ, "ASNUMPY_HOST_DEVICE_COUNT": "2"}
+    result = subprocess.run([sys.executable, "-c", _PRELUDE + code], env=env,
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+
+def test_device_context():
+    out = _run("x = ap.ones((2, 3), np.dtype(np.float32))\n"
+               "with ap.Device(1) as d:\n"
+               "    y = ap.ones((2, 3), np.dtype(np.float32))\n"
+               "    print(ap.npu.current_device(), d.id, y.device.id, ap.npu.current_stream().device.id)\n"
+               "print(ap.npu.current_device(), x.device.id, x.device == 0, sorted(ap.npu.active_devices()))")
+    if out != "skip":
+        assert out.splitlines() == ["1 1 1 1", "0 0 True [0, 1]"]
+    print("device context: ok")
+
+
+def test_to():
+    out = _run("a = np.arange(12, dtype=np.float32).reshape(3, 4)\n"
+               "x = ap.ndarray.from_numpy(a)\n"
+               "y = x.to(1)\n"
+               "assert y.device == 1 and np.array_equal(y.to_numpy(), a)\n"
+               "z = x[:, 1::2].to(ap.Device(1))\n"
+               "assert np.array_equal(z.to_numpy(), a[:, 1::2])\n"
+               "with ap.Device(1):\n"
+               "    w = ap.add(y, y)\n"
+               "assert np.array_equal(w.to(0).to_numpy(), 2 * a)\n"
+               "assert x.to(0).device == 0\n"
+               "print('ok')")
+    assert out in ("ok", "skip")
+    print("to: ok")
+
+
+def test_read_outside_context():
+    # 在上下文外读取 1 号卡的结果时，须等待 1 号卡上的内核
+    out = _run("a = np.ones((1 << 16,), dtype=np.float32)\n"
+               "for _ in range(20):\n"
+               "    with ap.Device(1):\n"
+               "        x = ap.ndarray.from_numpy(a)\n"
+               "        for _ in range(20):\n"
+               "            x = ap.add(x, x)\n"
+               "    assert np.array_equal(x.to_numpy(), a * 2 ** 20)\n"
+               "    with ap.Device(1):\n"
+               "        s = ap.sum(ap.add(x, x))\n"
+               "    assert s.item() == a.size * 2 ** 21\n"
+               "print('ok')")
+    assert out in ("ok", "skip")
+    print("read outside context: ok")
+
+
+def test_cross_device_operands():
+    out = _run("x = ap.ones((4,), np.dtype(np.float32))\n"
+               "with ap.Device(1):\n"
+               "    y = ap.ones((4,), np.dtype(np.float32))\n"
+               "try:\n"
+               "    ap.add(x, y)\n"
+               "except ValueError as e:\n"
+               "    print('device' in str(e))\n")
+    assert out in ("True", "skip")
+    print("cross-device operands: ok")
+
+
+def test_per_device_pools():
+    out = _run("x = ap.ones((1024,), np.dtype(np.float32))\n"
+               "used = ap.npu.memory_pool().used_bytes()\n"
+               "with ap.Device(1):\n"
+               "    before = ap.npu.memory_pool().used_bytes()\n"
+               "    y = ap.ones((1024,), np.dtype(np.float32))\n"
+               "    grown = ap.npu.memory_pool().used_bytes() - before\n"
+               "print(grown > 0, ap.npu.memory_pool().used_bytes() == used)")
+    assert out in ("True True", "skip")
+    print("per-device pools: ok")
+
+
+if __name__ == "__main__":
+    test_device_context()
+    test_to()
+    test_read_outside_context()
+    test_cross_device_operands()
+    test_per_device_pools()
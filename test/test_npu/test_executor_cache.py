@@ -0,0 +1,70 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+import numpy as np
+import asnumpy as ap
+
+
+def test_cache_hits():
+    cache = ap.npu.executor_cache()
+    cache.reset_stats()
+    x_np = np.random.randn(32, 32).astype(np.float32)
+    x = ap.ndarray.from_numpy(x_np)
+    for _ in range(10):
+        y = ap.absolute(x)
+    # 形状和类型不变，只规划一次
+    assert cache.misses() == 1
+    assert cache.hits() == 9
+    assert np.allclose(y.to_numpy(), np.abs(x_np))
+    # 新的输入地址也能得到正确结果
+    z_np = np.random.randn(32, 32).astype(np.float32)
+    z = ap.absolute(ap.ndarray.from_numpy(z_np))
+    assert cache.hits() == 10
+    assert np.allclose(z.to_numpy(), np.abs(z_np))
+    print("cache hits: ok, size", cache.size())
+
+
+def test_cache_eviction():
+    cache = ap.npu.executor_cache()
+    cache.clear()
+    cache.set_capacity(2)
+    for n in (4, 5, 6):
+        ap.sign(ap.ndarray.from_numpy(np.ones((n,), dtype=np.float32)))
+    assert cache.size() == 2
+    cache.reset_stats()
+    ap.sign(ap.ndarray.from_numpy(np.ones((4,), dtype=np.float32)))
+    assert cache.misses() == 1
+    cache.set_capacity(256)
+    print("cache eviction: ok")
+
+
+def test_cache_disabled():
+    cache = ap.npu.executor_cache()
+    cache.set_enabled(False)
+    cache.reset_stats()
+    a = ap.ndarray.from_numpy(np.array([-1.0, 0.0, 2.0], dtype=np.float32))
+    b = ap.ndarray.from_numpy(np.array([0.5, 0.5, 0.5], dtype=np.float32))
+    y = ap.heaviside(a, b)
+    assert cache.hits() == 0 and cache.misses() == 0
+    assert np.allclose(y.to_numpy(), [0.0, 0.5, 1.0])
+    cache.set_enabled(True)
+    print("cache disabled: ok")
+
+
+if __name__ == "__main__":
+    test_cache_hits()
+    test_cache_eviction()
+    test_cache_disabled()
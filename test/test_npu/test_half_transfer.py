@@ -0,0 +1,55 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+import numpy as np
+import asnumpy as ap
+
+
+def test_float16_roundtrip():
+    x_np = np.random.randn(512, 512).astype(np.float16)
+    x = ap.ndarray.from_numpy(x_np)
+    r = x.to_numpy()
+    # float16 按位传回，不经过 float32 转换
+    assert r.dtype == np.float16
+    assert np.array_equal(r.view(np.uint16), x_np.view(np.uint16))
+    print("float16 roundtrip: ok")
+
+
+def test_to_numpy_dtype():
+    x_np = np.random.randn(256, 256).astype(np.float32)
+    x = ap.ndarray.from_numpy(x_np)
+    # 在设备上转换为 float16 后再传输
+    r = x.to_numpy(dtype=np.float16)
+    assert r.dtype == np.float16
+    assert np.allclose(r.astype(np.float32), x_np, rtol=1e-3, atol=1e-3)
+    # 与原类型相同时不做转换
+    assert np.array_equal(x.to_numpy(dtype=np.float32), x_np)
+    print("to_numpy dtype: ok")
+
+
+def test_float16_to_float32():
+    x_np = (np.arange(4096, dtype=np.float32) / 7).astype(np.float16)
+    x = ap.ndarray.from_numpy(x_np)
+    r = x.to_numpy(dtype=np.float32)
+    assert r.dtype == np.float32
+    assert np.array_equal(r, x_np.astype(np.float32))
+    print("float16 -> float32: ok")
+
+
+if __name__ == "__main__":
+    test_float16_roundtrip()
+    test_to_numpy_dtype()
+    test_float16_to_float32()
@@ -0,0 +1,66 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+import numpy as np
+import asnumpy as ap
+
+
+def test_elementwise_and_reductions():
+    # 主机运行时与设备应给出相同结果，这里对照 NumPy 检查常用算子
+    a_np = np.random.rand(4, 5).astype(np.float32) + 0.5
+    b_np = np.random.rand(5).astype(np.float32) + 0.5
+    a = ap.ndarray.from_numpy(a_np)
+    b = ap.ndarray.from_numpy(b_np)
+    assert np.allclose(ap.add(a, b).to_numpy(), a_np + b_np)
+    assert np.allclose(ap.divide(a, b).to_numpy(), a_np / b_np)
+    assert np.allclose(ap.exp(a).to_numpy(), np.exp(a_np), rtol=1e-5)
+    assert np.allclose(ap.sum(a).to_numpy(), np.sum(a_np), rtol=1e-5)
+    assert np.allclose(ap.cumsum(a, 1).to_numpy(), np.cumsum(a_np, 1), rtol=1e-5)
+    print("elementwise and reductions: ok")
+
+
+def test_matmul_batched():
+    a_np = np.random.rand(2, 4, 4).astype(np.float32)
+    b_np = np.random.rand(2, 4, 4).astype(np.float32)
+    c = ap.matmul(ap.ndarray.from_numpy(a_np), ap.ndarray.from_numpy(b_np))
+    assert tuple(c.shape) == (2, 4, 4)
+    assert np.allclose(c.to_numpy(), a_np @ b_np, rtol=1e-5)
+    print("matmul batched: ok")
+
+
+def test_cross_stream_wait():
+    # 第二条流在事件完成前不得开始
+    x_np = np.random.rand(128, 128).astype(np.float32)
+    s1 = ap.Stream()
+    s2 = ap.Stream()
+    with s1:
+        x = ap.ndarray.from_numpy(x_np)
+        y = x
+        for _ in range(8):
+            y = ap.add(y, x)
+        done = s1.record()
+    s2.wait_event(done)
+    with s2:
+        z = ap.multiply(y, 2.0)
+    s2.synchronize()
+    assert np.allclose(z.to_numpy(), x_np * 18)
+    print("cross stream wait: ok")
+
+
+if __name__ == "__main__":
+    test_elementwise_and_reductions()
+    test_matmul_batched()
+    test_cross_stream_wait()
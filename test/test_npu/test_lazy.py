@@ -0,0 +1,125 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+import numpy as np
+import asnumpy as ap
+
+
+def test_lazy_chain():
+    a_np, b_np, c_np = (np.random.rand(64, 64).astype(np.float32) for _ in range(3))
+    a = ap.ndarray.from_numpy(a_np)
+    b = ap.ndarray.from_numpy(b_np)
+    c = ap.ndarray.from_numpy(c_np)
+    with ap.lazy():
+        y = ap.add(ap.multiply(a, b), c)          # 融合为一个 addcmul
+        z = ap.tanh(ap.exp(a) - ap.multiply(b, 2.0)) / 3.0 + 1.0
+    assert isinstance(y, ap.LazyArray)
+    assert y.shape == (64, 64)
+    assert np.allclose(y.to_numpy(), a_np * b_np + c_np, atol=1e-5)
+    assert np.allclose(z.to_numpy(), np.tanh(np.exp(a_np) - 2.0 * b_np) / 3.0 + 1.0, atol=1e-5)
+    print("lazy chain: ok")
+
+
+def test_lazy_allocations():
+    pool = ap.npu.memory_pool()
+    x = ap.ndarray.from_numpy(np.random.rand(256, 256).astype(np.float32))
+    with ap.lazy():
+        y = x
+        for _ in range(10):
+            y = ap.sin(ap.add(y, x))
+    used = pool.used_bytes()
+    out = y.compute()
+    # 中间结果原地复用，整条链只分配一个输出
+    assert pool.used_bytes() - used == 256 * 256 * 4
+    expected = x.to_numpy()
+    for _ in range(10):
+        expected = np.sin(expected + x.to_numpy())
+    assert np.allclose(out.to_numpy(), expected, atol=1e-5)
+    print("lazy allocations: ok")
+
+
+def test_lazy_fallback():
+    x = ap.ndarray.from_numpy(np.arange(12, dtype=np.int32).reshape(3, 4))
+    with ap.lazy():
+        y = ap.add(x, ap.multiply(x, x))
+    # 整型输入走 eager 路径
+    assert np.array_equal(y.to_numpy(), (np.arange(12) + np.arange(12) ** 2).reshape(3, 4))
+    # 非 lazy 模式下传入 LazyArray 时先求值
+    z = ap.negative(y)
+    assert isinstance(z, ap.ndarray)
+    # 标量运算的类型提升与 eager 模式一致
+    for ap_func, value in ((ap.divide, 2), (ap.add, 0.5), (ap.subtract, 1)):
+        eager = ap_func(x, value)
+        with ap.lazy():
+            lazy = ap_func(x, value)
+        assert lazy.compute().dtype == eager.dtype, ap_func.__name__
+        assert np.array_equal(lazy.to_numpy(), eager.to_numpy()), ap_func.__name__
+    print("lazy fallback: ok")
+
+
+def test_lazy_scalar_divide():
+    a_np = np.random.rand(16).astype(np.float32) + 1
+    a = ap.ndarray.from_numpy(a_np)
+    with ap.lazy():
+        y = ap.divide(a, 0.0)
+        z = ap.divide(2.0, ap.add(a, 1.0))
+    # 与 eager 模式一样除以 0 得到 inf，而不是在 Python 中取倒数
+    assert np.all(np.isinf(y.to_numpy()))
+    assert np.allclose(z.to_numpy(), 2.0 / (a_np + 1.0), rtol=1e-5)
+    print("lazy scalar divide: ok")
+
+
+def test_lazy_dtype():
+    i = ap.ndarray.from_numpy(np.arange(1, 7, dtype=np.int32))
+    h = ap.ndarray.from_numpy(np.ones(6, dtype=np.float16))
+    f = ap.ndarray.from_numpy(np.ones(6, dtype=np.float32))
+    with ap.lazy():
+        nodes = (ap.add(i, 0.5), ap.add(h, f), ap.divide(i, i), ap.multiply(h, 3), ap.exp(ap.add(h, f)))
+    # 提升规则与 eager 模式一致，并与计算结果相符
+    for node, dtype in zip(nodes, (np.float64, np.float32, np.float64, np.float16, np.float32)):
+        assert node.dtype == dtype, node
+        assert node.compute().dtype == dtype, node
+    print("lazy dtype: ok")
+
+
+def test_lazy_entry_points():
+    a_np = np.random.rand(4, 4).astype(np.float32)
+    a = ap.ndarray.from_numpy(a_np)
+    expected = np.sin(a_np) * 2
+    with ap.lazy():
+        y = ap.sin(a) * 2.0
+        # 不参与融合的函数直接接收 LazyArray，先计算整条链
+        assert np.isclose(ap.sum(y).item(), expected.sum(), rtol=1e-5)
+    assert np.allclose(ap.hypot(a, y).to_numpy(), np.hypot(a_np, expected), rtol=1e-5)
+    assert np.allclose(ap.maximum(y, a).to_numpy(), np.maximum(expected, a_np), rtol=1e-5)
+    assert np.allclose((a @ y).to_numpy(), a_np @ expected, rtol=1e-4)
+    assert np.allclose((y @ a).to_numpy(), expected @ a_np, rtol=1e-4)
+    assert np.array_equal((a < y).to_numpy(), a_np < expected)
+    b = ap.ndarray.from_numpy(a_np)
+    b += y
+    assert np.allclose(b.to_numpy(), a_np + expected, rtol=1e-5)
+    # lazy 之外的 ufunc 直接走 eager 实现
+    assert isinstance(ap.exp(y), ap.ndarray)
+    print("lazy entry points: ok")
+
+
+if __name__ == "__main__":
+    test_lazy_chain()
+    test_lazy_allocations()
+    test_lazy_fallback()
+    test_lazy_scalar_divide()
+    test_lazy_dtype()
+    test_lazy_entry_points()
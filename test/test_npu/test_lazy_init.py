@@ -0,0 +1,66 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+import os
+import subprocess
+import sys
+
+
+def _run(code, **env):
+    # 初始化状态是进程级的，所以在新进程中检查
+    result = subprocess.run([sys.executable, "-c", code], env={**os.environ, **env},
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+
+def test_import_does_not_init():
+    out = _run("import asnumpy as ap; print(ap.npu.is_initialized())")
+    assert out == "False"
+    print("import without init: ok")
+
+
+def test_first_use_inits():
+    out = _run("import numpy as np, asnumpy as ap\n"
+               "x = ap.ndarray.from_numpy(np.ones(4, dtype=np.float32))\n"
+               "assert np.allclose(ap.add(x, x).to_numpy(), 2)\n"
+               "print(ap.npu.is_initialized(), ap.npu.current_device())")
+    assert out == "True 0"
+    print("init on first use: ok")
+
+
+def test_device_selection():
+    code = "import asnumpy as ap; print(ap.npu.current_device())"
+    assert _run(code, ASNUMPY_DEVICE="0") == "0"
+    out = _run("import asnumpy as ap\n"
+               "ap.npu.set_device(0)\n"
+               "print(ap.npu.is_initialized(), ap.npu.current_device())")
+    assert out == "True 0"
+    print("device selection: ok")
+
+
+def test_lazy_io():
+    out = _run("import sys, asnumpy as ap\n"
+               "print('asnumpy.io' in sys.modules, callable(ap.save), 'asnumpy.io' in sys.modules)")
+    assert out == "False True True"
+    print("lazy io: ok")
+
+
+if __name__ == "__main__":
+    test_import_does_not_init()
+    test_first_use_inits()
+    test_device_selection()
+    test_lazy_io()
@@ -0,0 +1,64 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+import numpy as np
+import asnumpy as ap
+
+
+def test_reuse():
+    pool = ap.npu.memory_pool()
+    a = ap.ndarray.from_numpy(np.ones((256, 256), dtype=np.float32))
+    used = pool.used_bytes()
+    total = pool.total_bytes()
+    del a
+    # 释放后块回到池中，总量不变
+    assert pool.used_bytes() < used
+    assert pool.total_bytes() == total
+
+    # 相同大小的再次申请应复用缓存块，不向驱动申请新内存
+    b = ap.ndarray.from_numpy(np.ones((256, 256), dtype=np.float32))
+    assert pool.total_bytes() == total
+    del b
+    print("reuse: used", pool.used_bytes(), "total", pool.total_bytes())
+
+
+def test_free_all_blocks():
+    pool = ap.npu.memory_pool()
+    arrays = [ap.ndarray.from_numpy(np.zeros((1024, 1024), dtype=np.float32)) for _ in range(4)]
+    del arrays
+    assert pool.n_free_blocks() > 0
+    total = pool.total_bytes()
+    pool.free_all_blocks()
+    assert pool.total_bytes() < total
+    print("free_all_blocks: total", pool.total_bytes(), "free blocks", pool.n_free_blocks())
+
+
+def test_ops_return_workspace():
+    pool = ap.npu.memory_pool()
+    x = ap.ndarray.from_numpy(np.random.rand(64, 64).astype(np.float32))
+    y = ap.add(x, x)
+    used = pool.used_bytes()
+    for _ in range(10):
+        y = ap.add(x, x)
+    # 算子的workspace用完即归还，重复调用不会累积占用
+    assert pool.used_bytes() == used
+    print("ops: used", pool.used_bytes())
+
+
+if __name__ == "__main__":
+    test_reuse()
+    test_free_all_blocks()
+    test_ops_return_workspace()
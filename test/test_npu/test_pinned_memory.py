@@ -0,0 +1,66 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+import numpy as np
+import asnumpy as ap
+
+
+def test_empty_pinned_roundtrip():
+    pool = ap.npu.pinned_memory_pool()
+    host = ap.npu.empty_pinned((256, 256), dtype=np.float32)
+    assert host.shape == (256, 256) and host.dtype == np.float32
+    assert pool.used_bytes() >= host.nbytes
+    host[...] = np.random.rand(256, 256)
+    x = ap.ndarray.from_numpy(host)
+    out = ap.npu.empty_pinned((256, 256), dtype=np.float32)
+    y = ap.add(x, x)
+    r = y.to_numpy(out=out)
+    assert r is out or np.shares_memory(r, out)
+    assert np.allclose(out, host * 2)
+    print("empty_pinned roundtrip: ok")
+
+
+def test_non_blocking_upload():
+    s = ap.Stream()
+    data = [np.random.rand(128, 128).astype(np.float32) for _ in range(4)]
+    # 可分页内存经由锁页暂存区上传，调用返回后即可修改源数组
+    arrays = [ap.ndarray.from_numpy(d, stream=s, non_blocking=True) for d in data]
+    expected = [d.copy() for d in data]
+    for d in data:
+        d[...] = 0
+    s.synchronize()
+    for a, e in zip(arrays, expected):
+        assert np.array_equal(a.to_numpy(stream=s), e)
+    print("non-blocking upload: ok")
+
+
+def test_staging_reuse():
+    pool = ap.npu.pinned_memory_pool()
+    x_np = np.random.rand(64, 64).astype(np.float32)
+    ap.ndarray.from_numpy(x_np)
+    total = pool.total_bytes()
+    for _ in range(10):
+        x = ap.ndarray.from_numpy(x_np)
+        x.to_numpy()
+    # 暂存缓冲区被复用，不会重复申请锁页内存
+    assert pool.total_bytes() == total
+    print("staging reuse: ok, cached blocks", pool.n_free_blocks())
+
+
+if __name__ == "__main__":
+    test_empty_pinned_roundtrip()
+    test_non_blocking_upload()
+    test_staging_reuse()
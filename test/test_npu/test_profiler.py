@@ -0,0 +1,114 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+import json
+import os
+import tempfile
+
+import numpy as np
+import asnumpy as ap
+
+
+def _ops(prof, name):
+    return [r for r in prof.records if r.name == name]
+
+
+def test_records_ops_and_copies():
+    a_np = np.random.randn(8, 8).astype(np.float32)
+    with ap.profiler.profile() as prof:
+        a = ap.ndarray.from_numpy(a_np)
+        b = ap.matmul(a, ap.ndarray.from_numpy(np.ones((8, 8), dtype=np.float32)))
+        out = b.to_numpy()
+    assert np.allclose(out, a_np @ np.ones((8, 8), dtype=np.float32), atol=1e-4)
+
+    [mm] = _ops(prof, "Matmul")
+    assert [list(s) for s in mm.shapes] == [[8, 8]] * 3
+    assert mm.dtypes == ["float32"] * 3
+    assert 0 <= mm.plan_time <= mm.host_time
+    assert mm.device_time >= 0 and mm.device_start >= 0
+    h2d = [r for r in prof.records if r.name == "H2D"]
+    d2h = [r for r in prof.records if r.name == "D2H"]
+    assert [r.bytes for r in h2d] == [8 * 8 * 4] * 2
+    assert [r.bytes for r in d2h] == [8 * 8 * 4]
+    assert all(r.copy for r in h2d + d2h)
+    starts = [r.start for r in prof.records]
+    assert starts == sorted(starts)
+    print("records ops and copies: ok")
+
+
+def test_cached_executor():
+    x = ap.ndarray.from_numpy(np.random.randn(32, 32).astype(np.float32))
+    ap.sign(x)  # 预先规划，会话中命中缓存
+    with ap.profiler.profile() as prof:
+        for _ in range(3):
+            ap.sign(x)
+    signs = _ops(prof, "Sign")
+    assert len(signs) == 3 and all(r.cached for r in signs)
+    assert [list(s) for s in signs[0].shapes] == [[32, 32], [32, 32]]
+    print("cached executor: ok")
+
+
+def test_table_and_trace():
+    x = ap.ndarray.from_numpy(np.ones((64,), dtype=np.float32))
+    with ap.profiler.profile() as prof:
+        for _ in range(4):
+            y = ap.add(x, x)
+        ap.exp(y)
+    rows = {row["name"]: row for row in prof.key_averages()}
+    assert rows["Add"]["calls"] == 4
+    text = prof.table(sort_by="calls")
+    lines = text.splitlines()
+    assert lines[0].startswith("Name") and lines[2].startswith("Add")
+    assert "(64,)" in prof.table(group_by_shape=True)
+    try:
+        prof.table(sort_by="nope")
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+    path = os.path.join(tempfile.mkdtemp(), "trace.json")
+    prof.export_chrome_trace(path)
+    with open(path) as f:
+        events = json.load(f)["traceEvents"]
+    host = [e for e in events if e["ph"] == "X" and e["pid"] == 0 and e["cat"] == "op"]
+    device = [e for e in events if e["ph"] == "X" and e["pid"] == 1]
+    assert [e["name"] for e in host] == ["Add"] * 4 + ["Exp"]
+    assert len(device) == 5
+    print("table and trace: ok")
+
+
+def test_session_state():
+    x = ap.ndarray.from_numpy(np.ones((4,), dtype=np.float32))
+    ap.add(x, x)
+    assert not ap.npu.profiler_enabled()
+    with ap.profiler.profile() as prof:
+        assert ap.npu.profiler_enabled()
+        try:
+            with ap.profiler.profile():
+                pass
+            assert False, "expected RuntimeError"
+        except RuntimeError:
+            pass
+    assert not ap.npu.profiler_enabled()
+    assert prof.records == []
+    print("session state: ok")
+
+
+if __name__ == "__main__":
+    test_records_ops_and_copies()
+    test_cached_executor()
+    test_table_and_trace()
+    test_session_state()
@@ -0,0 +1,69 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+import numpy as np
+import asnumpy as ap
+
+
+def test_stream_context():
+    x_np = np.random.rand(64, 64).astype(np.float32)
+    x = ap.ndarray.from_numpy(x_np)
+    s = ap.Stream()
+    with s:
+        assert ap.npu.current_stream().ptr == s.ptr
+        y = ap.add(x, x)
+        for _ in range(10):
+            y = ap.add(y, x)
+    assert ap.npu.current_stream().ptr == 0
+    s.synchronize()
+    assert np.allclose(y.to_numpy(), x_np * 12)
+    print("stream context: ok")
+
+
+def test_event_ordering():
+    x_np = np.random.rand(32, 32).astype(np.float32)
+    s1 = ap.Stream()
+    s2 = ap.Stream()
+    with s1:
+        x = ap.ndarray.from_numpy(x_np)
+        y = ap.multiply(x, x)
+        done = s1.record()
+    # s2 上的计算必须等待 s1 完成
+    s2.wait_event(done)
+    with s2:
+        z = ap.add(y, x)
+    s2.synchronize()
+    assert done.query()
+    assert np.allclose(z.to_numpy(), x_np * x_np + x_np)
+    print("event ordering: ok")
+
+
+def test_event_timing():
+    x = ap.ndarray.from_numpy(np.random.rand(256, 256).astype(np.float32))
+    start = ap.Event()
+    end = ap.Event()
+    start.record()
+    for _ in range(20):
+        x = ap.add(x, x)
+    end.record()
+    end.synchronize()
+    print("20 adds: {:.3f} ms".format(start.elapsed_time(end)))
+
+
+if __name__ == "__main__":
+    test_stream_context()
+    test_event_ordering()
+    test_event_timing()
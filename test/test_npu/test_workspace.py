@@ -0,0 +1,70 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+import numpy as np
+import asnumpy as ap
+
+
+def test_workspace_reuse():
+    arena = ap.npu.workspace_arena()
+    pool = ap.npu.memory_pool()
+    x = ap.ndarray.from_numpy(np.random.rand(128, 128).astype(np.float32))
+    y = ap.sum(x, axis=0, keepdims=False)
+    held = arena.used_bytes()
+    used = pool.used_bytes()
+    for _ in range(20):
+        y = ap.sum(x, axis=0, keepdims=False)
+    # 同一条流上的算子复用同一块workspace，不会增长
+    assert arena.used_bytes() == held
+    assert pool.used_bytes() == used
+    print("reuse: workspace", held, "high water mark", arena.high_water_mark())
+
+
+def test_arena_get():
+    arena = ap.npu.workspace_arena()
+    arena.release()
+    arena.reset_high_water_mark()
+    ptr = arena.get(1 << 16)
+    assert ptr != 0
+    assert arena.used_bytes() >= 1 << 16
+    # 够用时直接复用当前的 workspace，更大的请求才换成新的块
+    assert arena.get(1 << 10) == ptr
+    held = arena.used_bytes()
+    arena.get(1 << 20)
+    assert arena.used_bytes() >= 1 << 20
+    assert arena.high_water_mark() >= arena.used_bytes() > held
+    assert arena.get(0) == 0
+    print("get: ok")
+
+
+def test_release():
+    arena = ap.npu.workspace_arena()
+    pool = ap.npu.memory_pool()
+    arena.get(1 << 16)
+    used = pool.used_bytes()
+    arena.release()
+    assert arena.used_bytes() == 0
+    assert pool.used_bytes() < used
+    assert arena.high_water_mark() > 0
+    arena.reset_high_water_mark()
+    assert arena.high_water_mark() == 0
+    print("release: ok")
+
+
+if __name__ == "__main__":
+    test_workspace_reuse()
+    test_arena_get()
+    test_release()
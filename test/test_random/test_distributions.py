@@ -0,0 +1,73 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+import numpy as np
+import asnumpy as ap
+
+N = 200000
+
+
+def _check(name, samples, mean, var, tol=0.05):
+    m, v = samples.mean(), samples.var()
+    assert abs(m - mean) <= tol * max(1.0, abs(mean)), (name, m, mean)
+    assert abs(v - var) <= 2 * tol * max(1.0, var), (name, v, var)
+    print(f"{name}: mean={m:.4f} ({mean:.4f}) var={v:.4f} ({var:.4f}) ok")
+
+
+def test_moments():
+    g = ap.random.default_rng(123)
+    a, scale, p = 4.0, 2.0, 0.3
+    _check("pareto", g.pareto(a, (N,)).to_numpy(), 1 / (a - 1), a / ((a - 1) ** 2 * (a - 2)), tol=0.1)
+    _check("rayleigh", g.rayleigh(scale, (N,)).to_numpy(), scale * np.sqrt(np.pi / 2), (4 - np.pi) / 2 * scale ** 2)
+    _check("weibull", g.weibull(1.0, (N,)).to_numpy(), 1.0, 1.0)
+    _check("exponential", g.exponential(scale, (N,)).to_numpy(), scale, scale ** 2)
+    _check("geometric", g.geometric(p, (N,)).to_numpy(), 1 / p, (1 - p) / p ** 2)
+    _check("gumbel", g.gumbel(1.0, scale, (N,)).to_numpy(), 1.0 + 0.5772156649 * scale, np.pi ** 2 / 6 * scale ** 2)
+    _check("laplace", g.laplace(1.0, scale, (N,)).to_numpy(), 1.0, 2 * scale ** 2)
+    _check("logistic", g.logistic(1.0, scale, (N,)).to_numpy(), 1.0, np.pi ** 2 / 3 * scale ** 2)
+    _check("lognormal", g.lognormal(0.0, 0.5, (N,)).to_numpy(), np.exp(0.125), (np.exp(0.25) - 1) * np.exp(0.25))
+    _check("binomial", g.binomial(10, 0.5, (N,)).to_numpy(), 5.0, 2.5)
+    c = g.standard_cauchy((N,)).to_numpy()
+    # 柯西分布没有矩，检查中位数与四分位数
+    assert abs(np.median(c)) < 0.05 and abs(np.percentile(c, 75) - 1.0) < 0.05
+    print("standard_cauchy: ok")
+
+
+def test_in_place_into_out():
+    g = ap.random.default_rng(5)
+    out = ap.empty((N,), np.float32)
+    pool = ap.npu.memory_pool()
+    used = pool.used_bytes()
+    r = g.gumbel(0.0, 1.0, out=out)
+    # 变换在 out 上原地完成，调用结束后不残留额外显存
+    assert r is out and pool.used_bytes() == used
+    assert np.isfinite(out.to_numpy()).all()
+    print("in place into out: ok")
+
+
+def test_open_interval():
+    # gumbel 与 logistic 的均匀样本取开区间 (0, 1)，端点不会产生 inf
+    g = ap.random.default_rng(0)
+    for _ in range(4):
+        assert np.isfinite(g.logistic(0.0, 1.0, (1 << 22,)).to_numpy()).all()
+        assert np.isfinite(g.gumbel(0.0, 1.0, (1 << 22,)).to_numpy()).all()
+    print("open interval: ok")
+
+
+if __name__ == "__main__":
+    test_moments()
+    test_in_place_into_out()
+    test_open_interval()
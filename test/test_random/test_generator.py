@@ -0,0 +1,83 @@
+# *****************************************************************************
+# Copyright (c) 2025 AISS Group at Harbin Institute of Technology. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# *****************************************************************************
+
+import numpy as np
+import asnumpy as ap
+
+
+def test_seed_reproducible():
+    a = ap.random.default_rng(2025).normal(0.0, 1.0, (1000,)).to_numpy()
+    b = ap.random.default_rng(2025).normal(0.0, 1.0, (1000,)).to_numpy()
+    assert np.array_equal(a, b)
+    print("seed reproducible: ok")
+
+
+def test_offset_advances():
+    g = ap.random.Generator(7)
+    assert g.offset == 0
+    x = g.uniform(size=(1000,)).to_numpy()
+    # 偏移量按 Philox 块（4 个值）对齐前进
+    assert g.offset == 1000
+    y = g.uniform(size=(1000,)).to_numpy()
+    assert not np.array_equal(x, y)
+    # 恢复状态后重现同一序列
+    g.state = (7, 1000)
+    assert np.array_equal(g.uniform(size=(1000,)).to_numpy(), y)
+    print("offset advances: ok")
+
+
+def test_spawn_independent():
+    parent = ap.random.Generator(1)
+    children = parent.spawn(3)
+    assert len({c.seed for c in children}) == 3
+    samples = [c.standard_normal((4096,)).to_numpy() for c in children]
+    for i in range(3):
+        for j in range(i + 1, 3):
+            assert abs(np.corrcoef(samples[i], samples[j])[0, 1]) < 0.1
+    print("spawn independent: ok")
+
+
+def test_out():
+    g = ap.random.default_rng(3)
+    out = ap.empty((64, 64), np.float32)
+    r = g.random(out=out)
+    assert r is out
+    v = out.to_numpy()
+    assert v.min() >= 0.0 and v.max() < 1.0
+    y = g.exponential(2.0, out=ap.empty((128,), np.float32))
+    assert tuple(y.shape) == (128,) and y.to_numpy().min() >= 0.0
+    assert g.random((16,), dtype=np.float32).dtype == np.float32
+    assert g.standard_normal((16,), dtype="float32").dtype == np.float32
+    print("out: ok")
+
+
+def test_module_level_seed():
+    ap.random.seed(11)
+    a = ap.random.laplace(0.0, 1.0, (256,)).to_numpy()
+    b = ap.random.laplace(0.0, 1.0, (256,)).to_numpy()
+    # 连续调用不再返回相同的样本
+    assert not np.array_equal(a, b)
+    ap.random.seed(11)
+    assert np.array_equal(ap.random.laplace(0.0, 1.0, (256,)).to_numpy(), a)
+    print("module-level seed: ok")
+
+
+if __name__ == "__main__":
+    test_seed_reproducible()
+    test_offset_advances()
+    test_spawn_independent()
+    test_out()
+    test_module_level_seed()